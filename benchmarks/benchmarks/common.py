@@ -0,0 +1,87 @@
+"""
+Synthetic radar volumes shared by the Py-ART benchmarks.
+"""
+
+import bz2
+import io
+import struct
+
+import numpy as np
+
+import pyart
+from pyart.io.nexrad_level2 import NEXRADLevel2File
+
+# number of gates, rays per sweep and sweeps in the synthetic volumes
+RADAR_SIZES = {
+    'small': (400, 360, 5),
+    'nexrad': (1832, 720, 9),
+}
+
+# sizes of the NEXRAD Level II structures used to build synthetic archives
+VOLUME_HEADER_SIZE = 24
+COMPRESSION_RECORD_SIZE = 12
+CTM_HEADER_SIZE = 12
+MSG_HEADER_SIZE = 16
+DATA_BLOCK_SIZE = 28
+
+# number of radials in each compressed block of a synthetic archive
+RADIALS_PER_BLOCK = 120
+
+
+def make_radar(size):
+    """ Return a synthetic PPI radar volume of a given size. """
+    ngates, rays_per_sweep, nsweeps = RADAR_SIZES[size]
+    return pyart.testing.make_synthetic_ppi_radar(
+        ngates, rays_per_sweep, nsweeps)
+
+
+def make_nexrad_archive(filename, compressed=False, seed=0):
+    """
+    Write a synthetic full size NEXRAD Level II archive file.
+
+    The volume structure (16 sweeps, 7200 radials, up to 1832 gates) is
+    taken from the example NEXRAD archive file, in which all moment data is
+    replaced by a single value.  Here the moment data is replaced by random
+    values with about half of the gates below the threshold so the file is
+    similar in size and cost to decode to a real volume.  When compressed is
+    True the records are written as bzip2 compressed blocks of
+    RADIALS_PER_BLOCK radials, otherwise they are written uncompressed.
+    """
+    with bz2.BZ2File(pyart.testing.NEXRAD_ARCHIVE_FILE) as f:
+        raw = bytearray(f.read())
+    start = VOLUME_HEADER_SIZE + COMPRESSION_RECORD_SIZE
+    index = NEXRADLevel2File(io.BytesIO(bytes(raw))).msg31_index
+
+    # replace the data of each moment block, PHI uses 10 bit values
+    rng = np.random.RandomState(seed)
+    for offset, block_pointers in zip(index['offset'],
+                                      index['block_pointers']):
+        for block_pointer in block_pointers[3:]:
+            if block_pointer == 0:
+                continue
+            pos = start + offset + block_pointer
+            ngates, = struct.unpack_from('>H', raw, pos + 8)
+            word_size, = struct.unpack_from('>B', raw, pos + 19)
+            dtype = '>u%d' % (word_size // 8)
+            data = rng.randint(2, 2 ** min(word_size, 10), ngates)
+            data[rng.rand(ngates) < 0.5] = 0
+            data = data.astype(dtype).tostring()
+            pos += DATA_BLOCK_SIZE
+            raw[pos:pos + len(data)] = data
+
+    with open(filename, 'wb') as f:
+        f.write(raw[:VOLUME_HEADER_SIZE])
+        records = raw[VOLUME_HEADER_SIZE:]
+        if not compressed:
+            f.write(records)
+            return
+        # blocks start at the CTM header of every RADIALS_PER_BLOCK radial,
+        # the first also contains the compression record and metadata
+        splits = [COMPRESSION_RECORD_SIZE + offset - MSG_HEADER_SIZE -
+                  CTM_HEADER_SIZE
+                  for offset in index['offset'][::RADIALS_PER_BLOCK]]
+        splits = [0] + splits[1:] + [len(records)]
+        for block_start, block_end in zip(splits[:-1], splits[1:]):
+            block = bz2.compress(bytes(records[block_start:block_end]))
+            f.write(struct.pack('>i', len(block)))
+            f.write(block)
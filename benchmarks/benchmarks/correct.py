@@ -0,0 +1,74 @@
+"""
+Benchmarks for the pyart.correct module.
+"""
+
+import imp
+
+import pyart
+
+from .common import make_radar
+
+
+class Dealias(object):
+    """ Benchmark the Doppler velocity dealiasing algorithms. """
+
+    params = ['small', 'nexrad']
+    param_names = ['size']
+    timeout = 600
+
+    def setup(self, size):
+        self.radar = make_radar(size)
+
+    def time_dealias_region_based(self, size):
+        pyart.correct.dealias_region_based(self.radar)
+
+    def peakmem_dealias_region_based(self, size):
+        pyart.correct.dealias_region_based(self.radar)
+
+    def time_dealias_unwrap_phase(self, size):
+        pyart.correct.dealias_unwrap_phase(self.radar)
+
+    def peakmem_dealias_unwrap_phase(self, size):
+        pyart.correct.dealias_unwrap_phase(self.radar)
+
+
+class DealiasFourDD(object):
+    """ Benchmark the 4DD dealiasing algorithm, requires TRMM RSL. """
+
+    params = ['small', 'nexrad']
+    param_names = ['size']
+    timeout = 600
+
+    def setup(self, size):
+        if not hasattr(pyart.correct, 'dealias_fourdd'):
+            raise NotImplementedError('Py-ART not built with TRMM RSL')
+        self.radar = make_radar(size)
+        self.height = [0, 10000, 20000]
+        self.speed = [25, 25, 25]
+        self.direction = [37, 37, 37]
+
+    def time_dealias_fourdd(self, size):
+        pyart.correct.dealias_fourdd(
+            self.radar, sounding_heights=self.height,
+            sounding_wind_speeds=self.speed,
+            sounding_wind_direction=self.direction)
+
+
+class PhaseProcLP(object):
+    """ Benchmark LP phase processing, requires CyLP. """
+
+    timeout = 600
+
+    def setup(self):
+        try:
+            imp.find_module('cylp')
+        except ImportError:
+            raise NotImplementedError('CyLP is not installed')
+        # LP processing is slow, use a single sweep of the small volume
+        self.radar = make_radar('small').extract_sweeps([0])
+
+    def time_phase_proc_lp(self):
+        pyart.correct.phase_proc_lp(self.radar, 0.0, LP_solver='cylp')
+
+    def peakmem_phase_proc_lp(self):
+        pyart.correct.phase_proc_lp(self.radar, 0.0, LP_solver='cylp')
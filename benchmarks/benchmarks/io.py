@@ -0,0 +1,74 @@
+"""
+Benchmarks for the pyart.io module.
+"""
+
+import os
+import shutil
+import tempfile
+
+import pyart
+
+from .common import make_radar, make_nexrad_archive
+
+
+class CFRadial(object):
+    """ Benchmark reading and writing CF/Radial files. """
+
+    params = ['small', 'nexrad']
+    param_names = ['size']
+    timeout = 300
+
+    def setup(self, size):
+        self.radar = make_radar(size)
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'radar.nc')
+        self.write_filename = os.path.join(self.tmpdir, 'write.nc')
+        pyart.io.write_cfradial(self.filename, self.radar)
+
+    def teardown(self, size):
+        shutil.rmtree(self.tmpdir)
+
+    def time_read_cfradial(self, size):
+        radar = pyart.io.read_cfradial(self.filename)
+        # access the field data, which may be loaded lazily
+        for field in radar.fields.values():
+            field['data']
+
+    def peakmem_read_cfradial(self, size):
+        radar = pyart.io.read_cfradial(self.filename)
+        for field in radar.fields.values():
+            field['data']
+
+    def time_write_cfradial(self, size):
+        pyart.io.write_cfradial(self.write_filename, self.radar)
+
+    def peakmem_write_cfradial(self, size):
+        pyart.io.write_cfradial(self.write_filename, self.radar)
+
+
+class NEXRADArchive(object):
+    """ Benchmark reading NEXRAD Level II archive files. """
+
+    params = ['bzip2', 'compressed', 'full', 'full_compressed']
+    param_names = ['archive']
+    timeout = 300
+
+    def setup_cache(self):
+        # synthetic full size volumes, the sample files are either truncated
+        # or contain a single moment value which decompresses trivially
+        filenames = {
+            'bzip2': pyart.testing.NEXRAD_ARCHIVE_FILE,
+            'compressed': pyart.testing.NEXRAD_ARCHIVE_COMPRESSED_FILE,
+            'full': os.path.abspath('nexrad_full.ar2v'),
+            'full_compressed': os.path.abspath(
+                'nexrad_full_compressed.ar2v'),
+        }
+        make_nexrad_archive(filenames['full'])
+        make_nexrad_archive(filenames['full_compressed'], compressed=True)
+        return filenames
+
+    def time_read_nexrad_archive(self, filenames, archive):
+        pyart.io.read_nexrad_archive(filenames[archive])
+
+    def peakmem_read_nexrad_archive(self, filenames, archive):
+        pyart.io.read_nexrad_archive(filenames[archive])
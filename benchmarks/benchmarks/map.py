@@ -0,0 +1,116 @@
+"""
+Benchmarks for the pyart.map module.
+"""
+
+import os
+import shutil
+import tempfile
+
+import pyart
+
+from .common import make_radar
+
+
+class MapToGrid(object):
+    """ Benchmark the map_to_grid function. """
+
+    params = [None, 1000, 10000]
+    param_names = ['block_size']
+
+    def setup(self, block_size):
+        self.radar = make_radar('small')
+        self.grid_shape = (5, 41, 41)
+        self.grid_limits = ((1000, 5000), (-50000, 50000), (-50000, 50000))
+
+    def time_map_to_grid(self, block_size):
+        pyart.map.map_to_grid(
+            self.radar, self.grid_shape, self.grid_limits,
+            fields=['reflectivity'], block_size=block_size)
+
+    def peakmem_map_to_grid(self, block_size):
+        pyart.map.map_to_grid(
+            self.radar, self.grid_shape, self.grid_limits,
+            fields=['reflectivity'], block_size=block_size)
+
+
+class MapGatesToGrid(object):
+    """ Benchmark the map_gates_to_grid function. """
+
+    params = [1, 2, 4]
+    param_names = ['nthreads']
+
+    def setup(self, nthreads):
+        self.radar = make_radar('small')
+        self.grid_shape = (11, 101, 101)
+        self.grid_limits = ((0, 10000), (-50000, 50000), (-50000, 50000))
+
+    def time_map_gates_to_grid(self, nthreads):
+        pyart.map.map_gates_to_grid(
+            self.radar, self.grid_shape, self.grid_limits,
+            fields=['reflectivity'], nthreads=nthreads)
+
+    def peakmem_map_gates_to_grid(self, nthreads):
+        pyart.map.map_gates_to_grid(
+            self.radar, self.grid_shape, self.grid_limits,
+            fields=['reflectivity'], nthreads=nthreads)
+
+
+class MapGatesToGridInterpolation(object):
+    """ Benchmark the per sweep interpolation of map_gates_to_grid. """
+
+    params = ['Barnes', 'Nearest', 'Bilinear']
+    param_names = ['weighting_function']
+
+    def setup(self, weighting_function):
+        self.radar = make_radar('small')
+        self.grid_shape = (11, 101, 101)
+        self.grid_limits = ((0, 10000), (-50000, 50000), (-50000, 50000))
+
+    def time_map_gates_to_grid(self, weighting_function):
+        pyart.map.map_gates_to_grid(
+            self.radar, self.grid_shape, self.grid_limits,
+            fields=['reflectivity'], weighting_function=weighting_function)
+
+
+class WriteTiledGrid(object):
+    """ Benchmark the write_tiled_grid function. """
+
+    params = [(101, 101), (51, 51), (21, 21)]
+    param_names = ['tile_shape']
+
+    def setup(self, tile_shape):
+        self.radar = make_radar('small')
+        self.grid_shape = (11, 101, 101)
+        self.grid_limits = ((0, 10000), (-50000, 50000), (-50000, 50000))
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'grid.nc')
+
+    def teardown(self, tile_shape):
+        shutil.rmtree(self.tmpdir)
+
+    def time_write_tiled_grid(self, tile_shape):
+        pyart.map.write_tiled_grid(
+            self.filename, self.radar, self.grid_shape, self.grid_limits,
+            tile_shape, fields=['reflectivity'])
+
+    def peakmem_write_tiled_grid(self, tile_shape):
+        pyart.map.write_tiled_grid(
+            self.filename, self.radar, self.grid_shape, self.grid_limits,
+            tile_shape, fields=['reflectivity'])
+
+
+class GridMapperSeries(object):
+    """ Benchmark mapping volumes with a persistent GridMapper. """
+
+    def setup(self):
+        self.radar = make_radar('small')
+        self.grid_shape = (5, 41, 41)
+        self.grid_limits = ((1000, 5000), (-50000, 50000), (-50000, 50000))
+        self.mapper = pyart.map.GridMapper(
+            self.radar, self.grid_shape, self.grid_limits)
+
+    def time_create_grid_mapper(self):
+        pyart.map.GridMapper(self.radar, self.grid_shape, self.grid_limits)
+
+    def time_grid_mapper_map_to_grid(self):
+        self.mapper.map_to_grid(self.radar, fields=['reflectivity'])
@@ -206,11 +206,15 @@ class FileMetadata():
         True to keep the field names in the file.
     exclude_fields : list of strings
         Fields to exclude during readings.
+    include_fields : list of strings or None
+        Fields to include during readings, all other fields are excluded.
+        None includes all fields which are not excluded.
 
     """
 
     def __init__(self, filetype, field_names=None, additional_metadata=None,
-                 file_field_names=False, exclude_fields=None):
+                 file_field_names=False, exclude_fields=None,
+                 include_fields=None):
         """
         Initialize.
         """
@@ -242,6 +246,9 @@ class FileMetadata():
         else:
             self._exclude_fields = exclude_fields
 
+        # parse include_fields
+        self._include_fields = include_fields
+
     def get_metadata(self, p):
         """
         Retrieve metadata for a parameter `p`.
@@ -304,5 +311,8 @@ class FileMetadata():
 
         if field_name in self._exclude_fields:
             return None     # field is excluded
+        elif (self._include_fields is not None and
+                field_name not in self._include_fields):
+            return None     # field is not included
         else:
             return field_name
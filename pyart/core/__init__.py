@@ -15,6 +15,7 @@ Core classes
 
     Radar
     Grid
+    PackedField
 
 Core functions
 ==============
@@ -24,10 +25,17 @@ Core functions
 
     is_vpt
     to_vpt
+    antenna_to_cartesian
+    antenna_vectors_to_cartesian
+    cartesian_to_geographic_aeqd
 
 """
 
 from .radar import Radar, is_vpt, to_vpt
 from .grid import Grid
+from .packed import PackedField
+from .transforms import antenna_to_cartesian
+from .transforms import antenna_vectors_to_cartesian
+from .transforms import cartesian_to_geographic_aeqd
 
 __all__ = [s for s in dir() if not s.startswith('_')]
@@ -0,0 +1,217 @@
+"""
+pyart.core.packed
+=================
+
+Field dictionary storing packed integer data.
+
+.. autosummary::
+    :toctree: generated/
+    :template: dev_template.rst
+
+    PackedField
+
+"""
+
+import collections
+import itertools
+
+import numpy as np
+
+
+class PackedField(collections.MutableMapping):
+    """
+    A field dictionary storing the field data as packed integers.
+
+    Radar moments are typically recorded as integers which are converted to
+    physical values using a scale factor and offset.  This dictionary-like
+    class stores these packed integers in place of the 'data' key, unpacking
+    them to a masked floating point array when the 'data' key is first
+    accessed::
+
+        data = packed * scale_factor + add_offset
+
+    Formats which define the unpacked values as ``(packed - packed_offset) /
+    packed_scale`` can provide this scale and offset so the unpacked data is
+    identical to that produced when the format is read without packing.
+
+    Packed values equal to the fill value or outside of the valid range are
+    masked.  Once unpacked, or when the 'data' key is set, the packed data is
+    discarded and the class behaves as a traditional dictionary.  Writers can
+    store fields which have not been unpacked without requantizing the data.
+
+    Parameters
+    ----------
+    dic : dict
+        Dictionary containing the remaining keys of the field, typically
+        the field metadata.  This dictionary is referenced not copied.
+    packed : array
+        Packed integer data.
+    scale_factor, add_offset : float
+        Scale factor and offset used to unpack the data.
+    fill_value : int
+        Packed value indicating missing data.
+    valid_min, valid_max : int or None
+        Smallest and largest valid packed values, packed values outside of
+        this range are masked.  None for no limit.
+    dtype : dtype
+        Data type of the unpacked data.
+    packed_scale, packed_offset : float or None
+        Scale and offset used to unpack the data as
+        (packed - packed_offset) / packed_scale.  When provided
+        scale_factor and add_offset should be the equivalent
+        1 / packed_scale and -packed_offset / packed_scale, they are used
+        by writers.  None, the default, unpacks the data using scale_factor
+        and add_offset.
+
+    Attributes
+    ----------
+    packed : array or None
+        Packed integer data, None once the data has been unpacked.
+    scale_factor, add_offset : float
+        Scale factor and offset used to unpack the data.
+    fill_value : int
+        Packed value indicating missing data.
+    valid_min, valid_max : int or None
+        Smallest and largest valid packed values.
+    dtype : dtype
+        Data type of the unpacked data.
+    packed_scale, packed_offset : float or None
+        Scale and offset used to unpack the data, None when scale_factor and
+        add_offset are used.
+
+    """
+
+    def __init__(self, dic, packed, scale_factor, add_offset, fill_value,
+                 valid_min=None, valid_max=None, dtype='float32',
+                 packed_scale=None, packed_offset=None):
+        """ initalize. """
+        self._dic = dic
+        if 'data' in self._dic:
+            del self._dic['data']
+        self.packed = packed
+        self.scale_factor = scale_factor
+        self.add_offset = add_offset
+        self.fill_value = fill_value
+        self.valid_min = valid_min
+        self.valid_max = valid_max
+        self.dtype = np.dtype(dtype)
+        self.packed_scale = packed_scale
+        self.packed_offset = packed_offset
+
+    # abstract methods
+    def __setitem__(self, key, value):
+        """ Set a key, setting 'data' discards the packed data. """
+        if key == 'data':
+            self.packed = None
+        self._dic[key] = value
+
+    def __getitem__(self, key):
+        """ Get the value of a key, unpacking the data if needed. """
+        if key == 'data' and self.packed is not None:
+            self._dic['data'] = self.unpack()
+            self.packed = None
+        return self._dic[key]
+
+    def __delitem__(self, key):
+        """ Remove a key from the dictionary. """
+        if key == 'data' and self.packed is not None:
+            self.packed = None
+        else:
+            del self._dic[key]
+
+    def __iter__(self):
+        """ Iterate over all keys, the 'data' key is not unpacked. """
+        if self.packed is None:
+            return iter(self._dic.copy())
+        return itertools.chain(self._dic.copy(), ['data'])
+
+    def __len__(self):
+        """ Return the number of keys. """
+        return len(self._dic) + (self.packed is not None)
+
+    # additional methods to mimic dict behavior
+    def __str__(self):
+        """ Return a string representation of the object. """
+        if self.packed is None:
+            return str(self._dic)
+        packed_str = "'data': Packed(%s)" % (self.packed.dtype)
+        if len(self._dic) == 0:
+            return '{' + packed_str + '}'
+        return str(self._dic)[:-1] + ', ' + packed_str + '}'
+
+    def __contains__(self, key):
+        """ True if dictionary has key, the 'data' key is not unpacked. """
+        if key == 'data' and self.packed is not None:
+            return True
+        return key in self._dic
+
+    def has_key(self, key):
+        """ True if dictionary has key, else False. """
+        return key in self
+
+    def copy(self):
+        """
+        Return a copy of the dictionary.
+
+        The data is not unpacked in the original or copied dictionary, the
+        packed data is shared by the two.
+        """
+        if self.packed is None:
+            return self._dic.copy()
+        return self.__class__(
+            self._dic.copy(), self.packed, self.scale_factor,
+            self.add_offset, self.fill_value, self.valid_min, self.valid_max,
+            self.dtype, self.packed_scale, self.packed_offset)
+
+    # packed field specific methods
+    def get_mask(self):
+        """ Return a boolean array which is True where data is missing. """
+        mask = self.packed == self.fill_value
+        if self.valid_min is not None:
+            mask |= self.packed < self.valid_min
+        if self.valid_max is not None:
+            mask |= self.packed > self.valid_max
+        return mask
+
+    def get_packed(self, fill_value=None):
+        """
+        Return the packed data with missing data set to a fill value.
+
+        Parameters
+        ----------
+        fill_value : int or None
+            Value to use for missing data, None uses the fill_value
+            attribute.
+
+        Returns
+        -------
+        packed : array
+            Packed data with missing data set to the fill value.
+
+        """
+        if fill_value is None:
+            fill_value = self.fill_value
+        if (fill_value == self.fill_value and self.valid_min is None and
+                self.valid_max is None):
+            return self.packed
+        return np.where(self.get_mask(), fill_value, self.packed).astype(
+            self.packed.dtype)
+
+    def unpack(self):
+        """
+        Return the unpacked data without discarding the packed data.
+
+        Returns
+        -------
+        data : MaskedArray
+            Unpacked data, missing data is masked.
+
+        """
+        data = self.packed.astype(self.dtype)
+        if self.packed_scale is not None:
+            data -= self.dtype.type(self.packed_offset or 0.)
+            data /= self.dtype.type(self.packed_scale)
+        else:
+            data *= self.dtype.type(self.scale_factor)
+            data += self.dtype.type(self.add_offset)
+        return np.ma.masked_array(data, self.get_mask())
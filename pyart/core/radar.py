@@ -23,10 +23,18 @@ from __future__ import print_function
 
 import copy
 import sys
+import hashlib
+import weakref
 
 import numpy as np
 
 from ..config import get_metadata
+from .transforms import antenna_vectors_to_cartesian
+from .transforms import cartesian_to_geographic_aeqd
+
+# gate coordinates shared between radars with identical geometry, entries
+# are removed when no radar references them.
+_SHARED_GATE_COORDINATES = weakref.WeakValueDictionary()
 
 
 class Radar(object):
@@ -138,6 +146,26 @@ class Radar(object):
         Number of rays in the volume.
     nsweeps : int
         Number of sweep in the volume.
+    gate_x, gate_y, gate_z : dict
+        Location of each gate in a Cartesian coordinate system assuming a
+        standard atmosphere with a 4/3 Earth's radius model. The data keys of
+        these attributes are float32 arrays with dimensions of (nrays,
+        ngates) which are calculated the first time they are accessed and
+        cached.  The cache is recalculated when the range, azimuth or
+        elevation data is replaced and is shared between radars with identical
+        geometry.  When the data is modified in place call
+        :py:func:`init_gate_x_y_z`.  These are read only attributes, the
+        arrays in the data keys cannot be modified.
+    gate_longitude, gate_latitude : dict
+        Geographic location of each gate.  Calculated from the Cartesian
+        gate locations using an inverse azimuthal equidistant map projection
+        centered at the radar location.  Cached and read only, see gate_x for
+        details.  When the radar location data is modified in place call
+        :py:func:`init_gate_longitude_latitude`.
+    gate_altitude : dict
+        The altitude of each radar gate as calculated from the altitude of the
+        radar and the Cartesian z location of each gate.  Cached and read
+        only, see gate_longitude for details.
 
     """
 
@@ -205,6 +233,10 @@ class Radar(object):
         self.nrays = len(time['data'])
         self.nsweeps = len(sweep_number['data'])
 
+        # lazily calculated gate coordinates
+        self._gate_cartesian = None
+        self._gate_geographic = None
+
     @property
     def rays_per_sweep(self):
         dic = get_metadata('rays_per_sweep')
@@ -212,6 +244,110 @@ class Radar(object):
                        self.sweep_start_ray_index['data'] + 1)
         return dic
 
+    @property
+    def gate_x(self):
+        dic = get_metadata('gate_x')
+        dic['data'] = self._get_gate_cartesian()[0]
+        return dic
+
+    @property
+    def gate_y(self):
+        dic = get_metadata('gate_y')
+        dic['data'] = self._get_gate_cartesian()[1]
+        return dic
+
+    @property
+    def gate_z(self):
+        dic = get_metadata('gate_z')
+        dic['data'] = self._get_gate_cartesian()[2]
+        return dic
+
+    @property
+    def gate_longitude(self):
+        dic = get_metadata('gate_longitude')
+        dic['data'] = self._get_gate_geographic()[0]
+        return dic
+
+    @property
+    def gate_latitude(self):
+        dic = get_metadata('gate_latitude')
+        dic['data'] = self._get_gate_geographic()[1]
+        return dic
+
+    @property
+    def gate_altitude(self):
+        dic = get_metadata('gate_altitude')
+        dic['data'] = self._get_gate_geographic()[2]
+        return dic
+
+    def init_gate_x_y_z(self):
+        """
+        Recalculate the gate_x, gate_y and gate_z and the geographic gate
+        locations when next accessed.
+
+        Call this method after modifying the range, azimuth or elevation data
+        in place.  Replacing these arrays is detected automatically.
+        """
+        self._gate_cartesian = None
+        self._gate_geographic = None
+
+    def init_gate_longitude_latitude(self):
+        """
+        Recalculate the gate_longitude, gate_latitude and gate_altitude when
+        next accessed.
+
+        Call this method after modifying the longitude, latitude or altitude
+        data in place.  Replacing these arrays is detected automatically.
+        """
+        self._gate_geographic = None
+
+    # private functions for calculating and caching gate coordinates
+
+    def _get_gate_cartesian(self):
+        """ Return the cached Cartesian gate locations, x, y, z. """
+        sources = _geometry_sources(self.range, self.azimuth, self.elevation)
+        cache = getattr(self, '_gate_cartesian', None)
+        if cache is None or not _same_sources(cache[0], sources):
+            key = _geometry_key(self.range, self.azimuth, self.elevation)
+            cache = _SHARED_GATE_COORDINATES.get(key)
+            if cache is None:
+                x, y, z = antenna_vectors_to_cartesian(
+                    self.range['data'], self.azimuth['data'],
+                    self.elevation['data'], dtype='float32')
+                cache = _GateCoordinates(key, x, y, z)
+                _SHARED_GATE_COORDINATES[key] = cache
+            cache = self._gate_cartesian = (sources, cache)
+        return cache[1].arrays
+
+    def _get_gate_geographic(self):
+        """ Return the cached geographic gate locations, lon, lat, alt. """
+        x, y, z = self._get_gate_cartesian()
+        dics = (self.range, self.azimuth, self.elevation,
+                self.longitude, self.latitude, self.altitude)
+        sources = _geometry_sources(*dics)
+        cache = getattr(self, '_gate_geographic', None)
+        if cache is None or not _same_sources(cache[0], sources):
+            key = _geometry_key(*dics)
+            cache = _SHARED_GATE_COORDINATES.get(key)
+            if cache is None:
+                lon_0 = self.longitude['data']
+                lat_0 = self.latitude['data']
+                alt_0 = self.altitude['data']
+                if lat_0.size != 1:
+                    # moving platform, one location per ray
+                    lon_0 = lon_0.reshape(-1, 1)
+                    lat_0 = lat_0.reshape(-1, 1)
+                    alt_0 = alt_0.reshape(-1, 1)
+                lon, lat = cartesian_to_geographic_aeqd(
+                    x.astype('float64'), y.astype('float64'), lon_0, lat_0)
+                alt = z + alt_0
+                cache = _GateCoordinates(
+                    key, lon.astype('float32'), lat.astype('float32'),
+                    alt.astype('float32'))
+                _SHARED_GATE_COORDINATES[key] = cache
+            cache = self._gate_geographic = (sources, cache)
+        return cache[1].arrays
+
     # private functions for checking limits, etc.
     def _check_sweep_in_range(self, sweep):
         """ Check that a sweep number is in range. """
@@ -737,6 +873,45 @@ class Radar(object):
                      radar_calibration=radar_calibration)
 
 
+class _GateCoordinates(object):
+    """ Read only gate coordinate arrays for a given geometry key. """
+
+    def __init__(self, key, *arrays):
+        """ initialize. """
+        for array in arrays:
+            array.flags.writeable = False
+        self.key = key
+        self.arrays = arrays
+
+    def __deepcopy__(self, memo):
+        """ The arrays are read only, copies can share them. """
+        return self
+
+
+def _geometry_sources(*dics):
+    """ Return the data arrays from which gate coordinates are calculated. """
+    return tuple(dic['data'] for dic in dics)
+
+
+def _same_sources(sources, other):
+    """ True when two sets of data arrays are the same objects. """
+    return all(a is b for a, b in zip(sources, other))
+
+
+def _geometry_key(*dics):
+    """
+    Return a key which identifies the data in a set of dictionaries.  The
+    data is hashed, this is only done when the cached gate coordinates of a
+    radar are invalidated.
+    """
+    sha = hashlib.sha1()
+    for dic in dics:
+        data = np.ascontiguousarray(np.ma.getdata(dic['data']))
+        sha.update(str((data.dtype.str, data.shape)).encode('ascii'))
+        sha.update(data.tobytes())
+    return sha.hexdigest()
+
+
 def is_vpt(radar, offset=0.5):
     """
     Determine if a Radar appears to be a vertical pointing scan.
@@ -0,0 +1,85 @@
+""" Unit Tests for Py-ART's core/packed.py module. """
+
+import numpy as np
+from numpy.testing import assert_almost_equal, assert_raises
+
+from pyart.core.packed import PackedField
+
+
+def make_packed_field():
+    """ Return a PackedField with a few masked gates. """
+    packed = np.array([[0, 1, 2], [3, 4, 255]], dtype='uint8')
+    return PackedField(
+        {'units': 'dBZ', 'data': 'replaced'}, packed, 0.5, -1.,
+        fill_value=0, valid_max=254)
+
+
+def test_packed_field_keys():
+    dic = make_packed_field()
+    assert len(dic) == 2
+    assert sorted(dic.keys()) == ['data', 'units']
+    assert 'data' in dic
+    assert dic.has_key('units')
+    assert dic.packed is not None
+    assert 'Packed(uint8)' in str(dic)
+
+
+def test_packed_field_unpack():
+    dic = make_packed_field()
+    data = dic['data']
+    assert dic.packed is None
+    assert data.dtype == np.float32
+    assert_almost_equal(data.data[0, 1:], [-0.5, 0.])
+    assert_almost_equal(data.data[1, :2], [0.5, 1.])
+    assert np.all(data.mask == [[True, False, False], [False, False, True]])
+    assert dic['data'] is data
+    assert 'Packed' not in str(dic)
+
+
+def test_packed_field_get_packed():
+    dic = make_packed_field()
+    packed = dic.get_packed()
+    assert packed.dtype == np.uint8
+    assert np.all(packed == [[0, 1, 2], [3, 4, 0]])
+    packed = dic.get_packed(fill_value=255)
+    assert np.all(packed == [[255, 1, 2], [3, 4, 255]])
+    assert dic.packed is not None
+
+
+def test_packed_field_set_data():
+    dic = make_packed_field()
+    dic['data'] = np.zeros((2, 3))
+    assert dic.packed is None
+    assert np.all(dic['data'] == 0)
+
+    dic = make_packed_field()
+    del dic['data']
+    assert 'data' not in dic
+    assert len(dic) == 1
+    assert_raises(KeyError, dic.__getitem__, 'data')
+
+
+def test_packed_field_copy():
+    dic = make_packed_field()
+    dic2 = dic.copy()
+    assert isinstance(dic2, PackedField)
+    assert dic2.packed is dic.packed
+    dic2['units'] = 'm/s'
+    assert dic['units'] == 'dBZ'
+    data = dic2['data']
+    assert dic.packed is not None
+    assert isinstance(dic.copy(), PackedField)
+    assert isinstance(dic2.copy(), dict)
+    assert dic2.copy()['data'] is data
+
+
+def test_packed_field_packed_scale():
+    packed = np.arange(256, dtype='uint8').reshape(16, 16)
+    scale, offset = np.float32(2.), np.float32(66.)
+    dic = PackedField({}, packed, 1. / scale, -offset / scale, fill_value=0,
+                      packed_scale=scale, packed_offset=offset)
+    expected = (packed.astype('float32') - offset) / scale
+    data = dic.copy()['data']
+    assert data.dtype == np.float32
+    assert np.all(data.data == expected)
+    assert_almost_equal(data.data, packed * dic.scale_factor + dic.add_offset)
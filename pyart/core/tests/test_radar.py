@@ -1,5 +1,6 @@
 """ Unit Tests for Py-ART's core/radar.py module. """
 
+import gc
 import sys
 # we need a class which excepts str for writing in Python 2 and 3
 try:
@@ -9,7 +10,7 @@ except ImportError:
 import inspect
 
 import numpy as np
-from numpy.testing import assert_raises
+from numpy.testing import assert_raises, assert_allclose
 import pyart
 
 
@@ -21,6 +22,126 @@ def test_rays_per_sweep_attribute():
     assert rays_per_sweep['data'][0] == 360
 
 
+def test_gate_x_y_z_attributes():
+    radar = pyart.testing.make_target_radar()
+    x, y, z = pyart.io.common.radar_coords_to_cart(
+        radar.range['data'][np.newaxis, :].astype('float64') / 1000.,
+        radar.azimuth['data'][:, np.newaxis].astype('float64'),
+        radar.elevation['data'][:, np.newaxis].astype('float64'))
+    for attr, ref in [('gate_x', x), ('gate_y', y), ('gate_z', z)]:
+        dic = getattr(radar, attr)
+        assert isinstance(dic, dict)
+        assert 'units' in dic
+        assert dic['data'].shape == (radar.nrays, radar.ngates)
+        assert dic['data'].dtype == np.float32
+        assert_allclose(dic['data'], ref, atol=0.01)
+
+
+def test_gate_longitude_latitude_altitude_attributes():
+    radar = pyart.testing.make_target_radar()
+    radar.latitude['data'][0] = 36.0
+    radar.longitude['data'][0] = -97.0
+    radar.altitude['data'][0] = 200.0
+    for attr in ['gate_longitude', 'gate_latitude', 'gate_altitude']:
+        dic = getattr(radar, attr)
+        assert dic['data'].shape == (radar.nrays, radar.ngates)
+        assert dic['data'].dtype == np.float32
+    assert_allclose(radar.gate_longitude['data'][:, 0], -97.0, atol=1e-4)
+    assert_allclose(radar.gate_latitude['data'][:, 0], 36.0, atol=1e-4)
+    assert_allclose(radar.gate_altitude['data'],
+                    radar.gate_z['data'] + 200.0, atol=0.01)
+
+    # ray pointing north, latitude increases, longitude is constant
+    assert_allclose(radar.gate_longitude['data'][0], -97.0, atol=1e-4)
+    assert np.all(np.diff(radar.gate_latitude['data'][0]) > 0)
+
+    # the geographic locations are updated when the radar is moved
+    radar.latitude['data'] = np.array([40.0])
+    assert_allclose(radar.gate_latitude['data'][:, 0], 40.0, atol=1e-4)
+    radar.latitude['data'][0] = 42.0
+    radar.init_gate_longitude_latitude()
+    assert_allclose(radar.gate_latitude['data'][:, 0], 42.0, atol=1e-4)
+
+
+def test_gate_coordinates_cached():
+    radar = pyart.testing.make_target_radar()
+    assert radar.gate_x['data'] is radar.gate_x['data']
+    assert radar.gate_latitude['data'] is radar.gate_latitude['data']
+
+    # cached arrays are read only
+    assert_raises(ValueError, radar.gate_x['data'].__setitem__, 0, 1.)
+
+    # radars with identical geometry share the cache
+    radar2 = pyart.testing.make_target_radar()
+    assert radar.gate_z['data'] is radar2.gate_z['data']
+
+
+def test_gate_coordinates_shared():
+    shared = pyart.core.radar._SHARED_GATE_COORDINATES
+    radar = pyart.testing.make_empty_ppi_radar(7, 11, 2)
+    radar2 = pyart.testing.make_empty_ppi_radar(7, 11, 2)
+    radar.gate_x
+    nentries = len(shared)
+    radar2.gate_x
+    assert len(shared) == nentries
+    assert radar._gate_cartesian[1] is radar2._gate_cartesian[1]
+
+    # entries are removed when no radar references them
+    key = radar._gate_cartesian[1].key
+    assert key in shared
+    del radar, radar2
+    gc.collect()
+    assert key not in shared
+
+
+def test_gate_coordinates_key_not_recalculated():
+    radar = pyart.testing.make_target_radar()
+    calls = []
+    geometry_key = pyart.core.radar._geometry_key
+
+    def counting_geometry_key(*dics):
+        calls.append(len(dics))
+        return geometry_key(*dics)
+
+    pyart.core.radar._geometry_key = counting_geometry_key
+    try:
+        radar.gate_x
+        radar.gate_y
+        radar.gate_z
+        assert len(calls) == 1
+        radar.gate_latitude
+        radar.gate_longitude
+        assert len(calls) == 2
+        radar.init_gate_x_y_z()
+        radar.gate_x
+        assert len(calls) == 3
+    finally:
+        pyart.core.radar._geometry_key = geometry_key
+
+
+def test_gate_coordinates_invalidated():
+    radar = pyart.testing.make_target_radar()
+    gate_x = radar.gate_x['data']
+    gate_z = radar.gate_z['data']
+
+    radar.azimuth['data'] = radar.azimuth['data'] + 10.
+    assert radar.gate_x['data'] is not gate_x
+    assert np.any(radar.gate_x['data'] != gate_x)
+
+    # in place changes require the cache to be reset
+    radar.elevation['data'][:] = 5.
+    radar.init_gate_x_y_z()
+    assert np.all(radar.gate_z['data'][:, 1:] > gate_z[:, 1:])
+
+    radar.range['data'][:] *= 2.
+    radar.init_gate_x_y_z()
+    x, y, z = pyart.io.common.radar_coords_to_cart(
+        radar.range['data'][np.newaxis, :].astype('float64') / 1000.,
+        radar.azimuth['data'][:, np.newaxis].astype('float64'),
+        radar.elevation['data'][:, np.newaxis].astype('float64'))
+    assert_allclose(radar.gate_x['data'], x, atol=0.01)
+
+
 def test_iterators():
     radar = pyart.testing.make_empty_ppi_radar(30, 20, 5)
     radar.fields['reflectivity'] = {
@@ -0,0 +1,60 @@
+""" Unit Tests for Py-ART's core/transforms.py module. """
+
+import numpy as np
+from numpy.testing import assert_almost_equal, assert_allclose
+
+from pyart.core import transforms
+
+
+def test_antenna_to_cartesian():
+    x, y, z = transforms.antenna_to_cartesian(0, 0, 0)
+    assert_almost_equal(x, 0)
+    assert_almost_equal(y, 0)
+    assert_almost_equal(z, 0)
+
+    x, y, z = transforms.antenna_to_cartesian(1, 90, 0)
+    assert_almost_equal(x, 1000., 1)
+    assert_almost_equal(y, 0, 1)
+    assert_almost_equal(z, 0.0588, 3)
+
+
+def test_antenna_vectors_to_cartesian():
+    ranges = np.array([0, 1000., 2000.])
+    azimuths = np.array([0., 90., 180., 270.])
+    elevations = np.array([0., 0., 1., 1.])
+    x, y, z = transforms.antenna_vectors_to_cartesian(
+        ranges, azimuths, elevations)
+    assert x.shape == (4, 3)
+    assert y.shape == (4, 3)
+    assert z.shape == (4, 3)
+
+    rg, azg = np.meshgrid(ranges, azimuths)
+    rg, eleg = np.meshgrid(ranges, elevations)
+    ref_x, ref_y, ref_z = transforms.antenna_to_cartesian(
+        rg / 1000., azg, eleg)
+    assert_allclose(x, ref_x)
+    assert_allclose(y, ref_y)
+    assert_allclose(z, ref_z)
+
+    x, y, z = transforms.antenna_vectors_to_cartesian(
+        ranges, azimuths, elevations, dtype='float32')
+    assert x.dtype == np.float32
+
+
+def test_cartesian_to_geographic_aeqd():
+    lon, lat = transforms.cartesian_to_geographic_aeqd(0, 0, -97.0, 36.0)
+    assert_almost_equal(lon, -97.0)
+    assert_almost_equal(lat, 36.0)
+
+    # one degree of latitude north of the origin
+    dist = 6371.0 * 1000.0 * np.pi / 180.
+    lon, lat = transforms.cartesian_to_geographic_aeqd(0, dist, -97.0, 36.0)
+    assert_almost_equal(lon, -97.0)
+    assert_almost_equal(lat, 37.0)
+
+    x = np.array([0, 1000., -1000.])
+    y = np.array([0, 1000., 2000.])
+    lon, lat = transforms.cartesian_to_geographic_aeqd(x, y, -97.0, 36.0)
+    assert lon.shape == (3, )
+    assert lon[1] > -97.0
+    assert lon[2] < -97.0
@@ -0,0 +1,167 @@
+"""
+pyart.core.transforms
+=====================
+
+Transformations between antenna, Cartesian and geographic coordinate systems.
+
+.. autosummary::
+    :toctree: generated/
+
+    antenna_to_cartesian
+    antenna_vectors_to_cartesian
+    cartesian_to_geographic_aeqd
+
+"""
+
+import numpy as np
+
+PI = np.pi
+
+
+def antenna_to_cartesian(ranges, azimuths, elevations):
+    """
+    Return Cartesian coordinates from antenna coordinates.
+
+    Parameters
+    ----------
+    ranges : array
+        Distances to the center of the radar gates (bins) in kilometers.
+    azimuths : array
+        Azimuth angle of the radar in degrees.
+    elevations : array
+        Elevation angle of the radar in degrees.
+
+    Returns
+    -------
+    x, y, z : array
+        Cartesian coordinates in meters from the radar.
+
+    Notes
+    -----
+    The calculation for Cartesian coordinate is adapted from equations
+    2.28(b) and 2.28(c) of Doviak and Zrnic [1]_ assuming a
+    standard atmosphere (4/3 Earth's radius model).
+
+    .. math::
+
+        z = \\sqrt{r^2+R^2+r*R*sin(\\theta_e)} - R
+
+        s = R * arcsin(\\frac{r*cos(\\theta_e)}{R+z})
+
+        x = s * sin(\\theta_a)
+
+        y = s * cos(\\theta_a)
+
+    Where r is the distance from the radar to the center of the gate,
+    :math:`\\theta_a` is the azimuth angle, :math:`\\theta_e` is the
+    elevation angle, s is the arc length, and R is the effective radius
+    of the earth, taken to be 4/3 the mean radius of earth (6371 km).
+
+    References
+    ----------
+    .. [1] Doviak and Zrnic, Doppler Radar and Weather Observations, Second
+        Edition, 1993, p. 21.
+
+    """
+    theta_e = elevations * PI / 180.0   # elevation angle in radians.
+    theta_a = azimuths * PI / 180.0     # azimuth angle in radians.
+    R = 6371.0 * 1000.0 * 4.0 / 3.0     # effective radius of earth in meters.
+    r = ranges * 1000.0                 # distances to gates in meters.
+
+    z = (r ** 2 + R ** 2 + 2.0 * r * R * np.sin(theta_e)) ** 0.5 - R
+    s = R * np.arcsin(r * np.cos(theta_e) / (R + z))  # arc length in m.
+    x = s * np.sin(theta_a)
+    y = s * np.cos(theta_a)
+    return x, y, z
+
+
+def antenna_vectors_to_cartesian(ranges, azimuths, elevations,
+                                 dtype='float64'):
+    """
+    Calculate Cartesian coordinates for all gates in a radar volume.
+
+    The 1D range, azimuth and elevation vectors are broadcast against each
+    other, no 2D meshgrid of the antenna coordinates is created.  See
+    :py:func:`antenna_to_cartesian` for details on the calculation.
+
+    Parameters
+    ----------
+    ranges : array, 1D.
+        Distances to the center of the radar gates (bins) in meters.
+    azimuths : array, 1D.
+        Azimuth angle of each ray in degrees.
+    elevations : array, 1D.
+        Elevation angle of each ray in degrees.
+    dtype : str or dtype
+        Data type of the returned arrays.  The calculation is always performed
+        in double precision.
+
+    Returns
+    -------
+    x, y, z : array, 2D
+        Cartesian coordinates in meters from the radar to the center of each
+        gate, dimensions are ordered as nrays, ngates.
+
+    """
+    ranges = np.asarray(ranges, dtype='float64')[np.newaxis, :]
+    azimuths = np.asarray(azimuths, dtype='float64')[:, np.newaxis]
+    elevations = np.asarray(elevations, dtype='float64')[:, np.newaxis]
+    x, y, z = antenna_to_cartesian(ranges / 1000., azimuths, elevations)
+    return x.astype(dtype), y.astype(dtype), z.astype(dtype)
+
+
+def cartesian_to_geographic_aeqd(x, y, lon_0, lat_0, R=6371.0 * 1000.0):
+    """
+    Azimuthal equidistant Cartesian to geographic coordinate transform.
+
+    Transform a set of Cartesian/Cartographic coordinates (x, y) to
+    geographic coordinate system (lat, lon) using a azimuthal equidistant
+    map projection [1]_.
+
+    .. math::
+
+        c = \\sqrt(x^2 + y^2)/R
+
+        azi = \\arctan2(y,x) \\text{  # from east to north}
+
+        lat = \\arcsin(\\cos(c)*\\sin(lat0)+\\sin(azi)*\\sin(c)*\\cos(lat0))
+
+        lon = \\arctan2(\\cos(azi)*\\sin(c),\\cos(c)*\\cos(lat0)-
+                        \\sin(azi)*\\sin(c)*\\sin(lat0)) + lon0
+
+    Where x, y are the Cartesian position from the center of projection;
+    lat, lon the corresponding latitude and longitude; lat0, lon0 the latitude
+    and longitude of the center of the projection; R the radius of the earth.
+
+    Parameters
+    ----------
+    x, y : array
+        Cartesian coordinates in the same units as R, typically meters.
+    lon_0, lat_0 : float or array
+        Longitude and latitude, in degrees, of the center of the projection.
+        Arrays must be broadcastable against x and y.
+    R : float
+        Earth radius in the same units as x and y. The default value is in
+        units of meters.
+
+    Returns
+    -------
+    lon, lat : array
+        Longitude and latitude of Cartesian coordinates in degrees.
+
+    References
+    ----------
+    .. [1] Snyder, J. P. Map Projections--A Working Manual. U. S. Geological
+        Survey Professional Paper 1395, 1987, pp. 191-202.
+
+    """
+    c = np.sqrt(x * x + y * y) / R
+    phi_0 = lat_0 * PI / 180.
+    azi = np.arctan2(y, x)  # from east to north
+
+    lat = np.arcsin(np.cos(c) * np.sin(phi_0) +
+                    np.sin(azi) * np.sin(c) * np.cos(phi_0)) * 180. / PI
+    lon = (np.arctan2(np.cos(azi) * np.sin(c), np.cos(c) * np.cos(phi_0) -
+           np.sin(azi) * np.sin(c) * np.sin(phi_0)) * 180. / PI + lon_0)
+    lon = np.fmod(lon + 180., 360.) - 180.
+    return lon, lat
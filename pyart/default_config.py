@@ -301,6 +301,32 @@ DEFAULT_METADATA = {
         'units': 'meters',
         'positive': 'up'},
 
+    # Metadata for radar gate location attributes
+    'gate_x': {
+        'long_name': 'Cartesian x location of gate with origin at the radar',
+        'units': 'meters'},
+
+    'gate_y': {
+        'long_name': 'Cartesian y location of gate with origin at the radar',
+        'units': 'meters'},
+
+    'gate_z': {
+        'long_name': 'Cartesian z location of gate with origin at the radar',
+        'units': 'meters'},
+
+    'gate_longitude': {
+        'long_name': 'Longitude of radar gate',
+        'units': 'degrees_east'},
+
+    'gate_latitude': {
+        'long_name': 'Latitude of radar gate',
+        'units': 'degrees_north'},
+
+    'gate_altitude': {
+        'long_name': 'Altitude of radar gate',
+        'units': 'meters',
+        'positive': 'up'},
+
     # Metadata for instrument_parameter dictionary
     'prt_mode': {
         'comments': ('Pulsing mode Options are: "fixed", "staggered", '
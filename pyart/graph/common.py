@@ -45,7 +45,8 @@ from netCDF4 import num2date
 
 PI = 3.141592653589793
 
-from ..io.common import dms_to_d, radar_coords_to_cart
+from ..io.common import dms_to_d, radar_coords_to_cart  # noqa
+from ..core.transforms import antenna_vectors_to_cartesian
 
 
 def corner_to_point(corner, point):
@@ -138,9 +139,7 @@ def sweep_coords_to_cart(ranges, azimuths, elevations, edges=False):
             elevations = _interpolate_elevation_edges(elevations)
         if len(azimuths) != 1:
             azimuths = _interpolate_azimuth_edges(azimuths)
-    rg, azg = np.meshgrid(ranges, azimuths)
-    rg, eleg = np.meshgrid(ranges, elevations)
-    return radar_coords_to_cart(rg / 1000., azg, eleg)
+    return antenna_vectors_to_cartesian(ranges, azimuths, elevations)
 
 
 def _interpolate_range_edges(ranges):
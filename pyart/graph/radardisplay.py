@@ -122,11 +122,9 @@ class RadarDisplay(object):
     def _calculate_localization(self, radar):
         """ Calculate self.x, self.y, self.z and self.loc. """
         # x, y, z attributes: cartesian location for a sweep in km.
-        rg, azg = np.meshgrid(self.ranges, self.azimuths)
-        rg, eleg = np.meshgrid(self.ranges, self.elevations)
-
-        self.x, self.y, self.z = common.radar_coords_to_cart(rg / 1000.0, azg,
-                                                             eleg)
+        self.x = radar.gate_x['data']
+        self.y = radar.gate_y['data']
+        self.z = radar.gate_z['data']
         self.x = self.x + self.shift[0]
         self.y = self.y + self.shift[1]
 
@@ -1064,9 +1062,21 @@ class RadarDisplay(object):
             in_trans = self.antenna_transition[start:end]
             azimuths = azimuths[in_trans == 0]
             elevations = elevations[in_trans == 0]
+        else:
+            in_trans = None
 
-        x, y, z = common.sweep_coords_to_cart(
-            self.ranges, azimuths, elevations, edges=edges)
+        if edges:
+            x, y, z = common.sweep_coords_to_cart(
+                self.ranges, azimuths, elevations, edges=edges)
+        else:
+            # gate centers, use the locations cached by the radar
+            x = self._radar.gate_x['data'][start:end]
+            y = self._radar.gate_y['data'][start:end]
+            z = self._radar.gate_z['data'][start:end]
+            if in_trans is not None:
+                x = x[in_trans == 0]
+                y = y[in_trans == 0]
+                z = z[in_trans == 0]
         x = (x + self.shift[0]) / 1000.0
         y = (y + self.shift[1]) / 1000.0
         z = z / 1000.0
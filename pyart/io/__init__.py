@@ -19,12 +19,14 @@ for the format in question should be used.
     :toctree: generated/
 
     read
+    read_many
     read_rsl
     read_mdv
     read_sigmet
     read_cfradial
     read_chl
     read_nexrad_archive
+    read_nexrad_stream
     read_nexrad_cdm
     read_nexrad_level3
     read_uf
@@ -64,6 +66,8 @@ Special use
 
     add_2d_latlon_axis
     prepare_for_read
+    NEXRADLevel2Stream
+    nexrad_level3_stacked_data
 
 """
 
@@ -76,13 +80,16 @@ from .mdv_radar import read_mdv
 from .sigmet import read_sigmet
 from .chl import read_chl
 from .cfradial import read_cfradial, write_cfradial
-from .nexrad_archive import read_nexrad_archive
+from .nexrad_archive import read_nexrad_archive, read_nexrad_stream
+from .nexrad_level2 import NEXRADLevel2Stream
 from .nexrad_cdm import read_nexrad_cdm
 from .nexradl3_read import read_nexrad_level3
+from .nexrad_level3 import nexrad_level3_stacked_data
 from .uf import read_uf
 from .uf_write import write_uf
 from .grid_io import read_grid, write_grid
 from .auto_read import read
+from .multi_read import read_many
 from .mdv_grid import write_grid_mdv, read_grid_mdv
 from .common import add_2d_latlon_axis, prepare_for_read
 
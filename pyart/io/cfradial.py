@@ -18,7 +18,14 @@ Utilities for reading CF/Radial files.
     _find_all_meta_group_vars
     _ncvar_to_dict
     _unpack_variable_gate_field_dic
+    _hyperslab_selection
+    _select_variable_gate_rays
     _create_ncvar
+    _encode_ncvar
+    _write_ncvar
+    _pack_data
+    _is_packed_for_writing
+    _packed_field_attributes
 
 """
 
@@ -32,10 +39,27 @@ import netCDF4
 
 from ..config import FileMetadata
 from .common import stringarray_to_chararray, _test_arguments
+from .common import _unpack_variable_gates
 from ..core.radar import Radar
+from ..core.packed import PackedField
 from .lazydict import LazyLoadDict
 
 
+# Radar dictionary keys which can be used to change the default values of
+# the netCDF createVariable arguments, some of these map to netCDF special
+# attributes, other are Py-ART conventions.
+_NCVAR_SPECIAL_KEYS = {
+    '_Zlib': 'zlib',
+    '_DeflateLevel': 'complevel',
+    '_Shuffle': 'shuffle',
+    '_Fletcher32': 'fletcher32',
+    '_Continguous': 'contiguous',
+    '_ChunkSizes': 'chunksizes',
+    '_Endianness': 'endian',
+    '_Least_significant_digit': 'least_significant_digit',
+    '_FillValue': 'fill_value',
+}
+
 # Variables and dimensions in the instrument_parameter convention and
 # radar_parameters sub-convention that will be read from and written to
 # CfRadial files using Py-ART.
@@ -70,7 +94,8 @@ _INSTRUMENT_PARAMS_DIMS = {
 
 def read_cfradial(filename, field_names=None, additional_metadata=None,
                   file_field_names=False, exclude_fields=None,
-                  delay_field_loading=False, **kwargs):
+                  delay_field_loading=False, sweeps=None, gate_range=None,
+                  **kwargs):
     """
     Read a Cfradial netCDF file.
 
@@ -100,6 +125,16 @@ def read_cfradial(filename, field_names=None, additional_metadata=None,
         LazyLoadDict objects not dict objects.  Delayed field loading will not
         provide any speedup in file where the number of gates vary between
         rays (ngates_vary=True) and is not recommended.
+    sweeps : list or None, optional
+        Sweeps (0 based) to read from the file.  None, the default, reads all
+        sweeps.  Only the rays in the requested sweeps are read from the
+        file, the sweep_number attribute of the returned radar gives the
+        sweep number of each sweep.
+    gate_range : tuple of two floats or None, optional
+        Minimum and maximum range, in meters, of the gates to read from the
+        file.  None, the default, reads all gates.  Combined with `sweeps`
+        and `delay_field_loading` only the hyperslab of each field variable
+        which is needed is read.
 
     Returns
     -------
@@ -122,6 +157,13 @@ def read_cfradial(filename, field_names=None, additional_metadata=None,
     ncobj = netCDF4.Dataset(filename)
     ncvars = ncobj.variables
 
+    # determine the rays and gates to read
+    try:
+        selection = _hyperslab_selection(ncvars, sweeps, gate_range)
+    except ValueError:
+        ncobj.close()
+        raise
+
     # 4.1 Global attribute -> move to metadata dictionary
     metadata = dict([(k, getattr(ncobj, k)) for k in ncobj.ncattrs()])
     if 'n_gates_vary' in metadata:
@@ -146,44 +188,63 @@ def read_cfradial(filename, field_names=None, additional_metadata=None,
             metadata[var] = default_value
 
     # 4.4 coordinate variables -> create attribute dictionaries
-    time = _ncvar_to_dict(ncvars['time'])
-    _range = _ncvar_to_dict(ncvars['range'])
+    time = _ncvar_to_dict(ncvars['time'], selection=selection)
+    _range = _ncvar_to_dict(ncvars['range'], selection=selection)
+    if selection is not None and 'range' in selection:
+        _range['meters_to_center_of_first_gate'] = _range['data'][0]
 
     # 4.5 Ray dimension variables
 
     # 4.6 Location variables -> create attribute dictionaries
-    latitude = _ncvar_to_dict(ncvars['latitude'])
-    longitude = _ncvar_to_dict(ncvars['longitude'])
-    altitude = _ncvar_to_dict(ncvars['altitude'])
+    latitude = _ncvar_to_dict(ncvars['latitude'], selection=selection)
+    longitude = _ncvar_to_dict(ncvars['longitude'], selection=selection)
+    altitude = _ncvar_to_dict(ncvars['altitude'], selection=selection)
     if 'altitude_agl' in ncvars:
-        altitude_agl = _ncvar_to_dict(ncvars['altitude_agl'])
+        altitude_agl = _ncvar_to_dict(
+            ncvars['altitude_agl'], selection=selection)
     else:
         altitude_agl = None
 
     # 4.7 Sweep variables -> create atrribute dictionaries
-    sweep_mode = _ncvar_to_dict(ncvars['sweep_mode'])
-    fixed_angle = _ncvar_to_dict(ncvars['fixed_angle'])
-    sweep_start_ray_index = _ncvar_to_dict(ncvars['sweep_start_ray_index'])
-    sweep_end_ray_index = _ncvar_to_dict(ncvars['sweep_end_ray_index'])
- 
+    sweep_mode = _ncvar_to_dict(ncvars['sweep_mode'], selection=selection)
+    fixed_angle = _ncvar_to_dict(ncvars['fixed_angle'], selection=selection)
+    sweep_start_ray_index = _ncvar_to_dict(
+        ncvars['sweep_start_ray_index'], selection=selection)
+    sweep_end_ray_index = _ncvar_to_dict(
+        ncvars['sweep_end_ray_index'], selection=selection)
+    if selection is not None and 'sweep' in selection:
+        # renumber the rays of the selected sweeps
+        start = sweep_start_ray_index['data']
+        end = sweep_end_ray_index['data']
+        nrays = end - start + 1
+        sweep_end_ray_index['data'] = (np.cumsum(nrays) - 1).astype(end.dtype)
+        sweep_start_ray_index['data'] = (
+            sweep_end_ray_index['data'] - nrays + 1).astype(start.dtype)
+
     if 'sweep_number' in ncvars:
-        sweep_number = _ncvar_to_dict(ncvars['sweep_number'])
+        sweep_number = _ncvar_to_dict(
+            ncvars['sweep_number'], selection=selection)
     else:
-        nsweeps = len(sweep_start_ray_index['data'])
+        nsweeps = len(ncvars['sweep_start_ray_index'])
         sweep_number = filemetadata('sweep_number')
         sweep_number['data'] = np.arange(nsweeps, dtype='float32')
+        if selection is not None and 'sweep' in selection:
+            sweep_number['data'] = sweep_number['data'][selection['sweep']]
         warnings.warn("Warning: File violates CF/Radial convention. Missing sweep_number variable")
 
     if 'target_scan_rate' in ncvars:
-        target_scan_rate = _ncvar_to_dict(ncvars['target_scan_rate'])
+        target_scan_rate = _ncvar_to_dict(
+            ncvars['target_scan_rate'], selection=selection)
     else:
         target_scan_rate = None
     if 'rays_are_indexed' in ncvars:
-        rays_are_indexed = _ncvar_to_dict(ncvars['rays_are_indexed'])
+        rays_are_indexed = _ncvar_to_dict(
+            ncvars['rays_are_indexed'], selection=selection)
     else:
         rays_are_indexed = None
     if 'ray_angle_res' in ncvars:
-        ray_angle_res = _ncvar_to_dict(ncvars['ray_angle_res'])
+        ray_angle_res = _ncvar_to_dict(
+            ncvars['ray_angle_res'], selection=selection)
     else:
         ray_angle_res = None
 
@@ -217,52 +278,54 @@ def read_cfradial(filename, field_names=None, additional_metadata=None,
         scan_type = 'other'
 
     # 4.8 Sensor pointing variables -> create attribute dictionaries
-    azimuth = _ncvar_to_dict(ncvars['azimuth'])
-    elevation = _ncvar_to_dict(ncvars['elevation'])
+    azimuth = _ncvar_to_dict(ncvars['azimuth'], selection=selection)
+    elevation = _ncvar_to_dict(ncvars['elevation'], selection=selection)
     if 'scan_rate' in ncvars:
-        scan_rate = _ncvar_to_dict(ncvars['scan_rate'])
+        scan_rate = _ncvar_to_dict(ncvars['scan_rate'], selection=selection)
     else:
         scan_rate = None
 
     if 'antenna_transition' in ncvars:
-        antenna_transition = _ncvar_to_dict(ncvars['antenna_transition'])
+        antenna_transition = _ncvar_to_dict(
+            ncvars['antenna_transition'], selection=selection)
     else:
         antenna_transition = None
 
     # 4.9 Moving platform geo-reference variables
     # Aircraft specific varaibles
     if 'rotation' in ncvars:
-        rotation = _ncvar_to_dict(ncvars['rotation'])
+        rotation = _ncvar_to_dict(ncvars['rotation'], selection=selection)
     else:
         rotation = None
 
     if 'tilt' in ncvars:
-        tilt = _ncvar_to_dict(ncvars['tilt'])
+        tilt = _ncvar_to_dict(ncvars['tilt'], selection=selection)
     else:
         tilt = None
 
     if 'roll' in ncvars:
-        roll = _ncvar_to_dict(ncvars['roll'])
+        roll = _ncvar_to_dict(ncvars['roll'], selection=selection)
     else:
         roll = None
 
     if 'drift' in ncvars:
-        drift = _ncvar_to_dict(ncvars['drift'])
+        drift = _ncvar_to_dict(ncvars['drift'], selection=selection)
     else:
         drift = None
 
     if 'heading' in ncvars:
-        heading = _ncvar_to_dict(ncvars['heading'])
+        heading = _ncvar_to_dict(ncvars['heading'], selection=selection)
     else:
         heading = None
 
     if 'pitch' in ncvars:
-        pitch = _ncvar_to_dict(ncvars['pitch'])
+        pitch = _ncvar_to_dict(ncvars['pitch'], selection=selection)
     else:
         pitch = None
 
     if 'georefs_applied' in ncvars:
-        georefs_applied = _ncvar_to_dict(ncvars['georefs_applied'])
+        georefs_applied = _ncvar_to_dict(
+            ncvars['georefs_applied'], selection=selection)
     else:
         georefs_applied = None
 
@@ -283,20 +346,28 @@ def read_cfradial(filename, field_names=None, additional_metadata=None,
             if exclude_fields is not None and key in exclude_fields:
                 continue
             field_name = key
-        fields[field_name] = _ncvar_to_dict(ncvars[key], delay_field_loading)
+        fields[field_name] = _ncvar_to_dict(
+            ncvars[key], delay_field_loading, selection)
 
     if 'ray_n_gates' in ncvars:
-        shape = (len(ncvars['time']), len(ncvars['range']))
         ray_n_gates = ncvars['ray_n_gates'][:]
         ray_start_index = ncvars['ray_start_index'][:]
+        if selection is not None and 'time' in selection:
+            ray_n_gates, ray_start_index = _select_variable_gate_rays(
+                ray_n_gates, ray_start_index, selection['time'],
+                selection['n_points'])
+        shape = (len(ray_n_gates), len(ncvars['range']))
         for dic in fields.values():
             _unpack_variable_gate_field_dic(
                 dic, shape, ray_n_gates, ray_start_index)
+            if selection is not None and 'range' in selection:
+                dic['data'] = dic['data'][:, selection['range']]
 
     # 4.5 instrument_parameters sub-convention -> instrument_parameters dict
     # 4.6 radar_parameters sub-convention -> instrument_parameters dict
     keys = [k for k in _INSTRUMENT_PARAMS_DIMS.keys() if k in ncvars]
-    instrument_parameters = dict((k, _ncvar_to_dict(ncvars[k])) for k in keys)
+    instrument_parameters = dict(
+        (k, _ncvar_to_dict(ncvars[k], selection=selection)) for k in keys)
     if instrument_parameters == {}:  # if no parameters set to None
         instrument_parameters = None
 
@@ -336,12 +407,88 @@ def _find_all_meta_group_vars(ncvars, meta_group_name):
             v.meta_group == meta_group_name]
 
 
-def _ncvar_to_dict(ncvar, lazydict=False):
+def _hyperslab_selection(ncvars, sweeps, gate_range):
+    """
+    Return the indices of the rays and gates to read from a CF/Radial file.
+
+    The indices are returned as a dictionary keyed by dimension name, see
+    :py:class:`_NetCDFVariableDataExtractor`, or None when the entire file is
+    to be read.  The rays of each sweep are stored as a list of slices, one
+    for each run of consecutive sweeps, so that they can be read as
+    hyperslabs.
+
+    """
+    if sweeps is None and gate_range is None:
+        return None
+    selection = {}
+
+    if sweeps is not None:
+        start = np.atleast_1d(ncvars['sweep_start_ray_index'][:])
+        end = np.atleast_1d(ncvars['sweep_end_ray_index'][:])
+        sweeps = sorted(set(int(sweep) for sweep in sweeps))
+        if len(sweeps) == 0 or sweeps[0] < 0:
+            raise ValueError('sweeps must be non-negative sweep numbers')
+        if sweeps[-1] >= len(start):
+            raise ValueError(
+                'sweep %d not in file, which contains %d sweeps' %
+                (sweeps[-1], len(start)))
+        ray_slices = []
+        for sweep in sweeps:
+            first, last = int(start[sweep]), int(end[sweep]) + 1
+            if len(ray_slices) and ray_slices[-1].stop == first:
+                ray_slices[-1] = slice(ray_slices[-1].start, last)
+            else:
+                ray_slices.append(slice(first, last))
+        selection['sweep'] = np.array(sweeps)
+        selection['time'] = ray_slices
+
+        if 'ray_n_gates' in ncvars:
+            # gates of each run of rays in the n_points dimension
+            ray_n_gates = ncvars['ray_n_gates'][:]
+            ray_start_index = ncvars['ray_start_index'][:]
+            point_slices = []
+            for rays in ray_slices:
+                ray_start = ray_start_index[rays]
+                ray_stop = ray_start + ray_n_gates[rays]
+                point_slices.append(
+                    slice(int(ray_start.min()), int(ray_stop.max())))
+            selection['n_points'] = point_slices
+
+    if gate_range is not None:
+        min_range, max_range = gate_range
+        _range = np.atleast_1d(ncvars['range'][:])
+        gates = np.nonzero((_range >= min_range) & (_range <= max_range))[0]
+        if len(gates) == 0:
+            raise ValueError(
+                'no gates between %g and %g meters' % (min_range, max_range))
+        selection['range'] = slice(int(gates[0]), int(gates[-1]) + 1)
+    return selection
+
+
+def _select_variable_gate_rays(ray_n_gates, ray_start_index, ray_slices,
+                               point_slices):
+    """
+    Return the number of gates and start index of each selected ray.
+
+    The start indices are relative to the concatenation of the n_points
+    hyperslabs read for the runs of rays in `ray_slices`.
+    """
+    n_gates = []
+    start_index = []
+    offset = 0
+    for rays, points in zip(ray_slices, point_slices):
+        n_gates.append(ray_n_gates[rays])
+        start_index.append(ray_start_index[rays] - points.start + offset)
+        offset += points.stop - points.start
+    return np.concatenate(n_gates), np.concatenate(start_index)
+
+
+def _ncvar_to_dict(ncvar, lazydict=False, selection=None):
     """ Convert a NetCDF Dataset variable to a dictionary. """
     # copy all attribute except for scaling parameters
     d = dict((k, getattr(ncvar, k)) for k in ncvar.ncattrs()
              if k not in ['scale_factor', 'add_offset'])
-    data_extractor = _NetCDFVariableDataExtractor(ncvar)
+    data_extractor = _NetCDFVariableDataExtractor(ncvar, selection)
     if lazydict:
         d = LazyLoadDict(d)
         d.set_lazy('data', data_extractor)
@@ -358,34 +505,54 @@ class _NetCDFVariableDataExtractor(object):
     ----------
     ncvar : netCDF4.Variable
         NetCDF Variable from which data will be extracted.
+    selection : dict or None, optional
+        Indices to extract along the dimensions of the variable keyed by
+        dimension name, dimensions not in the dictionary are read in full.
+        Values are slices, integer arrays or a list of slices.  A list of
+        slices is read as one hyperslab per slice and the results are
+        concatenated along that dimension.  None reads the entire variable.
 
     """
 
-    def __init__(self, ncvar):
+    def __init__(self, ncvar, selection=None):
         """ initialize the object. """
         self.ncvar = ncvar
+        self.selection = selection
 
     def __call__(self):
         """ Return an array containing data from the stored variable. """
         # Use atleast_1d to force the array to be at minimum one dimensional,
         # some version of netCDF return scalar or scalar arrays for scalar
         # NetCDF variables.
-        return np.atleast_1d(self.ncvar[:])
+        dims = self.ncvar.dimensions
+        if self.selection is None or not any(
+                dim in self.selection for dim in dims):
+            return np.atleast_1d(self.ncvar[:])
+
+        index = [self.selection.get(dim, slice(None)) for dim in dims]
+        for axis, dim_index in enumerate(index):
+            if isinstance(dim_index, list):
+                pieces = []
+                for piece in dim_index:
+                    index[axis] = piece
+                    pieces.append(self.ncvar[tuple(index)])
+                if any(isinstance(p, np.ma.MaskedArray) for p in pieces):
+                    return np.ma.concatenate(pieces, axis=axis)
+                return np.concatenate(pieces, axis=axis)
+        return np.atleast_1d(self.ncvar[tuple(index)])
 
 
 def _unpack_variable_gate_field_dic(
         dic, shape, ray_n_gates, ray_start_index):
     """ Create a 2D array from a 1D field data, dic update in place """
-    fdata = dic['data']
-    data = np.ma.masked_all(shape, dtype=fdata.dtype)
-    for i, (gates, idx) in enumerate(zip(ray_n_gates, ray_start_index)):
-        data[i, :gates] = fdata[idx:idx+gates]
-    dic['data'] = data
+    dic['data'] = _unpack_variable_gates(
+        dic['data'], shape, ray_n_gates, ray_start_index)
     return
 
 
 def write_cfradial(filename, radar, format='NETCDF4', time_reference=None,
-                   arm_time_variables=False):
+                   arm_time_variables=False, field_chunks=None,
+                   complevel=None, shuffle=None, field_dtype=None):
     """
     Write a Radar object to a CF/Radial compliant netCDF file.
 
@@ -428,6 +595,29 @@ def write_cfradial(filename, radar, format='NETCDF4', time_reference=None,
     arm_time_variables : bool
         True to create the ARM standard time variables base_time and
         time_offset, False will not create these variables.
+    field_chunks : 'sweep', tuple or None, optional
+        Chunk shape of the field variables.  'sweep' uses chunks of
+        (rays in the longest sweep, ngates) so that a sweep is stored in at
+        most two chunks, a tuple gives the chunk shape explicitly.  None, the
+        default, uses the netCDF library default chunking.  Ignored for
+        netCDF3 formats.
+    complevel : int or None, optional
+        zlib compression level, 0 to 9, of the field variables, 0 disables
+        compression.  None, the default, uses the netCDF default of 4.
+    shuffle : bool or None, optional
+        True to apply the HDF5 shuffle filter to the field variables before
+        compression, False to not.  None, the default, applies the filter.
+    field_dtype : str, dtype or None, optional
+        Integer dtype, for example 'int16', to pack floating point fields
+        into using a scale and offset calculated from the field data.
+        Fields with a '_Write_as_dtype' key or packed data are written as
+        specified by those.  None, the default, writes fields in the dtype
+        of their data.
+
+    Notes
+    -----
+    Fields are packed, compressed and written one at a time, the netCDF
+    library performs the compression serially as each variable is written.
 
     """
     dataset = netCDF4.Dataset(filename, 'w', format=format)
@@ -515,8 +705,25 @@ def write_cfradial(filename, radar, format='NETCDF4', time_reference=None,
                       'antenna_transition', ('time', ))
 
     # fields
+    field_kwargs = {}
+    if complevel is not None:
+        field_kwargs['zlib'] = complevel > 0
+        field_kwargs['complevel'] = complevel
+    if shuffle is not None:
+        field_kwargs['shuffle'] = shuffle
+    if field_chunks == 'sweep':
+        rays_per_sweep = (radar.sweep_end_ray_index['data'] -
+                          radar.sweep_start_ray_index['data'] + 1)
+        field_kwargs['chunksizes'] = (
+            max(int(rays_per_sweep.max()), 1), radar.ngates)
+    elif field_chunks is not None:
+        field_kwargs['chunksizes'] = tuple(field_chunks)
+
+    # each field is encoded and written before the next is loaded so that
+    # only a single encoded field is held in memory
     for field, dic in radar.fields.items():
-        _create_ncvar(dic, dataset, field, ('time', 'range'))
+        encoded = _encode_ncvar(dic, dataset, field, field_kwargs, field_dtype)
+        _write_ncvar(encoded, dataset, field, ('time', 'range'))
 
     # sweep parameters
     _create_ncvar(radar.sweep_number, dataset, 'sweep_number', ('sweep', ))
@@ -685,51 +892,99 @@ def _create_ncvar(dic, dataset, name, dimensions):
         Dimension of variable.
 
     """
-    # create array from list, etc.
-    data = dic['data']
-    if isinstance(data, np.ndarray) is not True:
-        warnings.warn("Warning, converting non-array to array:%s" %  name)
-        data = np.array(data)
+    encoded = _encode_ncvar(dic, dataset, name)
+    _write_ncvar(encoded, dataset, name, dimensions)
+
+
+def _encode_ncvar(dic, dataset, name, defaults=None, write_as_dtype=None):
+    """
+    Prepare the data and arguments needed to create a netCDF variable.
+
+    Parameters
+    ----------
+    dic : dict
+        Radar dictionary to containing variable data and meta-data
+    dataset : Dataset
+        NetCDF dataset the variable will be created in.
+    name : str
+        Name of variable.
+    defaults : dict or None, optional
+        Default createVariable keyword arguments, these are overridden by
+        any special keys in dic.
+    write_as_dtype : str, dtype or None, optional
+        Integer dtype to pack floating point data into when dic does not
+        contain a '_Write_as_dtype' key.  None writes the data in its
+        native dtype.
+
+    Returns
+    -------
+    encoded : tuple
+        Data to write, netCDF dtype, createVariable keyword arguments,
+        attribute dictionary and True when the data is already in the
+        packed representation stored in the file.
+
+    """
+    # packed fields are written without requantizing the data
+    packed = _is_packed_for_writing(dic, dataset)
+    if packed:
+        data = dic.get_packed()
+        dic = _packed_field_attributes(dic)
+    else:
+        data = dic['data']
+        # create array from list, etc.
+        if isinstance(data, np.ndarray) is not True:
+            warnings.warn("Warning, converting non-array to array:%s" % name)
+            data = np.array(data)
 
     # convert string/unicode arrays to character arrays
-    if data.dtype.char is 'U':  # cast unicode arrays to char arrays
+    if data.dtype.char == 'U':  # cast unicode arrays to char arrays
         data = data.astype('S')
-    if data.dtype.char is 'S' and data.dtype != 'S1':
+    if data.dtype.char == 'S' and data.dtype != 'S1':
         data = stringarray_to_chararray(data)
 
     # determine netCDF variable arguments
-    special_keys = {
-        # dictionary keys which can be used to change the default values of
-        # createVariable arguments, some of these map to netCDF special
-        # attributes, other are Py-ART conventions.
-        '_Zlib': 'zlib',
-        '_DeflateLevel': 'complevel',
-        '_Shuffle': 'shuffle',
-        '_Fletcher32': 'fletcher32',
-        '_Continguous': 'contiguous',
-        '_ChunkSizes': 'chunksizes',
-        '_Endianness': 'endian',
-        '_Least_significant_digit': 'least_significant_digit',
-        '_FillValue': 'fill_value',
-    }
     kwargs = {'zlib': True}  # default is to use compression
-    for dic_key, kwargs_key in special_keys.items():
+    if defaults is not None:
+        kwargs.update(defaults)
+    for dic_key, kwargs_key in _NCVAR_SPECIAL_KEYS.items():
         if dic_key in dic:
             kwargs[kwargs_key] = dic[dic_key]
 
     # the _Write_as_dtype key can be used to specify the netCDF dtype
     if '_Write_as_dtype' in dic:
-        dtype = np.dtype(dic['_Write_as_dtype'])
+        write_as_dtype = dic['_Write_as_dtype']
+    elif packed or data.dtype.kind != 'f':
+        write_as_dtype = None
+    elif write_as_dtype is not None:
+        # do not add the scaling attributes to the radar dictionary
+        dic = dict((k, v) for k, v in dic.items() if k != 'data')
+        dic['data'] = data
+
+    raw = packed
+    if write_as_dtype is not None:
+        dtype = np.dtype(write_as_dtype)
         if np.issubdtype(dtype, np.integer):
             if 'scale_factor' not in dic and 'add_offset' not in dic:
-                # calculate scale and offset
+                # calculate scale and offset and pack the data
+                missing = dic.get('_FillValue', None)
                 scale, offset, fill = _calculate_scale_and_offset(dic, dtype)
                 dic['scale_factor'] = scale
                 dic['add_offset'] = offset
                 dic['_FillValue'] = fill
                 kwargs['fill_value'] = fill
+                data = _pack_data(data, dtype, scale, offset, fill, missing)
+                raw = True
     else:
         dtype = data.dtype
+    return data, dtype, kwargs, dic, raw
+
+
+def _write_ncvar(encoded, dataset, name, dimensions):
+    """
+    Create and fill a Variable in a netCDF Dataset object from the data and
+    arguments returned by :py:func:`_encode_ncvar`.
+    """
+    data, dtype, kwargs, dic, raw = encoded
 
     # create the dataset variable
     ncvar = dataset.createVariable(name, dtype, dimensions, **kwargs)
@@ -750,7 +1005,7 @@ def _create_ncvar(dic, dataset, name, dimensions):
 
     # set all attributes
     for key, value in dic.items():
-        if key in special_keys.keys():
+        if key in _NCVAR_SPECIAL_KEYS.keys():
             continue
         if key in ['data', 'long_name', 'units']:
             continue
@@ -768,7 +1023,56 @@ def _create_ncvar(dic, dataset, name, dimensions):
         else:
             ncvar[..., :data.shape[-1]] = data[:]
     else:
-        ncvar[:] = data[:]
+        if raw:
+            # data is already packed, restore automatic unpacking after
+            # writing so reads of the variable are masked and scaled
+            ncvar.set_auto_maskandscale(False)
+            ncvar[:] = data[:]
+            ncvar.set_auto_maskandscale(True)
+        else:
+            ncvar[:] = data[:]
+
+
+def _pack_data(data, dtype, scale, offset, fill, missing=None):
+    """
+    Pack floating point data into an integer dtype.
+
+    Masked and non-finite values, and values equal to missing when
+    specified, are set to fill.
+    """
+    values = np.ma.getdata(data)
+    mask = np.ma.getmaskarray(data) | ~np.isfinite(values)
+    if missing is not None:
+        mask |= values == missing
+    packed = (values - offset) / scale
+    np.around(packed, out=packed)
+    packed[mask] = fill
+    return packed.astype(dtype)
+
+
+def _is_packed_for_writing(dic, dataset):
+    """
+    Return True if the packed data in a field dictionary can be written
+    to a dataset without requantizing.
+    """
+    if not isinstance(dic, PackedField) or dic.packed is None:
+        return False
+    dtype = dic.packed.dtype
+    if '_Write_as_dtype' in dic and np.dtype(dic['_Write_as_dtype']) != dtype:
+        return False
+    if dataset.data_model != 'NETCDF4' and dtype.kind == 'u':
+        return False    # unsigned types require the netCDF4 data model
+    return dtype.kind in 'iu' and dtype.itemsize <= 4
+
+
+def _packed_field_attributes(dic):
+    """ Return the dictionary of a packed field without the data. """
+    attrs = dict((k, dic[k]) for k in dic.keys()
+                 if k not in ['data', '_Write_as_dtype'])
+    attrs['scale_factor'] = dic.dtype.type(dic.scale_factor)
+    attrs['add_offset'] = dic.dtype.type(dic.add_offset)
+    attrs['_FillValue'] = dic.packed.dtype.type(dic.fill_value)
+    return attrs
 
 
 def _calculate_scale_and_offset(dic, dtype, minimum=None, maximum=None):
@@ -11,6 +11,11 @@ Input/output routines common to many file formats.
     dms_to_d
     stringarray_to_chararray
     _test_arguments
+    _unpack_variable_gates
+    _read_buffer
+    _close_mmap
+    _gather_structures
+    _structure_dtype
     radar_coords_to_cart
     make_time_unit_str
     add_2d_latlon_axis
@@ -19,10 +24,23 @@ Input/output routines common to many file formats.
 
 import bz2
 import gzip
+import io
+import mmap
+import os
 
 import numpy as np
 import netCDF4
 
+from ..core.transforms import antenna_to_cartesian
+from ..core.transforms import cartesian_to_geographic_aeqd
+
+# file objects which can be memory mapped, the built-in file objects
+# returned by open in Python 2 are not io module classes.
+try:
+    _MAPPABLE_FILE_TYPES = (io.BufferedReader, io.FileIO, file)  # noqa
+except NameError:
+    _MAPPABLE_FILE_TYPES = (io.BufferedReader, io.FileIO)
+
 
 def prepare_for_read(filename):
     """
@@ -106,6 +124,138 @@ def _test_arguments(dic):
         warnings.warn('Unexpected arguments: %s' % dic.keys())
 
 
+def _unpack_variable_gates(data, shape, ray_n_gates, ray_start_index):
+    """
+    Unpack data stored with a variable number of gates in each ray.
+
+    Parameters
+    ----------
+    data : array
+        Data for all rays, the gates of ray i are stored in
+        data[ray_start_index[i]:ray_start_index[i] + ray_n_gates[i]].
+    shape : tuple
+        Shape, (nrays, ngates), of the unpacked data.
+    ray_n_gates, ray_start_index : array
+        Number of gates in and start index of each ray.
+
+    Returns
+    -------
+    unpacked : MaskedArray
+        Unpacked data, gates beyond those in each ray are masked.
+
+    """
+    ray_n_gates = np.asarray(ray_n_gates, dtype='int64')
+    ray_start_index = np.asarray(ray_start_index, dtype='int64')
+    valid = np.arange(shape[1]) < ray_n_gates[:, np.newaxis]
+    unpacked = np.ma.masked_all(shape, dtype=data.dtype)
+    if np.array_equal(ray_start_index, np.cumsum(ray_n_gates) - ray_n_gates):
+        # rays stored in order without gaps, unpack in a single assignment
+        unpacked[valid] = data[:ray_n_gates.sum()]
+    else:
+        for i, (gates, idx) in enumerate(zip(ray_n_gates, ray_start_index)):
+            unpacked[i, :gates] = data[idx:idx + gates]
+    return unpacked
+
+
+def _read_buffer(fh):
+    """
+    Return a buffer containing the remaining data in a file-like object.
+
+    Uncompressed files on disk are memory mapped and a read-only memoryview
+    of the mapping is returned, so no data is copied and the file pages are
+    shared between processes reading the same file.  Other file-like objects
+    are read into a bytes object.
+
+    Parameters
+    ----------
+    fh : file-like
+        File-like object to read from its current position.
+
+    Returns
+    -------
+    buf : memoryview or bytes
+        Buffer containing the data.
+    mapped : mmap or None
+        Memory map underlying buf or None when the data was read into a
+        bytes object.  Close the map using :py:func:`_close_mmap` once all
+        references to buf have been removed.
+
+    """
+    if isinstance(fh, _MAPPABLE_FILE_TYPES):
+        mapped = None
+        try:
+            pos = fh.tell()
+            if os.fstat(fh.fileno()).st_size > pos:
+                mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                buf = memoryview(mapped)[pos:]
+                fh.seek(0, os.SEEK_END)
+                return buf, mapped
+        except (EnvironmentError, TypeError, ValueError):
+            # not a regular file or, in Python 2, the map does not support
+            # memoryviews, read the data
+            if mapped is not None:
+                mapped.close()
+    return fh.read(), None
+
+
+def _close_mmap(mapped):
+    """
+    Close a memory map returned by :py:func:`_read_buffer`.
+
+    Maps which are still referenced by a buffer or array cannot be closed,
+    these are left open and closed when garbage collected.  Nothing is done
+    when mapped is None.
+    """
+    if mapped is None:
+        return
+    try:
+        mapped.close()
+    except BufferError:
+        pass    # data from the map is still in use
+
+
+def _gather_structures(buf_array, positions, dtype):
+    """
+    Decode structures located at the given positions in a buffer.
+
+    Parameters
+    ----------
+    buf_array : array
+        Buffer viewed as an array of unsigned bytes.
+    positions : array
+        Location of each structure in the buffer.
+    dtype : dtype
+        Structured NumPy data type describing the structure.
+
+    Returns
+    -------
+    structures : array
+        Array of structures with the given dtype.
+
+    """
+    positions = np.asarray(positions, dtype=np.intp)
+    loc = positions[:, np.newaxis] + np.arange(dtype.itemsize)
+    return buf_array[loc].view(dtype).reshape(len(positions))
+
+
+def _structure_dtype(structure):
+    """
+    Return a structured big-endian NumPy dtype for a structure.
+
+    The structure is a list of (name, format) tuples using the format
+    characters of the struct module.  Byte strings are stored as void
+    elements, bytes(element) returns the string including any trailing null
+    bytes as struct.unpack does.
+    """
+    dtypes = []
+    for name, fmt in structure:
+        if fmt.endswith('s'):
+            dtypes.append((name, 'V' + fmt[:-1]))
+        else:
+            dtypes.append((name, '>' + np.dtype(fmt).str[1:]))
+    return np.dtype(dtypes)
+
+
 # XXX move this to another module
 def radar_coords_to_cart(rng, az, ele, debug=False):
     """
@@ -152,16 +302,7 @@ def radar_coords_to_cart(rng, az, ele, debug=False):
         Edition, 1993, p. 21.
 
     """
-    theta_e = ele * np.pi / 180.0       # elevation angle in radians.
-    theta_a = az * np.pi / 180.0        # azimuth angle in radians.
-    R = 6371.0 * 1000.0 * 4.0 / 3.0     # effective radius of earth in meters.
-    r = rng * 1000.0                    # distances to gates in meters.
-
-    z = (r ** 2 + R ** 2 + 2.0 * r * R * np.sin(theta_e)) ** 0.5 - R
-    s = R * np.arcsin(r * np.cos(theta_e) / (R + z))  # arc length in m.
-    x = s * np.sin(theta_a)
-    y = s * np.cos(theta_a)
-    return x, y, z
+    return antenna_to_cartesian(rng, az, ele)
 
 
 def make_time_unit_str(dtobj):
@@ -233,21 +374,10 @@ def add_2d_latlon_axis(grid, **kwargs):
         warnings.warn('No basemap found, using internal implementation '
                       'for converting azimuthal equidistant to latlon')
         # azimutal equidistant projetion to latlon
-        R = 6371.0 * 1000.0     # radius of earth in meters.
-
         x, y = np.meshgrid(grid.axes["x_disp"]['data'],
                            grid.axes["y_disp"]['data'])
-
-        c = np.sqrt(x*x + y*y) / R
-        phi_0 = grid.axes["lat"]['data'] * np.pi / 180
-        azi = np.arctan2(y, x)  # from east to north
-
-        lat = np.arcsin(np.cos(c) * np.sin(phi_0) +
-                        np.sin(azi) * np.sin(c) * np.cos(phi_0)) * 180 / np.pi
-        lon = (np.arctan2(np.cos(azi) * np.sin(c), np.cos(c) * np.cos(phi_0) -
-               np.sin(azi) * np.sin(c) * np.sin(phi_0)) * 180 /
-               np.pi + grid.axes["lon"]['data'])
-        lon = np.fmod(lon + 180, 360) - 180
+        lon, lat = cartesian_to_geographic_aeqd(
+            x, y, grid.axes["lon"]['data'], grid.axes["lat"]['data'])
 
     lat_axis = {
         'data':  lat,
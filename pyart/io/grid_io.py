@@ -10,6 +10,7 @@ Reading and writing Grid objects.
     read_grid
     write_grid
 
+    _create_grid_axes
     _read_grid_cf
     _read_grid_wrf
 
@@ -129,30 +130,66 @@ def write_grid(filename, grid, format='NETCDF4', arm_time_variables=False):
     """
     ncobj = netCDF4.Dataset(filename, mode='w', format=format)
 
+    # dimensions and axes variables
+    grid_shape = grid.fields[list(grid.fields.keys())[0]]['data'].shape
+    _create_grid_axes(ncobj, grid_shape, grid.axes, arm_time_variables)
+
+    # field variables
+    for field, field_dic in grid.fields.items():
+        # append 1, to the shape of all data to indicate the time var.
+        field_dic['data'].shape = (1, ) + field_dic['data'].shape
+        _create_ncvar(field_dic, ncobj, field, ('time', 'nz', 'ny', 'nx'))
+        field_dic['data'].shape = field_dic['data'].shape[1:]
+
+    # metadata
+    for k, v in grid.metadata.items():
+        setattr(ncobj, k, v)
+
+    ncobj.close()
+
+    return
+
+
+def _create_grid_axes(ncobj, grid_shape, axes, arm_time_variables=False):
+    """
+    Create the dimensions and axes variables of a grid in a netCDF Dataset.
+
+    Parameters
+    ----------
+    ncobj : Dataset
+        NetCDF dataset to create the dimensions and variables in.
+    grid_shape : 3-tuple of int
+        Number of points in the grid (z, y, x).
+    axes : dict
+        Axes dictionary of the grid.
+    arm_time_variables : bool
+        True to write the ARM standard time variables base_time and
+        time_offset. False will not write these variables.
+
+    """
     # create the time dimension
     ncobj.createDimension('time', None)
 
     # create additional dimensions
-    grid_shape = grid.fields[list(grid.fields.keys())[0]]['data'].shape
     nz, ny, nx = grid_shape
     ncobj.createDimension('nz', nz)
     ncobj.createDimension('ny', ny)
     ncobj.createDimension('nx', nx)
 
     # axes variables
-    _create_ncvar(grid.axes['time'], ncobj, 'time', ('time', ))
-    _create_ncvar(grid.axes['time_end'], ncobj, 'time_end', ('time', ))
-    _create_ncvar(grid.axes['time_start'], ncobj, 'time_start', ('time', ))
-    _create_ncvar(grid.axes['x_disp'], ncobj, 'x_disp', ('nx', ))
-    _create_ncvar(grid.axes['y_disp'], ncobj, 'y_disp', ('ny', ))
-    _create_ncvar(grid.axes['z_disp'], ncobj, 'z_disp', ('nz', ))
-    _create_ncvar(grid.axes['lat'], ncobj, 'lat', ('time', ))
-    _create_ncvar(grid.axes['lon'], ncobj, 'lon', ('time', ))
-    _create_ncvar(grid.axes['alt'], ncobj, 'alt', ('time', ))
+    _create_ncvar(axes['time'], ncobj, 'time', ('time', ))
+    _create_ncvar(axes['time_end'], ncobj, 'time_end', ('time', ))
+    _create_ncvar(axes['time_start'], ncobj, 'time_start', ('time', ))
+    _create_ncvar(axes['x_disp'], ncobj, 'x_disp', ('nx', ))
+    _create_ncvar(axes['y_disp'], ncobj, 'y_disp', ('ny', ))
+    _create_ncvar(axes['z_disp'], ncobj, 'z_disp', ('nz', ))
+    _create_ncvar(axes['lat'], ncobj, 'lat', ('time', ))
+    _create_ncvar(axes['lon'], ncobj, 'lon', ('time', ))
+    _create_ncvar(axes['alt'], ncobj, 'alt', ('time', ))
 
     # create ARM time variables base_time and time_offset, if requested
     if arm_time_variables:
-        time = grid.axes['time']
+        time = axes['time']
         dt = netCDF4.num2date(time['data'][0], time['units'])
         td = dt - datetime.datetime.utcfromtimestamp(0)
         td = td.seconds + td.days * 24 * 3600
@@ -175,21 +212,6 @@ def write_grid(filename, grid, format='NETCDF4', arm_time_variables=False):
         }
         _create_ncvar(time_offset, ncobj, 'time_offset', ('time', ))
 
-    # field variables
-    for field, field_dic in grid.fields.items():
-        # append 1, to the shape of all data to indicate the time var.
-        field_dic['data'].shape = (1, ) + field_dic['data'].shape
-        _create_ncvar(field_dic, ncobj, field, ('time', 'nz', 'ny', 'nx'))
-        field_dic['data'].shape = field_dic['data'].shape[1:]
-
-    # metadata
-    for k, v in grid.metadata.items():
-        setattr(ncobj, k, v)
-
-    ncobj.close()
-
-    return
-
 
 def _read_grid_cf(filename):
     """
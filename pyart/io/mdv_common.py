@@ -21,6 +21,7 @@ import struct
 import gzip
 import zlib
 from io import BytesIO
+from multiprocessing.pool import ThreadPool
 import datetime
 
 import numpy as np
@@ -83,6 +84,13 @@ ENCODING_INT8 = 1  # unsigned 8 bit integer
 ENCODING_INT16 = 2  # unsigned 16 bit integer
 ENCODING_FLOAT32 = 5  # 32 bit IEEE floating point
 
+# data type of the encoded data
+_ENCODING_DTYPES = {
+    ENCODING_INT8: np.dtype('>B'),
+    ENCODING_INT16: np.dtype('>H'),
+    ENCODING_FLOAT32: np.dtype('>f'),
+}
+
 #  ***************** CHUNK HEADER and DATA *******************
 CHUNK_DSRADAR_PARAMS = 3
 CHUNK_DSRADAR_ELEVATIONS = 7
@@ -115,6 +123,9 @@ class MdvFile(object):
     read_fields : bool
         True to read all field during initalization, False (default) only
         reads metadata.
+    nthreads : int
+        Number of threads used to decompress and scale the fields when
+        `read_fields` is True, see :py:meth:`read_all_fields`.
 
     Notes
     -----
@@ -366,7 +377,8 @@ class MdvFile(object):
         ("spare", 58, 72)
     ]
 
-    def __init__(self, filename, debug=False, read_fields=False):
+    def __init__(self, filename, debug=False, read_fields=False,
+                 nthreads=1):
         """ initalize """
         if debug:
             print("Opening file for reading: ", filename)
@@ -428,7 +440,7 @@ class MdvFile(object):
         if read_fields:
             if debug:
                 print("Reading all fields")
-            self.read_all_fields()
+            self.read_all_fields(nthreads)
         return
 
     ##################
@@ -531,16 +543,71 @@ class MdvFile(object):
         nz = field_header['nz']
         ny = field_header['ny']
         nx = field_header['nx']
-
-        # read the header
         field_data = np.zeros([nz, ny, nx], dtype='float32')
-        self.fileptr.seek(field_header['field_data_offset'])
-        self._get_levels_info(nz)  # dict not used, but need to seek.
+        for sw, sw_data in enumerate(self._iter_packed_levels(fnum, debug)):
+            # mask, scale and offset the data, store in field_data
+            _scale_level(field_header, sw_data, field_data[sw])
 
-        for sw in range(nz):
+        # store data as object attribute and return
+        self.fields_data[fnum] = field_data
+        return field_data
+
+    def read_packed_field(self, fnum):
+        """
+        Read the packed data of a field from the MDV file.
+
+        The data is not scaled, offset or masked, nor stored as an object
+        attribute.  Field values are given by packed * scale + bias using the
+        'scale' and 'bias' elements of the field header, packed values equal
+        to the 'bad_data_value' element are missing.
+
+        Parameters
+        ----------
+        fnum : int
+            Field number to read.
+
+        Returns
+        -------
+        packed : array
+            Packed field data, the data type depends on the encoding of the
+            field, uint8 or uint16 for integer encodings and float32 for
+            fields which are not packed.
+
+        """
+        field_header = self.field_headers[fnum]
+        shape = (field_header['nz'], field_header['ny'], field_header['nx'])
+        encoding_type = field_header['encoding_type']
+        if encoding_type not in _ENCODING_DTYPES:
+            raise NotImplementedError('encoding: ', encoding_type)
+        dtype = _ENCODING_DTYPES[encoding_type].newbyteorder('=')
+        packed = np.empty(shape, dtype=dtype)
+        for sw, sw_data in enumerate(self._iter_packed_levels(fnum)):
+            packed[sw] = sw_data
+        return packed
+
+    def _iter_packed_levels(self, fnum, debug=False):
+        """ Iterate over the packed data in each level of a field. """
+        field_header = self.field_headers[fnum]
+        for sw, level in enumerate(self._read_compressed_levels(fnum)):
             if debug:
                 print("doing levels ", sw)
+            yield _decode_level(field_header, *level)
 
+    def _read_compressed_levels(self, fnum):
+        """
+        Return a list of the compression information and compressed data of
+        each level of a field.
+        """
+        field_header = self.field_headers[fnum]
+        if field_header['encoding_type'] not in _ENCODING_DTYPES:
+            raise NotImplementedError(
+                'encoding: ', field_header['encoding_type'])
+
+        # read the header
+        self.fileptr.seek(field_header['field_data_offset'])
+        self._get_levels_info(field_header['nz'])  # dict not used, but seek.
+        levels = []
+        for sw in range(field_header['nz']):
             # get the compressed level data
             compr_info = self._get_compression_info()
             if compr_info['magic_cookie'] == 0xfe0103fd:
@@ -551,70 +618,61 @@ class MdvFile(object):
                 compr_data = self.fileptr.read(compr_info['spare'][0])
             else:
                 compr_data = self.fileptr.read(compr_info['nbytes_coded'])
-            encoding_type = field_header['encoding_type']
-            if encoding_type == ENCODING_INT8:
-                fmt = '>%iB' % (nx * ny)
-                np_form = '>B'
-            elif encoding_type == ENCODING_INT16:
-                fmt = '>%iH' % (nx * ny)
-                np_form = '>H'
-            elif encoding_type == ENCODING_FLOAT32:
-                fmt = '>%if' % (nx * ny)
-                np_form = '>f'
-            else:
-                raise NotImplementedError('encoding: ', encoding_type)
+            levels.append((compr_info, compr_data))
+        return levels
 
-            # decompress the level data
-            if compr_info['magic_cookie'] == 0xf7f7f7f7:
-                cd_fobj = BytesIO(compr_data)
-                gzip_file_handle = gzip.GzipFile(fileobj=cd_fobj)
-                decompr_data = gzip_file_handle.read(struct.calcsize(fmt))
-                gzip_file_handle.close()
-            elif compr_info['magic_cookie'] == 0xf5f5f5f5:
-                decompr_data = zlib.decompress(compr_data)
-            elif compr_info['magic_cookie'] == 0xf6f6f6f6:
-                # ZLIB_NOT_COMPRESSED
-                decompr_data = compr_data
-            elif compr_info['magic_cookie'] == 0xfe0103fd:
-                # Run length encoding of 8-bit data
-                # Compression info is in a different order, namely
-                # int32 : RL8_FLAG (0xfe0103fd)
-                # int32 : key
-                # int32 : nbytes_array (bytes of encoded data with header)
-                # int32 : nbytes_full (bytes of unencoded data, no header)
-                # int32 : nbytes_coded (bytes of encoded data, no header)
-                key = compr_info['nbytes_uncompressed']
-                decompr_size = compr_info['nbytes_coded']
-                decompr_data = _decode_rle8(compr_data, key, decompr_size)
-            else:
-                raise NotImplementedError('unsupported compression mode')
-                # With sample data it should be possible to write
-                # decompressor for other modes, the compression magic
-                # cookies for these modes are:
-                # 0x2f2f2f2f : TA_NOT_COMPRESSED
-                # 0xf8f8f8f8 : GZIP_NOT_COMPRSSED
-                # 0xf3f3f3f3 : BZIP_COMPRESSED
-                # 0xf4f4f4f4 : BZIP_NOT_COMPRESSED
-
-            # read the decompressed data, reshape and mask
-            sw_data = np.fromstring(decompr_data, np_form).astype('float32')
-            sw_data.shape = (ny, nx)
-            mask = sw_data == field_header['bad_data_value']
-            np.putmask(sw_data, mask, [np.NaN])
-
-            # scale and offset the data, store in field_data
-            scale = field_header['scale']
-            bias = field_header['bias']
-            field_data[sw, :, :] = sw_data * scale + bias
+    def read_all_fields(self, nthreads=1, fnums=None):
+        """
+        Read all fields, storing data to field name attributes.
 
-        # store data as object attribute and return
-        self.fields_data[fnum] = field_data
-        return field_data
+        Parameters
+        ----------
+        nthreads : int, optional
+            Number of threads used to decompress and scale the levels of the
+            fields.  The compressed data of all unread fields is read from
+            the file before any is decoded.
+        fnums : list of int or None, optional
+            Field numbers of the fields to read, None reads all fields.
 
-    def read_all_fields(self):
-        """ Read all fields, storing data to field name attributes. """
-        for i in range(self.master_header['nfields']):
-            self.read_a_field(i)
+        """
+        if int(nthreads) < 1:
+            raise ValueError('nthreads must be a positive integer')
+        nthreads = int(nthreads)
+        if fnums is None:
+            fnums = range(self.master_header['nfields'])
+        unread = [i for i in fnums if self.fields_data[i] is None]
+        if nthreads == 1 or len(unread) == 0:
+            for i in unread:
+                self.read_a_field(i)
+            return
+
+        # read the compressed data in turn, allocate the field volumes
+        tasks = []
+        fields_data = {}
+        for fnum in unread:
+            field_header = self.field_headers[fnum]
+            levels = self._read_compressed_levels(fnum)
+            fields_data[fnum] = np.zeros(
+                (field_header['nz'], field_header['ny'], field_header['nx']),
+                dtype='float32')
+            tasks.extend((fnum, sw, level) for sw, level in enumerate(levels))
+
+        def decode(task):
+            """ Decode, scale and store the data in a single level. """
+            fnum, sw, level = task
+            field_header = self.field_headers[fnum]
+            sw_data = _decode_level(field_header, *level)
+            _scale_level(field_header, sw_data, fields_data[fnum][sw])
+
+        # decode the levels concurrently
+        pool = ThreadPool(min(nthreads, len(tasks)))
+        try:
+            pool.map(decode, tasks)
+        finally:
+            pool.close()
+            pool.join()
+        for fnum, field_data in fields_data.items():
+            self.fields_data[fnum] = field_data
 
     def close(self):
         """ Close the MDV file. """
@@ -1131,28 +1189,109 @@ class MdvFile(object):
         return [fh[i]['field_name'] for i in range(len(fh))]
 
 
+def _decode_level(field_header, compr_info, compr_data):
+    """ Decompress the data of a single level, returning a 2D array. """
+    ny = field_header['ny']
+    nx = field_header['nx']
+    np_form = _ENCODING_DTYPES[field_header['encoding_type']]
+    fmt = '>%i%s' % (nx * ny, np_form.char)
+
+    # decompress the level data
+    if compr_info['magic_cookie'] == 0xf7f7f7f7:
+        cd_fobj = BytesIO(compr_data)
+        gzip_file_handle = gzip.GzipFile(fileobj=cd_fobj)
+        decompr_data = gzip_file_handle.read(struct.calcsize(fmt))
+        gzip_file_handle.close()
+    elif compr_info['magic_cookie'] == 0xf5f5f5f5:
+        decompr_data = zlib.decompress(compr_data)
+    elif compr_info['magic_cookie'] == 0xf6f6f6f6:
+        # ZLIB_NOT_COMPRESSED
+        decompr_data = compr_data
+    elif compr_info['magic_cookie'] == 0xfe0103fd:
+        # Run length encoding of 8-bit data
+        # Compression info is in a different order, namely
+        # int32 : RL8_FLAG (0xfe0103fd)
+        # int32 : key
+        # int32 : nbytes_array (bytes of encoded data with header)
+        # int32 : nbytes_full (bytes of unencoded data, no header)
+        # int32 : nbytes_coded (bytes of encoded data, no header)
+        key = compr_info['nbytes_uncompressed']
+        decompr_size = compr_info['nbytes_coded']
+        decompr_data = _decode_rle8(compr_data, key, decompr_size)
+    else:
+        raise NotImplementedError('unsupported compression mode')
+        # With sample data it should be possible to write
+        # decompressor for other modes, the compression magic
+        # cookies for these modes are:
+        # 0x2f2f2f2f : TA_NOT_COMPRESSED
+        # 0xf8f8f8f8 : GZIP_NOT_COMPRSSED
+        # 0xf3f3f3f3 : BZIP_COMPRESSED
+        # 0xf4f4f4f4 : BZIP_NOT_COMPRESSED
+
+    # read the decompressed data and reshape
+    sw_data = np.frombuffer(decompr_data, np_form)
+    sw_data.shape = (ny, nx)
+    return sw_data
+
+
+def _scale_level(field_header, sw_data, out):
+    """
+    Scale and offset the packed data of a level into out, setting bad data
+    to NaN.
+    """
+    out[:] = sw_data
+    out[sw_data == field_header['bad_data_value']] = np.nan
+    out *= field_header['scale']
+    out += field_header['bias']
+
+
 def _decode_rle8(compr_data, key, decompr_size):
-    """ Decode 8-bit MDV run length encoding. """
+    """
+    Decode 8-bit MDV run length encoding.
+
+    Returns a uint8 array of length decompr_size.
+    """
     # Encoding is described in section 7 of:
     # http://rap.ucar.edu/projects/IHL/RalHtml/protocols/mdv_file/
-    # This function would benefit greate by being rewritten in Cython
-    data = np.fromstring(compr_data, dtype='>B')
-    out = np.empty((decompr_size, ), dtype='uint8')
-    data_ptr = 0
-    out_ptr = 0
-    while data_ptr != len(data):
-        v = data[data_ptr]
-        if v != key:  # not encoded
-            out[out_ptr] = v
-            data_ptr += 1
-            out_ptr += 1
-        else:   # run length encoded
-            count = data[data_ptr+1]
-            value = data[data_ptr+2]
-            out[out_ptr:out_ptr+count] = value
-            data_ptr += 3
-            out_ptr += count
-    return out.tostring()
+    # A byte equal to key starts a run, the following two bytes are the
+    # count and value of the run, all other bytes are literal values.
+    data = np.frombuffer(compr_data, dtype='>B')
+    markers = np.flatnonzero(data == key)
+    if np.any(np.diff(markers) < 3):
+        # key values in the count or value of a run are not markers
+        markers = _rle8_markers(markers)
+    if len(markers) and markers[-1] + 2 >= len(data):
+        raise ValueError('truncated run length encoded data')
+
+    # each token is either a literal or the marker of a run
+    is_token = np.ones(len(data), dtype=bool)
+    is_token[markers + 1] = False
+    is_token[markers + 2] = False
+    tokens = np.flatnonzero(is_token)
+    values = data[tokens]
+    counts = np.ones(len(tokens), dtype='intp')
+    is_run = values == key
+    values[is_run] = data[tokens[is_run] + 2]
+    counts[is_run] = data[tokens[is_run] + 1]
+
+    out = np.zeros((decompr_size, ), dtype='uint8')
+    decoded = np.repeat(values, counts)
+    out[:len(decoded)] = decoded
+    return out
+
+
+def _rle8_markers(candidates):
+    """
+    Return the positions of the run markers given the positions of all
+    bytes equal to the key, skipping those which are part of a run.
+    """
+    markers = []
+    next_pos = 0
+    for pos in candidates:
+        if pos >= next_pos:
+            markers.append(pos)
+            next_pos = pos + 3
+    return np.array(markers, dtype='intp')
 
 
 class _MdvVolumeDataExtractor(object):
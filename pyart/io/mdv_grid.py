@@ -247,7 +247,7 @@ def write_grid_mdv(filename, grid, mdv_field_names=None,
 
 def read_grid_mdv(filename, field_names=None, additional_metadata=None,
                   file_field_names=False, exclude_fields=None,
-                  delay_field_loading=False, **kwargs):
+                  delay_field_loading=False, nthreads=1, **kwargs):
     """
     Read a MDV file to a Grid Object.
 
@@ -281,6 +281,10 @@ def read_grid_mdv(filename, field_names=None, additional_metadata=None,
         key in a particular field dictionary is accessed.  In this case
         the field attribute of the returned Radar object will contain
         LazyLoadDict objects not dict objects.
+    nthreads : int
+        Number of threads used to decompress and scale the fields read from
+        the file, see :py:meth:`MdvFile.read_all_fields`.  Not used when
+        `delay_field_loading` is True.
 
     Returns
     -------
@@ -431,8 +435,9 @@ def read_grid_mdv(filename, field_names=None, additional_metadata=None,
     for meta_key, mdv_key in mdv_common.MDV_METADATA_MAP.items():
         metadata[meta_key] = mdv.master_header[mdv_key]
 
-    # fields
+    # fields, those which are not lazy loaded are read together
     fields = {}
+    unread = []
     mdv_fields = mdv._make_fields_list()
     for mdv_field in set(mdv_fields):
         field_name = filemetadata.get_field_name(mdv_field)
@@ -447,8 +452,12 @@ def read_grid_mdv(filename, field_names=None, additional_metadata=None,
             field_dic = LazyLoadDict(field_dic)
             field_dic.set_lazy('data', dataextractor)
         else:
-            field_dic['data'] = dataextractor()
+            unread.append((field_dic, dataextractor))
         fields[field_name] = field_dic
+    mdv.read_all_fields(
+        nthreads, [extractor.field_num for dic, extractor in unread])
+    for field_dic, dataextractor in unread:
+        field_dic['data'] = dataextractor()
 
     if not delay_field_loading:
         mdv.close()
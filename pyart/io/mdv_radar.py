@@ -16,6 +16,7 @@ from netCDF4 import date2num
 
 from ..config import FileMetadata, get_fillvalue
 from ..core.radar import Radar
+from ..core.packed import PackedField
 from .common import make_time_unit_str, _test_arguments, prepare_for_read
 from .lazydict import LazyLoadDict
 from . import mdv_common
@@ -23,7 +24,8 @@ from . import mdv_common
 
 def read_mdv(filename, field_names=None, additional_metadata=None,
              file_field_names=False, exclude_fields=None,
-             delay_field_loading=False, **kwargs):
+             delay_field_loading=False, packed_fields=False, nthreads=1,
+             **kwargs):
     """
     Read a MDV file.
 
@@ -58,6 +60,17 @@ def read_mdv(filename, field_names=None, additional_metadata=None,
         the field attribute of the returned Radar object will contain
         LazyLoadDict objects not dict objects. Not all file types support this
         parameter.
+    packed_fields : bool
+        True to store the packed integer data of fields encoded as 8 or 16
+        bit integers, scaling the data when the 'data' key in a particular
+        field dictionary is first accessed.  In this case these fields are
+        stored as PackedField objects.  Fields stored as floating point
+        values are read as usual.  This parameter is ignored when
+        `delay_field_loading` is True.
+    nthreads : int
+        Number of threads used to decompress and scale the fields read from
+        the file, see :py:meth:`MdvFile.read_all_fields`.  Not used when
+        `delay_field_loading` is True.
 
     Returns
     -------
@@ -102,8 +115,9 @@ def read_mdv(filename, field_names=None, additional_metadata=None,
     _range['meters_to_center_of_first_gate'] = _range['data'][0]
     _range['meters_between_gates'] = (_range['data'][1] - _range['data'][0])
 
-    # fields
+    # fields, those which are not packed or lazy loaded are read together
     fields = {}
+    unread = []
     for mdv_field in set(mdvfile.fields):
         field_name = filemetadata.get_field_name(mdv_field)
         if field_name is None:
@@ -112,14 +126,27 @@ def read_mdv(filename, field_names=None, additional_metadata=None,
         # create and store the field dictionary
         field_dic = filemetadata(field_name)
         field_dic['_FillValue'] = get_fillvalue()
+        fnum = mdvfile.fields.index(mdv_field)
+        field_header = mdvfile.field_headers[fnum]
         dataextractor = mdv_common._MdvVolumeDataExtractor(
-            mdvfile, mdvfile.fields.index(mdv_field), get_fillvalue())
+            mdvfile, fnum, get_fillvalue())
         if delay_field_loading:
             field_dic = LazyLoadDict(field_dic)
             field_dic.set_lazy('data', dataextractor)
+        elif packed_fields and field_header['encoding_type'] in (
+                mdv_common.ENCODING_INT8, mdv_common.ENCODING_INT16):
+            packed = mdvfile.read_packed_field(fnum)
+            packed.shape = (packed.shape[0] * packed.shape[1], packed.shape[2])
+            field_dic = PackedField(
+                field_dic, packed, field_header['scale'],
+                field_header['bias'], int(field_header['bad_data_value']))
         else:
-            field_dic['data'] = dataextractor()
+            unread.append((field_dic, dataextractor))
         fields[field_name] = field_dic
+    mdvfile.read_all_fields(
+        nthreads, [extractor.field_num for dic, extractor in unread])
+    for field_dic, dataextractor in unread:
+        field_dic['data'] = dataextractor()
 
     # metadata
     metadata = filemetadata('metadata')
@@ -0,0 +1,349 @@
+"""
+pyart.io.multi_read
+===================
+
+Reading of multiple radar files as a time series.
+
+.. autosummary::
+    :toctree: generated/
+
+    read_many
+    _iter_read
+    _concatenate_radars
+    _append_rays
+    _concatenate_dics
+    _concatenate_parameters
+    _copy_metadata
+
+"""
+
+import collections
+import itertools
+import multiprocessing
+
+import numpy as np
+from netCDF4 import num2date, date2num
+
+from ..core.radar import Radar
+from .auto_read import read
+
+
+def read_many(filenames, concatenate=False, nprocesses=1, max_queued=None,
+              reader=None, **kwargs):
+    """
+    Read multiple radar files.
+
+    Files are read using :py:func:`pyart.io.read` or the given reader,
+    optionally concurrently by a pool of worker processes.  At most
+    `max_queued` files are read ahead of the radar objects which have been
+    consumed, limiting the memory used when iterating over long time series.
+
+    Parameters
+    ----------
+    filenames : list of str
+        Names of the radar files to read, typically in time order.
+    concatenate : bool, optional
+        False to return an iterator over the Radar objects read from the
+        files in the order of `filenames`, the files are not sorted by
+        time.  True to return a single Radar object containing all rays
+        from all files concatenated along the time dimension in order of
+        the volume start times.
+    nprocesses : int, optional
+        Number of processes used to read files.  A value of 1, the default,
+        reads the files in the calling process.
+    max_queued : int or None, optional
+        Maximum number of files which are read ahead when using multiple
+        processes.  None, the default, uses twice the number of processes.
+    reader : function or None, optional
+        Function used to read each file, for example
+        :py:func:`pyart.io.read_nexrad_archive` when all files are known to
+        be in that format, avoiding the file format detection of
+        :py:func:`pyart.io.read`.  The function must be defined at the top
+        level of a module when using multiple processes.  None, the
+        default, uses :py:func:`pyart.io.read`.
+
+    Other Parameters
+    ----------------
+    **kwargs
+        Additional parameters passed to the reader.  Lazy field loading is
+        not possible when reading files in worker processes.
+
+    Returns
+    -------
+    radars : iterator of Radar or Radar
+        Iterator over the Radar object read from each file or, when
+        concatenate is True, a Radar object containing the rays from all
+        files.  When concatenated, fields which are not present in all
+        files are excluded and rays with fewer gates than the longest rays
+        are padded with masked values.
+
+    Notes
+    -----
+    When concatenating, the field data of each file is copied into the
+    concatenated fields as soon as the file has been read and is then
+    released, so the field data of all files is not held twice.  Rays are
+    only reordered, one field at a time, when the files are not read in
+    order of their volume start times.
+
+    """
+    if int(nprocesses) < 1:
+        raise ValueError('nprocesses must be a positive integer')
+    if max_queued is None:
+        max_queued = 2 * int(nprocesses)
+    if int(max_queued) < 1:
+        raise ValueError('max_queued must be a positive integer')
+
+    if reader is None:
+        reader = read
+
+    radars = _iter_read(
+        filenames, reader, int(nprocesses), int(max_queued), kwargs)
+    if not concatenate:
+        return radars
+    return _concatenate_radars(radars)
+
+
+def _iter_read(filenames, reader, nprocesses, max_queued, kwargs):
+    """ Yield Radar objects read from files, in order of filenames. """
+    if nprocesses == 1:
+        for filename in filenames:
+            yield reader(filename, **kwargs)
+        return
+
+    pool = multiprocessing.Pool(nprocesses)
+    try:
+        pending = collections.deque()
+        for filename in filenames:
+            pending.append(pool.apply_async(reader, (filename, ), kwargs))
+            if len(pending) >= max_queued:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _concatenate_radars(radars):
+    """
+    Concatenate Radar objects along the time dimension.
+
+    Radars are consumed from an iterable.  The field data of each radar is
+    copied into arrays which grow as radars arrive and is then removed from
+    the radar.  Rays are ordered by the volume start times, the other
+    arrays of the new Radar object are allocated once and filled with the
+    data from all radars.  All radars must have the same gate spacing,
+    those with fewer gates are padded with masked values.
+    """
+    # fill the fields as radars arrive, keeping the fields present in all
+    radars = iter(radars)
+    first = next(radars, None)
+    if first is None:
+        raise ValueError('no radar files to read')
+    field_buffers = dict(
+        (field_name, None) for field_name in first.fields.keys())
+    field_metadata = dict(
+        (field_name, _copy_metadata(field_dic))
+        for field_name, field_dic in first.fields.items())
+    shells = []     # radars without field data, in the order read
+    start = 0
+    for radar in itertools.chain([first], radars):
+        for field_name in list(field_buffers.keys()):
+            if field_name not in radar.fields:
+                del field_buffers[field_name]
+                continue
+            field_buffers[field_name] = _append_rays(
+                field_buffers[field_name],
+                radar.fields[field_name]['data'], start)
+        start += radar.nrays
+        radar.fields = {}
+        shells.append(radar)
+
+    # order the radars and rays by volume start time
+    nrays = [radar.nrays for radar in shells]
+    ray_offsets = np.cumsum([0] + nrays[:-1])
+    order = sorted(range(len(shells)), key=lambda i: num2date(
+        shells[i].time['data'][0], shells[i].time['units']))
+    rays = None
+    if order != list(range(len(shells))):
+        rays = np.concatenate([
+            np.arange(ray_offsets[i], ray_offsets[i] + nrays[i])
+            for i in order])
+    radars = [shells[i] for i in order]
+
+    first = radars[0]
+    nrays = [radar.nrays for radar in radars]
+    ray_offsets = np.cumsum([0] + nrays[:-1])
+
+    # range, taken from the radar with the most gates
+    longest = radars[int(np.argmax([radar.ngates for radar in radars]))]
+    _range = _copy_metadata(longest.range)
+    _range['data'] = np.array(longest.range['data'])
+    for radar in radars:
+        if not np.allclose(radar.range['data'],
+                           _range['data'][:radar.ngates]):
+            raise ValueError('all radars must have the same gate spacing')
+
+    # time, relative to the units of the first radar
+    time = _copy_metadata(first.time)
+    calendar = first.time.get('calendar', 'gregorian')
+    time['data'] = np.empty((sum(nrays), ), dtype='float64')
+    for radar, start in zip(radars, ray_offsets):
+        epoch = num2date(0, radar.time['units'], calendar)
+        offset = date2num(epoch, first.time['units'], calendar)
+        time['data'][start:start + radar.nrays] = radar.time['data'] + offset
+
+    # fields present in all radars, reordered one at a time if needed
+    fields = {}
+    for field_name in list(field_buffers.keys()):
+        data = field_buffers.pop(field_name)[:sum(nrays)]
+        if rays is not None:
+            data = data[rays]
+        fields[field_name] = field_metadata[field_name]
+        fields[field_name]['data'] = data
+
+    # sweeps
+    sweep_number = _copy_metadata(first.sweep_number)
+    sweep_number['data'] = np.arange(
+        sum(radar.nsweeps for radar in radars), dtype='int32')
+    sweep_start_ray_index = _copy_metadata(first.sweep_start_ray_index)
+    sweep_start_ray_index['data'] = np.concatenate(
+        [radar.sweep_start_ray_index['data'] + start
+         for radar, start in zip(radars, ray_offsets)])
+    sweep_end_ray_index = _copy_metadata(first.sweep_end_ray_index)
+    sweep_end_ray_index['data'] = np.concatenate(
+        [radar.sweep_end_ray_index['data'] + start
+         for radar, start in zip(radars, ray_offsets)])
+
+    # radar location, one location per ray if the radar moved
+    locations = [(radar.latitude, radar.longitude, radar.altitude)
+                 for radar in radars]
+    fixed = all(dic['data'].size == 1 for location in locations
+                for dic in location)
+    if fixed:
+        fixed = all(
+            np.all(dic['data'] == ref['data'])
+            for location in locations[1:]
+            for dic, ref in zip(location, locations[0]))
+    if fixed:
+        latitude, longitude, altitude = [
+            _concatenate_dics([dic]) for dic in locations[0]]
+    else:
+        latitude, longitude, altitude = [
+            _concatenate_dics([location[i] for location in locations],
+                              sizes=nrays) for i in range(3)]
+
+    def concatenate_attribute(attr):
+        """ Concatenate an attribute which is present in all radars. """
+        return _concatenate_dics([getattr(radar, attr) for radar in radars])
+
+    return Radar(
+        time, _range, fields, _copy_metadata(first.metadata),
+        first.scan_type, latitude, longitude, altitude,
+        sweep_number, concatenate_attribute('sweep_mode'),
+        concatenate_attribute('fixed_angle'), sweep_start_ray_index,
+        sweep_end_ray_index, concatenate_attribute('azimuth'),
+        concatenate_attribute('elevation'),
+        altitude_agl=_concatenate_dics([first.altitude_agl]),
+        target_scan_rate=concatenate_attribute('target_scan_rate'),
+        rays_are_indexed=concatenate_attribute('rays_are_indexed'),
+        ray_angle_res=concatenate_attribute('ray_angle_res'),
+        scan_rate=concatenate_attribute('scan_rate'),
+        antenna_transition=concatenate_attribute('antenna_transition'),
+        instrument_parameters=_concatenate_parameters(
+            radars, 'instrument_parameters'),
+        radar_calibration=_concatenate_parameters(
+            radars, 'radar_calibration'),
+        rotation=concatenate_attribute('rotation'),
+        tilt=concatenate_attribute('tilt'),
+        roll=concatenate_attribute('roll'),
+        drift=concatenate_attribute('drift'),
+        heading=concatenate_attribute('heading'),
+        pitch=concatenate_attribute('pitch'),
+        georefs_applied=concatenate_attribute('georefs_applied'))
+
+
+def _append_rays(data, rays, start):
+    """
+    Copy rays into a masked array starting at ray start.
+
+    The array is allocated when data is None and reallocated when it
+    cannot hold the rays, growing the number of rays geometrically so that
+    appending many radars requires few copies.  Gates beyond those in the
+    rays and newly allocated rays are masked.  The, possibly new, array is
+    returned.
+    """
+    end = start + rays.shape[0]
+    if data is None:
+        data = np.ma.masked_all(rays.shape, dtype=rays.dtype)
+    elif end > data.shape[0] or rays.shape[1] > data.shape[1]:
+        nrays = data.shape[0]
+        if end > nrays:
+            nrays = max(end, nrays + nrays // 2)
+        grown = np.ma.masked_all(
+            (nrays, max(rays.shape[1], data.shape[1])), dtype=data.dtype)
+        grown[:start, :data.shape[1]] = data[:start]
+        data = grown
+    data[start:end, :rays.shape[1]] = rays
+    return data
+
+
+def _concatenate_dics(dics, sizes=None):
+    """
+    Return a dictionary with the concatenated data of a list of dictionaries.
+
+    Metadata is taken from the first dictionary.  None is returned if any
+    of the dictionaries is None.  When sizes is provided, data with a single
+    element is repeated to the given size before concatenation.
+    """
+    if any(dic is None for dic in dics):
+        return None
+    dic = _copy_metadata(dics[0])
+    if len(dics) == 1 and sizes is None:
+        data = dics[0]['data']
+        dic['data'] = data.copy() if hasattr(data, 'copy') else data
+        return dic
+
+    data = [d['data'] for d in dics]
+    if sizes is not None:
+        data = [np.repeat(d, size) if np.size(d) == 1 else d
+                for d, size in zip(data, sizes)]
+    if any(isinstance(d, np.ma.MaskedArray) for d in data):
+        dic['data'] = np.ma.concatenate(data)
+    else:
+        dic['data'] = np.concatenate(data)
+    return dic
+
+
+def _concatenate_parameters(radars, attr):
+    """
+    Concatenate a dictionary of parameter dictionaries, such as the
+    instrument_parameters attribute.
+
+    Parameters with a leading dimension matching the number of rays or
+    sweeps in every radar are concatenated, all others are taken from the
+    first radar.  Parameters not present in all radars are excluded.
+    """
+    parameters = [getattr(radar, attr) for radar in radars]
+    if any(params is None for params in parameters):
+        return None
+
+    concatenated = {}
+    for key in parameters[0]:
+        if any(key not in params for params in parameters[1:]):
+            continue
+        dics = [params[key] for params in parameters]
+        lengths = [
+            dic['data'].shape[0] if np.ndim(dic['data']) != 0 else -1
+            for dic in dics]
+        if (lengths == [radar.nrays for radar in radars] or
+                lengths == [radar.nsweeps for radar in radars]):
+            concatenated[key] = _concatenate_dics(dics)
+        else:
+            concatenated[key] = _concatenate_dics(dics[:1])
+    return concatenated
+
+
+def _copy_metadata(dic):
+    """ Return a copy of a dictionary without the 'data' key. """
+    return dict((key, dic[key]) for key in dic if key != 'data')
@@ -9,26 +9,34 @@ Functions for reading NEXRAD Level II Archive files.
     :template: dev_template.rst
 
     _NEXRADLevel2StagedField
+    _NEXRADLevel2VariableGateField
 
 .. autosummary::
     :toctree: generated/
 
     read_nexrad_archive
+    read_nexrad_stream
 
 """
 
+from io import BytesIO
+
 import numpy as np
 
 from ..config import FileMetadata, get_fillvalue
 from ..core.radar import Radar
+from ..core.packed import PackedField
 from .common import make_time_unit_str, _test_arguments, prepare_for_read
-from .nexrad_level2 import NEXRADLevel2File
+from .common import _unpack_variable_gates
+from .nexrad_level2 import NEXRADLevel2File, _scale_moment_data
 from .lazydict import LazyLoadDict
 
 
 def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
                         file_field_names=False, exclude_fields=None,
-                        delay_field_loading=False, **kwargs):
+                        delay_field_loading=False, include_fields=None,
+                        scans=None, variable_gates=False, packed_fields=False,
+                        nthreads=1, **kwargs):
     """
     Read a NEXRAD Level 2 Archive file.
 
@@ -64,13 +72,48 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
         True to delay loading of field data from the file until the 'data'
         key in a particular field dictionary is accessed.  In this case
         the field attribute of the returned Radar object will contain
-        LazyLoadDict objects not dict objects.
+        LazyLoadDict objects not dict objects.  The file is closed before
+        this function returns.  Its contents are kept in memory until the
+        fields are released, uncompressed files are copied out of their
+        memory map.
+    include_fields : list or None, optional
+        List of fields to include in the radar object, all other fields are
+        excluded.  None, the default, includes all fields not excluded by
+        `exclude_fields`.  Moments which are not included are never decoded.
+    scans : list or None, optional
+        Scans (0 based) to read from the file.  None, the default, reads all
+        scans.  The moment data is only decoded for the requested scans.
+        All records up to the end of the last requested scan are indexed
+        and, for compressed files, decompressed, including those of scans
+        which were not requested.  Only the records after the last requested
+        scan are skipped, so reading early scans is faster than reading
+        late ones.  The sweep_number attribute of the returned radar gives
+        the scan number of each sweep.
+    variable_gates : bool
+        True to store the field data using the number of gates collected in
+        each ray rather than padding all rays to the largest number of gates
+        in the volume.  The raw moment data is kept in the CF/Radial
+        variable length ray layout (see `ray_n_gates` and `ray_start_index`)
+        and the field data is unpacked, scaled and offset when the 'data'
+        key of the field dictionary is first accessed.  In this case the
+        field attribute of the returned Radar object will contain
+        LazyLoadDict objects not dict objects.  False, the default, stores
+        the field data in padded arrays.
+    packed_fields : bool
+        True to store the raw integer moment data in
+        :py:class:`pyart.core.PackedField` dictionaries, the data is scaled
+        and offset when the 'data' key is first accessed.  False, the
+        default, scales the data when the file is read.  Ignored when
+        `delay_field_loading` or `variable_gates` is True.
+    nthreads : int, optional
+        Number of threads used to decompress the blocks of a compressed
+        file.  The default, 1, decompresses the blocks in turn.
 
     Returns
     -------
     radar : Radar
-        Radar object containing all moments and sweeps/cuts in the volume.
-        Gates not collected are masked in the field data.
+        Radar object containing all moments and the requested sweeps/cuts in
+        the volume.  Gates not collected are masked in the field data.
 
     References
     ----------
@@ -84,15 +127,29 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
     # create metadata retrieval object
     filemetadata = FileMetadata('nexrad_archive', field_names,
                                 additional_metadata, file_field_names,
-                                exclude_fields)
+                                exclude_fields, include_fields)
 
     # open the file and retrieve scan information
-    nfile = NEXRADLevel2File(prepare_for_read(filename))
-    scan_info = nfile.scan_info()
+    if scans is None:
+        nfile = NEXRADLevel2File(prepare_for_read(filename),
+                                 nthreads=nthreads)
+        scans = list(range(nfile.nscans))
+    else:
+        scans = sorted(set(int(scan) for scan in scans))
+        if len(scans) == 0 or scans[0] < 0:
+            raise ValueError('scans must be non-negative scan numbers')
+        nfile = NEXRADLevel2File(
+            prepare_for_read(filename), last_scan=scans[-1],
+            nthreads=nthreads)
+        if scans[-1] >= nfile.nscans:
+            raise ValueError(
+                'scan %d not in file, which contains %d scans' %
+                (scans[-1], nfile.nscans))
+    scan_info = nfile.scan_info(scans)
 
     # time
     time = filemetadata('time')
-    time_start, _time = nfile.get_times()
+    time_start, _time = nfile.get_times(scans)
     time['data'] = _time
     time['units'] = make_time_unit_str(time_start)
 
@@ -101,7 +158,7 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
     i = np.argmax(scan_info[scan_max_gates]['ngates'])
     moment_max_gates = scan_info[scan_max_gates]['moments'][i]
     _range = filemetadata('range')
-    _range['data'] = nfile.get_range(scan_max_gates, moment_max_gates)
+    _range['data'] = nfile.get_range(scans[scan_max_gates], moment_max_gates)
     _range['meters_to_center_of_first_gate'] = _range['data'][0]
     _range['meters_between_gates'] = _range['data'][1] - _range['data'][0]
 
@@ -112,19 +169,45 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
         for moment in info['moments']:
             available_moments.add(moment)
 
+    field_moments = dict(
+        (filemetadata.get_field_name(moment), moment)
+        for moment in available_moments)
+    field_moments.pop(None, None)
+
+    if variable_gates:
+        # the number of gates in each ray is the largest number of gates
+        # of any moment read in the ray
+        nrays = sum(s['nrays'] for s in scan_info)
+        ray_n_gates = np.zeros((nrays, ), dtype='int32')
+        for moment in field_moments.values():
+            ray_n_gates = np.maximum(
+                ray_n_gates, nfile.get_ngates(moment, scans))
+        ray_start_index = np.cumsum(ray_n_gates) - ray_n_gates
+
     fields = {}
-    for moment in available_moments:
-        field_name = filemetadata.get_field_name(moment)
-        if field_name is None:
-            continue
+    for field_name, moment in field_moments.items():
         dic = filemetadata(field_name)
         dic['_FillValue'] = get_fillvalue()
         if delay_field_loading:
             dic = LazyLoadDict(dic)
-            data_call = _NEXRADLevel2StagedField(nfile, moment, max_ngates)
+            data_call = _NEXRADLevel2StagedField(
+                nfile, moment, max_ngates, scans)
+            dic.set_lazy('data', data_call)
+        elif variable_gates:
+            dic = LazyLoadDict(dic)
+            packed = nfile.get_variable_gate_data(moment, ray_n_gates, scans)
+            data_call = _NEXRADLevel2VariableGateField(
+                packed, nfile.get_scale_offset(moment, scans),
+                ray_n_gates, ray_start_index, (nrays, max_ngates))
             dic.set_lazy('data', data_call)
+        elif packed_fields:
+            raw = nfile.get_data(moment, max_ngates, scans, raw_data=True)
+            scale, offset = nfile.get_scale_offset(moment, scans) or (1., 0.)
+            dic = PackedField(dic, raw, 1. / scale, -offset / scale,
+                              fill_value=0, valid_min=2, packed_scale=scale,
+                              packed_offset=offset)
         else:
-            dic['data'] = nfile.get_data(moment, max_ngates)
+            dic['data'] = nfile.get_data(moment, max_ngates, scans=scans)
         fields[field_name] = dic
 
     # metadata
@@ -151,8 +234,8 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
     sweep_start_ray_index = filemetadata('sweep_start_ray_index')
     sweep_end_ray_index = filemetadata('sweep_end_ray_index')
 
-    nsweeps = int(nfile.nscans)
-    sweep_number['data'] = np.arange(nsweeps, dtype='int32')
+    nsweeps = len(scans)
+    sweep_number['data'] = np.array(scans, dtype='int32')
     sweep_mode['data'] = np.array(
         nsweeps * ['azimuth_surveillance'], dtype='S')
 
@@ -167,20 +250,23 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
     azimuth = filemetadata('azimuth')
     elevation = filemetadata('elevation')
     fixed_angle = filemetadata('fixed_angle')
-    azimuth['data'] = nfile.get_azimuth_angles()
-    elevation['data'] = nfile.get_elevation_angles().astype('float32')
-    fixed_angle['data'] = nfile.get_target_angles()
+    azimuth['data'] = nfile.get_azimuth_angles(scans)
+    elevation['data'] = nfile.get_elevation_angles(scans).astype('float32')
+    fixed_angle['data'] = nfile.get_target_angles(scans)
 
     # instrument_parameters
     nyquist_velocity = filemetadata('nyquist_velocity')
     unambiguous_range = filemetadata('unambiguous_range')
-    nyquist_velocity['data'] = nfile.get_nyquist_vel().astype('float32')
-    unambiguous_range['data'] = nfile.get_unambigous_range().astype('float32')
+    nyquist_velocity['data'] = nfile.get_nyquist_vel(scans).astype('float32')
+    unambiguous_range['data'] = nfile.get_unambigous_range(
+        scans).astype('float32')
 
     instrument_parameters = {'unambiguous_range': unambiguous_range,
                              'nyquist_velocity': nyquist_velocity, }
 
-    nfile.close()
+    # when field loading is delayed the file contents are kept, in memory,
+    # until the radar fields are released.
+    nfile.close(keep_data=delay_field_loading)
     return Radar(
         time, _range, fields, metadata, scan_type,
         latitude, longitude, altitude,
@@ -190,17 +276,74 @@ def read_nexrad_archive(filename, field_names=None, additional_metadata=None,
         instrument_parameters=instrument_parameters)
 
 
+def read_nexrad_stream(stream, scans=None, **kwargs):
+    """
+    Read scans from a stream of NEXRAD Level 2 data chunks.
+
+    Parameters
+    ----------
+    stream : NEXRADLevel2Stream
+        Stream to which the NEXRAD Level 2 data chunks have been added.
+    scans : list or None, optional
+        Scans (0 based) to read from the stream.  None, the default, reads
+        all scans which have been completed.  This function is typically
+        called from the stream callback to read each scan as it is
+        completed.
+
+    Additional keyword parameters are passed to
+    :py:func:`read_nexrad_archive`.
+
+    Returns
+    -------
+    radar : Radar
+        Radar object containing the requested scans.  The sweep_number
+        attribute gives the scan number of each sweep.
+
+    """
+    if scans is None:
+        scans = stream.completed_scans
+    archive = BytesIO(stream.get_archive(scans))
+    return read_nexrad_archive(archive, scans=scans, **kwargs)
+
+
+class _NEXRADLevel2VariableGateField(object):
+    """
+    A class storing raw field data with a variable number of gates per ray,
+    the data is unpacked, scaled and offset when called.
+    """
+
+    def __init__(self, packed, scale_offset, ray_n_gates, ray_start_index,
+                 shape):
+        """ initialize. """
+        self.packed = packed
+        self.scale_offset = scale_offset
+        self.ray_n_gates = ray_n_gates
+        self.ray_start_index = ray_start_index
+        self.shape = shape
+
+    def __call__(self):
+        """ Return the array containing the field data. """
+        data = _unpack_variable_gates(
+            self.packed, self.shape, self.ray_n_gates, self.ray_start_index)
+        raw = data.filled(1)
+        if self.scale_offset is None:
+            return np.ma.masked_less_equal(raw, 1)
+        return _scale_moment_data(raw, *self.scale_offset)
+
+
 class _NEXRADLevel2StagedField(object):
     """
     A class to facilitate on demand loading of field data from a Level 2 file.
     """
 
-    def __init__(self, nfile, moment, max_ngates):
+    def __init__(self, nfile, moment, max_ngates, scans=None):
         """ initialize. """
         self.nfile = nfile
         self.moment = moment
         self.max_ngates = max_ngates
+        self.scans = scans
 
     def __call__(self):
         """ Return the array containing the field data. """
-        return self.nfile.get_data(self.moment, self.max_ngates)
+        return self.nfile.get_data(
+            self.moment, self.max_ngates, scans=self.scans)
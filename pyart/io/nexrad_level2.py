@@ -7,13 +7,26 @@ pyart.io.nexrad_level2
     :template: dev_template.rst
 
     NEXRADLevel2File
+    NEXRADLevel2Stream
 
 .. autosummary::
     :toctree: generated/
 
+    _scale_moment_data
     _decompress_records
+    _find_compressed_blocks
+    _iter_decompressed_blocks
+    _decompress_blocks_in_pool
+    _join_blocks
+    _index_records
+    _byte_value
+    _record_type
     _get_record_from_buf
     _get_msg31_data_block
+    _read_buffer
+    _close_mmap
+    _gather_structures
+    _structure_dtype
     _structure_size
     _unpack_from_buf
     _unpack_structure
@@ -75,11 +88,22 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import bz2
+import io
+import mmap
+import os
 import struct
 from datetime import datetime, timedelta
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 
+# file objects which can be memory mapped, the built-in file objects
+# returned by open in Python 2 are not io module classes.
+try:
+    _MAPPABLE_FILE_TYPES = (io.BufferedReader, io.FileIO, file)  # noqa
+except NameError:
+    _MAPPABLE_FILE_TYPES = (io.BufferedReader, io.FileIO)
+
 
 class NEXRADLevel2File(object):
     """
@@ -92,15 +116,34 @@ class NEXRADLevel2File(object):
     only "message 31" type files are supported, "message 1" file cannot be
     read using this class.
 
+    When the file is opened only the message headers are scanned, building
+    a compact index of the message 31 records.  Moment data is decoded from
+    the (decompressed) file contents when requested.
+
     Parameters
     ----------
     filename : str
         Filename of Archive II file to read.
+    last_scan : int or None
+        Last scan (0 based) which will be read from the file.  Records
+        collected after this scan are not indexed and, for compressed files,
+        blocks containing only such records are not decompressed.  The
+        records of all earlier scans are always indexed and decompressed.
+        None, the default, reads all scans.
+    nthreads : int, optional
+        Number of threads used to decompress the blocks of compressed files.
+        The default, 1, decompresses the blocks in turn.
 
     Attributes
     ----------
     msg31s : list
-        Message 31 message in the file.
+        Message 31 message in the file.  These messages are fully decoded
+        the first time this attribute is accessed.
+    msg31_index : ndarray
+        Structured array indexing the message 31 records in the file.  The
+        'offset' field gives the location of each message in the decompressed
+        file contents, other fields contain the message header elements used
+        to locate the radials and the block pointers.
     nscans : int
         Number of scans in the file.
     scan_msgs : list of arrays
@@ -111,9 +154,12 @@ class NEXRADLevel2File(object):
     vcp : dict
         VCP information dictionary.
     _records : list
-        A list of all records (message) in the file.
+        A list of all records (message) in the file.  These are decoded the
+        first time the attribute is accessed.
     _fh : file-like
         File like object from which data is read.
+    _mmap : mmap or None
+        Memory map of uncompressed files, closed when the file is closed.
 
     References
     ----------
@@ -123,7 +169,7 @@ class NEXRADLevel2File(object):
 
 
     """
-    def __init__(self, filename):
+    def __init__(self, filename, last_scan=None, nthreads=1):
         """ initalize the object. """
         # read in the volume header and compression_record
         if hasattr(filename, 'read'):
@@ -135,41 +181,78 @@ class NEXRADLevel2File(object):
         compression_record = fh.read(COMPRESSION_RECORD_SIZE)
 
         # read the records in the file, decompressing as needed
+        if last_scan is None:
+            max_elevation_number = None
+        else:
+            max_elevation_number = int(last_scan) + 1
         s = slice(CONTROL_WORD_SIZE, CONTROL_WORD_SIZE + 2)
+        self._mmap = None
         if compression_record[s] == b'BZ':
-            buf = _decompress_records(fh)
+            buf = _decompress_records(
+                fh, nthreads, max_elevation_number=max_elevation_number)
         elif compression_record[s] == b'\x00\x00':
-            buf = fh.read()
+            buf, self._mmap = _read_buffer(fh)
         else:
             raise IOError('unknown compression record')
         self._fh = fh
-
-        # read the records from the buffer
-        self._records = []
-        buf_length = len(buf)
-        pos = 0
-        while pos < buf_length:
-            pos, dic = _get_record_from_buf(buf, pos)
-            self._records.append(dic)
-
-        # pull out msg31 records which contain the moment data.
-        self.msg31s = [r for r in self._records if r['header']['type'] == 31]
-        if len(self.msg31s) == 0:
+        self._buf = buf
+        self._buf_array = np.frombuffer(buf, dtype='u1')
+
+        # scan the record headers, indexing the msg31 records which contain
+        # the moment data.
+        record_pos, self.msg31_index, _ = _index_records(
+            buf, max_elevation_number)
+        self._record_pos = record_pos
+        self._decoded_records = None
+        if len(self.msg31_index) == 0:
             raise ValueError('No MSG31 records found, cannot read file')
-        elev_nums = np.array([m['msg31_header']['elevation_number']
-                             for m in self.msg31s])
+        elev_nums = self.msg31_index['elevation_number']
         self.scan_msgs = [np.where(elev_nums == i + 1)[0]
                           for i in range(elev_nums.max())]
         self.nscans = len(self.scan_msgs)
 
-        # pull out the vcp record
-        self.vcp = [r for r in self._records if r['header']['type'] == 5][0]
-
+        # decode the vcp record
+        for pos in record_pos:
+            if _record_type(buf, pos) == 5:
+                self.vcp = _get_record_from_buf(buf, pos)[1]
+                break
         return
 
-    def close(self):
-        """ Close the file. """
+    @property
+    def _records(self):
+        """ All records in the file, decoded on first access. """
+        if self._decoded_records is None:
+            self._decoded_records = [_get_record_from_buf(self._buf, pos)[1]
+                                     for pos in self._record_pos]
+        return self._decoded_records
+
+    @property
+    def msg31s(self):
+        """ Message 31 records in the file, decoded on first access. """
+        return [r for r in self._records if r['header']['type'] == 31]
+
+    def close(self, keep_data=False):
+        """
+        Close the file.
+
+        Parameters
+        ----------
+        keep_data : bool, optional
+            True to keep the file contents so that data can still be
+            retrieved after the file is closed, the contents of memory mapped
+            files are copied into memory.  False, the default, releases the
+            memory map of uncompressed files.
+
+        """
         self._fh.close()
+        if self._mmap is not None:
+            if keep_data:
+                self._buf = bytes(self._buf)
+                self._buf_array = np.frombuffer(self._buf, dtype='u1')
+            else:
+                self._buf = self._buf_array = None
+            _close_mmap(self._mmap)
+            self._mmap = None
 
     def location(self):
         """
@@ -185,13 +268,19 @@ class NEXRADLevel2File(object):
             Height of radar and feedhorn in meters above mean sea level.
 
         """
-        dic = self.msg31s[0]['VOL']
+        dic = self._get_msg31_block(0, 'VOL')
         return dic['lat'], dic['lon'], dic['height'] + dic['feedhorn_height']
 
-    def scan_info(self):
+    def scan_info(self, scans=None):
         """
         Return a list of dictionaries with scan information.
 
+        Parameters
+        ----------
+        scans : list or None
+            Scans (0 based) for which information will be returned.  None
+            (the default) returns information on all scans in the volume.
+
         Returns
         -------
         scan_info : list
@@ -203,16 +292,22 @@ class NEXRADLevel2File(object):
             given scan.
 
         """
+        if scans is None:
+            scans = range(self.nscans)
         info = []
-        for scan in range(self.nscans):
+        for scan in scans:
             nrays = self.get_nrays(scan)
 
             msg31_number = self.scan_msgs[scan][0]
-            msg = self.msg31s[msg31_number]
 
             nexrad_moments = ['REF', 'VEL', 'SW', 'ZDR', 'PHI', 'RHO']
-            moments = [f for f in nexrad_moments if f in msg]
-            ngates = [msg[f]['ngates'] for f in moments]
+            moments = []
+            ngates = []
+            for moment in nexrad_moments:
+                dic = self._get_msg31_block(msg31_number, moment, False)
+                if dic is not None:
+                    moments.append(moment)
+                    ngates.append(dic['ngates'])
             info.append({
                 'nrays': nrays,
                 'ngates': ngates,
@@ -253,7 +348,7 @@ class NEXRADLevel2File(object):
             Range in meters from the antenna to the center of gate (bin).
 
         """
-        dic = self.msg31s[self.scan_msgs[scan_num][0]][moment]
+        dic = self._get_msg31_block(self.scan_msgs[scan_num][0], moment, False)
         ngates = dic['ngates']
         first_gate = dic['first_gate']
         gate_spacing = dic['gate_spacing']
@@ -269,16 +364,48 @@ class NEXRADLevel2File(object):
         Return an array of msg31 header elements for all rays in scans.
         """
         msg_nums = self._msg_nums(scans)
-        t = [self.msg31s[i]['msg31_header'][key] for i in msg_nums]
-        return np.array(t)
+        return self.msg31_index[key][msg_nums]
 
     def _msg31_rad_array(self, scans, key):
         """
         Return an array of msg31 RAD elements for all rays in scans.
         """
         msg_nums = self._msg_nums(scans)
-        t = [self.msg31s[i]['RAD'][key] for i in msg_nums]
-        return np.array(t)
+        pos = self._msg31_block_positions(msg_nums, 'RAD')
+        blocks = _gather_structures(
+            self._buf_array, pos, RADIAL_DATA_BLOCK_DTYPE)
+        return blocks[key].astype('int64')
+
+    def _msg31_block_positions(self, msg_nums, block_name):
+        """
+        Return the locations of a data block within the file contents for
+        msg31 records, -1 for records which do not contain the block.
+        """
+        msg_nums = np.asarray(msg_nums, dtype=np.intp)
+        offsets = self.msg31_index['offset'][msg_nums]
+        pointers = self.msg31_index['block_pointers'][msg_nums]
+        ptrs = offsets[:, np.newaxis] + pointers
+        name_loc = ptrs[..., np.newaxis] + np.arange(1, 4)
+        name_loc = np.minimum(name_loc, len(self._buf_array) - 1)
+        name = np.frombuffer(block_name.ljust(3).encode('ascii'), 'u1')
+        match = np.logical_and(
+            np.all(self._buf_array[name_loc] == name, axis=-1), pointers > 0)
+        first = np.argmax(match, axis=1)
+        pos = ptrs[np.arange(len(msg_nums)), first]
+        pos[~np.any(match, axis=1)] = -1
+        return pos
+
+    def _get_msg31_block(self, msg_num, block_name, with_data=True):
+        """
+        Decode a data block from a msg31 record, None if the record does
+        not contain the block.
+        """
+        ptr = self._msg31_block_positions([msg_num], block_name)[0]
+        if ptr < 0:
+            return None
+        if not with_data:
+            return _unpack_from_buf(self._buf, ptr, GENERIC_DATA_BLOCK)
+        return _get_msg31_data_block(self._buf, ptr)[1]
 
     def get_times(self, scans=None):
         """
@@ -458,12 +585,8 @@ class NEXRADLevel2File(object):
             data = np.ones((nrays, max_ngates), dtype='u1')
         else:
             data = np.ones((nrays, max_ngates), dtype='u2')
-        for i, msg_num in enumerate(msg_nums):
-            msg = self.msg31s[msg_num]
-            if moment not in msg.keys():
-                continue
-            ngates = msg[moment]['ngates']
-            data[i, :ngates] = msg[moment]['data']
+        for rays, values in self._iter_moment_data(moment, scans):
+            data[rays, :values.shape[1]] = values
 
         # return raw data if requested
         if raw_data:
@@ -471,33 +594,532 @@ class NEXRADLevel2File(object):
 
         # mask, scan and offset, assume that the offset and scale
         # are the same in all scans/gates
-        for scan in scans:  # find a scan which contains the moment
-            msg_num = self.scan_msgs[scan][0]
-            msg = self.msg31s[msg_num]
-            if moment in msg.keys():
-                offset = np.float32(msg[moment]['offset'])
-                scale = np.float32(msg[moment]['scale'])
-                return (np.ma.masked_less_equal(data, 1) - offset) / (scale)
+        scale_offset = self.get_scale_offset(moment, scans)
+        if scale_offset is not None:
+            return _scale_moment_data(data, *scale_offset)
 
         # moment is not present in any scan, mask all values
         return np.ma.masked_less_equal(data, 1)
 
+    def get_ngates(self, moment, scans=None):
+        """
+        Retrieve the number of gates of a moment in each ray.
+
+        Parameters
+        ----------
+        moment : 'REF', 'VEL', 'SW', 'ZDR', 'PHI', or 'RHO'
+            Moment of interest.
+        scans : list or None.
+            Scans (0 based) for which the number of gates will be retrieved.
+            None (the default) will return the number of gates for all
+            scans in the volume.
+
+        Returns
+        -------
+        ngates : ndarray
+            Number of gates of the moment in each ray in the requested scans,
+            0 for rays which do not contain the moment.
+
+        """
+        if scans is None:
+            scans = range(self.nscans)
+        msg_nums = self._msg_nums(scans)
+        pos = self._msg31_block_positions(msg_nums, moment)
+        rays = np.flatnonzero(pos >= 0)
+        ngates = np.zeros(len(msg_nums), dtype='int32')
+        ngates[rays] = _gather_structures(
+            self._buf_array, pos[rays], GENERIC_DATA_BLOCK_DTYPE)['ngates']
+        return ngates
+
+    def get_variable_gate_data(self, moment, ray_n_gates, scans=None):
+        """
+        Retrieve raw moment data stored with a variable number of gates.
+
+        The data is stored in the layout used by CF/Radial for variable
+        length rays, the gates of each ray are stored in turn, ray i having
+        ray_n_gates[i] gates.  Gates in a ray beyond those collected for
+        the moment have a value of 1.
+
+        Parameters
+        ----------
+        moment : 'REF', 'VEL', 'SW', 'ZDR', 'PHI', or 'RHO'
+            Moment for which to to retrieve data.
+        ray_n_gates : array
+            Number of gates stored for each ray in the requested scans, must
+            be at least the number of gates of the moment in each ray, see
+            :py:func:`get_ngates`.
+        scans : list or None.
+            Scans to retrieve data from (0 based).  None (the default) will
+            get the data for all scans in the volume.
+
+        Returns
+        -------
+        data : ndarray
+            Raw moment data with a length of the sum of ray_n_gates.
+
+        """
+        if scans is None:
+            scans = range(self.nscans)
+        ray_n_gates = np.asarray(ray_n_gates, dtype='int64')
+        ray_start_index = np.cumsum(ray_n_gates) - ray_n_gates
+        if moment != 'PHI':
+            data = np.ones((ray_n_gates.sum(), ), dtype='u1')
+        else:
+            data = np.ones((ray_n_gates.sum(), ), dtype='u2')
+        for rays, values in self._iter_moment_data(moment, scans):
+            if np.any(ray_n_gates[rays] < values.shape[1]):
+                raise ValueError(
+                    'ray_n_gates smaller than the number of moment gates')
+            index = (ray_start_index[rays, np.newaxis] +
+                     np.arange(values.shape[1]))
+            data[index] = values
+        return data
+
+    def get_scale_offset(self, moment, scans=None):
+        """
+        Retrieve the scale and offset of a moment.
+
+        Raw moment data is converted to values using
+        (raw - offset) / scale, raw values of 0 and 1 indicate data below
+        threshold and range folded data.
+
+        Parameters
+        ----------
+        moment : 'REF', 'VEL', 'SW', 'ZDR', 'PHI', or 'RHO'
+            Moment of interest.
+        scans : list or None.
+            Scans (0 based) to search for the moment.  None (the default)
+            will search all scans in the volume.
+
+        Returns
+        -------
+        scale, offset : float32 or None
+            Scale and offset of the moment in the first scan which contains
+            it, None when the moment is not present in any scan.
+
+        """
+        if scans is None:
+            scans = range(self.nscans)
+        for scan in scans:  # find a scan which contains the moment
+            msg_num = self.scan_msgs[scan][0]
+            dic = self._get_msg31_block(msg_num, moment, False)
+            if dic is not None:
+                return np.float32(dic['scale']), np.float32(dic['offset'])
+        return None
+
+    def _iter_moment_data(self, moment, scans):
+        """
+        Iterate over the raw data of a moment in a number of scans, yielding
+        the ray numbers and data of the rays in a scan with the same number
+        of gates.
+        """
+        if moment != 'PHI':
+            word_dtype = np.dtype('>u1')
+        else:
+            word_dtype = np.dtype('>u2')
+        block_size = GENERIC_DATA_BLOCK_DTYPE.itemsize
+        first_ray = 0
+        for scan in scans:
+            scan_msg_nums = self.scan_msgs[scan]
+            pos = self._msg31_block_positions(scan_msg_nums, moment)
+            rays = np.flatnonzero(pos >= 0)
+            ngates = _gather_structures(
+                self._buf_array, pos[rays], GENERIC_DATA_BLOCK_DTYPE)['ngates']
+            for scan_ngates in np.unique(ngates):
+                sel = rays[ngates == scan_ngates]
+                loc = (pos[sel, np.newaxis] + block_size +
+                       np.arange(scan_ngates * word_dtype.itemsize))
+                yield first_ray + sel, self._buf_array[loc].view(word_dtype)
+            first_ray += len(scan_msg_nums)
+
+
+class NEXRADLevel2Stream(object):
+    """
+    Class for incrementally reading NEXRAD Level II data chunks.
+
+    In real time NEXRAD Level II data is distributed as a sequence of chunks
+    for each volume [1]_.  The first (start) chunk of a volume contains the
+    volume header followed by a BZ2 compressed block of metadata records,
+    the intermediate and end chunks contain compressed blocks of message 31
+    radials.  As chunks are added to the stream each complete block is
+    decompressed and the new records indexed, allowing scans (elevation
+    cuts) to be read as soon as they are complete rather than once the
+    entire volume has been received.
+
+    Parameters
+    ----------
+    callback : function or None
+        Function called as callback(stream, scan) each time a scan in the
+        volume is completed.  None, the default, performs no callback.
+
+    Attributes
+    ----------
+    volume_header : dict or None
+        Volume header, None until the start chunk has been added.
+    vcp : dict or None
+        VCP information dictionary, None until the metadata records have
+        been received.
+    msg31_index : ndarray
+        Structured array indexing the message 31 records received, see
+        :py:class:`NEXRADLevel2File`.
+    completed_scans : list
+        Scans (0 based) of the volume which have been completed, in the
+        order they were completed.
+    volume_complete : bool
+        True when the end of the volume has been received.
+    callback : function or None
+        Function called when a scan is completed.
+
+    References
+    ----------
+    .. [1] http://www.roc.noaa.gov/WSR88D/Level_II/Level2Info.aspx
+
+    """
+
+    def __init__(self, callback=None):
+        """ initialize the object. """
+        self.callback = callback
+        self._reset()
+
+    def _reset(self):
+        """ Discard all data received. """
+        self.volume_header = None
+        self.vcp = None
+        self.msg31_index = np.zeros((0, ), dtype=MSG31_INDEX_DTYPE)
+        self.completed_scans = []
+        self.volume_complete = False
+        self._volume_header_str = None
+        self._cbuf = b''            # compressed data not yet decompressed
+        self._buf = bytearray()     # decompressed records
+        self._nblocks = 0
+        self._record_pos = []
+        self._next_pos = 0
+
+    def add_chunk(self, chunk):
+        """
+        Add a chunk of data to the stream.
+
+        Parameters
+        ----------
+        chunk : bytes
+            Chunk of NEXRAD Level II data.  A chunk which begins with a
+            volume header starts a new volume, discarding the data received
+            for any previous volume.
+
+        Returns
+        -------
+        scans : list
+            Scans (0 based) completed by the chunk.
+
+        """
+        if chunk[:4] == b'AR2V':
+            self._reset()
+            size = _structure_size(VOLUME_HEADER)
+            self._volume_header_str = chunk[:size]
+            self.volume_header = _unpack_structure(chunk[:size], VOLUME_HEADER)
+            chunk = chunk[size:]
+        elif self.volume_header is None:
+            raise ValueError(
+                'No volume header, the first chunk must start a volume')
+        self._cbuf += chunk
+
+        # decompress all complete blocks, the compression record which
+        # begins the first block is discarded.
+        while len(self._cbuf) >= CONTROL_WORD_SIZE:
+            size = abs(struct.unpack_from('>i', self._cbuf)[0])
+            end = CONTROL_WORD_SIZE + size
+            if len(self._cbuf) < end:
+                break
+            block = bz2.decompress(self._cbuf[CONTROL_WORD_SIZE:end])
+            if self._nblocks == 0:
+                block = block[COMPRESSION_RECORD_SIZE:]
+            self._buf.extend(block)
+            self._nblocks += 1
+            self._cbuf = self._cbuf[end:]
+        return self._index_new_records()
+
+    def _index_new_records(self):
+        """ Index the records decompressed since the last call. """
+        record_pos, index, self._next_pos = _index_records(
+            self._buf, pos=self._next_pos)
+        self._record_pos.extend(record_pos)
+        if self.vcp is None:
+            for pos in record_pos:
+                if _record_type(self._buf, pos) == 5:
+                    record = bytes(self._buf[pos:pos + RECORD_SIZE])
+                    self.vcp = _get_record_from_buf(record, 0)[1]
+                    break
+        if len(index) == 0:
+            return []
+        self.msg31_index = np.concatenate([self.msg31_index, index])
+
+        # scans are complete when the end of the elevation or volume is
+        # received or a radial from a later scan arrives.
+        received = np.unique(self.msg31_index['elevation_number']) - 1
+        status = index['radial_status']
+        if np.any(status == END_OF_VOLUME):
+            self.volume_complete = True
+            return self._complete_scans(received)
+        ends = index['elevation_number'][status == END_OF_ELEVATION] - 1
+        return self._complete_scans(np.union1d(received[:-1], ends))
+
+    def _complete_scans(self, scans):
+        """ Mark scans as complete, calling the callback for new scans. """
+        new_scans = [int(scan) for scan in scans
+                     if scan not in self.completed_scans]
+        self.completed_scans.extend(new_scans)
+        if self.callback is not None:
+            for scan in new_scans:
+                self.callback(self, scan)
+        return new_scans
+
+    def finish(self):
+        """
+        Mark the end of the volume.
+
+        Any scan which has been partially received is marked as complete,
+        use this method when the end of the volume is not contained in the
+        data stream.
+
+        Returns
+        -------
+        scans : list
+            Scans (0 based) completed.
+
+        """
+        self.volume_complete = True
+        received = np.unique(self.msg31_index['elevation_number']) - 1
+        return self._complete_scans(received)
+
+    def get_archive(self, scans=None):
+        """
+        Return the data received for a number of scans as a Level II file.
+
+        Parameters
+        ----------
+        scans : list or None
+            Scans (0 based) to include in the file.  None, the default,
+            includes all completed scans.
+
+        Returns
+        -------
+        archive : bytes
+            Contents of an uncompressed Archive II file containing the
+            metadata records and the records of the requested scans.  This
+            can be read using :py:class:`NEXRADLevel2File`.
 
-def _decompress_records(file_handler):
+        """
+        if scans is None:
+            scans = self.completed_scans
+        scans = sorted(set(int(scan) for scan in scans))
+        if len(scans) == 0:
+            raise ValueError('No scans to include in the archive')
+        if len(self.msg31_index) == 0:
+            raise ValueError('No scans have been received')
+        record_pos = np.array(self._record_pos, dtype='int64')
+        msg31_pos = self.msg31_index['offset'] - MSG_HEADER_DTYPE.itemsize
+        elev_nums = self.msg31_index['elevation_number']
+
+        parts = [self._volume_header_str, b'\x00' * COMPRESSION_RECORD_SIZE,
+                 bytes(self._buf[:msg31_pos[0]])]
+        for scan in scans:
+            scan_pos = msg31_pos[elev_nums == scan + 1]
+            if len(scan_pos) == 0:
+                raise ValueError('scan %d has not been received' % (scan))
+            # records extend to the start of the following record which
+            # may not have been received, pad with zeros in this case
+            i = np.searchsorted(record_pos, scan_pos[-1], side='right')
+            if i < len(record_pos):
+                end = record_pos[i]
+            else:
+                end = self._next_pos
+            part = bytes(self._buf[scan_pos[0]:end])
+            parts.append(part.ljust(end - scan_pos[0], b'\x00'))
+        return b''.join(parts)
+
+
+def _scale_moment_data(data, scale, offset):
+    """
+    Scale and offset raw moment data, masking gates with raw values of 0 or 1.
+    """
+    values = data.astype('float32')
+    values -= offset
+    values /= scale
+    return np.ma.masked_array(values, data <= 1)
+
+
+def _decompress_records(file_handler, nthreads=1,
+                        max_elevation_number=None):
     """
     Decompressed the records from an BZ2 compressed Archive 2 file.
+
+    Each compressed block is an independent bzip2 stream preceded by a
+    control word giving the size of the block.  When these can be located
+    and nthreads is larger than 1 the blocks are decompressed concurrently
+    using nthreads threads.  Otherwise the blocks are decompressed in turn.
+    When max_elevation_number is specified no blocks are decompressed after
+    the first containing a radial with a larger elevation number.  The
+    records are returned in a bytearray, excluding the compression record.
     """
+    if int(nthreads) < 1:
+        raise ValueError('nthreads must be a positive integer')
+    nthreads = int(nthreads)
     file_handler.seek(0)
     cbuf = file_handler.read()    # read all data from the file
+    start = _structure_size(VOLUME_HEADER)
+    blocks = _find_compressed_blocks(cbuf, start)
+    pool = None
+    if blocks is None:
+        batches = ([b] for b in _iter_decompressed_blocks(cbuf, start))
+    elif len(blocks) == 1 or nthreads == 1:
+        batches = ([bz2.decompress(cbuf[i:j])] for i, j in blocks)
+    else:
+        pool = ThreadPool(min(nthreads, len(blocks)))
+        batches = _decompress_blocks_in_pool(cbuf, blocks, pool, nthreads)
+
+    decompressed = []
+    unindexed = b''     # decompressed data following the last indexed record
+    pos = COMPRESSION_RECORD_SIZE
+    try:
+        for batch in batches:
+            decompressed.extend(batch)
+            if max_elevation_number is None:
+                continue
+            buf = unindexed + b''.join(batch)
+            index, end = _index_records(buf, pos=pos)[1:]
+            if np.any(index['elevation_number'] > max_elevation_number):
+                break
+            unindexed = buf[end:]
+            pos = max(end - len(buf), 0)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return _join_blocks(decompressed, COMPRESSION_RECORD_SIZE)
+
+
+def _join_blocks(blocks, skip):
+    """
+    Join decompressed blocks into a single bytearray, excluding the first
+    skip bytes.  The bytearray is allocated once and each block is copied
+    into it directly.
+    """
+    size = max(sum(len(block) for block in blocks) - skip, 0)
+    buf = bytearray(size)
+    pos = 0
+    for block in blocks:
+        view = memoryview(block)
+        if skip:
+            view = view[min(skip, len(view)):]
+            skip -= len(block) - len(view)
+        buf[pos:pos + len(view)] = view
+        pos += len(view)
+    return buf
+
+
+def _decompress_blocks_in_pool(cbuf, blocks, pool, nthreads):
+    """
+    Decompress BZ2 blocks using a thread pool, yielding the decompressed
+    blocks in batches of nthreads blocks.
+    """
+    def decompress(block):
+        """ Decompress a single block. """
+        return bz2.decompress(cbuf[block[0]:block[1]])
+
+    for i in range(0, len(blocks), nthreads):
+        yield pool.map(decompress, blocks[i:i + nthreads])
+
+
+def _find_compressed_blocks(cbuf, pos):
+    """
+    Find the start and end of the BZ2 compressed blocks in a Archive 2 file
+    from the control words, None if the blocks cannot be located.
+    """
+    blocks = []
+    cbuf_length = len(cbuf)
+    while pos < cbuf_length:
+        if pos + CONTROL_WORD_SIZE > cbuf_length:
+            return None
+        size = abs(struct.unpack_from('>i', cbuf, pos)[0])
+        start = pos + CONTROL_WORD_SIZE
+        end = start + size
+        if size == 0 or end > cbuf_length or cbuf[start:start + 3] != b'BZh':
+            return None
+        blocks.append((start, end))
+        pos = end
+    return blocks
+
+
+def _iter_decompressed_blocks(cbuf, pos):
+    """
+    Decompress the BZ2 blocks of an Archive 2 file one after another, using
+    the end of each stream to find the next block.
+    """
     decompressor = bz2.BZ2Decompressor()
-    skip = _structure_size(VOLUME_HEADER) + CONTROL_WORD_SIZE
-    buf = decompressor.decompress(cbuf[skip:])
+    yield decompressor.decompress(cbuf[pos + CONTROL_WORD_SIZE:])
     while len(decompressor.unused_data):
         cbuf = decompressor.unused_data
         decompressor = bz2.BZ2Decompressor()
-        buf += decompressor.decompress(cbuf[CONTROL_WORD_SIZE:])
+        yield decompressor.decompress(cbuf[CONTROL_WORD_SIZE:])
+
+
+def _index_records(buf, max_elevation_number=None, pos=0):
+    """
+    Find the location of all records in a buffer and index the msg31 records.
 
-    return buf[COMPRESSION_RECORD_SIZE:]
+    Records are located starting from pos until the end of the buffer or the
+    first record which is not complete.  When max_elevation_number is
+    specified the records following the first msg31 record with a larger
+    elevation number are not located.  Returns the record positions, the
+    msg31 index and the position of the first record not located.
+    """
+    msg_header_size = MSG_HEADER_DTYPE.itemsize
+    header_struct = struct.Struct('>HxB')
+    elev_num_offset = (msg_header_size +
+                       MSG_31_DTYPE.fields['elevation_number'][1])
+    record_pos = []
+    msg31_pos = []
+    buf_length = len(buf)
+    while pos + msg_header_size <= buf_length:
+        size, msg_type = header_struct.unpack_from(buf, pos)
+        if msg_type == 31:
+            if pos + size * 2 > buf_length:
+                break
+            if (max_elevation_number is not None and
+                    _byte_value(buf, pos + elev_num_offset) >
+                    max_elevation_number):
+                break
+            record_pos.append(pos)
+            msg31_pos.append(pos + msg_header_size)
+            pos += msg_header_size + size * 2 - 4
+        else:
+            if pos + RECORD_SIZE - CTM_HEADER_SIZE > buf_length:
+                break
+            record_pos.append(pos)
+            pos += RECORD_SIZE
+
+    # decode the msg31 headers at once
+    msg31_pos = np.array(msg31_pos, dtype='int64')
+    headers = _gather_structures(
+        np.frombuffer(buf, dtype='u1'), msg31_pos, MSG_31_DTYPE)
+    index = np.zeros((len(msg31_pos), ), dtype=MSG31_INDEX_DTYPE)
+    index['offset'] = msg31_pos
+    for name in ['collect_ms', 'collect_date', 'azimuth_angle',
+                 'radial_status', 'elevation_number', 'elevation_angle']:
+        index[name] = headers[name]
+    for i in range(9):
+        index['block_pointers'][:, i] = headers['block_pointer_%d' % (i + 1)]
+    return record_pos, index, pos
+
+
+def _byte_value(buf, pos):
+    """ Return the unsigned integer value of a byte in a buffer. """
+    return struct.unpack_from('>B', buf, pos)[0]
+
+
+def _record_type(buf, pos):
+    """ Return the message type of the record at a position in a buffer. """
+    return struct.unpack_from('>B', buf, pos + 3)[0]
 
 
 def _get_record_from_buf(buf, pos):
@@ -540,7 +1162,7 @@ def _get_record_from_buf(buf, pos):
 
 def _get_msg31_data_block(buf, ptr):
     """ Unpack a msg_31 data block into a dictionary. """
-    block_name = buf[ptr + 1: ptr + 4].decode('ascii').strip()
+    block_name = bytes(buf[ptr + 1: ptr + 4]).decode('ascii').strip()
 
     if block_name == 'VOL':
         dic = _unpack_from_buf(buf, ptr, VOLUME_DATA_BLOCK)
@@ -553,9 +1175,9 @@ def _get_msg31_data_block(buf, ptr):
         ngates = dic['ngates']
         ptr2 = ptr + _structure_size(GENERIC_DATA_BLOCK)
         if block_name == 'PHI':
-            data = np.fromstring(buf[ptr2: ptr2 + ngates * 2], '>u2')
+            data = np.frombuffer(buf[ptr2: ptr2 + ngates * 2], '>u2')
         else:
-            data = np.fromstring(buf[ptr2: ptr2 + ngates], '>u1')
+            data = np.frombuffer(buf[ptr2: ptr2 + ngates], '>u1')
         dic['data'] = data
     else:
         dic = {}
@@ -580,6 +1202,105 @@ def _unpack_structure(string, structure):
     return dict(zip([i[0] for i in structure], l))
 
 
+def _read_buffer(fh):
+    """
+    Return a buffer containing the remaining data in a file-like object.
+
+    Uncompressed files on disk are memory mapped and a read-only memoryview
+    of the mapping is returned, so no data is copied and the file pages are
+    shared between processes reading the same file.  Other file-like objects
+    are read into a bytes object.
+
+    Parameters
+    ----------
+    fh : file-like
+        File-like object to read from its current position.
+
+    Returns
+    -------
+    buf : memoryview or bytes
+        Buffer containing the data.
+    mapped : mmap or None
+        Memory map underlying buf or None when the data was read into a
+        bytes object.  Close the map using :py:func:`_close_mmap` once all
+        references to buf have been removed.
+
+    """
+    if isinstance(fh, _MAPPABLE_FILE_TYPES):
+        mapped = None
+        try:
+            pos = fh.tell()
+            if os.fstat(fh.fileno()).st_size > pos:
+                mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                buf = memoryview(mapped)[pos:]
+                fh.seek(0, os.SEEK_END)
+                return buf, mapped
+        except (EnvironmentError, TypeError, ValueError):
+            # not a regular file or, in Python 2, the map does not support
+            # memoryviews, read the data
+            if mapped is not None:
+                mapped.close()
+    return fh.read(), None
+
+
+def _close_mmap(mapped):
+    """
+    Close a memory map returned by :py:func:`_read_buffer`.
+
+    Maps which are still referenced by a buffer or array cannot be closed,
+    these are left open and closed when garbage collected.  Nothing is done
+    when mapped is None.
+    """
+    if mapped is None:
+        return
+    try:
+        mapped.close()
+    except BufferError:
+        pass    # data from the map is still in use
+
+
+def _gather_structures(buf_array, positions, dtype):
+    """
+    Decode structures located at the given positions in a buffer.
+
+    Parameters
+    ----------
+    buf_array : array
+        Buffer viewed as an array of unsigned bytes.
+    positions : array
+        Location of each structure in the buffer.
+    dtype : dtype
+        Structured NumPy data type describing the structure.
+
+    Returns
+    -------
+    structures : array
+        Array of structures with the given dtype.
+
+    """
+    positions = np.asarray(positions, dtype=np.intp)
+    loc = positions[:, np.newaxis] + np.arange(dtype.itemsize)
+    return buf_array[loc].view(dtype).reshape(len(positions))
+
+
+def _structure_dtype(structure):
+    """
+    Return a structured big-endian NumPy dtype for a structure.
+
+    The structure is a list of (name, format) tuples using the format
+    characters of the struct module.  Byte strings are stored as void
+    elements, bytes(element) returns the string including any trailing null
+    bytes as struct.unpack does.
+    """
+    dtypes = []
+    for name, fmt in structure:
+        if fmt.endswith('s'):
+            dtypes.append((name, 'V' + fmt[:-1]))
+        else:
+            dtypes.append((name, '>' + np.dtype(fmt).str[1:]))
+    return np.dtype(dtypes)
+
+
 # NEXRAD Level II file structures and sizes
 # The deails on these structures are documented in:
 # "Interface Control Document for the Achive II/User" RPG Build 12.0
@@ -592,6 +1313,12 @@ def _unpack_structure(string, structure):
 RECORD_SIZE = 2432
 COMPRESSION_RECORD_SIZE = 12
 CONTROL_WORD_SIZE = 4
+CTM_HEADER_SIZE = 12
+
+# radial status values marking the end of an elevation cut or volume
+# Table XVII-A Data Header Block (Message Type 31)
+END_OF_ELEVATION = 2
+END_OF_VOLUME = 4
 
 # format of structure elements
 # section 3.2.1, page 3-2
@@ -641,7 +1368,7 @@ MSG_31 = (
     ('spare_0', INT1),              # 17
     ('radial_length', INT2),        # 18-19
     ('azimuth_resolution', CODE1),  # 20
-    ('radial_spacing', CODE1),      # 21
+    ('radial_status', CODE1),       # 21
     ('elevation_number', INT1),     # 22
     ('cut_sector', INT1),           # 23
     ('elevation_angle', REAL4),     # 24-27
@@ -762,3 +1489,23 @@ RADIAL_DATA_BLOCK = (
     ('nyquist_vel', SINT2),
     ('spare', '2s')
 )
+
+# structured NumPy data types of the structures which are decoded at once
+# for many records.
+MSG_HEADER_DTYPE = _structure_dtype(MSG_HEADER)
+MSG_31_DTYPE = _structure_dtype(MSG_31)
+GENERIC_DATA_BLOCK_DTYPE = _structure_dtype(GENERIC_DATA_BLOCK)
+RADIAL_DATA_BLOCK_DTYPE = _structure_dtype(RADIAL_DATA_BLOCK)
+
+# Index of the message 31 records in a file, offset is the location of the
+# message 31 header in the decompressed file contents.
+MSG31_INDEX_DTYPE = np.dtype([
+    ('offset', 'i8'),
+    ('collect_ms', 'i8'),
+    ('collect_date', 'i4'),
+    ('azimuth_angle', 'f8'),
+    ('radial_status', 'i4'),
+    ('elevation_number', 'i4'),
+    ('elevation_angle', 'f8'),
+    ('block_pointers', 'u4', (9, )),
+])
@@ -14,11 +14,18 @@ Class for reading data from NEXRAD Level 3 files.
     :toctree: generated/
 
     nexrad_level3_message_code
+    nexrad_level3_stacked_data
     _datetime_from_mdate_mtime
+    _radial_positions
+    _segment_index
     _structure_size
     _unpack_from_buf
     _unpack_structure
     _int16_to_float16
+    _read_buffer
+    _close_mmap
+    _gather_structures
+    _structure_dtype
 
 
 """
@@ -79,11 +86,21 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import bz2
+import io
+import mmap
+import os
 import struct
 from datetime import datetime, timedelta
 
 import numpy as np
 
+# file objects which can be memory mapped, the built-in file objects
+# returned by open in Python 2 are not io module classes.
+try:
+    _MAPPABLE_FILE_TYPES = (io.BufferedReader, io.FileIO, file)  # noqa
+except NameError:
+    _MAPPABLE_FILE_TYPES = (io.BufferedReader, io.FileIO)
+
 
 class NEXRADLevel3File(object):
     """
@@ -101,14 +118,16 @@ class NEXRADLevel3File(object):
         Symbology header.
     packet_header : dict
         Radial data array packet header.
-    radial_headers : list of dicts
-        List of radials headers
+    radial_headers : array
+        Structured array of radial headers, fields are accessed by name.
     raw_data : array
         Raw unscaled, unmasked data.
     data : array
         Scaled, masked radial data.
     _fh : file-like
         File like object from which data is read.
+    _mmap : mmap or None
+        Memory map of the file contents, closed when the file is closed.
 
     """
 
@@ -119,12 +138,13 @@ class NEXRADLevel3File(object):
             fhandle = filename
         else:
             fhandle = open(filename, 'rb')
-        buf = fhandle.read()    # string buffer containing file data
+        buf, mapped = _read_buffer(fhandle)    # buffer containing file data
         self._fh = fhandle
+        self._mmap = mapped
 
         # Text header
         # Format of Text header is SDUSXX KYYYY DDHHMM\r\r\nAAABBB\r\r\n
-        self.text_header = buf[:30]
+        self.text_header = bytes(buf[:30])
         bpos = 30       # current reading position in buffer
 
         # Read and decode 18 byte Message Header Block
@@ -150,6 +170,7 @@ class NEXRADLevel3File(object):
     def close(self):
         """ Close the file. """
         self._fh.close()
+        _close_mmap(self._mmap)
 
     def _read_symbology_block(self, buf2):
         """ Read symbology block. """
@@ -160,31 +181,40 @@ class NEXRADLevel3File(object):
         packet_code = struct.unpack('>h', buf2[16:18])[0]
         assert packet_code in SUPPORTED_PACKET_CODES
         self.packet_header = _unpack_from_buf(buf2, 16, RADIAL_PACKET_HEADER)
-        self.radial_headers = []
         nbins = self.packet_header['nbins']
         nradials = self.packet_header['nradials']
         nbytes = _unpack_from_buf(buf2, 30, RADIAL_HEADER)['nbytes']
         if packet_code == 16 and nbytes != nbins:
             nbins = nbytes  # sometimes these do not match, use nbytes
-        self.raw_data = np.empty((nradials, nbins), dtype='uint8')
-        pos = 30
-
-        for radial in self.raw_data:
-            radial_header = _unpack_from_buf(buf2, pos, RADIAL_HEADER)
-            pos += 6
-            if packet_code == 16:
-                radial[:] = np.fromstring(buf2[pos:pos+nbins], '>u1')
-                pos += radial_header['nbytes']
-            else:
-                assert packet_code == AF1F
-                # decode run length encoding
-                rle_size = radial_header['nbytes'] * 2
-                rle = np.fromstring(buf2[pos:pos+rle_size], dtype='>u1')
-                colors = np.bitwise_and(rle, 0b00001111)
-                runs = np.bitwise_and(rle, 0b11110000) // 16
-                radial[:] = np.repeat(colors, runs)
-                pos += rle_size
-            self.radial_headers.append(radial_header)
+
+        # locate and decode all radial headers
+        buf_array = np.frombuffer(buf2, dtype=np.uint8)
+        positions = _radial_positions(buf2, 30, nradials, packet_code)
+        self.radial_headers = _gather_structures(
+            buf_array, positions, _structure_dtype(RADIAL_HEADER))
+        data_pos = positions + 6
+
+        if packet_code == 16:
+            loc = data_pos[:, np.newaxis] + np.arange(nbins)
+            self.raw_data = buf_array[loc]
+        else:
+            assert packet_code == AF1F
+            # decode the run length encoding of all radials at once
+            rle_sizes = self.radial_headers['nbytes'].astype(np.intp) * 2
+            rle = buf_array[_segment_index(data_pos, rle_sizes)]
+            colors = np.bitwise_and(rle, 0b00001111)
+            runs = np.right_shift(rle, 4)
+
+            # check that each radial expands to the same number of bins
+            run_ends = np.zeros((len(runs) + 1, ), dtype=np.intp)
+            np.cumsum(runs, dtype=np.intp, out=run_ends[1:])
+            rle_ends = np.cumsum(rle_sizes)
+            bins = run_ends[rle_ends] - run_ends[rle_ends - rle_sizes]
+            if np.any(bins != nbins):
+                raise ValueError(
+                    'Run length encoded radials do not contain %d bins' %
+                    (nbins))
+            self.raw_data = np.repeat(colors, runs).reshape(nradials, nbins)
 
     def get_location(self):
         """ Return the latitude, longitude and height of the radar. """
@@ -195,8 +225,8 @@ class NEXRADLevel3File(object):
 
     def get_azimuth(self):
         """ Return an array of starting azimuth angles in degrees. """
-        azimuths = [d['angle_start'] for d in self.radial_headers]
-        return np.array(azimuths, dtype='float32') * 0.1
+        azimuths = self.radial_headers['angle_start']
+        return azimuths.astype('float32') * 0.1
 
     def get_range(self):
         """ Return an array of gate range spacing in meters. """
@@ -317,6 +347,39 @@ def _datetime_from_mdate_mtime(mdate, mtime):
     return epoch + timedelta(days=mdate - 1, seconds=mtime)
 
 
+def _radial_positions(buf, pos, nradials, packet_code):
+    """ Return the location of each radial header in a radial packet. """
+    # the size of each radial is given in bytes for packet code 16 and in
+    # halfwords for run length encoded radials.  This size is typically
+    # constant for packet code 16 allowing the positions to be calculated
+    # directly and verified.
+    unit = 1 if packet_code == 16 else 2
+    nbytes = struct.unpack_from('>h', buf, pos)[0]
+    positions = pos + np.arange(nradials, dtype=np.intp) * (6 + nbytes * unit)
+    if nradials > 0 and positions[-1] + 2 <= len(buf):
+        buf_array = np.frombuffer(buf, dtype=np.uint8)
+        loc = positions[:, np.newaxis] + np.arange(2)
+        if np.all(buf_array[loc].view('>i2') == nbytes):
+            return positions
+
+    # otherwise walk the radial headers, the location of each radial depends
+    # on the size of all previous radials so they are found in turn.  This
+    # is a single unpack per radial, all data is decoded using arrays.
+    unpack_from = struct.Struct('>h').unpack_from
+    positions = np.empty((nradials, ), dtype=np.intp)
+    for i in range(nradials):
+        positions[i] = pos
+        pos += 6 + unpack_from(buf, pos)[0] * unit
+    return positions
+
+
+def _segment_index(starts, lengths):
+    """ Return indices which gather multiple segments of a buffer. """
+    total = np.sum(lengths)
+    segment_starts = np.cumsum(lengths) - lengths
+    return np.repeat(starts - segment_starts, lengths) + np.arange(total)
+
+
 def _structure_size(structure):
     """ Find the size of a structure in bytes. """
     return struct.calcsize('>' + ''.join([i[1] for i in structure]))
@@ -335,6 +398,105 @@ def _unpack_structure(string, structure):
     return dict(zip([i[0] for i in structure], lst))
 
 
+def _read_buffer(fh):
+    """
+    Return a buffer containing the remaining data in a file-like object.
+
+    Uncompressed files on disk are memory mapped and a read-only memoryview
+    of the mapping is returned, so no data is copied and the file pages are
+    shared between processes reading the same file.  Other file-like objects
+    are read into a bytes object.
+
+    Parameters
+    ----------
+    fh : file-like
+        File-like object to read from its current position.
+
+    Returns
+    -------
+    buf : memoryview or bytes
+        Buffer containing the data.
+    mapped : mmap or None
+        Memory map underlying buf or None when the data was read into a
+        bytes object.  Close the map using :py:func:`_close_mmap` once all
+        references to buf have been removed.
+
+    """
+    if isinstance(fh, _MAPPABLE_FILE_TYPES):
+        mapped = None
+        try:
+            pos = fh.tell()
+            if os.fstat(fh.fileno()).st_size > pos:
+                mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                buf = memoryview(mapped)[pos:]
+                fh.seek(0, os.SEEK_END)
+                return buf, mapped
+        except (EnvironmentError, TypeError, ValueError):
+            # not a regular file or, in Python 2, the map does not support
+            # memoryviews, read the data
+            if mapped is not None:
+                mapped.close()
+    return fh.read(), None
+
+
+def _close_mmap(mapped):
+    """
+    Close a memory map returned by :py:func:`_read_buffer`.
+
+    Maps which are still referenced by a buffer or array cannot be closed,
+    these are left open and closed when garbage collected.  Nothing is done
+    when mapped is None.
+    """
+    if mapped is None:
+        return
+    try:
+        mapped.close()
+    except BufferError:
+        pass    # data from the map is still in use
+
+
+def _gather_structures(buf_array, positions, dtype):
+    """
+    Decode structures located at the given positions in a buffer.
+
+    Parameters
+    ----------
+    buf_array : array
+        Buffer viewed as an array of unsigned bytes.
+    positions : array
+        Location of each structure in the buffer.
+    dtype : dtype
+        Structured NumPy data type describing the structure.
+
+    Returns
+    -------
+    structures : array
+        Array of structures with the given dtype.
+
+    """
+    positions = np.asarray(positions, dtype=np.intp)
+    loc = positions[:, np.newaxis] + np.arange(dtype.itemsize)
+    return buf_array[loc].view(dtype).reshape(len(positions))
+
+
+def _structure_dtype(structure):
+    """
+    Return a structured big-endian NumPy dtype for a structure.
+
+    The structure is a list of (name, format) tuples using the format
+    characters of the struct module.  Byte strings are stored as void
+    elements, bytes(element) returns the string including any trailing null
+    bytes as struct.unpack does.
+    """
+    dtypes = []
+    for name, fmt in structure:
+        if fmt.endswith('s'):
+            dtypes.append((name, 'V' + fmt[:-1]))
+        else:
+            dtypes.append((name, '>' + np.dtype(fmt).str[1:]))
+    return np.dtype(dtypes)
+
+
 def nexrad_level3_message_code(filename):
     """ Return the message (product) code for a NEXRAD Level 3 file. """
     fhl = open(filename, 'r')
@@ -344,6 +506,60 @@ def nexrad_level3_message_code(filename):
     return msg_header['code']
 
 
+def nexrad_level3_stacked_data(filenames, raw_data=False):
+    """
+    Read the data from multiple NEXRAD Level 3 products into a single array.
+
+    Parameters
+    ----------
+    filenames : str or list of str
+        List of NEXRAD Level 3 product files or a directory containing
+        only such files.  Files in a directory are read in sorted order.
+    raw_data : bool, optional
+        True to return the raw unscaled data, False to return the scaled and
+        masked data as provided by :py:meth:`NEXRADLevel3File.get_data`.
+
+    Returns
+    -------
+    data : array
+        Data from all products stacked along the first dimension, shape is
+        (nproducts, nradials, nbins).  All products must have the same
+        number of radials and bins.
+
+    """
+    if not isinstance(filenames, (list, tuple)):
+        if os.path.isdir(filenames):
+            filenames = [os.path.join(filenames, f) for f in
+                         sorted(os.listdir(filenames))
+                         if not f.startswith('.')]
+        else:
+            filenames = [filenames]
+    if len(filenames) == 0:
+        raise ValueError('no NEXRAD Level 3 products to read')
+
+    data = None
+    for i, filename in enumerate(filenames):
+        nfile = NEXRADLevel3File(filename)
+        if raw_data:
+            product_data = nfile.raw_data
+        else:
+            product_data = nfile.get_data()
+        nfile.close()
+
+        if data is None:
+            shape = (len(filenames), ) + product_data.shape
+            if raw_data:
+                data = np.empty(shape, dtype=product_data.dtype)
+            else:
+                data = np.ma.masked_all(shape, dtype=product_data.dtype)
+        elif product_data.shape != data.shape[1:]:
+            raise ValueError(
+                'product %s has shape %s, expected %s' %
+                (filename, product_data.shape, data.shape[1:]))
+        data[i] = product_data
+    return data
+
+
 # NEXRAD Level III file structures, sizes, and static data
 # The deails on these structures are documented in:
 # "INTERFACE CONTROL DOCUMENT FOR THE RPG TO CLASS 1 USER" RPG Build 13.0
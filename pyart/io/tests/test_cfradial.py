@@ -341,6 +341,68 @@ def test_write_ppi_arm_time_vars():
         dset.close()
 
 
+def test_write_packed_field():
+    # packed fields are written without requantizing the data
+    with pyart.testing.InTemporaryDirectory():
+        tmpfile = 'tmp_packed.nc'
+        radar = pyart.testing.make_empty_ppi_radar(10, 36, 1)
+        packed = np.arange(360, dtype='int32').reshape(36, 10) % 256
+        radar.fields['reflectivity'] = pyart.core.PackedField(
+            {'units': 'dBZ'}, packed.astype('uint8'), 0.5, -32.,
+            fill_value=0)
+        pyart.io.write_cfradial(tmpfile, radar, format='NETCDF4')
+        assert radar.fields['reflectivity'].packed is not None
+
+        dset = netCDF4.Dataset(tmpfile)
+        var = dset.variables['reflectivity']
+        assert var.dtype == np.uint8
+        assert_almost_equal(var.scale_factor, 0.5)
+        assert_almost_equal(var.add_offset, -32.)
+        var.set_auto_maskandscale(False)
+        assert_array_equal(var[:], packed)
+        dset.close()
+
+        radar2 = pyart.io.read_cfradial(tmpfile)
+        data = radar2.fields['reflectivity']['data']
+        ref_data = radar.fields['reflectivity']['data']
+        assert_array_equal(data.mask, ref_data.mask)
+        assert_almost_equal(data, ref_data)
+
+
+def test_write_field_options():
+    # chunking, compression and packing options for the field variables
+    with pyart.testing.InTemporaryDirectory():
+        radar = pyart.testing.make_empty_ppi_radar(10, 36, 3)
+        for name in ['reflectivity', 'velocity']:
+            field = pyart.config.get_metadata(name)
+            field['data'] = np.ma.masked_array(
+                np.linspace(-20, 60, 1080, dtype='float32').reshape(108, 10))
+            field['data'][0, 0] = np.ma.masked
+            radar.add_field(name, field)
+
+        tmpfile = 'tmp_field_options.nc'
+        pyart.io.write_cfradial(
+            tmpfile, radar, field_chunks='sweep', complevel=2,
+            shuffle=False, field_dtype='int16')
+        assert 'scale_factor' not in radar.fields['velocity']
+
+        dset = netCDF4.Dataset(tmpfile)
+        var = dset.variables['velocity']
+        assert var.dtype == np.int16
+        assert var.chunking() == [36, 10]
+        assert var.filters()['complevel'] == 2
+        assert not var.filters()['shuffle']
+        assert dset.variables['azimuth'].dtype == np.float32
+        dset.close()
+
+        radar2 = pyart.io.read_cfradial(tmpfile)
+        for name in ['reflectivity', 'velocity']:
+            data = radar2.fields[name]['data']
+            ref_data = radar.fields[name]['data']
+            assert_array_equal(data.mask, ref_data.mask)
+            assert_almost_equal(data, ref_data, 2)
+
+
 def check_dataset_to_ref(dset, ref):
     """ Check that all data in Dataset is contained in the ref Dataset. """
 
@@ -519,3 +581,80 @@ def test_calculate_scale_and_offset():
         pyart.io.cfradial._calculate_scale_and_offset(
             {'data': data}, np.dtype('u1'), 100, 100)
         assert len(w) == 1
+
+
+def test_unpack_variable_gate_field_dic():
+    data = np.ma.arange(9, dtype='float32')
+    data[4] = np.ma.masked
+    ray_n_gates = np.array([2, 4, 0, 3])
+    for ray_start_index in [np.array([0, 2, 6, 6]), np.array([6, 2, 0, 0])]:
+        dic = {'data': data}
+        pyart.io.cfradial._unpack_variable_gate_field_dic(
+            dic, (4, 5), ray_n_gates, ray_start_index)
+        unpacked = dic['data']
+        assert unpacked.shape == (4, 5)
+        assert unpacked.dtype == np.float32
+        assert np.ma.count(unpacked) == 8
+        assert_array_equal(unpacked[1, :4].mask, [False, False, True, False])
+        assert_array_equal(unpacked[1].compressed(), [2, 3, 5])
+        assert_array_equal(unpacked[3, 3:].mask, [True, True])
+    assert_array_equal(unpacked[0, :2], [6, 7])
+    assert_array_equal(unpacked[3, :3], [0, 1, 2])
+
+
+def _make_multi_sweep_file(filename):
+    radar = pyart.testing.make_empty_ppi_radar(11, 5, 4)
+    radar.fixed_angle['data'] = np.array([0.5, 1.5, 2.5, 3.5], 'float32')
+    field = pyart.config.get_metadata('reflectivity')
+    field['data'] = np.arange(20 * 11, dtype='float32').reshape(20, 11)
+    radar.add_field('reflectivity', field)
+    pyart.io.write_cfradial(filename, radar)
+    return radar
+
+
+def test_read_sweeps_and_gate_range():
+    with pyart.testing.InTemporaryDirectory():
+        tmpfile = 'tmp_sweeps_gate_range.nc'
+        _make_multi_sweep_file(tmpfile)
+        for delay in [False, True]:
+            radar = pyart.io.read_cfradial(
+                tmpfile, sweeps=[3, 1], gate_range=(200., 500.),
+                delay_field_loading=delay)
+            assert radar.nsweeps == 2
+            assert radar.nrays == 10
+            assert radar.ngates == 4
+            assert_array_equal(radar.sweep_number['data'], [1, 3])
+            assert_array_equal(radar.fixed_angle['data'], [1.5, 3.5])
+            assert_array_equal(radar.sweep_start_ray_index['data'], [0, 5])
+            assert_array_equal(radar.sweep_end_ray_index['data'], [4, 9])
+            assert_array_equal(radar.azimuth['data'], [
+                5, 6, 7, 8, 9, 15, 16, 17, 18, 19])
+            assert_almost_equal(radar.range['data'], [200, 300, 400, 500])
+            assert_almost_equal(
+                radar.range['meters_to_center_of_first_gate'], 200)
+            data = radar.fields['reflectivity']['data']
+            assert data.shape == (10, 4)
+            assert_almost_equal(data[0], [57, 58, 59, 60])
+            assert_almost_equal(data[5], [167, 168, 169, 170])
+
+
+def test_read_sweeps_invalid():
+    with pyart.testing.InTemporaryDirectory():
+        tmpfile = 'tmp_sweeps_invalid.nc'
+        _make_multi_sweep_file(tmpfile)
+        assert_raises(ValueError, pyart.io.read_cfradial, tmpfile,
+                      sweeps=[4])
+        assert_raises(ValueError, pyart.io.read_cfradial, tmpfile,
+                      sweeps=[])
+        assert_raises(ValueError, pyart.io.read_cfradial, tmpfile,
+                      gate_range=(2000., 3000.))
+
+
+def test_select_variable_gate_rays():
+    ray_n_gates = np.array([2, 4, 0, 3])
+    ray_start_index = np.array([6, 2, 0, 0])
+    n_gates, start_index = pyart.io.cfradial._select_variable_gate_rays(
+        ray_n_gates, ray_start_index, [slice(0, 1), slice(3, 4)],
+        [slice(6, 8), slice(0, 3)])
+    assert_array_equal(n_gates, [2, 3])
+    assert_array_equal(start_index, [0, 2])
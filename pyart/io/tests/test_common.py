@@ -0,0 +1,80 @@
+""" Unit Tests for Py-ART's io/common.py module. """
+
+import bz2
+import imp
+import mmap
+import os
+import struct
+from io import BytesIO
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+import pyart
+from pyart.io import common
+
+
+def test_read_buffer_mmap():
+    with pyart.testing.InTemporaryDirectory():
+        with open('tmp_read_buffer.bin', 'wb') as f:
+            f.write(b'HEADER' + bytes(bytearray(range(100))))
+        fh = open('tmp_read_buffer.bin', 'rb')
+        fh.read(6)
+        buf, mapped = common._read_buffer(fh)
+        assert isinstance(mapped, mmap.mmap)
+        assert bytes(buf) == bytes(bytearray(range(100)))
+        assert fh.read() == b''
+
+        # maps referenced by an array are not closed
+        buf_array = np.frombuffer(buf, dtype='u1')
+        del buf
+        common._close_mmap(mapped)
+        assert not mapped.closed
+        assert_array_equal(buf_array, np.arange(100))
+
+        del buf_array
+        common._close_mmap(mapped)
+        assert mapped.closed
+        fh.close()
+
+
+def test_read_buffer_read():
+    # file-like objects which are not files on disk are read
+    buf, mapped = common._read_buffer(BytesIO(b'abcd'))
+    assert buf == b'abcd'
+    assert mapped is None
+    common._close_mmap(mapped)
+
+    # compressed files are not mapped even though they have a fileno
+    with pyart.testing.InTemporaryDirectory():
+        with bz2.BZ2File('tmp_read_buffer.bz2', 'wb') as f:
+            f.write(b'abcd')
+        fh = bz2.BZ2File('tmp_read_buffer.bz2', 'rb')
+        buf, mapped = common._read_buffer(fh)
+        fh.close()
+    assert buf == b'abcd'
+    assert mapped is None
+
+
+def test_gather_structures():
+    structure = (('name', '4s'), ('value', 'h'), ('size', 'I'))
+    dtype = common._structure_dtype(structure)
+    assert dtype.itemsize == struct.calcsize('>4shI')
+
+    buf = (struct.pack('>4shI', b'AB', -3, 10) + b'xx' +
+           struct.pack('>4shI', b'CDEF', 7, 20))
+    buf_array = np.frombuffer(buf, dtype='u1')
+    structures = common._gather_structures(buf_array, [0, 12], dtype)
+    assert structures.shape == (2, )
+    assert bytes(structures['name'][0]) == b'AB\x00\x00'
+    assert bytes(structures['name'][1]) == b'CDEF'
+    assert_array_equal(structures['value'], [-3, 7])
+    assert_array_equal(structures['size'], [10, 20])
+
+
+def test_standalone_readers():
+    # the low level readers can be used outside of Py-ART
+    for name in ['nexrad_level2', 'nexrad_level3', 'uffile']:
+        filename = os.path.join(os.path.dirname(common.__file__), name + '.py')
+        module = imp.load_source('standalone_' + name, filename)
+        assert hasattr(module, '_read_buffer')
@@ -7,7 +7,8 @@ from datetime import datetime
 from io import BytesIO
 
 import numpy as np
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_array_equal
+from numpy.testing import assert_raises
 
 import pyart
 from pyart.io.mdv_common import MdvFile
@@ -300,12 +301,49 @@ def test_read_all_fields():
     assert_almost_equal(mdvfile.fields_data[0][0, 1, 2], 13.19, 2)
 
 
+def test_read_all_fields_nthreads():
+    mdvfile = MdvFile(pyart.testing.MDV_PPI_FILE)
+    mdvfile.read_all_fields(nthreads=2)
+    ref_mdvfile = MdvFile(pyart.testing.MDV_PPI_FILE)
+    ref_mdvfile.read_all_fields()
+    for data, ref_data in zip(mdvfile.fields_data, ref_mdvfile.fields_data):
+        assert data.shape == ref_data.shape
+        assert_array_equal(np.isnan(data), np.isnan(ref_data))
+        assert_almost_equal(data, ref_data)
+    assert_raises(ValueError, mdvfile.read_all_fields, 0)
+
+
+def test_decode_rle8():
+    # key values in the count or value of a run are not run markers
+    compr_data = bytes(bytearray([1, 2, 9, 3, 7, 5, 9, 9, 9, 9, 2, 9, 6]))
+    out = pyart.io.mdv_common._decode_rle8(compr_data, 9, 18)
+    assert out.dtype == np.uint8
+    assert_array_equal(out, [1, 2, 7, 7, 7, 5] + [9] * 11 + [6])
+
+    # truncated runs
+    assert_raises(ValueError, pyart.io.mdv_common._decode_rle8,
+                  compr_data[:-2], 9, 18)
+
+
 def test_read_all_fields_on_creation():
     mdvfile2 = MdvFile(pyart.testing.MDV_PPI_FILE, read_fields=True)
     assert mdvfile2.fields_data[0] is not None
     assert_almost_equal(mdvfile2.fields_data[0][0, 1, 2], 13.19, 2)
     mdvfile2.close()
 
+    mdvfile3 = MdvFile(pyart.testing.MDV_PPI_FILE, read_fields=True,
+                       nthreads=2)
+    assert_array_equal(mdvfile3.fields_data[0], mdvfile2.fields_data[0])
+    mdvfile3.close()
+
+
+def test_read_all_fields_fnums():
+    mdvfile = MdvFile(pyart.testing.MDV_PPI_FILE)
+    mdvfile.read_all_fields(nthreads=2, fnums=[])
+    assert mdvfile.fields_data[0] is None
+    mdvfile.read_all_fields(nthreads=2, fnums=[0])
+    assert mdvfile.fields_data[0] is not None
+
 
 def test_mdvfile_radar_stubs():
     mdvfile = pyart.io.mdv_common.MdvFile(None)
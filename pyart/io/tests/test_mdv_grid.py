@@ -219,3 +219,12 @@ def test_mdv_degree_grid():
     assert_almost_equal(grid.axes['x_disp']['data'][0], -129.99, 2)
     assert grid.axes['y_disp']['units'] == 'degree_N'
     assert_almost_equal(grid.axes['y_disp']['data'][0], 20.01, 2)
+
+
+def test_mdv_degree_grid_nthreads():
+    grid = pyart.io.read_grid_mdv(
+        pyart.testing.MDV_GRID_FILE, file_field_names=True, nthreads=2)
+    fdata = grid.fields['refl']['data']
+    assert fdata.shape == (1, 1837, 3661)
+    assert np.ma.is_masked(fdata[0, 0, 0])
+    assert_almost_equal(fdata[0, 130, 2536], 20.0, 1)
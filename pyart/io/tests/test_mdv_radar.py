@@ -354,3 +354,25 @@ def test_radar_exclude_fields():
     radar = pyart.io.read_mdv(
         pyart.testing.MDV_PPI_FILE, exclude_fields=['reflectivity'])
     assert 'reflectivity' not in radar.fields
+
+
+def test_read_nthreads():
+    tradar = pyart.io.read_mdv(pyart.testing.MDV_PPI_FILE, nthreads=2)
+    assert sorted(tradar.fields.keys()) == sorted(radar.fields.keys())
+    for field_name, dic in radar.fields.items():
+        data = tradar.fields[field_name]['data']
+        assert np.all(data.mask == dic['data'].mask)
+        assert np.all(data.data == dic['data'].data)
+
+
+def test_read_packed_fields():
+    pradar = pyart.io.read_mdv(
+        pyart.testing.MDV_PPI_FILE, packed_fields=True)
+    field_dic = pradar.fields['reflectivity']
+    assert isinstance(field_dic, pyart.core.PackedField)
+    assert field_dic.packed.dtype == np.uint16
+    data = field_dic['data']
+    ref_data = radar.fields['reflectivity']['data']
+    assert data.shape == ref_data.shape
+    assert np.all(data.mask == ref_data.mask)
+    assert_almost_equal(data, ref_data)
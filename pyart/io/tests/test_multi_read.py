@@ -0,0 +1,113 @@
+""" Unit Tests for Py-ART's io/multi_read.py module. """
+
+import numpy as np
+from numpy.testing import assert_array_equal, assert_raises
+
+import pyart
+from pyart.io.multi_read import _append_rays, _concatenate_radars
+
+
+def test_read_many_iterator():
+    filenames = [pyart.testing.UF_FILE] * 3
+    ref = pyart.io.read(pyart.testing.UF_FILE)
+    radars = list(pyart.io.read_many(filenames))
+    assert len(radars) == 3
+    for radar in radars:
+        assert radar.nrays == ref.nrays
+        assert_array_equal(radar.fields['reflectivity']['data'],
+                           ref.fields['reflectivity']['data'])
+
+
+def test_read_many_processes():
+    filenames = [pyart.testing.UF_FILE] * 3
+    ref = pyart.io.read(pyart.testing.UF_FILE)
+    radars = list(pyart.io.read_many(filenames, nprocesses=2, max_queued=1))
+    assert len(radars) == 3
+    for radar in radars:
+        assert_array_equal(radar.fields['reflectivity']['data'],
+                           ref.fields['reflectivity']['data'])
+
+
+def test_read_many_concatenate():
+    filenames = [pyart.testing.NEXRAD_LEVEL3_MSG19] * 2
+    ref = pyart.io.read(pyart.testing.NEXRAD_LEVEL3_MSG19)
+    radar = pyart.io.read_many(filenames, concatenate=True)
+    assert radar.nrays == 2 * ref.nrays
+    assert radar.ngates == ref.ngates
+    assert radar.nsweeps == 2
+
+    assert_array_equal(radar.time['data'][ref.nrays:], ref.time['data'])
+    assert_array_equal(radar.azimuth['data'][:ref.nrays],
+                       ref.azimuth['data'])
+    assert_array_equal(radar.sweep_start_ray_index['data'],
+                       [0, ref.nrays])
+    assert_array_equal(radar.sweep_end_ray_index['data'],
+                       [ref.nrays - 1, 2 * ref.nrays - 1])
+    assert radar.latitude['data'].shape == (1, )
+
+    field_name = list(ref.fields.keys())[0]
+    data = radar.fields[field_name]['data']
+    ref_data = ref.fields[field_name]['data']
+    assert_array_equal(data[ref.nrays:], ref_data)
+    assert_array_equal(np.ma.getmaskarray(data[ref.nrays:]),
+                       np.ma.getmaskarray(ref_data))
+
+
+def test_read_many_reader():
+    filenames = [pyart.testing.NEXRAD_LEVEL3_MSG19] * 2
+    ref = pyart.io.read_many(filenames, concatenate=True)
+    for nprocesses in [1, 2]:
+        radar = pyart.io.read_many(
+            filenames, concatenate=True, nprocesses=nprocesses,
+            reader=pyart.io.read_nexrad_level3)
+        assert radar.nrays == ref.nrays
+        for field_name, dic in ref.fields.items():
+            assert_array_equal(radar.fields[field_name]['data'], dic['data'])
+
+    calls = []
+
+    def reader(filename, **kwargs):
+        calls.append((filename, kwargs))
+        return pyart.io.read_nexrad_level3(filename, **kwargs)
+
+    radars = list(pyart.io.read_many(
+        filenames, reader=reader, file_field_names=True))
+    assert len(radars) == 2
+    assert calls == [(f, {'file_field_names': True}) for f in filenames]
+
+
+def test_concatenate_radars_time_order():
+    first = pyart.io.read(pyart.testing.NEXRAD_LEVEL3_MSG19)
+    earlier = pyart.io.read(pyart.testing.NEXRAD_LEVEL3_MSG19)
+    earlier.time['units'] = 'seconds since 2015-01-01T00:00:00Z'
+    field_name = list(first.fields.keys())[0]
+    data = first.fields[field_name]['data'].copy()
+    earlier.fields[field_name]['data'] = data[::-1]
+    nrays = first.nrays
+
+    radar = _concatenate_radars(iter([first, earlier]))
+    assert radar.nrays == 2 * nrays
+    assert first.fields == {}
+    assert radar.time['units'] == earlier.time['units']
+    assert_array_equal(radar.fields[field_name]['data'][:nrays], data[::-1])
+    assert_array_equal(radar.fields[field_name]['data'][nrays:], data)
+
+
+def test_append_rays():
+    data = _append_rays(None, np.ones((2, 3)), 0)
+    assert data.shape == (2, 3)
+    data = _append_rays(data, np.ma.masked_equal([[2, 0, 2, 2]], 0), 2)
+    assert data.shape[0] >= 3 and data.shape[1] == 4
+    assert_array_equal(np.ma.getmaskarray(data[:3]), [
+        [False, False, False, True], [False, False, False, True],
+        [False, True, False, False]])
+    assert_array_equal(data[:3].filled(0), [
+        [1, 1, 1, 0], [1, 1, 1, 0], [2, 0, 2, 2]])
+
+
+def test_read_many_invalid():
+    filenames = [pyart.testing.NEXRAD_LEVEL3_MSG19,
+                 pyart.testing.NEXRAD_LEVEL3_MSG163]
+    assert_raises(ValueError, pyart.io.read_many, filenames, True)
+    assert_raises(ValueError, pyart.io.read_many, filenames, nprocesses=0)
+    assert_raises(ValueError, pyart.io.read_many, [], concatenate=True)
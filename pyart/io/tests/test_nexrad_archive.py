@@ -1,7 +1,11 @@
 """ Unit Tests for Py-ART's io/nexrad_archive.py module. """
 
+import bz2
+import struct
+
 import numpy as np
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_array_equal
+from numpy.testing import assert_raises
 from numpy.ma.core import MaskedArray
 
 import pyart
@@ -281,3 +285,124 @@ def test_compressed_archive():
     assert_almost_equal(rdata[2, 0], 9.5, 1)
     assert 'velocity' not in radar.fields.keys()
     assert 'spectrum_width' not in radar.fields.keys()
+
+    radar2 = pyart.io.read_nexrad_archive(
+        pyart.testing.NEXRAD_ARCHIVE_COMPRESSED_FILE, nthreads=2)
+    assert_array_equal(radar2.fields['reflectivity']['data'], rdata)
+
+
+def test_delay_field_loading_closes_file():
+    # uncompressed files are memory mapped, the map and file handle must be
+    # released when the reader returns even if field loading is delayed
+    raw = bz2.BZ2File(pyart.testing.NEXRAD_ARCHIVE_FILE, 'rb').read()
+    with pyart.testing.InTemporaryDirectory():
+        with open('uncompressed_archive', 'wb') as f:
+            f.write(raw)
+        lazy = pyart.io.read_nexrad_archive(
+            'uncompressed_archive', delay_field_loading=True)
+    nfile = lazy.fields['reflectivity']._lazyload['data'].nfile
+    assert nfile._fh.closed
+    assert nfile._mmap is None
+    assert_array_equal(lazy.fields['reflectivity']['data'],
+                       radar.fields['reflectivity']['data'])
+
+
+def test_read_scans_and_fields():
+    sub = pyart.io.read_nexrad_archive(
+        pyart.testing.NEXRAD_ARCHIVE_FILE, scans=[2, 0],
+        include_fields=['reflectivity', 'velocity'])
+    ref = radar.extract_sweeps([0, 2])
+
+    assert sub.nsweeps == 2
+    assert sub.nrays == 1440
+    assert sub.ngates == 1832
+    assert sorted(sub.fields.keys()) == ['reflectivity']
+    assert_array_equal(sub.sweep_number['data'], [0, 2])
+    assert_array_equal(sub.sweep_start_ray_index['data'], [0, 720])
+    assert_array_equal(sub.sweep_end_ray_index['data'], [719, 1439])
+    assert_array_equal(sub.fixed_angle['data'], ref.fixed_angle['data'])
+    assert_array_equal(sub.azimuth['data'], ref.azimuth['data'])
+    assert_array_equal(sub.time['data'], ref.time['data'])
+    assert_array_equal(
+        sub.instrument_parameters['nyquist_velocity']['data'],
+        ref.instrument_parameters['nyquist_velocity']['data'])
+    assert_array_equal(sub.fields['reflectivity']['data'],
+                       ref.fields['reflectivity']['data'])
+
+
+def test_read_scans_errors():
+    assert_raises(ValueError, pyart.io.read_nexrad_archive,
+                  pyart.testing.NEXRAD_ARCHIVE_FILE, scans=[16])
+    assert_raises(ValueError, pyart.io.read_nexrad_archive,
+                  pyart.testing.NEXRAD_ARCHIVE_FILE, scans=[])
+
+
+def test_read_nexrad_stream():
+    # split the uncompressed file into a start chunk containing the
+    # metadata records and a chunk for each scan
+    raw = bz2.BZ2File(pyart.testing.NEXRAD_ARCHIVE_FILE, 'rb').read()
+    records = raw[24:]
+    index = pyart.io.nexrad_level2._index_records(records[12:])[1]
+    first_ray = radar.sweep_start_ray_index['data']
+    bounds = list(index['offset'][first_ray] - 16) + [len(records)]
+    chunks = [raw[:24]]
+    block_start = 0
+    for block_end in bounds:
+        cblock = bz2.compress(records[block_start:block_end])
+        chunks.append(struct.pack('>i', len(cblock)) + cblock)
+        block_start = block_end
+    chunks[0] += chunks.pop(1)
+
+    sweeps = []
+
+    def callback(stream, scan):
+        sweeps.append(pyart.io.read_nexrad_stream(stream, [scan]))
+
+    stream = pyart.io.NEXRADLevel2Stream(callback)
+    for chunk in chunks[:4]:
+        stream.add_chunk(chunk)
+    assert len(sweeps) == 3
+    ref = radar.extract_sweeps([2])
+    assert sweeps[2].nrays == 720
+    assert_array_equal(sweeps[2].sweep_number['data'], [2])
+    assert_array_equal(sweeps[2].azimuth['data'], ref.azimuth['data'])
+    assert_array_equal(sweeps[2].fields['reflectivity']['data'],
+                       ref.fields['reflectivity']['data'][:, :1676])
+
+    partial = pyart.io.read_nexrad_stream(stream)
+    assert partial.nsweeps == 3
+    assert partial.nrays == 2160
+    assert_array_equal(partial.time['data'], radar.time['data'][:2160])
+
+
+def test_read_variable_gates():
+    vradar = pyart.io.read_nexrad_archive(
+        pyart.testing.NEXRAD_ARCHIVE_FILE, variable_gates=True)
+    field_data = vradar.fields['reflectivity']._lazyload['data']
+    assert field_data.packed.dtype == np.uint8
+    assert field_data.packed.size == field_data.ray_n_gates.sum()
+    assert field_data.packed.size < 0.6 * vradar.nrays * vradar.ngates
+    assert_array_equal(field_data.ray_n_gates[[0, 720, 1440, 7199]],
+                       [1832, 1192, 1676, 240])
+
+    assert sorted(vradar.fields.keys()) == sorted(radar.fields.keys())
+    for field_name, dic in radar.fields.items():
+        data = vradar.fields[field_name]['data']
+        assert data.dtype == dic['data'].dtype
+        assert_array_equal(data, dic['data'])
+        assert_array_equal(data.mask, dic['data'].mask)
+
+
+def test_read_packed_fields():
+    pradar = pyart.io.read_nexrad_archive(
+        pyart.testing.NEXRAD_ARCHIVE_FILE, packed_fields=True)
+    field_dic = pradar.fields['reflectivity']
+    assert isinstance(field_dic, pyart.core.PackedField)
+    assert field_dic.packed.dtype == np.uint8
+
+    assert sorted(pradar.fields.keys()) == sorted(radar.fields.keys())
+    for field_name, dic in radar.fields.items():
+        data = pradar.fields[field_name]['data']
+        assert data.dtype == dic['data'].dtype
+        assert_array_equal(data.mask, dic['data'].mask)
+        assert_array_equal(data.data, dic['data'].data)
@@ -2,6 +2,7 @@
 
 import datetime
 import bz2
+import struct
 from io import BytesIO
 
 import numpy as np
@@ -23,6 +24,15 @@ def test_msg31s():
     assert len(nfile.msg31s) == 7200
 
 
+def test_msg31_index():
+    assert len(nfile.msg31_index) == 7200
+    assert_array_equal(nfile.msg31_index['elevation_number'][[0, 5050]],
+                       [1, 11])
+    assert_almost_equal(nfile.msg31_index['azimuth_angle'][0],
+                        nfile.msg31s[0]['msg31_header']['azimuth_angle'])
+    assert nfile.msg31_index['block_pointers'].shape == (7200, 9)
+
+
 def test_nscans():
     assert nfile.nscans == 16
 
@@ -334,3 +344,186 @@ def test_bad_compression_header():
 
     # should raise IOError
     assert_raises(IOError, nexrad_level2.NEXRADLevel2File, corrupt_file)
+
+
+def test_records_decoded_on_demand():
+    lfile = nexrad_level2.NEXRADLevel2File(COMPRESSED_FILE)
+    data = lfile.get_data('REF', 1832, [0])
+    assert round(data[0, 0], 1) == 10.5
+    assert lfile._decoded_records is None
+    msg = lfile.msg31s[0]
+    assert lfile._decoded_records is not None
+    assert_array_equal(lfile.get_data('REF', 1832, [0], True)[0, :1832],
+                       msg['REF']['data'])
+    lfile.close()
+
+
+def test_decompress_records():
+    # build a compressed archive with many blocks from the uncompressed file
+    raw = bz2.BZ2File(pyart.testing.NEXRAD_ARCHIVE_FILE, 'rb').read()
+    header_size = 24 + 12
+    records = raw[header_size:header_size + 2432 * 40]
+    blocks = [raw[24:header_size] + records[:2432 * 8]]
+    blocks += [records[i:i + 2432 * 8] for i in range(2432 * 8, 2432 * 40,
+                                                        2432 * 8)]
+    cbuf = raw[:24]
+    for i, block in enumerate(blocks):
+        cblock = bz2.compress(block)
+        size = len(cblock) if i < len(blocks) - 1 else -len(cblock)
+        cbuf += struct.pack('>i', size) + cblock
+
+    for nthreads in [1, 3]:
+        buf = nexrad_level2._decompress_records(BytesIO(cbuf), nthreads)
+        assert buf == records
+    assert_raises(ValueError, nexrad_level2._decompress_records,
+                  BytesIO(cbuf), 0)
+
+    # blocks which cannot be located from the control words are
+    # decompressed in turn
+    bad_cbuf = cbuf[:24] + b'\x00' * 4 + cbuf[28:]
+    buf = nexrad_level2._decompress_records(BytesIO(bad_cbuf))
+    assert buf == records
+
+
+def test_last_scan():
+    fh = bz2.BZ2File(pyart.testing.NEXRAD_ARCHIVE_FILE, 'rb')
+    lfile = nexrad_level2.NEXRADLevel2File(fh, last_scan=1)
+    lfile.close()
+    assert lfile.nscans == 2
+    assert len(lfile.msg31_index) == 1440
+    assert_array_equal(lfile.get_data('REF', 1832, [1]),
+                       nfile.get_data('REF', 1832, [1]))
+    info = lfile.scan_info([1])
+    assert len(info) == 1
+    assert info[0]['moments'] == ['REF', 'VEL', 'SW']
+
+
+def test_decompress_records_max_elevation_number():
+    # compress the uncompressed file in blocks of 360 records
+    raw = bz2.BZ2File(pyart.testing.NEXRAD_ARCHIVE_FILE, 'rb').read()
+    records = raw[24 + 12:]
+    record_pos = nexrad_level2._index_records(records)[0] + [len(records)]
+    cbuf = raw[:24]
+    block_start = 0
+    bounds = record_pos[360::360] + [len(records)]
+    for i, block_end in enumerate(bounds):
+        block = records[block_start:block_end]
+        if i == 0:
+            block = raw[24:36] + block
+        cblock = bz2.compress(block)
+        cbuf += struct.pack('>i', len(cblock)) + cblock
+        block_start = block_end
+
+    buf = nexrad_level2._decompress_records(BytesIO(cbuf), 2)
+    assert buf == records
+
+    buf = nexrad_level2._decompress_records(
+        BytesIO(cbuf), 2, max_elevation_number=2)
+    assert len(buf) < len(records)
+    assert records.startswith(buf)
+    index = nexrad_level2._index_records(buf)[1]
+    assert index['elevation_number'].max() == 3
+    assert np.sum(index['elevation_number'] <= 2) == 1440
+
+
+def test_structure_dtypes():
+    for structure in [nexrad_level2.MSG_HEADER, nexrad_level2.MSG_31,
+                      nexrad_level2.GENERIC_DATA_BLOCK,
+                      nexrad_level2.RADIAL_DATA_BLOCK]:
+        dtype = nexrad_level2._structure_dtype(structure)
+        assert dtype.itemsize == nexrad_level2._structure_size(structure)
+
+    # structures decoded at once match those unpacked individually
+    buf = nfile._buf
+    pos = nfile._msg31_block_positions(nfile.scan_msgs[4][:5], 'VEL')
+    blocks = nexrad_level2._gather_structures(
+        np.frombuffer(buf, dtype='u1'), pos,
+        nexrad_level2.GENERIC_DATA_BLOCK_DTYPE)
+    for p, block in zip(pos, blocks):
+        dic = nexrad_level2._unpack_from_buf(
+            buf, p, nexrad_level2.GENERIC_DATA_BLOCK)
+        assert block['ngates'] == dic['ngates'] == 1192
+        assert block['scale'] == dic['scale']
+        assert bytes(block['data_name']) == dic['data_name'] == b'VEL'
+
+
+def _make_chunks(nrecords=120):
+    # split the uncompressed file into Level II chunks, the start chunk
+    # contains the metadata records and each following chunk a block of
+    # nrecords message 31 records.
+    raw = bz2.BZ2File(pyart.testing.NEXRAD_ARCHIVE_FILE, 'rb').read()
+    records = raw[24:]
+    index = nexrad_level2._index_records(records[12:])[1]
+    bounds = list(index['offset'][::nrecords] - 16) + [len(records)]
+    chunks = [raw[:24]]
+    block_start = 0
+    for block_end in bounds:
+        cblock = bz2.compress(records[block_start:block_end])
+        chunks.append(struct.pack('>i', len(cblock)) + cblock)
+        block_start = block_end
+    chunks[0] += chunks.pop(1)
+    return chunks
+
+
+def test_stream():
+    chunks = _make_chunks()
+    assert len(chunks) == 61
+    completed = []
+    stream = nexrad_level2.NEXRADLevel2Stream(
+        lambda stream, scan: completed.append(scan))
+    assert stream.add_chunk(chunks[0]) == []
+    assert stream.volume_header['icao'] == nfile.volume_header['icao']
+    assert stream.vcp['msg5_header'] == nfile.vcp['msg5_header']
+
+    # the first scan is complete after its 720 radials are received,
+    # chunks split across calls are assembled.
+    for chunk in chunks[1:6]:
+        assert stream.add_chunk(chunk[:100]) == []
+        assert stream.add_chunk(chunk[100:]) == []
+    assert len(stream.msg31_index) == 600
+    assert stream.add_chunk(chunks[6]) == [0]
+    assert completed == [0]
+    assert not stream.volume_complete
+
+    for chunk in chunks[7:]:
+        stream.add_chunk(chunk)
+    assert stream.volume_complete
+    assert completed == list(range(16))
+    assert_array_equal(stream.msg31_index, nfile.msg31_index)
+
+    # scans can be read from the archive created by the stream
+    archive = nexrad_level2.NEXRADLevel2File(
+        BytesIO(stream.get_archive([1, 3])))
+    assert len(archive.msg31_index) == 1440
+    assert archive.vcp == nfile.vcp
+    assert_array_equal(archive.get_data('REF', 1832, [1, 3]),
+                       nfile.get_data('REF', 1832, [1, 3]))
+    assert_array_equal(archive.get_azimuth_angles([1, 3]),
+                       nfile.get_azimuth_angles([1, 3]))
+    assert_raises(ValueError, stream.get_archive, [16])
+
+    # a chunk with a volume header starts a new volume
+    stream.add_chunk(chunks[0])
+    assert len(stream.msg31_index) == 0
+    assert stream.completed_scans == []
+    assert_raises(ValueError, stream.get_archive)
+
+
+def test_stream_finish():
+    chunks = _make_chunks(100)
+    stream = nexrad_level2.NEXRADLevel2Stream()
+    for chunk in chunks[:4]:
+        stream.add_chunk(chunk)
+    assert stream.completed_scans == []
+    assert stream.finish() == [0]
+    assert stream.volume_complete
+    archive = nexrad_level2.NEXRADLevel2File(BytesIO(stream.get_archive()))
+    assert archive.get_nrays(0) == 300
+    assert_array_equal(archive.get_data('VEL', 1192, [0], raw_data=True),
+                       nfile.get_data('VEL', 1192, [0], True)[:300])
+
+
+def test_stream_no_volume_header():
+    chunks = _make_chunks()
+    stream = nexrad_level2.NEXRADLevel2Stream()
+    assert_raises(ValueError, stream.add_chunk, chunks[1])
@@ -1,9 +1,17 @@
 """ Unit Tests for Py-ART's io/nexrad_level3.py module. """
 
+import os
+import shutil
+import struct
+
 import numpy as np
 from numpy.ma.core import MaskedArray
+from numpy.testing import assert_array_equal, assert_raises
 
 import pyart
+from pyart.io.nexrad_level3 import NEXRADLevel3File
+from pyart.io.nexrad_level3 import nexrad_level3_stacked_data
+from pyart.io.nexrad_level3 import _radial_positions
 
 
 def test_nexrad_level3_msg19():
@@ -139,3 +147,54 @@ def test_nexrad_level3_msg161_fileobj():
     assert radar.fields[field_name]['data'].shape == (360, 1200)
     assert type(radar.fields[field_name]['data']) is MaskedArray
     assert round(radar.fields[field_name]['data'][103, 170]) == 2.
+
+
+def test_nexrad_level3_stacked_data():
+    nfile = NEXRADLevel3File(pyart.testing.NEXRAD_LEVEL3_MSG19)
+    ref_data = nfile.get_data()
+    ref_raw_data = nfile.raw_data
+    nfile.close()
+
+    filenames = [pyart.testing.NEXRAD_LEVEL3_MSG19] * 2
+    data = nexrad_level3_stacked_data(filenames)
+    assert type(data) is MaskedArray
+    assert data.shape == (2, ) + ref_data.shape
+    assert_array_equal(data[1], ref_data)
+    assert_array_equal(data.mask[1], np.ma.getmaskarray(ref_data))
+
+    raw_data = nexrad_level3_stacked_data(filenames, raw_data=True)
+    assert raw_data.dtype == np.uint8
+    assert_array_equal(raw_data[0], ref_raw_data)
+
+    with pyart.testing.InTemporaryDirectory():
+        os.mkdir('products')
+        for i in range(3):
+            shutil.copy(pyart.testing.NEXRAD_LEVEL3_MSG163,
+                        os.path.join('products', 'product%d' % i))
+        data = nexrad_level3_stacked_data('products')
+        assert data.shape == (3, 360, 1200)
+
+    filenames = [pyart.testing.NEXRAD_LEVEL3_MSG19,
+                 pyart.testing.NEXRAD_LEVEL3_MSG163]
+    assert_raises(ValueError, nexrad_level3_stacked_data, filenames)
+    assert pyart.io.nexrad_level3_stacked_data is nexrad_level3_stacked_data
+
+
+def test_radial_positions():
+    def make_radials(sizes, unit):
+        """ Radials with 6 byte headers starting with the size. """
+        return b''.join(struct.pack('>h', size) + b'\x00' * 4 +
+                        b'\x01' * (size * unit) for size in sizes)
+
+    for packet_code, unit in [(16, 1), (0xAF1F, 2)]:
+        # radials of constant size
+        buf = b'\x00' * 4 + make_radials([3] * 5, unit)
+        positions = _radial_positions(buf, 4, 5, packet_code)
+        assert_array_equal(positions, 4 + np.arange(5) * (6 + 3 * unit))
+
+        # radials of varying size
+        sizes = [3, 1, 4, 1, 5]
+        buf = make_radials(sizes, unit)
+        positions = _radial_positions(buf, 0, 5, packet_code)
+        expected = np.cumsum([0] + [6 + size * unit for size in sizes[:-1]])
+        assert_array_equal(positions, expected)
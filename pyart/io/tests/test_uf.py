@@ -5,8 +5,11 @@ try:
 except ImportError:
     from io import BytesIO as StringIO
 
+import struct
+
 import numpy as np
 from numpy.testing import assert_raises, assert_almost_equal
+from numpy.testing import assert_array_equal
 
 import pyart
 from pyart.io.uffile import UFFile, UFRay
@@ -105,23 +108,69 @@ def test_instrument_parameters():
 
 def test_nyquist_vel():
     ufile = UFFile(pyart.testing.UF_FILE)
-    ufile.rays[0].field_headers[1].pop('nyquist')
+    ufile.field_nyquists[1][0] = np.ma.masked
     assert ufile.get_nyquists() is None
 
     ufile = UFFile(pyart.testing.UF_FILE)
-    ray = UFRay(ufile.rays[0]._buf)
-    ray.field_headers[1].pop('nyquist')
-    ufile.rays.append(ray)
+    assert ufile.get_nyquists() is not None
+    ufile.field_nyquists = [None] * len(ufile.field_nyquists)
+    assert ufile.get_nyquists() is None
+
+    ufile = UFFile(pyart.testing.UF_FILE)
+    nyquist = ufile.field_nyquists[1]
+    ufile.field_nyquists[1] = np.ma.masked_array(
+        [nyquist[0], 0], mask=[False, True])
     ufile.nrays = 2
     assert ufile.get_nyquists() is None
 
 
 def test_polrization():
     ufile = UFFile(pyart.testing.UF_FILE)
-    ufile.rays[0].field_headers[0]['polarization'] = 99
+    ufile.field_headers[0]['polarization'][0] = 99
     assert ufile.get_sweep_polarizations()[0] == 'elliptical'
 
 
+def test_ufile_headers_match_rays():
+    ufile = UFFile(pyart.testing.UF_FILE)
+    ray = ufile.rays[0]
+    for key, value in ray.mandatory_header.items():
+        assert _header_value(ufile.mandatory_headers[key][0]) == value
+    for i, field_header in enumerate(ray.field_headers):
+        assert ufile.field_data_types[i] == ray.field_positions[i]['data_type']
+        for key in ufile.field_headers[i].dtype.names:
+            value = _header_value(ufile.field_headers[i][key][0])
+            assert value == field_header[key]
+        raw = ufile.get_field_data(i, raw_data=True)
+        assert raw.dtype == np.int16
+        assert np.all(raw[0] == ray.field_raw_data[i])
+
+
+def _header_value(value):
+    """ Return a header element as returned by _unpack_from_buf. """
+    if isinstance(value, np.void):
+        return bytes(value)
+    return value
+
+
+def test_get_field_data_truncated():
+    with open(pyart.testing.UF_FILE, 'rb') as fh:
+        buf = fh.read()
+    ufile = UFFile(StringIO(buf[:-1000]))
+    assert_raises(ValueError, ufile.get_field_data, 11)
+
+
+def test_delay_field_loading():
+    lazy_radar = pyart.io.read_uf(
+        pyart.testing.UF_FILE, file_field_names=True,
+        delay_field_loading=True)
+    field_dic = lazy_radar.fields['DZ']
+    assert isinstance(field_dic, pyart.io.lazydict.LazyLoadDict)
+    for field_name, dic in radar.fields.items():
+        data = lazy_radar.fields[field_name]['data']
+        assert np.all(data.mask == dic['data'].mask)
+        assert_array_equal(data.data, dic['data'].data)
+
+
 def test_skip_field():
     test_radar = pyart.io.read_uf(
         pyart.testing.UF_FILE, exclude_fields=['DZ'], file_field_names=True)
@@ -138,3 +187,60 @@ def test_range_start_nonzero():
     radar2 = pyart.io.read_uf(in_mem)
     assert_almost_equal(radar2.range['meters_to_center_of_first_gate'], 1530)
     assert_almost_equal(radar2.range['data'][0], 1530)
+
+
+def test_read_packed_fields():
+    pradar = pyart.io.read_uf(
+        pyart.testing.UF_FILE, file_field_names=True, packed_fields=True)
+    field_dic = pradar.fields['DZ']
+    assert isinstance(field_dic, pyart.core.PackedField)
+    assert field_dic.packed.dtype == np.int16
+
+    for field_name, dic in radar.fields.items():
+        data = pradar.fields[field_name]['data']
+        assert np.all(data.mask == dic['data'].mask)
+        assert_array_equal(data.data, dic['data'].data)
+
+
+def test_read_packed_fields_scale_differs():
+    # two ray file where the second ray has a different DZ scale factor
+    with open(pyart.testing.UF_FILE, 'rb') as fh:
+        buf = fh.read()
+    ufile = UFFile(StringIO(buf))
+    record_pos = int(ufile._record_pos[0])
+    header = ufile.mandatory_headers[0]
+    data_header_pos = record_pos + (int(header['offset_data_header']) - 1) * 2
+    offset = struct.unpack_from('>h', buf, data_header_pos + 8)[0]
+    scale_pos = len(buf) + record_pos + (offset - 1) * 2 + 2
+    buf = bytearray(buf + buf)
+    buf[scale_pos:scale_pos + 2] = struct.pack('>h', 50)
+
+    ufile = UFFile(StringIO(bytes(buf)))
+    assert_array_equal(ufile.field_headers[0]['scale_factor'], [100, 50])
+    raw = ufile.get_field_data(0, raw_data=True)
+    data = ufile.get_field_data(0)
+    assert_array_equal(data.data[0], raw[0] / 100.)
+    assert_array_equal(data.data[1], raw[1] / 50.)
+
+    pradar = pyart.io.read_uf(
+        StringIO(bytes(buf)), file_field_names=True, packed_fields=True)
+    assert not isinstance(pradar.fields['DZ'], pyart.core.PackedField)
+    assert_array_equal(pradar.fields['DZ']['data'].data, data.data)
+    assert isinstance(pradar.fields['VR'], pyart.core.PackedField)
+
+
+def test_memory_mapped_read():
+    # files on disk are memory mapped, file-like objects are read
+    with open(pyart.testing.UF_FILE, 'rb') as fh:
+        ufile = UFFile(fh)
+        assert isinstance(ufile.rays[0]._buf, memoryview)
+    with open(pyart.testing.UF_FILE, 'rb') as fh:
+        in_mem = StringIO(fh.read())
+    ufile2 = UFFile(in_mem)
+    assert isinstance(ufile2.rays[0]._buf, bytes)
+
+    assert ufile.nrays == ufile2.nrays
+    for ray, ray2 in zip(ufile.rays, ufile2.rays):
+        assert ray._buf == ray2._buf
+        for data, data2 in zip(ray.field_raw_data, ray2.field_raw_data):
+            assert np.all(data == data2)
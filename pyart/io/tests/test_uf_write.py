@@ -397,3 +397,62 @@ def test_range_start():
     field_header = ufile.rays[0].field_headers[0]
     assert field_header['range_start_km'] == 1
     assert field_header['range_start_m'] == 500
+
+
+def test_write_packed_fields():
+    # packed fields are written with the scale from the original file
+    radar = pyart.io.read_uf(pyart.testing.UF_FILE, packed_fields=True)
+    in_mem = StringIO()
+    write_uf(in_mem, radar)
+    for field_dic in radar.fields.values():
+        assert field_dic.packed is not None
+
+    in_mem.seek(0)
+    ufile = UFFile(in_mem)
+    ref_ufile = UFFile(pyart.testing.UF_FILE)
+    for header, ref_header in zip(ufile.rays[0].field_headers,
+                                  ref_ufile.rays[0].field_headers):
+        assert header['scale_factor'] == ref_header['scale_factor']
+    for i in range(len(ufile.rays[0].field_headers)):
+        ref_data = ref_ufile.get_field_data(i)
+        data = ufile.get_field_data(i)
+        assert np.all(data.mask == ref_data.mask)
+        assert_almost_equal(data, ref_data)
+    ufile.close()
+    ref_ufile.close()
+
+
+def test_make_records_matches_make_ray():
+    radar = pyart.testing.make_empty_ppi_radar(10, 4, 2)
+    radar.range['meters_between_gates'] = 111.
+    radar.range['meters_to_center_of_first_gate'] = 0.
+    data = np.ma.masked_greater(
+        np.arange(80, dtype='float32').reshape(8, 10), 75)
+    radar.add_field('reflectivity', {'data': data})
+    radar.add_field('velocity', {'data': -data, '_UF_scale_factor': 10})
+    radar.instrument_parameters = {
+        'nyquist_velocity': {'data': np.linspace(10, 20, 8)},
+        'prt': {'data': np.ones(8) * 1.e-3},
+        'polarization_mode': {'data': np.array(['vertical', 'horizontal'])},
+    }
+    field_mapping = {'reflectivity': 'DZ', 'velocity': 'VR'}
+    field_write_order = ['reflectivity', 'velocity']
+    ufraycreator = UFRayCreator(radar, field_mapping, field_write_order)
+    records = ufraycreator.make_records()
+    assert len(records) == 8
+
+    pad = struct.pack(b'>i', ufraycreator.record_length * 2)
+    for ray_num in range(8):
+        ref_ray = pad + ufraycreator.make_ray(ray_num) + pad
+        assert records[ray_num:ray_num+1].tostring() == ref_ray
+
+    in_mem = StringIO()
+    write_uf(in_mem, radar, uf_field_names=field_mapping,
+             field_write_order=field_write_order)
+    assert in_mem.getvalue() == records.tostring()
+
+    in_mem.seek(0)
+    ufile = UFFile(in_mem)
+    assert ufile.nrays == 8
+    raw = ufile.get_field_data(1, raw_data=True)
+    assert np.array_equal(raw, records['data_1'])
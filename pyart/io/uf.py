@@ -9,6 +9,7 @@ Reading of Universal format (UF) files
 
     read_uf
     _get_instrument_parameters
+    _UFFieldDataExtractor
 
 """
 
@@ -17,8 +18,10 @@ from netCDF4 import date2num
 
 from ..config import FileMetadata, get_fillvalue
 from ..core.radar import Radar
+from ..core.packed import PackedField
 from .common import make_time_unit_str, _test_arguments, prepare_for_read
 from .uffile import UFFile
+from .lazydict import LazyLoadDict
 
 _LIGHT_SPEED = 2.99792458e8  # speed of light in meters per second
 _UF_SWEEP_MODES = {
@@ -46,7 +49,7 @@ _SWEEP_MODE_STR = {
 
 def read_uf(filename, field_names=None, additional_metadata=None,
             file_field_names=False, exclude_fields=None,
-            delay_field_loading=False, **kwargs):
+            delay_field_loading=False, packed_fields=False, **kwargs):
     """
     Read a UF File.
 
@@ -74,8 +77,18 @@ def read_uf(filename, field_names=None, additional_metadata=None,
         List of fields to exclude from the radar object. This is applied
         after the `file_field_names` and `field_names` parameters.
     delay_field_loading : bool
-        This option is not implemented in the function but included for
-        compatibility.
+        True to delay loading of field data from the file until the 'data'
+        key in a particular field dictionary is accessed.  In this case
+        the field attribute of the returned Radar object will contain
+        LazyLoadDict objects not dict objects.  Only the bytes of the fields
+        which are accessed are read from the file.  Not used when
+        `packed_fields` is True.
+    packed_fields : bool
+        True to store the raw integer field data from the file in
+        :py:class:`pyart.core.PackedField` dictionaries, the data is scaled
+        when the 'data' key is first accessed.  False, the default, scales
+        the data when the file is read.  Fields whose scale factor differs
+        between rays are always scaled when the file is read.
 
     Returns
     -------
@@ -92,7 +105,7 @@ def read_uf(filename, field_names=None, additional_metadata=None,
 
     # Open UF file and get handle
     ufile = UFFile(prepare_for_read(filename))
-    first_ray = ufile.rays[0]
+    first_ray = ufile.get_ray(0)
 
     # time
     dts = ufile.get_datetimes()
@@ -162,14 +175,28 @@ def read_uf(filename, field_names=None, additional_metadata=None,
 
     # fields
     fields = {}
-    for uf_field_number, uf_field_dic in enumerate(first_ray.field_positions):
-        uf_field_name = uf_field_dic['data_type'].decode('ascii')
+    for uf_field_number, data_type in enumerate(ufile.field_data_types):
+        uf_field_name = data_type.decode('ascii')
         field_name = filemetadata.get_field_name(uf_field_name)
         if field_name is None:
             continue
         field_dic = filemetadata(field_name)
-        field_dic['data'] = ufile.get_field_data(uf_field_number)
         field_dic['_FillValue'] = get_fillvalue()
+        scale_factors = ufile.field_headers[uf_field_number]['scale_factor']
+        if packed_fields and np.all(scale_factors == scale_factors[0]):
+            scale = float(scale_factors[0])
+            missing_data_value = first_ray.mandatory_header[
+                'missing_data_value']
+            field_dic = PackedField(
+                field_dic, ufile.get_field_data(uf_field_number, True),
+                1. / scale, 0., missing_data_value, dtype='float64',
+                packed_scale=scale, packed_offset=0.)
+        elif delay_field_loading and not packed_fields:
+            field_dic = LazyLoadDict(field_dic)
+            field_dic.set_lazy(
+                'data', _UFFieldDataExtractor(ufile, uf_field_number))
+        else:
+            field_dic['data'] = ufile.get_field_data(uf_field_number)
         fields[field_name] = field_dic
 
     # instrument_parameters
@@ -179,7 +206,9 @@ def read_uf(filename, field_names=None, additional_metadata=None,
     scan_rate = filemetadata('scan_rate')
     scan_rate['data'] = ufile.get_sweep_rates()
 
-    ufile.close()
+    # do not close file if field loading is delayed
+    if not delay_field_loading or packed_fields:
+        ufile.close()
     return Radar(
         time, _range, fields, metadata, scan_type,
         latitude, longitude, altitude,
@@ -199,7 +228,7 @@ def _get_instrument_parameters(ufile, filemetadata):
 
     # assume that the parameters in the first ray represent the beam widths,
     # bandwidth and frequency in the entire volume
-    first_ray = ufile.rays[0]
+    first_ray = ufile.get_ray(0)
     field_header = first_ray.field_headers[0]
     beam_width_h = field_header['beam_width_h'] / 64.
     beam_width_v = field_header['beam_width_v'] / 64.
@@ -248,3 +277,27 @@ def _get_instrument_parameters(ufile, filemetadata):
         instrument_parameters['nyquist_velocity'] = nyquist_velocity
 
     return instrument_parameters
+
+
+class _UFFieldDataExtractor(object):
+    """
+    Class facilitating on demand extraction of field data from a UF file.
+
+    Parameters
+    ----------
+    ufile : UFFile
+        UFFile object from which data will be extracted.  The file may be
+        closed, data is read from the file buffer.
+    field_number : int
+        Field number of the data to extract.
+
+    """
+
+    def __init__(self, ufile, field_number):
+        """ initialize the object. """
+        self.ufile = ufile
+        self.field_number = field_number
+
+    def __call__(self):
+        """ Return an array containing the field data. """
+        return self.ufile.get_field_data(self.field_number)
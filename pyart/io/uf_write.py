@@ -15,6 +15,7 @@ Functions for writing UF files.
 
     write_uf
     _d_to_dms
+    _fill_structure
     _pack_structure
 
 """
@@ -29,6 +30,7 @@ import numpy as np
 from netCDF4 import num2date
 
 from ..config import get_field_mapping
+from ..core.packed import PackedField
 from .uf import _LIGHT_SPEED
 from .uffile import UF_MANDATORY_HEADER
 from .uffile import UF_OPTIONAL_HEADER
@@ -37,6 +39,7 @@ from .uffile import UF_FIELD_POSITION
 from .uffile import UF_FIELD_HEADER
 from .uffile import UF_FSI_VEL
 from .uffile import POLARIZATION_STR
+from .common import _structure_dtype
 
 
 def write_uf(filename, radar, uf_field_names=None, radar_field_names=False,
@@ -65,7 +68,14 @@ def write_uf(filename, radar, uf_field_names=None, radar_field_names=False,
     Radar fields will be scaled and rounded to integer values when writing to
     UF files.  The scale factor for each field can be specified in the
     `_UF_scale_factor` key for each field dictionary.  If not specified the
-    default scaling (100) will be used.
+    default scaling (100) will be used.  Fields stored as PackedField objects
+    which have not been unpacked and whose packing is compatible with UF, an
+    integer scale and no offset, are written using their packed data and
+    scale without requantizing the data.
+
+    The records for all rays are assembled in a single structured array,
+    with each field quantized for the entire volume at once, and written to
+    the file in one pass.
 
     Parameters
     ----------
@@ -116,14 +126,10 @@ def write_uf(filename, radar, uf_field_names=None, radar_field_names=False,
         radar, field_mapping, field_write_order, volume_start=volume_start,
         templates_extra=templates_extra)
 
-    for ray_num in range(radar.nrays):
-
-        ray_bytes = raycreator.make_ray(ray_num)
-        pad = struct.pack(b'>i', raycreator.record_length * 2)
-
-        fhandle.write(pad)
-        fhandle.write(ray_bytes)
-        fhandle.write(pad)
+    records = raycreator.make_records()
+    record_bytes = records.view(np.uint8).reshape(
+        len(records), records.dtype.itemsize)
+    fhandle.writelines(record.tostring() for record in record_bytes)
 
     if close:
         fhandle.close()
@@ -187,6 +193,8 @@ class UFRayCreator(object):
         self.record_length = self._calc_record_length(
             radar, field_mapping, field_write_order)
         self.ray_num_to_sweep_num = self._calc_ray_num_to_sweep_num(radar)
+        self.packed_fields = self._find_packed_fields(
+            radar, field_write_order)
 
         self.mandatory_header_template = UF_MANDATORY_HEADER_TEMPLATE.copy()
         self.optional_header_template = UF_OPTIONAL_HEADER_TEMPLATE.copy()
@@ -207,6 +215,32 @@ class UFRayCreator(object):
             ray_num_to_sweep_num[sweep_slice] = isweep
         return ray_num_to_sweep_num
 
+    @staticmethod
+    def _find_packed_fields(radar, field_write_order):
+        """
+        Return a dictionary of UF scale and data for fields which can be
+        written using their packed data.
+        """
+        packed_fields = {}
+        for field in field_write_order:
+            field_dic = radar.fields[field]
+            if not isinstance(field_dic, PackedField):
+                continue
+            if field_dic.packed is None or field_dic.add_offset != 0:
+                continue
+            dtype = field_dic.packed.dtype
+            if dtype.kind not in 'iu' or dtype.itemsize > 2 or dtype == 'u2':
+                continue
+            scale = int(round(1. / field_dic.scale_factor))
+            if not np.isclose(scale * field_dic.scale_factor, 1.):
+                continue
+            if field_dic.get('_UF_scale_factor', scale) != scale:
+                continue
+            data = field_dic.packed.astype('>i2')
+            data[field_dic.get_mask()] = UF_MISSING_VALUE
+            packed_fields[field] = (scale, data)
+        return packed_fields
+
     @staticmethod
     def _calc_record_length(radar, field_mapping, field_write_order):
         """ Return the record length in 2-byte words. """
@@ -315,6 +349,161 @@ class UFRayCreator(object):
 
         return
 
+    def _field_scale(self, radar_field):
+        """ Return the UF scale factor used for a radar field. """
+        if radar_field in self.packed_fields:
+            return self.packed_fields[radar_field][0]
+        if '_UF_scale_factor' in self.radar.fields[radar_field]:
+            return self.radar.fields[radar_field]['_UF_scale_factor']
+        return UF_DEFAULT_SCALE_FACTOR
+
+    def record_dtype(self):
+        """
+        Return a structured NumPy dtype describing a complete UF record.
+
+        The record includes the leading and trailing Fortran record length
+        words which surround each ray in a UF file.
+        """
+        nfields = len(self.field_write_order)
+        dtypes = [
+            ('record_length_start', '>i4'),
+            ('mandatory_header', _structure_dtype(UF_MANDATORY_HEADER)),
+            ('optional_header', _structure_dtype(UF_OPTIONAL_HEADER)),
+            ('data_header', _structure_dtype(UF_DATA_HEADER)),
+            ('field_position', _structure_dtype(UF_FIELD_POSITION),
+             (nfields, )),
+        ]
+        for i, radar_field in enumerate(self.field_write_order):
+            data_type = self.field_mapping[radar_field].encode('ascii')
+            dtypes.append(
+                ('field_header_%d' % i, _structure_dtype(UF_FIELD_HEADER)))
+            if data_type in UF_VEL_DATA_TYPES:
+                dtypes.append(('fsi_vel_%d' % i, _structure_dtype(UF_FSI_VEL)))
+            dtypes.append(('data_%d' % i, '>i2', (self.radar.ngates, )))
+        dtypes.append(('record_length_end', '>i4'))
+        return np.dtype(dtypes)
+
+    def make_records(self):
+        """
+        Return a structured array containing the UF records for all rays.
+
+        Headers are populated for all rays at once and each field is
+        quantized for the entire volume in a single operation.  The
+        ray_num-th element contains the same bytes as make_ray(ray_num)
+        surrounded by the Fortran record length words.
+        """
+        radar = self.radar
+        nrays = radar.nrays
+        sweep_nums = self.ray_num_to_sweep_num
+        records = np.zeros((nrays, ), dtype=self.record_dtype())
+        records['record_length_start'] = self.record_length * 2
+        records['record_length_end'] = self.record_length * 2
+
+        # mandatory header
+        header = records['mandatory_header']
+        _fill_structure(header, self.mandatory_header_template)
+        ray_times = num2date(radar.time['data'], radar.time['units'])
+        ray_times = np.ravel(ray_times)
+        header['year'] = [ray_time.year - 2000 for ray_time in ray_times]
+        header['month'] = [ray_time.month for ray_time in ray_times]
+        header['day'] = [ray_time.day for ray_time in ray_times]
+        header['hour'] = [ray_time.hour for ray_time in ray_times]
+        header['minute'] = [ray_time.minute for ray_time in ray_times]
+        header['second'] = [ray_time.second for ray_time in ray_times]
+        header['record_number'] = np.arange(1, nrays + 1)
+        header['ray_number'] = np.arange(1, nrays + 1)
+        header['sweep_number'] = sweep_nums + 1
+        header['azimuth'] = np.round(radar.azimuth['data'] * 64)
+        header['elevation'] = np.round(radar.elevation['data'] * 64)
+        fixed_angle = np.asarray(radar.fixed_angle['data'])[sweep_nums]
+        header['fixed_angle'] = np.round(fixed_angle * 64)
+        if radar.scan_rate is not None:
+            header['sweep_rate'] = np.round(radar.scan_rate['data'] * 64)
+        else:
+            header['sweep_rate'] = UF_MISSING_VALUE
+        if radar.scan_type in UF_SWEEP_MODES:
+            header['sweep_mode'] = UF_SWEEP_MODES[radar.scan_type]
+        else:
+            warnings.warn(
+                'Unknown scan_type: %s, defaulting to PPI' %
+                (radar.scan_type))
+            header['sweep_mode'] = UF_SWEEP_MODES['ppi']
+        header['record_length'] = self.record_length
+
+        # optional header, data header and field positions, same for all rays
+        optional_header = records['optional_header']
+        _fill_structure(optional_header, self.optional_header_template)
+
+        data_header = records['data_header']
+        nfields = len(self.field_write_order)
+        _fill_structure(data_header, UF_DATA_HEADER_TEMPLATE)
+        data_header['ray_nfields'] = nfields
+        data_header['record_nfields'] = nfields
+
+        field_positions = self.make_field_position_list()
+        field_position = records['field_position']
+        for i, field_info in enumerate(field_positions):
+            field_position[:, i]['data_type'] = field_info['data_type']
+            field_position[:, i]['offset_field_header'] = (
+                field_info['offset_field_header'])
+
+        # per-ray field header parameters, shared by all fields
+        iparams = radar.instrument_parameters
+        if iparams is not None and 'pulse_width' in iparams:
+            pulse_width = np.asarray(iparams['pulse_width']['data'])
+            pulse_width_m = np.round(pulse_width * _LIGHT_SPEED)
+        else:
+            pulse_width_m = UF_MISSING_VALUE
+
+        if iparams is not None and 'prt' in iparams:
+            prt = np.asarray(iparams['prt']['data'])
+            prt_ms = np.round(prt * 1.e6)
+        else:
+            prt_ms = UF_MISSING_VALUE
+
+        polarization = np.ones((radar.nsweeps, ), dtype='int16')
+        if iparams is not None and 'polarization_mode' in iparams:
+            modes = iparams['polarization_mode']['data']
+            for sweep_num in range(radar.nsweeps):
+                mode = str(modes[sweep_num])
+                if mode in POLARIZATION_STR:
+                    polarization[sweep_num] = POLARIZATION_STR.index(mode)
+        polarization = polarization[sweep_nums]
+
+        if iparams is not None and 'nyquist_velocity' in iparams:
+            nyquist = np.asarray(iparams['nyquist_velocity']['data'])
+        else:
+            nyquist = None
+
+        # field headers and data
+        for i, field_info in enumerate(field_positions):
+            data_type = field_info['data_type']
+            offset = field_info['offset_field_header'] + 19
+            radar_field = field_info['radar_field']
+            scale = self._field_scale(radar_field)
+
+            if data_type in UF_VEL_DATA_TYPES:
+                offset += 2
+                fsi_vel = records['fsi_vel_%d' % i]
+                _fill_structure(fsi_vel, UF_FSI_VEL_TEMPLATE)
+                if nyquist is not None:
+                    fsi_vel['nyquist'] = np.round(nyquist * scale)
+                else:
+                    fsi_vel['nyquist'] = UF_MISSING_VALUE
+
+            field_header = records['field_header_%d' % i]
+            _fill_structure(field_header, self.field_header_template)
+            field_header['nbins'] = radar.ngates
+            field_header['data_offset'] = offset
+            field_header['scale_factor'] = scale
+            field_header['pulse_width_m'] = pulse_width_m
+            field_header['prt_ms'] = prt_ms
+            field_header['polarization'] = polarization
+
+            records['data_%d' % i] = self.make_data_array(
+                radar_field, slice(None), scale)
+        return records
+
     def make_ray(self, ray_num):
         """ Return a byte string representing a complete UF ray. """
         ray = self.make_mandatory_header(ray_num)
@@ -328,10 +517,7 @@ class UFRayCreator(object):
             data_type = field_info['data_type']
             offset = field_info['offset_field_header'] + 19
             radar_field = field_info['radar_field']
-            if '_UF_scale_factor' in self.radar.fields[radar_field]:
-                scale = self.radar.fields[radar_field]['_UF_scale_factor']
-            else:
-                scale = UF_DEFAULT_SCALE_FACTOR
+            scale = self._field_scale(radar_field)
 
             if data_type in UF_VEL_DATA_TYPES:
                 offset += 2
@@ -479,7 +665,13 @@ class UFRayCreator(object):
         return _pack_structure(fsi_vel, UF_FSI_VEL)
 
     def make_data_array(self, field, ray_num, scale=100.):
-        """ Return an array of UF field data. """
+        """
+        Return an array of UF field data.
+
+        ray_num may be a slice to quantize the data for multiple rays.
+        """
+        if field in self.packed_fields:
+            return self.packed_fields[field][1][ray_num]
         field_data = np.round(self.radar.fields[field]['data'][ray_num]*scale)
         return field_data.filled(-32768).astype('>i2')
 
@@ -495,6 +687,12 @@ def _d_to_dms(in_deg):
     return degrees, minutes, seconds
 
 
+def _fill_structure(array, dic):
+    """ Set all elements of a structured array from a dictionary. """
+    for name in array.dtype.names:
+        array[name] = dic[name]
+
+
 def _pack_structure(dic, structure):
     """ Pack a structure from a dictionary """
     fmt = '>' + ''.join([i[1] for i in structure])  # UF is big-endian
@@ -14,9 +14,14 @@ Low level class for reading Universal Format (UF) files.
 .. autosummary::
     :toctree: generated/
 
+    _word_offset
     _structure_size
     _unpack_from_buf
     _unpack_structure
+    _read_buffer
+    _close_mmap
+    _gather_structures
+    _structure_dtype
 
 """
 
@@ -77,14 +82,29 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import struct
 import datetime
+import io
+import mmap
+import os
 
 import numpy as np
 
+# file objects which can be memory mapped, the built-in file objects
+# returned by open in Python 2 are not io module classes.
+try:
+    _MAPPABLE_FILE_TYPES = (io.BufferedReader, io.FileIO, file)  # noqa
+except NameError:
+    _MAPPABLE_FILE_TYPES = (io.BufferedReader, io.FileIO)
+
 
 class UFFile(object):
     """
     A class for reading data from Universal Format (UF) files.
 
+    The location of each record (ray) is found when the object is created
+    and the mandatory and field headers of all rays are decoded into
+    structured arrays.  Field data is read from the file buffer when
+    requested.
+
     Parameters
     ----------
     filename : str or file-like
@@ -93,13 +113,28 @@ class UFFile(object):
     Attributes
     ----------
     rays : list of UFRay objects
-        List of rays within the UF file.
+        List of rays within the UF file.  These are decoded the first time
+        the attribute is accessed.
     nrays, nsweeps : int
         Number of rays and sweep in the file.
     ray_sweep_numbers : array
         Sweep number of each ray in the file.
     first_ray_in_sweep, last_ray_in_sweep : array
         Indices of the first and last ray in each sweep.
+    mandatory_headers : array
+        Structured array of the mandatory header of each ray.
+    field_data_types : list of bytes
+        Data type of each field in the first ray.
+    field_headers : list of arrays
+        Structured arrays of the field headers of each ray, one per field.
+    field_nyquists : list of arrays or None
+        Nyquist velocity, as stored in the field specific velocity header,
+        of each ray, one per field.  Masked in rays without this header,
+        None for fields which are not velocities.
+    _record_pos : array
+        Position of each record in the file buffer.
+    _buf_array : array
+        File buffer viewed as an array of unsigned bytes.
 
     """
 
@@ -122,35 +157,47 @@ class UFFile(object):
         # by the 'record_length' structure elements is used.
 
         # determine padding around records
-        buf = fobj.read(8)
+        buf, self._mmap = _read_buffer(fobj)
         try:
-            padding = buf.index(b'UF')
+            padding = bytes(buf[:8]).index(b'UF')
         except ValueError:
             raise IOError('file in not a valid UF file')
 
-        # read in the records, store as a list of rays
-        self.rays = []
-        while len(buf) == 8:  # read until EOF reached
+        # locate the records
+        record_pos = []
+        pos = 0
+        while len(buf) - pos >= 8:  # read until EOF reached
 
             # record size stored as a 2-byte int start at byte 2
-            record_size = struct.unpack('>h', buf[padding+2:padding+4])[0] * 2
-
-            # read in full record
-            bytes_read = len(buf) - padding
-            bytes_to_read = record_size - bytes_read
-            record = buf[-bytes_read:] + fobj.read(bytes_to_read)
-
-            # convert record into UFRay
-            self.rays.append(UFRay(record))
-
-            # read post record padding
-            fobj.read(padding)
-
-            # read in the first eight bytes of the next record
-            buf = fobj.read(8)
+            record_size = struct.unpack_from(
+                '>h', buf, pos + padding + 2)[0] * 2
+            record_pos.append(pos + padding)
+            pos += padding + record_size + padding
+        self._buf = buf
+        self._buf_array = np.frombuffer(buf, dtype='u1')
+        self._record_pos = np.array(record_pos, dtype=np.intp)
+        self._decoded_rays = None
 
         # determine volume size statistics
-        self.nrays = len(self.rays)
+        self.nrays = len(self._record_pos)
+
+        # decode the headers of all rays
+        self.mandatory_headers = _gather_structures(
+            self._buf_array, self._record_pos,
+            _structure_dtype(UF_MANDATORY_HEADER))
+        data_header_pos = self._record_pos + _word_offset(
+            self.mandatory_headers['offset_data_header'])
+        data_header = _gather_structures(
+            self._buf_array, data_header_pos[:1],
+            _structure_dtype(UF_DATA_HEADER))[0]
+        self.field_data_types = []
+        self.field_headers = []
+        self.field_nyquists = []
+        position_dtype = _structure_dtype(UF_FIELD_POSITION)
+        for i in range(data_header['record_nfields']):
+            position = _gather_structures(
+                self._buf_array, data_header_pos + 6 + i * 4, position_dtype)
+            self._read_field_headers(position)
 
         # determine sweep information
         self.ray_sweep_numbers = self._get_ray_sweep_numbers()
@@ -159,16 +206,51 @@ class UFFile(object):
         self.first_ray_in_sweep = first_ray_in_sweep
         self.last_ray_in_sweep = last_ray_in_sweep
 
+    def _read_field_headers(self, position):
+        """ Decode the field headers of one field in all rays. """
+        offset = self._record_pos + _word_offset(
+            position['offset_field_header'])
+        field_header = _gather_structures(
+            self._buf_array, offset, _structure_dtype(UF_FIELD_HEADER))
+        data_type = bytes(position['data_type'][0])
+        self.field_data_types.append(data_type)
+        self.field_headers.append(field_header)
+
+        # velocity fields may contain the nyquist velocity
+        if data_type not in [b'VF', b'VE', b'VR', b'VT', b'VP']:
+            self.field_nyquists.append(None)
+            return
+        data_offset = self._record_pos + _word_offset(
+            field_header['data_offset'])
+        has_nyquist = (data_offset - offset) == 42
+        vel_header = _gather_structures(
+            self._buf_array, offset + 38, _structure_dtype(UF_FSI_VEL))
+        self.field_nyquists.append(np.ma.masked_array(
+            vel_header['nyquist'].astype('int16'), ~has_nyquist))
+
+    @property
+    def rays(self):
+        """ Rays in the file, decoded on first access. """
+        if self._decoded_rays is None:
+            self._decoded_rays = [self.get_ray(i) for i in range(self.nrays)]
+        return self._decoded_rays
+
+    def get_ray(self, ray_number):
+        """ Return a UFRay object for a single ray in the file. """
+        start = self._record_pos[ray_number]
+        size = int(self.mandatory_headers['record_length'][ray_number]) * 2
+        return UFRay(self._buf[start:start + size])
+
     def close(self):
         """ Close the file. """
         self._fh.close()
+        if self._mmap is not None:
+            self._buf = self._buf_array = None
+            _close_mmap(self._mmap)
 
     def _get_ray_sweep_numbers(self):
         """ Return an array of the sweep_number stored in each ray. """
-        ray_sweep_numbers = np.empty((self.nrays, ), dtype='int32')
-        for i, ray in enumerate(self.rays):
-            ray_sweep_numbers[i] = ray.mandatory_header['sweep_number']
-        return ray_sweep_numbers
+        return self.mandatory_headers['sweep_number'].astype('int32')
 
     def _get_sweep_limits(self):
         """ Return arrays of indices of first and last ray in each sweep. """
@@ -181,62 +263,62 @@ class UFFile(object):
             last_ray_in_sweep[i] = matches[0][-1]
         return first_ray_in_sweep, last_ray_in_sweep
 
-    def get_field_data(self, field_number):
-        """ Return a 2D array of scale/masked field data for the volume. """
+    def get_field_data(self, field_number, raw_data=False):
+        """
+        Return a 2D array of scale/masked field data for the volume.
+
+        When raw_data is True the unscaled int16 data is returned with
+        gates not present set to the missing data value.  Otherwise the data
+        of each ray is scaled by the scale factor of that ray.
+        """
         # Assumes that no rays contain more gates than the first ray and
-        # that the missing_data_value and scale_factor are identical for all
-        # rays.  Additional the order and number of the fields are assumed to
-        # be identical between rays.
-        first_ray = self.rays[0]
-        ngates = len(first_ray.field_raw_data[field_number])
-        missing_data_value = first_ray.mandatory_header['missing_data_value']
-        scale_factor = first_ray.field_headers[field_number]['scale_factor']
-
-        raw_data = np.empty((self.nrays, ngates), 'int16')
-        for i, ray in enumerate(self.rays):
-            ray_data = ray.field_raw_data[field_number]
-            bins = len(ray_data)
-            raw_data[i, :bins] = ray.field_raw_data[field_number]
-            raw_data[i, bins:] = missing_data_value
-
-        data = raw_data / float(scale_factor)
-        mask = raw_data == missing_data_value
+        # that the missing_data_value is identical for all rays.
+        # Additional the order and number of the fields are assumed to be
+        # identical between rays.
+        field_header = self.field_headers[field_number]
+        nbins = field_header['nbins'].astype(np.intp)
+        ngates = int(nbins[0])
+        missing_data_value = self.mandatory_headers['missing_data_value'][0]
+        scale_factors = field_header['scale_factor'].astype('float64')
+        if np.any(nbins > ngates):
+            raise ValueError(
+                'UF rays contain more gates than the first ray')
+
+        # copy the data of each ray from the file buffer
+        data_pos = self._record_pos + _word_offset(field_header['data_offset'])
+        if np.any(data_pos + nbins * 2 > len(self._buf_array)):
+            raise ValueError('UF file is truncated')
+        raw = np.empty((self.nrays, ngates), dtype='int16')
+        for ray_num, (pos, count) in enumerate(zip(data_pos, nbins)):
+            raw[ray_num, :count] = (
+                self._buf_array[pos:pos + count * 2].view('>i2'))
+            raw[ray_num, count:] = missing_data_value
+        if raw_data:
+            return raw
+
+        data = raw / scale_factors[:, np.newaxis]
+        mask = raw == missing_data_value
         return np.ma.masked_array(data, mask)
 
     def get_azimuths(self):
         """ Return an array of azimuth angles for each ray in degrees. """
-        azimuth = np.empty((self.nrays, ), dtype='float32')
-        for i, ray in enumerate(self.rays):
-            azimuth[i] = ray.mandatory_header['azimuth'] / 64.
-        return azimuth
+        return self.mandatory_headers['azimuth'] / np.float32(64.)
 
     def get_elevations(self):
         """ Return an array of elevation angles for each ray in degrees. """
-        elevation = np.empty((self.nrays, ), dtype='float32')
-        for i, ray in enumerate(self.rays):
-            elevation[i] = ray.mandatory_header['elevation'] / 64.
-        return elevation
+        return self.mandatory_headers['elevation'] / np.float32(64.)
 
     def get_sweep_rates(self):
         """ Return an array of sweep rates for each ray in degrees/sec. """
-        sweep_rates = np.empty((self.nrays, ), dtype='float32')
-        for i, ray in enumerate(self.rays):
-            sweep_rates[i] = ray.mandatory_header['sweep_rate'] / 64.
-        return sweep_rates
+        return self.mandatory_headers['sweep_rate'] / np.float32(64.)
 
     def get_pulse_widths(self):
         """ Return an array of pulse widths for each ray in meters. """
-        pulse_widths = np.empty((self.nrays, ), dtype='float32')
-        for i, ray in enumerate(self.rays):
-            pulse_widths[i] = ray.field_headers[0]['pulse_width_m']
-        return pulse_widths
+        return self.field_headers[0]['pulse_width_m'].astype('float32')
 
     def get_prts(self):
         """ Return an array of prts for each ray in microseconds. """
-        prts = np.empty((self.nrays, ), dtype='float32')
-        for i, ray in enumerate(self.rays):
-            prts[i] = ray.field_headers[0]['prt_ms']
-        return prts
+        return self.field_headers[0]['prt_ms'].astype('float32')
 
     def get_nyquists(self):
         """
@@ -244,41 +326,38 @@ class UFFile(object):
 
         Returns None if nyquist velocities cannot be determined for all rays.
         """
-        field_headers = self.rays[0].field_headers
+        has_nyquist = [nyquist is not None and nyquist[0] is not np.ma.masked
+                       for nyquist in self.field_nyquists]
         try:
-            field_idx = ['nyquist' in fh for fh in field_headers].index(True)
+            field_idx = has_nyquist.index(True)
         except ValueError:
             return None  # True not in list
-        nyquist = np.empty((self.nrays, ), dtype='float32')
-        for i, ray in enumerate(self.rays):
-            scale = ray.field_headers[field_idx]['scale_factor']
-            try:
-                nyquist[i] = ray.field_headers[field_idx]['nyquist'] / scale
-            except KeyError:
-                return None  # nyquist not in field header
-        return nyquist
+        nyquist = self.field_nyquists[field_idx]
+        if np.ma.is_masked(nyquist):
+            return None  # nyquist not in field header
+        scale = self.field_headers[field_idx]['scale_factor']
+        return (np.ma.getdata(nyquist) / scale).astype('float32')
 
     def get_sweep_fixed_angles(self):
         """ Return an array of fixed angles for each sweep in degrees. """
-        fixed = np.empty((self.nsweeps, ), dtype='float32')
-        for i, ray_num in enumerate(self.first_ray_in_sweep):
-            fixed[i] = self.rays[ray_num].mandatory_header['fixed_angle'] / 64.
-        return fixed
+        fixed = self.mandatory_headers['fixed_angle'][self.first_ray_in_sweep]
+        return fixed / np.float32(64.)
 
     def get_sweep_polarizations(self):
         """ Return an array of polarization modes for each sweep. """
-        modes = []
-        for ray_num in self.first_ray_in_sweep:
-            ray = self.rays[ray_num]
-            polarization = ray.field_headers[0]['polarization']
-            if polarization > 3:
-                polarization = 3
-            modes.append(POLARIZATION_STR[polarization])
-        return np.array(modes)
+        polarization = self.field_headers[0]['polarization']
+        polarization = np.minimum(polarization[self.first_ray_in_sweep], 3)
+        return np.array([POLARIZATION_STR[p] for p in polarization])
 
     def get_datetimes(self):
         """ Return a list of datetimes for each ray. """
-        return [ray.get_datetime() for ray in self.rays]
+        headers = self.mandatory_headers
+        year = headers['year'].astype('int32')
+        year[year < 1900] += 2000   # years after 2000, 11 -> 2011
+        return [datetime.datetime(*args) for args in zip(
+            year.tolist(), headers['month'].tolist(), headers['day'].tolist(),
+            headers['hour'].tolist(), headers['minute'].tolist(),
+            headers['second'].tolist())]
 
 
 class UFRay(object):
@@ -287,8 +366,8 @@ class UFRay(object):
 
     Parameters
     ----------
-    record : str
-        Byte string containing the binary data for a UF ray.
+    record : bytes or memoryview
+        Buffer containing the binary data for a UF ray.
 
     Attributes
     ----------
@@ -360,7 +439,7 @@ class UFRay(object):
                 field_header.update(vel_header)
 
         data_str = self._buf[data_offset:data_offset+field_header['nbins']*2]
-        raw_data = np.fromstring(data_str, dtype='>i2')
+        raw_data = np.frombuffer(data_str, dtype='>i2')
         return raw_data
 
     def get_datetime(self):
@@ -392,6 +471,11 @@ class UFRay(object):
         return latitude, longitude, height
 
 
+def _word_offset(offset):
+    """ Convert 1-based offsets in 16-bit words to 0-based byte offsets. """
+    return (offset.astype(np.intp) - 1) * 2
+
+
 def _structure_size(structure):
     """ Find the size of a structure in bytes. """
     return struct.calcsize('>' + ''.join([i[1] for i in structure]))
@@ -410,6 +494,105 @@ def _unpack_structure(string, structure):
     return dict(zip([i[0] for i in structure], lst))
 
 
+def _read_buffer(fh):
+    """
+    Return a buffer containing the remaining data in a file-like object.
+
+    Uncompressed files on disk are memory mapped and a read-only memoryview
+    of the mapping is returned, so no data is copied and the file pages are
+    shared between processes reading the same file.  Other file-like objects
+    are read into a bytes object.
+
+    Parameters
+    ----------
+    fh : file-like
+        File-like object to read from its current position.
+
+    Returns
+    -------
+    buf : memoryview or bytes
+        Buffer containing the data.
+    mapped : mmap or None
+        Memory map underlying buf or None when the data was read into a
+        bytes object.  Close the map using :py:func:`_close_mmap` once all
+        references to buf have been removed.
+
+    """
+    if isinstance(fh, _MAPPABLE_FILE_TYPES):
+        mapped = None
+        try:
+            pos = fh.tell()
+            if os.fstat(fh.fileno()).st_size > pos:
+                mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+                buf = memoryview(mapped)[pos:]
+                fh.seek(0, os.SEEK_END)
+                return buf, mapped
+        except (EnvironmentError, TypeError, ValueError):
+            # not a regular file or, in Python 2, the map does not support
+            # memoryviews, read the data
+            if mapped is not None:
+                mapped.close()
+    return fh.read(), None
+
+
+def _close_mmap(mapped):
+    """
+    Close a memory map returned by :py:func:`_read_buffer`.
+
+    Maps which are still referenced by a buffer or array cannot be closed,
+    these are left open and closed when garbage collected.  Nothing is done
+    when mapped is None.
+    """
+    if mapped is None:
+        return
+    try:
+        mapped.close()
+    except BufferError:
+        pass    # data from the map is still in use
+
+
+def _gather_structures(buf_array, positions, dtype):
+    """
+    Decode structures located at the given positions in a buffer.
+
+    Parameters
+    ----------
+    buf_array : array
+        Buffer viewed as an array of unsigned bytes.
+    positions : array
+        Location of each structure in the buffer.
+    dtype : dtype
+        Structured NumPy data type describing the structure.
+
+    Returns
+    -------
+    structures : array
+        Array of structures with the given dtype.
+
+    """
+    positions = np.asarray(positions, dtype=np.intp)
+    loc = positions[:, np.newaxis] + np.arange(dtype.itemsize)
+    return buf_array[loc].view(dtype).reshape(len(positions))
+
+
+def _structure_dtype(structure):
+    """
+    Return a structured big-endian NumPy dtype for a structure.
+
+    The structure is a list of (name, format) tuples using the format
+    characters of the struct module.  Byte strings are stored as void
+    elements, bytes(element) returns the string including any trailing null
+    bytes as struct.unpack does.
+    """
+    dtypes = []
+    for name, fmt in structure:
+        if fmt.endswith('s'):
+            dtypes.append((name, 'V' + fmt[:-1]))
+        else:
+            dtypes.append((name, '>' + np.dtype(fmt).str[1:]))
+    return np.dtype(dtypes)
+
+
 # The Universal file format was originally described in the report:
 #
 # Barnes, Stanley L. Report on a meeting to establish a common Doppler radar
@@ -14,16 +14,26 @@ coordinates to Cartesian coordinates.
     grid_from_radars
     map_to_grid
     map_gates_to_grid
+    GridMapper
+    iter_grid_tiles
+    write_tiled_grid
+    build_grid_weight_operator
+    load_grid_weight_operator
+    GridWeightOperator
     example_roi_func_constant
     example_roi_func_dist
     example_roi_func_dist_beam
 
 """
 
-from .grid_mapper import map_to_grid, grid_from_radars
+from .grid_mapper import map_to_grid, grid_from_radars, GridMapper
 from .grid_mapper import example_roi_func_constant
 from .grid_mapper import example_roi_func_dist
 from .grid_mapper import example_roi_func_dist_beam
 from .gates_to_grid import map_gates_to_grid
+from .tiled_grid import iter_grid_tiles, write_tiled_grid
+from .weight_operator import GridWeightOperator
+from .weight_operator import build_grid_weight_operator
+from .weight_operator import load_grid_weight_operator
 
 __all__ = [s for s in dir() if not s.startswith('_')]
@@ -447,7 +447,7 @@ static const char *__pyx_filename;
 
 static const char *__pyx_f[] = {
   "pyart/map/_gate_to_grid_map.pyx",
-  "pyart/map/stringsource",
+  "stringsource",
 };
 struct __pyx_memoryview_obj;
 typedef struct {
@@ -546,15 +546,16 @@ struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction;
 struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_ConstantRoI;
 struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistRoI;
 struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistBeamRoI;
+struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI;
 struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper;
 struct __pyx_array_obj;
 struct __pyx_MemviewEnum_obj;
 struct __pyx_memoryview_obj;
 struct __pyx_memoryviewslice_obj;
 
-/* "pyart/map/_gate_to_grid_map.pyx":33
+/* "pyart/map/_gate_to_grid_map.pyx":39
  * # This definition can be added to a .pxd file so others can defined fast
- * # RoI functions
+ * # RoI functions by implementing the roi method.
  * cdef class RoIFunction:             # <<<<<<<<<<<<<<
  *     """ A class for storing radius of interest calculations. """
  * 
@@ -565,7 +566,7 @@ struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction {
 };
 
 
-/* "pyart/map/_gate_to_grid_map.pyx":41
+/* "pyart/map/_gate_to_grid_map.pyx":51
  * 
  * 
  * cdef class ConstantRoI(RoIFunction):             # <<<<<<<<<<<<<<
@@ -578,7 +579,7 @@ struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_ConstantRoI {
 };
 
 
-/* "pyart/map/_gate_to_grid_map.pyx":55
+/* "pyart/map/_gate_to_grid_map.pyx":65
  * 
  * 
  * cdef class DistRoI(RoIFunction):             # <<<<<<<<<<<<<<
@@ -595,7 +596,7 @@ struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistRoI {
 };
 
 
-/* "pyart/map/_gate_to_grid_map.pyx":101
+/* "pyart/map/_gate_to_grid_map.pyx":111
  * 
  * 
  * cdef class DistBeamRoI(RoIFunction):             # <<<<<<<<<<<<<<
@@ -612,7 +613,29 @@ struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistBeamRoI {
 };
 
 
-/* "pyart/map/_gate_to_grid_map.pyx":150
+/* "pyart/map/_gate_to_grid_map.pyx":160
+ * 
+ * 
+ * cdef class LatticeRoI(RoIFunction):             # <<<<<<<<<<<<<<
+ *     """
+ *     Radius of influence interpolated from values on a regular lattice.
+ */
+struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI {
+  struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction __pyx_base;
+  __Pyx_memviewslice roi_values;
+  float z_start;
+  float y_start;
+  float x_start;
+  float z_step;
+  float y_step;
+  float x_step;
+  int nz;
+  int ny;
+  int nx;
+};
+
+
+/* "pyart/map/_gate_to_grid_map.pyx":242
  * 
  * 
  * cdef class GateToGridMapper:             # <<<<<<<<<<<<<<
@@ -714,9 +737,9 @@ struct __pyx_memoryviewslice_obj {
 
 
 
-/* "pyart/map/_gate_to_grid_map.pyx":33
+/* "pyart/map/_gate_to_grid_map.pyx":39
  * # This definition can be added to a .pxd file so others can defined fast
- * # RoI functions
+ * # RoI functions by implementing the roi method.
  * cdef class RoIFunction:             # <<<<<<<<<<<<<<
  *     """ A class for storing radius of interest calculations. """
  * 
@@ -724,11 +747,12 @@ struct __pyx_memoryviewslice_obj {
 
 struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction {
   float (*get_roi)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, float, float, float, int __pyx_skip_dispatch);
+  float (*roi)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, float, float, float);
 };
 static struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_RoIFunction;
 
 
-/* "pyart/map/_gate_to_grid_map.pyx":41
+/* "pyart/map/_gate_to_grid_map.pyx":51
  * 
  * 
  * cdef class ConstantRoI(RoIFunction):             # <<<<<<<<<<<<<<
@@ -742,7 +766,7 @@ struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_ConstantRoI {
 static struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_ConstantRoI *__pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_ConstantRoI;
 
 
-/* "pyart/map/_gate_to_grid_map.pyx":55
+/* "pyart/map/_gate_to_grid_map.pyx":65
  * 
  * 
  * cdef class DistRoI(RoIFunction):             # <<<<<<<<<<<<<<
@@ -756,7 +780,7 @@ struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_DistRoI {
 static struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_DistRoI *__pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_DistRoI;
 
 
-/* "pyart/map/_gate_to_grid_map.pyx":101
+/* "pyart/map/_gate_to_grid_map.pyx":111
  * 
  * 
  * cdef class DistBeamRoI(RoIFunction):             # <<<<<<<<<<<<<<
@@ -770,7 +794,21 @@ struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_DistBeamRoI {
 static struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_DistBeamRoI *__pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_DistBeamRoI;
 
 
-/* "pyart/map/_gate_to_grid_map.pyx":150
+/* "pyart/map/_gate_to_grid_map.pyx":160
+ * 
+ * 
+ * cdef class LatticeRoI(RoIFunction):             # <<<<<<<<<<<<<<
+ *     """
+ *     Radius of influence interpolated from values on a regular lattice.
+ */
+
+struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_LatticeRoI {
+  struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction __pyx_base;
+};
+static struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_LatticeRoI *__pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_LatticeRoI;
+
+
+/* "pyart/map/_gate_to_grid_map.pyx":242
  * 
  * 
  * cdef class GateToGridMapper:             # <<<<<<<<<<<<<<
@@ -963,8 +1001,6 @@ static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, in
 
 static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void);
 
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
-
 #include <string.h>
 
 static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
@@ -977,6 +1013,13 @@ static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int
 #define __Pyx_PyString_Equals __Pyx_PyBytes_Equals
 #endif
 
+static CYTHON_INLINE int __Pyx_PySequence_Contains(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
 static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t, Py_ssize_t); /* proto */
 
 #ifndef __PYX_FORCE_INIT_THREADS
@@ -1145,18 +1188,20 @@ static int __Pyx_ValidateAndInit_memviewslice(
                 __Pyx_memviewslice *memviewslice,
                 PyObject *original_obj);
 
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_d_dc_float(PyObject *);
-
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(PyObject *);
 
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_float(PyObject *);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_d_dc_float(PyObject *);
 
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_char(PyObject *);
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dc_float(PyObject *);
 
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_char(PyObject *);
 
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_int(PyObject *);
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_char(PyObject *);
+
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
 static PyObject *__pyx_memview_get_float(const char *itemp);
@@ -1164,6 +1209,8 @@ static int __pyx_memview_set_float(const char *itemp, PyObject *obj);
 
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_char(char value);
+
 static int __pyx_memviewslice_is_contig(const __Pyx_memviewslice *mvs,
                                         char order, int ndim);
 
@@ -1187,14 +1234,30 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
 
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_float(PyObject *);
 
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_char(PyObject *);
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_double(PyObject *);
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_signed_char(PyObject *);
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char(PyObject *);
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_short(PyObject *);
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_short(PyObject *);
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_int(PyObject *);
+
 static int __Pyx_check_binary_version(void);
 
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
-static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(CYTHON_UNUSED struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_self, CYTHON_UNUSED float __pyx_v_z, CYTHON_UNUSED float __pyx_v_y, CYTHON_UNUSED float __pyx_v_x, int __pyx_skip_dispatch); /* proto*/
-static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_ConstantRoI *__pyx_v_self, CYTHON_UNUSED float __pyx_v_z, CYTHON_UNUSED float __pyx_v_y, CYTHON_UNUSED float __pyx_v_x, int __pyx_skip_dispatch); /* proto*/
-static float __pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x, int __pyx_skip_dispatch); /* proto*/
-static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistBeamRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x, int __pyx_skip_dispatch); /* proto*/
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x, int __pyx_skip_dispatch); /* proto*/
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_roi(CYTHON_UNUSED struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_self, CYTHON_UNUSED float __pyx_v_z, CYTHON_UNUSED float __pyx_v_y, CYTHON_UNUSED float __pyx_v_x); /* proto*/
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_ConstantRoI *__pyx_v_self, CYTHON_UNUSED float __pyx_v_z, CYTHON_UNUSED float __pyx_v_y, CYTHON_UNUSED float __pyx_v_x); /* proto*/
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x); /* proto*/
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistBeamRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x); /* proto*/
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_10LatticeRoI_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x); /* proto*/
 static int __pyx_f_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_map_gate(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, float __pyx_v_x, float __pyx_v_y, float __pyx_v_z, float __pyx_v_roi, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_masks, int __pyx_v_weighting_function); /* proto*/
 static char *__pyx_memoryview_get_item_pointer(struct __pyx_memoryview_obj *__pyx_v_self, PyObject *__pyx_v_index); /* proto*/
 static PyObject *__pyx_memoryview_is_slice(struct __pyx_memoryview_obj *__pyx_v_self, PyObject *__pyx_v_obj); /* proto*/
@@ -1217,6 +1280,7 @@ static PyTypeObject *__pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction = 0
 static PyTypeObject *__pyx_ptype_5pyart_3map_17_gate_to_grid_map_ConstantRoI = 0;
 static PyTypeObject *__pyx_ptype_5pyart_3map_17_gate_to_grid_map_DistRoI = 0;
 static PyTypeObject *__pyx_ptype_5pyart_3map_17_gate_to_grid_map_DistBeamRoI = 0;
+static PyTypeObject *__pyx_ptype_5pyart_3map_17_gate_to_grid_map_LatticeRoI = 0;
 static PyTypeObject *__pyx_ptype_5pyart_3map_17_gate_to_grid_map_GateToGridMapper = 0;
 static PyTypeObject *__pyx_array_type = 0;
 static PyTypeObject *__pyx_MemviewEnum_type = 0;
@@ -1224,15 +1288,31 @@ static PyTypeObject *__pyx_memoryview_type = 0;
 static PyTypeObject *__pyx_memoryviewslice_type = 0;
 static int __pyx_v_5pyart_3map_17_gate_to_grid_map_BARNES;
 static int __pyx_v_5pyart_3map_17_gate_to_grid_map_CRESSMAN;
+static int __pyx_v_5pyart_3map_17_gate_to_grid_map_NEAREST;
+static int __pyx_v_5pyart_3map_17_gate_to_grid_map_BILINEAR;
 static float __pyx_v_5pyart_3map_17_gate_to_grid_map_PI;
 static float __pyx_v_5pyart_3map_17_gate_to_grid_map_R;
+static int __pyx_v_5pyart_3map_17_gate_to_grid_map_RAY_BLOCK_SIZE;
 static PyObject *generic = 0;
 static PyObject *strided = 0;
 static PyObject *indirect = 0;
 static PyObject *contiguous = 0;
 static PyObject *indirect_contiguous = 0;
+static int __pyx_f_5pyart_3map_17_gate_to_grid_map__load_rays(PyObject *, int, int, int, float, float, __Pyx_memviewslice); /*proto*/
+static void __pyx_f_5pyart_3map_17_gate_to_grid_map__find_gate_info(__Pyx_memviewslice, __Pyx_memviewslice, __Pyx_memviewslice, int, int, float, float, float, float, __Pyx_memviewslice, int, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, int, __Pyx_memviewslice); /*proto*/
+static int __pyx_f_5pyart_3map_17_gate_to_grid_map__has_nogil_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *); /*proto*/
+static CYTHON_INLINE void __pyx_f_5pyart_3map_17_gate_to_grid_map_gate_location(float, float, float, float, float, float, float *, float *, float *); /*proto*/
+static CYTHON_INLINE double __pyx_f_5pyart_3map_17_gate_to_grid_map_point_elevation(double, double); /*proto*/
+static CYTHON_INLINE void __pyx_f_5pyart_3map_17_gate_to_grid_map_lattice_position(float, float, float, int, int *, float *); /*proto*/
 static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(float, float, float); /*proto*/
 static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(float, float, float, int); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_0__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice, int, int, int, float, float, __Pyx_memviewslice); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_1__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice, int, int, int, float, float, __Pyx_memviewslice); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_2__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice, int, int, int, float, float, __Pyx_memviewslice); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_3__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice, int, int, int, float, float, __Pyx_memviewslice); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_4__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice, int, int, int, float, float, __Pyx_memviewslice); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_5__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice, int, int, int, float, float, __Pyx_memviewslice); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_6__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice, int, int, int, float, float, __Pyx_memviewslice); /*proto*/
 static struct __pyx_array_obj *__pyx_array_new(PyObject *, Py_ssize_t, char *, char *, char *); /*proto*/
 static void *__pyx_align_pointer(void *, size_t); /*proto*/
 static PyObject *__pyx_memoryview_new(PyObject *, int, int, __Pyx_TypeInfo *); /*proto*/
@@ -1267,6 +1347,12 @@ static void __pyx_memoryview_slice_assign_scalar(__Pyx_memviewslice *, int, size
 static void __pyx_memoryview__slice_assign_scalar(char *, Py_ssize_t *, Py_ssize_t *, int, size_t, void *); /*proto*/
 static __Pyx_TypeInfo __Pyx_TypeInfo_float = { "float", NULL, sizeof(float), { 0 }, 0, 'R', 0, 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_char = { "char", NULL, sizeof(char), { 0 }, 0, 'H', IS_UNSIGNED(char), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_int = { "int", NULL, sizeof(int), { 0 }, 0, IS_UNSIGNED(int) ? 'U' : 'I', IS_UNSIGNED(int), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_double = { "double", NULL, sizeof(double), { 0 }, 0, 'R', 0, 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_signed_char = { "signed char", NULL, sizeof(signed char), { 0 }, 0, IS_UNSIGNED(signed char) ? 'U' : 'I', IS_UNSIGNED(signed char), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_char = { "unsigned char", NULL, sizeof(unsigned char), { 0 }, 0, IS_UNSIGNED(unsigned char) ? 'U' : 'I', IS_UNSIGNED(unsigned char), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_short = { "short", NULL, sizeof(short), { 0 }, 0, IS_UNSIGNED(short) ? 'U' : 'I', IS_UNSIGNED(short), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_unsigned_short = { "unsigned short", NULL, sizeof(unsigned short), { 0 }, 0, IS_UNSIGNED(unsigned short) ? 'U' : 'I', IS_UNSIGNED(unsigned short), 0 };
 #define __Pyx_MODULE_NAME "pyart.map._gate_to_grid_map"
 int __pyx_module_is_main_pyart__map___gate_to_grid_map = 0;
 
@@ -1281,14 +1367,16 @@ static PyObject *__pyx_builtin_id;
 static PyObject *__pyx_builtin_IndexError;
 static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x); /* proto */
 static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11ConstantRoI___init__(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_ConstantRoI *__pyx_v_self, float __pyx_v_constant_roi); /* proto */
-static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_2get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_ConstantRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x); /* proto */
 static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistRoI *__pyx_v_self, PyObject *__pyx_v_z_factor, PyObject *__pyx_v_xy_factor, PyObject *__pyx_v_min_radius, PyObject *__pyx_v_offsets); /* proto */
-static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI_2get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x); /* proto */
 static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistBeamRoI *__pyx_v_self, PyObject *__pyx_v_h_factor, PyObject *__pyx_v_nb, PyObject *__pyx_v_bsp, PyObject *__pyx_v_min_radius, PyObject *__pyx_v_offsets); /* proto */
-static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_2get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistBeamRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x); /* proto */
+static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_10LatticeRoI___init__(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI *__pyx_v_self, __Pyx_memviewslice __pyx_v_roi_values, PyObject *__pyx_v_lattice_starts, PyObject *__pyx_v_lattice_steps); /* proto */
+static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_find_roi_on_lattice(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func, PyObject *__pyx_v_lattice_starts, PyObject *__pyx_v_lattice_steps, __Pyx_memviewslice __pyx_v_roi_array); /* proto */
 static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, PyObject *__pyx_v_grid_shape, PyObject *__pyx_v_grid_starts, PyObject *__pyx_v_grid_steps, __Pyx_memviewslice __pyx_v_grid_sum, __Pyx_memviewslice __pyx_v_grid_wsum); /* proto */
 static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_2find_roi_for_grid(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, __Pyx_memviewslice __pyx_v_roi_array, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func); /* proto */
-static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_4map_gates_to_grid(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, __Pyx_memviewslice __pyx_v_elevations, __Pyx_memviewslice __pyx_v_azimuths, __Pyx_memviewslice __pyx_v_ranges, __Pyx_memviewslice __pyx_v_field_data, __Pyx_memviewslice __pyx_v_field_mask, __Pyx_memviewslice __pyx_v_excluded_gates, PyObject *__pyx_v_offset, float __pyx_v_toa, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func, int __pyx_v_weighting_function); /* proto */
+static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_4map_gates_to_grid(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, __Pyx_memviewslice __pyx_v_elevations, __Pyx_memviewslice __pyx_v_azimuths, __Pyx_memviewslice __pyx_v_ranges, PyObject *__pyx_v_field_data, PyObject *__pyx_v_field_mask, __Pyx_memviewslice __pyx_v_scale_factors, __Pyx_memviewslice __pyx_v_add_offsets, __Pyx_memviewslice __pyx_v_excluded_gates, PyObject *__pyx_v_offset, float __pyx_v_toa, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func, int __pyx_v_weighting_function, int __pyx_v_ray_start, int __pyx_v_ray_end); /* proto */
+static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_6find_nearest_sweep(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, __Pyx_memviewslice __pyx_v_sweep_elevations, PyObject *__pyx_v_offset, __Pyx_memviewslice __pyx_v_nearest_sweep); /* proto */
+static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_8map_sweep_to_grid(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, __Pyx_memviewslice __pyx_v_azimuths, __Pyx_memviewslice __pyx_v_ranges, float __pyx_v_elevation, __Pyx_memviewslice __pyx_v_sweep_data, __Pyx_memviewslice __pyx_v_sweep_mask, __Pyx_memviewslice __pyx_v_nearest_sweep, int __pyx_v_isweep, PyObject *__pyx_v_offset, float __pyx_v_toa, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func, int __pyx_v_weighting_function, float __pyx_v_max_azimuth_gap); /* proto */
+static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_2find_gate_locations_and_roi(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_elevations, __Pyx_memviewslice __pyx_v_azimuths, __Pyx_memviewslice __pyx_v_ranges, PyObject *__pyx_v_offset, float __pyx_v_toa, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func, __Pyx_memviewslice __pyx_v_gate_info); /* proto */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array___cinit__(struct __pyx_array_obj *__pyx_v_self, PyObject *__pyx_v_shape, Py_ssize_t __pyx_v_itemsize, PyObject *__pyx_v_format, PyObject *__pyx_v_mode, int __pyx_v_allocate_buffer); /* proto */
 static int __pyx_array___pyx_pf_15View_dot_MemoryView_5array_2__getbuffer__(struct __pyx_array_obj *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_array___pyx_pf_15View_dot_MemoryView_5array_4__dealloc__(struct __pyx_array_obj *__pyx_v_self); /* proto */
@@ -1325,59 +1413,90 @@ static PyObject *__pyx_tp_new_5pyart_3map_17_gate_to_grid_map_RoIFunction(PyType
 static PyObject *__pyx_tp_new_5pyart_3map_17_gate_to_grid_map_ConstantRoI(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_5pyart_3map_17_gate_to_grid_map_DistRoI(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_5pyart_3map_17_gate_to_grid_map_DistBeamRoI(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_5pyart_3map_17_gate_to_grid_map_LatticeRoI(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_5pyart_3map_17_gate_to_grid_map_GateToGridMapper(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_array(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_Enum(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_memoryview(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new__memoryviewslice(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static char __pyx_k_B[] = "B";
+static char __pyx_k_H[] = "H";
 static char __pyx_k_O[] = "O";
+static char __pyx_k_b[] = "b";
 static char __pyx_k_c[] = "c";
+static char __pyx_k_d[] = "d";
 static char __pyx_k_f[] = "f";
+static char __pyx_k_h[] = "h";
 static char __pyx_k_x[] = "x";
 static char __pyx_k_y[] = "y";
 static char __pyx_k_z[] = "z";
 static char __pyx_k_id[] = "id";
+static char __pyx_k_ix[] = "ix";
+static char __pyx_k_iy[] = "iy";
+static char __pyx_k_iz[] = "iz";
 static char __pyx_k_nb[] = "nb";
 static char __pyx_k_bsp[] = "bsp";
+static char __pyx_k_mro[] = "__mro__";
 static char __pyx_k_obj[] = "obj";
 static char __pyx_k_toa[] = "toa";
 static char __pyx_k_base[] = "base";
+static char __pyx_k_char[] = "char";
+static char __pyx_k_dict[] = "__dict__";
 static char __pyx_k_main[] = "__main__";
 static char __pyx_k_mode[] = "mode";
 static char __pyx_k_name[] = "name";
 static char __pyx_k_ndim[] = "ndim";
+static char __pyx_k_nray[] = "nray";
 static char __pyx_k_pack[] = "pack";
 static char __pyx_k_size[] = "size";
 static char __pyx_k_step[] = "step";
 static char __pyx_k_stop[] = "stop";
 static char __pyx_k_test[] = "__test__";
 static char __pyx_k_class[] = "__class__";
+static char __pyx_k_dtype[] = "dtype";
 static char __pyx_k_error[] = "error";
 static char __pyx_k_flags[] = "flags";
+static char __pyx_k_ngate[] = "ngate";
+static char __pyx_k_nrays[] = "nrays";
 static char __pyx_k_range[] = "range";
 static char __pyx_k_shape[] = "shape";
 static char __pyx_k_start[] = "start";
 static char __pyx_k_format[] = "format";
 static char __pyx_k_import[] = "__import__";
+static char __pyx_k_isweep[] = "isweep";
 static char __pyx_k_name_2[] = "__name__";
 static char __pyx_k_offset[] = "offset";
 static char __pyx_k_ranges[] = "ranges";
 static char __pyx_k_struct[] = "struct";
 static char __pyx_k_unpack[] = "unpack";
+static char __pyx_k_x_step[] = "x_step";
+static char __pyx_k_y_step[] = "y_step";
+static char __pyx_k_z_step[] = "z_step";
 static char __pyx_k_fortran[] = "fortran";
 static char __pyx_k_get_roi[] = "get_roi";
 static char __pyx_k_memview[] = "memview";
 static char __pyx_k_offsets[] = "offsets";
+static char __pyx_k_ray_end[] = "ray_end";
+static char __pyx_k_x_start[] = "x_start";
+static char __pyx_k_y_start[] = "y_start";
+static char __pyx_k_z_start[] = "z_start";
 static char __pyx_k_Ellipsis[] = "Ellipsis";
 static char __pyx_k_azimuths[] = "azimuths";
 static char __pyx_k_grid_sum[] = "grid_sum";
 static char __pyx_k_h_factor[] = "h_factor";
 static char __pyx_k_itemsize[] = "itemsize";
 static char __pyx_k_roi_func[] = "roi_func";
+static char __pyx_k_x_offset[] = "x_offset";
+static char __pyx_k_y_offset[] = "y_offset";
 static char __pyx_k_z_factor[] = "z_factor";
+static char __pyx_k_z_offset[] = "z_offset";
 static char __pyx_k_TypeError[] = "TypeError";
+static char __pyx_k_elevation[] = "elevation";
 static char __pyx_k_enumerate[] = "enumerate";
+static char __pyx_k_gate_info[] = "gate_info";
 static char __pyx_k_grid_wsum[] = "grid_wsum";
+static char __pyx_k_nogil_roi[] = "nogil_roi";
+static char __pyx_k_ray_start[] = "ray_start";
 static char __pyx_k_roi_array[] = "roi_array";
 static char __pyx_k_xy_factor[] = "xy_factor";
 static char __pyx_k_IndexError[] = "IndexError";
@@ -1389,15 +1508,26 @@ static char __pyx_k_grid_shape[] = "grid_shape";
 static char __pyx_k_grid_steps[] = "grid_steps";
 static char __pyx_k_min_radius[] = "min_radius";
 static char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static char __pyx_k_roi_values[] = "roi_values";
+static char __pyx_k_sweep_data[] = "sweep_data";
+static char __pyx_k_sweep_mask[] = "sweep_mask";
 static char __pyx_k_MemoryError[] = "MemoryError";
+static char __pyx_k_add_offsets[] = "add_offsets";
 static char __pyx_k_grid_starts[] = "grid_starts";
 static char __pyx_k_constant_roi[] = "constant_roi";
+static char __pyx_k_lattice_steps[] = "lattice_steps";
+static char __pyx_k_nearest_sweep[] = "nearest_sweep";
 static char __pyx_k_pyx_getbuffer[] = "__pyx_getbuffer";
+static char __pyx_k_scale_factors[] = "scale_factors";
 static char __pyx_k_excluded_gates[] = "excluded_gates";
+static char __pyx_k_lattice_starts[] = "lattice_starts";
 static char __pyx_k_allocate_buffer[] = "allocate_buffer";
 static char __pyx_k_dtype_is_object[] = "dtype_is_object";
+static char __pyx_k_max_azimuth_gap[] = "max_azimuth_gap";
+static char __pyx_k_sweep_elevations[] = "sweep_elevations";
 static char __pyx_k_strided_and_direct[] = "<strided and direct>";
 static char __pyx_k_weighting_function[] = "weighting_function";
+static char __pyx_k_find_roi_on_lattice[] = "find_roi_on_lattice";
 static char __pyx_k_strided_and_indirect[] = "<strided and indirect>";
 static char __pyx_k_contiguous_and_direct[] = "<contiguous and direct>";
 static char __pyx_k_MemoryView_of_r_object[] = "<MemoryView of %r object>";
@@ -1409,10 +1539,13 @@ static char __pyx_k_Dimension_d_is_not_direct[] = "Dimension %d is not direct";
 static char __pyx_k_Invalid_shape_in_axis_d_d[] = "Invalid shape in axis %d: %d.";
 static char __pyx_k_Index_out_of_bounds_axis_d[] = "Index out of bounds (axis %d)";
 static char __pyx_k_Step_may_not_be_zero_axis_d[] = "Step may not be zero (axis %d)";
+static char __pyx_k_find_gate_locations_and_roi[] = "find_gate_locations_and_roi";
 static char __pyx_k_itemsize_0_for_cython_array[] = "itemsize <= 0 for cython.array";
+static char __pyx_k_pyart_map__gate_to_grid_map[] = "pyart.map._gate_to_grid_map";
 static char __pyx_k_unable_to_allocate_array_data[] = "unable to allocate array data.";
 static char __pyx_k_strided_and_direct_or_indirect[] = "<strided and direct or indirect>";
-static char __pyx_k_pyart_map__gate_to_grid_map_Cyt[] = "\npyart.map._gate_to_grid_map\n===========================\n\nCython classes and functions for efficient mapping of radar gates to\na uniform grid.\n\n.. autosummary::\n    :toctree: generated/\n    :template: dev_template.rst\n\n    GateToGridMapper\n    RoIFunction\n    ConstantRoI\n    DistRoI\n    DistBeamRoI\n\n";
+static char __pyx_k_pyart_map__gate_to_grid_map_Cyt[] = "\npyart.map._gate_to_grid_map\n===========================\n\nCython classes and functions for efficient mapping of radar gates to\na uniform grid.\n\n.. autosummary::\n    :toctree: generated/\n    :template: dev_template.rst\n\n    GateToGridMapper\n    RoIFunction\n    ConstantRoI\n    DistRoI\n    DistBeamRoI\n    LatticeRoI\n    find_roi_on_lattice\n\n";
+static char __pyx_k_root_package_pyart_map__gate_to[] = "/root/package/pyart/map/_gate_to_grid_map.pyx";
 static char __pyx_k_All_dimensions_preceding_dimensi[] = "All dimensions preceding dimension %d must be indexed and not sliced";
 static char __pyx_k_Buffer_view_does_not_expose_stri[] = "Buffer view does not expose strides";
 static char __pyx_k_Can_only_create_a_buffer_that_is[] = "Can only create a buffer that is contiguous in memory.";
@@ -1424,11 +1557,13 @@ static char __pyx_k_Out_of_bounds_on_buffer_access_a[] = "Out of bounds on buffe
 static char __pyx_k_Unable_to_convert_item_to_object[] = "Unable to convert item to object";
 static char __pyx_k_got_differing_extents_in_dimensi[] = "got differing extents in dimension %d (got %d and %d)";
 static char __pyx_k_unable_to_allocate_shape_and_str[] = "unable to allocate shape and strides.";
+static PyObject *__pyx_n_s_B;
 static PyObject *__pyx_kp_s_Buffer_view_does_not_expose_stri;
 static PyObject *__pyx_kp_s_Can_only_create_a_buffer_that_is;
 static PyObject *__pyx_kp_s_Cannot_index_with_type_s;
 static PyObject *__pyx_n_s_Ellipsis;
 static PyObject *__pyx_kp_s_Empty_shape_tuple_for_cython_arr;
+static PyObject *__pyx_n_s_H;
 static PyObject *__pyx_n_s_IndexError;
 static PyObject *__pyx_kp_s_Indirect_dimensions_not_supporte;
 static PyObject *__pyx_kp_s_Invalid_mode_expected_c_or_fortr;
@@ -1441,17 +1576,24 @@ static PyObject *__pyx_kp_s_Out_of_bounds_on_buffer_access_a;
 static PyObject *__pyx_n_s_TypeError;
 static PyObject *__pyx_kp_s_Unable_to_convert_item_to_object;
 static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_n_s_add_offsets;
 static PyObject *__pyx_n_s_allocate_buffer;
 static PyObject *__pyx_n_s_azimuths;
+static PyObject *__pyx_n_s_b;
 static PyObject *__pyx_n_s_base;
 static PyObject *__pyx_n_s_bsp;
 static PyObject *__pyx_n_s_c;
 static PyObject *__pyx_n_u_c;
+static PyObject *__pyx_n_s_char;
 static PyObject *__pyx_n_s_class;
 static PyObject *__pyx_n_s_constant_roi;
 static PyObject *__pyx_kp_s_contiguous_and_direct;
 static PyObject *__pyx_kp_s_contiguous_and_indirect;
+static PyObject *__pyx_n_s_d;
+static PyObject *__pyx_n_s_dict;
+static PyObject *__pyx_n_s_dtype;
 static PyObject *__pyx_n_s_dtype_is_object;
+static PyObject *__pyx_n_s_elevation;
 static PyObject *__pyx_n_s_elevations;
 static PyObject *__pyx_n_s_enumerate;
 static PyObject *__pyx_n_s_error;
@@ -1459,10 +1601,13 @@ static PyObject *__pyx_n_s_excluded_gates;
 static PyObject *__pyx_n_s_f;
 static PyObject *__pyx_n_s_field_data;
 static PyObject *__pyx_n_s_field_mask;
+static PyObject *__pyx_n_s_find_gate_locations_and_roi;
+static PyObject *__pyx_n_s_find_roi_on_lattice;
 static PyObject *__pyx_n_s_flags;
 static PyObject *__pyx_n_s_format;
 static PyObject *__pyx_n_s_fortran;
 static PyObject *__pyx_n_u_fortran;
+static PyObject *__pyx_n_s_gate_info;
 static PyObject *__pyx_n_s_get_roi;
 static PyObject *__pyx_kp_s_got_differing_extents_in_dimensi;
 static PyObject *__pyx_n_s_grid_shape;
@@ -1470,29 +1615,49 @@ static PyObject *__pyx_n_s_grid_starts;
 static PyObject *__pyx_n_s_grid_steps;
 static PyObject *__pyx_n_s_grid_sum;
 static PyObject *__pyx_n_s_grid_wsum;
+static PyObject *__pyx_n_s_h;
 static PyObject *__pyx_n_s_h_factor;
 static PyObject *__pyx_n_s_id;
 static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_isweep;
 static PyObject *__pyx_n_s_itemsize;
 static PyObject *__pyx_kp_s_itemsize_0_for_cython_array;
+static PyObject *__pyx_n_s_ix;
+static PyObject *__pyx_n_s_iy;
+static PyObject *__pyx_n_s_iz;
+static PyObject *__pyx_n_s_lattice_starts;
+static PyObject *__pyx_n_s_lattice_steps;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_max_azimuth_gap;
 static PyObject *__pyx_n_s_memview;
 static PyObject *__pyx_n_s_min_radius;
 static PyObject *__pyx_n_s_mode;
+static PyObject *__pyx_n_s_mro;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_name_2;
 static PyObject *__pyx_n_s_nb;
 static PyObject *__pyx_n_s_ndim;
+static PyObject *__pyx_n_s_nearest_sweep;
+static PyObject *__pyx_n_s_ngate;
+static PyObject *__pyx_n_s_nogil_roi;
+static PyObject *__pyx_n_s_nray;
+static PyObject *__pyx_n_s_nrays;
 static PyObject *__pyx_n_s_obj;
 static PyObject *__pyx_n_s_offset;
 static PyObject *__pyx_n_s_offsets;
 static PyObject *__pyx_n_s_pack;
+static PyObject *__pyx_n_s_pyart_map__gate_to_grid_map;
 static PyObject *__pyx_n_s_pyx_getbuffer;
 static PyObject *__pyx_n_s_pyx_vtable;
 static PyObject *__pyx_n_s_range;
 static PyObject *__pyx_n_s_ranges;
+static PyObject *__pyx_n_s_ray_end;
+static PyObject *__pyx_n_s_ray_start;
 static PyObject *__pyx_n_s_roi_array;
 static PyObject *__pyx_n_s_roi_func;
+static PyObject *__pyx_n_s_roi_values;
+static PyObject *__pyx_kp_s_root_package_pyart_map__gate_to;
+static PyObject *__pyx_n_s_scale_factors;
 static PyObject *__pyx_n_s_shape;
 static PyObject *__pyx_n_s_size;
 static PyObject *__pyx_n_s_start;
@@ -1502,6 +1667,9 @@ static PyObject *__pyx_kp_s_strided_and_direct;
 static PyObject *__pyx_kp_s_strided_and_direct_or_indirect;
 static PyObject *__pyx_kp_s_strided_and_indirect;
 static PyObject *__pyx_n_s_struct;
+static PyObject *__pyx_n_s_sweep_data;
+static PyObject *__pyx_n_s_sweep_elevations;
+static PyObject *__pyx_n_s_sweep_mask;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_toa;
 static PyObject *__pyx_kp_s_unable_to_allocate_array_data;
@@ -1509,14 +1677,24 @@ static PyObject *__pyx_kp_s_unable_to_allocate_shape_and_str;
 static PyObject *__pyx_n_s_unpack;
 static PyObject *__pyx_n_s_weighting_function;
 static PyObject *__pyx_n_s_x;
+static PyObject *__pyx_n_s_x_offset;
+static PyObject *__pyx_n_s_x_start;
+static PyObject *__pyx_n_s_x_step;
 static PyObject *__pyx_n_s_xy_factor;
 static PyObject *__pyx_n_s_y;
+static PyObject *__pyx_n_s_y_offset;
+static PyObject *__pyx_n_s_y_start;
+static PyObject *__pyx_n_s_y_step;
 static PyObject *__pyx_n_s_z;
 static PyObject *__pyx_n_s_z_factor;
+static PyObject *__pyx_n_s_z_offset;
+static PyObject *__pyx_n_s_z_start;
+static PyObject *__pyx_n_s_z_step;
 static PyObject *__pyx_float_180_;
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_3;
+static PyObject *__pyx_int_4;
 static PyObject *__pyx_int_neg_1;
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_slice__9;
@@ -1531,21 +1709,25 @@ static PyObject *__pyx_slice__10;
 static PyObject *__pyx_slice__11;
 static PyObject *__pyx_tuple__12;
 static PyObject *__pyx_tuple__13;
-static PyObject *__pyx_tuple__14;
 static PyObject *__pyx_tuple__15;
-static PyObject *__pyx_tuple__16;
 static PyObject *__pyx_tuple__17;
-
-/* "pyart/map/_gate_to_grid_map.pyx":36
+static PyObject *__pyx_tuple__18;
+static PyObject *__pyx_tuple__19;
+static PyObject *__pyx_tuple__20;
+static PyObject *__pyx_tuple__21;
+static PyObject *__pyx_codeobj__14;
+static PyObject *__pyx_codeobj__16;
+
+/* "pyart/map/_gate_to_grid_map.pyx":42
  *     """ A class for storing radius of interest calculations. """
  * 
  *     cpdef float get_roi(self, float z, float y, float x):             # <<<<<<<<<<<<<<
  *         """ Return the radius of influence for coordinates in meters. """
- *         return 0
+ *         return self.roi(z, y, x)
  */
 
 static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_11RoIFunction_1get_roi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(CYTHON_UNUSED struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_self, CYTHON_UNUSED float __pyx_v_z, CYTHON_UNUSED float __pyx_v_y, CYTHON_UNUSED float __pyx_v_x, int __pyx_skip_dispatch) {
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x, int __pyx_skip_dispatch) {
   float __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -1566,14 +1748,14 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(CYTHO
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
   else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_roi); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_roi); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
     if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_11RoIFunction_1get_roi)) {
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_z); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_z); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_y); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_y); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_5 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_INCREF(__pyx_t_1);
       __pyx_t_6 = __pyx_t_1; __pyx_t_7 = NULL;
@@ -1588,7 +1770,7 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(CYTHO
           __pyx_t_8 = 1;
         }
       }
-      __pyx_t_9 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_9 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_9);
       if (__pyx_t_7) {
         __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
@@ -1602,11 +1784,11 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(CYTHO
       __pyx_t_3 = 0;
       __pyx_t_4 = 0;
       __pyx_t_5 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_10 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_10 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __pyx_r = __pyx_t_10;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -1615,22 +1797,22 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(CYTHO
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":38
+  /* "pyart/map/_gate_to_grid_map.pyx":44
  *     cpdef float get_roi(self, float z, float y, float x):
  *         """ Return the radius of influence for coordinates in meters. """
- *         return 0             # <<<<<<<<<<<<<<
- * 
+ *         return self.roi(z, y, x)             # <<<<<<<<<<<<<<
  * 
+ *     cdef float roi(self, float z, float y, float x) nogil:
  */
-  __pyx_r = 0.0;
+  __pyx_r = ((struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction *)__pyx_v_self->__pyx_vtab)->roi(__pyx_v_self, __pyx_v_z, __pyx_v_y, __pyx_v_x);
   goto __pyx_L0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":36
+  /* "pyart/map/_gate_to_grid_map.pyx":42
  *     """ A class for storing radius of interest calculations. """
  * 
  *     cpdef float get_roi(self, float z, float y, float x):             # <<<<<<<<<<<<<<
  *         """ Return the radius of influence for coordinates in meters. """
- *         return 0
+ *         return self.roi(z, y, x)
  */
 
   /* function exit code */
@@ -1684,16 +1866,16 @@ static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_11RoIFunction_1get_roi
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_roi") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_roi") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -1702,13 +1884,13 @@ static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_11RoIFunction_1get_roi
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
     }
-    __pyx_v_z = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_z == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_y = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_y == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_x = __pyx_PyFloat_AsFloat(values[2]); if (unlikely((__pyx_v_x == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_z = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_z == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_y = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_y == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_x = __pyx_PyFloat_AsFloat(values[2]); if (unlikely((__pyx_v_x == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pyart.map._gate_to_grid_map.RoIFunction.get_roi", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1730,7 +1912,7 @@ static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_roi", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(__pyx_v_self, __pyx_v_z, __pyx_v_y, __pyx_v_x, 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(__pyx_v_self, __pyx_v_z, __pyx_v_y, __pyx_v_x, 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -1748,6 +1930,40 @@ static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi(
 }
 
 /* "pyart/map/_gate_to_grid_map.pyx":46
+ *         return self.roi(z, y, x)
+ * 
+ *     cdef float roi(self, float z, float y, float x) nogil:             # <<<<<<<<<<<<<<
+ *         """ Return the radius of influence without holding the GIL. """
+ *         return 0
+ */
+
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_roi(CYTHON_UNUSED struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_self, CYTHON_UNUSED float __pyx_v_z, CYTHON_UNUSED float __pyx_v_y, CYTHON_UNUSED float __pyx_v_x) {
+  float __pyx_r;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":48
+ *     cdef float roi(self, float z, float y, float x) nogil:
+ *         """ Return the radius of influence without holding the GIL. """
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0.0;
+  goto __pyx_L0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":46
+ *         return self.roi(z, y, x)
+ * 
+ *     cdef float roi(self, float z, float y, float x) nogil:             # <<<<<<<<<<<<<<
+ *         """ Return the radius of influence without holding the GIL. """
+ *         return 0
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":56
  *     cdef float constant_roi
  * 
  *     def __init__(self, float constant_roi):             # <<<<<<<<<<<<<<
@@ -1787,18 +2003,18 @@ static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_1__init__(PyOb
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
     }
-    __pyx_v_constant_roi = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_constant_roi == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_constant_roi = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_constant_roi == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 56; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pyart.map._gate_to_grid_map.ConstantRoI.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1816,16 +2032,16 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11ConstantRoI___init__(struc
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":48
+  /* "pyart/map/_gate_to_grid_map.pyx":58
  *     def __init__(self, float constant_roi):
  *         """ intialize. """
  *         self.constant_roi = constant_roi             # <<<<<<<<<<<<<<
  * 
- *     cpdef float get_roi(self, float z, float y, float x):
+ *     cdef float roi(self, float z, float y, float x) nogil:
  */
   __pyx_v_self->constant_roi = __pyx_v_constant_roi;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":46
+  /* "pyart/map/_gate_to_grid_map.pyx":56
  *     cdef float constant_roi
  * 
  *     def __init__(self, float constant_roi):             # <<<<<<<<<<<<<<
@@ -1839,87 +2055,19 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11ConstantRoI___init__(struc
   return __pyx_r;
 }
 
-/* "pyart/map/_gate_to_grid_map.pyx":50
+/* "pyart/map/_gate_to_grid_map.pyx":60
  *         self.constant_roi = constant_roi
  * 
- *     cpdef float get_roi(self, float z, float y, float x):             # <<<<<<<<<<<<<<
+ *     cdef float roi(self, float z, float y, float x) nogil:             # <<<<<<<<<<<<<<
  *         """ Return contstant radius of influence. """
  *         return self.constant_roi
  */
 
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_3get_roi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_ConstantRoI *__pyx_v_self, CYTHON_UNUSED float __pyx_v_z, CYTHON_UNUSED float __pyx_v_y, CYTHON_UNUSED float __pyx_v_x, int __pyx_skip_dispatch) {
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_ConstantRoI *__pyx_v_self, CYTHON_UNUSED float __pyx_v_z, CYTHON_UNUSED float __pyx_v_y, CYTHON_UNUSED float __pyx_v_x) {
   float __pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  Py_ssize_t __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  float __pyx_t_10;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_roi", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_roi); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_3get_roi)) {
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_z); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_y); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_6 = __pyx_t_1; __pyx_t_7 = NULL;
-      __pyx_t_8 = 0;
-      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_7)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_7);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
-          __pyx_t_8 = 1;
-        }
-      }
-      __pyx_t_9 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_9);
-      if (__pyx_t_7) {
-        __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
-      }
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_8, __pyx_t_5);
-      __pyx_t_3 = 0;
-      __pyx_t_4 = 0;
-      __pyx_t_5 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_10 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_10;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":52
- *     cpdef float get_roi(self, float z, float y, float x):
+  /* "pyart/map/_gate_to_grid_map.pyx":62
+ *     cdef float roi(self, float z, float y, float x) nogil:
  *         """ Return contstant radius of influence. """
  *         return self.constant_roi             # <<<<<<<<<<<<<<
  * 
@@ -1928,129 +2076,20 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_get_roi(struc
   __pyx_r = __pyx_v_self->constant_roi;
   goto __pyx_L0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":50
+  /* "pyart/map/_gate_to_grid_map.pyx":60
  *         self.constant_roi = constant_roi
  * 
- *     cpdef float get_roi(self, float z, float y, float x):             # <<<<<<<<<<<<<<
+ *     cdef float roi(self, float z, float y, float x) nogil:             # <<<<<<<<<<<<<<
  *         """ Return contstant radius of influence. """
  *         return self.constant_roi
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_WriteUnraisable("pyart.map._gate_to_grid_map.ConstantRoI.get_roi", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 0);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* Python wrapper */
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_3get_roi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_2get_roi[] = " Return contstant radius of influence. ";
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_3get_roi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  float __pyx_v_z;
-  float __pyx_v_y;
-  float __pyx_v_x;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("get_roi (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_z,&__pyx_n_s_y,&__pyx_n_s_x,0};
-    PyObject* values[3] = {0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_z)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_roi") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-    }
-    __pyx_v_z = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_z == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_y = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_y == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_x = __pyx_PyFloat_AsFloat(values[2]); if (unlikely((__pyx_v_x == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.ConstantRoI.get_roi", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_2get_roi(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_ConstantRoI *)__pyx_v_self), __pyx_v_z, __pyx_v_y, __pyx_v_x);
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_2get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_ConstantRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_roi", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_get_roi(__pyx_v_self, __pyx_v_z, __pyx_v_y, __pyx_v_x, 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 50; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.ConstantRoI.get_roi", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "pyart/map/_gate_to_grid_map.pyx":62
+/* "pyart/map/_gate_to_grid_map.pyx":72
  *     cdef float[:, :] offsets
  * 
  *     def __init__(self, z_factor, xy_factor, min_radius, offsets):             # <<<<<<<<<<<<<<
@@ -2097,21 +2136,21 @@ static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_7DistRoI_1__init__(PyObject
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_xy_factor)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_min_radius)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_offsets)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -2128,7 +2167,7 @@ static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_7DistRoI_1__init__(PyObject
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pyart.map._gate_to_grid_map.DistRoI.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -2173,66 +2212,66 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":64
+  /* "pyart/map/_gate_to_grid_map.pyx":74
  *     def __init__(self, z_factor, xy_factor, min_radius, offsets):
  *         """ initalize. """
  *         self.z_factor = z_factor             # <<<<<<<<<<<<<<
  *         self.xy_factor = xy_factor
  *         self.min_radius = min_radius
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_z_factor); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_z_factor); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->z_factor = __pyx_t_1;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":65
+  /* "pyart/map/_gate_to_grid_map.pyx":75
  *         """ initalize. """
  *         self.z_factor = z_factor
  *         self.xy_factor = xy_factor             # <<<<<<<<<<<<<<
  *         self.min_radius = min_radius
  * 
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_xy_factor); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_xy_factor); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->xy_factor = __pyx_t_1;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":66
+  /* "pyart/map/_gate_to_grid_map.pyx":76
  *         self.z_factor = z_factor
  *         self.xy_factor = xy_factor
  *         self.min_radius = min_radius             # <<<<<<<<<<<<<<
  * 
  *         self.num_offsets = len(offsets)
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_min_radius); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 66; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_min_radius); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->min_radius = __pyx_t_1;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":68
+  /* "pyart/map/_gate_to_grid_map.pyx":78
  *         self.min_radius = min_radius
  * 
  *         self.num_offsets = len(offsets)             # <<<<<<<<<<<<<<
  *         # does this array need to be explicitly de-allocated when the
  *         # class instance is removed?
  */
-  __pyx_t_2 = PyObject_Length(__pyx_v_offsets); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 68; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyObject_Length(__pyx_v_offsets); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->num_offsets = __pyx_t_2;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":71
+  /* "pyart/map/_gate_to_grid_map.pyx":81
  *         # does this array need to be explicitly de-allocated when the
  *         # class instance is removed?
  *         self.offsets = cvarray(             # <<<<<<<<<<<<<<
  *             shape=(self.num_offsets, 3), itemsize=sizeof(float), format='f')
  * 
  */
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":72
+  /* "pyart/map/_gate_to_grid_map.pyx":82
  *         # class instance is removed?
  *         self.offsets = cvarray(
  *             shape=(self.num_offsets, 3), itemsize=sizeof(float), format='f')             # <<<<<<<<<<<<<<
  * 
  *         for i, (z_offset, y_offset, x_offset) in enumerate(offsets):
  */
-  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->num_offsets); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->num_offsets); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 82; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 82; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4);
@@ -2240,33 +2279,33 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
   __Pyx_GIVEREF(__pyx_int_3);
   PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_int_3);
   __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_shape, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_shape, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyInt_FromSize_t((sizeof(float))); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyInt_FromSize_t((sizeof(float))); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 82; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_itemsize, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_itemsize, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_format, __pyx_n_s_f) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_format, __pyx_n_s_f) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pyart/map/_gate_to_grid_map.pyx":71
+  /* "pyart/map/_gate_to_grid_map.pyx":81
  *         # does this array need to be explicitly de-allocated when the
  *         # class instance is removed?
  *         self.offsets = cvarray(             # <<<<<<<<<<<<<<
  *             shape=(self.num_offsets, 3), itemsize=sizeof(float), format='f')
  * 
  */
-  __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_array_type)), __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_array_type)), __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_float(__pyx_t_5);
-  if (unlikely(!__pyx_t_6.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__pyx_t_6.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __PYX_XDEC_MEMVIEW(&__pyx_v_self->offsets, 0);
   __pyx_v_self->offsets = __pyx_t_6;
   __pyx_t_6.memview = NULL;
   __pyx_t_6.data = NULL;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":74
+  /* "pyart/map/_gate_to_grid_map.pyx":84
  *             shape=(self.num_offsets, 3), itemsize=sizeof(float), format='f')
  * 
  *         for i, (z_offset, y_offset, x_offset) in enumerate(offsets):             # <<<<<<<<<<<<<<
@@ -2279,26 +2318,26 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
     __pyx_t_3 = __pyx_v_offsets; __Pyx_INCREF(__pyx_t_3); __pyx_t_2 = 0;
     __pyx_t_7 = NULL;
   } else {
-    __pyx_t_2 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_offsets); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_offsets); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_7 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_7 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   for (;;) {
     if (likely(!__pyx_t_7)) {
       if (likely(PyList_CheckExact(__pyx_t_3))) {
         if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_3)) break;
         #if CYTHON_COMPILING_IN_CPYTHON
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       } else {
         if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
         #if CYTHON_COMPILING_IN_CPYTHON
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_2); __Pyx_INCREF(__pyx_t_4); __pyx_t_2++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       }
@@ -2308,7 +2347,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(exc_type == PyExc_StopIteration || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         }
         break;
       }
@@ -2324,7 +2363,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
       if (unlikely(size != 3)) {
         if (size > 3) __Pyx_RaiseTooManyValuesError(3);
         else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       }
       #if CYTHON_COMPILING_IN_CPYTHON
       if (likely(PyTuple_CheckExact(sequence))) {
@@ -2340,17 +2379,17 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
       __Pyx_INCREF(__pyx_t_9);
       __Pyx_INCREF(__pyx_t_10);
       #else
-      __pyx_t_8 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_8 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_9 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_9 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_9);
-      __pyx_t_10 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_10 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_10);
       #endif
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
       Py_ssize_t index = -1;
-      __pyx_t_11 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_11 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_11);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __pyx_t_12 = Py_TYPE(__pyx_t_11)->tp_iternext;
@@ -2360,7 +2399,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
       __Pyx_GOTREF(__pyx_t_9);
       index = 2; __pyx_t_10 = __pyx_t_12(__pyx_t_11); if (unlikely(!__pyx_t_10)) goto __pyx_L5_unpacking_failed;
       __Pyx_GOTREF(__pyx_t_10);
-      if (__Pyx_IternextUnpackEndCheck(__pyx_t_12(__pyx_t_11), 3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_12(__pyx_t_11), 3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __pyx_t_12 = NULL;
       __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
       goto __pyx_L6_unpacking_done;
@@ -2368,7 +2407,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
       __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
       __pyx_t_12 = NULL;
       if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __pyx_L6_unpacking_done:;
     }
     __Pyx_XDECREF_SET(__pyx_v_z_offset, __pyx_t_8);
@@ -2379,22 +2418,22 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
     __pyx_t_10 = 0;
     __Pyx_INCREF(__pyx_t_5);
     __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_5);
-    __pyx_t_4 = PyNumber_Add(__pyx_t_5, __pyx_int_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyNumber_Add(__pyx_t_5, __pyx_int_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_5);
     __pyx_t_5 = __pyx_t_4;
     __pyx_t_4 = 0;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":75
+    /* "pyart/map/_gate_to_grid_map.pyx":85
  * 
  *         for i, (z_offset, y_offset, x_offset) in enumerate(offsets):
  *             self.offsets[i, 0] = z_offset             # <<<<<<<<<<<<<<
  *             self.offsets[i, 1] = y_offset
  *             self.offsets[i, 2] = x_offset
  */
-    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_z_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
-    __pyx_t_13 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_13 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_z_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
+    __pyx_t_13 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_13 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_14 = __pyx_t_13;
     __pyx_t_15 = 0;
     __pyx_t_16 = -1;
@@ -2408,20 +2447,20 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
     } else if (unlikely(__pyx_t_15 >= __pyx_v_self->offsets.shape[1])) __pyx_t_16 = 1;
     if (unlikely(__pyx_t_16 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_16);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 75; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     *((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_14 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_15 * __pyx_v_self->offsets.strides[1]) )) = __pyx_t_1;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":76
+    /* "pyart/map/_gate_to_grid_map.pyx":86
  *         for i, (z_offset, y_offset, x_offset) in enumerate(offsets):
  *             self.offsets[i, 0] = z_offset
  *             self.offsets[i, 1] = y_offset             # <<<<<<<<<<<<<<
  *             self.offsets[i, 2] = x_offset
  * 
  */
-    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_y_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
-    __pyx_t_13 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_13 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_y_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
+    __pyx_t_13 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_13 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_17 = __pyx_t_13;
     __pyx_t_18 = 1;
     __pyx_t_16 = -1;
@@ -2435,20 +2474,20 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
     } else if (unlikely(__pyx_t_18 >= __pyx_v_self->offsets.shape[1])) __pyx_t_16 = 1;
     if (unlikely(__pyx_t_16 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_16);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 76; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     *((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_17 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_18 * __pyx_v_self->offsets.strides[1]) )) = __pyx_t_1;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":77
+    /* "pyart/map/_gate_to_grid_map.pyx":87
  *             self.offsets[i, 0] = z_offset
  *             self.offsets[i, 1] = y_offset
  *             self.offsets[i, 2] = x_offset             # <<<<<<<<<<<<<<
  * 
  *     @cython.initializedcheck(False)
  */
-    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_x_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
-    __pyx_t_13 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_13 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_x_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
+    __pyx_t_13 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_13 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_19 = __pyx_t_13;
     __pyx_t_20 = 2;
     __pyx_t_16 = -1;
@@ -2462,11 +2501,11 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
     } else if (unlikely(__pyx_t_20 >= __pyx_v_self->offsets.shape[1])) __pyx_t_16 = 1;
     if (unlikely(__pyx_t_16 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_16);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     *((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_19 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_20 * __pyx_v_self->offsets.strides[1]) )) = __pyx_t_1;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":74
+    /* "pyart/map/_gate_to_grid_map.pyx":84
  *             shape=(self.num_offsets, 3), itemsize=sizeof(float), format='f')
  * 
  *         for i, (z_offset, y_offset, x_offset) in enumerate(offsets):             # <<<<<<<<<<<<<<
@@ -2477,7 +2516,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":62
+  /* "pyart/map/_gate_to_grid_map.pyx":72
  *     cdef float[:, :] offsets
  * 
  *     def __init__(self, z_factor, xy_factor, min_radius, offsets):             # <<<<<<<<<<<<<<
@@ -2508,16 +2547,15 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__(struct __p
   return __pyx_r;
 }
 
-/* "pyart/map/_gate_to_grid_map.pyx":83
+/* "pyart/map/_gate_to_grid_map.pyx":93
  *     @cython.boundscheck(False)
  *     @cython.wraparound(False)
- *     cpdef float get_roi(self, float z, float y, float x):             # <<<<<<<<<<<<<<
+ *     cdef float roi(self, float z, float y, float x) nogil:             # <<<<<<<<<<<<<<
  *         """ Return the radius of influence for coordinates in meters. """
  *         cdef float min_roi, roi, z_offset, y_offset, x_offset
  */
 
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_7DistRoI_3get_roi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static float __pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x, int __pyx_skip_dispatch) {
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x) {
   float __pyx_v_min_roi;
   float __pyx_v_roi;
   float __pyx_v_z_offset;
@@ -2525,83 +2563,17 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_get_roi(struct __p
   float __pyx_v_x_offset;
   int __pyx_v_i;
   float __pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  Py_ssize_t __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  float __pyx_t_10;
-  int __pyx_t_11;
-  int __pyx_t_12;
-  int __pyx_t_13;
-  int __pyx_t_14;
-  Py_ssize_t __pyx_t_15;
-  int __pyx_t_16;
-  Py_ssize_t __pyx_t_17;
-  int __pyx_t_18;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_roi", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_roi); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_7DistRoI_3get_roi)) {
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_z); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_y); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_6 = __pyx_t_1; __pyx_t_7 = NULL;
-      __pyx_t_8 = 0;
-      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_7)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_7);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
-          __pyx_t_8 = 1;
-        }
-      }
-      __pyx_t_9 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_9);
-      if (__pyx_t_7) {
-        __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
-      }
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_8, __pyx_t_5);
-      __pyx_t_3 = 0;
-      __pyx_t_4 = 0;
-      __pyx_t_5 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_10 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_10;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  int __pyx_t_7;
+  Py_ssize_t __pyx_t_8;
+  int __pyx_t_9;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":88
+  /* "pyart/map/_gate_to_grid_map.pyx":98
  *         cdef int i
  * 
  *         min_roi = 999999999.0             # <<<<<<<<<<<<<<
@@ -2610,51 +2582,51 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_get_roi(struct __p
  */
   __pyx_v_min_roi = 999999999.0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":89
+  /* "pyart/map/_gate_to_grid_map.pyx":99
  * 
  *         min_roi = 999999999.0
  *         for i in range(self.num_offsets):             # <<<<<<<<<<<<<<
  *             z_offset = self.offsets[i, 0]
  *             y_offset = self.offsets[i, 1]
  */
-  __pyx_t_11 = __pyx_v_self->num_offsets;
-  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
-    __pyx_v_i = __pyx_t_12;
+  __pyx_t_1 = __pyx_v_self->num_offsets;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_i = __pyx_t_2;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":90
+    /* "pyart/map/_gate_to_grid_map.pyx":100
  *         min_roi = 999999999.0
  *         for i in range(self.num_offsets):
  *             z_offset = self.offsets[i, 0]             # <<<<<<<<<<<<<<
  *             y_offset = self.offsets[i, 1]
  *             x_offset = self.offsets[i, 2]
  */
-    __pyx_t_13 = __pyx_v_i;
-    __pyx_t_8 = 0;
-    __pyx_v_z_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_13 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_8 * __pyx_v_self->offsets.strides[1]) )));
+    __pyx_t_3 = __pyx_v_i;
+    __pyx_t_4 = 0;
+    __pyx_v_z_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_3 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_4 * __pyx_v_self->offsets.strides[1]) )));
 
-    /* "pyart/map/_gate_to_grid_map.pyx":91
+    /* "pyart/map/_gate_to_grid_map.pyx":101
  *         for i in range(self.num_offsets):
  *             z_offset = self.offsets[i, 0]
  *             y_offset = self.offsets[i, 1]             # <<<<<<<<<<<<<<
  *             x_offset = self.offsets[i, 2]
  *             roi = (self.z_factor * (z - z_offset) + self.xy_factor *
  */
-    __pyx_t_14 = __pyx_v_i;
-    __pyx_t_15 = 1;
-    __pyx_v_y_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_14 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_15 * __pyx_v_self->offsets.strides[1]) )));
+    __pyx_t_5 = __pyx_v_i;
+    __pyx_t_6 = 1;
+    __pyx_v_y_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_5 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_6 * __pyx_v_self->offsets.strides[1]) )));
 
-    /* "pyart/map/_gate_to_grid_map.pyx":92
+    /* "pyart/map/_gate_to_grid_map.pyx":102
  *             z_offset = self.offsets[i, 0]
  *             y_offset = self.offsets[i, 1]
  *             x_offset = self.offsets[i, 2]             # <<<<<<<<<<<<<<
  *             roi = (self.z_factor * (z - z_offset) + self.xy_factor *
  *                    sqrt((x - x_offset)**2 + (y - y_offset)**2) +
  */
-    __pyx_t_16 = __pyx_v_i;
-    __pyx_t_17 = 2;
-    __pyx_v_x_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_16 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_17 * __pyx_v_self->offsets.strides[1]) )));
+    __pyx_t_7 = __pyx_v_i;
+    __pyx_t_8 = 2;
+    __pyx_v_x_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_7 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_8 * __pyx_v_self->offsets.strides[1]) )));
 
-    /* "pyart/map/_gate_to_grid_map.pyx":94
+    /* "pyart/map/_gate_to_grid_map.pyx":104
  *             x_offset = self.offsets[i, 2]
  *             roi = (self.z_factor * (z - z_offset) + self.xy_factor *
  *                    sqrt((x - x_offset)**2 + (y - y_offset)**2) +             # <<<<<<<<<<<<<<
@@ -2663,17 +2635,17 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_get_roi(struct __p
  */
     __pyx_v_roi = (((__pyx_v_self->z_factor * (__pyx_v_z - __pyx_v_z_offset)) + (__pyx_v_self->xy_factor * sqrt((powf((__pyx_v_x - __pyx_v_x_offset), 2.0) + powf((__pyx_v_y - __pyx_v_y_offset), 2.0))))) + __pyx_v_self->min_radius);
 
-    /* "pyart/map/_gate_to_grid_map.pyx":96
+    /* "pyart/map/_gate_to_grid_map.pyx":106
  *                    sqrt((x - x_offset)**2 + (y - y_offset)**2) +
  *                    self.min_radius)
  *             if roi < min_roi:             # <<<<<<<<<<<<<<
  *                 min_roi = roi
  *         return min_roi
  */
-    __pyx_t_18 = ((__pyx_v_roi < __pyx_v_min_roi) != 0);
-    if (__pyx_t_18) {
+    __pyx_t_9 = ((__pyx_v_roi < __pyx_v_min_roi) != 0);
+    if (__pyx_t_9) {
 
-      /* "pyart/map/_gate_to_grid_map.pyx":97
+      /* "pyart/map/_gate_to_grid_map.pyx":107
  *                    self.min_radius)
  *             if roi < min_roi:
  *                 min_roi = roi             # <<<<<<<<<<<<<<
@@ -2686,7 +2658,7 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_get_roi(struct __p
     __pyx_L5:;
   }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":98
+  /* "pyart/map/_gate_to_grid_map.pyx":108
  *             if roi < min_roi:
  *                 min_roi = roi
  *         return min_roi             # <<<<<<<<<<<<<<
@@ -2696,129 +2668,20 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_get_roi(struct __p
   __pyx_r = __pyx_v_min_roi;
   goto __pyx_L0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":83
+  /* "pyart/map/_gate_to_grid_map.pyx":93
  *     @cython.boundscheck(False)
  *     @cython.wraparound(False)
- *     cpdef float get_roi(self, float z, float y, float x):             # <<<<<<<<<<<<<<
+ *     cdef float roi(self, float z, float y, float x) nogil:             # <<<<<<<<<<<<<<
  *         """ Return the radius of influence for coordinates in meters. """
  *         cdef float min_roi, roi, z_offset, y_offset, x_offset
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_WriteUnraisable("pyart.map._gate_to_grid_map.DistRoI.get_roi", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 0);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* Python wrapper */
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_7DistRoI_3get_roi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_7DistRoI_2get_roi[] = " Return the radius of influence for coordinates in meters. ";
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_7DistRoI_3get_roi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  float __pyx_v_z;
-  float __pyx_v_y;
-  float __pyx_v_x;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("get_roi (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_z,&__pyx_n_s_y,&__pyx_n_s_x,0};
-    PyObject* values[3] = {0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_z)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_roi") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-    }
-    __pyx_v_z = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_z == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_y = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_y == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_x = __pyx_PyFloat_AsFloat(values[2]); if (unlikely((__pyx_v_x == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.DistRoI.get_roi", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI_2get_roi(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistRoI *)__pyx_v_self), __pyx_v_z, __pyx_v_y, __pyx_v_x);
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_7DistRoI_2get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_roi", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_get_roi(__pyx_v_self, __pyx_v_z, __pyx_v_y, __pyx_v_x, 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.DistRoI.get_roi", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "pyart/map/_gate_to_grid_map.pyx":110
+/* "pyart/map/_gate_to_grid_map.pyx":120
  *     cdef float[:, :] offsets
  * 
  *     def __init__(self, h_factor, nb, bsp, min_radius, offsets):             # <<<<<<<<<<<<<<
@@ -2867,26 +2730,26 @@ static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_1__init__(PyOb
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_nb)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bsp)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_min_radius)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_offsets)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
       goto __pyx_L5_argtuple_error;
@@ -2905,7 +2768,7 @@ static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_1__init__(PyOb
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 110; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pyart.map._gate_to_grid_map.DistBeamRoI.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -2951,78 +2814,78 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":112
+  /* "pyart/map/_gate_to_grid_map.pyx":122
  *     def __init__(self, h_factor, nb, bsp, min_radius, offsets):
  *         """ initalize. """
  *         self.h_factor = h_factor             # <<<<<<<<<<<<<<
  *         self.min_radius = min_radius
  *         self.beam_factor = tan(nb * bsp * PI / 180.)
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_h_factor); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_h_factor); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->h_factor = __pyx_t_1;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":113
+  /* "pyart/map/_gate_to_grid_map.pyx":123
  *         """ initalize. """
  *         self.h_factor = h_factor
  *         self.min_radius = min_radius             # <<<<<<<<<<<<<<
  *         self.beam_factor = tan(nb * bsp * PI / 180.)
  * 
  */
-  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_min_radius); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_min_radius); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->min_radius = __pyx_t_1;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":114
+  /* "pyart/map/_gate_to_grid_map.pyx":124
  *         self.h_factor = h_factor
  *         self.min_radius = min_radius
  *         self.beam_factor = tan(nb * bsp * PI / 180.)             # <<<<<<<<<<<<<<
  * 
  *         self.num_offsets = len(offsets)
  */
-  __pyx_t_2 = PyNumber_Multiply(__pyx_v_nb, __pyx_v_bsp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyNumber_Multiply(__pyx_v_nb, __pyx_v_bsp); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_5pyart_3map_17_gate_to_grid_map_PI); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyFloat_FromDouble(__pyx_v_5pyart_3map_17_gate_to_grid_map_PI); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = PyNumber_Multiply(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = PyNumber_Multiply(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyNumber_Divide(__pyx_t_4, __pyx_float_180_); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyNumber_Divide(__pyx_t_4, __pyx_float_180_); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_v_self->beam_factor = tan(__pyx_t_5);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":116
+  /* "pyart/map/_gate_to_grid_map.pyx":126
  *         self.beam_factor = tan(nb * bsp * PI / 180.)
  * 
  *         self.num_offsets = len(offsets)             # <<<<<<<<<<<<<<
  *         # does this array need to be explicitly de-allocated when the
  *         # class instance is removed?
  */
-  __pyx_t_6 = PyObject_Length(__pyx_v_offsets); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = PyObject_Length(__pyx_v_offsets); if (unlikely(__pyx_t_6 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_self->num_offsets = __pyx_t_6;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":119
+  /* "pyart/map/_gate_to_grid_map.pyx":129
  *         # does this array need to be explicitly de-allocated when the
  *         # class instance is removed?
  *         self.offsets = cvarray(             # <<<<<<<<<<<<<<
  *             shape=(self.num_offsets, 3), itemsize=sizeof(float), format='f')
  * 
  */
-  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = PyDict_New(); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_3);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":120
+  /* "pyart/map/_gate_to_grid_map.pyx":130
  *         # class instance is removed?
  *         self.offsets = cvarray(
  *             shape=(self.num_offsets, 3), itemsize=sizeof(float), format='f')             # <<<<<<<<<<<<<<
  * 
  *         for i, (z_offset, y_offset, x_offset) in enumerate(offsets):
  */
-  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->num_offsets); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_self->num_offsets); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_4);
@@ -3030,33 +2893,33 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
   __Pyx_GIVEREF(__pyx_int_3);
   PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_int_3);
   __pyx_t_4 = 0;
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_shape, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_shape, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_FromSize_t((sizeof(float))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_FromSize_t((sizeof(float))); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_itemsize, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_itemsize, __pyx_t_2) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_format, __pyx_n_s_f) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_t_3, __pyx_n_s_format, __pyx_n_s_f) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pyart/map/_gate_to_grid_map.pyx":119
+  /* "pyart/map/_gate_to_grid_map.pyx":129
  *         # does this array need to be explicitly de-allocated when the
  *         # class instance is removed?
  *         self.offsets = cvarray(             # <<<<<<<<<<<<<<
  *             shape=(self.num_offsets, 3), itemsize=sizeof(float), format='f')
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_array_type)), __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_array_type)), __pyx_empty_tuple, __pyx_t_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_dsds_float(__pyx_t_2);
-  if (unlikely(!__pyx_t_7.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 119; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__pyx_t_7.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __PYX_XDEC_MEMVIEW(&__pyx_v_self->offsets, 0);
   __pyx_v_self->offsets = __pyx_t_7;
   __pyx_t_7.memview = NULL;
   __pyx_t_7.data = NULL;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":122
+  /* "pyart/map/_gate_to_grid_map.pyx":132
  *             shape=(self.num_offsets, 3), itemsize=sizeof(float), format='f')
  * 
  *         for i, (z_offset, y_offset, x_offset) in enumerate(offsets):             # <<<<<<<<<<<<<<
@@ -3069,26 +2932,26 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
     __pyx_t_3 = __pyx_v_offsets; __Pyx_INCREF(__pyx_t_3); __pyx_t_6 = 0;
     __pyx_t_8 = NULL;
   } else {
-    __pyx_t_6 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_offsets); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_offsets); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_8 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   for (;;) {
     if (likely(!__pyx_t_8)) {
       if (likely(PyList_CheckExact(__pyx_t_3))) {
         if (__pyx_t_6 >= PyList_GET_SIZE(__pyx_t_3)) break;
         #if CYTHON_COMPILING_IN_CPYTHON
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       } else {
         if (__pyx_t_6 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
         #if CYTHON_COMPILING_IN_CPYTHON
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_6); __Pyx_INCREF(__pyx_t_4); __pyx_t_6++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_3, __pyx_t_6); __pyx_t_6++; if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       }
@@ -3098,7 +2961,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(exc_type == PyExc_StopIteration || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+          else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
         }
         break;
       }
@@ -3114,7 +2977,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
       if (unlikely(size != 3)) {
         if (size > 3) __Pyx_RaiseTooManyValuesError(3);
         else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       }
       #if CYTHON_COMPILING_IN_CPYTHON
       if (likely(PyTuple_CheckExact(sequence))) {
@@ -3130,17 +2993,17 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
       __Pyx_INCREF(__pyx_t_10);
       __Pyx_INCREF(__pyx_t_11);
       #else
-      __pyx_t_9 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_9 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_9);
-      __pyx_t_10 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_10 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_10);
-      __pyx_t_11 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_11 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_11);
       #endif
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
       Py_ssize_t index = -1;
-      __pyx_t_12 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_12 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __Pyx_GOTREF(__pyx_t_12);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __pyx_t_13 = Py_TYPE(__pyx_t_12)->tp_iternext;
@@ -3150,7 +3013,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
       __Pyx_GOTREF(__pyx_t_10);
       index = 2; __pyx_t_11 = __pyx_t_13(__pyx_t_12); if (unlikely(!__pyx_t_11)) goto __pyx_L5_unpacking_failed;
       __Pyx_GOTREF(__pyx_t_11);
-      if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_12), 3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_12), 3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __pyx_t_13 = NULL;
       __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
       goto __pyx_L6_unpacking_done;
@@ -3158,7 +3021,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
       __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
       __pyx_t_13 = NULL;
       if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
       __pyx_L6_unpacking_done:;
     }
     __Pyx_XDECREF_SET(__pyx_v_z_offset, __pyx_t_9);
@@ -3169,22 +3032,22 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
     __pyx_t_11 = 0;
     __Pyx_INCREF(__pyx_t_2);
     __Pyx_XDECREF_SET(__pyx_v_i, __pyx_t_2);
-    __pyx_t_4 = PyNumber_Add(__pyx_t_2, __pyx_int_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 122; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_4 = PyNumber_Add(__pyx_t_2, __pyx_int_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_2);
     __pyx_t_2 = __pyx_t_4;
     __pyx_t_4 = 0;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":123
+    /* "pyart/map/_gate_to_grid_map.pyx":133
  * 
  *         for i, (z_offset, y_offset, x_offset) in enumerate(offsets):
  *             self.offsets[i, 0] = z_offset             # <<<<<<<<<<<<<<
  *             self.offsets[i, 1] = y_offset
  *             self.offsets[i, 2] = x_offset
  */
-    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_z_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
-    __pyx_t_14 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_14 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_z_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
+    __pyx_t_14 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_14 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_15 = __pyx_t_14;
     __pyx_t_16 = 0;
     __pyx_t_17 = -1;
@@ -3198,20 +3061,20 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
     } else if (unlikely(__pyx_t_16 >= __pyx_v_self->offsets.shape[1])) __pyx_t_17 = 1;
     if (unlikely(__pyx_t_17 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_17);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     *((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_15 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_16 * __pyx_v_self->offsets.strides[1]) )) = __pyx_t_1;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":124
+    /* "pyart/map/_gate_to_grid_map.pyx":134
  *         for i, (z_offset, y_offset, x_offset) in enumerate(offsets):
  *             self.offsets[i, 0] = z_offset
  *             self.offsets[i, 1] = y_offset             # <<<<<<<<<<<<<<
  *             self.offsets[i, 2] = x_offset
  * 
  */
-    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_y_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
-    __pyx_t_14 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_14 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_y_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 134; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 134; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
+    __pyx_t_14 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_14 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 134; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_18 = __pyx_t_14;
     __pyx_t_19 = 1;
     __pyx_t_17 = -1;
@@ -3225,20 +3088,20 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
     } else if (unlikely(__pyx_t_19 >= __pyx_v_self->offsets.shape[1])) __pyx_t_17 = 1;
     if (unlikely(__pyx_t_17 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_17);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 134; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     *((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_18 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_19 * __pyx_v_self->offsets.strides[1]) )) = __pyx_t_1;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":125
+    /* "pyart/map/_gate_to_grid_map.pyx":135
  *             self.offsets[i, 0] = z_offset
  *             self.offsets[i, 1] = y_offset
  *             self.offsets[i, 2] = x_offset             # <<<<<<<<<<<<<<
  * 
  *     @cython.initializedcheck(False)
  */
-    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_x_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
-    __pyx_t_14 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_14 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = __pyx_PyFloat_AsFloat(__pyx_v_x_offset); if (unlikely((__pyx_t_1 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(!__pyx_v_self->offsets.memview)) {PyErr_SetString(PyExc_AttributeError,"Memoryview is not initialized");{__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}}
+    __pyx_t_14 = __Pyx_PyIndex_AsSsize_t(__pyx_v_i); if (unlikely((__pyx_t_14 == (Py_ssize_t)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __pyx_t_20 = __pyx_t_14;
     __pyx_t_21 = 2;
     __pyx_t_17 = -1;
@@ -3252,11 +3115,11 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
     } else if (unlikely(__pyx_t_21 >= __pyx_v_self->offsets.shape[1])) __pyx_t_17 = 1;
     if (unlikely(__pyx_t_17 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_17);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     *((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_20 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_21 * __pyx_v_self->offsets.strides[1]) )) = __pyx_t_1;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":122
+    /* "pyart/map/_gate_to_grid_map.pyx":132
  *             shape=(self.num_offsets, 3), itemsize=sizeof(float), format='f')
  * 
  *         for i, (z_offset, y_offset, x_offset) in enumerate(offsets):             # <<<<<<<<<<<<<<
@@ -3267,7 +3130,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":110
+  /* "pyart/map/_gate_to_grid_map.pyx":120
  *     cdef float[:, :] offsets
  * 
  *     def __init__(self, h_factor, nb, bsp, min_radius, offsets):             # <<<<<<<<<<<<<<
@@ -3298,16 +3161,15 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__(struc
   return __pyx_r;
 }
 
-/* "pyart/map/_gate_to_grid_map.pyx":131
+/* "pyart/map/_gate_to_grid_map.pyx":141
  *     @cython.boundscheck(False)
  *     @cython.wraparound(False)
- *     cpdef float get_roi(self, float z, float y, float x):             # <<<<<<<<<<<<<<
+ *     cdef float roi(self, float z, float y, float x) nogil:             # <<<<<<<<<<<<<<
  *         """ Return the radius of influence for coordinates in meters. """
  * 
  */
 
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_3get_roi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistBeamRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x, int __pyx_skip_dispatch) {
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistBeamRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x) {
   float __pyx_v_min_roi;
   float __pyx_v_roi;
   float __pyx_v_z_offset;
@@ -3315,83 +3177,17 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_get_roi(struc
   float __pyx_v_x_offset;
   int __pyx_v_i;
   float __pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  int __pyx_t_7;
   Py_ssize_t __pyx_t_8;
-  PyObject *__pyx_t_9 = NULL;
-  float __pyx_t_10;
-  int __pyx_t_11;
-  int __pyx_t_12;
-  int __pyx_t_13;
-  int __pyx_t_14;
-  Py_ssize_t __pyx_t_15;
-  int __pyx_t_16;
-  Py_ssize_t __pyx_t_17;
-  int __pyx_t_18;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_roi", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_roi); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_3get_roi)) {
-      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_z); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyFloat_FromDouble(__pyx_v_y); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = PyFloat_FromDouble(__pyx_v_x); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_6 = __pyx_t_1; __pyx_t_7 = NULL;
-      __pyx_t_8 = 0;
-      if (CYTHON_COMPILING_IN_CPYTHON && unlikely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_7)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_7);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
-          __pyx_t_8 = 1;
-        }
-      }
-      __pyx_t_9 = PyTuple_New(3+__pyx_t_8); if (unlikely(!__pyx_t_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_9);
-      if (__pyx_t_7) {
-        __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
-      }
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, __pyx_t_3);
-      __Pyx_GIVEREF(__pyx_t_4);
-      PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_5);
-      PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_8, __pyx_t_5);
-      __pyx_t_3 = 0;
-      __pyx_t_4 = 0;
-      __pyx_t_5 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_10 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_10;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
+  int __pyx_t_9;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":137
+  /* "pyart/map/_gate_to_grid_map.pyx":147
  *         cdef int i
  * 
  *         min_roi = 999999999.0             # <<<<<<<<<<<<<<
@@ -3400,51 +3196,51 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_get_roi(struc
  */
   __pyx_v_min_roi = 999999999.0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":138
+  /* "pyart/map/_gate_to_grid_map.pyx":148
  * 
  *         min_roi = 999999999.0
  *         for i in range(self.num_offsets):             # <<<<<<<<<<<<<<
  *             z_offset = self.offsets[i, 0]
  *             y_offset = self.offsets[i, 1]
  */
-  __pyx_t_11 = __pyx_v_self->num_offsets;
-  for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
-    __pyx_v_i = __pyx_t_12;
+  __pyx_t_1 = __pyx_v_self->num_offsets;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_i = __pyx_t_2;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":139
+    /* "pyart/map/_gate_to_grid_map.pyx":149
  *         min_roi = 999999999.0
  *         for i in range(self.num_offsets):
  *             z_offset = self.offsets[i, 0]             # <<<<<<<<<<<<<<
  *             y_offset = self.offsets[i, 1]
  *             x_offset = self.offsets[i, 2]
  */
-    __pyx_t_13 = __pyx_v_i;
-    __pyx_t_8 = 0;
-    __pyx_v_z_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_13 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_8 * __pyx_v_self->offsets.strides[1]) )));
+    __pyx_t_3 = __pyx_v_i;
+    __pyx_t_4 = 0;
+    __pyx_v_z_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_3 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_4 * __pyx_v_self->offsets.strides[1]) )));
 
-    /* "pyart/map/_gate_to_grid_map.pyx":140
+    /* "pyart/map/_gate_to_grid_map.pyx":150
  *         for i in range(self.num_offsets):
  *             z_offset = self.offsets[i, 0]
  *             y_offset = self.offsets[i, 1]             # <<<<<<<<<<<<<<
  *             x_offset = self.offsets[i, 2]
  *             roi = (self.h_factor * ((z - z_offset) / 20.0) +
  */
-    __pyx_t_14 = __pyx_v_i;
-    __pyx_t_15 = 1;
-    __pyx_v_y_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_14 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_15 * __pyx_v_self->offsets.strides[1]) )));
+    __pyx_t_5 = __pyx_v_i;
+    __pyx_t_6 = 1;
+    __pyx_v_y_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_5 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_6 * __pyx_v_self->offsets.strides[1]) )));
 
-    /* "pyart/map/_gate_to_grid_map.pyx":141
+    /* "pyart/map/_gate_to_grid_map.pyx":151
  *             z_offset = self.offsets[i, 0]
  *             y_offset = self.offsets[i, 1]
  *             x_offset = self.offsets[i, 2]             # <<<<<<<<<<<<<<
  *             roi = (self.h_factor * ((z - z_offset) / 20.0) +
  *                    sqrt((y - y_offset)**2 + (x - x_offset)**2) *
  */
-    __pyx_t_16 = __pyx_v_i;
-    __pyx_t_17 = 2;
-    __pyx_v_x_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_16 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_17 * __pyx_v_self->offsets.strides[1]) )));
+    __pyx_t_7 = __pyx_v_i;
+    __pyx_t_8 = 2;
+    __pyx_v_x_offset = (*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->offsets.data + __pyx_t_7 * __pyx_v_self->offsets.strides[0]) ) + __pyx_t_8 * __pyx_v_self->offsets.strides[1]) )));
 
-    /* "pyart/map/_gate_to_grid_map.pyx":144
+    /* "pyart/map/_gate_to_grid_map.pyx":154
  *             roi = (self.h_factor * ((z - z_offset) / 20.0) +
  *                    sqrt((y - y_offset)**2 + (x - x_offset)**2) *
  *                    self.beam_factor + self.min_radius)             # <<<<<<<<<<<<<<
@@ -3453,17 +3249,17 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_get_roi(struc
  */
     __pyx_v_roi = (((__pyx_v_self->h_factor * ((__pyx_v_z - __pyx_v_z_offset) / 20.0)) + (sqrt((powf((__pyx_v_y - __pyx_v_y_offset), 2.0) + powf((__pyx_v_x - __pyx_v_x_offset), 2.0))) * __pyx_v_self->beam_factor)) + __pyx_v_self->min_radius);
 
-    /* "pyart/map/_gate_to_grid_map.pyx":145
+    /* "pyart/map/_gate_to_grid_map.pyx":155
  *                    sqrt((y - y_offset)**2 + (x - x_offset)**2) *
  *                    self.beam_factor + self.min_radius)
  *             if roi < min_roi:             # <<<<<<<<<<<<<<
  *                 min_roi = roi
  *         return min_roi
  */
-    __pyx_t_18 = ((__pyx_v_roi < __pyx_v_min_roi) != 0);
-    if (__pyx_t_18) {
+    __pyx_t_9 = ((__pyx_v_roi < __pyx_v_min_roi) != 0);
+    if (__pyx_t_9) {
 
-      /* "pyart/map/_gate_to_grid_map.pyx":146
+      /* "pyart/map/_gate_to_grid_map.pyx":156
  *                    self.beam_factor + self.min_radius)
  *             if roi < min_roi:
  *                 min_roi = roi             # <<<<<<<<<<<<<<
@@ -3476,7 +3272,7 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_get_roi(struc
     __pyx_L5:;
   }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":147
+  /* "pyart/map/_gate_to_grid_map.pyx":157
  *             if roi < min_roi:
  *                 min_roi = roi
  *         return min_roi             # <<<<<<<<<<<<<<
@@ -3486,148 +3282,37 @@ static float __pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_get_roi(struc
   __pyx_r = __pyx_v_min_roi;
   goto __pyx_L0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":131
+  /* "pyart/map/_gate_to_grid_map.pyx":141
  *     @cython.boundscheck(False)
  *     @cython.wraparound(False)
- *     cpdef float get_roi(self, float z, float y, float x):             # <<<<<<<<<<<<<<
+ *     cdef float roi(self, float z, float y, float x) nogil:             # <<<<<<<<<<<<<<
  *         """ Return the radius of influence for coordinates in meters. """
  * 
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_9);
-  __Pyx_WriteUnraisable("pyart.map._gate_to_grid_map.DistBeamRoI.get_roi", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 0);
-  __pyx_r = 0;
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* Python wrapper */
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_3get_roi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_2get_roi[] = " Return the radius of influence for coordinates in meters. ";
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_3get_roi(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  float __pyx_v_z;
-  float __pyx_v_y;
-  float __pyx_v_x;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("get_roi (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_z,&__pyx_n_s_y,&__pyx_n_s_x,0};
-    PyObject* values[3] = {0,0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_z)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_y)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_x)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "get_roi") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-    }
-    __pyx_v_z = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_z == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_y = __pyx_PyFloat_AsFloat(values[1]); if (unlikely((__pyx_v_y == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_x = __pyx_PyFloat_AsFloat(values[2]); if (unlikely((__pyx_v_x == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("get_roi", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.DistBeamRoI.get_roi", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_2get_roi(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistBeamRoI *)__pyx_v_self), __pyx_v_z, __pyx_v_y, __pyx_v_x);
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_2get_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_DistBeamRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("get_roi", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_get_roi(__pyx_v_self, __pyx_v_z, __pyx_v_y, __pyx_v_x, 1)); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.DistBeamRoI.get_roi", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "pyart/map/_gate_to_grid_map.pyx":175
- *     cdef float[:, :, :, ::1] grid_wsum
+/* "pyart/map/_gate_to_grid_map.pyx":174
+ *     cdef int nz, ny, nx
  * 
- *     def __init__(self, tuple grid_shape, tuple grid_starts, tuple grid_steps,             # <<<<<<<<<<<<<<
- *                  float[:, :, :, ::1] grid_sum, float[:, :, :, ::1] grid_wsum):
- *         """ initialize. """
+ *     def __init__(self, float[:, :, ::1] roi_values, tuple lattice_starts,             # <<<<<<<<<<<<<<
+ *                  tuple lattice_steps):
+ *         """ initalize. """
  */
 
 /* Python wrapper */
-static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__[] = " initialize. ";
+static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_10LatticeRoI_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_10LatticeRoI___init__[] = " initalize. ";
 #if CYTHON_COMPILING_IN_CPYTHON
-struct wrapperbase __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__;
+struct wrapperbase __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_10LatticeRoI___init__;
 #endif
-static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_grid_shape = 0;
-  PyObject *__pyx_v_grid_starts = 0;
-  PyObject *__pyx_v_grid_steps = 0;
-  __Pyx_memviewslice __pyx_v_grid_sum = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_grid_wsum = { 0, 0, { 0 }, { 0 }, { 0 } };
+static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_10LatticeRoI_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_roi_values = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_v_lattice_starts = 0;
+  PyObject *__pyx_v_lattice_steps = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -3635,14 +3320,12 @@ static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_1__init__
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_grid_shape,&__pyx_n_s_grid_starts,&__pyx_n_s_grid_steps,&__pyx_n_s_grid_sum,&__pyx_n_s_grid_wsum,0};
-    PyObject* values[5] = {0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_roi_values,&__pyx_n_s_lattice_starts,&__pyx_n_s_lattice_steps,0};
+    PyObject* values[3] = {0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -3652,59 +3335,44 @@ static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_1__init__
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_grid_shape)) != 0)) kw_args--;
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_roi_values)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_grid_starts)) != 0)) kw_args--;
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_lattice_starts)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_grid_steps)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  3:
-        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_grid_sum)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  4:
-        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_grid_wsum)) != 0)) kw_args--;
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_lattice_steps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
     }
-    __pyx_v_grid_shape = ((PyObject*)values[0]);
-    __pyx_v_grid_starts = ((PyObject*)values[1]);
-    __pyx_v_grid_steps = ((PyObject*)values[2]);
-    __pyx_v_grid_sum = __Pyx_PyObject_to_MemoryviewSlice_d_d_d_dc_float(values[3]); if (unlikely(!__pyx_v_grid_sum.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_grid_wsum = __Pyx_PyObject_to_MemoryviewSlice_d_d_d_dc_float(values[4]); if (unlikely(!__pyx_v_grid_wsum.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_roi_values = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(values[0]); if (unlikely(!__pyx_v_roi_values.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_lattice_starts = ((PyObject*)values[1]);
+    __pyx_v_lattice_steps = ((PyObject*)values[2]);
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.LatticeRoI.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_grid_shape), (&PyTuple_Type), 1, "grid_shape", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_grid_starts), (&PyTuple_Type), 1, "grid_starts", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_grid_steps), (&PyTuple_Type), 1, "grid_steps", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *)__pyx_v_self), __pyx_v_grid_shape, __pyx_v_grid_starts, __pyx_v_grid_steps, __pyx_v_grid_sum, __pyx_v_grid_wsum);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_lattice_starts), (&PyTuple_Type), 1, "lattice_starts", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_lattice_steps), (&PyTuple_Type), 1, "lattice_steps", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_10LatticeRoI___init__(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI *)__pyx_v_self), __pyx_v_roi_values, __pyx_v_lattice_starts, __pyx_v_lattice_steps);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3715,37 +3383,67 @@ static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_1__init__
   return __pyx_r;
 }
 
-static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, PyObject *__pyx_v_grid_shape, PyObject *__pyx_v_grid_starts, PyObject *__pyx_v_grid_steps, __Pyx_memviewslice __pyx_v_grid_sum, __Pyx_memviewslice __pyx_v_grid_wsum) {
-  PyObject *__pyx_v_nz = NULL;
-  PyObject *__pyx_v_ny = NULL;
-  PyObject *__pyx_v_nx = NULL;
-  PyObject *__pyx_v_z_start = NULL;
-  PyObject *__pyx_v_y_start = NULL;
-  PyObject *__pyx_v_x_start = NULL;
-  PyObject *__pyx_v_z_step = NULL;
-  PyObject *__pyx_v_y_step = NULL;
-  PyObject *__pyx_v_x_step = NULL;
+static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_10LatticeRoI___init__(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI *__pyx_v_self, __Pyx_memviewslice __pyx_v_roi_values, PyObject *__pyx_v_lattice_starts, PyObject *__pyx_v_lattice_steps) {
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   float __pyx_t_4;
-  int __pyx_t_5;
+  float __pyx_t_5;
+  float __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 0);
 
+  /* "pyart/map/_gate_to_grid_map.pyx":177
+ *                  tuple lattice_steps):
+ *         """ initalize. """
+ *         self.roi_values = roi_values             # <<<<<<<<<<<<<<
+ *         self.nz = roi_values.shape[0]
+ *         self.ny = roi_values.shape[1]
+ */
+  __PYX_XDEC_MEMVIEW(&__pyx_v_self->roi_values, 0);
+  __PYX_INC_MEMVIEW(&__pyx_v_roi_values, 0);
+  __pyx_v_self->roi_values = __pyx_v_roi_values;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":178
+ *         """ initalize. """
+ *         self.roi_values = roi_values
+ *         self.nz = roi_values.shape[0]             # <<<<<<<<<<<<<<
+ *         self.ny = roi_values.shape[1]
+ *         self.nx = roi_values.shape[2]
+ */
+  __pyx_v_self->nz = (__pyx_v_roi_values.shape[0]);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":179
+ *         self.roi_values = roi_values
+ *         self.nz = roi_values.shape[0]
+ *         self.ny = roi_values.shape[1]             # <<<<<<<<<<<<<<
+ *         self.nx = roi_values.shape[2]
+ *         self.z_start, self.y_start, self.x_start = lattice_starts
+ */
+  __pyx_v_self->ny = (__pyx_v_roi_values.shape[1]);
+
   /* "pyart/map/_gate_to_grid_map.pyx":180
+ *         self.nz = roi_values.shape[0]
+ *         self.ny = roi_values.shape[1]
+ *         self.nx = roi_values.shape[2]             # <<<<<<<<<<<<<<
+ *         self.z_start, self.y_start, self.x_start = lattice_starts
+ *         self.z_step, self.y_step, self.x_step = lattice_steps
+ */
+  __pyx_v_self->nx = (__pyx_v_roi_values.shape[2]);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":181
+ *         self.ny = roi_values.shape[1]
+ *         self.nx = roi_values.shape[2]
+ *         self.z_start, self.y_start, self.x_start = lattice_starts             # <<<<<<<<<<<<<<
+ *         self.z_step, self.y_step, self.x_step = lattice_steps
  * 
- *         # unpack tuples
- *         nz, ny, nx = grid_shape             # <<<<<<<<<<<<<<
- *         z_start, y_start, x_start = grid_starts
- *         z_step, y_step, x_step = grid_steps
  */
-  if (likely(__pyx_v_grid_shape != Py_None)) {
-    PyObject* sequence = __pyx_v_grid_shape;
+  if (likely(__pyx_v_lattice_starts != Py_None)) {
+    PyObject* sequence = __pyx_v_lattice_starts;
     #if CYTHON_COMPILING_IN_CPYTHON
     Py_ssize_t size = Py_SIZE(sequence);
     #else
@@ -3754,7 +3452,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__(
     if (unlikely(size != 3)) {
       if (size > 3) __Pyx_RaiseTooManyValuesError(3);
       else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     #if CYTHON_COMPILING_IN_CPYTHON
     __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
@@ -3764,32 +3462,35 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__(
     __Pyx_INCREF(__pyx_t_2);
     __Pyx_INCREF(__pyx_t_3);
     #else
-    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
     #endif
   } else {
-    __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
-  __pyx_v_nz = __pyx_t_1;
-  __pyx_t_1 = 0;
-  __pyx_v_ny = __pyx_t_2;
-  __pyx_t_2 = 0;
-  __pyx_v_nx = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_t_1); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_3); if (unlikely((__pyx_t_6 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_self->z_start = __pyx_t_4;
+  __pyx_v_self->y_start = __pyx_t_5;
+  __pyx_v_self->x_start = __pyx_t_6;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":181
- *         # unpack tuples
- *         nz, ny, nx = grid_shape
- *         z_start, y_start, x_start = grid_starts             # <<<<<<<<<<<<<<
- *         z_step, y_step, x_step = grid_steps
+  /* "pyart/map/_gate_to_grid_map.pyx":182
+ *         self.nx = roi_values.shape[2]
+ *         self.z_start, self.y_start, self.x_start = lattice_starts
+ *         self.z_step, self.y_step, self.x_step = lattice_steps             # <<<<<<<<<<<<<<
  * 
+ *     @cython.initializedcheck(False)
  */
-  if (likely(__pyx_v_grid_starts != Py_None)) {
-    PyObject* sequence = __pyx_v_grid_starts;
+  if (likely(__pyx_v_lattice_steps != Py_None)) {
+    PyObject* sequence = __pyx_v_lattice_steps;
     #if CYTHON_COMPILING_IN_CPYTHON
     Py_ssize_t size = Py_SIZE(sequence);
     #else
@@ -3798,7 +3499,7 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__(
     if (unlikely(size != 3)) {
       if (size > 3) __Pyx_RaiseTooManyValuesError(3);
       else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     #if CYTHON_COMPILING_IN_CPYTHON
     __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
@@ -3808,256 +3509,346 @@ static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__(
     __Pyx_INCREF(__pyx_t_2);
     __Pyx_INCREF(__pyx_t_1);
     #else
-    __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
-    #endif
-  } else {
-    __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_v_z_start = __pyx_t_3;
-  __pyx_t_3 = 0;
-  __pyx_v_y_start = __pyx_t_2;
-  __pyx_t_2 = 0;
-  __pyx_v_x_start = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "pyart/map/_gate_to_grid_map.pyx":182
- *         nz, ny, nx = grid_shape
- *         z_start, y_start, x_start = grid_starts
- *         z_step, y_step, x_step = grid_steps             # <<<<<<<<<<<<<<
- * 
- *         # set attributes
- */
-  if (likely(__pyx_v_grid_steps != Py_None)) {
-    PyObject* sequence = __pyx_v_grid_steps;
-    #if CYTHON_COMPILING_IN_CPYTHON
-    Py_ssize_t size = Py_SIZE(sequence);
-    #else
-    Py_ssize_t size = PySequence_Size(sequence);
-    #endif
-    if (unlikely(size != 3)) {
-      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
-      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    #if CYTHON_COMPILING_IN_CPYTHON
-    __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
-    __pyx_t_2 = PyTuple_GET_ITEM(sequence, 1); 
-    __pyx_t_3 = PyTuple_GET_ITEM(sequence, 2); 
-    __Pyx_INCREF(__pyx_t_1);
-    __Pyx_INCREF(__pyx_t_2);
-    __Pyx_INCREF(__pyx_t_3);
-    #else
-    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_1);
     __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
     #endif
   } else {
     __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
-  __pyx_v_z_step = __pyx_t_1;
-  __pyx_t_1 = 0;
-  __pyx_v_y_step = __pyx_t_2;
-  __pyx_t_2 = 0;
-  __pyx_v_x_step = __pyx_t_3;
-  __pyx_t_3 = 0;
-
-  /* "pyart/map/_gate_to_grid_map.pyx":185
- * 
- *         # set attributes
- *         self.x_step = x_step             # <<<<<<<<<<<<<<
- *         self.y_step = y_step
- *         self.z_step = z_step
- */
-  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_x_step); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_3); if (unlikely((__pyx_t_6 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_t_1); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_self->z_step = __pyx_t_6;
+  __pyx_v_self->y_step = __pyx_t_5;
   __pyx_v_self->x_step = __pyx_t_4;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":186
- *         # set attributes
- *         self.x_step = x_step
- *         self.y_step = y_step             # <<<<<<<<<<<<<<
- *         self.z_step = z_step
- *         self.x_start = x_start
- */
-  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_y_step); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_self->y_step = __pyx_t_4;
-
-  /* "pyart/map/_gate_to_grid_map.pyx":187
- *         self.x_step = x_step
- *         self.y_step = y_step
- *         self.z_step = z_step             # <<<<<<<<<<<<<<
- *         self.x_start = x_start
- *         self.y_start = y_start
+  /* "pyart/map/_gate_to_grid_map.pyx":174
+ *     cdef int nz, ny, nx
+ * 
+ *     def __init__(self, float[:, :, ::1] roi_values, tuple lattice_starts,             # <<<<<<<<<<<<<<
+ *                  tuple lattice_steps):
+ *         """ initalize. """
  */
-  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_z_step); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_self->z_step = __pyx_t_4;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":188
- *         self.y_step = y_step
- *         self.z_step = z_step
- *         self.x_start = x_start             # <<<<<<<<<<<<<<
- *         self.y_start = y_start
- *         self.z_start = z_start
- */
-  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_x_start); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_self->x_start = __pyx_t_4;
-
-  /* "pyart/map/_gate_to_grid_map.pyx":189
- *         self.z_step = z_step
- *         self.x_start = x_start
- *         self.y_start = y_start             # <<<<<<<<<<<<<<
- *         self.z_start = z_start
- *         self.nx = nx
- */
-  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_y_start); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_self->y_start = __pyx_t_4;
-
-  /* "pyart/map/_gate_to_grid_map.pyx":190
- *         self.x_start = x_start
- *         self.y_start = y_start
- *         self.z_start = z_start             # <<<<<<<<<<<<<<
- *         self.nx = nx
- *         self.ny = ny
- */
-  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_z_start); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_self->z_start = __pyx_t_4;
-
-  /* "pyart/map/_gate_to_grid_map.pyx":191
- *         self.y_start = y_start
- *         self.z_start = z_start
- *         self.nx = nx             # <<<<<<<<<<<<<<
- *         self.ny = ny
- *         self.nz = nz
- */
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_nx); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_self->nx = __pyx_t_5;
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.LatticeRoI.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_roi_values, 1);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "pyart/map/_gate_to_grid_map.pyx":192
- *         self.z_start = z_start
- *         self.nx = nx
- *         self.ny = ny             # <<<<<<<<<<<<<<
- *         self.nz = nz
- *         self.nfields = grid_sum.shape[3]
- */
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_ny); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 192; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_self->ny = __pyx_t_5;
+/* "pyart/map/_gate_to_grid_map.pyx":188
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     cdef float roi(self, float z, float y, float x) nogil:             # <<<<<<<<<<<<<<
+ *         """ Return the radius of influence for coordinates in meters. """
+ *         cdef int z0, y0, x0, z1, y1, x1
+ */
+
+static float __pyx_f_5pyart_3map_17_gate_to_grid_map_10LatticeRoI_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI *__pyx_v_self, float __pyx_v_z, float __pyx_v_y, float __pyx_v_x) {
+  int __pyx_v_z0;
+  int __pyx_v_y0;
+  int __pyx_v_x0;
+  int __pyx_v_z1;
+  int __pyx_v_y1;
+  int __pyx_v_x1;
+  float __pyx_v_zw;
+  float __pyx_v_yw;
+  float __pyx_v_xw;
+  float __pyx_v_c00;
+  float __pyx_v_c01;
+  float __pyx_v_c10;
+  float __pyx_v_c11;
+  float __pyx_r;
+  long __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+  int __pyx_t_20;
+  int __pyx_t_21;
+  int __pyx_t_22;
+  int __pyx_t_23;
+  int __pyx_t_24;
+  int __pyx_t_25;
 
   /* "pyart/map/_gate_to_grid_map.pyx":193
- *         self.nx = nx
- *         self.ny = ny
- *         self.nz = nz             # <<<<<<<<<<<<<<
- *         self.nfields = grid_sum.shape[3]
- *         self.grid_sum = grid_sum
+ *         cdef float zw, yw, xw, c00, c01, c10, c11
+ * 
+ *         lattice_position(z, self.z_start, self.z_step, self.nz, &z0, &zw)             # <<<<<<<<<<<<<<
+ *         lattice_position(y, self.y_start, self.y_step, self.ny, &y0, &yw)
+ *         lattice_position(x, self.x_start, self.x_step, self.nx, &x0, &xw)
  */
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_nz); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_self->nz = __pyx_t_5;
+  __pyx_f_5pyart_3map_17_gate_to_grid_map_lattice_position(__pyx_v_z, __pyx_v_self->z_start, __pyx_v_self->z_step, __pyx_v_self->nz, (&__pyx_v_z0), (&__pyx_v_zw));
 
   /* "pyart/map/_gate_to_grid_map.pyx":194
- *         self.ny = ny
- *         self.nz = nz
- *         self.nfields = grid_sum.shape[3]             # <<<<<<<<<<<<<<
- *         self.grid_sum = grid_sum
- *         self.grid_wsum = grid_wsum
+ * 
+ *         lattice_position(z, self.z_start, self.z_step, self.nz, &z0, &zw)
+ *         lattice_position(y, self.y_start, self.y_step, self.ny, &y0, &yw)             # <<<<<<<<<<<<<<
+ *         lattice_position(x, self.x_start, self.x_step, self.nx, &x0, &xw)
+ *         z1 = z0 + 1 if z0 + 1 < self.nz else z0
  */
-  __pyx_v_self->nfields = (__pyx_v_grid_sum.shape[3]);
+  __pyx_f_5pyart_3map_17_gate_to_grid_map_lattice_position(__pyx_v_y, __pyx_v_self->y_start, __pyx_v_self->y_step, __pyx_v_self->ny, (&__pyx_v_y0), (&__pyx_v_yw));
 
   /* "pyart/map/_gate_to_grid_map.pyx":195
- *         self.nz = nz
- *         self.nfields = grid_sum.shape[3]
- *         self.grid_sum = grid_sum             # <<<<<<<<<<<<<<
- *         self.grid_wsum = grid_wsum
- *         return
+ *         lattice_position(z, self.z_start, self.z_step, self.nz, &z0, &zw)
+ *         lattice_position(y, self.y_start, self.y_step, self.ny, &y0, &yw)
+ *         lattice_position(x, self.x_start, self.x_step, self.nx, &x0, &xw)             # <<<<<<<<<<<<<<
+ *         z1 = z0 + 1 if z0 + 1 < self.nz else z0
+ *         y1 = y0 + 1 if y0 + 1 < self.ny else y0
  */
-  __PYX_XDEC_MEMVIEW(&__pyx_v_self->grid_sum, 0);
-  __PYX_INC_MEMVIEW(&__pyx_v_grid_sum, 0);
-  __pyx_v_self->grid_sum = __pyx_v_grid_sum;
+  __pyx_f_5pyart_3map_17_gate_to_grid_map_lattice_position(__pyx_v_x, __pyx_v_self->x_start, __pyx_v_self->x_step, __pyx_v_self->nx, (&__pyx_v_x0), (&__pyx_v_xw));
 
   /* "pyart/map/_gate_to_grid_map.pyx":196
- *         self.nfields = grid_sum.shape[3]
- *         self.grid_sum = grid_sum
- *         self.grid_wsum = grid_wsum             # <<<<<<<<<<<<<<
- *         return
+ *         lattice_position(y, self.y_start, self.y_step, self.ny, &y0, &yw)
+ *         lattice_position(x, self.x_start, self.x_step, self.nx, &x0, &xw)
+ *         z1 = z0 + 1 if z0 + 1 < self.nz else z0             # <<<<<<<<<<<<<<
+ *         y1 = y0 + 1 if y0 + 1 < self.ny else y0
+ *         x1 = x0 + 1 if x0 + 1 < self.nx else x0
+ */
+  if ((((__pyx_v_z0 + 1) < __pyx_v_self->nz) != 0)) {
+    __pyx_t_1 = (__pyx_v_z0 + 1);
+  } else {
+    __pyx_t_1 = __pyx_v_z0;
+  }
+  __pyx_v_z1 = __pyx_t_1;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":197
+ *         lattice_position(x, self.x_start, self.x_step, self.nx, &x0, &xw)
+ *         z1 = z0 + 1 if z0 + 1 < self.nz else z0
+ *         y1 = y0 + 1 if y0 + 1 < self.ny else y0             # <<<<<<<<<<<<<<
+ *         x1 = x0 + 1 if x0 + 1 < self.nx else x0
  * 
  */
-  __PYX_XDEC_MEMVIEW(&__pyx_v_self->grid_wsum, 0);
-  __PYX_INC_MEMVIEW(&__pyx_v_grid_wsum, 0);
-  __pyx_v_self->grid_wsum = __pyx_v_grid_wsum;
+  if ((((__pyx_v_y0 + 1) < __pyx_v_self->ny) != 0)) {
+    __pyx_t_1 = (__pyx_v_y0 + 1);
+  } else {
+    __pyx_t_1 = __pyx_v_y0;
+  }
+  __pyx_v_y1 = __pyx_t_1;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":197
- *         self.grid_sum = grid_sum
- *         self.grid_wsum = grid_wsum
- *         return             # <<<<<<<<<<<<<<
+  /* "pyart/map/_gate_to_grid_map.pyx":198
+ *         z1 = z0 + 1 if z0 + 1 < self.nz else z0
+ *         y1 = y0 + 1 if y0 + 1 < self.ny else y0
+ *         x1 = x0 + 1 if x0 + 1 < self.nx else x0             # <<<<<<<<<<<<<<
  * 
- *     @cython.boundscheck(False)
+ *         c00 = (self.roi_values[z0, y0, x0] * (1. - xw) +
  */
-  __pyx_r = 0;
-  goto __pyx_L0;
+  if ((((__pyx_v_x0 + 1) < __pyx_v_self->nx) != 0)) {
+    __pyx_t_1 = (__pyx_v_x0 + 1);
+  } else {
+    __pyx_t_1 = __pyx_v_x0;
+  }
+  __pyx_v_x1 = __pyx_t_1;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":175
- *     cdef float[:, :, :, ::1] grid_wsum
+  /* "pyart/map/_gate_to_grid_map.pyx":200
+ *         x1 = x0 + 1 if x0 + 1 < self.nx else x0
  * 
- *     def __init__(self, tuple grid_shape, tuple grid_starts, tuple grid_steps,             # <<<<<<<<<<<<<<
- *                  float[:, :, :, ::1] grid_sum, float[:, :, :, ::1] grid_wsum):
- *         """ initialize. """
+ *         c00 = (self.roi_values[z0, y0, x0] * (1. - xw) +             # <<<<<<<<<<<<<<
+ *                self.roi_values[z0, y0, x1] * xw)
+ *         c01 = (self.roi_values[z0, y1, x0] * (1. - xw) +
+ */
+  __pyx_t_2 = __pyx_v_z0;
+  __pyx_t_3 = __pyx_v_y0;
+  __pyx_t_4 = __pyx_v_x0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":201
+ * 
+ *         c00 = (self.roi_values[z0, y0, x0] * (1. - xw) +
+ *                self.roi_values[z0, y0, x1] * xw)             # <<<<<<<<<<<<<<
+ *         c01 = (self.roi_values[z0, y1, x0] * (1. - xw) +
+ *                self.roi_values[z0, y1, x1] * xw)
+ */
+  __pyx_t_5 = __pyx_v_z0;
+  __pyx_t_6 = __pyx_v_y0;
+  __pyx_t_7 = __pyx_v_x1;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":200
+ *         x1 = x0 + 1 if x0 + 1 < self.nx else x0
+ * 
+ *         c00 = (self.roi_values[z0, y0, x0] * (1. - xw) +             # <<<<<<<<<<<<<<
+ *                self.roi_values[z0, y0, x1] * xw)
+ *         c01 = (self.roi_values[z0, y1, x0] * (1. - xw) +
+ */
+  __pyx_v_c00 = (((*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->roi_values.data + __pyx_t_2 * __pyx_v_self->roi_values.strides[0]) ) + __pyx_t_3 * __pyx_v_self->roi_values.strides[1]) )) + __pyx_t_4)) ))) * (1. - __pyx_v_xw)) + ((*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->roi_values.data + __pyx_t_5 * __pyx_v_self->roi_values.strides[0]) ) + __pyx_t_6 * __pyx_v_self->roi_values.strides[1]) )) + __pyx_t_7)) ))) * __pyx_v_xw));
+
+  /* "pyart/map/_gate_to_grid_map.pyx":202
+ *         c00 = (self.roi_values[z0, y0, x0] * (1. - xw) +
+ *                self.roi_values[z0, y0, x1] * xw)
+ *         c01 = (self.roi_values[z0, y1, x0] * (1. - xw) +             # <<<<<<<<<<<<<<
+ *                self.roi_values[z0, y1, x1] * xw)
+ *         c10 = (self.roi_values[z1, y0, x0] * (1. - xw) +
+ */
+  __pyx_t_8 = __pyx_v_z0;
+  __pyx_t_9 = __pyx_v_y1;
+  __pyx_t_10 = __pyx_v_x0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":203
+ *                self.roi_values[z0, y0, x1] * xw)
+ *         c01 = (self.roi_values[z0, y1, x0] * (1. - xw) +
+ *                self.roi_values[z0, y1, x1] * xw)             # <<<<<<<<<<<<<<
+ *         c10 = (self.roi_values[z1, y0, x0] * (1. - xw) +
+ *                self.roi_values[z1, y0, x1] * xw)
+ */
+  __pyx_t_11 = __pyx_v_z0;
+  __pyx_t_12 = __pyx_v_y1;
+  __pyx_t_13 = __pyx_v_x1;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":202
+ *         c00 = (self.roi_values[z0, y0, x0] * (1. - xw) +
+ *                self.roi_values[z0, y0, x1] * xw)
+ *         c01 = (self.roi_values[z0, y1, x0] * (1. - xw) +             # <<<<<<<<<<<<<<
+ *                self.roi_values[z0, y1, x1] * xw)
+ *         c10 = (self.roi_values[z1, y0, x0] * (1. - xw) +
+ */
+  __pyx_v_c01 = (((*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->roi_values.data + __pyx_t_8 * __pyx_v_self->roi_values.strides[0]) ) + __pyx_t_9 * __pyx_v_self->roi_values.strides[1]) )) + __pyx_t_10)) ))) * (1. - __pyx_v_xw)) + ((*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->roi_values.data + __pyx_t_11 * __pyx_v_self->roi_values.strides[0]) ) + __pyx_t_12 * __pyx_v_self->roi_values.strides[1]) )) + __pyx_t_13)) ))) * __pyx_v_xw));
+
+  /* "pyart/map/_gate_to_grid_map.pyx":204
+ *         c01 = (self.roi_values[z0, y1, x0] * (1. - xw) +
+ *                self.roi_values[z0, y1, x1] * xw)
+ *         c10 = (self.roi_values[z1, y0, x0] * (1. - xw) +             # <<<<<<<<<<<<<<
+ *                self.roi_values[z1, y0, x1] * xw)
+ *         c11 = (self.roi_values[z1, y1, x0] * (1. - xw) +
+ */
+  __pyx_t_14 = __pyx_v_z1;
+  __pyx_t_15 = __pyx_v_y0;
+  __pyx_t_16 = __pyx_v_x0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":205
+ *                self.roi_values[z0, y1, x1] * xw)
+ *         c10 = (self.roi_values[z1, y0, x0] * (1. - xw) +
+ *                self.roi_values[z1, y0, x1] * xw)             # <<<<<<<<<<<<<<
+ *         c11 = (self.roi_values[z1, y1, x0] * (1. - xw) +
+ *                self.roi_values[z1, y1, x1] * xw)
+ */
+  __pyx_t_17 = __pyx_v_z1;
+  __pyx_t_18 = __pyx_v_y0;
+  __pyx_t_19 = __pyx_v_x1;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":204
+ *         c01 = (self.roi_values[z0, y1, x0] * (1. - xw) +
+ *                self.roi_values[z0, y1, x1] * xw)
+ *         c10 = (self.roi_values[z1, y0, x0] * (1. - xw) +             # <<<<<<<<<<<<<<
+ *                self.roi_values[z1, y0, x1] * xw)
+ *         c11 = (self.roi_values[z1, y1, x0] * (1. - xw) +
+ */
+  __pyx_v_c10 = (((*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->roi_values.data + __pyx_t_14 * __pyx_v_self->roi_values.strides[0]) ) + __pyx_t_15 * __pyx_v_self->roi_values.strides[1]) )) + __pyx_t_16)) ))) * (1. - __pyx_v_xw)) + ((*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->roi_values.data + __pyx_t_17 * __pyx_v_self->roi_values.strides[0]) ) + __pyx_t_18 * __pyx_v_self->roi_values.strides[1]) )) + __pyx_t_19)) ))) * __pyx_v_xw));
+
+  /* "pyart/map/_gate_to_grid_map.pyx":206
+ *         c10 = (self.roi_values[z1, y0, x0] * (1. - xw) +
+ *                self.roi_values[z1, y0, x1] * xw)
+ *         c11 = (self.roi_values[z1, y1, x0] * (1. - xw) +             # <<<<<<<<<<<<<<
+ *                self.roi_values[z1, y1, x1] * xw)
+ *         return ((c00 * (1. - yw) + c01 * yw) * (1. - zw) +
+ */
+  __pyx_t_20 = __pyx_v_z1;
+  __pyx_t_21 = __pyx_v_y1;
+  __pyx_t_22 = __pyx_v_x0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":207
+ *                self.roi_values[z1, y0, x1] * xw)
+ *         c11 = (self.roi_values[z1, y1, x0] * (1. - xw) +
+ *                self.roi_values[z1, y1, x1] * xw)             # <<<<<<<<<<<<<<
+ *         return ((c00 * (1. - yw) + c01 * yw) * (1. - zw) +
+ *                 (c10 * (1. - yw) + c11 * yw) * zw)
+ */
+  __pyx_t_23 = __pyx_v_z1;
+  __pyx_t_24 = __pyx_v_y1;
+  __pyx_t_25 = __pyx_v_x1;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":206
+ *         c10 = (self.roi_values[z1, y0, x0] * (1. - xw) +
+ *                self.roi_values[z1, y0, x1] * xw)
+ *         c11 = (self.roi_values[z1, y1, x0] * (1. - xw) +             # <<<<<<<<<<<<<<
+ *                self.roi_values[z1, y1, x1] * xw)
+ *         return ((c00 * (1. - yw) + c01 * yw) * (1. - zw) +
+ */
+  __pyx_v_c11 = (((*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->roi_values.data + __pyx_t_20 * __pyx_v_self->roi_values.strides[0]) ) + __pyx_t_21 * __pyx_v_self->roi_values.strides[1]) )) + __pyx_t_22)) ))) * (1. - __pyx_v_xw)) + ((*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->roi_values.data + __pyx_t_23 * __pyx_v_self->roi_values.strides[0]) ) + __pyx_t_24 * __pyx_v_self->roi_values.strides[1]) )) + __pyx_t_25)) ))) * __pyx_v_xw));
+
+  /* "pyart/map/_gate_to_grid_map.pyx":208
+ *         c11 = (self.roi_values[z1, y1, x0] * (1. - xw) +
+ *                self.roi_values[z1, y1, x1] * xw)
+ *         return ((c00 * (1. - yw) + c01 * yw) * (1. - zw) +             # <<<<<<<<<<<<<<
+ *                 (c10 * (1. - yw) + c11 * yw) * zw)
+ * 
+ */
+  __pyx_r = ((((__pyx_v_c00 * (1. - __pyx_v_yw)) + (__pyx_v_c01 * __pyx_v_yw)) * (1. - __pyx_v_zw)) + (((__pyx_v_c10 * (1. - __pyx_v_yw)) + (__pyx_v_c11 * __pyx_v_yw)) * __pyx_v_zw));
+  goto __pyx_L0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":188
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     cdef float roi(self, float z, float y, float x) nogil:             # <<<<<<<<<<<<<<
+ *         """ Return the radius of influence for coordinates in meters. """
+ *         cdef int z0, y0, x0, z1, y1, x1
  */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_nz);
-  __Pyx_XDECREF(__pyx_v_ny);
-  __Pyx_XDECREF(__pyx_v_nx);
-  __Pyx_XDECREF(__pyx_v_z_start);
-  __Pyx_XDECREF(__pyx_v_y_start);
-  __Pyx_XDECREF(__pyx_v_x_start);
-  __Pyx_XDECREF(__pyx_v_z_step);
-  __Pyx_XDECREF(__pyx_v_y_step);
-  __Pyx_XDECREF(__pyx_v_x_step);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_grid_sum, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_grid_wsum, 1);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "pyart/map/_gate_to_grid_map.pyx":201
- *     @cython.boundscheck(False)
- *     @cython.wraparound(False)
- *     def find_roi_for_grid(             # <<<<<<<<<<<<<<
- *             self, float[:, :, ::1] roi_array, RoIFunction roi_func):
- *         """
+/* "pyart/map/_gate_to_grid_map.pyx":212
+ * 
+ * 
+ * def find_roi_on_lattice(             # <<<<<<<<<<<<<<
+ *         RoIFunction roi_func, tuple lattice_starts, tuple lattice_steps,
+ *         float[:, :, ::1] roi_array):
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_3find_roi_for_grid(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_2find_roi_for_grid[] = "\n        Fill in the radius of influence for each point in the grid.\n\n        Parameters\n        ----------\n        roi_array : 3D float32 array\n            Array which will be filled by the radius of influence for each\n            point in the grid.\n        roi_func : RoIFunction\n            Object whose get_roi method returns the radius of influence.\n\n        ";
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_3find_roi_for_grid(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  __Pyx_memviewslice __pyx_v_roi_array = { 0, 0, { 0 }, { 0 }, { 0 } };
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_1find_roi_on_lattice(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_find_roi_on_lattice[] = "\n    Evaluate a radius of influence function on a regular lattice.\n\n    Parameters\n    ----------\n    roi_func : RoIFunction\n        Object whose get_roi method returns the radius of influence.\n    lattice_starts, lattice_steps : tuple of floats\n        Location of the first lattice point and the spacing between points,\n        in meters.  Dimensions are ordered as z, y, x.\n    roi_array : 3D float32 array\n        Array which will be filled by the radius of influence at each point\n        in the lattice.\n\n    ";
+static PyMethodDef __pyx_mdef_5pyart_3map_17_gate_to_grid_map_1find_roi_on_lattice = {"find_roi_on_lattice", (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_1find_roi_on_lattice, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5pyart_3map_17_gate_to_grid_map_find_roi_on_lattice};
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_1find_roi_on_lattice(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func = 0;
+  PyObject *__pyx_v_lattice_starts = 0;
+  PyObject *__pyx_v_lattice_steps = 0;
+  __Pyx_memviewslice __pyx_v_roi_array = { 0, 0, { 0 }, { 0 }, { 0 } };
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("find_roi_for_grid (wrapper)", 0);
+  __Pyx_RefNannySetupContext("find_roi_on_lattice (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_roi_array,&__pyx_n_s_roi_func,0};
-    PyObject* values[2] = {0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_roi_func,&__pyx_n_s_lattice_starts,&__pyx_n_s_lattice_steps,&__pyx_n_s_roi_array,0};
+    PyObject* values[4] = {0,0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
         case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
         case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
         case  0: break;
@@ -4066,36 +3857,52 @@ static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_3fi
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_roi_array)) != 0)) kw_args--;
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_roi_func)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_roi_func)) != 0)) kw_args--;
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_lattice_starts)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_roi_on_lattice", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_lattice_steps)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_roi_on_lattice", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_roi_array)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("find_roi_for_grid", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("find_roi_on_lattice", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "find_roi_for_grid") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "find_roi_on_lattice") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __pyx_v_roi_array = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(values[0]); if (unlikely(!__pyx_v_roi_array.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_roi_func = ((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *)values[1]);
+    __pyx_v_roi_func = ((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *)values[0]);
+    __pyx_v_lattice_starts = ((PyObject*)values[1]);
+    __pyx_v_lattice_steps = ((PyObject*)values[2]);
+    __pyx_v_roi_array = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(values[3]); if (unlikely(!__pyx_v_roi_array.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 214; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("find_roi_for_grid", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 201; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("find_roi_on_lattice", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.find_roi_for_grid", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.find_roi_on_lattice", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_roi_func), __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction, 1, "roi_func", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 202; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_2find_roi_for_grid(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *)__pyx_v_self), __pyx_v_roi_array, __pyx_v_roi_func);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_roi_func), __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction, 1, "roi_func", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_lattice_starts), (&PyTuple_Type), 1, "lattice_starts", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_lattice_steps), (&PyTuple_Type), 1, "lattice_steps", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_find_roi_on_lattice(__pyx_self, __pyx_v_roi_func, __pyx_v_lattice_starts, __pyx_v_lattice_steps, __pyx_v_roi_array);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4106,131 +3913,215 @@ static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_3fi
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_2find_roi_for_grid(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, __Pyx_memviewslice __pyx_v_roi_array, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func) {
+static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_find_roi_on_lattice(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func, PyObject *__pyx_v_lattice_starts, PyObject *__pyx_v_lattice_steps, __Pyx_memviewslice __pyx_v_roi_array) {
   int __pyx_v_ix;
   int __pyx_v_iy;
   int __pyx_v_iz;
-  float __pyx_v_x;
-  float __pyx_v_y;
-  float __pyx_v_z;
-  float __pyx_v_roi;
+  float __pyx_v_z_start;
+  float __pyx_v_y_start;
+  float __pyx_v_x_start;
+  float __pyx_v_z_step;
+  float __pyx_v_y_step;
+  float __pyx_v_x_step;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  int __pyx_t_7;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  float __pyx_t_4;
+  float __pyx_t_5;
+  float __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
   int __pyx_t_8;
-  int __pyx_t_9;
-  __Pyx_RefNannySetupContext("find_roi_for_grid", 0);
-
-  /* "pyart/map/_gate_to_grid_map.pyx":217
- *         cdef int ix, iy, iz
- *         cdef float x, y, z, roi
- *         for ix in range(self.nx):             # <<<<<<<<<<<<<<
- *             for iy in range(self.ny):
- *                 for iz in range(self.nz):
- */
-  __pyx_t_1 = __pyx_v_self->nx;
-  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
-    __pyx_v_ix = __pyx_t_2;
-
-    /* "pyart/map/_gate_to_grid_map.pyx":218
- *         cdef float x, y, z, roi
- *         for ix in range(self.nx):
- *             for iy in range(self.ny):             # <<<<<<<<<<<<<<
- *                 for iz in range(self.nz):
- *                     x = self.x_start + self.x_step * ix
- */
-    __pyx_t_3 = __pyx_v_self->ny;
-    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
-      __pyx_v_iy = __pyx_t_4;
-
-      /* "pyart/map/_gate_to_grid_map.pyx":219
- *         for ix in range(self.nx):
- *             for iy in range(self.ny):
- *                 for iz in range(self.nz):             # <<<<<<<<<<<<<<
- *                     x = self.x_start + self.x_step * ix
- *                     y = self.y_start + self.y_step * iy
- */
-      __pyx_t_5 = __pyx_v_self->nz;
-      for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
-        __pyx_v_iz = __pyx_t_6;
-
-        /* "pyart/map/_gate_to_grid_map.pyx":220
- *             for iy in range(self.ny):
- *                 for iz in range(self.nz):
- *                     x = self.x_start + self.x_step * ix             # <<<<<<<<<<<<<<
- *                     y = self.y_start + self.y_step * iy
- *                     z = self.z_start + self.z_step * iz
- */
-        __pyx_v_x = (__pyx_v_self->x_start + (__pyx_v_self->x_step * __pyx_v_ix));
+  Py_ssize_t __pyx_t_9;
+  int __pyx_t_10;
+  Py_ssize_t __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("find_roi_on_lattice", 0);
 
-        /* "pyart/map/_gate_to_grid_map.pyx":221
- *                 for iz in range(self.nz):
- *                     x = self.x_start + self.x_step * ix
- *                     y = self.y_start + self.y_step * iy             # <<<<<<<<<<<<<<
- *                     z = self.z_start + self.z_step * iz
- *                     roi = roi_func.get_roi(z, y, x)
+  /* "pyart/map/_gate_to_grid_map.pyx":232
+ *     cdef int ix, iy, iz
+ *     cdef float z_start, y_start, x_start, z_step, y_step, x_step
+ *     z_start, y_start, x_start = lattice_starts             # <<<<<<<<<<<<<<
+ *     z_step, y_step, x_step = lattice_steps
+ *     for iz in range(roi_array.shape[0]):
  */
-        __pyx_v_y = (__pyx_v_self->y_start + (__pyx_v_self->y_step * __pyx_v_iy));
-
-        /* "pyart/map/_gate_to_grid_map.pyx":222
- *                     x = self.x_start + self.x_step * ix
- *                     y = self.y_start + self.y_step * iy
- *                     z = self.z_start + self.z_step * iz             # <<<<<<<<<<<<<<
- *                     roi = roi_func.get_roi(z, y, x)
- *                     roi_array[iz, iy, ix] = roi
- */
-        __pyx_v_z = (__pyx_v_self->z_start + (__pyx_v_self->z_step * __pyx_v_iz));
-
-        /* "pyart/map/_gate_to_grid_map.pyx":223
- *                     y = self.y_start + self.y_step * iy
- *                     z = self.z_start + self.z_step * iz
- *                     roi = roi_func.get_roi(z, y, x)             # <<<<<<<<<<<<<<
- *                     roi_array[iz, iy, ix] = roi
- *         return
- */
-        __pyx_v_roi = ((struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction *)__pyx_v_roi_func->__pyx_vtab)->get_roi(__pyx_v_roi_func, __pyx_v_z, __pyx_v_y, __pyx_v_x, 0);
-
-        /* "pyart/map/_gate_to_grid_map.pyx":224
- *                     z = self.z_start + self.z_step * iz
- *                     roi = roi_func.get_roi(z, y, x)
- *                     roi_array[iz, iy, ix] = roi             # <<<<<<<<<<<<<<
- *         return
- * 
- */
-        __pyx_t_7 = __pyx_v_iz;
-        __pyx_t_8 = __pyx_v_iy;
-        __pyx_t_9 = __pyx_v_ix;
-        *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_roi_array.data + __pyx_t_7 * __pyx_v_roi_array.strides[0]) ) + __pyx_t_8 * __pyx_v_roi_array.strides[1]) )) + __pyx_t_9)) )) = __pyx_v_roi;
+  if (likely(__pyx_v_lattice_starts != Py_None)) {
+    PyObject* sequence = __pyx_v_lattice_starts;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    Py_ssize_t size = Py_SIZE(sequence);
+    #else
+    Py_ssize_t size = PySequence_Size(sequence);
+    #endif
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    #if CYTHON_COMPILING_IN_CPYTHON
+    __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
+    __pyx_t_2 = PyTuple_GET_ITEM(sequence, 1); 
+    __pyx_t_3 = PyTuple_GET_ITEM(sequence, 2); 
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_3);
+    #else
+    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+  } else {
+    __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_t_1); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_3); if (unlikely((__pyx_t_6 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_z_start = __pyx_t_4;
+  __pyx_v_y_start = __pyx_t_5;
+  __pyx_v_x_start = __pyx_t_6;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":233
+ *     cdef float z_start, y_start, x_start, z_step, y_step, x_step
+ *     z_start, y_start, x_start = lattice_starts
+ *     z_step, y_step, x_step = lattice_steps             # <<<<<<<<<<<<<<
+ *     for iz in range(roi_array.shape[0]):
+ *         for iy in range(roi_array.shape[1]):
+ */
+  if (likely(__pyx_v_lattice_steps != Py_None)) {
+    PyObject* sequence = __pyx_v_lattice_steps;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    Py_ssize_t size = Py_SIZE(sequence);
+    #else
+    Py_ssize_t size = PySequence_Size(sequence);
+    #endif
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    #if CYTHON_COMPILING_IN_CPYTHON
+    __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
+    __pyx_t_2 = PyTuple_GET_ITEM(sequence, 1); 
+    __pyx_t_1 = PyTuple_GET_ITEM(sequence, 2); 
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_1);
+    #else
+    __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    #endif
+  } else {
+    __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_t_6 = __pyx_PyFloat_AsFloat(__pyx_t_3); if (unlikely((__pyx_t_6 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_t_1); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_z_step = __pyx_t_6;
+  __pyx_v_y_step = __pyx_t_5;
+  __pyx_v_x_step = __pyx_t_4;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":234
+ *     z_start, y_start, x_start = lattice_starts
+ *     z_step, y_step, x_step = lattice_steps
+ *     for iz in range(roi_array.shape[0]):             # <<<<<<<<<<<<<<
+ *         for iy in range(roi_array.shape[1]):
+ *             for ix in range(roi_array.shape[2]):
+ */
+  __pyx_t_7 = (__pyx_v_roi_array.shape[0]);
+  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+    __pyx_v_iz = __pyx_t_8;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":235
+ *     z_step, y_step, x_step = lattice_steps
+ *     for iz in range(roi_array.shape[0]):
+ *         for iy in range(roi_array.shape[1]):             # <<<<<<<<<<<<<<
+ *             for ix in range(roi_array.shape[2]):
+ *                 roi_array[iz, iy, ix] = roi_func.get_roi(
+ */
+    __pyx_t_9 = (__pyx_v_roi_array.shape[1]);
+    for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+      __pyx_v_iy = __pyx_t_10;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":236
+ *     for iz in range(roi_array.shape[0]):
+ *         for iy in range(roi_array.shape[1]):
+ *             for ix in range(roi_array.shape[2]):             # <<<<<<<<<<<<<<
+ *                 roi_array[iz, iy, ix] = roi_func.get_roi(
+ *                     z_start + z_step * iz, y_start + y_step * iy,
+ */
+      __pyx_t_11 = (__pyx_v_roi_array.shape[2]);
+      for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_11; __pyx_t_12+=1) {
+        __pyx_v_ix = __pyx_t_12;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":237
+ *         for iy in range(roi_array.shape[1]):
+ *             for ix in range(roi_array.shape[2]):
+ *                 roi_array[iz, iy, ix] = roi_func.get_roi(             # <<<<<<<<<<<<<<
+ *                     z_start + z_step * iz, y_start + y_step * iy,
+ *                     x_start + x_step * ix)
+ */
+        __pyx_t_13 = __pyx_v_iz;
+        __pyx_t_14 = __pyx_v_iy;
+        __pyx_t_15 = __pyx_v_ix;
+        __pyx_t_16 = -1;
+        if (__pyx_t_13 < 0) {
+          __pyx_t_13 += __pyx_v_roi_array.shape[0];
+          if (unlikely(__pyx_t_13 < 0)) __pyx_t_16 = 0;
+        } else if (unlikely(__pyx_t_13 >= __pyx_v_roi_array.shape[0])) __pyx_t_16 = 0;
+        if (__pyx_t_14 < 0) {
+          __pyx_t_14 += __pyx_v_roi_array.shape[1];
+          if (unlikely(__pyx_t_14 < 0)) __pyx_t_16 = 1;
+        } else if (unlikely(__pyx_t_14 >= __pyx_v_roi_array.shape[1])) __pyx_t_16 = 1;
+        if (__pyx_t_15 < 0) {
+          __pyx_t_15 += __pyx_v_roi_array.shape[2];
+          if (unlikely(__pyx_t_15 < 0)) __pyx_t_16 = 2;
+        } else if (unlikely(__pyx_t_15 >= __pyx_v_roi_array.shape[2])) __pyx_t_16 = 2;
+        if (unlikely(__pyx_t_16 != -1)) {
+          __Pyx_RaiseBufferIndexError(__pyx_t_16);
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        }
+        *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_roi_array.data + __pyx_t_13 * __pyx_v_roi_array.strides[0]) ) + __pyx_t_14 * __pyx_v_roi_array.strides[1]) )) + __pyx_t_15)) )) = ((struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction *)__pyx_v_roi_func->__pyx_vtab)->get_roi(__pyx_v_roi_func, (__pyx_v_z_start + (__pyx_v_z_step * __pyx_v_iz)), (__pyx_v_y_start + (__pyx_v_y_step * __pyx_v_iy)), (__pyx_v_x_start + (__pyx_v_x_step * __pyx_v_ix)), 0);
       }
     }
   }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":225
- *                     roi = roi_func.get_roi(z, y, x)
- *                     roi_array[iz, iy, ix] = roi
- *         return             # <<<<<<<<<<<<<<
+  /* "pyart/map/_gate_to_grid_map.pyx":212
  * 
- *     @cython.cdivision(True)
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-
-  /* "pyart/map/_gate_to_grid_map.pyx":201
- *     @cython.boundscheck(False)
- *     @cython.wraparound(False)
- *     def find_roi_for_grid(             # <<<<<<<<<<<<<<
- *             self, float[:, :, ::1] roi_array, RoIFunction roi_func):
- *         """
+ * 
+ * def find_roi_on_lattice(             # <<<<<<<<<<<<<<
+ *         RoIFunction roi_func, tuple lattice_starts, tuple lattice_steps,
+ *         float[:, :, ::1] roi_array):
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.find_roi_on_lattice", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
   __PYX_XDEC_MEMVIEW(&__pyx_v_roi_array, 1);
   __Pyx_XGIVEREF(__pyx_r);
@@ -4238,46 +4129,39 @@ static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_2fi
   return __pyx_r;
 }
 
-/* "pyart/map/_gate_to_grid_map.pyx":230
- *     @cython.boundscheck(False)
- *     @cython.wraparound(False)
- *     def map_gates_to_grid(             # <<<<<<<<<<<<<<
- *             self, float[::1] elevations, float[::1] azimuths,
- *             float[::1] ranges, float[:, :, ::1] field_data,
+/* "pyart/map/_gate_to_grid_map.pyx":267
+ *     cdef float[:, :, :, ::1] grid_wsum
+ * 
+ *     def __init__(self, tuple grid_shape, tuple grid_starts, tuple grid_steps,             # <<<<<<<<<<<<<<
+ *                  float[:, :, :, ::1] grid_sum, float[:, :, :, ::1] grid_wsum):
+ *         """ initialize. """
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_5map_gates_to_grid(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_4map_gates_to_grid[] = "\n        Map radar gates unto the regular grid.\n\n        The grid_sum and grid_wsum arrays used to initalize the class\n        are update with the mapped gate data.\n\n        Parameters\n        ----------\n        elevations, azimuths : 1D float32 array\n            Elevation and azimuth angles in degrees for each ray in the radar.\n        ranges : 1D float32 array\n            Gate ranges in meters for each bin in the radar.\n        field_data : 3D float32 array\n            Array containing field data for the radar, dimension are ordered\n            as nrays, ngates, nfields.\n        field_mask : 3D uint8 array\n            Array containing masking of the field data for the radar,\n            dimension are ordered as nrays, ngates, nfields.\n        excluded_gates : 2D uint8 array\n            Array containing gate masking information.  Gates with non-zero\n            values will not be included in the mapping.\n        offset : tuple of floats\n            Offset of the radar from the grid origin.  Dimension are ordered\n            as z, y, x.\n        toa : float\n            Top of atmosphere.  Gates above this level are considered.\n        roi_func : RoIFunction\n            Object whose get_roi method returns the radius of influence.\n        weighting_function : int\n            Function to use for weighting gates based upon distance.\n            0 for Barnes, 1 for Cressman weighting.\n\n        ";
-static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_5map_gates_to_grid(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  __Pyx_memviewslice __pyx_v_elevations = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_azimuths = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_ranges = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_field_data = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_field_mask = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_excluded_gates = { 0, 0, { 0 }, { 0 }, { 0 } };
-  PyObject *__pyx_v_offset = 0;
-  float __pyx_v_toa;
-  struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func = 0;
-  int __pyx_v_weighting_function;
+static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__[] = " initialize. ";
+#if CYTHON_COMPILING_IN_CPYTHON
+struct wrapperbase __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__;
+#endif
+static int __pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_grid_shape = 0;
+  PyObject *__pyx_v_grid_starts = 0;
+  PyObject *__pyx_v_grid_steps = 0;
+  __Pyx_memviewslice __pyx_v_grid_sum = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_grid_wsum = { 0, 0, { 0 }, { 0 }, { 0 } };
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("map_gates_to_grid (wrapper)", 0);
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_elevations,&__pyx_n_s_azimuths,&__pyx_n_s_ranges,&__pyx_n_s_field_data,&__pyx_n_s_field_mask,&__pyx_n_s_excluded_gates,&__pyx_n_s_offset,&__pyx_n_s_toa,&__pyx_n_s_roi_func,&__pyx_n_s_weighting_function,0};
-    PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_grid_shape,&__pyx_n_s_grid_starts,&__pyx_n_s_grid_steps,&__pyx_n_s_grid_sum,&__pyx_n_s_grid_wsum,0};
+    PyObject* values[5] = {0,0,0,0,0};
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
-        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
-        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
@@ -4289,58 +4173,33 @@ static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_5ma
       kw_args = PyDict_Size(__pyx_kwds);
       switch (pos_args) {
         case  0:
-        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_elevations)) != 0)) kw_args--;
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_grid_shape)) != 0)) kw_args--;
         else goto __pyx_L5_argtuple_error;
         case  1:
-        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_azimuths)) != 0)) kw_args--;
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_grid_starts)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 1, 10, 10, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
-        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ranges)) != 0)) kw_args--;
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_grid_steps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 1, 10, 10, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
-        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_field_data)) != 0)) kw_args--;
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_grid_sum)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 1, 10, 10, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
-        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_field_mask)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 1, 10, 10, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  5:
-        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_excluded_gates)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 1, 10, 10, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  6:
-        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 1, 10, 10, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  7:
-        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_toa)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 1, 10, 10, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  8:
-        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_roi_func)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 1, 10, 10, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-        }
-        case  9:
-        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_weighting_function)) != 0)) kw_args--;
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_grid_wsum)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 1, 10, 10, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "map_gates_to_grid") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__init__") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 10) {
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
@@ -4348,124 +4207,66 @@ static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_5ma
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
       values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
     }
-    __pyx_v_elevations = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_elevations.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_azimuths = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[1]); if (unlikely(!__pyx_v_azimuths.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 231; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_ranges = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[2]); if (unlikely(!__pyx_v_ranges.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_field_data = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(values[3]); if (unlikely(!__pyx_v_field_data.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_field_mask = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_char(values[4]); if (unlikely(!__pyx_v_field_mask.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_excluded_gates = __Pyx_PyObject_to_MemoryviewSlice_d_dc_char(values[5]); if (unlikely(!__pyx_v_excluded_gates.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 233; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_offset = values[6];
-    __pyx_v_toa = __pyx_PyFloat_AsFloat(values[7]); if (unlikely((__pyx_v_toa == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_roi_func = ((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *)values[8]);
-    __pyx_v_weighting_function = __Pyx_PyInt_As_int(values[9]); if (unlikely((__pyx_v_weighting_function == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_grid_shape = ((PyObject*)values[0]);
+    __pyx_v_grid_starts = ((PyObject*)values[1]);
+    __pyx_v_grid_steps = ((PyObject*)values[2]);
+    __pyx_v_grid_sum = __Pyx_PyObject_to_MemoryviewSlice_d_d_d_dc_float(values[3]); if (unlikely(!__pyx_v_grid_sum.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_grid_wsum = __Pyx_PyObject_to_MemoryviewSlice_d_d_d_dc_float(values[4]); if (unlikely(!__pyx_v_grid_wsum.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 268; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 1, 10, 10, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 230; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
-  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.map_gates_to_grid", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
-  return NULL;
+  return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_roi_func), __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction, 1, "roi_func", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_4map_gates_to_grid(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *)__pyx_v_self), __pyx_v_elevations, __pyx_v_azimuths, __pyx_v_ranges, __pyx_v_field_data, __pyx_v_field_mask, __pyx_v_excluded_gates, __pyx_v_offset, __pyx_v_toa, __pyx_v_roi_func, __pyx_v_weighting_function);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_grid_shape), (&PyTuple_Type), 1, "grid_shape", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_grid_starts), (&PyTuple_Type), 1, "grid_starts", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_grid_steps), (&PyTuple_Type), 1, "grid_steps", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 267; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *)__pyx_v_self), __pyx_v_grid_shape, __pyx_v_grid_starts, __pyx_v_grid_steps, __pyx_v_grid_sum, __pyx_v_grid_wsum);
 
   /* function exit code */
   goto __pyx_L0;
   __pyx_L1_error:;
-  __pyx_r = NULL;
+  __pyx_r = -1;
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_4map_gates_to_grid(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, __Pyx_memviewslice __pyx_v_elevations, __Pyx_memviewslice __pyx_v_azimuths, __Pyx_memviewslice __pyx_v_ranges, __Pyx_memviewslice __pyx_v_field_data, __Pyx_memviewslice __pyx_v_field_mask, __Pyx_memviewslice __pyx_v_excluded_gates, PyObject *__pyx_v_offset, float __pyx_v_toa, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func, int __pyx_v_weighting_function) {
-  int __pyx_v_nrays;
-  int __pyx_v_ngates;
-  float __pyx_v_elevation;
-  float __pyx_v_azimuth;
-  float __pyx_v_r;
-  float __pyx_v_s;
-  float __pyx_v_roi;
-  __Pyx_memviewslice __pyx_v_values = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_v_masks = { 0, 0, { 0 }, { 0 }, { 0 } };
-  float __pyx_v_x;
-  float __pyx_v_y;
-  float __pyx_v_z;
-  float __pyx_v_x_offset;
-  float __pyx_v_y_offset;
-  float __pyx_v_z_offset;
-  int __pyx_v_nray;
-  int __pyx_v_ngate;
-  PyObject *__pyx_r = NULL;
+static int __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, PyObject *__pyx_v_grid_shape, PyObject *__pyx_v_grid_starts, PyObject *__pyx_v_grid_steps, __Pyx_memviewslice __pyx_v_grid_sum, __Pyx_memviewslice __pyx_v_grid_wsum) {
+  PyObject *__pyx_v_nz = NULL;
+  PyObject *__pyx_v_ny = NULL;
+  PyObject *__pyx_v_nx = NULL;
+  PyObject *__pyx_v_z_start = NULL;
+  PyObject *__pyx_v_y_start = NULL;
+  PyObject *__pyx_v_x_start = NULL;
+  PyObject *__pyx_v_z_step = NULL;
+  PyObject *__pyx_v_y_step = NULL;
+  PyObject *__pyx_v_x_step = NULL;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
+  PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *(*__pyx_t_6)(PyObject *);
-  float __pyx_t_7;
-  float __pyx_t_8;
-  float __pyx_t_9;
-  int __pyx_t_10;
-  int __pyx_t_11;
-  int __pyx_t_12;
-  int __pyx_t_13;
-  int __pyx_t_14;
-  int __pyx_t_15;
-  int __pyx_t_16;
-  int __pyx_t_17;
-  int __pyx_t_18;
-  int __pyx_t_19;
-  __Pyx_memviewslice __pyx_t_20 = { 0, 0, { 0 }, { 0 }, { 0 } };
-  __Pyx_memviewslice __pyx_t_21 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  float __pyx_t_4;
+  int __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("map_gates_to_grid", 0);
-
-  /* "pyart/map/_gate_to_grid_map.pyx":277
- *         cdef float x_offset, y_offset, z_offset
- * 
- *         nrays = len(elevations)             # <<<<<<<<<<<<<<
- *         ngates = len(ranges)
- *         z_offset, y_offset, x_offset = offset
- */
-  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_elevations, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_nrays = __pyx_t_2;
+  __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":278
+  /* "pyart/map/_gate_to_grid_map.pyx":272
  * 
- *         nrays = len(elevations)
- *         ngates = len(ranges)             # <<<<<<<<<<<<<<
- *         z_offset, y_offset, x_offset = offset
- *         for nray in range(nrays):
- */
-  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_ranges, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_ngates = __pyx_t_2;
-
-  /* "pyart/map/_gate_to_grid_map.pyx":279
- *         nrays = len(elevations)
- *         ngates = len(ranges)
- *         z_offset, y_offset, x_offset = offset             # <<<<<<<<<<<<<<
- *         for nray in range(nrays):
- *             # elevation and azimuth angles in radians
+ *         # unpack tuples
+ *         nz, ny, nx = grid_shape             # <<<<<<<<<<<<<<
+ *         z_start, y_start, x_start = grid_starts
+ *         z_step, y_step, x_step = grid_steps
  */
-  if ((likely(PyTuple_CheckExact(__pyx_v_offset))) || (PyList_CheckExact(__pyx_v_offset))) {
-    PyObject* sequence = __pyx_v_offset;
+  if (likely(__pyx_v_grid_shape != Py_None)) {
+    PyObject* sequence = __pyx_v_grid_shape;
     #if CYTHON_COMPILING_IN_CPYTHON
     Py_ssize_t size = Py_SIZE(sequence);
     #else
@@ -4474,842 +4275,6517 @@ static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_4ma
     if (unlikely(size != 3)) {
       if (size > 3) __Pyx_RaiseTooManyValuesError(3);
       else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     }
     #if CYTHON_COMPILING_IN_CPYTHON
-    if (likely(PyTuple_CheckExact(sequence))) {
-      __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
-      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1); 
-      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 2); 
-    } else {
-      __pyx_t_1 = PyList_GET_ITEM(sequence, 0); 
-      __pyx_t_3 = PyList_GET_ITEM(sequence, 1); 
-      __pyx_t_4 = PyList_GET_ITEM(sequence, 2); 
-    }
+    __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
+    __pyx_t_2 = PyTuple_GET_ITEM(sequence, 1); 
+    __pyx_t_3 = PyTuple_GET_ITEM(sequence, 2); 
     __Pyx_INCREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_2);
     __Pyx_INCREF(__pyx_t_3);
-    __Pyx_INCREF(__pyx_t_4);
     #else
-    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_4);
     #endif
   } else {
-    Py_ssize_t index = -1;
-    __pyx_t_5 = PyObject_GetIter(__pyx_v_offset); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = Py_TYPE(__pyx_t_5)->tp_iternext;
-    index = 0; __pyx_t_1 = __pyx_t_6(__pyx_t_5); if (unlikely(!__pyx_t_1)) goto __pyx_L3_unpacking_failed;
+    __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 272; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_v_nz = __pyx_t_1;
+  __pyx_t_1 = 0;
+  __pyx_v_ny = __pyx_t_2;
+  __pyx_t_2 = 0;
+  __pyx_v_nx = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":273
+ *         # unpack tuples
+ *         nz, ny, nx = grid_shape
+ *         z_start, y_start, x_start = grid_starts             # <<<<<<<<<<<<<<
+ *         z_step, y_step, x_step = grid_steps
+ * 
+ */
+  if (likely(__pyx_v_grid_starts != Py_None)) {
+    PyObject* sequence = __pyx_v_grid_starts;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    Py_ssize_t size = Py_SIZE(sequence);
+    #else
+    Py_ssize_t size = PySequence_Size(sequence);
+    #endif
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    #if CYTHON_COMPILING_IN_CPYTHON
+    __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
+    __pyx_t_2 = PyTuple_GET_ITEM(sequence, 1); 
+    __pyx_t_1 = PyTuple_GET_ITEM(sequence, 2); 
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_1);
+    #else
+    __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_1);
-    index = 1; __pyx_t_3 = __pyx_t_6(__pyx_t_5); if (unlikely(!__pyx_t_3)) goto __pyx_L3_unpacking_failed;
+    #endif
+  } else {
+    __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_v_z_start = __pyx_t_3;
+  __pyx_t_3 = 0;
+  __pyx_v_y_start = __pyx_t_2;
+  __pyx_t_2 = 0;
+  __pyx_v_x_start = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":274
+ *         nz, ny, nx = grid_shape
+ *         z_start, y_start, x_start = grid_starts
+ *         z_step, y_step, x_step = grid_steps             # <<<<<<<<<<<<<<
+ * 
+ *         # set attributes
+ */
+  if (likely(__pyx_v_grid_steps != Py_None)) {
+    PyObject* sequence = __pyx_v_grid_steps;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    Py_ssize_t size = Py_SIZE(sequence);
+    #else
+    Py_ssize_t size = PySequence_Size(sequence);
+    #endif
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    #if CYTHON_COMPILING_IN_CPYTHON
+    __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
+    __pyx_t_2 = PyTuple_GET_ITEM(sequence, 1); 
+    __pyx_t_3 = PyTuple_GET_ITEM(sequence, 2); 
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_3);
+    #else
+    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     __Pyx_GOTREF(__pyx_t_3);
-    index = 2; __pyx_t_4 = __pyx_t_6(__pyx_t_5); if (unlikely(!__pyx_t_4)) goto __pyx_L3_unpacking_failed;
-    __Pyx_GOTREF(__pyx_t_4);
-    if (__Pyx_IternextUnpackEndCheck(__pyx_t_6(__pyx_t_5), 3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_6 = NULL;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    goto __pyx_L4_unpacking_done;
-    __pyx_L3_unpacking_failed:;
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __pyx_t_6 = NULL;
-    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_L4_unpacking_done:;
+    #endif
+  } else {
+    __Pyx_RaiseNoneNotIterableError(); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 274; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
-  __pyx_t_7 = __pyx_PyFloat_AsFloat(__pyx_t_1); if (unlikely((__pyx_t_7 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_8 = __pyx_PyFloat_AsFloat(__pyx_t_3); if (unlikely((__pyx_t_8 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_9 = __pyx_PyFloat_AsFloat(__pyx_t_4); if (unlikely((__pyx_t_9 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_v_z_offset = __pyx_t_7;
-  __pyx_v_y_offset = __pyx_t_8;
-  __pyx_v_x_offset = __pyx_t_9;
+  __pyx_v_z_step = __pyx_t_1;
+  __pyx_t_1 = 0;
+  __pyx_v_y_step = __pyx_t_2;
+  __pyx_t_2 = 0;
+  __pyx_v_x_step = __pyx_t_3;
+  __pyx_t_3 = 0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":277
+ * 
+ *         # set attributes
+ *         self.x_step = x_step             # <<<<<<<<<<<<<<
+ *         self.y_step = y_step
+ *         self.z_step = z_step
+ */
+  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_x_step); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_self->x_step = __pyx_t_4;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":278
+ *         # set attributes
+ *         self.x_step = x_step
+ *         self.y_step = y_step             # <<<<<<<<<<<<<<
+ *         self.z_step = z_step
+ *         self.x_start = x_start
+ */
+  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_y_step); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_self->y_step = __pyx_t_4;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":279
+ *         self.x_step = x_step
+ *         self.y_step = y_step
+ *         self.z_step = z_step             # <<<<<<<<<<<<<<
+ *         self.x_start = x_start
+ *         self.y_start = y_start
+ */
+  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_z_step); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_self->z_step = __pyx_t_4;
 
   /* "pyart/map/_gate_to_grid_map.pyx":280
- *         ngates = len(ranges)
- *         z_offset, y_offset, x_offset = offset
- *         for nray in range(nrays):             # <<<<<<<<<<<<<<
- *             # elevation and azimuth angles in radians
- *             elevation = elevations[nray] * PI / 180.0
+ *         self.y_step = y_step
+ *         self.z_step = z_step
+ *         self.x_start = x_start             # <<<<<<<<<<<<<<
+ *         self.y_start = y_start
+ *         self.z_start = z_start
  */
-  __pyx_t_10 = __pyx_v_nrays;
-  for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
-    __pyx_v_nray = __pyx_t_11;
+  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_x_start); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 280; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_self->x_start = __pyx_t_4;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":282
- *         for nray in range(nrays):
- *             # elevation and azimuth angles in radians
- *             elevation = elevations[nray] * PI / 180.0             # <<<<<<<<<<<<<<
- *             azimuth = azimuths[nray] * PI / 180.0
- *             for ngate in range(ngates):
+  /* "pyart/map/_gate_to_grid_map.pyx":281
+ *         self.z_step = z_step
+ *         self.x_start = x_start
+ *         self.y_start = y_start             # <<<<<<<<<<<<<<
+ *         self.z_start = z_start
+ *         self.nx = nx
  */
-    __pyx_t_12 = __pyx_v_nray;
-    __pyx_v_elevation = (((*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_elevations.data) + __pyx_t_12)) ))) * __pyx_v_5pyart_3map_17_gate_to_grid_map_PI) / 180.0);
+  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_y_start); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_self->y_start = __pyx_t_4;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":283
- *             # elevation and azimuth angles in radians
- *             elevation = elevations[nray] * PI / 180.0
- *             azimuth = azimuths[nray] * PI / 180.0             # <<<<<<<<<<<<<<
- *             for ngate in range(ngates):
- * 
+  /* "pyart/map/_gate_to_grid_map.pyx":282
+ *         self.x_start = x_start
+ *         self.y_start = y_start
+ *         self.z_start = z_start             # <<<<<<<<<<<<<<
+ *         self.nx = nx
+ *         self.ny = ny
  */
-    __pyx_t_13 = __pyx_v_nray;
-    __pyx_v_azimuth = (((*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_azimuths.data) + __pyx_t_13)) ))) * __pyx_v_5pyart_3map_17_gate_to_grid_map_PI) / 180.0);
+  __pyx_t_4 = __pyx_PyFloat_AsFloat(__pyx_v_z_start); if (unlikely((__pyx_t_4 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_self->z_start = __pyx_t_4;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":284
- *             elevation = elevations[nray] * PI / 180.0
- *             azimuth = azimuths[nray] * PI / 180.0
- *             for ngate in range(ngates):             # <<<<<<<<<<<<<<
- * 
- *                 # continue if gate excluded
+  /* "pyart/map/_gate_to_grid_map.pyx":283
+ *         self.y_start = y_start
+ *         self.z_start = z_start
+ *         self.nx = nx             # <<<<<<<<<<<<<<
+ *         self.ny = ny
+ *         self.nz = nz
  */
-    __pyx_t_14 = __pyx_v_ngates;
-    for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
-      __pyx_v_ngate = __pyx_t_15;
+  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_nx); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 283; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_self->nx = __pyx_t_5;
 
-      /* "pyart/map/_gate_to_grid_map.pyx":287
- * 
- *                 # continue if gate excluded
- *                 if excluded_gates[nray, ngate]:             # <<<<<<<<<<<<<<
- *                     continue
- * 
+  /* "pyart/map/_gate_to_grid_map.pyx":284
+ *         self.z_start = z_start
+ *         self.nx = nx
+ *         self.ny = ny             # <<<<<<<<<<<<<<
+ *         self.nz = nz
+ *         self.nfields = grid_sum.shape[3]
  */
-      __pyx_t_16 = __pyx_v_nray;
-      __pyx_t_17 = __pyx_v_ngate;
-      __pyx_t_18 = ((*((char *) ( /* dim=1 */ ((char *) (((char *) ( /* dim=0 */ (__pyx_v_excluded_gates.data + __pyx_t_16 * __pyx_v_excluded_gates.strides[0]) )) + __pyx_t_17)) ))) != 0);
-      if (__pyx_t_18) {
+  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_ny); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 284; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_self->ny = __pyx_t_5;
 
-        /* "pyart/map/_gate_to_grid_map.pyx":288
- *                 # continue if gate excluded
- *                 if excluded_gates[nray, ngate]:
- *                     continue             # <<<<<<<<<<<<<<
- * 
- *                 # calculate cartesian coordinate assuming 4/3 earth radius
+  /* "pyart/map/_gate_to_grid_map.pyx":285
+ *         self.nx = nx
+ *         self.ny = ny
+ *         self.nz = nz             # <<<<<<<<<<<<<<
+ *         self.nfields = grid_sum.shape[3]
+ *         self.grid_sum = grid_sum
  */
-        goto __pyx_L7_continue;
-      }
+  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_nz); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 285; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_self->nz = __pyx_t_5;
 
-      /* "pyart/map/_gate_to_grid_map.pyx":291
- * 
- *                 # calculate cartesian coordinate assuming 4/3 earth radius
- *                 r = ranges[ngate]             # <<<<<<<<<<<<<<
- *                 z = (r**2 + R**2 + 2.0*r*R*sin(elevation))**0.5 - R
- *                 if z + z_offset >= toa:
+  /* "pyart/map/_gate_to_grid_map.pyx":286
+ *         self.ny = ny
+ *         self.nz = nz
+ *         self.nfields = grid_sum.shape[3]             # <<<<<<<<<<<<<<
+ *         self.grid_sum = grid_sum
+ *         self.grid_wsum = grid_wsum
  */
-      __pyx_t_19 = __pyx_v_ngate;
-      __pyx_v_r = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_ranges.data) + __pyx_t_19)) )));
-
-      /* "pyart/map/_gate_to_grid_map.pyx":292
- *                 # calculate cartesian coordinate assuming 4/3 earth radius
- *                 r = ranges[ngate]
- *                 z = (r**2 + R**2 + 2.0*r*R*sin(elevation))**0.5 - R             # <<<<<<<<<<<<<<
- *                 if z + z_offset >= toa:
- *                     continue    # above top of atmosphere
- */
-      __pyx_v_z = (pow(((powf(__pyx_v_r, 2.0) + powf(__pyx_v_5pyart_3map_17_gate_to_grid_map_R, 2.0)) + (((2.0 * __pyx_v_r) * __pyx_v_5pyart_3map_17_gate_to_grid_map_R) * sin(__pyx_v_elevation))), 0.5) - __pyx_v_5pyart_3map_17_gate_to_grid_map_R);
-
-      /* "pyart/map/_gate_to_grid_map.pyx":293
- *                 r = ranges[ngate]
- *                 z = (r**2 + R**2 + 2.0*r*R*sin(elevation))**0.5 - R
- *                 if z + z_offset >= toa:             # <<<<<<<<<<<<<<
- *                     continue    # above top of atmosphere
- *                 s = R * asin(r * cos(elevation) / (R + z))  # arc length in m.
- */
-      __pyx_t_18 = (((__pyx_v_z + __pyx_v_z_offset) >= __pyx_v_toa) != 0);
-      if (__pyx_t_18) {
-
-        /* "pyart/map/_gate_to_grid_map.pyx":294
- *                 z = (r**2 + R**2 + 2.0*r*R*sin(elevation))**0.5 - R
- *                 if z + z_offset >= toa:
- *                     continue    # above top of atmosphere             # <<<<<<<<<<<<<<
- *                 s = R * asin(r * cos(elevation) / (R + z))  # arc length in m.
- *                 x = s * sin(azimuth)
- */
-        goto __pyx_L7_continue;
-      }
+  __pyx_v_self->nfields = (__pyx_v_grid_sum.shape[3]);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":287
+ *         self.nz = nz
+ *         self.nfields = grid_sum.shape[3]
+ *         self.grid_sum = grid_sum             # <<<<<<<<<<<<<<
+ *         self.grid_wsum = grid_wsum
+ *         return
+ */
+  __PYX_XDEC_MEMVIEW(&__pyx_v_self->grid_sum, 0);
+  __PYX_INC_MEMVIEW(&__pyx_v_grid_sum, 0);
+  __pyx_v_self->grid_sum = __pyx_v_grid_sum;
 
-      /* "pyart/map/_gate_to_grid_map.pyx":295
- *                 if z + z_offset >= toa:
- *                     continue    # above top of atmosphere
- *                 s = R * asin(r * cos(elevation) / (R + z))  # arc length in m.             # <<<<<<<<<<<<<<
- *                 x = s * sin(azimuth)
- *                 y = s * cos(azimuth)
+  /* "pyart/map/_gate_to_grid_map.pyx":288
+ *         self.nfields = grid_sum.shape[3]
+ *         self.grid_sum = grid_sum
+ *         self.grid_wsum = grid_wsum             # <<<<<<<<<<<<<<
+ *         return
+ * 
  */
-      __pyx_v_s = (__pyx_v_5pyart_3map_17_gate_to_grid_map_R * asin(((__pyx_v_r * cos(__pyx_v_elevation)) / (__pyx_v_5pyart_3map_17_gate_to_grid_map_R + __pyx_v_z))));
+  __PYX_XDEC_MEMVIEW(&__pyx_v_self->grid_wsum, 0);
+  __PYX_INC_MEMVIEW(&__pyx_v_grid_wsum, 0);
+  __pyx_v_self->grid_wsum = __pyx_v_grid_wsum;
 
-      /* "pyart/map/_gate_to_grid_map.pyx":296
- *                     continue    # above top of atmosphere
- *                 s = R * asin(r * cos(elevation) / (R + z))  # arc length in m.
- *                 x = s * sin(azimuth)             # <<<<<<<<<<<<<<
- *                 y = s * cos(azimuth)
+  /* "pyart/map/_gate_to_grid_map.pyx":289
+ *         self.grid_sum = grid_sum
+ *         self.grid_wsum = grid_wsum
+ *         return             # <<<<<<<<<<<<<<
  * 
+ *     @cython.boundscheck(False)
  */
-      __pyx_v_x = (__pyx_v_s * sin(__pyx_v_azimuth));
+  __pyx_r = 0;
+  goto __pyx_L0;
 
-      /* "pyart/map/_gate_to_grid_map.pyx":297
- *                 s = R * asin(r * cos(elevation) / (R + z))  # arc length in m.
- *                 x = s * sin(azimuth)
- *                 y = s * cos(azimuth)             # <<<<<<<<<<<<<<
+  /* "pyart/map/_gate_to_grid_map.pyx":267
+ *     cdef float[:, :, :, ::1] grid_wsum
  * 
- *                 # add offsets
+ *     def __init__(self, tuple grid_shape, tuple grid_starts, tuple grid_steps,             # <<<<<<<<<<<<<<
+ *                  float[:, :, :, ::1] grid_sum, float[:, :, :, ::1] grid_wsum):
+ *         """ initialize. """
  */
-      __pyx_v_y = (__pyx_v_s * cos(__pyx_v_azimuth));
 
-      /* "pyart/map/_gate_to_grid_map.pyx":300
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_nz);
+  __Pyx_XDECREF(__pyx_v_ny);
+  __Pyx_XDECREF(__pyx_v_nx);
+  __Pyx_XDECREF(__pyx_v_z_start);
+  __Pyx_XDECREF(__pyx_v_y_start);
+  __Pyx_XDECREF(__pyx_v_x_start);
+  __Pyx_XDECREF(__pyx_v_z_step);
+  __Pyx_XDECREF(__pyx_v_y_step);
+  __Pyx_XDECREF(__pyx_v_x_step);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_grid_sum, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_grid_wsum, 1);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":293
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     def find_roi_for_grid(             # <<<<<<<<<<<<<<
+ *             self, float[:, :, ::1] roi_array, RoIFunction roi_func):
+ *         """
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_3find_roi_for_grid(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_2find_roi_for_grid[] = "\n        Fill in the radius of influence for each point in the grid.\n\n        Parameters\n        ----------\n        roi_array : 3D float32 array\n            Array which will be filled by the radius of influence for each\n            point in the grid.\n        roi_func : RoIFunction\n            Object whose get_roi method returns the radius of influence.\n\n        ";
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_3find_roi_for_grid(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_roi_array = { 0, 0, { 0 }, { 0 }, { 0 } };
+  struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("find_roi_for_grid (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_roi_array,&__pyx_n_s_roi_func,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_roi_array)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_roi_func)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_roi_for_grid", 1, 2, 2, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 293; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "find_roi_for_grid") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 293; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_roi_array = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(values[0]); if (unlikely(!__pyx_v_roi_array.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_roi_func = ((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *)values[1]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("find_roi_for_grid", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 293; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.find_roi_for_grid", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_roi_func), __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction, 1, "roi_func", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 294; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_2find_roi_for_grid(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *)__pyx_v_self), __pyx_v_roi_array, __pyx_v_roi_func);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_2find_roi_for_grid(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, __Pyx_memviewslice __pyx_v_roi_array, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func) {
+  int __pyx_v_ix;
+  int __pyx_v_iy;
+  int __pyx_v_iz;
+  float __pyx_v_x;
+  float __pyx_v_y;
+  float __pyx_v_z;
+  float __pyx_v_roi;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  __Pyx_RefNannySetupContext("find_roi_for_grid", 0);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":309
+ *         cdef int ix, iy, iz
+ *         cdef float x, y, z, roi
+ *         for ix in range(self.nx):             # <<<<<<<<<<<<<<
+ *             for iy in range(self.ny):
+ *                 for iz in range(self.nz):
+ */
+  __pyx_t_1 = __pyx_v_self->nx;
+  for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_ix = __pyx_t_2;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":310
+ *         cdef float x, y, z, roi
+ *         for ix in range(self.nx):
+ *             for iy in range(self.ny):             # <<<<<<<<<<<<<<
+ *                 for iz in range(self.nz):
+ *                     x = self.x_start + self.x_step * ix
+ */
+    __pyx_t_3 = __pyx_v_self->ny;
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_iy = __pyx_t_4;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":311
+ *         for ix in range(self.nx):
+ *             for iy in range(self.ny):
+ *                 for iz in range(self.nz):             # <<<<<<<<<<<<<<
+ *                     x = self.x_start + self.x_step * ix
+ *                     y = self.y_start + self.y_step * iy
+ */
+      __pyx_t_5 = __pyx_v_self->nz;
+      for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+        __pyx_v_iz = __pyx_t_6;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":312
+ *             for iy in range(self.ny):
+ *                 for iz in range(self.nz):
+ *                     x = self.x_start + self.x_step * ix             # <<<<<<<<<<<<<<
+ *                     y = self.y_start + self.y_step * iy
+ *                     z = self.z_start + self.z_step * iz
+ */
+        __pyx_v_x = (__pyx_v_self->x_start + (__pyx_v_self->x_step * __pyx_v_ix));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":313
+ *                 for iz in range(self.nz):
+ *                     x = self.x_start + self.x_step * ix
+ *                     y = self.y_start + self.y_step * iy             # <<<<<<<<<<<<<<
+ *                     z = self.z_start + self.z_step * iz
+ *                     roi = roi_func.get_roi(z, y, x)
+ */
+        __pyx_v_y = (__pyx_v_self->y_start + (__pyx_v_self->y_step * __pyx_v_iy));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":314
+ *                     x = self.x_start + self.x_step * ix
+ *                     y = self.y_start + self.y_step * iy
+ *                     z = self.z_start + self.z_step * iz             # <<<<<<<<<<<<<<
+ *                     roi = roi_func.get_roi(z, y, x)
+ *                     roi_array[iz, iy, ix] = roi
+ */
+        __pyx_v_z = (__pyx_v_self->z_start + (__pyx_v_self->z_step * __pyx_v_iz));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":315
+ *                     y = self.y_start + self.y_step * iy
+ *                     z = self.z_start + self.z_step * iz
+ *                     roi = roi_func.get_roi(z, y, x)             # <<<<<<<<<<<<<<
+ *                     roi_array[iz, iy, ix] = roi
+ *         return
+ */
+        __pyx_v_roi = ((struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction *)__pyx_v_roi_func->__pyx_vtab)->get_roi(__pyx_v_roi_func, __pyx_v_z, __pyx_v_y, __pyx_v_x, 0);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":316
+ *                     z = self.z_start + self.z_step * iz
+ *                     roi = roi_func.get_roi(z, y, x)
+ *                     roi_array[iz, iy, ix] = roi             # <<<<<<<<<<<<<<
+ *         return
+ * 
+ */
+        __pyx_t_7 = __pyx_v_iz;
+        __pyx_t_8 = __pyx_v_iy;
+        __pyx_t_9 = __pyx_v_ix;
+        *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_roi_array.data + __pyx_t_7 * __pyx_v_roi_array.strides[0]) ) + __pyx_t_8 * __pyx_v_roi_array.strides[1]) )) + __pyx_t_9)) )) = __pyx_v_roi;
+      }
+    }
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":317
+ *                     roi = roi_func.get_roi(z, y, x)
+ *                     roi_array[iz, iy, ix] = roi
+ *         return             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.cdivision(True)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":293
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     def find_roi_for_grid(             # <<<<<<<<<<<<<<
+ *             self, float[:, :, ::1] roi_array, RoIFunction roi_func):
+ *         """
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_roi_array, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":322
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     def map_gates_to_grid(             # <<<<<<<<<<<<<<
+ *             self, float[::1] elevations, float[::1] azimuths,
+ *             float[::1] ranges, list field_data, list field_mask,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_5map_gates_to_grid(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_4map_gates_to_grid[] = "\n        Map radar gates unto the regular grid.\n\n        The grid_sum and grid_wsum arrays used to initalize the class\n        are update with the mapped gate data.\n\n        The field data is read in place a block of rays at a time, no copy\n        of the radar fields is made.  The location and radius of influence\n        of each gate are found once and the gates are mapped onto the grid\n        with the GIL released, only the buffer acquisition of the field\n        data and any RoIFunction whose get_roi method is implemented in\n        Python require the GIL.  Separate instances of this class, each\n        with their own grid_sum and grid_wsum arrays, can therefore map\n        different rays from a radar concurrently in multiple threads.\n\n        Parameters\n        ----------\n        elevations, azimuths : 1D float32 array\n            Elevation and azimuth angles in degrees for each ray in the radar.\n        ranges : 1D float32 array\n            Gate ranges in meters for each bin in the radar.\n        field_data : list of 2D arrays\n            Field data for each field to map, dimensions are ordered as\n            nrays, ngates.  float32, float64, int8, uint8, int16, uint16\n            and int32 arrays are supported, arrays do not need to be\n            contiguous.\n        field_mask : list of 2D uint8 arrays or None\n            Masking of the field data for each field, dimension are\n            ordered as nrays, ngates.  Gates with non-zero values will not\n            be included in the mapping of that field.  None indicates that\n            no gates in the field are masked.\n        scale_factors, add_offsets : 1D float32 array\n            Scale factor and offset applied to the field data for each\n            field, the mapped value is data * scale_factor + add_offset.\n        excluded_gates : 2D uint8 array\n            Array containing gate masking information.  Gates with non-zero\n            values will not be included in the"" mapping.\n        offset : tuple of floats\n            Offset of the radar from the grid origin.  Dimension are ordered\n            as z, y, x.\n        toa : float\n            Top of atmosphere.  Gates above this level are considered.\n        roi_func : RoIFunction\n            Object whose get_roi method returns the radius of influence.\n        weighting_function : int\n            Function to use for weighting gates based upon distance.\n            0 for Barnes, 1 for Cressman weighting.\n        ray_start, ray_end : int\n            Range of rays, [ray_start, ray_end), to map.  The default maps\n            all rays, a ray_end of -1 indicates the last ray.\n\n        ";
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_5map_gates_to_grid(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_elevations = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_azimuths = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ranges = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_v_field_data = 0;
+  PyObject *__pyx_v_field_mask = 0;
+  __Pyx_memviewslice __pyx_v_scale_factors = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_add_offsets = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_excluded_gates = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_v_offset = 0;
+  float __pyx_v_toa;
+  struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func = 0;
+  int __pyx_v_weighting_function;
+  int __pyx_v_ray_start;
+  int __pyx_v_ray_end;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("map_gates_to_grid (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_elevations,&__pyx_n_s_azimuths,&__pyx_n_s_ranges,&__pyx_n_s_field_data,&__pyx_n_s_field_mask,&__pyx_n_s_scale_factors,&__pyx_n_s_add_offsets,&__pyx_n_s_excluded_gates,&__pyx_n_s_offset,&__pyx_n_s_toa,&__pyx_n_s_roi_func,&__pyx_n_s_weighting_function,&__pyx_n_s_ray_start,&__pyx_n_s_ray_end,0};
+    PyObject* values[14] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 14: values[13] = PyTuple_GET_ITEM(__pyx_args, 13);
+        case 13: values[12] = PyTuple_GET_ITEM(__pyx_args, 12);
+        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_elevations)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_azimuths)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ranges)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_field_data)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_field_mask)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_scale_factors)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_add_offsets)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_excluded_gates)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  8:
+        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  9:
+        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_toa)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 10:
+        if (likely((values[10] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_roi_func)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, 10); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 11:
+        if (likely((values[11] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_weighting_function)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, 11); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 12:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ray_start);
+          if (value) { values[12] = value; kw_args--; }
+        }
+        case 13:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ray_end);
+          if (value) { values[13] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "map_gates_to_grid") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case 14: values[13] = PyTuple_GET_ITEM(__pyx_args, 13);
+        case 13: values[12] = PyTuple_GET_ITEM(__pyx_args, 12);
+        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+        values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_elevations = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_elevations.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_azimuths = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[1]); if (unlikely(!__pyx_v_azimuths.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_ranges = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[2]); if (unlikely(!__pyx_v_ranges.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 324; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_field_data = ((PyObject*)values[3]);
+    __pyx_v_field_mask = ((PyObject*)values[4]);
+    __pyx_v_scale_factors = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[5]); if (unlikely(!__pyx_v_scale_factors.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_add_offsets = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[6]); if (unlikely(!__pyx_v_add_offsets.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_excluded_gates = __Pyx_PyObject_to_MemoryviewSlice_d_dc_char(values[7]); if (unlikely(!__pyx_v_excluded_gates.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_offset = values[8];
+    __pyx_v_toa = __pyx_PyFloat_AsFloat(values[9]); if (unlikely((__pyx_v_toa == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_roi_func = ((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *)values[10]);
+    __pyx_v_weighting_function = __Pyx_PyInt_As_int(values[11]); if (unlikely((__pyx_v_weighting_function == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    if (values[12]) {
+      __pyx_v_ray_start = __Pyx_PyInt_As_int(values[12]); if (unlikely((__pyx_v_ray_start == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_ray_start = ((int)0);
+    }
+    if (values[13]) {
+      __pyx_v_ray_end = __Pyx_PyInt_As_int(values[13]); if (unlikely((__pyx_v_ray_end == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 328; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    } else {
+      __pyx_v_ray_end = ((int)-1);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("map_gates_to_grid", 0, 12, 14, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.map_gates_to_grid", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_data), (&PyList_Type), 1, "field_data", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_field_mask), (&PyList_Type), 1, "field_mask", 1))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 324; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_roi_func), __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction, 1, "roi_func", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 327; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_4map_gates_to_grid(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *)__pyx_v_self), __pyx_v_elevations, __pyx_v_azimuths, __pyx_v_ranges, __pyx_v_field_data, __pyx_v_field_mask, __pyx_v_scale_factors, __pyx_v_add_offsets, __pyx_v_excluded_gates, __pyx_v_offset, __pyx_v_toa, __pyx_v_roi_func, __pyx_v_weighting_function, __pyx_v_ray_start, __pyx_v_ray_end);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_4map_gates_to_grid(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, __Pyx_memviewslice __pyx_v_elevations, __Pyx_memviewslice __pyx_v_azimuths, __Pyx_memviewslice __pyx_v_ranges, PyObject *__pyx_v_field_data, PyObject *__pyx_v_field_mask, __Pyx_memviewslice __pyx_v_scale_factors, __Pyx_memviewslice __pyx_v_add_offsets, __Pyx_memviewslice __pyx_v_excluded_gates, PyObject *__pyx_v_offset, float __pyx_v_toa, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func, int __pyx_v_weighting_function, int __pyx_v_ray_start, int __pyx_v_ray_end) {
+  int __pyx_v_nrays;
+  int __pyx_v_ngates;
+  int __pyx_v_nray;
+  int __pyx_v_ngate;
+  int __pyx_v_i;
+  int __pyx_v_nblock;
+  int __pyx_v_block_start;
+  int __pyx_v_block_end;
+  float __pyx_v_x_offset;
+  float __pyx_v_y_offset;
+  float __pyx_v_z_offset;
+  __Pyx_memviewslice __pyx_v_ray_data = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ray_mask = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_gate_info = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_mask = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_nogil_roi;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *(*__pyx_t_8)(PyObject *);
+  float __pyx_t_9;
+  float __pyx_t_10;
+  float __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  PyObject *__pyx_t_15 = NULL;
+  __Pyx_memviewslice __pyx_t_16 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_17 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *(*__pyx_t_18)(PyObject *);
+  int __pyx_t_19;
+  int __pyx_t_20;
+  int __pyx_t_21;
+  int __pyx_t_22;
+  int __pyx_t_23;
+  int __pyx_t_24;
+  int __pyx_t_25;
+  int __pyx_t_26;
+  __Pyx_memviewslice __pyx_t_27 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_t_28;
+  int __pyx_t_29;
+  int __pyx_t_30;
+  int __pyx_t_31;
+  int __pyx_t_32;
+  Py_ssize_t __pyx_t_33;
+  int __pyx_t_34;
+  int __pyx_t_35;
+  Py_ssize_t __pyx_t_36;
+  int __pyx_t_37;
+  int __pyx_t_38;
+  Py_ssize_t __pyx_t_39;
+  int __pyx_t_40;
+  int __pyx_t_41;
+  Py_ssize_t __pyx_t_42;
+  int __pyx_t_43;
+  int __pyx_t_44;
+  Py_ssize_t __pyx_t_45;
+  int __pyx_t_46;
+  int __pyx_t_47;
+  Py_ssize_t __pyx_t_48;
+  int __pyx_t_49;
+  int __pyx_t_50;
+  Py_ssize_t __pyx_t_51;
+  int __pyx_t_52;
+  int __pyx_t_53;
+  Py_ssize_t __pyx_t_54;
+  int __pyx_t_55;
+  int __pyx_t_56;
+  Py_ssize_t __pyx_t_57;
+  int __pyx_t_58;
+  int __pyx_t_59;
+  Py_ssize_t __pyx_t_60;
+  __Pyx_memviewslice __pyx_t_61 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_62 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("map_gates_to_grid", 0);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":391
+ *         cdef bint nogil_roi
+ * 
+ *         nrays = len(elevations)             # <<<<<<<<<<<<<<
+ *         ngates = len(ranges)
+ *         if ray_end < 0 or ray_end > nrays:
+ */
+  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_elevations, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 391; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_nrays = __pyx_t_2;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":392
+ * 
+ *         nrays = len(elevations)
+ *         ngates = len(ranges)             # <<<<<<<<<<<<<<
+ *         if ray_end < 0 or ray_end > nrays:
+ *             ray_end = nrays
+ */
+  __pyx_t_1 = __pyx_memoryview_fromslice(__pyx_v_ranges, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_2 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 392; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_ngates = __pyx_t_2;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":393
+ *         nrays = len(elevations)
+ *         ngates = len(ranges)
+ *         if ray_end < 0 or ray_end > nrays:             # <<<<<<<<<<<<<<
+ *             ray_end = nrays
+ *         if ray_start < 0:
+ */
+  __pyx_t_4 = ((__pyx_v_ray_end < 0) != 0);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_ray_end > __pyx_v_nrays) != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":394
+ *         ngates = len(ranges)
+ *         if ray_end < 0 or ray_end > nrays:
+ *             ray_end = nrays             # <<<<<<<<<<<<<<
+ *         if ray_start < 0:
+ *             ray_start = 0
+ */
+    __pyx_v_ray_end = __pyx_v_nrays;
+    goto __pyx_L3;
+  }
+  __pyx_L3:;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":395
+ *         if ray_end < 0 or ray_end > nrays:
+ *             ray_end = nrays
+ *         if ray_start < 0:             # <<<<<<<<<<<<<<
+ *             ray_start = 0
+ *         if ray_start >= ray_end or ngates == 0 or self.nfields == 0:
+ */
+  __pyx_t_3 = ((__pyx_v_ray_start < 0) != 0);
+  if (__pyx_t_3) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":396
+ *             ray_end = nrays
+ *         if ray_start < 0:
+ *             ray_start = 0             # <<<<<<<<<<<<<<
+ *         if ray_start >= ray_end or ngates == 0 or self.nfields == 0:
+ *             return
+ */
+    __pyx_v_ray_start = 0;
+    goto __pyx_L6;
+  }
+  __pyx_L6:;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":397
+ *         if ray_start < 0:
+ *             ray_start = 0
+ *         if ray_start >= ray_end or ngates == 0 or self.nfields == 0:             # <<<<<<<<<<<<<<
+ *             return
+ *         z_offset, y_offset, x_offset = offset
+ */
+  __pyx_t_4 = ((__pyx_v_ray_start >= __pyx_v_ray_end) != 0);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_ngates == 0) != 0);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_3 = __pyx_t_4;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_4 = ((__pyx_v_self->nfields == 0) != 0);
+  __pyx_t_3 = __pyx_t_4;
+  __pyx_L8_bool_binop_done:;
+  if (__pyx_t_3) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":398
+ *             ray_start = 0
+ *         if ray_start >= ray_end or ngates == 0 or self.nfields == 0:
+ *             return             # <<<<<<<<<<<<<<
+ *         z_offset, y_offset, x_offset = offset
+ *         nogil_roi = _has_nogil_roi(roi_func)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":399
+ *         if ray_start >= ray_end or ngates == 0 or self.nfields == 0:
+ *             return
+ *         z_offset, y_offset, x_offset = offset             # <<<<<<<<<<<<<<
+ *         nogil_roi = _has_nogil_roi(roi_func)
+ * 
+ */
+  if ((likely(PyTuple_CheckExact(__pyx_v_offset))) || (PyList_CheckExact(__pyx_v_offset))) {
+    PyObject* sequence = __pyx_v_offset;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    Py_ssize_t size = Py_SIZE(sequence);
+    #else
+    Py_ssize_t size = PySequence_Size(sequence);
+    #endif
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    #if CYTHON_COMPILING_IN_CPYTHON
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_5 = PyTuple_GET_ITEM(sequence, 1); 
+      __pyx_t_6 = PyTuple_GET_ITEM(sequence, 2); 
+    } else {
+      __pyx_t_1 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_5 = PyList_GET_ITEM(sequence, 1); 
+      __pyx_t_6 = PyList_GET_ITEM(sequence, 2); 
+    }
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_t_6);
+    #else
+    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_6);
+    #endif
+  } else {
+    Py_ssize_t index = -1;
+    __pyx_t_7 = PyObject_GetIter(__pyx_v_offset); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_8 = Py_TYPE(__pyx_t_7)->tp_iternext;
+    index = 0; __pyx_t_1 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_1)) goto __pyx_L11_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_1);
+    index = 1; __pyx_t_5 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_5)) goto __pyx_L11_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_5);
+    index = 2; __pyx_t_6 = __pyx_t_8(__pyx_t_7); if (unlikely(!__pyx_t_6)) goto __pyx_L11_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_6);
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_8(__pyx_t_7), 3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_8 = NULL;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    goto __pyx_L12_unpacking_done;
+    __pyx_L11_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_8 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_L12_unpacking_done:;
+  }
+  __pyx_t_9 = __pyx_PyFloat_AsFloat(__pyx_t_1); if (unlikely((__pyx_t_9 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_10 = __pyx_PyFloat_AsFloat(__pyx_t_5); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_11 = __pyx_PyFloat_AsFloat(__pyx_t_6); if (unlikely((__pyx_t_11 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 399; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_v_z_offset = __pyx_t_9;
+  __pyx_v_y_offset = __pyx_t_10;
+  __pyx_v_x_offset = __pyx_t_11;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":400
+ *             return
+ *         z_offset, y_offset, x_offset = offset
+ *         nogil_roi = _has_nogil_roi(roi_func)             # <<<<<<<<<<<<<<
+ * 
+ *         # buffers holding the field data, masks, gate locations and radius
+ */
+  __pyx_v_nogil_roi = __pyx_f_5pyart_3map_17_gate_to_grid_map__has_nogil_roi(__pyx_v_roi_func);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":404
+ *         # buffers holding the field data, masks, gate locations and radius
+ *         # of influence for a block of rays
+ *         nblock = min(RAY_BLOCK_SIZE, ray_end - ray_start)             # <<<<<<<<<<<<<<
+ *         ray_data = cvarray(shape=(nblock, ngates, self.nfields),
+ *                            itemsize=sizeof(float), format='f')
+ */
+  __pyx_t_12 = (__pyx_v_ray_end - __pyx_v_ray_start);
+  __pyx_t_13 = __pyx_v_5pyart_3map_17_gate_to_grid_map_RAY_BLOCK_SIZE;
+  if (((__pyx_t_12 < __pyx_t_13) != 0)) {
+    __pyx_t_14 = __pyx_t_12;
+  } else {
+    __pyx_t_14 = __pyx_t_13;
+  }
+  __pyx_v_nblock = __pyx_t_14;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":405
+ *         # of influence for a block of rays
+ *         nblock = min(RAY_BLOCK_SIZE, ray_end - ray_start)
+ *         ray_data = cvarray(shape=(nblock, ngates, self.nfields),             # <<<<<<<<<<<<<<
+ *                            itemsize=sizeof(float), format='f')
+ *         ray_mask = cvarray(shape=(nblock, ngates, self.nfields),
+ */
+  __pyx_t_6 = PyDict_New(); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_nblock); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_ngates); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_self->nfields); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_15 = PyTuple_New(3); if (unlikely(!__pyx_t_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_15);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_15, 2, __pyx_t_7);
+  __pyx_t_5 = 0;
+  __pyx_t_1 = 0;
+  __pyx_t_7 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_shape, __pyx_t_15) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":406
+ *         nblock = min(RAY_BLOCK_SIZE, ray_end - ray_start)
+ *         ray_data = cvarray(shape=(nblock, ngates, self.nfields),
+ *                            itemsize=sizeof(float), format='f')             # <<<<<<<<<<<<<<
+ *         ray_mask = cvarray(shape=(nblock, ngates, self.nfields),
+ *                            itemsize=sizeof(char), format='c')
+ */
+  __pyx_t_15 = __Pyx_PyInt_FromSize_t((sizeof(float))); if (unlikely(!__pyx_t_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 406; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_15);
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_itemsize, __pyx_t_15) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+  if (PyDict_SetItem(__pyx_t_6, __pyx_n_s_format, __pyx_n_s_f) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pyart/map/_gate_to_grid_map.pyx":405
+ *         # of influence for a block of rays
+ *         nblock = min(RAY_BLOCK_SIZE, ray_end - ray_start)
+ *         ray_data = cvarray(shape=(nblock, ngates, self.nfields),             # <<<<<<<<<<<<<<
+ *                            itemsize=sizeof(float), format='f')
+ *         ray_mask = cvarray(shape=(nblock, ngates, self.nfields),
+ */
+  __pyx_t_15 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_array_type)), __pyx_empty_tuple, __pyx_t_6); if (unlikely(!__pyx_t_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_15);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_16 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(__pyx_t_15);
+  if (unlikely(!__pyx_t_16.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 405; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+  __pyx_v_ray_data = __pyx_t_16;
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":407
+ *         ray_data = cvarray(shape=(nblock, ngates, self.nfields),
+ *                            itemsize=sizeof(float), format='f')
+ *         ray_mask = cvarray(shape=(nblock, ngates, self.nfields),             # <<<<<<<<<<<<<<
+ *                            itemsize=sizeof(char), format='c')
+ *         gate_info = cvarray(shape=(nblock, ngates, 4),
+ */
+  __pyx_t_15 = PyDict_New(); if (unlikely(!__pyx_t_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_15);
+  __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_nblock); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_ngates); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->nfields); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_5 = PyTuple_New(3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_5, 2, __pyx_t_1);
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_t_15, __pyx_n_s_shape, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":408
+ *                            itemsize=sizeof(float), format='f')
+ *         ray_mask = cvarray(shape=(nblock, ngates, self.nfields),
+ *                            itemsize=sizeof(char), format='c')             # <<<<<<<<<<<<<<
+ *         gate_info = cvarray(shape=(nblock, ngates, 4),
+ *                             itemsize=sizeof(float), format='f')
+ */
+  __pyx_t_5 = __Pyx_PyInt_FromSize_t((sizeof(char))); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 408; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  if (PyDict_SetItem(__pyx_t_15, __pyx_n_s_itemsize, __pyx_t_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (PyDict_SetItem(__pyx_t_15, __pyx_n_s_format, __pyx_n_s_c) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pyart/map/_gate_to_grid_map.pyx":407
+ *         ray_data = cvarray(shape=(nblock, ngates, self.nfields),
+ *                            itemsize=sizeof(float), format='f')
+ *         ray_mask = cvarray(shape=(nblock, ngates, self.nfields),             # <<<<<<<<<<<<<<
+ *                            itemsize=sizeof(char), format='c')
+ *         gate_info = cvarray(shape=(nblock, ngates, 4),
+ */
+  __pyx_t_5 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_array_type)), __pyx_empty_tuple, __pyx_t_15); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+  __pyx_t_17 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_char(__pyx_t_5);
+  if (unlikely(!__pyx_t_17.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 407; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_v_ray_mask = __pyx_t_17;
+  __pyx_t_17.memview = NULL;
+  __pyx_t_17.data = NULL;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":409
+ *         ray_mask = cvarray(shape=(nblock, ngates, self.nfields),
+ *                            itemsize=sizeof(char), format='c')
+ *         gate_info = cvarray(shape=(nblock, ngates, 4),             # <<<<<<<<<<<<<<
+ *                             itemsize=sizeof(float), format='f')
+ * 
+ */
+  __pyx_t_5 = PyDict_New(); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_15 = __Pyx_PyInt_From_int(__pyx_v_nblock); if (unlikely(!__pyx_t_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_15);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_ngates); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_7 = PyTuple_New(3); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_15);
+  PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_15);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_7, 1, __pyx_t_1);
+  __Pyx_INCREF(__pyx_int_4);
+  __Pyx_GIVEREF(__pyx_int_4);
+  PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_int_4);
+  __pyx_t_15 = 0;
+  __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_shape, __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":410
+ *                            itemsize=sizeof(char), format='c')
+ *         gate_info = cvarray(shape=(nblock, ngates, 4),
+ *                             itemsize=sizeof(float), format='f')             # <<<<<<<<<<<<<<
+ * 
+ *         for block_start in range(ray_start, ray_end, RAY_BLOCK_SIZE):
+ */
+  __pyx_t_7 = __Pyx_PyInt_FromSize_t((sizeof(float))); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 410; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_itemsize, __pyx_t_7) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_format, __pyx_n_s_f) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pyart/map/_gate_to_grid_map.pyx":409
+ *         ray_mask = cvarray(shape=(nblock, ngates, self.nfields),
+ *                            itemsize=sizeof(char), format='c')
+ *         gate_info = cvarray(shape=(nblock, ngates, 4),             # <<<<<<<<<<<<<<
+ *                             itemsize=sizeof(float), format='f')
+ * 
+ */
+  __pyx_t_7 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_array_type)), __pyx_empty_tuple, __pyx_t_5); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_16 = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(__pyx_t_7);
+  if (unlikely(!__pyx_t_16.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 409; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_v_gate_info = __pyx_t_16;
+  __pyx_t_16.memview = NULL;
+  __pyx_t_16.data = NULL;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":412
+ *                             itemsize=sizeof(float), format='f')
+ * 
+ *         for block_start in range(ray_start, ray_end, RAY_BLOCK_SIZE):             # <<<<<<<<<<<<<<
+ *             block_end = min(block_start + RAY_BLOCK_SIZE, ray_end)
+ * 
+ */
+  __pyx_t_7 = __Pyx_PyInt_From_int(__pyx_v_ray_start); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_ray_end); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_5pyart_3map_17_gate_to_grid_map_RAY_BLOCK_SIZE); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_15 = PyTuple_New(3); if (unlikely(!__pyx_t_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_15);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_t_7);
+  __Pyx_GIVEREF(__pyx_t_5);
+  PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_15, 2, __pyx_t_1);
+  __pyx_t_7 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_15, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_15 = __pyx_t_1; __Pyx_INCREF(__pyx_t_15); __pyx_t_2 = 0;
+    __pyx_t_18 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_15 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_15);
+    __pyx_t_18 = Py_TYPE(__pyx_t_15)->tp_iternext; if (unlikely(!__pyx_t_18)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_18)) {
+      if (likely(PyList_CheckExact(__pyx_t_15))) {
+        if (__pyx_t_2 >= PyList_GET_SIZE(__pyx_t_15)) break;
+        #if CYTHON_COMPILING_IN_CPYTHON
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_15, __pyx_t_2); __Pyx_INCREF(__pyx_t_1); __pyx_t_2++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_15, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      } else {
+        if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_15)) break;
+        #if CYTHON_COMPILING_IN_CPYTHON
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_15, __pyx_t_2); __Pyx_INCREF(__pyx_t_1); __pyx_t_2++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_15, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      }
+    } else {
+      __pyx_t_1 = __pyx_t_18(__pyx_t_15);
+      if (unlikely(!__pyx_t_1)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(exc_type == PyExc_StopIteration || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __pyx_t_14 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_14 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 412; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_block_start = __pyx_t_14;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":413
+ * 
+ *         for block_start in range(ray_start, ray_end, RAY_BLOCK_SIZE):
+ *             block_end = min(block_start + RAY_BLOCK_SIZE, ray_end)             # <<<<<<<<<<<<<<
+ * 
+ *             # load the field data and masks for the rays in the block
+ */
+    __pyx_t_14 = __pyx_v_ray_end;
+    __pyx_t_12 = (__pyx_v_block_start + __pyx_v_5pyart_3map_17_gate_to_grid_map_RAY_BLOCK_SIZE);
+    if (((__pyx_t_14 < __pyx_t_12) != 0)) {
+      __pyx_t_13 = __pyx_t_14;
+    } else {
+      __pyx_t_13 = __pyx_t_12;
+    }
+    __pyx_v_block_end = __pyx_t_13;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":416
+ * 
+ *             # load the field data and masks for the rays in the block
+ *             for i in range(self.nfields):             # <<<<<<<<<<<<<<
+ *                 _load_rays(field_data[i], block_start, block_end, i,
+ *                            scale_factors[i], add_offsets[i], ray_data)
+ */
+    __pyx_t_13 = __pyx_v_self->nfields;
+    for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+      __pyx_v_i = __pyx_t_14;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":417
+ *             # load the field data and masks for the rays in the block
+ *             for i in range(self.nfields):
+ *                 _load_rays(field_data[i], block_start, block_end, i,             # <<<<<<<<<<<<<<
+ *                            scale_factors[i], add_offsets[i], ray_data)
+ *                 if field_mask[i] is None:
+ */
+      if (unlikely(__pyx_v_field_data == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 417; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      __pyx_t_1 = PyList_GET_ITEM(__pyx_v_field_data, __pyx_v_i);
+      __Pyx_INCREF(__pyx_t_1);
+
+      /* "pyart/map/_gate_to_grid_map.pyx":418
+ *             for i in range(self.nfields):
+ *                 _load_rays(field_data[i], block_start, block_end, i,
+ *                            scale_factors[i], add_offsets[i], ray_data)             # <<<<<<<<<<<<<<
+ *                 if field_mask[i] is None:
+ *                     with nogil:
+ */
+      __pyx_t_12 = __pyx_v_i;
+      __pyx_t_19 = __pyx_v_i;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":417
+ *             # load the field data and masks for the rays in the block
+ *             for i in range(self.nfields):
+ *                 _load_rays(field_data[i], block_start, block_end, i,             # <<<<<<<<<<<<<<
+ *                            scale_factors[i], add_offsets[i], ray_data)
+ *                 if field_mask[i] is None:
+ */
+      __pyx_t_20 = __pyx_f_5pyart_3map_17_gate_to_grid_map__load_rays(__pyx_t_1, __pyx_v_block_start, __pyx_v_block_end, __pyx_v_i, (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_scale_factors.data) + __pyx_t_12)) ))), (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_add_offsets.data) + __pyx_t_19)) ))), __pyx_v_ray_data); if (unlikely(__pyx_t_20 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 417; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":419
+ *                 _load_rays(field_data[i], block_start, block_end, i,
+ *                            scale_factors[i], add_offsets[i], ray_data)
+ *                 if field_mask[i] is None:             # <<<<<<<<<<<<<<
+ *                     with nogil:
+ *                         for nray in range(block_end - block_start):
+ */
+      if (unlikely(__pyx_v_field_mask == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 419; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      }
+      __pyx_t_3 = (PyList_GET_ITEM(__pyx_v_field_mask, __pyx_v_i) == Py_None);
+      __pyx_t_4 = (__pyx_t_3 != 0);
+      if (__pyx_t_4) {
+
+        /* "pyart/map/_gate_to_grid_map.pyx":420
+ *                            scale_factors[i], add_offsets[i], ray_data)
+ *                 if field_mask[i] is None:
+ *                     with nogil:             # <<<<<<<<<<<<<<
+ *                         for nray in range(block_end - block_start):
+ *                             for ngate in range(ngates):
+ */
+        {
+            #ifdef WITH_THREAD
+            PyThreadState *_save;
+            Py_UNBLOCK_THREADS
+            #endif
+            /*try:*/ {
+
+              /* "pyart/map/_gate_to_grid_map.pyx":421
+ *                 if field_mask[i] is None:
+ *                     with nogil:
+ *                         for nray in range(block_end - block_start):             # <<<<<<<<<<<<<<
+ *                             for ngate in range(ngates):
+ *                                 ray_mask[nray, ngate, i] = 0
+ */
+              __pyx_t_20 = (__pyx_v_block_end - __pyx_v_block_start);
+              for (__pyx_t_21 = 0; __pyx_t_21 < __pyx_t_20; __pyx_t_21+=1) {
+                __pyx_v_nray = __pyx_t_21;
+
+                /* "pyart/map/_gate_to_grid_map.pyx":422
+ *                     with nogil:
+ *                         for nray in range(block_end - block_start):
+ *                             for ngate in range(ngates):             # <<<<<<<<<<<<<<
+ *                                 ray_mask[nray, ngate, i] = 0
+ *                 else:
+ */
+                __pyx_t_22 = __pyx_v_ngates;
+                for (__pyx_t_23 = 0; __pyx_t_23 < __pyx_t_22; __pyx_t_23+=1) {
+                  __pyx_v_ngate = __pyx_t_23;
+
+                  /* "pyart/map/_gate_to_grid_map.pyx":423
+ *                         for nray in range(block_end - block_start):
+ *                             for ngate in range(ngates):
+ *                                 ray_mask[nray, ngate, i] = 0             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     mask = field_mask[i]
+ */
+                  __pyx_t_24 = __pyx_v_nray;
+                  __pyx_t_25 = __pyx_v_ngate;
+                  __pyx_t_26 = __pyx_v_i;
+                  *((char *) ( /* dim=2 */ ((char *) (((char *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ray_mask.data + __pyx_t_24 * __pyx_v_ray_mask.strides[0]) ) + __pyx_t_25 * __pyx_v_ray_mask.strides[1]) )) + __pyx_t_26)) )) = 0;
+                }
+              }
+            }
+
+            /* "pyart/map/_gate_to_grid_map.pyx":420
+ *                            scale_factors[i], add_offsets[i], ray_data)
+ *                 if field_mask[i] is None:
+ *                     with nogil:             # <<<<<<<<<<<<<<
+ *                         for nray in range(block_end - block_start):
+ *                             for ngate in range(ngates):
+ */
+            /*finally:*/ {
+              /*normal exit:*/{
+                #ifdef WITH_THREAD
+                Py_BLOCK_THREADS
+                #endif
+                goto __pyx_L22;
+              }
+              __pyx_L22:;
+            }
+        }
+        goto __pyx_L17;
+      }
+      /*else*/ {
+
+        /* "pyart/map/_gate_to_grid_map.pyx":425
+ *                                 ray_mask[nray, ngate, i] = 0
+ *                 else:
+ *                     mask = field_mask[i]             # <<<<<<<<<<<<<<
+ *                     with nogil:
+ *                         for nray in range(block_start, block_end):
+ */
+        if (unlikely(__pyx_v_field_mask == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 425; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        }
+        __pyx_t_27 = __Pyx_PyObject_to_MemoryviewSlice_dsds_char(PyList_GET_ITEM(__pyx_v_field_mask, __pyx_v_i));
+        if (unlikely(!__pyx_t_27.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 425; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __PYX_XDEC_MEMVIEW(&__pyx_v_mask, 1);
+        __pyx_v_mask = __pyx_t_27;
+        __pyx_t_27.memview = NULL;
+        __pyx_t_27.data = NULL;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":426
+ *                 else:
+ *                     mask = field_mask[i]
+ *                     with nogil:             # <<<<<<<<<<<<<<
+ *                         for nray in range(block_start, block_end):
+ *                             for ngate in range(ngates):
+ */
+        {
+            #ifdef WITH_THREAD
+            PyThreadState *_save;
+            Py_UNBLOCK_THREADS
+            #endif
+            /*try:*/ {
+
+              /* "pyart/map/_gate_to_grid_map.pyx":427
+ *                     mask = field_mask[i]
+ *                     with nogil:
+ *                         for nray in range(block_start, block_end):             # <<<<<<<<<<<<<<
+ *                             for ngate in range(ngates):
+ *                                 ray_mask[nray - block_start, ngate, i] = (
+ */
+              __pyx_t_20 = __pyx_v_block_end;
+              for (__pyx_t_21 = __pyx_v_block_start; __pyx_t_21 < __pyx_t_20; __pyx_t_21+=1) {
+                __pyx_v_nray = __pyx_t_21;
+
+                /* "pyart/map/_gate_to_grid_map.pyx":428
+ *                     with nogil:
+ *                         for nray in range(block_start, block_end):
+ *                             for ngate in range(ngates):             # <<<<<<<<<<<<<<
+ *                                 ray_mask[nray - block_start, ngate, i] = (
+ *                                     mask[nray, ngate])
+ */
+                __pyx_t_22 = __pyx_v_ngates;
+                for (__pyx_t_23 = 0; __pyx_t_23 < __pyx_t_22; __pyx_t_23+=1) {
+                  __pyx_v_ngate = __pyx_t_23;
+
+                  /* "pyart/map/_gate_to_grid_map.pyx":430
+ *                             for ngate in range(ngates):
+ *                                 ray_mask[nray - block_start, ngate, i] = (
+ *                                     mask[nray, ngate])             # <<<<<<<<<<<<<<
+ * 
+ *             # find the location and radius of influence of each gate,
+ */
+                  __pyx_t_28 = __pyx_v_nray;
+                  __pyx_t_29 = __pyx_v_ngate;
+
+                  /* "pyart/map/_gate_to_grid_map.pyx":429
+ *                         for nray in range(block_start, block_end):
+ *                             for ngate in range(ngates):
+ *                                 ray_mask[nray - block_start, ngate, i] = (             # <<<<<<<<<<<<<<
+ *                                     mask[nray, ngate])
+ * 
+ */
+                  __pyx_t_30 = (__pyx_v_nray - __pyx_v_block_start);
+                  __pyx_t_31 = __pyx_v_ngate;
+                  __pyx_t_32 = __pyx_v_i;
+                  *((char *) ( /* dim=2 */ ((char *) (((char *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ray_mask.data + __pyx_t_30 * __pyx_v_ray_mask.strides[0]) ) + __pyx_t_31 * __pyx_v_ray_mask.strides[1]) )) + __pyx_t_32)) )) = (*((char *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_mask.data + __pyx_t_28 * __pyx_v_mask.strides[0]) ) + __pyx_t_29 * __pyx_v_mask.strides[1]) )));
+                }
+              }
+            }
+
+            /* "pyart/map/_gate_to_grid_map.pyx":426
+ *                 else:
+ *                     mask = field_mask[i]
+ *                     with nogil:             # <<<<<<<<<<<<<<
+ *                         for nray in range(block_start, block_end):
+ *                             for ngate in range(ngates):
+ */
+            /*finally:*/ {
+              /*normal exit:*/{
+                #ifdef WITH_THREAD
+                Py_BLOCK_THREADS
+                #endif
+                goto __pyx_L31;
+              }
+              __pyx_L31:;
+            }
+        }
+      }
+      __pyx_L17:;
+    }
+
+    /* "pyart/map/_gate_to_grid_map.pyx":435
+ *             # radius of influence methods implemented in Python are
+ *             # evaluated while holding the GIL
+ *             if nogil_roi:             # <<<<<<<<<<<<<<
+ *                 with nogil:
+ *                     _find_gate_info(
+ */
+    __pyx_t_4 = (__pyx_v_nogil_roi != 0);
+    if (__pyx_t_4) {
+
+      /* "pyart/map/_gate_to_grid_map.pyx":436
+ *             # evaluated while holding the GIL
+ *             if nogil_roi:
+ *                 with nogil:             # <<<<<<<<<<<<<<
+ *                     _find_gate_info(
+ *                         elevations, azimuths, ranges, block_start, block_end,
+ */
+      {
+          #ifdef WITH_THREAD
+          PyThreadState *_save;
+          Py_UNBLOCK_THREADS
+          #endif
+          /*try:*/ {
+
+            /* "pyart/map/_gate_to_grid_map.pyx":437
+ *             if nogil_roi:
+ *                 with nogil:
+ *                     _find_gate_info(             # <<<<<<<<<<<<<<
+ *                         elevations, azimuths, ranges, block_start, block_end,
+ *                         z_offset, y_offset, x_offset, toa, excluded_gates,
+ */
+            __pyx_f_5pyart_3map_17_gate_to_grid_map__find_gate_info(__pyx_v_elevations, __pyx_v_azimuths, __pyx_v_ranges, __pyx_v_block_start, __pyx_v_block_end, __pyx_v_z_offset, __pyx_v_y_offset, __pyx_v_x_offset, __pyx_v_toa, __pyx_v_excluded_gates, 1, __pyx_v_roi_func, 1, __pyx_v_gate_info);
+          }
+
+          /* "pyart/map/_gate_to_grid_map.pyx":436
+ *             # evaluated while holding the GIL
+ *             if nogil_roi:
+ *                 with nogil:             # <<<<<<<<<<<<<<
+ *                     _find_gate_info(
+ *                         elevations, azimuths, ranges, block_start, block_end,
+ */
+          /*finally:*/ {
+            /*normal exit:*/{
+              #ifdef WITH_THREAD
+              Py_BLOCK_THREADS
+              #endif
+              goto __pyx_L41;
+            }
+            __pyx_L41:;
+          }
+      }
+      goto __pyx_L36;
+    }
+    /*else*/ {
+
+      /* "pyart/map/_gate_to_grid_map.pyx":442
+ *                         True, roi_func, True, gate_info)
+ *             else:
+ *                 _find_gate_info(             # <<<<<<<<<<<<<<
+ *                     elevations, azimuths, ranges, block_start, block_end,
+ *                     z_offset, y_offset, x_offset, toa, excluded_gates,
+ */
+      __pyx_f_5pyart_3map_17_gate_to_grid_map__find_gate_info(__pyx_v_elevations, __pyx_v_azimuths, __pyx_v_ranges, __pyx_v_block_start, __pyx_v_block_end, __pyx_v_z_offset, __pyx_v_y_offset, __pyx_v_x_offset, __pyx_v_toa, __pyx_v_excluded_gates, 1, __pyx_v_roi_func, 0, __pyx_v_gate_info);
+
+      /* "pyart/map/_gate_to_grid_map.pyx":446
+ *                     z_offset, y_offset, x_offset, toa, excluded_gates,
+ *                     True, roi_func, False, gate_info)
+ *                 for nray in range(block_end - block_start):             # <<<<<<<<<<<<<<
+ *                     for ngate in range(ngates):
+ *                         if gate_info[nray, ngate, 3] < 0:
+ */
+      __pyx_t_13 = (__pyx_v_block_end - __pyx_v_block_start);
+      for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+        __pyx_v_nray = __pyx_t_14;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":447
+ *                     True, roi_func, False, gate_info)
+ *                 for nray in range(block_end - block_start):
+ *                     for ngate in range(ngates):             # <<<<<<<<<<<<<<
+ *                         if gate_info[nray, ngate, 3] < 0:
+ *                             continue
+ */
+        __pyx_t_20 = __pyx_v_ngates;
+        for (__pyx_t_21 = 0; __pyx_t_21 < __pyx_t_20; __pyx_t_21+=1) {
+          __pyx_v_ngate = __pyx_t_21;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":448
+ *                 for nray in range(block_end - block_start):
+ *                     for ngate in range(ngates):
+ *                         if gate_info[nray, ngate, 3] < 0:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         gate_info[nray, ngate, 3] = roi_func.get_roi(
+ */
+          __pyx_t_22 = __pyx_v_nray;
+          __pyx_t_23 = __pyx_v_ngate;
+          __pyx_t_33 = 3;
+          __pyx_t_4 = (((*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_22 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_23 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_33)) ))) < 0.0) != 0);
+          if (__pyx_t_4) {
+
+            /* "pyart/map/_gate_to_grid_map.pyx":449
+ *                     for ngate in range(ngates):
+ *                         if gate_info[nray, ngate, 3] < 0:
+ *                             continue             # <<<<<<<<<<<<<<
+ *                         gate_info[nray, ngate, 3] = roi_func.get_roi(
+ *                             gate_info[nray, ngate, 0],
+ */
+            goto __pyx_L44_continue;
+          }
+
+          /* "pyart/map/_gate_to_grid_map.pyx":451
+ *                             continue
+ *                         gate_info[nray, ngate, 3] = roi_func.get_roi(
+ *                             gate_info[nray, ngate, 0],             # <<<<<<<<<<<<<<
+ *                             gate_info[nray, ngate, 1],
+ *                             gate_info[nray, ngate, 2])
+ */
+          __pyx_t_34 = __pyx_v_nray;
+          __pyx_t_35 = __pyx_v_ngate;
+          __pyx_t_36 = 0;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":452
+ *                         gate_info[nray, ngate, 3] = roi_func.get_roi(
+ *                             gate_info[nray, ngate, 0],
+ *                             gate_info[nray, ngate, 1],             # <<<<<<<<<<<<<<
+ *                             gate_info[nray, ngate, 2])
+ * 
+ */
+          __pyx_t_37 = __pyx_v_nray;
+          __pyx_t_38 = __pyx_v_ngate;
+          __pyx_t_39 = 1;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":453
+ *                             gate_info[nray, ngate, 0],
+ *                             gate_info[nray, ngate, 1],
+ *                             gate_info[nray, ngate, 2])             # <<<<<<<<<<<<<<
+ * 
+ *             # map the gates in the block onto the grid
+ */
+          __pyx_t_40 = __pyx_v_nray;
+          __pyx_t_41 = __pyx_v_ngate;
+          __pyx_t_42 = 2;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":450
+ *                         if gate_info[nray, ngate, 3] < 0:
+ *                             continue
+ *                         gate_info[nray, ngate, 3] = roi_func.get_roi(             # <<<<<<<<<<<<<<
+ *                             gate_info[nray, ngate, 0],
+ *                             gate_info[nray, ngate, 1],
+ */
+          __pyx_t_43 = __pyx_v_nray;
+          __pyx_t_44 = __pyx_v_ngate;
+          __pyx_t_45 = 3;
+          *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_43 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_44 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_45)) )) = ((struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction *)__pyx_v_roi_func->__pyx_vtab)->get_roi(__pyx_v_roi_func, (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_34 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_35 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_36)) ))), (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_37 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_38 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_39)) ))), (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_40 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_41 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_42)) ))), 0);
+          __pyx_L44_continue:;
+        }
+      }
+    }
+    __pyx_L36:;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":456
+ * 
+ *             # map the gates in the block onto the grid
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 for nray in range(block_end - block_start):
+ *                     for ngate in range(ngates):
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        #endif
+        /*try:*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":457
+ *             # map the gates in the block onto the grid
+ *             with nogil:
+ *                 for nray in range(block_end - block_start):             # <<<<<<<<<<<<<<
+ *                     for ngate in range(ngates):
+ *                         if gate_info[nray, ngate, 3] < 0:
+ */
+          __pyx_t_13 = (__pyx_v_block_end - __pyx_v_block_start);
+          for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+            __pyx_v_nray = __pyx_t_14;
+
+            /* "pyart/map/_gate_to_grid_map.pyx":458
+ *             with nogil:
+ *                 for nray in range(block_end - block_start):
+ *                     for ngate in range(ngates):             # <<<<<<<<<<<<<<
+ *                         if gate_info[nray, ngate, 3] < 0:
+ *                             continue
+ */
+            __pyx_t_20 = __pyx_v_ngates;
+            for (__pyx_t_21 = 0; __pyx_t_21 < __pyx_t_20; __pyx_t_21+=1) {
+              __pyx_v_ngate = __pyx_t_21;
+
+              /* "pyart/map/_gate_to_grid_map.pyx":459
+ *                 for nray in range(block_end - block_start):
+ *                     for ngate in range(ngates):
+ *                         if gate_info[nray, ngate, 3] < 0:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         self.map_gate(
+ */
+              __pyx_t_46 = __pyx_v_nray;
+              __pyx_t_47 = __pyx_v_ngate;
+              __pyx_t_48 = 3;
+              __pyx_t_4 = (((*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_46 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_47 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_48)) ))) < 0.0) != 0);
+              if (__pyx_t_4) {
+
+                /* "pyart/map/_gate_to_grid_map.pyx":460
+ *                     for ngate in range(ngates):
+ *                         if gate_info[nray, ngate, 3] < 0:
+ *                             continue             # <<<<<<<<<<<<<<
+ *                         self.map_gate(
+ *                             gate_info[nray, ngate, 2],
+ */
+                goto __pyx_L54_continue;
+              }
+
+              /* "pyart/map/_gate_to_grid_map.pyx":462
+ *                             continue
+ *                         self.map_gate(
+ *                             gate_info[nray, ngate, 2],             # <<<<<<<<<<<<<<
+ *                             gate_info[nray, ngate, 1],
+ *                             gate_info[nray, ngate, 0],
+ */
+              __pyx_t_49 = __pyx_v_nray;
+              __pyx_t_50 = __pyx_v_ngate;
+              __pyx_t_51 = 2;
+
+              /* "pyart/map/_gate_to_grid_map.pyx":463
+ *                         self.map_gate(
+ *                             gate_info[nray, ngate, 2],
+ *                             gate_info[nray, ngate, 1],             # <<<<<<<<<<<<<<
+ *                             gate_info[nray, ngate, 0],
+ *                             gate_info[nray, ngate, 3],
+ */
+              __pyx_t_52 = __pyx_v_nray;
+              __pyx_t_53 = __pyx_v_ngate;
+              __pyx_t_54 = 1;
+
+              /* "pyart/map/_gate_to_grid_map.pyx":464
+ *                             gate_info[nray, ngate, 2],
+ *                             gate_info[nray, ngate, 1],
+ *                             gate_info[nray, ngate, 0],             # <<<<<<<<<<<<<<
+ *                             gate_info[nray, ngate, 3],
+ *                             ray_data[nray, ngate], ray_mask[nray, ngate],
+ */
+              __pyx_t_55 = __pyx_v_nray;
+              __pyx_t_56 = __pyx_v_ngate;
+              __pyx_t_57 = 0;
+
+              /* "pyart/map/_gate_to_grid_map.pyx":465
+ *                             gate_info[nray, ngate, 1],
+ *                             gate_info[nray, ngate, 0],
+ *                             gate_info[nray, ngate, 3],             # <<<<<<<<<<<<<<
+ *                             ray_data[nray, ngate], ray_mask[nray, ngate],
+ *                             weighting_function)
+ */
+              __pyx_t_58 = __pyx_v_nray;
+              __pyx_t_59 = __pyx_v_ngate;
+              __pyx_t_60 = 3;
+
+              /* "pyart/map/_gate_to_grid_map.pyx":466
+ *                             gate_info[nray, ngate, 0],
+ *                             gate_info[nray, ngate, 3],
+ *                             ray_data[nray, ngate], ray_mask[nray, ngate],             # <<<<<<<<<<<<<<
+ *                             weighting_function)
+ * 
+ */
+              __pyx_t_61.data = __pyx_v_ray_data.data;
+              __pyx_t_61.memview = __pyx_v_ray_data.memview;
+              __PYX_INC_MEMVIEW(&__pyx_t_61, 0);
+              {
+    Py_ssize_t __pyx_tmp_idx = __pyx_v_nray;
+    Py_ssize_t __pyx_tmp_shape = __pyx_v_ray_data.shape[0];
+    Py_ssize_t __pyx_tmp_stride = __pyx_v_ray_data.strides[0];
+    if (0 && (__pyx_tmp_idx < 0))
+        __pyx_tmp_idx += __pyx_tmp_shape;
+    if (0 && (__pyx_tmp_idx < 0 || __pyx_tmp_idx >= __pyx_tmp_shape)) {
+            #ifdef WITH_THREAD
+            PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
+            #endif
+        PyErr_SetString(PyExc_IndexError, "Index out of bounds (axis 0)");
+            #ifdef WITH_THREAD
+            PyGILState_Release(__pyx_gilstate_save);
+            #endif
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L50_error;}
+    }
+        __pyx_t_61.data += __pyx_tmp_idx * __pyx_tmp_stride;
+}
+
+{
+    Py_ssize_t __pyx_tmp_idx = __pyx_v_ngate;
+    Py_ssize_t __pyx_tmp_shape = __pyx_v_ray_data.shape[1];
+    Py_ssize_t __pyx_tmp_stride = __pyx_v_ray_data.strides[1];
+    if (0 && (__pyx_tmp_idx < 0))
+        __pyx_tmp_idx += __pyx_tmp_shape;
+    if (0 && (__pyx_tmp_idx < 0 || __pyx_tmp_idx >= __pyx_tmp_shape)) {
+            #ifdef WITH_THREAD
+            PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
+            #endif
+        PyErr_SetString(PyExc_IndexError, "Index out of bounds (axis 1)");
+            #ifdef WITH_THREAD
+            PyGILState_Release(__pyx_gilstate_save);
+            #endif
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L50_error;}
+    }
+        __pyx_t_61.data += __pyx_tmp_idx * __pyx_tmp_stride;
+}
+
+__pyx_t_61.shape[0] = __pyx_v_ray_data.shape[2];
+__pyx_t_61.strides[0] = __pyx_v_ray_data.strides[2];
+    __pyx_t_61.suboffsets[0] = -1;
+
+__pyx_t_62.data = __pyx_v_ray_mask.data;
+              __pyx_t_62.memview = __pyx_v_ray_mask.memview;
+              __PYX_INC_MEMVIEW(&__pyx_t_62, 0);
+              {
+    Py_ssize_t __pyx_tmp_idx = __pyx_v_nray;
+    Py_ssize_t __pyx_tmp_shape = __pyx_v_ray_mask.shape[0];
+    Py_ssize_t __pyx_tmp_stride = __pyx_v_ray_mask.strides[0];
+    if (0 && (__pyx_tmp_idx < 0))
+        __pyx_tmp_idx += __pyx_tmp_shape;
+    if (0 && (__pyx_tmp_idx < 0 || __pyx_tmp_idx >= __pyx_tmp_shape)) {
+            #ifdef WITH_THREAD
+            PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
+            #endif
+        PyErr_SetString(PyExc_IndexError, "Index out of bounds (axis 0)");
+            #ifdef WITH_THREAD
+            PyGILState_Release(__pyx_gilstate_save);
+            #endif
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L50_error;}
+    }
+        __pyx_t_62.data += __pyx_tmp_idx * __pyx_tmp_stride;
+}
+
+{
+    Py_ssize_t __pyx_tmp_idx = __pyx_v_ngate;
+    Py_ssize_t __pyx_tmp_shape = __pyx_v_ray_mask.shape[1];
+    Py_ssize_t __pyx_tmp_stride = __pyx_v_ray_mask.strides[1];
+    if (0 && (__pyx_tmp_idx < 0))
+        __pyx_tmp_idx += __pyx_tmp_shape;
+    if (0 && (__pyx_tmp_idx < 0 || __pyx_tmp_idx >= __pyx_tmp_shape)) {
+            #ifdef WITH_THREAD
+            PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();
+            #endif
+        PyErr_SetString(PyExc_IndexError, "Index out of bounds (axis 1)");
+            #ifdef WITH_THREAD
+            PyGILState_Release(__pyx_gilstate_save);
+            #endif
+        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 466; __pyx_clineno = __LINE__; goto __pyx_L50_error;}
+    }
+        __pyx_t_62.data += __pyx_tmp_idx * __pyx_tmp_stride;
+}
+
+__pyx_t_62.shape[0] = __pyx_v_ray_mask.shape[2];
+__pyx_t_62.strides[0] = __pyx_v_ray_mask.strides[2];
+    __pyx_t_62.suboffsets[0] = -1;
+
+((struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *)__pyx_v_self->__pyx_vtab)->map_gate(__pyx_v_self, (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_49 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_50 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_51)) ))), (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_52 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_53 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_54)) ))), (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_55 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_56 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_57)) ))), (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_58 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_59 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_60)) ))), __pyx_t_61, __pyx_t_62, __pyx_v_weighting_function);
+
+              /* "pyart/map/_gate_to_grid_map.pyx":461
+ *                         if gate_info[nray, ngate, 3] < 0:
+ *                             continue
+ *                         self.map_gate(             # <<<<<<<<<<<<<<
+ *                             gate_info[nray, ngate, 2],
+ *                             gate_info[nray, ngate, 1],
+ */
+              __PYX_XDEC_MEMVIEW(&__pyx_t_61, 0);
+              __PYX_XDEC_MEMVIEW(&__pyx_t_62, 0);
+              __pyx_L54_continue:;
+            }
+          }
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":456
+ * 
+ *             # map the gates in the block onto the grid
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 for nray in range(block_end - block_start):
+ *                     for ngate in range(ngates):
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L51;
+          }
+          __pyx_L50_error: {
+            #ifdef WITH_THREAD
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L1_error;
+          }
+          __pyx_L51:;
+        }
+    }
+
+    /* "pyart/map/_gate_to_grid_map.pyx":412
+ *                             itemsize=sizeof(float), format='f')
+ * 
+ *         for block_start in range(ray_start, ray_end, RAY_BLOCK_SIZE):             # <<<<<<<<<<<<<<
+ *             block_end = min(block_start + RAY_BLOCK_SIZE, ray_end)
+ * 
+ */
+  }
+  __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":322
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     def map_gates_to_grid(             # <<<<<<<<<<<<<<
+ *             self, float[::1] elevations, float[::1] azimuths,
+ *             float[::1] ranges, list field_data, list field_mask,
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_15);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_16, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_17, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_27, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_61, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_62, 1);
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.map_gates_to_grid", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ray_data, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ray_mask, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_gate_info, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_mask, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_elevations, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_azimuths, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ranges, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_scale_factors, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_add_offsets, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_excluded_gates, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":473
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     cdef int map_gate(self, float x, float y, float z, float roi,             # <<<<<<<<<<<<<<
+ *                       float[::1] values, char[::1] masks,
+ *                       int weighting_function) nogil:
+ */
+
+static int __pyx_f_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_map_gate(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, float __pyx_v_x, float __pyx_v_y, float __pyx_v_z, float __pyx_v_roi, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_masks, int __pyx_v_weighting_function) {
+  float __pyx_v_xg;
+  float __pyx_v_yg;
+  float __pyx_v_zg;
+  float __pyx_v_weight;
+  float __pyx_v_roi2;
+  float __pyx_v_dist2;
+  int __pyx_v_x_min;
+  int __pyx_v_x_max;
+  int __pyx_v_y_min;
+  int __pyx_v_y_max;
+  int __pyx_v_z_min;
+  int __pyx_v_z_max;
+  int __pyx_v_xi;
+  int __pyx_v_yi;
+  int __pyx_v_zi;
+  int __pyx_v_i;
+  int __pyx_r;
+  int __pyx_t_1;
+  long __pyx_t_2;
+  int __pyx_t_3;
+  long __pyx_t_4;
+  int __pyx_t_5;
+  long __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":483
+ * 
+ *         # shift positions so that grid starts at 0
+ *         x -= self.x_start             # <<<<<<<<<<<<<<
+ *         y -= self.y_start
+ *         z -= self.z_start
+ */
+  __pyx_v_x = (__pyx_v_x - __pyx_v_self->x_start);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":484
+ *         # shift positions so that grid starts at 0
+ *         x -= self.x_start
+ *         y -= self.y_start             # <<<<<<<<<<<<<<
+ *         z -= self.z_start
+ * 
+ */
+  __pyx_v_y = (__pyx_v_y - __pyx_v_self->y_start);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":485
+ *         x -= self.x_start
+ *         y -= self.y_start
+ *         z -= self.z_start             # <<<<<<<<<<<<<<
+ * 
+ *         x_min = find_min(x, roi, self.x_step)
+ */
+  __pyx_v_z = (__pyx_v_z - __pyx_v_self->z_start);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":487
+ *         z -= self.z_start
+ * 
+ *         x_min = find_min(x, roi, self.x_step)             # <<<<<<<<<<<<<<
+ *         if x_min > self.nx-1:
+ *             return 0
+ */
+  __pyx_v_x_min = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(__pyx_v_x, __pyx_v_roi, __pyx_v_self->x_step);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":488
+ * 
+ *         x_min = find_min(x, roi, self.x_step)
+ *         if x_min > self.nx-1:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         x_max = find_max(x, roi, self.x_step, self.nx)
+ */
+  __pyx_t_1 = ((__pyx_v_x_min > (__pyx_v_self->nx - 1)) != 0);
+  if (__pyx_t_1) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":489
+ *         x_min = find_min(x, roi, self.x_step)
+ *         if x_min > self.nx-1:
+ *             return 0             # <<<<<<<<<<<<<<
+ *         x_max = find_max(x, roi, self.x_step, self.nx)
+ *         if x_max < 0:
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":490
+ *         if x_min > self.nx-1:
+ *             return 0
+ *         x_max = find_max(x, roi, self.x_step, self.nx)             # <<<<<<<<<<<<<<
+ *         if x_max < 0:
+ *             return 0
+ */
+  __pyx_v_x_max = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(__pyx_v_x, __pyx_v_roi, __pyx_v_self->x_step, __pyx_v_self->nx);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":491
+ *             return 0
+ *         x_max = find_max(x, roi, self.x_step, self.nx)
+ *         if x_max < 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_x_max < 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":492
+ *         x_max = find_max(x, roi, self.x_step, self.nx)
+ *         if x_max < 0:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         y_min = find_min(y, roi, self.y_step)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":494
+ *             return 0
+ * 
+ *         y_min = find_min(y, roi, self.y_step)             # <<<<<<<<<<<<<<
+ *         if y_min > self.ny-1:
+ *             return 0
+ */
+  __pyx_v_y_min = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(__pyx_v_y, __pyx_v_roi, __pyx_v_self->y_step);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":495
+ * 
+ *         y_min = find_min(y, roi, self.y_step)
+ *         if y_min > self.ny-1:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         y_max = find_max(y, roi, self.y_step, self.ny)
+ */
+  __pyx_t_1 = ((__pyx_v_y_min > (__pyx_v_self->ny - 1)) != 0);
+  if (__pyx_t_1) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":496
+ *         y_min = find_min(y, roi, self.y_step)
+ *         if y_min > self.ny-1:
+ *             return 0             # <<<<<<<<<<<<<<
+ *         y_max = find_max(y, roi, self.y_step, self.ny)
+ *         if y_max < 0:
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":497
+ *         if y_min > self.ny-1:
+ *             return 0
+ *         y_max = find_max(y, roi, self.y_step, self.ny)             # <<<<<<<<<<<<<<
+ *         if y_max < 0:
+ *             return 0
+ */
+  __pyx_v_y_max = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(__pyx_v_y, __pyx_v_roi, __pyx_v_self->y_step, __pyx_v_self->ny);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":498
+ *             return 0
+ *         y_max = find_max(y, roi, self.y_step, self.ny)
+ *         if y_max < 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_y_max < 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":499
+ *         y_max = find_max(y, roi, self.y_step, self.ny)
+ *         if y_max < 0:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         z_min = find_min(z, roi, self.z_step)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":501
+ *             return 0
+ * 
+ *         z_min = find_min(z, roi, self.z_step)             # <<<<<<<<<<<<<<
+ *         if z_min > self.nz-1:
+ *             return 0
+ */
+  __pyx_v_z_min = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(__pyx_v_z, __pyx_v_roi, __pyx_v_self->z_step);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":502
+ * 
+ *         z_min = find_min(z, roi, self.z_step)
+ *         if z_min > self.nz-1:             # <<<<<<<<<<<<<<
+ *             return 0
+ *         z_max = find_max(z, roi, self.z_step, self.nz)
+ */
+  __pyx_t_1 = ((__pyx_v_z_min > (__pyx_v_self->nz - 1)) != 0);
+  if (__pyx_t_1) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":503
+ *         z_min = find_min(z, roi, self.z_step)
+ *         if z_min > self.nz-1:
+ *             return 0             # <<<<<<<<<<<<<<
+ *         z_max = find_max(z, roi, self.z_step, self.nz)
+ *         if z_max < 0:
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":504
+ *         if z_min > self.nz-1:
+ *             return 0
+ *         z_max = find_max(z, roi, self.z_step, self.nz)             # <<<<<<<<<<<<<<
+ *         if z_max < 0:
+ *             return 0
+ */
+  __pyx_v_z_max = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(__pyx_v_z, __pyx_v_roi, __pyx_v_self->z_step, __pyx_v_self->nz);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":505
+ *             return 0
+ *         z_max = find_max(z, roi, self.z_step, self.nz)
+ *         if z_max < 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+  __pyx_t_1 = ((__pyx_v_z_max < 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":506
+ *         z_max = find_max(z, roi, self.z_step, self.nz)
+ *         if z_max < 0:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         roi2 = roi * roi
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":508
+ *             return 0
+ * 
+ *         roi2 = roi * roi             # <<<<<<<<<<<<<<
+ *         for xi in range(x_min, x_max+1):
+ *             for yi in range(y_min, y_max+1):
+ */
+  __pyx_v_roi2 = (__pyx_v_roi * __pyx_v_roi);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":509
+ * 
+ *         roi2 = roi * roi
+ *         for xi in range(x_min, x_max+1):             # <<<<<<<<<<<<<<
+ *             for yi in range(y_min, y_max+1):
+ *                 for zi in range(z_min, z_max+1):
+ */
+  __pyx_t_2 = (__pyx_v_x_max + 1);
+  for (__pyx_t_3 = __pyx_v_x_min; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_xi = __pyx_t_3;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":510
+ *         roi2 = roi * roi
+ *         for xi in range(x_min, x_max+1):
+ *             for yi in range(y_min, y_max+1):             # <<<<<<<<<<<<<<
+ *                 for zi in range(z_min, z_max+1):
+ *                     xg = self.x_step * xi
+ */
+    __pyx_t_4 = (__pyx_v_y_max + 1);
+    for (__pyx_t_5 = __pyx_v_y_min; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_v_yi = __pyx_t_5;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":511
+ *         for xi in range(x_min, x_max+1):
+ *             for yi in range(y_min, y_max+1):
+ *                 for zi in range(z_min, z_max+1):             # <<<<<<<<<<<<<<
+ *                     xg = self.x_step * xi
+ *                     yg = self.y_step * yi
+ */
+      __pyx_t_6 = (__pyx_v_z_max + 1);
+      for (__pyx_t_7 = __pyx_v_z_min; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+        __pyx_v_zi = __pyx_t_7;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":512
+ *             for yi in range(y_min, y_max+1):
+ *                 for zi in range(z_min, z_max+1):
+ *                     xg = self.x_step * xi             # <<<<<<<<<<<<<<
+ *                     yg = self.y_step * yi
+ *                     zg = self.z_step * zi
+ */
+        __pyx_v_xg = (__pyx_v_self->x_step * __pyx_v_xi);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":513
+ *                 for zi in range(z_min, z_max+1):
+ *                     xg = self.x_step * xi
+ *                     yg = self.y_step * yi             # <<<<<<<<<<<<<<
+ *                     zg = self.z_step * zi
+ *                     dist2 = (xg-x)*(xg-x) + (yg-y)*(yg-y) + (zg-z)*(zg-z)
+ */
+        __pyx_v_yg = (__pyx_v_self->y_step * __pyx_v_yi);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":514
+ *                     xg = self.x_step * xi
+ *                     yg = self.y_step * yi
+ *                     zg = self.z_step * zi             # <<<<<<<<<<<<<<
+ *                     dist2 = (xg-x)*(xg-x) + (yg-y)*(yg-y) + (zg-z)*(zg-z)
+ * 
+ */
+        __pyx_v_zg = (__pyx_v_self->z_step * __pyx_v_zi);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":515
+ *                     yg = self.y_step * yi
+ *                     zg = self.z_step * zi
+ *                     dist2 = (xg-x)*(xg-x) + (yg-y)*(yg-y) + (zg-z)*(zg-z)             # <<<<<<<<<<<<<<
+ * 
+ *                     if dist2 > roi2:
+ */
+        __pyx_v_dist2 = ((((__pyx_v_xg - __pyx_v_x) * (__pyx_v_xg - __pyx_v_x)) + ((__pyx_v_yg - __pyx_v_y) * (__pyx_v_yg - __pyx_v_y))) + ((__pyx_v_zg - __pyx_v_z) * (__pyx_v_zg - __pyx_v_z)));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":517
+ *                     dist2 = (xg-x)*(xg-x) + (yg-y)*(yg-y) + (zg-z)*(zg-z)
+ * 
+ *                     if dist2 > roi2:             # <<<<<<<<<<<<<<
+ *                         continue
+ * 
+ */
+        __pyx_t_1 = ((__pyx_v_dist2 > __pyx_v_roi2) != 0);
+        if (__pyx_t_1) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":518
+ * 
+ *                     if dist2 > roi2:
+ *                         continue             # <<<<<<<<<<<<<<
+ * 
+ *                     if weighting_function == BARNES:
+ */
+          goto __pyx_L13_continue;
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":520
+ *                         continue
+ * 
+ *                     if weighting_function == BARNES:             # <<<<<<<<<<<<<<
+ *                         weight = exp(-(dist2) / (2*roi2)) + 1e-5
+ *                     else:   # CRESSMAN
+ */
+        __pyx_t_1 = ((__pyx_v_weighting_function == __pyx_v_5pyart_3map_17_gate_to_grid_map_BARNES) != 0);
+        if (__pyx_t_1) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":521
+ * 
+ *                     if weighting_function == BARNES:
+ *                         weight = exp(-(dist2) / (2*roi2)) + 1e-5             # <<<<<<<<<<<<<<
+ *                     else:   # CRESSMAN
+ *                         weight = (roi2 - dist2) / (roi2 + dist2)
+ */
+          __pyx_v_weight = (exp(((-__pyx_v_dist2) / (2.0 * __pyx_v_roi2))) + 1e-5);
+          goto __pyx_L16;
+        }
+        /*else*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":523
+ *                         weight = exp(-(dist2) / (2*roi2)) + 1e-5
+ *                     else:   # CRESSMAN
+ *                         weight = (roi2 - dist2) / (roi2 + dist2)             # <<<<<<<<<<<<<<
+ *                     for i in range(self.nfields):
+ *                         if masks[i]:
+ */
+          __pyx_v_weight = ((__pyx_v_roi2 - __pyx_v_dist2) / (__pyx_v_roi2 + __pyx_v_dist2));
+        }
+        __pyx_L16:;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":524
+ *                     else:   # CRESSMAN
+ *                         weight = (roi2 - dist2) / (roi2 + dist2)
+ *                     for i in range(self.nfields):             # <<<<<<<<<<<<<<
+ *                         if masks[i]:
+ *                             continue
+ */
+        __pyx_t_8 = __pyx_v_self->nfields;
+        for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+          __pyx_v_i = __pyx_t_9;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":525
+ *                         weight = (roi2 - dist2) / (roi2 + dist2)
+ *                     for i in range(self.nfields):
+ *                         if masks[i]:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         self.grid_sum[zi, yi, xi, i] += weight * values[i]
+ */
+          __pyx_t_10 = __pyx_v_i;
+          __pyx_t_1 = ((*((char *) ( /* dim=0 */ ((char *) (((char *) __pyx_v_masks.data) + __pyx_t_10)) ))) != 0);
+          if (__pyx_t_1) {
+
+            /* "pyart/map/_gate_to_grid_map.pyx":526
+ *                     for i in range(self.nfields):
+ *                         if masks[i]:
+ *                             continue             # <<<<<<<<<<<<<<
+ *                         self.grid_sum[zi, yi, xi, i] += weight * values[i]
+ *                         self.grid_wsum[zi, yi, xi, i] += weight
+ */
+            goto __pyx_L17_continue;
+          }
+
+          /* "pyart/map/_gate_to_grid_map.pyx":527
+ *                         if masks[i]:
+ *                             continue
+ *                         self.grid_sum[zi, yi, xi, i] += weight * values[i]             # <<<<<<<<<<<<<<
+ *                         self.grid_wsum[zi, yi, xi, i] += weight
+ *         return 1
+ */
+          __pyx_t_11 = __pyx_v_i;
+          __pyx_t_12 = __pyx_v_zi;
+          __pyx_t_13 = __pyx_v_yi;
+          __pyx_t_14 = __pyx_v_xi;
+          __pyx_t_15 = __pyx_v_i;
+          *((float *) ( /* dim=3 */ ((char *) (((float *) ( /* dim=2 */ (( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->grid_sum.data + __pyx_t_12 * __pyx_v_self->grid_sum.strides[0]) ) + __pyx_t_13 * __pyx_v_self->grid_sum.strides[1]) ) + __pyx_t_14 * __pyx_v_self->grid_sum.strides[2]) )) + __pyx_t_15)) )) += (__pyx_v_weight * (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_values.data) + __pyx_t_11)) ))));
+
+          /* "pyart/map/_gate_to_grid_map.pyx":528
+ *                             continue
+ *                         self.grid_sum[zi, yi, xi, i] += weight * values[i]
+ *                         self.grid_wsum[zi, yi, xi, i] += weight             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+ */
+          __pyx_t_16 = __pyx_v_zi;
+          __pyx_t_17 = __pyx_v_yi;
+          __pyx_t_18 = __pyx_v_xi;
+          __pyx_t_19 = __pyx_v_i;
+          *((float *) ( /* dim=3 */ ((char *) (((float *) ( /* dim=2 */ (( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->grid_wsum.data + __pyx_t_16 * __pyx_v_self->grid_wsum.strides[0]) ) + __pyx_t_17 * __pyx_v_self->grid_wsum.strides[1]) ) + __pyx_t_18 * __pyx_v_self->grid_wsum.strides[2]) )) + __pyx_t_19)) )) += __pyx_v_weight;
+          __pyx_L17_continue:;
+        }
+        __pyx_L13_continue:;
+      }
+    }
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":529
+ *                         self.grid_sum[zi, yi, xi, i] += weight * values[i]
+ *                         self.grid_wsum[zi, yi, xi, i] += weight
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.cdivision(True)
+ */
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":473
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     cdef int map_gate(self, float x, float y, float z, float roi,             # <<<<<<<<<<<<<<
+ *                       float[::1] values, char[::1] masks,
+ *                       int weighting_function) nogil:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":534
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     def find_nearest_sweep(             # <<<<<<<<<<<<<<
+ *             self, float[::1] sweep_elevations, offset,
+ *             int[:, :, ::1] nearest_sweep):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_7find_nearest_sweep(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_6find_nearest_sweep[] = "\n        Find the sweep nearest in elevation angle to each grid point.\n\n        Parameters\n        ----------\n        sweep_elevations : 1D float32 array\n            Elevation angle of each sweep in degrees.\n        offset : tuple of floats\n            Offset of the radar from the grid origin.  Dimension are ordered\n            as z, y, x.\n        nearest_sweep : 3D int32 array\n            Array which will be filled with the index of the sweep nearest\n            to each grid point.\n\n        ";
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_7find_nearest_sweep(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_sweep_elevations = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_v_offset = 0;
+  __Pyx_memviewslice __pyx_v_nearest_sweep = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("find_nearest_sweep (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_sweep_elevations,&__pyx_n_s_offset,&__pyx_n_s_nearest_sweep,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sweep_elevations)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_nearest_sweep", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_nearest_sweep)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_nearest_sweep", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "find_nearest_sweep") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_sweep_elevations = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_sweep_elevations.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 535; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_offset = values[1];
+    __pyx_v_nearest_sweep = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_int(values[2]); if (unlikely(!__pyx_v_nearest_sweep.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 536; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("find_nearest_sweep", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 534; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.find_nearest_sweep", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_6find_nearest_sweep(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *)__pyx_v_self), __pyx_v_sweep_elevations, __pyx_v_offset, __pyx_v_nearest_sweep);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_6find_nearest_sweep(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, __Pyx_memviewslice __pyx_v_sweep_elevations, PyObject *__pyx_v_offset, __Pyx_memviewslice __pyx_v_nearest_sweep) {
+  int __pyx_v_ix;
+  int __pyx_v_iy;
+  int __pyx_v_iz;
+  int __pyx_v_isweep;
+  int __pyx_v_nsweeps;
+  double __pyx_v_x;
+  double __pyx_v_y;
+  double __pyx_v_z;
+  double __pyx_v_s;
+  double __pyx_v_elevation;
+  double __pyx_v_diff;
+  double __pyx_v_min_diff;
+  double __pyx_v_x_offset;
+  double __pyx_v_y_offset;
+  double __pyx_v_z_offset;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *(*__pyx_t_5)(PyObject *);
+  double __pyx_t_6;
+  double __pyx_t_7;
+  double __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+  int __pyx_t_20;
+  int __pyx_t_21;
+  int __pyx_t_22;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("find_nearest_sweep", 0);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":556
+ *         cdef double x_offset, y_offset, z_offset
+ * 
+ *         z_offset, y_offset, x_offset = offset             # <<<<<<<<<<<<<<
+ *         nsweeps = len(sweep_elevations)
+ *         for iz in range(self.nz):
+ */
+  if ((likely(PyTuple_CheckExact(__pyx_v_offset))) || (PyList_CheckExact(__pyx_v_offset))) {
+    PyObject* sequence = __pyx_v_offset;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    Py_ssize_t size = Py_SIZE(sequence);
+    #else
+    Py_ssize_t size = PySequence_Size(sequence);
+    #endif
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    #if CYTHON_COMPILING_IN_CPYTHON
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_2 = PyTuple_GET_ITEM(sequence, 1); 
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 2); 
+    } else {
+      __pyx_t_1 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_2 = PyList_GET_ITEM(sequence, 1); 
+      __pyx_t_3 = PyList_GET_ITEM(sequence, 2); 
+    }
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_3);
+    #else
+    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+  } else {
+    Py_ssize_t index = -1;
+    __pyx_t_4 = PyObject_GetIter(__pyx_v_offset); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = Py_TYPE(__pyx_t_4)->tp_iternext;
+    index = 0; __pyx_t_1 = __pyx_t_5(__pyx_t_4); if (unlikely(!__pyx_t_1)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_1);
+    index = 1; __pyx_t_2 = __pyx_t_5(__pyx_t_4); if (unlikely(!__pyx_t_2)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_2);
+    index = 2; __pyx_t_3 = __pyx_t_5(__pyx_t_4); if (unlikely(!__pyx_t_3)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_5(__pyx_t_4), 3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = NULL;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    goto __pyx_L4_unpacking_done;
+    __pyx_L3_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_5 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_L4_unpacking_done:;
+  }
+  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_7 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 556; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_z_offset = __pyx_t_6;
+  __pyx_v_y_offset = __pyx_t_7;
+  __pyx_v_x_offset = __pyx_t_8;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":557
+ * 
+ *         z_offset, y_offset, x_offset = offset
+ *         nsweeps = len(sweep_elevations)             # <<<<<<<<<<<<<<
+ *         for iz in range(self.nz):
+ *             for iy in range(self.ny):
+ */
+  __pyx_t_3 = __pyx_memoryview_fromslice(__pyx_v_sweep_elevations, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_9 = PyObject_Length(__pyx_t_3); if (unlikely(__pyx_t_9 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 557; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_nsweeps = __pyx_t_9;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":558
+ *         z_offset, y_offset, x_offset = offset
+ *         nsweeps = len(sweep_elevations)
+ *         for iz in range(self.nz):             # <<<<<<<<<<<<<<
+ *             for iy in range(self.ny):
+ *                 for ix in range(self.nx):
+ */
+  __pyx_t_10 = __pyx_v_self->nz;
+  for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
+    __pyx_v_iz = __pyx_t_11;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":559
+ *         nsweeps = len(sweep_elevations)
+ *         for iz in range(self.nz):
+ *             for iy in range(self.ny):             # <<<<<<<<<<<<<<
+ *                 for ix in range(self.nx):
+ *                     x = self.x_start + self.x_step * ix - x_offset
+ */
+    __pyx_t_12 = __pyx_v_self->ny;
+    for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+      __pyx_v_iy = __pyx_t_13;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":560
+ *         for iz in range(self.nz):
+ *             for iy in range(self.ny):
+ *                 for ix in range(self.nx):             # <<<<<<<<<<<<<<
+ *                     x = self.x_start + self.x_step * ix - x_offset
+ *                     y = self.y_start + self.y_step * iy - y_offset
+ */
+      __pyx_t_14 = __pyx_v_self->nx;
+      for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+        __pyx_v_ix = __pyx_t_15;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":561
+ *             for iy in range(self.ny):
+ *                 for ix in range(self.nx):
+ *                     x = self.x_start + self.x_step * ix - x_offset             # <<<<<<<<<<<<<<
+ *                     y = self.y_start + self.y_step * iy - y_offset
+ *                     z = self.z_start + self.z_step * iz - z_offset
+ */
+        __pyx_v_x = ((__pyx_v_self->x_start + (__pyx_v_self->x_step * __pyx_v_ix)) - __pyx_v_x_offset);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":562
+ *                 for ix in range(self.nx):
+ *                     x = self.x_start + self.x_step * ix - x_offset
+ *                     y = self.y_start + self.y_step * iy - y_offset             # <<<<<<<<<<<<<<
+ *                     z = self.z_start + self.z_step * iz - z_offset
+ *                     s = sqrt(x * x + y * y)
+ */
+        __pyx_v_y = ((__pyx_v_self->y_start + (__pyx_v_self->y_step * __pyx_v_iy)) - __pyx_v_y_offset);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":563
+ *                     x = self.x_start + self.x_step * ix - x_offset
+ *                     y = self.y_start + self.y_step * iy - y_offset
+ *                     z = self.z_start + self.z_step * iz - z_offset             # <<<<<<<<<<<<<<
+ *                     s = sqrt(x * x + y * y)
+ *                     elevation = point_elevation(s, z)
+ */
+        __pyx_v_z = ((__pyx_v_self->z_start + (__pyx_v_self->z_step * __pyx_v_iz)) - __pyx_v_z_offset);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":564
+ *                     y = self.y_start + self.y_step * iy - y_offset
+ *                     z = self.z_start + self.z_step * iz - z_offset
+ *                     s = sqrt(x * x + y * y)             # <<<<<<<<<<<<<<
+ *                     elevation = point_elevation(s, z)
+ *                     min_diff = 1e30
+ */
+        __pyx_v_s = sqrt(((__pyx_v_x * __pyx_v_x) + (__pyx_v_y * __pyx_v_y)));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":565
+ *                     z = self.z_start + self.z_step * iz - z_offset
+ *                     s = sqrt(x * x + y * y)
+ *                     elevation = point_elevation(s, z)             # <<<<<<<<<<<<<<
+ *                     min_diff = 1e30
+ *                     for isweep in range(nsweeps):
+ */
+        __pyx_v_elevation = __pyx_f_5pyart_3map_17_gate_to_grid_map_point_elevation(__pyx_v_s, __pyx_v_z);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":566
+ *                     s = sqrt(x * x + y * y)
+ *                     elevation = point_elevation(s, z)
+ *                     min_diff = 1e30             # <<<<<<<<<<<<<<
+ *                     for isweep in range(nsweeps):
+ *                         diff = fabs(elevation - sweep_elevations[isweep])
+ */
+        __pyx_v_min_diff = 1e30;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":567
+ *                     elevation = point_elevation(s, z)
+ *                     min_diff = 1e30
+ *                     for isweep in range(nsweeps):             # <<<<<<<<<<<<<<
+ *                         diff = fabs(elevation - sweep_elevations[isweep])
+ *                         if diff < min_diff:
+ */
+        __pyx_t_16 = __pyx_v_nsweeps;
+        for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
+          __pyx_v_isweep = __pyx_t_17;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":568
+ *                     min_diff = 1e30
+ *                     for isweep in range(nsweeps):
+ *                         diff = fabs(elevation - sweep_elevations[isweep])             # <<<<<<<<<<<<<<
+ *                         if diff < min_diff:
+ *                             min_diff = diff
+ */
+          __pyx_t_18 = __pyx_v_isweep;
+          __pyx_v_diff = fabs((__pyx_v_elevation - (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_sweep_elevations.data) + __pyx_t_18)) )))));
+
+          /* "pyart/map/_gate_to_grid_map.pyx":569
+ *                     for isweep in range(nsweeps):
+ *                         diff = fabs(elevation - sweep_elevations[isweep])
+ *                         if diff < min_diff:             # <<<<<<<<<<<<<<
+ *                             min_diff = diff
+ *                             nearest_sweep[iz, iy, ix] = isweep
+ */
+          __pyx_t_19 = ((__pyx_v_diff < __pyx_v_min_diff) != 0);
+          if (__pyx_t_19) {
+
+            /* "pyart/map/_gate_to_grid_map.pyx":570
+ *                         diff = fabs(elevation - sweep_elevations[isweep])
+ *                         if diff < min_diff:
+ *                             min_diff = diff             # <<<<<<<<<<<<<<
+ *                             nearest_sweep[iz, iy, ix] = isweep
+ *         return
+ */
+            __pyx_v_min_diff = __pyx_v_diff;
+
+            /* "pyart/map/_gate_to_grid_map.pyx":571
+ *                         if diff < min_diff:
+ *                             min_diff = diff
+ *                             nearest_sweep[iz, iy, ix] = isweep             # <<<<<<<<<<<<<<
+ *         return
+ * 
+ */
+            __pyx_t_20 = __pyx_v_iz;
+            __pyx_t_21 = __pyx_v_iy;
+            __pyx_t_22 = __pyx_v_ix;
+            *((int *) ( /* dim=2 */ ((char *) (((int *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_nearest_sweep.data + __pyx_t_20 * __pyx_v_nearest_sweep.strides[0]) ) + __pyx_t_21 * __pyx_v_nearest_sweep.strides[1]) )) + __pyx_t_22)) )) = __pyx_v_isweep;
+            goto __pyx_L13;
+          }
+          __pyx_L13:;
+        }
+      }
+    }
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":572
+ *                             min_diff = diff
+ *                             nearest_sweep[iz, iy, ix] = isweep
+ *         return             # <<<<<<<<<<<<<<
+ * 
+ *     @cython.initializedcheck(False)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":534
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     def find_nearest_sweep(             # <<<<<<<<<<<<<<
+ *             self, float[::1] sweep_elevations, offset,
+ *             int[:, :, ::1] nearest_sweep):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.find_nearest_sweep", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_sweep_elevations, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_nearest_sweep, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":578
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     def map_sweep_to_grid(             # <<<<<<<<<<<<<<
+ *             self, float[::1] azimuths, float[::1] ranges, float elevation,
+ *             float[:, :, ::1] sweep_data, char[:, :, ::1] sweep_mask,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_9map_sweep_to_grid(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_8map_sweep_to_grid[] = "\n        Map a radar sweep onto the grid points nearest to the sweep.\n\n        The value at each grid point, whose nearest sweep is the given\n        sweep, is found from the gates surrounding the point's projection\n        onto the sweep, either the nearest gate or by bilinear interpolation\n        in azimuth and range.  Each grid point is visited once so the cost\n        scales with the number of grid points, not with the radius of\n        influence.\n\n        Parameters\n        ----------\n        azimuths : 1D float32 array\n            Azimuth angles of the rays in the sweep, in degrees, sorted in\n            increasing order.\n        ranges : 1D float32 array\n            Gate ranges in meters, increasing.\n        elevation : float\n            Elevation angle of the sweep in degrees.\n        sweep_data : 3D float32 array\n            Field data for the sweep, dimensions are ordered as rays (in the\n            order of the azimuths parameter), gates and fields.\n        sweep_mask : 3D int8 array\n            Non-zero for gates which are masked or excluded, same dimensions\n            as sweep_data.\n        nearest_sweep : 3D int32 array\n            Index of the sweep nearest to each grid point, see\n            :py:func:`find_nearest_sweep`.\n        isweep : int\n            Index of the sweep being mapped.\n        offset : tuple of floats\n            Offset of the radar from the grid origin.  Dimension are ordered\n            as z, y, x.\n        toa : float\n            Top of atmosphere.  Points where the beam is above this level are\n            not mapped.\n        roi_func : RoIFunction\n            Object whose get_roi method returns the radius of influence.\n            Grid points further than this distance from the center of the\n            beam are not mapped.\n        weighting_function : int\n            Function to use for interpolating, 2 for nearest, 3 for bilinear.\n        max_azimuth_gap : float\n            Maximum d""ifference in azimuth, in degrees, between rays used for\n            interpolation.  Larger gaps are treated as missing data.\n\n        ";
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_9map_sweep_to_grid(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_azimuths = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ranges = { 0, 0, { 0 }, { 0 }, { 0 } };
+  float __pyx_v_elevation;
+  __Pyx_memviewslice __pyx_v_sweep_data = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_sweep_mask = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_nearest_sweep = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_v_isweep;
+  PyObject *__pyx_v_offset = 0;
+  float __pyx_v_toa;
+  struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func = 0;
+  int __pyx_v_weighting_function;
+  float __pyx_v_max_azimuth_gap;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("map_sweep_to_grid (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_azimuths,&__pyx_n_s_ranges,&__pyx_n_s_elevation,&__pyx_n_s_sweep_data,&__pyx_n_s_sweep_mask,&__pyx_n_s_nearest_sweep,&__pyx_n_s_isweep,&__pyx_n_s_offset,&__pyx_n_s_toa,&__pyx_n_s_roi_func,&__pyx_n_s_weighting_function,&__pyx_n_s_max_azimuth_gap,0};
+    PyObject* values[12] = {0,0,0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_azimuths)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ranges)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_elevation)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sweep_data)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_sweep_mask)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_nearest_sweep)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_isweep)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  8:
+        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_toa)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  9:
+        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_roi_func)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 10:
+        if (likely((values[10] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_weighting_function)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, 10); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 11:
+        if (likely((values[11] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_max_azimuth_gap)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, 11); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "map_sweep_to_grid") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 12) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+      values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+    }
+    __pyx_v_azimuths = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_azimuths.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 579; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_ranges = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[1]); if (unlikely(!__pyx_v_ranges.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 579; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_elevation = __pyx_PyFloat_AsFloat(values[2]); if (unlikely((__pyx_v_elevation == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 579; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_sweep_data = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(values[3]); if (unlikely(!__pyx_v_sweep_data.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 580; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_sweep_mask = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_char(values[4]); if (unlikely(!__pyx_v_sweep_mask.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 580; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_nearest_sweep = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_int(values[5]); if (unlikely(!__pyx_v_nearest_sweep.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_isweep = __Pyx_PyInt_As_int(values[6]); if (unlikely((__pyx_v_isweep == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_offset = values[7];
+    __pyx_v_toa = __pyx_PyFloat_AsFloat(values[8]); if (unlikely((__pyx_v_toa == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 581; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_roi_func = ((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *)values[9]);
+    __pyx_v_weighting_function = __Pyx_PyInt_As_int(values[10]); if (unlikely((__pyx_v_weighting_function == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_max_azimuth_gap = __pyx_PyFloat_AsFloat(values[11]); if (unlikely((__pyx_v_max_azimuth_gap == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 583; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("map_sweep_to_grid", 1, 12, 12, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 578; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.map_sweep_to_grid", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_roi_func), __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction, 1, "roi_func", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 582; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_8map_sweep_to_grid(((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *)__pyx_v_self), __pyx_v_azimuths, __pyx_v_ranges, __pyx_v_elevation, __pyx_v_sweep_data, __pyx_v_sweep_mask, __pyx_v_nearest_sweep, __pyx_v_isweep, __pyx_v_offset, __pyx_v_toa, __pyx_v_roi_func, __pyx_v_weighting_function, __pyx_v_max_azimuth_gap);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_8map_sweep_to_grid(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, __Pyx_memviewslice __pyx_v_azimuths, __Pyx_memviewslice __pyx_v_ranges, float __pyx_v_elevation, __Pyx_memviewslice __pyx_v_sweep_data, __Pyx_memviewslice __pyx_v_sweep_mask, __Pyx_memviewslice __pyx_v_nearest_sweep, int __pyx_v_isweep, PyObject *__pyx_v_offset, float __pyx_v_toa, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func, int __pyx_v_weighting_function, float __pyx_v_max_azimuth_gap) {
+  int __pyx_v_ix;
+  int __pyx_v_iy;
+  int __pyx_v_iz;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_nrays;
+  int __pyx_v_ngates;
+  int __pyx_v_i0;
+  int __pyx_v_i1;
+  int __pyx_v_j0;
+  int __pyx_v_j1;
+  int __pyx_v_ilow;
+  int __pyx_v_ihigh;
+  int __pyx_v_imid;
+  double __pyx_v_x;
+  double __pyx_v_y;
+  double __pyx_v_z;
+  double __pyx_v_xg;
+  double __pyx_v_yg;
+  double __pyx_v_zg;
+  double __pyx_v_s;
+  double __pyx_v_theta;
+  double __pyx_v_r;
+  double __pyx_v_zb;
+  double __pyx_v_az;
+  double __pyx_v_roi;
+  double __pyx_v_az0;
+  double __pyx_v_az1;
+  double __pyx_v_ta;
+  double __pyx_v_tr;
+  double __pyx_v_wsum;
+  double __pyx_v_vsum;
+  double __pyx_v_sin_e;
+  double __pyx_v_cos_e;
+  double __pyx_v_x_offset;
+  double __pyx_v_y_offset;
+  double __pyx_v_z_offset;
+  double __pyx_v_weights[4];
+  int __pyx_v_rays[4];
+  int __pyx_v_gates[4];
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *(*__pyx_t_5)(PyObject *);
+  double __pyx_t_6;
+  double __pyx_t_7;
+  double __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+  int __pyx_t_20;
+  long __pyx_t_21;
+  Py_ssize_t __pyx_t_22;
+  long __pyx_t_23;
+  long __pyx_t_24;
+  Py_ssize_t __pyx_t_25;
+  int __pyx_t_26;
+  int __pyx_t_27;
+  int __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  long __pyx_t_30;
+  int __pyx_t_31;
+  int __pyx_t_32;
+  int __pyx_t_33;
+  int __pyx_t_34;
+  int __pyx_t_35;
+  int __pyx_t_36;
+  int __pyx_t_37;
+  int __pyx_t_38;
+  int __pyx_t_39;
+  int __pyx_t_40;
+  int __pyx_t_41;
+  int __pyx_t_42;
+  int __pyx_t_43;
+  int __pyx_t_44;
+  int __pyx_t_45;
+  int __pyx_t_46;
+  int __pyx_t_47;
+  int __pyx_t_48;
+  int __pyx_t_49;
+  int __pyx_t_50;
+  int __pyx_t_51;
+  int __pyx_t_52;
+  int __pyx_t_53;
+  int __pyx_t_54;
+  int __pyx_t_55;
+  int __pyx_t_56;
+  int __pyx_t_57;
+  int __pyx_t_58;
+  int __pyx_t_59;
+  int __pyx_t_60;
+  int __pyx_t_61;
+  int __pyx_t_62;
+  int __pyx_t_63;
+  int __pyx_t_64;
+  int __pyx_t_65;
+  int __pyx_t_66;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("map_sweep_to_grid", 0);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":641
+ *         cdef int gates[4]
+ * 
+ *         z_offset, y_offset, x_offset = offset             # <<<<<<<<<<<<<<
+ *         nrays = len(azimuths)
+ *         ngates = len(ranges)
+ */
+  if ((likely(PyTuple_CheckExact(__pyx_v_offset))) || (PyList_CheckExact(__pyx_v_offset))) {
+    PyObject* sequence = __pyx_v_offset;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    Py_ssize_t size = Py_SIZE(sequence);
+    #else
+    Py_ssize_t size = PySequence_Size(sequence);
+    #endif
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    #if CYTHON_COMPILING_IN_CPYTHON
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_1 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_2 = PyTuple_GET_ITEM(sequence, 1); 
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 2); 
+    } else {
+      __pyx_t_1 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_2 = PyList_GET_ITEM(sequence, 1); 
+      __pyx_t_3 = PyList_GET_ITEM(sequence, 2); 
+    }
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_3);
+    #else
+    __pyx_t_1 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    #endif
+  } else {
+    Py_ssize_t index = -1;
+    __pyx_t_4 = PyObject_GetIter(__pyx_v_offset); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = Py_TYPE(__pyx_t_4)->tp_iternext;
+    index = 0; __pyx_t_1 = __pyx_t_5(__pyx_t_4); if (unlikely(!__pyx_t_1)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_1);
+    index = 1; __pyx_t_2 = __pyx_t_5(__pyx_t_4); if (unlikely(!__pyx_t_2)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_2);
+    index = 2; __pyx_t_3 = __pyx_t_5(__pyx_t_4); if (unlikely(!__pyx_t_3)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_3);
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_5(__pyx_t_4), 3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_5 = NULL;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    goto __pyx_L4_unpacking_done;
+    __pyx_L3_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_5 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_L4_unpacking_done:;
+  }
+  __pyx_t_6 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_6 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_7 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_8 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely((__pyx_t_8 == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 641; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_z_offset = __pyx_t_6;
+  __pyx_v_y_offset = __pyx_t_7;
+  __pyx_v_x_offset = __pyx_t_8;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":642
+ * 
+ *         z_offset, y_offset, x_offset = offset
+ *         nrays = len(azimuths)             # <<<<<<<<<<<<<<
+ *         ngates = len(ranges)
+ *         if nrays == 0 or ngates == 0:
+ */
+  __pyx_t_3 = __pyx_memoryview_fromslice(__pyx_v_azimuths, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 642; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_9 = PyObject_Length(__pyx_t_3); if (unlikely(__pyx_t_9 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 642; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_nrays = __pyx_t_9;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":643
+ *         z_offset, y_offset, x_offset = offset
+ *         nrays = len(azimuths)
+ *         ngates = len(ranges)             # <<<<<<<<<<<<<<
+ *         if nrays == 0 or ngates == 0:
+ *             return
+ */
+  __pyx_t_3 = __pyx_memoryview_fromslice(__pyx_v_ranges, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 643; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_9 = PyObject_Length(__pyx_t_3); if (unlikely(__pyx_t_9 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 643; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_ngates = __pyx_t_9;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":644
+ *         nrays = len(azimuths)
+ *         ngates = len(ranges)
+ *         if nrays == 0 or ngates == 0:             # <<<<<<<<<<<<<<
+ *             return
+ *         sin_e = sin(elevation * PI / 180.)
+ */
+  __pyx_t_11 = ((__pyx_v_nrays == 0) != 0);
+  if (!__pyx_t_11) {
+  } else {
+    __pyx_t_10 = __pyx_t_11;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_11 = ((__pyx_v_ngates == 0) != 0);
+  __pyx_t_10 = __pyx_t_11;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_10) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":645
+ *         ngates = len(ranges)
+ *         if nrays == 0 or ngates == 0:
+ *             return             # <<<<<<<<<<<<<<
+ *         sin_e = sin(elevation * PI / 180.)
+ *         cos_e = cos(elevation * PI / 180.)
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":646
+ *         if nrays == 0 or ngates == 0:
+ *             return
+ *         sin_e = sin(elevation * PI / 180.)             # <<<<<<<<<<<<<<
+ *         cos_e = cos(elevation * PI / 180.)
+ * 
+ */
+  __pyx_v_sin_e = sin(((__pyx_v_elevation * __pyx_v_5pyart_3map_17_gate_to_grid_map_PI) / 180.));
+
+  /* "pyart/map/_gate_to_grid_map.pyx":647
+ *             return
+ *         sin_e = sin(elevation * PI / 180.)
+ *         cos_e = cos(elevation * PI / 180.)             # <<<<<<<<<<<<<<
+ * 
+ *         for iz in range(self.nz):
+ */
+  __pyx_v_cos_e = cos(((__pyx_v_elevation * __pyx_v_5pyart_3map_17_gate_to_grid_map_PI) / 180.));
+
+  /* "pyart/map/_gate_to_grid_map.pyx":649
+ *         cos_e = cos(elevation * PI / 180.)
+ * 
+ *         for iz in range(self.nz):             # <<<<<<<<<<<<<<
+ *             for iy in range(self.ny):
+ *                 for ix in range(self.nx):
+ */
+  __pyx_t_12 = __pyx_v_self->nz;
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+    __pyx_v_iz = __pyx_t_13;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":650
+ * 
+ *         for iz in range(self.nz):
+ *             for iy in range(self.ny):             # <<<<<<<<<<<<<<
+ *                 for ix in range(self.nx):
+ *                     if nearest_sweep[iz, iy, ix] != isweep:
+ */
+    __pyx_t_14 = __pyx_v_self->ny;
+    for (__pyx_t_15 = 0; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
+      __pyx_v_iy = __pyx_t_15;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":651
+ *         for iz in range(self.nz):
+ *             for iy in range(self.ny):
+ *                 for ix in range(self.nx):             # <<<<<<<<<<<<<<
+ *                     if nearest_sweep[iz, iy, ix] != isweep:
+ *                         continue
+ */
+      __pyx_t_16 = __pyx_v_self->nx;
+      for (__pyx_t_17 = 0; __pyx_t_17 < __pyx_t_16; __pyx_t_17+=1) {
+        __pyx_v_ix = __pyx_t_17;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":652
+ *             for iy in range(self.ny):
+ *                 for ix in range(self.nx):
+ *                     if nearest_sweep[iz, iy, ix] != isweep:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     xg = self.x_start + self.x_step * ix
+ */
+        __pyx_t_18 = __pyx_v_iz;
+        __pyx_t_19 = __pyx_v_iy;
+        __pyx_t_20 = __pyx_v_ix;
+        __pyx_t_10 = (((*((int *) ( /* dim=2 */ ((char *) (((int *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_nearest_sweep.data + __pyx_t_18 * __pyx_v_nearest_sweep.strides[0]) ) + __pyx_t_19 * __pyx_v_nearest_sweep.strides[1]) )) + __pyx_t_20)) ))) != __pyx_v_isweep) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":653
+ *                 for ix in range(self.nx):
+ *                     if nearest_sweep[iz, iy, ix] != isweep:
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     xg = self.x_start + self.x_step * ix
+ *                     yg = self.y_start + self.y_step * iy
+ */
+          goto __pyx_L12_continue;
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":654
+ *                     if nearest_sweep[iz, iy, ix] != isweep:
+ *                         continue
+ *                     xg = self.x_start + self.x_step * ix             # <<<<<<<<<<<<<<
+ *                     yg = self.y_start + self.y_step * iy
+ *                     zg = self.z_start + self.z_step * iz
+ */
+        __pyx_v_xg = (__pyx_v_self->x_start + (__pyx_v_self->x_step * __pyx_v_ix));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":655
+ *                         continue
+ *                     xg = self.x_start + self.x_step * ix
+ *                     yg = self.y_start + self.y_step * iy             # <<<<<<<<<<<<<<
+ *                     zg = self.z_start + self.z_step * iz
+ *                     x = xg - x_offset
+ */
+        __pyx_v_yg = (__pyx_v_self->y_start + (__pyx_v_self->y_step * __pyx_v_iy));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":656
+ *                     xg = self.x_start + self.x_step * ix
+ *                     yg = self.y_start + self.y_step * iy
+ *                     zg = self.z_start + self.z_step * iz             # <<<<<<<<<<<<<<
+ *                     x = xg - x_offset
+ *                     y = yg - y_offset
+ */
+        __pyx_v_zg = (__pyx_v_self->z_start + (__pyx_v_self->z_step * __pyx_v_iz));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":657
+ *                     yg = self.y_start + self.y_step * iy
+ *                     zg = self.z_start + self.z_step * iz
+ *                     x = xg - x_offset             # <<<<<<<<<<<<<<
+ *                     y = yg - y_offset
+ *                     z = zg - z_offset
+ */
+        __pyx_v_x = (__pyx_v_xg - __pyx_v_x_offset);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":658
+ *                     zg = self.z_start + self.z_step * iz
+ *                     x = xg - x_offset
+ *                     y = yg - y_offset             # <<<<<<<<<<<<<<
+ *                     z = zg - z_offset
+ * 
+ */
+        __pyx_v_y = (__pyx_v_yg - __pyx_v_y_offset);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":659
+ *                     x = xg - x_offset
+ *                     y = yg - y_offset
+ *                     z = zg - z_offset             # <<<<<<<<<<<<<<
+ * 
+ *                     # range along the sweep and height of the beam center
+ */
+        __pyx_v_z = (__pyx_v_zg - __pyx_v_z_offset);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":663
+ *                     # range along the sweep and height of the beam center
+ *                     # at the ground distance of the point
+ *                     s = sqrt(x * x + y * y)             # <<<<<<<<<<<<<<
+ *                     theta = s / R
+ *                     if cos_e * cos(theta) - sin_e * sin(theta) <= 0:
+ */
+        __pyx_v_s = sqrt(((__pyx_v_x * __pyx_v_x) + (__pyx_v_y * __pyx_v_y)));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":664
+ *                     # at the ground distance of the point
+ *                     s = sqrt(x * x + y * y)
+ *                     theta = s / R             # <<<<<<<<<<<<<<
+ *                     if cos_e * cos(theta) - sin_e * sin(theta) <= 0:
+ *                         continue
+ */
+        __pyx_v_theta = (__pyx_v_s / __pyx_v_5pyart_3map_17_gate_to_grid_map_R);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":665
+ *                     s = sqrt(x * x + y * y)
+ *                     theta = s / R
+ *                     if cos_e * cos(theta) - sin_e * sin(theta) <= 0:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     r = R * sin(theta) / (cos_e * cos(theta) -
+ */
+        __pyx_t_10 = ((((__pyx_v_cos_e * cos(__pyx_v_theta)) - (__pyx_v_sin_e * sin(__pyx_v_theta))) <= 0.0) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":666
+ *                     theta = s / R
+ *                     if cos_e * cos(theta) - sin_e * sin(theta) <= 0:
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     r = R * sin(theta) / (cos_e * cos(theta) -
+ *                                           sin_e * sin(theta))
+ */
+          goto __pyx_L12_continue;
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":667
+ *                     if cos_e * cos(theta) - sin_e * sin(theta) <= 0:
+ *                         continue
+ *                     r = R * sin(theta) / (cos_e * cos(theta) -             # <<<<<<<<<<<<<<
+ *                                           sin_e * sin(theta))
+ *                     zb = sqrt(r * r + R * R + 2.0 * r * R * sin_e) - R
+ */
+        __pyx_v_r = ((__pyx_v_5pyart_3map_17_gate_to_grid_map_R * sin(__pyx_v_theta)) / ((__pyx_v_cos_e * cos(__pyx_v_theta)) - (__pyx_v_sin_e * sin(__pyx_v_theta))));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":669
+ *                     r = R * sin(theta) / (cos_e * cos(theta) -
+ *                                           sin_e * sin(theta))
+ *                     zb = sqrt(r * r + R * R + 2.0 * r * R * sin_e) - R             # <<<<<<<<<<<<<<
+ *                     if zb + z_offset >= toa:
+ *                         continue
+ */
+        __pyx_v_zb = (sqrt((((__pyx_v_r * __pyx_v_r) + (__pyx_v_5pyart_3map_17_gate_to_grid_map_R * __pyx_v_5pyart_3map_17_gate_to_grid_map_R)) + (((2.0 * __pyx_v_r) * __pyx_v_5pyart_3map_17_gate_to_grid_map_R) * __pyx_v_sin_e))) - __pyx_v_5pyart_3map_17_gate_to_grid_map_R);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":670
+ *                                           sin_e * sin(theta))
+ *                     zb = sqrt(r * r + R * R + 2.0 * r * R * sin_e) - R
+ *                     if zb + z_offset >= toa:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     roi = roi_func.get_roi(zg, yg, xg)
+ */
+        __pyx_t_10 = (((__pyx_v_zb + __pyx_v_z_offset) >= __pyx_v_toa) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":671
+ *                     zb = sqrt(r * r + R * R + 2.0 * r * R * sin_e) - R
+ *                     if zb + z_offset >= toa:
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     roi = roi_func.get_roi(zg, yg, xg)
+ *                     if fabs(z - zb) > roi:
+ */
+          goto __pyx_L12_continue;
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":672
+ *                     if zb + z_offset >= toa:
+ *                         continue
+ *                     roi = roi_func.get_roi(zg, yg, xg)             # <<<<<<<<<<<<<<
+ *                     if fabs(z - zb) > roi:
+ *                         continue
+ */
+        __pyx_v_roi = ((struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction *)__pyx_v_roi_func->__pyx_vtab)->get_roi(__pyx_v_roi_func, __pyx_v_zg, __pyx_v_yg, __pyx_v_xg, 0);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":673
+ *                         continue
+ *                     roi = roi_func.get_roi(zg, yg, xg)
+ *                     if fabs(z - zb) > roi:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     az = atan2(x, y) * 180. / PI
+ */
+        __pyx_t_10 = ((fabs((__pyx_v_z - __pyx_v_zb)) > __pyx_v_roi) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":674
+ *                     roi = roi_func.get_roi(zg, yg, xg)
+ *                     if fabs(z - zb) > roi:
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     az = atan2(x, y) * 180. / PI
+ *                     if az < 0:
+ */
+          goto __pyx_L12_continue;
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":675
+ *                     if fabs(z - zb) > roi:
+ *                         continue
+ *                     az = atan2(x, y) * 180. / PI             # <<<<<<<<<<<<<<
+ *                     if az < 0:
+ *                         az += 360.
+ */
+        __pyx_v_az = ((atan2(__pyx_v_x, __pyx_v_y) * 180.) / __pyx_v_5pyart_3map_17_gate_to_grid_map_PI);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":676
+ *                         continue
+ *                     az = atan2(x, y) * 180. / PI
+ *                     if az < 0:             # <<<<<<<<<<<<<<
+ *                         az += 360.
+ * 
+ */
+        __pyx_t_10 = ((__pyx_v_az < 0.0) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":677
+ *                     az = atan2(x, y) * 180. / PI
+ *                     if az < 0:
+ *                         az += 360.             # <<<<<<<<<<<<<<
+ * 
+ *                     # find rays bracketing the azimuth, i0 <= az < i1
+ */
+          __pyx_v_az = (__pyx_v_az + 360.);
+          goto __pyx_L18;
+        }
+        __pyx_L18:;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":680
+ * 
+ *                     # find rays bracketing the azimuth, i0 <= az < i1
+ *                     if az < azimuths[0]:             # <<<<<<<<<<<<<<
+ *                         i0 = nrays - 1
+ *                         i1 = 0
+ */
+        __pyx_t_9 = 0;
+        __pyx_t_10 = ((__pyx_v_az < (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_azimuths.data) + __pyx_t_9)) )))) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":681
+ *                     # find rays bracketing the azimuth, i0 <= az < i1
+ *                     if az < azimuths[0]:
+ *                         i0 = nrays - 1             # <<<<<<<<<<<<<<
+ *                         i1 = 0
+ *                         az0 = azimuths[nrays - 1] - 360.
+ */
+          __pyx_v_i0 = (__pyx_v_nrays - 1);
+
+          /* "pyart/map/_gate_to_grid_map.pyx":682
+ *                     if az < azimuths[0]:
+ *                         i0 = nrays - 1
+ *                         i1 = 0             # <<<<<<<<<<<<<<
+ *                         az0 = azimuths[nrays - 1] - 360.
+ *                         az1 = azimuths[0]
+ */
+          __pyx_v_i1 = 0;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":683
+ *                         i0 = nrays - 1
+ *                         i1 = 0
+ *                         az0 = azimuths[nrays - 1] - 360.             # <<<<<<<<<<<<<<
+ *                         az1 = azimuths[0]
+ *                     elif az >= azimuths[nrays - 1]:
+ */
+          __pyx_t_21 = (__pyx_v_nrays - 1);
+          __pyx_v_az0 = ((*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_azimuths.data) + __pyx_t_21)) ))) - 360.);
+
+          /* "pyart/map/_gate_to_grid_map.pyx":684
+ *                         i1 = 0
+ *                         az0 = azimuths[nrays - 1] - 360.
+ *                         az1 = azimuths[0]             # <<<<<<<<<<<<<<
+ *                     elif az >= azimuths[nrays - 1]:
+ *                         i0 = nrays - 1
+ */
+          __pyx_t_22 = 0;
+          __pyx_v_az1 = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_azimuths.data) + __pyx_t_22)) )));
+          goto __pyx_L19;
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":685
+ *                         az0 = azimuths[nrays - 1] - 360.
+ *                         az1 = azimuths[0]
+ *                     elif az >= azimuths[nrays - 1]:             # <<<<<<<<<<<<<<
+ *                         i0 = nrays - 1
+ *                         i1 = 0
+ */
+        __pyx_t_23 = (__pyx_v_nrays - 1);
+        __pyx_t_10 = ((__pyx_v_az >= (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_azimuths.data) + __pyx_t_23)) )))) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":686
+ *                         az1 = azimuths[0]
+ *                     elif az >= azimuths[nrays - 1]:
+ *                         i0 = nrays - 1             # <<<<<<<<<<<<<<
+ *                         i1 = 0
+ *                         az0 = azimuths[nrays - 1]
+ */
+          __pyx_v_i0 = (__pyx_v_nrays - 1);
+
+          /* "pyart/map/_gate_to_grid_map.pyx":687
+ *                     elif az >= azimuths[nrays - 1]:
+ *                         i0 = nrays - 1
+ *                         i1 = 0             # <<<<<<<<<<<<<<
+ *                         az0 = azimuths[nrays - 1]
+ *                         az1 = azimuths[0] + 360.
+ */
+          __pyx_v_i1 = 0;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":688
+ *                         i0 = nrays - 1
+ *                         i1 = 0
+ *                         az0 = azimuths[nrays - 1]             # <<<<<<<<<<<<<<
+ *                         az1 = azimuths[0] + 360.
+ *                     else:
+ */
+          __pyx_t_24 = (__pyx_v_nrays - 1);
+          __pyx_v_az0 = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_azimuths.data) + __pyx_t_24)) )));
+
+          /* "pyart/map/_gate_to_grid_map.pyx":689
+ *                         i1 = 0
+ *                         az0 = azimuths[nrays - 1]
+ *                         az1 = azimuths[0] + 360.             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         ilow = 0
+ */
+          __pyx_t_25 = 0;
+          __pyx_v_az1 = ((*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_azimuths.data) + __pyx_t_25)) ))) + 360.);
+          goto __pyx_L19;
+        }
+        /*else*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":691
+ *                         az1 = azimuths[0] + 360.
+ *                     else:
+ *                         ilow = 0             # <<<<<<<<<<<<<<
+ *                         ihigh = nrays - 1
+ *                         while ihigh - ilow > 1:
+ */
+          __pyx_v_ilow = 0;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":692
+ *                     else:
+ *                         ilow = 0
+ *                         ihigh = nrays - 1             # <<<<<<<<<<<<<<
+ *                         while ihigh - ilow > 1:
+ *                             imid = (ilow + ihigh) // 2
+ */
+          __pyx_v_ihigh = (__pyx_v_nrays - 1);
+
+          /* "pyart/map/_gate_to_grid_map.pyx":693
+ *                         ilow = 0
+ *                         ihigh = nrays - 1
+ *                         while ihigh - ilow > 1:             # <<<<<<<<<<<<<<
+ *                             imid = (ilow + ihigh) // 2
+ *                             if azimuths[imid] <= az:
+ */
+          while (1) {
+            __pyx_t_10 = (((__pyx_v_ihigh - __pyx_v_ilow) > 1) != 0);
+            if (!__pyx_t_10) break;
+
+            /* "pyart/map/_gate_to_grid_map.pyx":694
+ *                         ihigh = nrays - 1
+ *                         while ihigh - ilow > 1:
+ *                             imid = (ilow + ihigh) // 2             # <<<<<<<<<<<<<<
+ *                             if azimuths[imid] <= az:
+ *                                 ilow = imid
+ */
+            __pyx_v_imid = ((__pyx_v_ilow + __pyx_v_ihigh) / 2);
+
+            /* "pyart/map/_gate_to_grid_map.pyx":695
+ *                         while ihigh - ilow > 1:
+ *                             imid = (ilow + ihigh) // 2
+ *                             if azimuths[imid] <= az:             # <<<<<<<<<<<<<<
+ *                                 ilow = imid
+ *                             else:
+ */
+            __pyx_t_26 = __pyx_v_imid;
+            __pyx_t_10 = (((*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_azimuths.data) + __pyx_t_26)) ))) <= __pyx_v_az) != 0);
+            if (__pyx_t_10) {
+
+              /* "pyart/map/_gate_to_grid_map.pyx":696
+ *                             imid = (ilow + ihigh) // 2
+ *                             if azimuths[imid] <= az:
+ *                                 ilow = imid             # <<<<<<<<<<<<<<
+ *                             else:
+ *                                 ihigh = imid
+ */
+              __pyx_v_ilow = __pyx_v_imid;
+              goto __pyx_L22;
+            }
+            /*else*/ {
+
+              /* "pyart/map/_gate_to_grid_map.pyx":698
+ *                                 ilow = imid
+ *                             else:
+ *                                 ihigh = imid             # <<<<<<<<<<<<<<
+ *                         i0 = ilow
+ *                         i1 = ihigh
+ */
+              __pyx_v_ihigh = __pyx_v_imid;
+            }
+            __pyx_L22:;
+          }
+
+          /* "pyart/map/_gate_to_grid_map.pyx":699
+ *                             else:
+ *                                 ihigh = imid
+ *                         i0 = ilow             # <<<<<<<<<<<<<<
+ *                         i1 = ihigh
+ *                         az0 = azimuths[i0]
+ */
+          __pyx_v_i0 = __pyx_v_ilow;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":700
+ *                                 ihigh = imid
+ *                         i0 = ilow
+ *                         i1 = ihigh             # <<<<<<<<<<<<<<
+ *                         az0 = azimuths[i0]
+ *                         az1 = azimuths[i1]
+ */
+          __pyx_v_i1 = __pyx_v_ihigh;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":701
+ *                         i0 = ilow
+ *                         i1 = ihigh
+ *                         az0 = azimuths[i0]             # <<<<<<<<<<<<<<
+ *                         az1 = azimuths[i1]
+ *                     if az1 - az0 > max_azimuth_gap:
+ */
+          __pyx_t_27 = __pyx_v_i0;
+          __pyx_v_az0 = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_azimuths.data) + __pyx_t_27)) )));
+
+          /* "pyart/map/_gate_to_grid_map.pyx":702
+ *                         i1 = ihigh
+ *                         az0 = azimuths[i0]
+ *                         az1 = azimuths[i1]             # <<<<<<<<<<<<<<
+ *                     if az1 - az0 > max_azimuth_gap:
+ *                         continue
+ */
+          __pyx_t_28 = __pyx_v_i1;
+          __pyx_v_az1 = (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_azimuths.data) + __pyx_t_28)) )));
+        }
+        __pyx_L19:;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":703
+ *                         az0 = azimuths[i0]
+ *                         az1 = azimuths[i1]
+ *                     if az1 - az0 > max_azimuth_gap:             # <<<<<<<<<<<<<<
+ *                         continue
+ * 
+ */
+        __pyx_t_10 = (((__pyx_v_az1 - __pyx_v_az0) > __pyx_v_max_azimuth_gap) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":704
+ *                         az1 = azimuths[i1]
+ *                     if az1 - az0 > max_azimuth_gap:
+ *                         continue             # <<<<<<<<<<<<<<
+ * 
+ *                     # find gates bracketing the range, j0 <= r <= j1
+ */
+          goto __pyx_L12_continue;
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":707
+ * 
+ *                     # find gates bracketing the range, j0 <= r <= j1
+ *                     if r < ranges[0] or r > ranges[ngates - 1]:             # <<<<<<<<<<<<<<
+ *                         continue
+ *                     if ngates == 1:
+ */
+        __pyx_t_29 = 0;
+        __pyx_t_11 = ((__pyx_v_r < (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_ranges.data) + __pyx_t_29)) )))) != 0);
+        if (!__pyx_t_11) {
+        } else {
+          __pyx_t_10 = __pyx_t_11;
+          goto __pyx_L25_bool_binop_done;
+        }
+        __pyx_t_30 = (__pyx_v_ngates - 1);
+        __pyx_t_11 = ((__pyx_v_r > (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_ranges.data) + __pyx_t_30)) )))) != 0);
+        __pyx_t_10 = __pyx_t_11;
+        __pyx_L25_bool_binop_done:;
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":708
+ *                     # find gates bracketing the range, j0 <= r <= j1
+ *                     if r < ranges[0] or r > ranges[ngates - 1]:
+ *                         continue             # <<<<<<<<<<<<<<
+ *                     if ngates == 1:
+ *                         j0 = 0
+ */
+          goto __pyx_L12_continue;
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":709
+ *                     if r < ranges[0] or r > ranges[ngates - 1]:
+ *                         continue
+ *                     if ngates == 1:             # <<<<<<<<<<<<<<
+ *                         j0 = 0
+ *                         j1 = 0
+ */
+        __pyx_t_10 = ((__pyx_v_ngates == 1) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":710
+ *                         continue
+ *                     if ngates == 1:
+ *                         j0 = 0             # <<<<<<<<<<<<<<
+ *                         j1 = 0
+ *                     else:
+ */
+          __pyx_v_j0 = 0;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":711
+ *                     if ngates == 1:
+ *                         j0 = 0
+ *                         j1 = 0             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         ilow = 0
+ */
+          __pyx_v_j1 = 0;
+          goto __pyx_L27;
+        }
+        /*else*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":713
+ *                         j1 = 0
+ *                     else:
+ *                         ilow = 0             # <<<<<<<<<<<<<<
+ *                         ihigh = ngates - 1
+ *                         while ihigh - ilow > 1:
+ */
+          __pyx_v_ilow = 0;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":714
+ *                     else:
+ *                         ilow = 0
+ *                         ihigh = ngates - 1             # <<<<<<<<<<<<<<
+ *                         while ihigh - ilow > 1:
+ *                             imid = (ilow + ihigh) // 2
+ */
+          __pyx_v_ihigh = (__pyx_v_ngates - 1);
+
+          /* "pyart/map/_gate_to_grid_map.pyx":715
+ *                         ilow = 0
+ *                         ihigh = ngates - 1
+ *                         while ihigh - ilow > 1:             # <<<<<<<<<<<<<<
+ *                             imid = (ilow + ihigh) // 2
+ *                             if ranges[imid] <= r:
+ */
+          while (1) {
+            __pyx_t_10 = (((__pyx_v_ihigh - __pyx_v_ilow) > 1) != 0);
+            if (!__pyx_t_10) break;
+
+            /* "pyart/map/_gate_to_grid_map.pyx":716
+ *                         ihigh = ngates - 1
+ *                         while ihigh - ilow > 1:
+ *                             imid = (ilow + ihigh) // 2             # <<<<<<<<<<<<<<
+ *                             if ranges[imid] <= r:
+ *                                 ilow = imid
+ */
+            __pyx_v_imid = ((__pyx_v_ilow + __pyx_v_ihigh) / 2);
+
+            /* "pyart/map/_gate_to_grid_map.pyx":717
+ *                         while ihigh - ilow > 1:
+ *                             imid = (ilow + ihigh) // 2
+ *                             if ranges[imid] <= r:             # <<<<<<<<<<<<<<
+ *                                 ilow = imid
+ *                             else:
+ */
+            __pyx_t_31 = __pyx_v_imid;
+            __pyx_t_10 = (((*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_ranges.data) + __pyx_t_31)) ))) <= __pyx_v_r) != 0);
+            if (__pyx_t_10) {
+
+              /* "pyart/map/_gate_to_grid_map.pyx":718
+ *                             imid = (ilow + ihigh) // 2
+ *                             if ranges[imid] <= r:
+ *                                 ilow = imid             # <<<<<<<<<<<<<<
+ *                             else:
+ *                                 ihigh = imid
+ */
+              __pyx_v_ilow = __pyx_v_imid;
+              goto __pyx_L30;
+            }
+            /*else*/ {
+
+              /* "pyart/map/_gate_to_grid_map.pyx":720
+ *                                 ilow = imid
+ *                             else:
+ *                                 ihigh = imid             # <<<<<<<<<<<<<<
+ *                         j0 = ilow
+ *                         j1 = ihigh
+ */
+              __pyx_v_ihigh = __pyx_v_imid;
+            }
+            __pyx_L30:;
+          }
+
+          /* "pyart/map/_gate_to_grid_map.pyx":721
+ *                             else:
+ *                                 ihigh = imid
+ *                         j0 = ilow             # <<<<<<<<<<<<<<
+ *                         j1 = ihigh
+ * 
+ */
+          __pyx_v_j0 = __pyx_v_ilow;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":722
+ *                                 ihigh = imid
+ *                         j0 = ilow
+ *                         j1 = ihigh             # <<<<<<<<<<<<<<
+ * 
+ *                     if az1 > az0:
+ */
+          __pyx_v_j1 = __pyx_v_ihigh;
+        }
+        __pyx_L27:;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":724
+ *                         j1 = ihigh
+ * 
+ *                     if az1 > az0:             # <<<<<<<<<<<<<<
+ *                         ta = (az - az0) / (az1 - az0)
+ *                     else:
+ */
+        __pyx_t_10 = ((__pyx_v_az1 > __pyx_v_az0) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":725
+ * 
+ *                     if az1 > az0:
+ *                         ta = (az - az0) / (az1 - az0)             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         ta = 0
+ */
+          __pyx_v_ta = ((__pyx_v_az - __pyx_v_az0) / (__pyx_v_az1 - __pyx_v_az0));
+          goto __pyx_L31;
+        }
+        /*else*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":727
+ *                         ta = (az - az0) / (az1 - az0)
+ *                     else:
+ *                         ta = 0             # <<<<<<<<<<<<<<
+ *                     if ranges[j1] > ranges[j0]:
+ *                         tr = (r - ranges[j0]) / (ranges[j1] - ranges[j0])
+ */
+          __pyx_v_ta = 0.0;
+        }
+        __pyx_L31:;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":728
+ *                     else:
+ *                         ta = 0
+ *                     if ranges[j1] > ranges[j0]:             # <<<<<<<<<<<<<<
+ *                         tr = (r - ranges[j0]) / (ranges[j1] - ranges[j0])
+ *                     else:
+ */
+        __pyx_t_32 = __pyx_v_j1;
+        __pyx_t_33 = __pyx_v_j0;
+        __pyx_t_10 = (((*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_ranges.data) + __pyx_t_32)) ))) > (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_ranges.data) + __pyx_t_33)) )))) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":729
+ *                         ta = 0
+ *                     if ranges[j1] > ranges[j0]:
+ *                         tr = (r - ranges[j0]) / (ranges[j1] - ranges[j0])             # <<<<<<<<<<<<<<
+ *                     else:
+ *                         tr = 0
+ */
+          __pyx_t_34 = __pyx_v_j0;
+          __pyx_t_35 = __pyx_v_j1;
+          __pyx_t_36 = __pyx_v_j0;
+          __pyx_v_tr = ((__pyx_v_r - (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_ranges.data) + __pyx_t_34)) )))) / ((*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_ranges.data) + __pyx_t_35)) ))) - (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_ranges.data) + __pyx_t_36)) )))));
+          goto __pyx_L32;
+        }
+        /*else*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":731
+ *                         tr = (r - ranges[j0]) / (ranges[j1] - ranges[j0])
+ *                     else:
+ *                         tr = 0             # <<<<<<<<<<<<<<
+ * 
+ *                     if weighting_function == NEAREST:
+ */
+          __pyx_v_tr = 0.0;
+        }
+        __pyx_L32:;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":733
+ *                         tr = 0
+ * 
+ *                     if weighting_function == NEAREST:             # <<<<<<<<<<<<<<
+ *                         rays[0] = i0 if ta < 0.5 else i1
+ *                         gates[0] = j0 if tr < 0.5 else j1
+ */
+        __pyx_t_10 = ((__pyx_v_weighting_function == __pyx_v_5pyart_3map_17_gate_to_grid_map_NEAREST) != 0);
+        if (__pyx_t_10) {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":734
+ * 
+ *                     if weighting_function == NEAREST:
+ *                         rays[0] = i0 if ta < 0.5 else i1             # <<<<<<<<<<<<<<
+ *                         gates[0] = j0 if tr < 0.5 else j1
+ *                         for i in range(self.nfields):
+ */
+          if (((__pyx_v_ta < 0.5) != 0)) {
+            __pyx_t_37 = __pyx_v_i0;
+          } else {
+            __pyx_t_37 = __pyx_v_i1;
+          }
+          (__pyx_v_rays[0]) = __pyx_t_37;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":735
+ *                     if weighting_function == NEAREST:
+ *                         rays[0] = i0 if ta < 0.5 else i1
+ *                         gates[0] = j0 if tr < 0.5 else j1             # <<<<<<<<<<<<<<
+ *                         for i in range(self.nfields):
+ *                             if sweep_mask[rays[0], gates[0], i]:
+ */
+          if (((__pyx_v_tr < 0.5) != 0)) {
+            __pyx_t_37 = __pyx_v_j0;
+          } else {
+            __pyx_t_37 = __pyx_v_j1;
+          }
+          (__pyx_v_gates[0]) = __pyx_t_37;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":736
+ *                         rays[0] = i0 if ta < 0.5 else i1
+ *                         gates[0] = j0 if tr < 0.5 else j1
+ *                         for i in range(self.nfields):             # <<<<<<<<<<<<<<
+ *                             if sweep_mask[rays[0], gates[0], i]:
+ *                                 continue
+ */
+          __pyx_t_37 = __pyx_v_self->nfields;
+          for (__pyx_t_38 = 0; __pyx_t_38 < __pyx_t_37; __pyx_t_38+=1) {
+            __pyx_v_i = __pyx_t_38;
+
+            /* "pyart/map/_gate_to_grid_map.pyx":737
+ *                         gates[0] = j0 if tr < 0.5 else j1
+ *                         for i in range(self.nfields):
+ *                             if sweep_mask[rays[0], gates[0], i]:             # <<<<<<<<<<<<<<
+ *                                 continue
+ *                             self.grid_sum[iz, iy, ix, i] += (
+ */
+            __pyx_t_39 = (__pyx_v_rays[0]);
+            __pyx_t_40 = (__pyx_v_gates[0]);
+            __pyx_t_41 = __pyx_v_i;
+            __pyx_t_10 = ((*((char *) ( /* dim=2 */ ((char *) (((char *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_sweep_mask.data + __pyx_t_39 * __pyx_v_sweep_mask.strides[0]) ) + __pyx_t_40 * __pyx_v_sweep_mask.strides[1]) )) + __pyx_t_41)) ))) != 0);
+            if (__pyx_t_10) {
+
+              /* "pyart/map/_gate_to_grid_map.pyx":738
+ *                         for i in range(self.nfields):
+ *                             if sweep_mask[rays[0], gates[0], i]:
+ *                                 continue             # <<<<<<<<<<<<<<
+ *                             self.grid_sum[iz, iy, ix, i] += (
+ *                                 sweep_data[rays[0], gates[0], i])
+ */
+              goto __pyx_L34_continue;
+            }
+
+            /* "pyart/map/_gate_to_grid_map.pyx":740
+ *                                 continue
+ *                             self.grid_sum[iz, iy, ix, i] += (
+ *                                 sweep_data[rays[0], gates[0], i])             # <<<<<<<<<<<<<<
+ *                             self.grid_wsum[iz, iy, ix, i] += 1.
+ *                         continue
+ */
+            __pyx_t_42 = (__pyx_v_rays[0]);
+            __pyx_t_43 = (__pyx_v_gates[0]);
+            __pyx_t_44 = __pyx_v_i;
+
+            /* "pyart/map/_gate_to_grid_map.pyx":739
+ *                             if sweep_mask[rays[0], gates[0], i]:
+ *                                 continue
+ *                             self.grid_sum[iz, iy, ix, i] += (             # <<<<<<<<<<<<<<
+ *                                 sweep_data[rays[0], gates[0], i])
+ *                             self.grid_wsum[iz, iy, ix, i] += 1.
+ */
+            __pyx_t_45 = __pyx_v_iz;
+            __pyx_t_46 = __pyx_v_iy;
+            __pyx_t_47 = __pyx_v_ix;
+            __pyx_t_48 = __pyx_v_i;
+            *((float *) ( /* dim=3 */ ((char *) (((float *) ( /* dim=2 */ (( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->grid_sum.data + __pyx_t_45 * __pyx_v_self->grid_sum.strides[0]) ) + __pyx_t_46 * __pyx_v_self->grid_sum.strides[1]) ) + __pyx_t_47 * __pyx_v_self->grid_sum.strides[2]) )) + __pyx_t_48)) )) += (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_sweep_data.data + __pyx_t_42 * __pyx_v_sweep_data.strides[0]) ) + __pyx_t_43 * __pyx_v_sweep_data.strides[1]) )) + __pyx_t_44)) )));
+
+            /* "pyart/map/_gate_to_grid_map.pyx":741
+ *                             self.grid_sum[iz, iy, ix, i] += (
+ *                                 sweep_data[rays[0], gates[0], i])
+ *                             self.grid_wsum[iz, iy, ix, i] += 1.             # <<<<<<<<<<<<<<
+ *                         continue
+ * 
+ */
+            __pyx_t_49 = __pyx_v_iz;
+            __pyx_t_50 = __pyx_v_iy;
+            __pyx_t_51 = __pyx_v_ix;
+            __pyx_t_52 = __pyx_v_i;
+            *((float *) ( /* dim=3 */ ((char *) (((float *) ( /* dim=2 */ (( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->grid_wsum.data + __pyx_t_49 * __pyx_v_self->grid_wsum.strides[0]) ) + __pyx_t_50 * __pyx_v_self->grid_wsum.strides[1]) ) + __pyx_t_51 * __pyx_v_self->grid_wsum.strides[2]) )) + __pyx_t_52)) )) += 1.;
+            __pyx_L34_continue:;
+          }
+
+          /* "pyart/map/_gate_to_grid_map.pyx":742
+ *                                 sweep_data[rays[0], gates[0], i])
+ *                             self.grid_wsum[iz, iy, ix, i] += 1.
+ *                         continue             # <<<<<<<<<<<<<<
+ * 
+ *                     # bilinear interpolation between the four gates
+ */
+          goto __pyx_L12_continue;
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":745
+ * 
+ *                     # bilinear interpolation between the four gates
+ *                     rays[0] = i0             # <<<<<<<<<<<<<<
+ *                     rays[1] = i0
+ *                     rays[2] = i1
+ */
+        (__pyx_v_rays[0]) = __pyx_v_i0;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":746
+ *                     # bilinear interpolation between the four gates
+ *                     rays[0] = i0
+ *                     rays[1] = i0             # <<<<<<<<<<<<<<
+ *                     rays[2] = i1
+ *                     rays[3] = i1
+ */
+        (__pyx_v_rays[1]) = __pyx_v_i0;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":747
+ *                     rays[0] = i0
+ *                     rays[1] = i0
+ *                     rays[2] = i1             # <<<<<<<<<<<<<<
+ *                     rays[3] = i1
+ *                     gates[0] = j0
+ */
+        (__pyx_v_rays[2]) = __pyx_v_i1;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":748
+ *                     rays[1] = i0
+ *                     rays[2] = i1
+ *                     rays[3] = i1             # <<<<<<<<<<<<<<
+ *                     gates[0] = j0
+ *                     gates[1] = j1
+ */
+        (__pyx_v_rays[3]) = __pyx_v_i1;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":749
+ *                     rays[2] = i1
+ *                     rays[3] = i1
+ *                     gates[0] = j0             # <<<<<<<<<<<<<<
+ *                     gates[1] = j1
+ *                     gates[2] = j0
+ */
+        (__pyx_v_gates[0]) = __pyx_v_j0;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":750
+ *                     rays[3] = i1
+ *                     gates[0] = j0
+ *                     gates[1] = j1             # <<<<<<<<<<<<<<
+ *                     gates[2] = j0
+ *                     gates[3] = j1
+ */
+        (__pyx_v_gates[1]) = __pyx_v_j1;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":751
+ *                     gates[0] = j0
+ *                     gates[1] = j1
+ *                     gates[2] = j0             # <<<<<<<<<<<<<<
+ *                     gates[3] = j1
+ *                     weights[0] = (1 - ta) * (1 - tr)
+ */
+        (__pyx_v_gates[2]) = __pyx_v_j0;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":752
+ *                     gates[1] = j1
+ *                     gates[2] = j0
+ *                     gates[3] = j1             # <<<<<<<<<<<<<<
+ *                     weights[0] = (1 - ta) * (1 - tr)
+ *                     weights[1] = (1 - ta) * tr
+ */
+        (__pyx_v_gates[3]) = __pyx_v_j1;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":753
+ *                     gates[2] = j0
+ *                     gates[3] = j1
+ *                     weights[0] = (1 - ta) * (1 - tr)             # <<<<<<<<<<<<<<
+ *                     weights[1] = (1 - ta) * tr
+ *                     weights[2] = ta * (1 - tr)
+ */
+        (__pyx_v_weights[0]) = ((1.0 - __pyx_v_ta) * (1.0 - __pyx_v_tr));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":754
+ *                     gates[3] = j1
+ *                     weights[0] = (1 - ta) * (1 - tr)
+ *                     weights[1] = (1 - ta) * tr             # <<<<<<<<<<<<<<
+ *                     weights[2] = ta * (1 - tr)
+ *                     weights[3] = ta * tr
+ */
+        (__pyx_v_weights[1]) = ((1.0 - __pyx_v_ta) * __pyx_v_tr);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":755
+ *                     weights[0] = (1 - ta) * (1 - tr)
+ *                     weights[1] = (1 - ta) * tr
+ *                     weights[2] = ta * (1 - tr)             # <<<<<<<<<<<<<<
+ *                     weights[3] = ta * tr
+ *                     for i in range(self.nfields):
+ */
+        (__pyx_v_weights[2]) = (__pyx_v_ta * (1.0 - __pyx_v_tr));
+
+        /* "pyart/map/_gate_to_grid_map.pyx":756
+ *                     weights[1] = (1 - ta) * tr
+ *                     weights[2] = ta * (1 - tr)
+ *                     weights[3] = ta * tr             # <<<<<<<<<<<<<<
+ *                     for i in range(self.nfields):
+ *                         wsum = 0
+ */
+        (__pyx_v_weights[3]) = (__pyx_v_ta * __pyx_v_tr);
+
+        /* "pyart/map/_gate_to_grid_map.pyx":757
+ *                     weights[2] = ta * (1 - tr)
+ *                     weights[3] = ta * tr
+ *                     for i in range(self.nfields):             # <<<<<<<<<<<<<<
+ *                         wsum = 0
+ *                         vsum = 0
+ */
+        __pyx_t_37 = __pyx_v_self->nfields;
+        for (__pyx_t_38 = 0; __pyx_t_38 < __pyx_t_37; __pyx_t_38+=1) {
+          __pyx_v_i = __pyx_t_38;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":758
+ *                     weights[3] = ta * tr
+ *                     for i in range(self.nfields):
+ *                         wsum = 0             # <<<<<<<<<<<<<<
+ *                         vsum = 0
+ *                         for j in range(4):
+ */
+          __pyx_v_wsum = 0.0;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":759
+ *                     for i in range(self.nfields):
+ *                         wsum = 0
+ *                         vsum = 0             # <<<<<<<<<<<<<<
+ *                         for j in range(4):
+ *                             if sweep_mask[rays[j], gates[j], i]:
+ */
+          __pyx_v_vsum = 0.0;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":760
+ *                         wsum = 0
+ *                         vsum = 0
+ *                         for j in range(4):             # <<<<<<<<<<<<<<
+ *                             if sweep_mask[rays[j], gates[j], i]:
+ *                                 continue
+ */
+          for (__pyx_t_53 = 0; __pyx_t_53 < 4; __pyx_t_53+=1) {
+            __pyx_v_j = __pyx_t_53;
+
+            /* "pyart/map/_gate_to_grid_map.pyx":761
+ *                         vsum = 0
+ *                         for j in range(4):
+ *                             if sweep_mask[rays[j], gates[j], i]:             # <<<<<<<<<<<<<<
+ *                                 continue
+ *                             wsum += weights[j]
+ */
+            __pyx_t_54 = (__pyx_v_rays[__pyx_v_j]);
+            __pyx_t_55 = (__pyx_v_gates[__pyx_v_j]);
+            __pyx_t_56 = __pyx_v_i;
+            __pyx_t_10 = ((*((char *) ( /* dim=2 */ ((char *) (((char *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_sweep_mask.data + __pyx_t_54 * __pyx_v_sweep_mask.strides[0]) ) + __pyx_t_55 * __pyx_v_sweep_mask.strides[1]) )) + __pyx_t_56)) ))) != 0);
+            if (__pyx_t_10) {
+
+              /* "pyart/map/_gate_to_grid_map.pyx":762
+ *                         for j in range(4):
+ *                             if sweep_mask[rays[j], gates[j], i]:
+ *                                 continue             # <<<<<<<<<<<<<<
+ *                             wsum += weights[j]
+ *                             vsum += weights[j] * sweep_data[
+ */
+              goto __pyx_L39_continue;
+            }
+
+            /* "pyart/map/_gate_to_grid_map.pyx":763
+ *                             if sweep_mask[rays[j], gates[j], i]:
+ *                                 continue
+ *                             wsum += weights[j]             # <<<<<<<<<<<<<<
+ *                             vsum += weights[j] * sweep_data[
+ *                                 rays[j], gates[j], i]
+ */
+            __pyx_v_wsum = (__pyx_v_wsum + (__pyx_v_weights[__pyx_v_j]));
+
+            /* "pyart/map/_gate_to_grid_map.pyx":764
+ *                                 continue
+ *                             wsum += weights[j]
+ *                             vsum += weights[j] * sweep_data[             # <<<<<<<<<<<<<<
+ *                                 rays[j], gates[j], i]
+ *                         if wsum <= 0:
+ */
+            __pyx_t_57 = (__pyx_v_rays[__pyx_v_j]);
+            __pyx_t_58 = (__pyx_v_gates[__pyx_v_j]);
+            __pyx_t_59 = __pyx_v_i;
+            __pyx_v_vsum = (__pyx_v_vsum + ((__pyx_v_weights[__pyx_v_j]) * (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_sweep_data.data + __pyx_t_57 * __pyx_v_sweep_data.strides[0]) ) + __pyx_t_58 * __pyx_v_sweep_data.strides[1]) )) + __pyx_t_59)) )))));
+            __pyx_L39_continue:;
+          }
+
+          /* "pyart/map/_gate_to_grid_map.pyx":766
+ *                             vsum += weights[j] * sweep_data[
+ *                                 rays[j], gates[j], i]
+ *                         if wsum <= 0:             # <<<<<<<<<<<<<<
+ *                             continue
+ *                         self.grid_sum[iz, iy, ix, i] += vsum
+ */
+          __pyx_t_10 = ((__pyx_v_wsum <= 0.0) != 0);
+          if (__pyx_t_10) {
+
+            /* "pyart/map/_gate_to_grid_map.pyx":767
+ *                                 rays[j], gates[j], i]
+ *                         if wsum <= 0:
+ *                             continue             # <<<<<<<<<<<<<<
+ *                         self.grid_sum[iz, iy, ix, i] += vsum
+ *                         self.grid_wsum[iz, iy, ix, i] += wsum
+ */
+            goto __pyx_L37_continue;
+          }
+
+          /* "pyart/map/_gate_to_grid_map.pyx":768
+ *                         if wsum <= 0:
+ *                             continue
+ *                         self.grid_sum[iz, iy, ix, i] += vsum             # <<<<<<<<<<<<<<
+ *                         self.grid_wsum[iz, iy, ix, i] += wsum
+ *         return
+ */
+          __pyx_t_53 = __pyx_v_iz;
+          __pyx_t_60 = __pyx_v_iy;
+          __pyx_t_61 = __pyx_v_ix;
+          __pyx_t_62 = __pyx_v_i;
+          *((float *) ( /* dim=3 */ ((char *) (((float *) ( /* dim=2 */ (( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->grid_sum.data + __pyx_t_53 * __pyx_v_self->grid_sum.strides[0]) ) + __pyx_t_60 * __pyx_v_self->grid_sum.strides[1]) ) + __pyx_t_61 * __pyx_v_self->grid_sum.strides[2]) )) + __pyx_t_62)) )) += __pyx_v_vsum;
+
+          /* "pyart/map/_gate_to_grid_map.pyx":769
+ *                             continue
+ *                         self.grid_sum[iz, iy, ix, i] += vsum
+ *                         self.grid_wsum[iz, iy, ix, i] += wsum             # <<<<<<<<<<<<<<
+ *         return
+ * 
+ */
+          __pyx_t_63 = __pyx_v_iz;
+          __pyx_t_64 = __pyx_v_iy;
+          __pyx_t_65 = __pyx_v_ix;
+          __pyx_t_66 = __pyx_v_i;
+          *((float *) ( /* dim=3 */ ((char *) (((float *) ( /* dim=2 */ (( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->grid_wsum.data + __pyx_t_63 * __pyx_v_self->grid_wsum.strides[0]) ) + __pyx_t_64 * __pyx_v_self->grid_wsum.strides[1]) ) + __pyx_t_65 * __pyx_v_self->grid_wsum.strides[2]) )) + __pyx_t_66)) )) += __pyx_v_wsum;
+          __pyx_L37_continue:;
+        }
+        __pyx_L12_continue:;
+      }
+    }
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":770
+ *                         self.grid_sum[iz, iy, ix, i] += vsum
+ *                         self.grid_wsum[iz, iy, ix, i] += wsum
+ *         return             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":578
+ *     @cython.boundscheck(False)
+ *     @cython.wraparound(False)
+ *     def map_sweep_to_grid(             # <<<<<<<<<<<<<<
+ *             self, float[::1] azimuths, float[::1] ranges, float elevation,
+ *             float[:, :, ::1] sweep_data, char[:, :, ::1] sweep_mask,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.map_sweep_to_grid", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_azimuths, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ranges, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_sweep_data, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_sweep_mask, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_nearest_sweep, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":775
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def find_gate_locations_and_roi(             # <<<<<<<<<<<<<<
+ *         float[::1] elevations, float[::1] azimuths, float[::1] ranges,
+ *         offset, float toa, RoIFunction roi_func,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_3find_gate_locations_and_roi(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5pyart_3map_17_gate_to_grid_map_2find_gate_locations_and_roi[] = "\n    Find the Cartesian location and radius of influence of radar gates.\n\n    Parameters\n    ----------\n    elevations, azimuths : 1D float32 array\n        Elevation and azimuth angles in degrees for each ray in the radar.\n    ranges : 1D float32 array\n        Gate ranges in meters for each bin in the radar.\n    offset : tuple of floats\n        Offset of the radar from the grid origin.  Dimension are ordered\n        as z, y, x.\n    toa : float\n        Top of atmosphere.  Gates above this level are assigned a radius of\n        influence of -1.\n    roi_func : RoIFunction\n        Object whose get_roi method returns the radius of influence.\n    gate_info : 3D float32 array\n        Array which will be filled with the z, y, x location and radius of\n        influence of each gate, dimensions are ordered as nrays, ngates, 4.\n\n    ";
+static PyMethodDef __pyx_mdef_5pyart_3map_17_gate_to_grid_map_3find_gate_locations_and_roi = {"find_gate_locations_and_roi", (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_3find_gate_locations_and_roi, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5pyart_3map_17_gate_to_grid_map_2find_gate_locations_and_roi};
+static PyObject *__pyx_pw_5pyart_3map_17_gate_to_grid_map_3find_gate_locations_and_roi(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  __Pyx_memviewslice __pyx_v_elevations = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_azimuths = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_ranges = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_v_offset = 0;
+  float __pyx_v_toa;
+  struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func = 0;
+  __Pyx_memviewslice __pyx_v_gate_info = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("find_gate_locations_and_roi (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_elevations,&__pyx_n_s_azimuths,&__pyx_n_s_ranges,&__pyx_n_s_offset,&__pyx_n_s_toa,&__pyx_n_s_roi_func,&__pyx_n_s_gate_info,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_elevations)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_azimuths)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_gate_locations_and_roi", 1, 7, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_ranges)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_gate_locations_and_roi", 1, 7, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_offset)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_gate_locations_and_roi", 1, 7, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_toa)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_gate_locations_and_roi", 1, 7, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_roi_func)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_gate_locations_and_roi", 1, 7, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_gate_info)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("find_gate_locations_and_roi", 1, 7, 7, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "find_gate_locations_and_roi") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+    }
+    __pyx_v_elevations = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[0]); if (unlikely(!__pyx_v_elevations.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_azimuths = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[1]); if (unlikely(!__pyx_v_azimuths.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_ranges = __Pyx_PyObject_to_MemoryviewSlice_dc_float(values[2]); if (unlikely(!__pyx_v_ranges.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 776; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_offset = values[3];
+    __pyx_v_toa = __pyx_PyFloat_AsFloat(values[4]); if (unlikely((__pyx_v_toa == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_roi_func = ((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *)values[5]);
+    __pyx_v_gate_info = __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(values[6]); if (unlikely(!__pyx_v_gate_info.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 778; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("find_gate_locations_and_roi", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.find_gate_locations_and_roi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_roi_func), __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction, 1, "roi_func", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 777; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_5pyart_3map_17_gate_to_grid_map_2find_gate_locations_and_roi(__pyx_self, __pyx_v_elevations, __pyx_v_azimuths, __pyx_v_ranges, __pyx_v_offset, __pyx_v_toa, __pyx_v_roi_func, __pyx_v_gate_info);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5pyart_3map_17_gate_to_grid_map_2find_gate_locations_and_roi(CYTHON_UNUSED PyObject *__pyx_self, __Pyx_memviewslice __pyx_v_elevations, __Pyx_memviewslice __pyx_v_azimuths, __Pyx_memviewslice __pyx_v_ranges, PyObject *__pyx_v_offset, float __pyx_v_toa, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func, __Pyx_memviewslice __pyx_v_gate_info) {
+  int __pyx_v_nray;
+  int __pyx_v_ngate;
+  int __pyx_v_nrays;
+  float __pyx_v_x_offset;
+  float __pyx_v_y_offset;
+  float __pyx_v_z_offset;
+  int __pyx_v_nogil_roi;
+  __Pyx_memviewslice __pyx_v_excluded_gates = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_memviewslice __pyx_t_1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *(*__pyx_t_6)(PyObject *);
+  float __pyx_t_7;
+  float __pyx_t_8;
+  float __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_t_14;
+  int __pyx_t_15;
+  int __pyx_t_16;
+  Py_ssize_t __pyx_t_17;
+  int __pyx_t_18;
+  int __pyx_t_19;
+  Py_ssize_t __pyx_t_20;
+  int __pyx_t_21;
+  int __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  int __pyx_t_24;
+  int __pyx_t_25;
+  Py_ssize_t __pyx_t_26;
+  int __pyx_t_27;
+  int __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("find_gate_locations_and_roi", 0);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":804
+ *     cdef float x_offset, y_offset, z_offset
+ *     cdef bint nogil_roi
+ *     cdef char[:, ::1] excluded_gates = None             # <<<<<<<<<<<<<<
+ * 
+ *     z_offset, y_offset, x_offset = offset
+ */
+  __pyx_t_1 = __Pyx_PyObject_to_MemoryviewSlice_d_dc_char(Py_None);
+  if (unlikely(!__pyx_t_1.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 804; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_excluded_gates = __pyx_t_1;
+  __pyx_t_1.memview = NULL;
+  __pyx_t_1.data = NULL;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":806
+ *     cdef char[:, ::1] excluded_gates = None
+ * 
+ *     z_offset, y_offset, x_offset = offset             # <<<<<<<<<<<<<<
+ *     nrays = len(elevations)
+ *     nogil_roi = _has_nogil_roi(roi_func)
+ */
+  if ((likely(PyTuple_CheckExact(__pyx_v_offset))) || (PyList_CheckExact(__pyx_v_offset))) {
+    PyObject* sequence = __pyx_v_offset;
+    #if CYTHON_COMPILING_IN_CPYTHON
+    Py_ssize_t size = Py_SIZE(sequence);
+    #else
+    Py_ssize_t size = PySequence_Size(sequence);
+    #endif
+    if (unlikely(size != 3)) {
+      if (size > 3) __Pyx_RaiseTooManyValuesError(3);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    }
+    #if CYTHON_COMPILING_IN_CPYTHON
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0); 
+      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1); 
+      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 2); 
+    } else {
+      __pyx_t_2 = PyList_GET_ITEM(sequence, 0); 
+      __pyx_t_3 = PyList_GET_ITEM(sequence, 1); 
+      __pyx_t_4 = PyList_GET_ITEM(sequence, 2); 
+    }
+    __Pyx_INCREF(__pyx_t_2);
+    __Pyx_INCREF(__pyx_t_3);
+    __Pyx_INCREF(__pyx_t_4);
+    #else
+    __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PySequence_ITEM(sequence, 2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    #endif
+  } else {
+    Py_ssize_t index = -1;
+    __pyx_t_5 = PyObject_GetIter(__pyx_v_offset); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = Py_TYPE(__pyx_t_5)->tp_iternext;
+    index = 0; __pyx_t_2 = __pyx_t_6(__pyx_t_5); if (unlikely(!__pyx_t_2)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_2);
+    index = 1; __pyx_t_3 = __pyx_t_6(__pyx_t_5); if (unlikely(!__pyx_t_3)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_3);
+    index = 2; __pyx_t_4 = __pyx_t_6(__pyx_t_5); if (unlikely(!__pyx_t_4)) goto __pyx_L3_unpacking_failed;
+    __Pyx_GOTREF(__pyx_t_4);
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_6(__pyx_t_5), 3) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_t_6 = NULL;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    goto __pyx_L4_unpacking_done;
+    __pyx_L3_unpacking_failed:;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_6 = NULL;
+    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_L4_unpacking_done:;
+  }
+  __pyx_t_7 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_7 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_8 = __pyx_PyFloat_AsFloat(__pyx_t_3); if (unlikely((__pyx_t_8 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_9 = __pyx_PyFloat_AsFloat(__pyx_t_4); if (unlikely((__pyx_t_9 == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 806; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_z_offset = __pyx_t_7;
+  __pyx_v_y_offset = __pyx_t_8;
+  __pyx_v_x_offset = __pyx_t_9;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":807
+ * 
+ *     z_offset, y_offset, x_offset = offset
+ *     nrays = len(elevations)             # <<<<<<<<<<<<<<
+ *     nogil_roi = _has_nogil_roi(roi_func)
+ *     with nogil:
+ */
+  __pyx_t_4 = __pyx_memoryview_fromslice(__pyx_v_elevations, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 807; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_10 = PyObject_Length(__pyx_t_4); if (unlikely(__pyx_t_10 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 807; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_v_nrays = __pyx_t_10;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":808
+ *     z_offset, y_offset, x_offset = offset
+ *     nrays = len(elevations)
+ *     nogil_roi = _has_nogil_roi(roi_func)             # <<<<<<<<<<<<<<
+ *     with nogil:
+ *         _find_gate_info(
+ */
+  __pyx_v_nogil_roi = __pyx_f_5pyart_3map_17_gate_to_grid_map__has_nogil_roi(__pyx_v_roi_func);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":809
+ *     nrays = len(elevations)
+ *     nogil_roi = _has_nogil_roi(roi_func)
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         _find_gate_info(
+ *             elevations, azimuths, ranges, 0, nrays, z_offset, y_offset,
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pyart/map/_gate_to_grid_map.pyx":810
+ *     nogil_roi = _has_nogil_roi(roi_func)
+ *     with nogil:
+ *         _find_gate_info(             # <<<<<<<<<<<<<<
+ *             elevations, azimuths, ranges, 0, nrays, z_offset, y_offset,
+ *             x_offset, toa, excluded_gates, False, roi_func, nogil_roi,
+ */
+        __pyx_f_5pyart_3map_17_gate_to_grid_map__find_gate_info(__pyx_v_elevations, __pyx_v_azimuths, __pyx_v_ranges, 0, __pyx_v_nrays, __pyx_v_z_offset, __pyx_v_y_offset, __pyx_v_x_offset, __pyx_v_toa, __pyx_v_excluded_gates, 0, __pyx_v_roi_func, __pyx_v_nogil_roi, __pyx_v_gate_info);
+      }
+
+      /* "pyart/map/_gate_to_grid_map.pyx":809
+ *     nrays = len(elevations)
+ *     nogil_roi = _has_nogil_roi(roi_func)
+ *     with nogil:             # <<<<<<<<<<<<<<
+ *         _find_gate_info(
+ *             elevations, azimuths, ranges, 0, nrays, z_offset, y_offset,
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L7;
+        }
+        __pyx_L7:;
+      }
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":814
+ *             x_offset, toa, excluded_gates, False, roi_func, nogil_roi,
+ *             gate_info)
+ *     if nogil_roi:             # <<<<<<<<<<<<<<
+ *         return
+ *     for nray in range(nrays):
+ */
+  __pyx_t_11 = (__pyx_v_nogil_roi != 0);
+  if (__pyx_t_11) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":815
+ *             gate_info)
+ *     if nogil_roi:
+ *         return             # <<<<<<<<<<<<<<
+ *     for nray in range(nrays):
+ *         for ngate in range(len(ranges)):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":816
+ *     if nogil_roi:
+ *         return
+ *     for nray in range(nrays):             # <<<<<<<<<<<<<<
+ *         for ngate in range(len(ranges)):
+ *             if gate_info[nray, ngate, 3] < 0:
+ */
+  __pyx_t_12 = __pyx_v_nrays;
+  for (__pyx_t_13 = 0; __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
+    __pyx_v_nray = __pyx_t_13;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":817
+ *         return
+ *     for nray in range(nrays):
+ *         for ngate in range(len(ranges)):             # <<<<<<<<<<<<<<
+ *             if gate_info[nray, ngate, 3] < 0:
+ *                 continue
+ */
+    __pyx_t_4 = __pyx_memoryview_fromslice(__pyx_v_ranges, 1, (PyObject *(*)(char *)) __pyx_memview_get_float, (int (*)(char *, PyObject *)) __pyx_memview_set_float, 0);; if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 817; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_10 = PyObject_Length(__pyx_t_4); if (unlikely(__pyx_t_10 == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 817; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_10; __pyx_t_14+=1) {
+      __pyx_v_ngate = __pyx_t_14;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":818
+ *     for nray in range(nrays):
+ *         for ngate in range(len(ranges)):
+ *             if gate_info[nray, ngate, 3] < 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             gate_info[nray, ngate, 3] = roi_func.get_roi(
+ */
+      __pyx_t_15 = __pyx_v_nray;
+      __pyx_t_16 = __pyx_v_ngate;
+      __pyx_t_17 = 3;
+      __pyx_t_11 = (((*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_15 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_16 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_17)) ))) < 0.0) != 0);
+      if (__pyx_t_11) {
+
+        /* "pyart/map/_gate_to_grid_map.pyx":819
+ *         for ngate in range(len(ranges)):
+ *             if gate_info[nray, ngate, 3] < 0:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             gate_info[nray, ngate, 3] = roi_func.get_roi(
+ *                 gate_info[nray, ngate, 0], gate_info[nray, ngate, 1],
+ */
+        goto __pyx_L11_continue;
+      }
+
+      /* "pyart/map/_gate_to_grid_map.pyx":821
+ *                 continue
+ *             gate_info[nray, ngate, 3] = roi_func.get_roi(
+ *                 gate_info[nray, ngate, 0], gate_info[nray, ngate, 1],             # <<<<<<<<<<<<<<
+ *                 gate_info[nray, ngate, 2])
+ * 
+ */
+      __pyx_t_18 = __pyx_v_nray;
+      __pyx_t_19 = __pyx_v_ngate;
+      __pyx_t_20 = 0;
+      __pyx_t_21 = __pyx_v_nray;
+      __pyx_t_22 = __pyx_v_ngate;
+      __pyx_t_23 = 1;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":822
+ *             gate_info[nray, ngate, 3] = roi_func.get_roi(
+ *                 gate_info[nray, ngate, 0], gate_info[nray, ngate, 1],
+ *                 gate_info[nray, ngate, 2])             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      __pyx_t_24 = __pyx_v_nray;
+      __pyx_t_25 = __pyx_v_ngate;
+      __pyx_t_26 = 2;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":820
+ *             if gate_info[nray, ngate, 3] < 0:
+ *                 continue
+ *             gate_info[nray, ngate, 3] = roi_func.get_roi(             # <<<<<<<<<<<<<<
+ *                 gate_info[nray, ngate, 0], gate_info[nray, ngate, 1],
+ *                 gate_info[nray, ngate, 2])
+ */
+      __pyx_t_27 = __pyx_v_nray;
+      __pyx_t_28 = __pyx_v_ngate;
+      __pyx_t_29 = 3;
+      *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_27 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_28 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_29)) )) = ((struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction *)__pyx_v_roi_func->__pyx_vtab)->get_roi(__pyx_v_roi_func, (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_18 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_19 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_20)) ))), (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_21 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_22 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_23)) ))), (*((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_24 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_25 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_26)) ))), 0);
+      __pyx_L11_continue:;
+    }
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":775
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def find_gate_locations_and_roi(             # <<<<<<<<<<<<<<
+ *         float[::1] elevations, float[::1] azimuths, float[::1] ranges,
+ *         offset, float toa, RoIFunction roi_func,
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __PYX_XDEC_MEMVIEW(&__pyx_t_1, 1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.find_gate_locations_and_roi", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_excluded_gates, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_elevations, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_azimuths, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_ranges, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_gate_info, 1);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":835
+ * 
+ * 
+ * cdef int _load_rays(             # <<<<<<<<<<<<<<
+ *         object field_data, int ray_start, int ray_end, int ifield,
+ *         float scale_factor, float add_offset,
+ */
+
+static int __pyx_f_5pyart_3map_17_gate_to_grid_map__load_rays(PyObject *__pyx_v_field_data, int __pyx_v_ray_start, int __pyx_v_ray_end, int __pyx_v_ifield, float __pyx_v_scale_factor, float __pyx_v_add_offset, __Pyx_memviewslice __pyx_v_ray_data) {
+  __Pyx_memviewslice __pyx_v_f4 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_f8 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_i1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_u1 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_i2 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_u2 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_v_i4 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  PyObject *__pyx_v_dtype_char = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  __Pyx_memviewslice __pyx_t_4 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_5 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_6 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_7 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_8 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_9 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  __Pyx_memviewslice __pyx_t_10 = { 0, 0, { 0 }, { 0 }, { 0 } };
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_load_rays", 0);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":867
+ *     # the buffer is acquired using the memoryview matching the field dtype,
+ *     # the data is then loaded without the GIL
+ *     dtype_char = field_data.dtype.char             # <<<<<<<<<<<<<<
+ *     if dtype_char == 'f':
+ *         f4 = field_data
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_field_data, __pyx_n_s_dtype); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 867; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_char); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 867; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_dtype_char = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":868
+ *     # the data is then loaded without the GIL
+ *     dtype_char = field_data.dtype.char
+ *     if dtype_char == 'f':             # <<<<<<<<<<<<<<
+ *         f4 = field_data
+ *         with nogil:
+ */
+  __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_dtype_char, __pyx_n_s_f, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 868; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_3) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":869
+ *     dtype_char = field_data.dtype.char
+ *     if dtype_char == 'f':
+ *         f4 = field_data             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             _load_typed_rays(f4, ray_start, ray_end, ifield, scale_factor,
+ */
+    __pyx_t_4 = __Pyx_PyObject_to_MemoryviewSlice_dsds_float(__pyx_v_field_data);
+    if (unlikely(!__pyx_t_4.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 869; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_f4 = __pyx_t_4;
+    __pyx_t_4.memview = NULL;
+    __pyx_t_4.data = NULL;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":870
+ *     if dtype_char == 'f':
+ *         f4 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(f4, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        #endif
+        /*try:*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":871
+ *         f4 = field_data
+ *         with nogil:
+ *             _load_typed_rays(f4, ray_start, ray_end, ifield, scale_factor,             # <<<<<<<<<<<<<<
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'd':
+ */
+          __pyx_fuse_0__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__pyx_v_f4, __pyx_v_ray_start, __pyx_v_ray_end, __pyx_v_ifield, __pyx_v_scale_factor, __pyx_v_add_offset, __pyx_v_ray_data);
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":870
+ *     if dtype_char == 'f':
+ *         f4 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(f4, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L6;
+          }
+          __pyx_L6:;
+        }
+    }
+    goto __pyx_L3;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":873
+ *             _load_typed_rays(f4, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'd':             # <<<<<<<<<<<<<<
+ *         f8 = field_data
+ *         with nogil:
+ */
+  __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_dtype_char, __pyx_n_s_d, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 873; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_3) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":874
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'd':
+ *         f8 = field_data             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             _load_typed_rays(f8, ray_start, ray_end, ifield, scale_factor,
+ */
+    __pyx_t_5 = __Pyx_PyObject_to_MemoryviewSlice_dsds_double(__pyx_v_field_data);
+    if (unlikely(!__pyx_t_5.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 874; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_f8 = __pyx_t_5;
+    __pyx_t_5.memview = NULL;
+    __pyx_t_5.data = NULL;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":875
+ *     elif dtype_char == 'd':
+ *         f8 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(f8, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        #endif
+        /*try:*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":876
+ *         f8 = field_data
+ *         with nogil:
+ *             _load_typed_rays(f8, ray_start, ray_end, ifield, scale_factor,             # <<<<<<<<<<<<<<
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'b':
+ */
+          __pyx_fuse_1__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__pyx_v_f8, __pyx_v_ray_start, __pyx_v_ray_end, __pyx_v_ifield, __pyx_v_scale_factor, __pyx_v_add_offset, __pyx_v_ray_data);
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":875
+ *     elif dtype_char == 'd':
+ *         f8 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(f8, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L9;
+          }
+          __pyx_L9:;
+        }
+    }
+    goto __pyx_L3;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":878
+ *             _load_typed_rays(f8, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'b':             # <<<<<<<<<<<<<<
+ *         i1 = field_data
+ *         with nogil:
+ */
+  __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_dtype_char, __pyx_n_s_b, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 878; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_3) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":879
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'b':
+ *         i1 = field_data             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             _load_typed_rays(i1, ray_start, ray_end, ifield, scale_factor,
+ */
+    __pyx_t_6 = __Pyx_PyObject_to_MemoryviewSlice_dsds_signed_char(__pyx_v_field_data);
+    if (unlikely(!__pyx_t_6.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 879; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_i1 = __pyx_t_6;
+    __pyx_t_6.memview = NULL;
+    __pyx_t_6.data = NULL;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":880
+ *     elif dtype_char == 'b':
+ *         i1 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(i1, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        #endif
+        /*try:*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":881
+ *         i1 = field_data
+ *         with nogil:
+ *             _load_typed_rays(i1, ray_start, ray_end, ifield, scale_factor,             # <<<<<<<<<<<<<<
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'B':
+ */
+          __pyx_fuse_2__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__pyx_v_i1, __pyx_v_ray_start, __pyx_v_ray_end, __pyx_v_ifield, __pyx_v_scale_factor, __pyx_v_add_offset, __pyx_v_ray_data);
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":880
+ *     elif dtype_char == 'b':
+ *         i1 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(i1, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L12;
+          }
+          __pyx_L12:;
+        }
+    }
+    goto __pyx_L3;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":883
+ *             _load_typed_rays(i1, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'B':             # <<<<<<<<<<<<<<
+ *         u1 = field_data
+ *         with nogil:
+ */
+  __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_dtype_char, __pyx_n_s_B, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 883; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_3) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":884
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'B':
+ *         u1 = field_data             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             _load_typed_rays(u1, ray_start, ray_end, ifield, scale_factor,
+ */
+    __pyx_t_7 = __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char(__pyx_v_field_data);
+    if (unlikely(!__pyx_t_7.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 884; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_u1 = __pyx_t_7;
+    __pyx_t_7.memview = NULL;
+    __pyx_t_7.data = NULL;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":885
+ *     elif dtype_char == 'B':
+ *         u1 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(u1, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        #endif
+        /*try:*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":886
+ *         u1 = field_data
+ *         with nogil:
+ *             _load_typed_rays(u1, ray_start, ray_end, ifield, scale_factor,             # <<<<<<<<<<<<<<
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'h':
+ */
+          __pyx_fuse_3__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__pyx_v_u1, __pyx_v_ray_start, __pyx_v_ray_end, __pyx_v_ifield, __pyx_v_scale_factor, __pyx_v_add_offset, __pyx_v_ray_data);
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":885
+ *     elif dtype_char == 'B':
+ *         u1 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(u1, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L15;
+          }
+          __pyx_L15:;
+        }
+    }
+    goto __pyx_L3;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":888
+ *             _load_typed_rays(u1, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'h':             # <<<<<<<<<<<<<<
+ *         i2 = field_data
+ *         with nogil:
+ */
+  __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_dtype_char, __pyx_n_s_h, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 888; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_3) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":889
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'h':
+ *         i2 = field_data             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             _load_typed_rays(i2, ray_start, ray_end, ifield, scale_factor,
+ */
+    __pyx_t_8 = __Pyx_PyObject_to_MemoryviewSlice_dsds_short(__pyx_v_field_data);
+    if (unlikely(!__pyx_t_8.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 889; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_i2 = __pyx_t_8;
+    __pyx_t_8.memview = NULL;
+    __pyx_t_8.data = NULL;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":890
+ *     elif dtype_char == 'h':
+ *         i2 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(i2, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        #endif
+        /*try:*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":891
+ *         i2 = field_data
+ *         with nogil:
+ *             _load_typed_rays(i2, ray_start, ray_end, ifield, scale_factor,             # <<<<<<<<<<<<<<
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'H':
+ */
+          __pyx_fuse_4__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__pyx_v_i2, __pyx_v_ray_start, __pyx_v_ray_end, __pyx_v_ifield, __pyx_v_scale_factor, __pyx_v_add_offset, __pyx_v_ray_data);
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":890
+ *     elif dtype_char == 'h':
+ *         i2 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(i2, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L18;
+          }
+          __pyx_L18:;
+        }
+    }
+    goto __pyx_L3;
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":893
+ *             _load_typed_rays(i2, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'H':             # <<<<<<<<<<<<<<
+ *         u2 = field_data
+ *         with nogil:
+ */
+  __pyx_t_3 = (__Pyx_PyString_Equals(__pyx_v_dtype_char, __pyx_n_s_H, Py_EQ)); if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 893; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__pyx_t_3) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":894
+ *                              add_offset, ray_data)
+ *     elif dtype_char == 'H':
+ *         u2 = field_data             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             _load_typed_rays(u2, ray_start, ray_end, ifield, scale_factor,
+ */
+    __pyx_t_9 = __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_short(__pyx_v_field_data);
+    if (unlikely(!__pyx_t_9.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 894; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_u2 = __pyx_t_9;
+    __pyx_t_9.memview = NULL;
+    __pyx_t_9.data = NULL;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":895
+ *     elif dtype_char == 'H':
+ *         u2 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(u2, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        #endif
+        /*try:*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":896
+ *         u2 = field_data
+ *         with nogil:
+ *             _load_typed_rays(u2, ray_start, ray_end, ifield, scale_factor,             # <<<<<<<<<<<<<<
+ *                              add_offset, ray_data)
+ *     else:
+ */
+          __pyx_fuse_5__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__pyx_v_u2, __pyx_v_ray_start, __pyx_v_ray_end, __pyx_v_ifield, __pyx_v_scale_factor, __pyx_v_add_offset, __pyx_v_ray_data);
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":895
+ *     elif dtype_char == 'H':
+ *         u2 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(u2, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L21;
+          }
+          __pyx_L21:;
+        }
+    }
+    goto __pyx_L3;
+  }
+  /*else*/ {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":899
+ *                              add_offset, ray_data)
+ *     else:
+ *         i4 = field_data             # <<<<<<<<<<<<<<
+ *         with nogil:
+ *             _load_typed_rays(i4, ray_start, ray_end, ifield, scale_factor,
+ */
+    __pyx_t_10 = __Pyx_PyObject_to_MemoryviewSlice_dsds_int(__pyx_v_field_data);
+    if (unlikely(!__pyx_t_10.memview)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 899; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __pyx_v_i4 = __pyx_t_10;
+    __pyx_t_10.memview = NULL;
+    __pyx_t_10.data = NULL;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":900
+ *     else:
+ *         i4 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(i4, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+    {
+        #ifdef WITH_THREAD
+        PyThreadState *_save;
+        Py_UNBLOCK_THREADS
+        #endif
+        /*try:*/ {
+
+          /* "pyart/map/_gate_to_grid_map.pyx":901
+ *         i4 = field_data
+ *         with nogil:
+ *             _load_typed_rays(i4, ray_start, ray_end, ifield, scale_factor,             # <<<<<<<<<<<<<<
+ *                              add_offset, ray_data)
+ *     return 0
+ */
+          __pyx_fuse_6__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__pyx_v_i4, __pyx_v_ray_start, __pyx_v_ray_end, __pyx_v_ifield, __pyx_v_scale_factor, __pyx_v_add_offset, __pyx_v_ray_data);
+        }
+
+        /* "pyart/map/_gate_to_grid_map.pyx":900
+ *     else:
+ *         i4 = field_data
+ *         with nogil:             # <<<<<<<<<<<<<<
+ *             _load_typed_rays(i4, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ */
+        /*finally:*/ {
+          /*normal exit:*/{
+            #ifdef WITH_THREAD
+            Py_BLOCK_THREADS
+            #endif
+            goto __pyx_L24;
+          }
+          __pyx_L24:;
+        }
+    }
+  }
+  __pyx_L3:;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":903
+ *             _load_typed_rays(i4, ray_start, ray_end, ifield, scale_factor,
+ *                              add_offset, ray_data)
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":835
+ * 
+ * 
+ * cdef int _load_rays(             # <<<<<<<<<<<<<<
+ *         object field_data, int ray_start, int ray_end, int ifield,
+ *         float scale_factor, float add_offset,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_4, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_5, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_6, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_7, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_8, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_9, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_t_10, 1);
+  __Pyx_AddTraceback("pyart.map._gate_to_grid_map._load_rays", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __PYX_XDEC_MEMVIEW(&__pyx_v_f4, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_f8, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_i1, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_u1, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_i2, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_u2, 1);
+  __PYX_XDEC_MEMVIEW(&__pyx_v_i4, 1);
+  __Pyx_XDECREF(__pyx_v_dtype_char);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":909
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef inline void _load_typed_rays(             # <<<<<<<<<<<<<<
+ *         field_data_t[:, :] field_data, int ray_start, int ray_end,
+ *         int ifield, float scale_factor, float add_offset,
+ */
+
+static CYTHON_INLINE void __pyx_fuse_0__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice __pyx_v_field_data, int __pyx_v_ray_start, int __pyx_v_ray_end, int __pyx_v_ifield, float __pyx_v_scale_factor, float __pyx_v_add_offset, __Pyx_memviewslice __pyx_v_ray_data) {
+  int __pyx_v_nray;
+  int __pyx_v_ngate;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":915
+ *     """ Load and scale a block of rays from typed field data. """
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):             # <<<<<<<<<<<<<<
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ */
+  __pyx_t_1 = __pyx_v_ray_end;
+  for (__pyx_t_2 = __pyx_v_ray_start; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_nray = __pyx_t_2;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":916
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):             # <<<<<<<<<<<<<<
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
+ */
+    __pyx_t_3 = (__pyx_v_ray_data.shape[1]);
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_ngate = __pyx_t_4;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":918
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      __pyx_t_5 = __pyx_v_nray;
+      __pyx_t_6 = __pyx_v_ngate;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":917
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (             # <<<<<<<<<<<<<<
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
+ * 
+ */
+      __pyx_t_7 = (__pyx_v_nray - __pyx_v_ray_start);
+      __pyx_t_8 = __pyx_v_ngate;
+      __pyx_t_9 = __pyx_v_ifield;
+      *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ray_data.data + __pyx_t_7 * __pyx_v_ray_data.strides[0]) ) + __pyx_t_8 * __pyx_v_ray_data.strides[1]) )) + __pyx_t_9)) )) = (((*((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_field_data.data + __pyx_t_5 * __pyx_v_field_data.strides[0]) ) + __pyx_t_6 * __pyx_v_field_data.strides[1]) ))) * __pyx_v_scale_factor) + __pyx_v_add_offset);
+    }
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":909
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef inline void _load_typed_rays(             # <<<<<<<<<<<<<<
+ *         field_data_t[:, :] field_data, int ray_start, int ray_end,
+ *         int ifield, float scale_factor, float add_offset,
+ */
+
+  /* function exit code */
+}
+
+static CYTHON_INLINE void __pyx_fuse_1__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice __pyx_v_field_data, int __pyx_v_ray_start, int __pyx_v_ray_end, int __pyx_v_ifield, float __pyx_v_scale_factor, float __pyx_v_add_offset, __Pyx_memviewslice __pyx_v_ray_data) {
+  int __pyx_v_nray;
+  int __pyx_v_ngate;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":915
+ *     """ Load and scale a block of rays from typed field data. """
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):             # <<<<<<<<<<<<<<
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ */
+  __pyx_t_1 = __pyx_v_ray_end;
+  for (__pyx_t_2 = __pyx_v_ray_start; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_nray = __pyx_t_2;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":916
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):             # <<<<<<<<<<<<<<
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
+ */
+    __pyx_t_3 = (__pyx_v_ray_data.shape[1]);
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_ngate = __pyx_t_4;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":918
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      __pyx_t_5 = __pyx_v_nray;
+      __pyx_t_6 = __pyx_v_ngate;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":917
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (             # <<<<<<<<<<<<<<
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
+ * 
+ */
+      __pyx_t_7 = (__pyx_v_nray - __pyx_v_ray_start);
+      __pyx_t_8 = __pyx_v_ngate;
+      __pyx_t_9 = __pyx_v_ifield;
+      *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ray_data.data + __pyx_t_7 * __pyx_v_ray_data.strides[0]) ) + __pyx_t_8 * __pyx_v_ray_data.strides[1]) )) + __pyx_t_9)) )) = (((*((double *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_field_data.data + __pyx_t_5 * __pyx_v_field_data.strides[0]) ) + __pyx_t_6 * __pyx_v_field_data.strides[1]) ))) * __pyx_v_scale_factor) + __pyx_v_add_offset);
+    }
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":909
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef inline void _load_typed_rays(             # <<<<<<<<<<<<<<
+ *         field_data_t[:, :] field_data, int ray_start, int ray_end,
+ *         int ifield, float scale_factor, float add_offset,
+ */
+
+  /* function exit code */
+}
+
+static CYTHON_INLINE void __pyx_fuse_2__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice __pyx_v_field_data, int __pyx_v_ray_start, int __pyx_v_ray_end, int __pyx_v_ifield, float __pyx_v_scale_factor, float __pyx_v_add_offset, __Pyx_memviewslice __pyx_v_ray_data) {
+  int __pyx_v_nray;
+  int __pyx_v_ngate;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":915
+ *     """ Load and scale a block of rays from typed field data. """
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):             # <<<<<<<<<<<<<<
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ */
+  __pyx_t_1 = __pyx_v_ray_end;
+  for (__pyx_t_2 = __pyx_v_ray_start; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_nray = __pyx_t_2;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":916
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):             # <<<<<<<<<<<<<<
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
+ */
+    __pyx_t_3 = (__pyx_v_ray_data.shape[1]);
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_ngate = __pyx_t_4;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":918
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      __pyx_t_5 = __pyx_v_nray;
+      __pyx_t_6 = __pyx_v_ngate;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":917
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (             # <<<<<<<<<<<<<<
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
+ * 
+ */
+      __pyx_t_7 = (__pyx_v_nray - __pyx_v_ray_start);
+      __pyx_t_8 = __pyx_v_ngate;
+      __pyx_t_9 = __pyx_v_ifield;
+      *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ray_data.data + __pyx_t_7 * __pyx_v_ray_data.strides[0]) ) + __pyx_t_8 * __pyx_v_ray_data.strides[1]) )) + __pyx_t_9)) )) = (((*((signed char *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_field_data.data + __pyx_t_5 * __pyx_v_field_data.strides[0]) ) + __pyx_t_6 * __pyx_v_field_data.strides[1]) ))) * __pyx_v_scale_factor) + __pyx_v_add_offset);
+    }
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":909
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef inline void _load_typed_rays(             # <<<<<<<<<<<<<<
+ *         field_data_t[:, :] field_data, int ray_start, int ray_end,
+ *         int ifield, float scale_factor, float add_offset,
+ */
+
+  /* function exit code */
+}
+
+static CYTHON_INLINE void __pyx_fuse_3__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice __pyx_v_field_data, int __pyx_v_ray_start, int __pyx_v_ray_end, int __pyx_v_ifield, float __pyx_v_scale_factor, float __pyx_v_add_offset, __Pyx_memviewslice __pyx_v_ray_data) {
+  int __pyx_v_nray;
+  int __pyx_v_ngate;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":915
+ *     """ Load and scale a block of rays from typed field data. """
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):             # <<<<<<<<<<<<<<
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ */
+  __pyx_t_1 = __pyx_v_ray_end;
+  for (__pyx_t_2 = __pyx_v_ray_start; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_nray = __pyx_t_2;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":916
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):             # <<<<<<<<<<<<<<
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
+ */
+    __pyx_t_3 = (__pyx_v_ray_data.shape[1]);
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_ngate = __pyx_t_4;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":918
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+      __pyx_t_5 = __pyx_v_nray;
+      __pyx_t_6 = __pyx_v_ngate;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":917
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (             # <<<<<<<<<<<<<<
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
+ * 
+ */
+      __pyx_t_7 = (__pyx_v_nray - __pyx_v_ray_start);
+      __pyx_t_8 = __pyx_v_ngate;
+      __pyx_t_9 = __pyx_v_ifield;
+      *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ray_data.data + __pyx_t_7 * __pyx_v_ray_data.strides[0]) ) + __pyx_t_8 * __pyx_v_ray_data.strides[1]) )) + __pyx_t_9)) )) = (((*((unsigned char *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_field_data.data + __pyx_t_5 * __pyx_v_field_data.strides[0]) ) + __pyx_t_6 * __pyx_v_field_data.strides[1]) ))) * __pyx_v_scale_factor) + __pyx_v_add_offset);
+    }
+  }
+
+  /* "pyart/map/_gate_to_grid_map.pyx":909
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef inline void _load_typed_rays(             # <<<<<<<<<<<<<<
+ *         field_data_t[:, :] field_data, int ray_start, int ray_end,
+ *         int ifield, float scale_factor, float add_offset,
+ */
+
+  /* function exit code */
+}
+
+static CYTHON_INLINE void __pyx_fuse_4__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice __pyx_v_field_data, int __pyx_v_ray_start, int __pyx_v_ray_end, int __pyx_v_ifield, float __pyx_v_scale_factor, float __pyx_v_add_offset, __Pyx_memviewslice __pyx_v_ray_data) {
+  int __pyx_v_nray;
+  int __pyx_v_ngate;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":915
+ *     """ Load and scale a block of rays from typed field data. """
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):             # <<<<<<<<<<<<<<
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ */
+  __pyx_t_1 = __pyx_v_ray_end;
+  for (__pyx_t_2 = __pyx_v_ray_start; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_nray = __pyx_t_2;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":916
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):             # <<<<<<<<<<<<<<
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
+ */
+    __pyx_t_3 = (__pyx_v_ray_data.shape[1]);
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_ngate = __pyx_t_4;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":918
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)             # <<<<<<<<<<<<<<
+ * 
  * 
- *                 # add offsets
- *                 x += x_offset             # <<<<<<<<<<<<<<
- *                 y += y_offset
- *                 z += z_offset
  */
-      __pyx_v_x = (__pyx_v_x + __pyx_v_x_offset);
+      __pyx_t_5 = __pyx_v_nray;
+      __pyx_t_6 = __pyx_v_ngate;
 
-      /* "pyart/map/_gate_to_grid_map.pyx":301
- *                 # add offsets
- *                 x += x_offset
- *                 y += y_offset             # <<<<<<<<<<<<<<
- *                 z += z_offset
+      /* "pyart/map/_gate_to_grid_map.pyx":917
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (             # <<<<<<<<<<<<<<
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
  * 
  */
-      __pyx_v_y = (__pyx_v_y + __pyx_v_y_offset);
+      __pyx_t_7 = (__pyx_v_nray - __pyx_v_ray_start);
+      __pyx_t_8 = __pyx_v_ngate;
+      __pyx_t_9 = __pyx_v_ifield;
+      *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ray_data.data + __pyx_t_7 * __pyx_v_ray_data.strides[0]) ) + __pyx_t_8 * __pyx_v_ray_data.strides[1]) )) + __pyx_t_9)) )) = (((*((short *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_field_data.data + __pyx_t_5 * __pyx_v_field_data.strides[0]) ) + __pyx_t_6 * __pyx_v_field_data.strides[1]) ))) * __pyx_v_scale_factor) + __pyx_v_add_offset);
+    }
+  }
 
-      /* "pyart/map/_gate_to_grid_map.pyx":302
- *                 x += x_offset
- *                 y += y_offset
- *                 z += z_offset             # <<<<<<<<<<<<<<
- * 
- *                 # Region of influence
+  /* "pyart/map/_gate_to_grid_map.pyx":909
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef inline void _load_typed_rays(             # <<<<<<<<<<<<<<
+ *         field_data_t[:, :] field_data, int ray_start, int ray_end,
+ *         int ifield, float scale_factor, float add_offset,
  */
-      __pyx_v_z = (__pyx_v_z + __pyx_v_z_offset);
 
-      /* "pyart/map/_gate_to_grid_map.pyx":305
+  /* function exit code */
+}
+
+static CYTHON_INLINE void __pyx_fuse_5__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice __pyx_v_field_data, int __pyx_v_ray_start, int __pyx_v_ray_end, int __pyx_v_ifield, float __pyx_v_scale_factor, float __pyx_v_add_offset, __Pyx_memviewslice __pyx_v_ray_data) {
+  int __pyx_v_nray;
+  int __pyx_v_ngate;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":915
+ *     """ Load and scale a block of rays from typed field data. """
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):             # <<<<<<<<<<<<<<
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ */
+  __pyx_t_1 = __pyx_v_ray_end;
+  for (__pyx_t_2 = __pyx_v_ray_start; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_nray = __pyx_t_2;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":916
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):             # <<<<<<<<<<<<<<
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
+ */
+    __pyx_t_3 = (__pyx_v_ray_data.shape[1]);
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_ngate = __pyx_t_4;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":918
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)             # <<<<<<<<<<<<<<
  * 
- *                 # Region of influence
- *                 roi = roi_func.get_roi(z, y, x)             # <<<<<<<<<<<<<<
  * 
- *                 values = field_data[nray, ngate]
  */
-      __pyx_v_roi = ((struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction *)__pyx_v_roi_func->__pyx_vtab)->get_roi(__pyx_v_roi_func, __pyx_v_z, __pyx_v_y, __pyx_v_x, 0);
+      __pyx_t_5 = __pyx_v_nray;
+      __pyx_t_6 = __pyx_v_ngate;
 
-      /* "pyart/map/_gate_to_grid_map.pyx":307
- *                 roi = roi_func.get_roi(z, y, x)
+      /* "pyart/map/_gate_to_grid_map.pyx":917
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (             # <<<<<<<<<<<<<<
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
  * 
- *                 values = field_data[nray, ngate]             # <<<<<<<<<<<<<<
- *                 masks = field_mask[nray, ngate]
- *                 self.map_gate(x, y, z, roi, values, masks, weighting_function)
  */
-      __pyx_t_20.data = __pyx_v_field_data.data;
-      __pyx_t_20.memview = __pyx_v_field_data.memview;
-      __PYX_INC_MEMVIEW(&__pyx_t_20, 0);
-      {
-    Py_ssize_t __pyx_tmp_idx = __pyx_v_nray;
-    Py_ssize_t __pyx_tmp_shape = __pyx_v_field_data.shape[0];
-    Py_ssize_t __pyx_tmp_stride = __pyx_v_field_data.strides[0];
-    if (0 && (__pyx_tmp_idx < 0))
-        __pyx_tmp_idx += __pyx_tmp_shape;
-    if (0 && (__pyx_tmp_idx < 0 || __pyx_tmp_idx >= __pyx_tmp_shape)) {
-        PyErr_SetString(PyExc_IndexError, "Index out of bounds (axis 0)");
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 307; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+      __pyx_t_7 = (__pyx_v_nray - __pyx_v_ray_start);
+      __pyx_t_8 = __pyx_v_ngate;
+      __pyx_t_9 = __pyx_v_ifield;
+      *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ray_data.data + __pyx_t_7 * __pyx_v_ray_data.strides[0]) ) + __pyx_t_8 * __pyx_v_ray_data.strides[1]) )) + __pyx_t_9)) )) = (((*((unsigned short *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_field_data.data + __pyx_t_5 * __pyx_v_field_data.strides[0]) ) + __pyx_t_6 * __pyx_v_field_data.strides[1]) ))) * __pyx_v_scale_factor) + __pyx_v_add_offset);
     }
-        __pyx_t_20.data += __pyx_tmp_idx * __pyx_tmp_stride;
-}
+  }
 
-{
-    Py_ssize_t __pyx_tmp_idx = __pyx_v_ngate;
-    Py_ssize_t __pyx_tmp_shape = __pyx_v_field_data.shape[1];
-    Py_ssize_t __pyx_tmp_stride = __pyx_v_field_data.strides[1];
-    if (0 && (__pyx_tmp_idx < 0))
-        __pyx_tmp_idx += __pyx_tmp_shape;
-    if (0 && (__pyx_tmp_idx < 0 || __pyx_tmp_idx >= __pyx_tmp_shape)) {
-        PyErr_SetString(PyExc_IndexError, "Index out of bounds (axis 1)");
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 307; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-        __pyx_t_20.data += __pyx_tmp_idx * __pyx_tmp_stride;
+  /* "pyart/map/_gate_to_grid_map.pyx":909
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef inline void _load_typed_rays(             # <<<<<<<<<<<<<<
+ *         field_data_t[:, :] field_data, int ray_start, int ray_end,
+ *         int ifield, float scale_factor, float add_offset,
+ */
+
+  /* function exit code */
 }
 
-__pyx_t_20.shape[0] = __pyx_v_field_data.shape[2];
-__pyx_t_20.strides[0] = __pyx_v_field_data.strides[2];
-    __pyx_t_20.suboffsets[0] = -1;
+static CYTHON_INLINE void __pyx_fuse_6__pyx_f_5pyart_3map_17_gate_to_grid_map__load_typed_rays(__Pyx_memviewslice __pyx_v_field_data, int __pyx_v_ray_start, int __pyx_v_ray_end, int __pyx_v_ifield, float __pyx_v_scale_factor, float __pyx_v_add_offset, __Pyx_memviewslice __pyx_v_ray_data) {
+  int __pyx_v_nray;
+  int __pyx_v_ngate;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
 
-__PYX_XDEC_MEMVIEW(&__pyx_v_values, 1);
-      __pyx_v_values = __pyx_t_20;
-      __pyx_t_20.memview = NULL;
-      __pyx_t_20.data = NULL;
+  /* "pyart/map/_gate_to_grid_map.pyx":915
+ *     """ Load and scale a block of rays from typed field data. """
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):             # <<<<<<<<<<<<<<
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ */
+  __pyx_t_1 = __pyx_v_ray_end;
+  for (__pyx_t_2 = __pyx_v_ray_start; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_nray = __pyx_t_2;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":916
+ *     cdef int nray, ngate
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):             # <<<<<<<<<<<<<<
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
+ */
+    __pyx_t_3 = (__pyx_v_ray_data.shape[1]);
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_ngate = __pyx_t_4;
 
-      /* "pyart/map/_gate_to_grid_map.pyx":308
+      /* "pyart/map/_gate_to_grid_map.pyx":918
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (
+ *                 field_data[nray, ngate] * scale_factor + add_offset)             # <<<<<<<<<<<<<<
  * 
- *                 values = field_data[nray, ngate]
- *                 masks = field_mask[nray, ngate]             # <<<<<<<<<<<<<<
- *                 self.map_gate(x, y, z, roi, values, masks, weighting_function)
  * 
  */
-      __pyx_t_21.data = __pyx_v_field_mask.data;
-      __pyx_t_21.memview = __pyx_v_field_mask.memview;
-      __PYX_INC_MEMVIEW(&__pyx_t_21, 0);
-      {
-    Py_ssize_t __pyx_tmp_idx = __pyx_v_nray;
-    Py_ssize_t __pyx_tmp_shape = __pyx_v_field_mask.shape[0];
-    Py_ssize_t __pyx_tmp_stride = __pyx_v_field_mask.strides[0];
-    if (0 && (__pyx_tmp_idx < 0))
-        __pyx_tmp_idx += __pyx_tmp_shape;
-    if (0 && (__pyx_tmp_idx < 0 || __pyx_tmp_idx >= __pyx_tmp_shape)) {
-        PyErr_SetString(PyExc_IndexError, "Index out of bounds (axis 0)");
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-        __pyx_t_21.data += __pyx_tmp_idx * __pyx_tmp_stride;
-}
-
-{
-    Py_ssize_t __pyx_tmp_idx = __pyx_v_ngate;
-    Py_ssize_t __pyx_tmp_shape = __pyx_v_field_mask.shape[1];
-    Py_ssize_t __pyx_tmp_stride = __pyx_v_field_mask.strides[1];
-    if (0 && (__pyx_tmp_idx < 0))
-        __pyx_tmp_idx += __pyx_tmp_shape;
-    if (0 && (__pyx_tmp_idx < 0 || __pyx_tmp_idx >= __pyx_tmp_shape)) {
-        PyErr_SetString(PyExc_IndexError, "Index out of bounds (axis 1)");
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 308; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-        __pyx_t_21.data += __pyx_tmp_idx * __pyx_tmp_stride;
-}
+      __pyx_t_5 = __pyx_v_nray;
+      __pyx_t_6 = __pyx_v_ngate;
 
-__pyx_t_21.shape[0] = __pyx_v_field_mask.shape[2];
-__pyx_t_21.strides[0] = __pyx_v_field_mask.strides[2];
-    __pyx_t_21.suboffsets[0] = -1;
-
-__PYX_XDEC_MEMVIEW(&__pyx_v_masks, 1);
-      __pyx_v_masks = __pyx_t_21;
-      __pyx_t_21.memview = NULL;
-      __pyx_t_21.data = NULL;
-
-      /* "pyart/map/_gate_to_grid_map.pyx":309
- *                 values = field_data[nray, ngate]
- *                 masks = field_mask[nray, ngate]
- *                 self.map_gate(x, y, z, roi, values, masks, weighting_function)             # <<<<<<<<<<<<<<
+      /* "pyart/map/_gate_to_grid_map.pyx":917
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ray_data.shape[1]):
+ *             ray_data[nray - ray_start, ngate, ifield] = (             # <<<<<<<<<<<<<<
+ *                 field_data[nray, ngate] * scale_factor + add_offset)
  * 
- *     @cython.initializedcheck(False)
  */
-      ((struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *)__pyx_v_self->__pyx_vtab)->map_gate(__pyx_v_self, __pyx_v_x, __pyx_v_y, __pyx_v_z, __pyx_v_roi, __pyx_v_values, __pyx_v_masks, __pyx_v_weighting_function);
-      __pyx_L7_continue:;
+      __pyx_t_7 = (__pyx_v_nray - __pyx_v_ray_start);
+      __pyx_t_8 = __pyx_v_ngate;
+      __pyx_t_9 = __pyx_v_ifield;
+      *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_ray_data.data + __pyx_t_7 * __pyx_v_ray_data.strides[0]) ) + __pyx_t_8 * __pyx_v_ray_data.strides[1]) )) + __pyx_t_9)) )) = (((*((int *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_field_data.data + __pyx_t_5 * __pyx_v_field_data.strides[0]) ) + __pyx_t_6 * __pyx_v_field_data.strides[1]) ))) * __pyx_v_scale_factor) + __pyx_v_add_offset);
     }
   }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":230
- *     @cython.boundscheck(False)
- *     @cython.wraparound(False)
- *     def map_gates_to_grid(             # <<<<<<<<<<<<<<
- *             self, float[::1] elevations, float[::1] azimuths,
- *             float[::1] ranges, float[:, :, ::1] field_data,
+  /* "pyart/map/_gate_to_grid_map.pyx":909
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef inline void _load_typed_rays(             # <<<<<<<<<<<<<<
+ *         field_data_t[:, :] field_data, int ray_start, int ray_end,
+ *         int ifield, float scale_factor, float add_offset,
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_20, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_t_21, 1);
-  __Pyx_AddTraceback("pyart.map._gate_to_grid_map.GateToGridMapper.map_gates_to_grid", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __PYX_XDEC_MEMVIEW(&__pyx_v_values, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_masks, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_elevations, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_azimuths, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_ranges, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_field_data, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_field_mask, 1);
-  __PYX_XDEC_MEMVIEW(&__pyx_v_excluded_gates, 1);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
 }
 
-/* "pyart/map/_gate_to_grid_map.pyx":315
- *     @cython.boundscheck(False)
- *     @cython.wraparound(False)
- *     cdef int map_gate(self, float x, float y, float z, float roi,             # <<<<<<<<<<<<<<
- *                       float[:] values, char[:] masks,
- *                       int weighting_function):
+/* "pyart/map/_gate_to_grid_map.pyx":924
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef void _find_gate_info(             # <<<<<<<<<<<<<<
+ *         float[::1] elevations, float[::1] azimuths, float[::1] ranges,
+ *         int ray_start, int ray_end, float z_offset, float y_offset,
  */
 
-static int __pyx_f_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_map_gate(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *__pyx_v_self, float __pyx_v_x, float __pyx_v_y, float __pyx_v_z, float __pyx_v_roi, __Pyx_memviewslice __pyx_v_values, __Pyx_memviewslice __pyx_v_masks, int __pyx_v_weighting_function) {
-  float __pyx_v_xg;
-  float __pyx_v_yg;
-  float __pyx_v_zg;
-  float __pyx_v_weight;
-  float __pyx_v_roi2;
-  float __pyx_v_dist2;
-  int __pyx_v_x_min;
-  int __pyx_v_x_max;
-  int __pyx_v_y_min;
-  int __pyx_v_y_max;
-  int __pyx_v_z_min;
-  int __pyx_v_z_max;
-  int __pyx_v_xi;
-  int __pyx_v_yi;
-  int __pyx_v_zi;
-  int __pyx_v_i;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
+static void __pyx_f_5pyart_3map_17_gate_to_grid_map__find_gate_info(__Pyx_memviewslice __pyx_v_elevations, __Pyx_memviewslice __pyx_v_azimuths, __Pyx_memviewslice __pyx_v_ranges, int __pyx_v_ray_start, int __pyx_v_ray_end, float __pyx_v_z_offset, float __pyx_v_y_offset, float __pyx_v_x_offset, float __pyx_v_toa, __Pyx_memviewslice __pyx_v_excluded_gates, int __pyx_v_check_excluded, struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func, int __pyx_v_find_roi, __Pyx_memviewslice __pyx_v_gate_info) {
+  int __pyx_v_nray;
+  int __pyx_v_ngate;
+  float __pyx_v_x;
+  float __pyx_v_y;
+  float __pyx_v_z;
   int __pyx_t_1;
-  long __pyx_t_2;
-  int __pyx_t_3;
-  long __pyx_t_4;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
   int __pyx_t_5;
-  long __pyx_t_6;
+  int __pyx_t_6;
   int __pyx_t_7;
   int __pyx_t_8;
   int __pyx_t_9;
   int __pyx_t_10;
-  int __pyx_t_11;
+  Py_ssize_t __pyx_t_11;
   int __pyx_t_12;
   int __pyx_t_13;
   int __pyx_t_14;
   int __pyx_t_15;
   int __pyx_t_16;
-  int __pyx_t_17;
+  Py_ssize_t __pyx_t_17;
   int __pyx_t_18;
   int __pyx_t_19;
-  __Pyx_RefNannySetupContext("map_gate", 0);
+  Py_ssize_t __pyx_t_20;
+  int __pyx_t_21;
+  int __pyx_t_22;
+  Py_ssize_t __pyx_t_23;
+  int __pyx_t_24;
+  int __pyx_t_25;
+  Py_ssize_t __pyx_t_26;
+  int __pyx_t_27;
+  int __pyx_t_28;
+  Py_ssize_t __pyx_t_29;
+  int __pyx_t_30;
+  int __pyx_t_31;
+  Py_ssize_t __pyx_t_32;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":942
+ *     cdef int nray, ngate
+ *     cdef float x, y, z
+ *     for nray in range(ray_start, ray_end):             # <<<<<<<<<<<<<<
+ *         for ngate in range(ranges.shape[0]):
+ *             if check_excluded and excluded_gates[nray, ngate]:
+ */
+  __pyx_t_1 = __pyx_v_ray_end;
+  for (__pyx_t_2 = __pyx_v_ray_start; __pyx_t_2 < __pyx_t_1; __pyx_t_2+=1) {
+    __pyx_v_nray = __pyx_t_2;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":943
+ *     cdef float x, y, z
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ranges.shape[0]):             # <<<<<<<<<<<<<<
+ *             if check_excluded and excluded_gates[nray, ngate]:
+ *                 gate_info[nray - ray_start, ngate, 3] = -1.
+ */
+    __pyx_t_3 = (__pyx_v_ranges.shape[0]);
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_ngate = __pyx_t_4;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":325
- * 
- *         # shift positions so that grid starts at 0
- *         x -= self.x_start             # <<<<<<<<<<<<<<
- *         y -= self.y_start
- *         z -= self.z_start
+      /* "pyart/map/_gate_to_grid_map.pyx":944
+ *     for nray in range(ray_start, ray_end):
+ *         for ngate in range(ranges.shape[0]):
+ *             if check_excluded and excluded_gates[nray, ngate]:             # <<<<<<<<<<<<<<
+ *                 gate_info[nray - ray_start, ngate, 3] = -1.
+ *                 continue
  */
-  __pyx_v_x = (__pyx_v_x - __pyx_v_self->x_start);
+      __pyx_t_6 = (__pyx_v_check_excluded != 0);
+      if (__pyx_t_6) {
+      } else {
+        __pyx_t_5 = __pyx_t_6;
+        goto __pyx_L8_bool_binop_done;
+      }
+      __pyx_t_7 = __pyx_v_nray;
+      __pyx_t_8 = __pyx_v_ngate;
+      __pyx_t_6 = ((*((char *) ( /* dim=1 */ ((char *) (((char *) ( /* dim=0 */ (__pyx_v_excluded_gates.data + __pyx_t_7 * __pyx_v_excluded_gates.strides[0]) )) + __pyx_t_8)) ))) != 0);
+      __pyx_t_5 = __pyx_t_6;
+      __pyx_L8_bool_binop_done:;
+      if (__pyx_t_5) {
+
+        /* "pyart/map/_gate_to_grid_map.pyx":945
+ *         for ngate in range(ranges.shape[0]):
+ *             if check_excluded and excluded_gates[nray, ngate]:
+ *                 gate_info[nray - ray_start, ngate, 3] = -1.             # <<<<<<<<<<<<<<
+ *                 continue
+ *             gate_location(elevations[nray], azimuths[nray], ranges[ngate],
+ */
+        __pyx_t_9 = (__pyx_v_nray - __pyx_v_ray_start);
+        __pyx_t_10 = __pyx_v_ngate;
+        __pyx_t_11 = 3;
+        *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_9 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_10 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_11)) )) = -1.;
+
+        /* "pyart/map/_gate_to_grid_map.pyx":946
+ *             if check_excluded and excluded_gates[nray, ngate]:
+ *                 gate_info[nray - ray_start, ngate, 3] = -1.
+ *                 continue             # <<<<<<<<<<<<<<
+ *             gate_location(elevations[nray], azimuths[nray], ranges[ngate],
+ *                           z_offset, y_offset, x_offset, &z, &y, &x)
+ */
+        goto __pyx_L5_continue;
+      }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":326
- *         # shift positions so that grid starts at 0
- *         x -= self.x_start
- *         y -= self.y_start             # <<<<<<<<<<<<<<
- *         z -= self.z_start
- * 
- */
-  __pyx_v_y = (__pyx_v_y - __pyx_v_self->y_start);
+      /* "pyart/map/_gate_to_grid_map.pyx":947
+ *                 gate_info[nray - ray_start, ngate, 3] = -1.
+ *                 continue
+ *             gate_location(elevations[nray], azimuths[nray], ranges[ngate],             # <<<<<<<<<<<<<<
+ *                           z_offset, y_offset, x_offset, &z, &y, &x)
+ *             gate_info[nray - ray_start, ngate, 0] = z
+ */
+      __pyx_t_12 = __pyx_v_nray;
+      __pyx_t_13 = __pyx_v_nray;
+      __pyx_t_14 = __pyx_v_ngate;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":948
+ *                 continue
+ *             gate_location(elevations[nray], azimuths[nray], ranges[ngate],
+ *                           z_offset, y_offset, x_offset, &z, &y, &x)             # <<<<<<<<<<<<<<
+ *             gate_info[nray - ray_start, ngate, 0] = z
+ *             gate_info[nray - ray_start, ngate, 1] = y
+ */
+      __pyx_f_5pyart_3map_17_gate_to_grid_map_gate_location((*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_elevations.data) + __pyx_t_12)) ))), (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_azimuths.data) + __pyx_t_13)) ))), (*((float *) ( /* dim=0 */ ((char *) (((float *) __pyx_v_ranges.data) + __pyx_t_14)) ))), __pyx_v_z_offset, __pyx_v_y_offset, __pyx_v_x_offset, (&__pyx_v_z), (&__pyx_v_y), (&__pyx_v_x));
+
+      /* "pyart/map/_gate_to_grid_map.pyx":949
+ *             gate_location(elevations[nray], azimuths[nray], ranges[ngate],
+ *                           z_offset, y_offset, x_offset, &z, &y, &x)
+ *             gate_info[nray - ray_start, ngate, 0] = z             # <<<<<<<<<<<<<<
+ *             gate_info[nray - ray_start, ngate, 1] = y
+ *             gate_info[nray - ray_start, ngate, 2] = x
+ */
+      __pyx_t_15 = (__pyx_v_nray - __pyx_v_ray_start);
+      __pyx_t_16 = __pyx_v_ngate;
+      __pyx_t_17 = 0;
+      *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_15 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_16 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_17)) )) = __pyx_v_z;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":950
+ *                           z_offset, y_offset, x_offset, &z, &y, &x)
+ *             gate_info[nray - ray_start, ngate, 0] = z
+ *             gate_info[nray - ray_start, ngate, 1] = y             # <<<<<<<<<<<<<<
+ *             gate_info[nray - ray_start, ngate, 2] = x
+ *             if z >= toa:
+ */
+      __pyx_t_18 = (__pyx_v_nray - __pyx_v_ray_start);
+      __pyx_t_19 = __pyx_v_ngate;
+      __pyx_t_20 = 1;
+      *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_18 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_19 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_20)) )) = __pyx_v_y;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":951
+ *             gate_info[nray - ray_start, ngate, 0] = z
+ *             gate_info[nray - ray_start, ngate, 1] = y
+ *             gate_info[nray - ray_start, ngate, 2] = x             # <<<<<<<<<<<<<<
+ *             if z >= toa:
+ *                 gate_info[nray - ray_start, ngate, 3] = -1.  # above toa
+ */
+      __pyx_t_21 = (__pyx_v_nray - __pyx_v_ray_start);
+      __pyx_t_22 = __pyx_v_ngate;
+      __pyx_t_23 = 2;
+      *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_21 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_22 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_23)) )) = __pyx_v_x;
+
+      /* "pyart/map/_gate_to_grid_map.pyx":952
+ *             gate_info[nray - ray_start, ngate, 1] = y
+ *             gate_info[nray - ray_start, ngate, 2] = x
+ *             if z >= toa:             # <<<<<<<<<<<<<<
+ *                 gate_info[nray - ray_start, ngate, 3] = -1.  # above toa
+ *             elif find_roi:
+ */
+      __pyx_t_5 = ((__pyx_v_z >= __pyx_v_toa) != 0);
+      if (__pyx_t_5) {
+
+        /* "pyart/map/_gate_to_grid_map.pyx":953
+ *             gate_info[nray - ray_start, ngate, 2] = x
+ *             if z >= toa:
+ *                 gate_info[nray - ray_start, ngate, 3] = -1.  # above toa             # <<<<<<<<<<<<<<
+ *             elif find_roi:
+ *                 gate_info[nray - ray_start, ngate, 3] = roi_func.roi(z, y, x)
+ */
+        __pyx_t_24 = (__pyx_v_nray - __pyx_v_ray_start);
+        __pyx_t_25 = __pyx_v_ngate;
+        __pyx_t_26 = 3;
+        *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_24 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_25 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_26)) )) = -1.;
+        goto __pyx_L10;
+      }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":327
- *         x -= self.x_start
- *         y -= self.y_start
- *         z -= self.z_start             # <<<<<<<<<<<<<<
- * 
- *         x_min = find_min(x, roi, self.x_step)
+      /* "pyart/map/_gate_to_grid_map.pyx":954
+ *             if z >= toa:
+ *                 gate_info[nray - ray_start, ngate, 3] = -1.  # above toa
+ *             elif find_roi:             # <<<<<<<<<<<<<<
+ *                 gate_info[nray - ray_start, ngate, 3] = roi_func.roi(z, y, x)
+ *             else:
  */
-  __pyx_v_z = (__pyx_v_z - __pyx_v_self->z_start);
+      __pyx_t_5 = (__pyx_v_find_roi != 0);
+      if (__pyx_t_5) {
 
-  /* "pyart/map/_gate_to_grid_map.pyx":329
- *         z -= self.z_start
- * 
- *         x_min = find_min(x, roi, self.x_step)             # <<<<<<<<<<<<<<
- *         if x_min > self.nx-1:
- *             return 0
+        /* "pyart/map/_gate_to_grid_map.pyx":955
+ *                 gate_info[nray - ray_start, ngate, 3] = -1.  # above toa
+ *             elif find_roi:
+ *                 gate_info[nray - ray_start, ngate, 3] = roi_func.roi(z, y, x)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 gate_info[nray - ray_start, ngate, 3] = 0.
  */
-  __pyx_v_x_min = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(__pyx_v_x, __pyx_v_roi, __pyx_v_self->x_step);
+        __pyx_t_27 = (__pyx_v_nray - __pyx_v_ray_start);
+        __pyx_t_28 = __pyx_v_ngate;
+        __pyx_t_29 = 3;
+        *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_27 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_28 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_29)) )) = ((struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction *)__pyx_v_roi_func->__pyx_vtab)->roi(__pyx_v_roi_func, __pyx_v_z, __pyx_v_y, __pyx_v_x);
+        goto __pyx_L10;
+      }
+      /*else*/ {
 
-  /* "pyart/map/_gate_to_grid_map.pyx":330
+        /* "pyart/map/_gate_to_grid_map.pyx":957
+ *                 gate_info[nray - ray_start, ngate, 3] = roi_func.roi(z, y, x)
+ *             else:
+ *                 gate_info[nray - ray_start, ngate, 3] = 0.             # <<<<<<<<<<<<<<
+ * 
  * 
- *         x_min = find_min(x, roi, self.x_step)
- *         if x_min > self.nx-1:             # <<<<<<<<<<<<<<
- *             return 0
- *         x_max = find_max(x, roi, self.x_step, self.nx)
- */
-  __pyx_t_1 = ((__pyx_v_x_min > (__pyx_v_self->nx - 1)) != 0);
-  if (__pyx_t_1) {
-
-    /* "pyart/map/_gate_to_grid_map.pyx":331
- *         x_min = find_min(x, roi, self.x_step)
- *         if x_min > self.nx-1:
- *             return 0             # <<<<<<<<<<<<<<
- *         x_max = find_max(x, roi, self.x_step, self.nx)
- *         if x_max < 0:
  */
-    __pyx_r = 0;
-    goto __pyx_L0;
+        __pyx_t_30 = (__pyx_v_nray - __pyx_v_ray_start);
+        __pyx_t_31 = __pyx_v_ngate;
+        __pyx_t_32 = 3;
+        *((float *) ( /* dim=2 */ ((char *) (((float *) ( /* dim=1 */ (( /* dim=0 */ (__pyx_v_gate_info.data + __pyx_t_30 * __pyx_v_gate_info.strides[0]) ) + __pyx_t_31 * __pyx_v_gate_info.strides[1]) )) + __pyx_t_32)) )) = 0.;
+      }
+      __pyx_L10:;
+      __pyx_L5_continue:;
+    }
   }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":332
- *         if x_min > self.nx-1:
- *             return 0
- *         x_max = find_max(x, roi, self.x_step, self.nx)             # <<<<<<<<<<<<<<
- *         if x_max < 0:
- *             return 0
+  /* "pyart/map/_gate_to_grid_map.pyx":924
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * cdef void _find_gate_info(             # <<<<<<<<<<<<<<
+ *         float[::1] elevations, float[::1] azimuths, float[::1] ranges,
+ *         int ray_start, int ray_end, float z_offset, float y_offset,
  */
-  __pyx_v_x_max = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(__pyx_v_x, __pyx_v_roi, __pyx_v_self->x_step, __pyx_v_self->nx);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":333
- *             return 0
- *         x_max = find_max(x, roi, self.x_step, self.nx)
- *         if x_max < 0:             # <<<<<<<<<<<<<<
- *             return 0
+  /* function exit code */
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":960
  * 
+ * 
+ * cdef bint _has_nogil_roi(RoIFunction roi_func):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return True when the radius of influence of roi_func can be found
  */
-  __pyx_t_1 = ((__pyx_v_x_max < 0) != 0);
-  if (__pyx_t_1) {
 
-    /* "pyart/map/_gate_to_grid_map.pyx":334
- *         x_max = find_max(x, roi, self.x_step, self.nx)
- *         if x_max < 0:
- *             return 0             # <<<<<<<<<<<<<<
- * 
- *         y_min = find_min(y, roi, self.y_step)
+static int __pyx_f_5pyart_3map_17_gate_to_grid_map__has_nogil_roi(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *__pyx_v_roi_func) {
+  PyObject *__pyx_v_cls = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *(*__pyx_t_4)(PyObject *);
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_has_nogil_roi", 0);
+
+  /* "pyart/map/_gate_to_grid_map.pyx":966
+ *     subclass defined in Python.
+ *     """
+ *     for cls in type(roi_func).__mro__:             # <<<<<<<<<<<<<<
+ *         if cls is RoIFunction:
+ *             return True
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)Py_TYPE(((PyObject *)__pyx_v_roi_func))), __pyx_n_s_mro); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_2 = __pyx_t_1; __Pyx_INCREF(__pyx_t_2); __pyx_t_3 = 0;
+    __pyx_t_4 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = Py_TYPE(__pyx_t_2)->tp_iternext; if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_4)) {
+      if (likely(PyList_CheckExact(__pyx_t_2))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_COMPILING_IN_CPYTHON
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_2)) break;
+        #if CYTHON_COMPILING_IN_CPYTHON
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_1); __pyx_t_3++; if (unlikely(0 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      }
+    } else {
+      __pyx_t_1 = __pyx_t_4(__pyx_t_2);
+      if (unlikely(!__pyx_t_1)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(exc_type == PyExc_StopIteration || PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else {__pyx_filename = __pyx_f[0]; __pyx_lineno = 966; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_XDECREF_SET(__pyx_v_cls, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "pyart/map/_gate_to_grid_map.pyx":967
+ *     """
+ *     for cls in type(roi_func).__mro__:
+ *         if cls is RoIFunction:             # <<<<<<<<<<<<<<
+ *             return True
+ *         if 'get_roi' in cls.__dict__:
+ */
+    __pyx_t_5 = (__pyx_v_cls == ((PyObject *)((PyObject*)__pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction)));
+    __pyx_t_6 = (__pyx_t_5 != 0);
+    if (__pyx_t_6) {
+
+      /* "pyart/map/_gate_to_grid_map.pyx":968
+ *     for cls in type(roi_func).__mro__:
+ *         if cls is RoIFunction:
+ *             return True             # <<<<<<<<<<<<<<
+ *         if 'get_roi' in cls.__dict__:
+ *             return False
  */
-    __pyx_r = 0;
-    goto __pyx_L0;
-  }
+      __pyx_r = 1;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      goto __pyx_L0;
+    }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":336
- *             return 0
- * 
- *         y_min = find_min(y, roi, self.y_step)             # <<<<<<<<<<<<<<
- *         if y_min > self.ny-1:
- *             return 0
+    /* "pyart/map/_gate_to_grid_map.pyx":969
+ *         if cls is RoIFunction:
+ *             return True
+ *         if 'get_roi' in cls.__dict__:             # <<<<<<<<<<<<<<
+ *             return False
+ *     return True
  */
-  __pyx_v_y_min = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(__pyx_v_y, __pyx_v_roi, __pyx_v_self->y_step);
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_cls, __pyx_n_s_dict); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 969; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = (__Pyx_PySequence_Contains(__pyx_n_s_get_roi, __pyx_t_1, Py_EQ)); if (unlikely(__pyx_t_6 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 969; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_5 = (__pyx_t_6 != 0);
+    if (__pyx_t_5) {
 
-  /* "pyart/map/_gate_to_grid_map.pyx":337
+      /* "pyart/map/_gate_to_grid_map.pyx":970
+ *             return True
+ *         if 'get_roi' in cls.__dict__:
+ *             return False             # <<<<<<<<<<<<<<
+ *     return True
  * 
- *         y_min = find_min(y, roi, self.y_step)
- *         if y_min > self.ny-1:             # <<<<<<<<<<<<<<
- *             return 0
- *         y_max = find_max(y, roi, self.y_step, self.ny)
  */
-  __pyx_t_1 = ((__pyx_v_y_min > (__pyx_v_self->ny - 1)) != 0);
-  if (__pyx_t_1) {
+      __pyx_r = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      goto __pyx_L0;
+    }
 
-    /* "pyart/map/_gate_to_grid_map.pyx":338
- *         y_min = find_min(y, roi, self.y_step)
- *         if y_min > self.ny-1:
- *             return 0             # <<<<<<<<<<<<<<
- *         y_max = find_max(y, roi, self.y_step, self.ny)
- *         if y_max < 0:
+    /* "pyart/map/_gate_to_grid_map.pyx":966
+ *     subclass defined in Python.
+ *     """
+ *     for cls in type(roi_func).__mro__:             # <<<<<<<<<<<<<<
+ *         if cls is RoIFunction:
+ *             return True
  */
-    __pyx_r = 0;
-    goto __pyx_L0;
   }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":339
- *         if y_min > self.ny-1:
- *             return 0
- *         y_max = find_max(y, roi, self.y_step, self.ny)             # <<<<<<<<<<<<<<
- *         if y_max < 0:
- *             return 0
+  /* "pyart/map/_gate_to_grid_map.pyx":971
+ *         if 'get_roi' in cls.__dict__:
+ *             return False
+ *     return True             # <<<<<<<<<<<<<<
+ * 
+ * 
  */
-  __pyx_v_y_max = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(__pyx_v_y, __pyx_v_roi, __pyx_v_self->y_step, __pyx_v_self->ny);
+  __pyx_r = 1;
+  goto __pyx_L0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":340
- *             return 0
- *         y_max = find_max(y, roi, self.y_step, self.ny)
- *         if y_max < 0:             # <<<<<<<<<<<<<<
- *             return 0
+  /* "pyart/map/_gate_to_grid_map.pyx":960
+ * 
  * 
+ * cdef bint _has_nogil_roi(RoIFunction roi_func):             # <<<<<<<<<<<<<<
+ *     """
+ *     Return True when the radius of influence of roi_func can be found
  */
-  __pyx_t_1 = ((__pyx_v_y_max < 0) != 0);
-  if (__pyx_t_1) {
 
-    /* "pyart/map/_gate_to_grid_map.pyx":341
- *         y_max = find_max(y, roi, self.y_step, self.ny)
- *         if y_max < 0:
- *             return 0             # <<<<<<<<<<<<<<
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_WriteUnraisable("pyart.map._gate_to_grid_map._has_nogil_roi", __pyx_clineno, __pyx_lineno, __pyx_filename, 0, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_cls);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":975
  * 
- *         z_min = find_min(z, roi, self.z_step)
+ * @cython.cdivision(True)
+ * cdef inline void gate_location(             # <<<<<<<<<<<<<<
+ *         float elevation, float azimuth, float r, float z_offset,
+ *         float y_offset, float x_offset, float *z, float *y, float *x) nogil:
  */
-    __pyx_r = 0;
-    goto __pyx_L0;
-  }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":343
- *             return 0
- * 
- *         z_min = find_min(z, roi, self.z_step)             # <<<<<<<<<<<<<<
- *         if z_min > self.nz-1:
- *             return 0
+static CYTHON_INLINE void __pyx_f_5pyart_3map_17_gate_to_grid_map_gate_location(float __pyx_v_elevation, float __pyx_v_azimuth, float __pyx_v_r, float __pyx_v_z_offset, float __pyx_v_y_offset, float __pyx_v_x_offset, float *__pyx_v_z, float *__pyx_v_y, float *__pyx_v_x) {
+  float __pyx_v_s;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":984
+ *     """
+ *     cdef float s
+ *     elevation = elevation * PI / 180.0             # <<<<<<<<<<<<<<
+ *     azimuth = azimuth * PI / 180.0
+ *     z[0] = (r**2 + R**2 + 2.0*r*R*sin(elevation))**0.5 - R
  */
-  __pyx_v_z_min = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(__pyx_v_z, __pyx_v_roi, __pyx_v_self->z_step);
+  __pyx_v_elevation = ((__pyx_v_elevation * __pyx_v_5pyart_3map_17_gate_to_grid_map_PI) / 180.0);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":344
- * 
- *         z_min = find_min(z, roi, self.z_step)
- *         if z_min > self.nz-1:             # <<<<<<<<<<<<<<
- *             return 0
- *         z_max = find_max(z, roi, self.z_step, self.nz)
+  /* "pyart/map/_gate_to_grid_map.pyx":985
+ *     cdef float s
+ *     elevation = elevation * PI / 180.0
+ *     azimuth = azimuth * PI / 180.0             # <<<<<<<<<<<<<<
+ *     z[0] = (r**2 + R**2 + 2.0*r*R*sin(elevation))**0.5 - R
+ *     s = R * asin(r * cos(elevation) / (R + z[0]))  # arc length in m.
  */
-  __pyx_t_1 = ((__pyx_v_z_min > (__pyx_v_self->nz - 1)) != 0);
-  if (__pyx_t_1) {
+  __pyx_v_azimuth = ((__pyx_v_azimuth * __pyx_v_5pyart_3map_17_gate_to_grid_map_PI) / 180.0);
 
-    /* "pyart/map/_gate_to_grid_map.pyx":345
- *         z_min = find_min(z, roi, self.z_step)
- *         if z_min > self.nz-1:
- *             return 0             # <<<<<<<<<<<<<<
- *         z_max = find_max(z, roi, self.z_step, self.nz)
- *         if z_max < 0:
+  /* "pyart/map/_gate_to_grid_map.pyx":986
+ *     elevation = elevation * PI / 180.0
+ *     azimuth = azimuth * PI / 180.0
+ *     z[0] = (r**2 + R**2 + 2.0*r*R*sin(elevation))**0.5 - R             # <<<<<<<<<<<<<<
+ *     s = R * asin(r * cos(elevation) / (R + z[0]))  # arc length in m.
+ *     x[0] = s * sin(azimuth) + x_offset
  */
-    __pyx_r = 0;
-    goto __pyx_L0;
-  }
+  (__pyx_v_z[0]) = (pow(((powf(__pyx_v_r, 2.0) + powf(__pyx_v_5pyart_3map_17_gate_to_grid_map_R, 2.0)) + (((2.0 * __pyx_v_r) * __pyx_v_5pyart_3map_17_gate_to_grid_map_R) * sin(__pyx_v_elevation))), 0.5) - __pyx_v_5pyart_3map_17_gate_to_grid_map_R);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":346
- *         if z_min > self.nz-1:
- *             return 0
- *         z_max = find_max(z, roi, self.z_step, self.nz)             # <<<<<<<<<<<<<<
- *         if z_max < 0:
- *             return 0
+  /* "pyart/map/_gate_to_grid_map.pyx":987
+ *     azimuth = azimuth * PI / 180.0
+ *     z[0] = (r**2 + R**2 + 2.0*r*R*sin(elevation))**0.5 - R
+ *     s = R * asin(r * cos(elevation) / (R + z[0]))  # arc length in m.             # <<<<<<<<<<<<<<
+ *     x[0] = s * sin(azimuth) + x_offset
+ *     y[0] = s * cos(azimuth) + y_offset
  */
-  __pyx_v_z_max = __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(__pyx_v_z, __pyx_v_roi, __pyx_v_self->z_step, __pyx_v_self->nz);
+  __pyx_v_s = (__pyx_v_5pyart_3map_17_gate_to_grid_map_R * asin(((__pyx_v_r * cos(__pyx_v_elevation)) / (__pyx_v_5pyart_3map_17_gate_to_grid_map_R + (__pyx_v_z[0])))));
 
-  /* "pyart/map/_gate_to_grid_map.pyx":347
- *             return 0
- *         z_max = find_max(z, roi, self.z_step, self.nz)
- *         if z_max < 0:             # <<<<<<<<<<<<<<
- *             return 0
- * 
+  /* "pyart/map/_gate_to_grid_map.pyx":988
+ *     z[0] = (r**2 + R**2 + 2.0*r*R*sin(elevation))**0.5 - R
+ *     s = R * asin(r * cos(elevation) / (R + z[0]))  # arc length in m.
+ *     x[0] = s * sin(azimuth) + x_offset             # <<<<<<<<<<<<<<
+ *     y[0] = s * cos(azimuth) + y_offset
+ *     z[0] = z[0] + z_offset
  */
-  __pyx_t_1 = ((__pyx_v_z_max < 0) != 0);
-  if (__pyx_t_1) {
+  (__pyx_v_x[0]) = ((__pyx_v_s * sin(__pyx_v_azimuth)) + __pyx_v_x_offset);
 
-    /* "pyart/map/_gate_to_grid_map.pyx":348
- *         z_max = find_max(z, roi, self.z_step, self.nz)
- *         if z_max < 0:
- *             return 0             # <<<<<<<<<<<<<<
+  /* "pyart/map/_gate_to_grid_map.pyx":989
+ *     s = R * asin(r * cos(elevation) / (R + z[0]))  # arc length in m.
+ *     x[0] = s * sin(azimuth) + x_offset
+ *     y[0] = s * cos(azimuth) + y_offset             # <<<<<<<<<<<<<<
+ *     z[0] = z[0] + z_offset
  * 
- *         roi2 = roi * roi
  */
-    __pyx_r = 0;
-    goto __pyx_L0;
-  }
+  (__pyx_v_y[0]) = ((__pyx_v_s * cos(__pyx_v_azimuth)) + __pyx_v_y_offset);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":350
- *             return 0
+  /* "pyart/map/_gate_to_grid_map.pyx":990
+ *     x[0] = s * sin(azimuth) + x_offset
+ *     y[0] = s * cos(azimuth) + y_offset
+ *     z[0] = z[0] + z_offset             # <<<<<<<<<<<<<<
+ * 
  * 
- *         roi2 = roi * roi             # <<<<<<<<<<<<<<
- *         for xi in range(x_min, x_max+1):
- *             for yi in range(y_min, y_max+1):
  */
-  __pyx_v_roi2 = (__pyx_v_roi * __pyx_v_roi);
+  (__pyx_v_z[0]) = ((__pyx_v_z[0]) + __pyx_v_z_offset);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":351
+  /* "pyart/map/_gate_to_grid_map.pyx":975
  * 
- *         roi2 = roi * roi
- *         for xi in range(x_min, x_max+1):             # <<<<<<<<<<<<<<
- *             for yi in range(y_min, y_max+1):
- *                 for zi in range(z_min, z_max+1):
+ * @cython.cdivision(True)
+ * cdef inline void gate_location(             # <<<<<<<<<<<<<<
+ *         float elevation, float azimuth, float r, float z_offset,
+ *         float y_offset, float x_offset, float *z, float *y, float *x) nogil:
  */
-  __pyx_t_2 = (__pyx_v_x_max + 1);
-  for (__pyx_t_3 = __pyx_v_x_min; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
-    __pyx_v_xi = __pyx_t_3;
 
-    /* "pyart/map/_gate_to_grid_map.pyx":352
- *         roi2 = roi * roi
- *         for xi in range(x_min, x_max+1):
- *             for yi in range(y_min, y_max+1):             # <<<<<<<<<<<<<<
- *                 for zi in range(z_min, z_max+1):
- *                     xg = self.x_step * xi
- */
-    __pyx_t_4 = (__pyx_v_y_max + 1);
-    for (__pyx_t_5 = __pyx_v_y_min; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
-      __pyx_v_yi = __pyx_t_5;
+  /* function exit code */
+}
 
-      /* "pyart/map/_gate_to_grid_map.pyx":353
- *         for xi in range(x_min, x_max+1):
- *             for yi in range(y_min, y_max+1):
- *                 for zi in range(z_min, z_max+1):             # <<<<<<<<<<<<<<
- *                     xg = self.x_step * xi
- *                     yg = self.y_step * yi
+/* "pyart/map/_gate_to_grid_map.pyx":994
+ * 
+ * @cython.cdivision(True)
+ * cdef inline double point_elevation(double s, double z) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Find the elevation angle, in degrees, of the beam which passes through a
  */
-      __pyx_t_6 = (__pyx_v_z_max + 1);
-      for (__pyx_t_7 = __pyx_v_z_min; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
-        __pyx_v_zi = __pyx_t_7;
 
-        /* "pyart/map/_gate_to_grid_map.pyx":354
- *             for yi in range(y_min, y_max+1):
- *                 for zi in range(z_min, z_max+1):
- *                     xg = self.x_step * xi             # <<<<<<<<<<<<<<
- *                     yg = self.y_step * yi
- *                     zg = self.z_step * zi
- */
-        __pyx_v_xg = (__pyx_v_self->x_step * __pyx_v_xi);
+static CYTHON_INLINE double __pyx_f_5pyart_3map_17_gate_to_grid_map_point_elevation(double __pyx_v_s, double __pyx_v_z) {
+  double __pyx_v_theta;
+  double __pyx_r;
 
-        /* "pyart/map/_gate_to_grid_map.pyx":355
- *                 for zi in range(z_min, z_max+1):
- *                     xg = self.x_step * xi
- *                     yg = self.y_step * yi             # <<<<<<<<<<<<<<
- *                     zg = self.z_step * zi
- *                     dist2 = (xg-x)*(xg-x) + (yg-y)*(yg-y) + (zg-z)*(zg-z)
+  /* "pyart/map/_gate_to_grid_map.pyx":1001
+ *     """
+ *     cdef double theta
+ *     theta = s / R             # <<<<<<<<<<<<<<
+ *     return atan2((R + z) * cos(theta) - R, (R + z) * sin(theta)) * 180. / PI
+ * 
  */
-        __pyx_v_yg = (__pyx_v_self->y_step * __pyx_v_yi);
+  __pyx_v_theta = (__pyx_v_s / __pyx_v_5pyart_3map_17_gate_to_grid_map_R);
 
-        /* "pyart/map/_gate_to_grid_map.pyx":356
- *                     xg = self.x_step * xi
- *                     yg = self.y_step * yi
- *                     zg = self.z_step * zi             # <<<<<<<<<<<<<<
- *                     dist2 = (xg-x)*(xg-x) + (yg-y)*(yg-y) + (zg-z)*(zg-z)
+  /* "pyart/map/_gate_to_grid_map.pyx":1002
+ *     cdef double theta
+ *     theta = s / R
+ *     return atan2((R + z) * cos(theta) - R, (R + z) * sin(theta)) * 180. / PI             # <<<<<<<<<<<<<<
+ * 
  * 
  */
-        __pyx_v_zg = (__pyx_v_self->z_step * __pyx_v_zi);
+  __pyx_r = ((atan2((((__pyx_v_5pyart_3map_17_gate_to_grid_map_R + __pyx_v_z) * cos(__pyx_v_theta)) - __pyx_v_5pyart_3map_17_gate_to_grid_map_R), ((__pyx_v_5pyart_3map_17_gate_to_grid_map_R + __pyx_v_z) * sin(__pyx_v_theta))) * 180.) / __pyx_v_5pyart_3map_17_gate_to_grid_map_PI);
+  goto __pyx_L0;
 
-        /* "pyart/map/_gate_to_grid_map.pyx":357
- *                     yg = self.y_step * yi
- *                     zg = self.z_step * zi
- *                     dist2 = (xg-x)*(xg-x) + (yg-y)*(yg-y) + (zg-z)*(zg-z)             # <<<<<<<<<<<<<<
+  /* "pyart/map/_gate_to_grid_map.pyx":994
  * 
- *                     if dist2 > roi2:
+ * @cython.cdivision(True)
+ * cdef inline double point_elevation(double s, double z) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     Find the elevation angle, in degrees, of the beam which passes through a
  */
-        __pyx_v_dist2 = ((((__pyx_v_xg - __pyx_v_x) * (__pyx_v_xg - __pyx_v_x)) + ((__pyx_v_yg - __pyx_v_y) * (__pyx_v_yg - __pyx_v_y))) + ((__pyx_v_zg - __pyx_v_z) * (__pyx_v_zg - __pyx_v_z)));
 
-        /* "pyart/map/_gate_to_grid_map.pyx":359
- *                     dist2 = (xg-x)*(xg-x) + (yg-y)*(yg-y) + (zg-z)*(zg-z)
- * 
- *                     if dist2 > roi2:             # <<<<<<<<<<<<<<
- *                         continue
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "pyart/map/_gate_to_grid_map.pyx":1006
  * 
+ * @cython.cdivision(True)
+ * cdef inline void lattice_position(             # <<<<<<<<<<<<<<
+ *         float coord, float start, float step, int npoints, int *index,
+ *         float *frac) nogil:
  */
-        __pyx_t_1 = ((__pyx_v_dist2 > __pyx_v_roi2) != 0);
-        if (__pyx_t_1) {
 
-          /* "pyart/map/_gate_to_grid_map.pyx":360
- * 
- *                     if dist2 > roi2:
- *                         continue             # <<<<<<<<<<<<<<
- * 
- *                     if weighting_function == BARNES:
+static CYTHON_INLINE void __pyx_f_5pyart_3map_17_gate_to_grid_map_lattice_position(float __pyx_v_coord, float __pyx_v_start, float __pyx_v_step, int __pyx_v_npoints, int *__pyx_v_index, float *__pyx_v_frac) {
+  float __pyx_v_pos;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":1014
+ *     """
+ *     cdef float pos
+ *     index[0] = 0             # <<<<<<<<<<<<<<
+ *     frac[0] = 0.
+ *     if npoints == 1 or step == 0:
+ */
+  (__pyx_v_index[0]) = 0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":1015
+ *     cdef float pos
+ *     index[0] = 0
+ *     frac[0] = 0.             # <<<<<<<<<<<<<<
+ *     if npoints == 1 or step == 0:
+ *         return
  */
-          goto __pyx_L13_continue;
-        }
+  (__pyx_v_frac[0]) = 0.;
 
-        /* "pyart/map/_gate_to_grid_map.pyx":362
- *                         continue
- * 
- *                     if weighting_function == BARNES:             # <<<<<<<<<<<<<<
- *                         weight = exp(-(dist2) / (2*roi2)) + 1e-5
- *                     else:   # CRESSMAN
+  /* "pyart/map/_gate_to_grid_map.pyx":1016
+ *     index[0] = 0
+ *     frac[0] = 0.
+ *     if npoints == 1 or step == 0:             # <<<<<<<<<<<<<<
+ *         return
+ *     pos = (coord - start) / step
  */
-        __pyx_t_1 = ((__pyx_v_weighting_function == __pyx_v_5pyart_3map_17_gate_to_grid_map_BARNES) != 0);
-        if (__pyx_t_1) {
+  __pyx_t_2 = ((__pyx_v_npoints == 1) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_step == 0.0) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
 
-          /* "pyart/map/_gate_to_grid_map.pyx":363
- * 
- *                     if weighting_function == BARNES:
- *                         weight = exp(-(dist2) / (2*roi2)) + 1e-5             # <<<<<<<<<<<<<<
- *                     else:   # CRESSMAN
- *                         weight = (roi2 - dist2) / (roi2 + dist2)
+    /* "pyart/map/_gate_to_grid_map.pyx":1017
+ *     frac[0] = 0.
+ *     if npoints == 1 or step == 0:
+ *         return             # <<<<<<<<<<<<<<
+ *     pos = (coord - start) / step
+ *     if pos <= 0:
  */
-          __pyx_v_weight = (exp(((-__pyx_v_dist2) / (2.0 * __pyx_v_roi2))) + 1e-5);
-          goto __pyx_L16;
-        }
-        /*else*/ {
+    goto __pyx_L0;
+  }
 
-          /* "pyart/map/_gate_to_grid_map.pyx":365
- *                         weight = exp(-(dist2) / (2*roi2)) + 1e-5
- *                     else:   # CRESSMAN
- *                         weight = (roi2 - dist2) / (roi2 + dist2)             # <<<<<<<<<<<<<<
- *                     for i in range(self.nfields):
- *                         if masks[i]:
+  /* "pyart/map/_gate_to_grid_map.pyx":1018
+ *     if npoints == 1 or step == 0:
+ *         return
+ *     pos = (coord - start) / step             # <<<<<<<<<<<<<<
+ *     if pos <= 0:
+ *         return
  */
-          __pyx_v_weight = ((__pyx_v_roi2 - __pyx_v_dist2) / (__pyx_v_roi2 + __pyx_v_dist2));
-        }
-        __pyx_L16:;
+  __pyx_v_pos = ((__pyx_v_coord - __pyx_v_start) / __pyx_v_step);
 
-        /* "pyart/map/_gate_to_grid_map.pyx":366
- *                     else:   # CRESSMAN
- *                         weight = (roi2 - dist2) / (roi2 + dist2)
- *                     for i in range(self.nfields):             # <<<<<<<<<<<<<<
- *                         if masks[i]:
- *                             continue
+  /* "pyart/map/_gate_to_grid_map.pyx":1019
+ *         return
+ *     pos = (coord - start) / step
+ *     if pos <= 0:             # <<<<<<<<<<<<<<
+ *         return
+ *     if pos >= npoints - 1:
  */
-        __pyx_t_8 = __pyx_v_self->nfields;
-        for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
-          __pyx_v_i = __pyx_t_9;
+  __pyx_t_1 = ((__pyx_v_pos <= 0.0) != 0);
+  if (__pyx_t_1) {
+
+    /* "pyart/map/_gate_to_grid_map.pyx":1020
+ *     pos = (coord - start) / step
+ *     if pos <= 0:
+ *         return             # <<<<<<<<<<<<<<
+ *     if pos >= npoints - 1:
+ *         index[0] = npoints - 1
+ */
+    goto __pyx_L0;
+  }
 
-          /* "pyart/map/_gate_to_grid_map.pyx":367
- *                         weight = (roi2 - dist2) / (roi2 + dist2)
- *                     for i in range(self.nfields):
- *                         if masks[i]:             # <<<<<<<<<<<<<<
- *                             continue
- *                         self.grid_sum[zi, yi, xi, i] += weight * values[i]
+  /* "pyart/map/_gate_to_grid_map.pyx":1021
+ *     if pos <= 0:
+ *         return
+ *     if pos >= npoints - 1:             # <<<<<<<<<<<<<<
+ *         index[0] = npoints - 1
+ *         return
  */
-          __pyx_t_10 = __pyx_v_i;
-          __pyx_t_1 = ((*((char *) ( /* dim=0 */ (__pyx_v_masks.data + __pyx_t_10 * __pyx_v_masks.strides[0]) ))) != 0);
-          if (__pyx_t_1) {
+  __pyx_t_1 = ((__pyx_v_pos >= (__pyx_v_npoints - 1)) != 0);
+  if (__pyx_t_1) {
 
-            /* "pyart/map/_gate_to_grid_map.pyx":368
- *                     for i in range(self.nfields):
- *                         if masks[i]:
- *                             continue             # <<<<<<<<<<<<<<
- *                         self.grid_sum[zi, yi, xi, i] += weight * values[i]
- *                         self.grid_wsum[zi, yi, xi, i] += weight
+    /* "pyart/map/_gate_to_grid_map.pyx":1022
+ *         return
+ *     if pos >= npoints - 1:
+ *         index[0] = npoints - 1             # <<<<<<<<<<<<<<
+ *         return
+ *     index[0] = <int>floor(pos)
  */
-            goto __pyx_L17_continue;
-          }
+    (__pyx_v_index[0]) = (__pyx_v_npoints - 1);
 
-          /* "pyart/map/_gate_to_grid_map.pyx":369
- *                         if masks[i]:
- *                             continue
- *                         self.grid_sum[zi, yi, xi, i] += weight * values[i]             # <<<<<<<<<<<<<<
- *                         self.grid_wsum[zi, yi, xi, i] += weight
- *         return 1
+    /* "pyart/map/_gate_to_grid_map.pyx":1023
+ *     if pos >= npoints - 1:
+ *         index[0] = npoints - 1
+ *         return             # <<<<<<<<<<<<<<
+ *     index[0] = <int>floor(pos)
+ *     frac[0] = pos - index[0]
  */
-          __pyx_t_11 = __pyx_v_i;
-          __pyx_t_12 = __pyx_v_zi;
-          __pyx_t_13 = __pyx_v_yi;
-          __pyx_t_14 = __pyx_v_xi;
-          __pyx_t_15 = __pyx_v_i;
-          *((float *) ( /* dim=3 */ ((char *) (((float *) ( /* dim=2 */ (( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->grid_sum.data + __pyx_t_12 * __pyx_v_self->grid_sum.strides[0]) ) + __pyx_t_13 * __pyx_v_self->grid_sum.strides[1]) ) + __pyx_t_14 * __pyx_v_self->grid_sum.strides[2]) )) + __pyx_t_15)) )) += (__pyx_v_weight * (*((float *) ( /* dim=0 */ (__pyx_v_values.data + __pyx_t_11 * __pyx_v_values.strides[0]) ))));
+    goto __pyx_L0;
+  }
 
-          /* "pyart/map/_gate_to_grid_map.pyx":370
- *                             continue
- *                         self.grid_sum[zi, yi, xi, i] += weight * values[i]
- *                         self.grid_wsum[zi, yi, xi, i] += weight             # <<<<<<<<<<<<<<
- *         return 1
+  /* "pyart/map/_gate_to_grid_map.pyx":1024
+ *         index[0] = npoints - 1
+ *         return
+ *     index[0] = <int>floor(pos)             # <<<<<<<<<<<<<<
+ *     frac[0] = pos - index[0]
  * 
  */
-          __pyx_t_16 = __pyx_v_zi;
-          __pyx_t_17 = __pyx_v_yi;
-          __pyx_t_18 = __pyx_v_xi;
-          __pyx_t_19 = __pyx_v_i;
-          *((float *) ( /* dim=3 */ ((char *) (((float *) ( /* dim=2 */ (( /* dim=1 */ (( /* dim=0 */ (__pyx_v_self->grid_wsum.data + __pyx_t_16 * __pyx_v_self->grid_wsum.strides[0]) ) + __pyx_t_17 * __pyx_v_self->grid_wsum.strides[1]) ) + __pyx_t_18 * __pyx_v_self->grid_wsum.strides[2]) )) + __pyx_t_19)) )) += __pyx_v_weight;
-          __pyx_L17_continue:;
-        }
-        __pyx_L13_continue:;
-      }
-    }
-  }
+  (__pyx_v_index[0]) = ((int)floor(__pyx_v_pos));
 
-  /* "pyart/map/_gate_to_grid_map.pyx":371
- *                         self.grid_sum[zi, yi, xi, i] += weight * values[i]
- *                         self.grid_wsum[zi, yi, xi, i] += weight
- *         return 1             # <<<<<<<<<<<<<<
+  /* "pyart/map/_gate_to_grid_map.pyx":1025
+ *         return
+ *     index[0] = <int>floor(pos)
+ *     frac[0] = pos - index[0]             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_r = 1;
-  goto __pyx_L0;
+  (__pyx_v_frac[0]) = (__pyx_v_pos - (__pyx_v_index[0]));
 
-  /* "pyart/map/_gate_to_grid_map.pyx":315
- *     @cython.boundscheck(False)
- *     @cython.wraparound(False)
- *     cdef int map_gate(self, float x, float y, float z, float roi,             # <<<<<<<<<<<<<<
- *                       float[:] values, char[:] masks,
- *                       int weighting_function):
+  /* "pyart/map/_gate_to_grid_map.pyx":1006
+ * 
+ * @cython.cdivision(True)
+ * cdef inline void lattice_position(             # <<<<<<<<<<<<<<
+ *         float coord, float start, float step, int npoints, int *index,
+ *         float *frac) nogil:
  */
 
   /* function exit code */
   __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
 }
 
-/* "pyart/map/_gate_to_grid_map.pyx":375
+/* "pyart/map/_gate_to_grid_map.pyx":1029
  * 
  * @cython.cdivision(True)
- * cdef int find_min(float a, float roi, float step):             # <<<<<<<<<<<<<<
+ * cdef int find_min(float a, float roi, float step) nogil:             # <<<<<<<<<<<<<<
  *     """ Find the mimumum gate index for a dimension. """
  *     cdef int a_min
  */
@@ -5317,11 +10793,9 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_map_gate(s
 static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(float __pyx_v_a, float __pyx_v_roi, float __pyx_v_step) {
   int __pyx_v_a_min;
   int __pyx_r;
-  __Pyx_RefNannyDeclarations
   int __pyx_t_1;
-  __Pyx_RefNannySetupContext("find_min", 0);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":378
+  /* "pyart/map/_gate_to_grid_map.pyx":1032
  *     """ Find the mimumum gate index for a dimension. """
  *     cdef int a_min
  *     if step == 0:             # <<<<<<<<<<<<<<
@@ -5331,7 +10805,7 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(float __pyx_v_a, flo
   __pyx_t_1 = ((__pyx_v_step == 0.0) != 0);
   if (__pyx_t_1) {
 
-    /* "pyart/map/_gate_to_grid_map.pyx":379
+    /* "pyart/map/_gate_to_grid_map.pyx":1033
  *     cdef int a_min
  *     if step == 0:
  *         return 0             # <<<<<<<<<<<<<<
@@ -5342,7 +10816,7 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(float __pyx_v_a, flo
     goto __pyx_L0;
   }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":380
+  /* "pyart/map/_gate_to_grid_map.pyx":1034
  *     if step == 0:
  *         return 0
  *     a_min = <int>ceil((a - roi) / step)             # <<<<<<<<<<<<<<
@@ -5351,7 +10825,7 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(float __pyx_v_a, flo
  */
   __pyx_v_a_min = ((int)ceil(((__pyx_v_a - __pyx_v_roi) / __pyx_v_step)));
 
-  /* "pyart/map/_gate_to_grid_map.pyx":381
+  /* "pyart/map/_gate_to_grid_map.pyx":1035
  *         return 0
  *     a_min = <int>ceil((a - roi) / step)
  *     if a_min < 0:             # <<<<<<<<<<<<<<
@@ -5361,7 +10835,7 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(float __pyx_v_a, flo
   __pyx_t_1 = ((__pyx_v_a_min < 0) != 0);
   if (__pyx_t_1) {
 
-    /* "pyart/map/_gate_to_grid_map.pyx":382
+    /* "pyart/map/_gate_to_grid_map.pyx":1036
  *     a_min = <int>ceil((a - roi) / step)
  *     if a_min < 0:
  *         a_min = 0             # <<<<<<<<<<<<<<
@@ -5373,7 +10847,7 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(float __pyx_v_a, flo
   }
   __pyx_L4:;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":383
+  /* "pyart/map/_gate_to_grid_map.pyx":1037
  *     if a_min < 0:
  *         a_min = 0
  *     return a_min             # <<<<<<<<<<<<<<
@@ -5383,24 +10857,23 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(float __pyx_v_a, flo
   __pyx_r = __pyx_v_a_min;
   goto __pyx_L0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":375
+  /* "pyart/map/_gate_to_grid_map.pyx":1029
  * 
  * @cython.cdivision(True)
- * cdef int find_min(float a, float roi, float step):             # <<<<<<<<<<<<<<
+ * cdef int find_min(float a, float roi, float step) nogil:             # <<<<<<<<<<<<<<
  *     """ Find the mimumum gate index for a dimension. """
  *     cdef int a_min
  */
 
   /* function exit code */
   __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "pyart/map/_gate_to_grid_map.pyx":387
+/* "pyart/map/_gate_to_grid_map.pyx":1041
  * 
  * @cython.cdivision(True)
- * cdef int find_max(float a, float roi, float step, int na):             # <<<<<<<<<<<<<<
+ * cdef int find_max(float a, float roi, float step, int na) nogil:             # <<<<<<<<<<<<<<
  *     """ Find the maximum gate index for a dimension. """
  *     cdef int a_max
  */
@@ -5408,11 +10881,9 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_min(float __pyx_v_a, flo
 static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(float __pyx_v_a, float __pyx_v_roi, float __pyx_v_step, int __pyx_v_na) {
   int __pyx_v_a_max;
   int __pyx_r;
-  __Pyx_RefNannyDeclarations
   int __pyx_t_1;
-  __Pyx_RefNannySetupContext("find_max", 0);
 
-  /* "pyart/map/_gate_to_grid_map.pyx":390
+  /* "pyart/map/_gate_to_grid_map.pyx":1044
  *     """ Find the maximum gate index for a dimension. """
  *     cdef int a_max
  *     if step == 0:             # <<<<<<<<<<<<<<
@@ -5422,7 +10893,7 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(float __pyx_v_a, flo
   __pyx_t_1 = ((__pyx_v_step == 0.0) != 0);
   if (__pyx_t_1) {
 
-    /* "pyart/map/_gate_to_grid_map.pyx":391
+    /* "pyart/map/_gate_to_grid_map.pyx":1045
  *     cdef int a_max
  *     if step == 0:
  *         return 0             # <<<<<<<<<<<<<<
@@ -5433,7 +10904,7 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(float __pyx_v_a, flo
     goto __pyx_L0;
   }
 
-  /* "pyart/map/_gate_to_grid_map.pyx":392
+  /* "pyart/map/_gate_to_grid_map.pyx":1046
  *     if step == 0:
  *         return 0
  *     a_max = <int>floor((a + roi) / step)             # <<<<<<<<<<<<<<
@@ -5442,7 +10913,7 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(float __pyx_v_a, flo
  */
   __pyx_v_a_max = ((int)floor(((__pyx_v_a + __pyx_v_roi) / __pyx_v_step)));
 
-  /* "pyart/map/_gate_to_grid_map.pyx":393
+  /* "pyart/map/_gate_to_grid_map.pyx":1047
  *         return 0
  *     a_max = <int>floor((a + roi) / step)
  *     if a_max > na-1:             # <<<<<<<<<<<<<<
@@ -5452,7 +10923,7 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(float __pyx_v_a, flo
   __pyx_t_1 = ((__pyx_v_a_max > (__pyx_v_na - 1)) != 0);
   if (__pyx_t_1) {
 
-    /* "pyart/map/_gate_to_grid_map.pyx":394
+    /* "pyart/map/_gate_to_grid_map.pyx":1048
  *     a_max = <int>floor((a + roi) / step)
  *     if a_max > na-1:
  *         a_max = na-1             # <<<<<<<<<<<<<<
@@ -5463,7 +10934,7 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(float __pyx_v_a, flo
   }
   __pyx_L4:;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":395
+  /* "pyart/map/_gate_to_grid_map.pyx":1049
  *     if a_max > na-1:
  *         a_max = na-1
  *     return a_max             # <<<<<<<<<<<<<<
@@ -5471,17 +10942,16 @@ static int __pyx_f_5pyart_3map_17_gate_to_grid_map_find_max(float __pyx_v_a, flo
   __pyx_r = __pyx_v_a_max;
   goto __pyx_L0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":387
+  /* "pyart/map/_gate_to_grid_map.pyx":1041
  * 
  * @cython.cdivision(True)
- * cdef int find_max(float a, float roi, float step, int na):             # <<<<<<<<<<<<<<
+ * cdef int find_max(float a, float roi, float step, int na) nogil:             # <<<<<<<<<<<<<<
  *     """ Find the maximum gate index for a dimension. """
  *     cdef int a_max
  */
 
   /* function exit code */
   __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
@@ -16220,7 +21690,6 @@ static PyObject *__pyx_tp_new_5pyart_3map_17_gate_to_grid_map_ConstantRoI(PyType
 }
 
 static PyMethodDef __pyx_methods_5pyart_3map_17_gate_to_grid_map_ConstantRoI[] = {
-  {"get_roi", (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_3get_roi, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_2get_roi},
   {0, 0, 0, 0}
 };
 
@@ -16305,7 +21774,6 @@ static void __pyx_tp_dealloc_5pyart_3map_17_gate_to_grid_map_DistRoI(PyObject *o
 }
 
 static PyMethodDef __pyx_methods_5pyart_3map_17_gate_to_grid_map_DistRoI[] = {
-  {"get_roi", (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_7DistRoI_3get_roi, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5pyart_3map_17_gate_to_grid_map_7DistRoI_2get_roi},
   {0, 0, 0, 0}
 };
 
@@ -16390,7 +21858,6 @@ static void __pyx_tp_dealloc_5pyart_3map_17_gate_to_grid_map_DistBeamRoI(PyObjec
 }
 
 static PyMethodDef __pyx_methods_5pyart_3map_17_gate_to_grid_map_DistBeamRoI[] = {
-  {"get_roi", (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_3get_roi, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_2get_roi},
   {0, 0, 0, 0}
 };
 
@@ -16450,6 +21917,90 @@ static PyTypeObject __pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI = {
   0, /*tp_finalize*/
   #endif
 };
+static struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_LatticeRoI __pyx_vtable_5pyart_3map_17_gate_to_grid_map_LatticeRoI;
+
+static PyObject *__pyx_tp_new_5pyart_3map_17_gate_to_grid_map_LatticeRoI(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI *p;
+  PyObject *o = __pyx_tp_new_5pyart_3map_17_gate_to_grid_map_RoIFunction(t, a, k);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI *)o);
+  p->__pyx_base.__pyx_vtab = (struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_RoIFunction*)__pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_LatticeRoI;
+  p->roi_values.data = NULL;
+  p->roi_values.memview = NULL;
+  return o;
+}
+
+static void __pyx_tp_dealloc_5pyart_3map_17_gate_to_grid_map_LatticeRoI(PyObject *o) {
+  struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI *p = (struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI *)o;
+  #if PY_VERSION_HEX >= 0x030400a1
+  if (unlikely(Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  __PYX_XDEC_MEMVIEW(&p->roi_values, 1);
+  __pyx_tp_dealloc_5pyart_3map_17_gate_to_grid_map_RoIFunction(o);
+}
+
+static PyMethodDef __pyx_methods_5pyart_3map_17_gate_to_grid_map_LatticeRoI[] = {
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_5pyart_3map_17_gate_to_grid_map_LatticeRoI = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "pyart.map._gate_to_grid_map.LatticeRoI", /*tp_name*/
+  sizeof(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_LatticeRoI), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_5pyart_3map_17_gate_to_grid_map_LatticeRoI, /*tp_dealloc*/
+  0, /*tp_print*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #else
+  0, /*reserved*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "\n    Radius of influence interpolated from values on a regular lattice.\n\n    The radius at any location is found by trilinear interpolation between\n    the eight surrounding lattice points, locations outside of the lattice\n    take the value at the nearest edge.\n    ", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_5pyart_3map_17_gate_to_grid_map_LatticeRoI, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  __pyx_pw_5pyart_3map_17_gate_to_grid_map_10LatticeRoI_1__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_5pyart_3map_17_gate_to_grid_map_LatticeRoI, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+};
 static struct __pyx_vtabstruct_5pyart_3map_17_gate_to_grid_map_GateToGridMapper __pyx_vtable_5pyart_3map_17_gate_to_grid_map_GateToGridMapper;
 
 static PyObject *__pyx_tp_new_5pyart_3map_17_gate_to_grid_map_GateToGridMapper(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
@@ -16485,6 +22036,8 @@ static void __pyx_tp_dealloc_5pyart_3map_17_gate_to_grid_map_GateToGridMapper(Py
 static PyMethodDef __pyx_methods_5pyart_3map_17_gate_to_grid_map_GateToGridMapper[] = {
   {"find_roi_for_grid", (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_3find_roi_for_grid, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_2find_roi_for_grid},
   {"map_gates_to_grid", (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_5map_gates_to_grid, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_4map_gates_to_grid},
+  {"find_nearest_sweep", (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_7find_nearest_sweep, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_6find_nearest_sweep},
+  {"map_sweep_to_grid", (PyCFunction)__pyx_pw_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_9map_sweep_to_grid, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_8map_sweep_to_grid},
   {0, 0, 0, 0}
 };
 
@@ -17223,11 +22776,13 @@ static struct PyModuleDef __pyx_moduledef = {
 #endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_n_s_B, __pyx_k_B, sizeof(__pyx_k_B), 0, 0, 1, 1},
   {&__pyx_kp_s_Buffer_view_does_not_expose_stri, __pyx_k_Buffer_view_does_not_expose_stri, sizeof(__pyx_k_Buffer_view_does_not_expose_stri), 0, 0, 1, 0},
   {&__pyx_kp_s_Can_only_create_a_buffer_that_is, __pyx_k_Can_only_create_a_buffer_that_is, sizeof(__pyx_k_Can_only_create_a_buffer_that_is), 0, 0, 1, 0},
   {&__pyx_kp_s_Cannot_index_with_type_s, __pyx_k_Cannot_index_with_type_s, sizeof(__pyx_k_Cannot_index_with_type_s), 0, 0, 1, 0},
   {&__pyx_n_s_Ellipsis, __pyx_k_Ellipsis, sizeof(__pyx_k_Ellipsis), 0, 0, 1, 1},
   {&__pyx_kp_s_Empty_shape_tuple_for_cython_arr, __pyx_k_Empty_shape_tuple_for_cython_arr, sizeof(__pyx_k_Empty_shape_tuple_for_cython_arr), 0, 0, 1, 0},
+  {&__pyx_n_s_H, __pyx_k_H, sizeof(__pyx_k_H), 0, 0, 1, 1},
   {&__pyx_n_s_IndexError, __pyx_k_IndexError, sizeof(__pyx_k_IndexError), 0, 0, 1, 1},
   {&__pyx_kp_s_Indirect_dimensions_not_supporte, __pyx_k_Indirect_dimensions_not_supporte, sizeof(__pyx_k_Indirect_dimensions_not_supporte), 0, 0, 1, 0},
   {&__pyx_kp_s_Invalid_mode_expected_c_or_fortr, __pyx_k_Invalid_mode_expected_c_or_fortr, sizeof(__pyx_k_Invalid_mode_expected_c_or_fortr), 0, 0, 1, 0},
@@ -17240,17 +22795,24 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
   {&__pyx_kp_s_Unable_to_convert_item_to_object, __pyx_k_Unable_to_convert_item_to_object, sizeof(__pyx_k_Unable_to_convert_item_to_object), 0, 0, 1, 0},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_n_s_add_offsets, __pyx_k_add_offsets, sizeof(__pyx_k_add_offsets), 0, 0, 1, 1},
   {&__pyx_n_s_allocate_buffer, __pyx_k_allocate_buffer, sizeof(__pyx_k_allocate_buffer), 0, 0, 1, 1},
   {&__pyx_n_s_azimuths, __pyx_k_azimuths, sizeof(__pyx_k_azimuths), 0, 0, 1, 1},
+  {&__pyx_n_s_b, __pyx_k_b, sizeof(__pyx_k_b), 0, 0, 1, 1},
   {&__pyx_n_s_base, __pyx_k_base, sizeof(__pyx_k_base), 0, 0, 1, 1},
   {&__pyx_n_s_bsp, __pyx_k_bsp, sizeof(__pyx_k_bsp), 0, 0, 1, 1},
   {&__pyx_n_s_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 0, 1, 1},
   {&__pyx_n_u_c, __pyx_k_c, sizeof(__pyx_k_c), 0, 1, 0, 1},
+  {&__pyx_n_s_char, __pyx_k_char, sizeof(__pyx_k_char), 0, 0, 1, 1},
   {&__pyx_n_s_class, __pyx_k_class, sizeof(__pyx_k_class), 0, 0, 1, 1},
   {&__pyx_n_s_constant_roi, __pyx_k_constant_roi, sizeof(__pyx_k_constant_roi), 0, 0, 1, 1},
   {&__pyx_kp_s_contiguous_and_direct, __pyx_k_contiguous_and_direct, sizeof(__pyx_k_contiguous_and_direct), 0, 0, 1, 0},
   {&__pyx_kp_s_contiguous_and_indirect, __pyx_k_contiguous_and_indirect, sizeof(__pyx_k_contiguous_and_indirect), 0, 0, 1, 0},
+  {&__pyx_n_s_d, __pyx_k_d, sizeof(__pyx_k_d), 0, 0, 1, 1},
+  {&__pyx_n_s_dict, __pyx_k_dict, sizeof(__pyx_k_dict), 0, 0, 1, 1},
+  {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
   {&__pyx_n_s_dtype_is_object, __pyx_k_dtype_is_object, sizeof(__pyx_k_dtype_is_object), 0, 0, 1, 1},
+  {&__pyx_n_s_elevation, __pyx_k_elevation, sizeof(__pyx_k_elevation), 0, 0, 1, 1},
   {&__pyx_n_s_elevations, __pyx_k_elevations, sizeof(__pyx_k_elevations), 0, 0, 1, 1},
   {&__pyx_n_s_enumerate, __pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 0, 1, 1},
   {&__pyx_n_s_error, __pyx_k_error, sizeof(__pyx_k_error), 0, 0, 1, 1},
@@ -17258,10 +22820,13 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_f, __pyx_k_f, sizeof(__pyx_k_f), 0, 0, 1, 1},
   {&__pyx_n_s_field_data, __pyx_k_field_data, sizeof(__pyx_k_field_data), 0, 0, 1, 1},
   {&__pyx_n_s_field_mask, __pyx_k_field_mask, sizeof(__pyx_k_field_mask), 0, 0, 1, 1},
+  {&__pyx_n_s_find_gate_locations_and_roi, __pyx_k_find_gate_locations_and_roi, sizeof(__pyx_k_find_gate_locations_and_roi), 0, 0, 1, 1},
+  {&__pyx_n_s_find_roi_on_lattice, __pyx_k_find_roi_on_lattice, sizeof(__pyx_k_find_roi_on_lattice), 0, 0, 1, 1},
   {&__pyx_n_s_flags, __pyx_k_flags, sizeof(__pyx_k_flags), 0, 0, 1, 1},
   {&__pyx_n_s_format, __pyx_k_format, sizeof(__pyx_k_format), 0, 0, 1, 1},
   {&__pyx_n_s_fortran, __pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 0, 1, 1},
   {&__pyx_n_u_fortran, __pyx_k_fortran, sizeof(__pyx_k_fortran), 0, 1, 0, 1},
+  {&__pyx_n_s_gate_info, __pyx_k_gate_info, sizeof(__pyx_k_gate_info), 0, 0, 1, 1},
   {&__pyx_n_s_get_roi, __pyx_k_get_roi, sizeof(__pyx_k_get_roi), 0, 0, 1, 1},
   {&__pyx_kp_s_got_differing_extents_in_dimensi, __pyx_k_got_differing_extents_in_dimensi, sizeof(__pyx_k_got_differing_extents_in_dimensi), 0, 0, 1, 0},
   {&__pyx_n_s_grid_shape, __pyx_k_grid_shape, sizeof(__pyx_k_grid_shape), 0, 0, 1, 1},
@@ -17269,29 +22834,49 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_grid_steps, __pyx_k_grid_steps, sizeof(__pyx_k_grid_steps), 0, 0, 1, 1},
   {&__pyx_n_s_grid_sum, __pyx_k_grid_sum, sizeof(__pyx_k_grid_sum), 0, 0, 1, 1},
   {&__pyx_n_s_grid_wsum, __pyx_k_grid_wsum, sizeof(__pyx_k_grid_wsum), 0, 0, 1, 1},
+  {&__pyx_n_s_h, __pyx_k_h, sizeof(__pyx_k_h), 0, 0, 1, 1},
   {&__pyx_n_s_h_factor, __pyx_k_h_factor, sizeof(__pyx_k_h_factor), 0, 0, 1, 1},
   {&__pyx_n_s_id, __pyx_k_id, sizeof(__pyx_k_id), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_isweep, __pyx_k_isweep, sizeof(__pyx_k_isweep), 0, 0, 1, 1},
   {&__pyx_n_s_itemsize, __pyx_k_itemsize, sizeof(__pyx_k_itemsize), 0, 0, 1, 1},
   {&__pyx_kp_s_itemsize_0_for_cython_array, __pyx_k_itemsize_0_for_cython_array, sizeof(__pyx_k_itemsize_0_for_cython_array), 0, 0, 1, 0},
+  {&__pyx_n_s_ix, __pyx_k_ix, sizeof(__pyx_k_ix), 0, 0, 1, 1},
+  {&__pyx_n_s_iy, __pyx_k_iy, sizeof(__pyx_k_iy), 0, 0, 1, 1},
+  {&__pyx_n_s_iz, __pyx_k_iz, sizeof(__pyx_k_iz), 0, 0, 1, 1},
+  {&__pyx_n_s_lattice_starts, __pyx_k_lattice_starts, sizeof(__pyx_k_lattice_starts), 0, 0, 1, 1},
+  {&__pyx_n_s_lattice_steps, __pyx_k_lattice_steps, sizeof(__pyx_k_lattice_steps), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_max_azimuth_gap, __pyx_k_max_azimuth_gap, sizeof(__pyx_k_max_azimuth_gap), 0, 0, 1, 1},
   {&__pyx_n_s_memview, __pyx_k_memview, sizeof(__pyx_k_memview), 0, 0, 1, 1},
   {&__pyx_n_s_min_radius, __pyx_k_min_radius, sizeof(__pyx_k_min_radius), 0, 0, 1, 1},
   {&__pyx_n_s_mode, __pyx_k_mode, sizeof(__pyx_k_mode), 0, 0, 1, 1},
+  {&__pyx_n_s_mro, __pyx_k_mro, sizeof(__pyx_k_mro), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_name_2, __pyx_k_name_2, sizeof(__pyx_k_name_2), 0, 0, 1, 1},
   {&__pyx_n_s_nb, __pyx_k_nb, sizeof(__pyx_k_nb), 0, 0, 1, 1},
   {&__pyx_n_s_ndim, __pyx_k_ndim, sizeof(__pyx_k_ndim), 0, 0, 1, 1},
+  {&__pyx_n_s_nearest_sweep, __pyx_k_nearest_sweep, sizeof(__pyx_k_nearest_sweep), 0, 0, 1, 1},
+  {&__pyx_n_s_ngate, __pyx_k_ngate, sizeof(__pyx_k_ngate), 0, 0, 1, 1},
+  {&__pyx_n_s_nogil_roi, __pyx_k_nogil_roi, sizeof(__pyx_k_nogil_roi), 0, 0, 1, 1},
+  {&__pyx_n_s_nray, __pyx_k_nray, sizeof(__pyx_k_nray), 0, 0, 1, 1},
+  {&__pyx_n_s_nrays, __pyx_k_nrays, sizeof(__pyx_k_nrays), 0, 0, 1, 1},
   {&__pyx_n_s_obj, __pyx_k_obj, sizeof(__pyx_k_obj), 0, 0, 1, 1},
   {&__pyx_n_s_offset, __pyx_k_offset, sizeof(__pyx_k_offset), 0, 0, 1, 1},
   {&__pyx_n_s_offsets, __pyx_k_offsets, sizeof(__pyx_k_offsets), 0, 0, 1, 1},
   {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
+  {&__pyx_n_s_pyart_map__gate_to_grid_map, __pyx_k_pyart_map__gate_to_grid_map, sizeof(__pyx_k_pyart_map__gate_to_grid_map), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_getbuffer, __pyx_k_pyx_getbuffer, sizeof(__pyx_k_pyx_getbuffer), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
   {&__pyx_n_s_ranges, __pyx_k_ranges, sizeof(__pyx_k_ranges), 0, 0, 1, 1},
+  {&__pyx_n_s_ray_end, __pyx_k_ray_end, sizeof(__pyx_k_ray_end), 0, 0, 1, 1},
+  {&__pyx_n_s_ray_start, __pyx_k_ray_start, sizeof(__pyx_k_ray_start), 0, 0, 1, 1},
   {&__pyx_n_s_roi_array, __pyx_k_roi_array, sizeof(__pyx_k_roi_array), 0, 0, 1, 1},
   {&__pyx_n_s_roi_func, __pyx_k_roi_func, sizeof(__pyx_k_roi_func), 0, 0, 1, 1},
+  {&__pyx_n_s_roi_values, __pyx_k_roi_values, sizeof(__pyx_k_roi_values), 0, 0, 1, 1},
+  {&__pyx_kp_s_root_package_pyart_map__gate_to, __pyx_k_root_package_pyart_map__gate_to, sizeof(__pyx_k_root_package_pyart_map__gate_to), 0, 0, 1, 0},
+  {&__pyx_n_s_scale_factors, __pyx_k_scale_factors, sizeof(__pyx_k_scale_factors), 0, 0, 1, 1},
   {&__pyx_n_s_shape, __pyx_k_shape, sizeof(__pyx_k_shape), 0, 0, 1, 1},
   {&__pyx_n_s_size, __pyx_k_size, sizeof(__pyx_k_size), 0, 0, 1, 1},
   {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
@@ -17301,6 +22886,9 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_strided_and_direct_or_indirect, __pyx_k_strided_and_direct_or_indirect, sizeof(__pyx_k_strided_and_direct_or_indirect), 0, 0, 1, 0},
   {&__pyx_kp_s_strided_and_indirect, __pyx_k_strided_and_indirect, sizeof(__pyx_k_strided_and_indirect), 0, 0, 1, 0},
   {&__pyx_n_s_struct, __pyx_k_struct, sizeof(__pyx_k_struct), 0, 0, 1, 1},
+  {&__pyx_n_s_sweep_data, __pyx_k_sweep_data, sizeof(__pyx_k_sweep_data), 0, 0, 1, 1},
+  {&__pyx_n_s_sweep_elevations, __pyx_k_sweep_elevations, sizeof(__pyx_k_sweep_elevations), 0, 0, 1, 1},
+  {&__pyx_n_s_sweep_mask, __pyx_k_sweep_mask, sizeof(__pyx_k_sweep_mask), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_toa, __pyx_k_toa, sizeof(__pyx_k_toa), 0, 0, 1, 1},
   {&__pyx_kp_s_unable_to_allocate_array_data, __pyx_k_unable_to_allocate_array_data, sizeof(__pyx_k_unable_to_allocate_array_data), 0, 0, 1, 0},
@@ -17308,15 +22896,24 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_unpack, __pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 0, 1, 1},
   {&__pyx_n_s_weighting_function, __pyx_k_weighting_function, sizeof(__pyx_k_weighting_function), 0, 0, 1, 1},
   {&__pyx_n_s_x, __pyx_k_x, sizeof(__pyx_k_x), 0, 0, 1, 1},
+  {&__pyx_n_s_x_offset, __pyx_k_x_offset, sizeof(__pyx_k_x_offset), 0, 0, 1, 1},
+  {&__pyx_n_s_x_start, __pyx_k_x_start, sizeof(__pyx_k_x_start), 0, 0, 1, 1},
+  {&__pyx_n_s_x_step, __pyx_k_x_step, sizeof(__pyx_k_x_step), 0, 0, 1, 1},
   {&__pyx_n_s_xy_factor, __pyx_k_xy_factor, sizeof(__pyx_k_xy_factor), 0, 0, 1, 1},
   {&__pyx_n_s_y, __pyx_k_y, sizeof(__pyx_k_y), 0, 0, 1, 1},
+  {&__pyx_n_s_y_offset, __pyx_k_y_offset, sizeof(__pyx_k_y_offset), 0, 0, 1, 1},
+  {&__pyx_n_s_y_start, __pyx_k_y_start, sizeof(__pyx_k_y_start), 0, 0, 1, 1},
+  {&__pyx_n_s_y_step, __pyx_k_y_step, sizeof(__pyx_k_y_step), 0, 0, 1, 1},
   {&__pyx_n_s_z, __pyx_k_z, sizeof(__pyx_k_z), 0, 0, 1, 1},
   {&__pyx_n_s_z_factor, __pyx_k_z_factor, sizeof(__pyx_k_z_factor), 0, 0, 1, 1},
+  {&__pyx_n_s_z_offset, __pyx_k_z_offset, sizeof(__pyx_k_z_offset), 0, 0, 1, 1},
+  {&__pyx_n_s_z_start, __pyx_k_z_start, sizeof(__pyx_k_z_start), 0, 0, 1, 1},
+  {&__pyx_n_s_z_step, __pyx_k_z_step, sizeof(__pyx_k_z_step), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 84; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 127; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_builtin_Ellipsis = __Pyx_GetBuiltinName(__pyx_n_s_Ellipsis); if (!__pyx_builtin_Ellipsis) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
@@ -17467,6 +23064,30 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__12);
   __Pyx_GIVEREF(__pyx_tuple__12);
 
+  /* "pyart/map/_gate_to_grid_map.pyx":212
+ * 
+ * 
+ * def find_roi_on_lattice(             # <<<<<<<<<<<<<<
+ *         RoIFunction roi_func, tuple lattice_starts, tuple lattice_steps,
+ *         float[:, :, ::1] roi_array):
+ */
+  __pyx_tuple__13 = PyTuple_Pack(13, __pyx_n_s_roi_func, __pyx_n_s_lattice_starts, __pyx_n_s_lattice_steps, __pyx_n_s_roi_array, __pyx_n_s_ix, __pyx_n_s_iy, __pyx_n_s_iz, __pyx_n_s_z_start, __pyx_n_s_y_start, __pyx_n_s_x_start, __pyx_n_s_z_step, __pyx_n_s_y_step, __pyx_n_s_x_step); if (unlikely(!__pyx_tuple__13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(4, 0, 13, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_root_package_pyart_map__gate_to, __pyx_n_s_find_roi_on_lattice, 212, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pyart/map/_gate_to_grid_map.pyx":775
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def find_gate_locations_and_roi(             # <<<<<<<<<<<<<<
+ *         float[::1] elevations, float[::1] azimuths, float[::1] ranges,
+ *         offset, float toa, RoIFunction roi_func,
+ */
+  __pyx_tuple__15 = PyTuple_Pack(15, __pyx_n_s_elevations, __pyx_n_s_azimuths, __pyx_n_s_ranges, __pyx_n_s_offset, __pyx_n_s_toa, __pyx_n_s_roi_func, __pyx_n_s_gate_info, __pyx_n_s_nray, __pyx_n_s_ngate, __pyx_n_s_nrays, __pyx_n_s_x_offset, __pyx_n_s_y_offset, __pyx_n_s_z_offset, __pyx_n_s_nogil_roi, __pyx_n_s_excluded_gates); if (unlikely(!__pyx_tuple__15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(7, 0, 15, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_root_package_pyart_map__gate_to, __pyx_n_s_find_gate_locations_and_roi, 775, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
   /* "View.MemoryView":276
  *         return self.name
  * 
@@ -17474,9 +23095,9 @@ static int __Pyx_InitCachedConstants(void) {
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__13)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct_or_indirect); if (unlikely(!__pyx_tuple__17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
 
   /* "View.MemoryView":277
  * 
@@ -17485,9 +23106,9 @@ static int __Pyx_InitCachedConstants(void) {
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__14)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_strided_and_direct); if (unlikely(!__pyx_tuple__18)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
 
   /* "View.MemoryView":278
  * cdef generic = Enum("<strided and direct or indirect>")
@@ -17496,9 +23117,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__15)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_kp_s_strided_and_indirect); if (unlikely(!__pyx_tuple__19)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
 
   /* "View.MemoryView":281
  * 
@@ -17507,9 +23128,9 @@ static int __Pyx_InitCachedConstants(void) {
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__16)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_direct); if (unlikely(!__pyx_tuple__20)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
 
   /* "View.MemoryView":282
  * 
@@ -17518,9 +23139,9 @@ static int __Pyx_InitCachedConstants(void) {
  * 
  * 
  */
-  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__17)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__17);
-  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_tuple__21 = PyTuple_Pack(1, __pyx_kp_s_contiguous_and_indirect); if (unlikely(!__pyx_tuple__21)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__21);
+  __Pyx_GIVEREF(__pyx_tuple__21);
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -17534,6 +23155,7 @@ static int __Pyx_InitGlobals(void) {
   __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_int_4 = PyInt_FromLong(4); if (unlikely(!__pyx_int_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
   __pyx_L1_error:;
@@ -17627,20 +23249,21 @@ PyMODINIT_FUNC PyInit__gate_to_grid_map(void)
   /*--- Type init code ---*/
   __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_RoIFunction = &__pyx_vtable_5pyart_3map_17_gate_to_grid_map_RoIFunction;
   __pyx_vtable_5pyart_3map_17_gate_to_grid_map_RoIFunction.get_roi = (float (*)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, float, float, float, int __pyx_skip_dispatch))__pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_get_roi;
-  if (PyType_Ready(&__pyx_type_5pyart_3map_17_gate_to_grid_map_RoIFunction) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_vtable_5pyart_3map_17_gate_to_grid_map_RoIFunction.roi = (float (*)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, float, float, float))__pyx_f_5pyart_3map_17_gate_to_grid_map_11RoIFunction_roi;
+  if (PyType_Ready(&__pyx_type_5pyart_3map_17_gate_to_grid_map_RoIFunction) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_type_5pyart_3map_17_gate_to_grid_map_RoIFunction.tp_print = 0;
-  if (__Pyx_SetVtable(__pyx_type_5pyart_3map_17_gate_to_grid_map_RoIFunction.tp_dict, __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_RoIFunction) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttrString(__pyx_m, "RoIFunction", (PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_RoIFunction) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_5pyart_3map_17_gate_to_grid_map_RoIFunction.tp_dict, __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_RoIFunction) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttrString(__pyx_m, "RoIFunction", (PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_RoIFunction) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 39; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction = &__pyx_type_5pyart_3map_17_gate_to_grid_map_RoIFunction;
   __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_ConstantRoI = &__pyx_vtable_5pyart_3map_17_gate_to_grid_map_ConstantRoI;
   __pyx_vtable_5pyart_3map_17_gate_to_grid_map_ConstantRoI.__pyx_base = *__pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_RoIFunction;
-  __pyx_vtable_5pyart_3map_17_gate_to_grid_map_ConstantRoI.__pyx_base.get_roi = (float (*)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, float, float, float, int __pyx_skip_dispatch))__pyx_f_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_get_roi;
+  __pyx_vtable_5pyart_3map_17_gate_to_grid_map_ConstantRoI.__pyx_base.roi = (float (*)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, float, float, float))__pyx_f_5pyart_3map_17_gate_to_grid_map_11ConstantRoI_roi;
   __pyx_type_5pyart_3map_17_gate_to_grid_map_ConstantRoI.tp_base = __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction;
-  if (PyType_Ready(&__pyx_type_5pyart_3map_17_gate_to_grid_map_ConstantRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyType_Ready(&__pyx_type_5pyart_3map_17_gate_to_grid_map_ConstantRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_type_5pyart_3map_17_gate_to_grid_map_ConstantRoI.tp_print = 0;
   #if CYTHON_COMPILING_IN_CPYTHON
   {
-    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_ConstantRoI, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_ConstantRoI, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
       __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_11ConstantRoI___init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
       __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_11ConstantRoI___init__.doc = __pyx_doc_5pyart_3map_17_gate_to_grid_map_11ConstantRoI___init__;
@@ -17648,18 +23271,18 @@ PyMODINIT_FUNC PyInit__gate_to_grid_map(void)
     }
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_type_5pyart_3map_17_gate_to_grid_map_ConstantRoI.tp_dict, __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_ConstantRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttrString(__pyx_m, "ConstantRoI", (PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_ConstantRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_5pyart_3map_17_gate_to_grid_map_ConstantRoI.tp_dict, __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_ConstantRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttrString(__pyx_m, "ConstantRoI", (PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_ConstantRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 51; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_5pyart_3map_17_gate_to_grid_map_ConstantRoI = &__pyx_type_5pyart_3map_17_gate_to_grid_map_ConstantRoI;
   __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_DistRoI = &__pyx_vtable_5pyart_3map_17_gate_to_grid_map_DistRoI;
   __pyx_vtable_5pyart_3map_17_gate_to_grid_map_DistRoI.__pyx_base = *__pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_RoIFunction;
-  __pyx_vtable_5pyart_3map_17_gate_to_grid_map_DistRoI.__pyx_base.get_roi = (float (*)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, float, float, float, int __pyx_skip_dispatch))__pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_get_roi;
+  __pyx_vtable_5pyart_3map_17_gate_to_grid_map_DistRoI.__pyx_base.roi = (float (*)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, float, float, float))__pyx_f_5pyart_3map_17_gate_to_grid_map_7DistRoI_roi;
   __pyx_type_5pyart_3map_17_gate_to_grid_map_DistRoI.tp_base = __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction;
-  if (PyType_Ready(&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyType_Ready(&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_type_5pyart_3map_17_gate_to_grid_map_DistRoI.tp_print = 0;
   #if CYTHON_COMPILING_IN_CPYTHON
   {
-    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistRoI, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistRoI, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
       __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
       __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__.doc = __pyx_doc_5pyart_3map_17_gate_to_grid_map_7DistRoI___init__;
@@ -17667,18 +23290,18 @@ PyMODINIT_FUNC PyInit__gate_to_grid_map(void)
     }
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_type_5pyart_3map_17_gate_to_grid_map_DistRoI.tp_dict, __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_DistRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttrString(__pyx_m, "DistRoI", (PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 55; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_5pyart_3map_17_gate_to_grid_map_DistRoI.tp_dict, __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_DistRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttrString(__pyx_m, "DistRoI", (PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_5pyart_3map_17_gate_to_grid_map_DistRoI = &__pyx_type_5pyart_3map_17_gate_to_grid_map_DistRoI;
   __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_DistBeamRoI = &__pyx_vtable_5pyart_3map_17_gate_to_grid_map_DistBeamRoI;
   __pyx_vtable_5pyart_3map_17_gate_to_grid_map_DistBeamRoI.__pyx_base = *__pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_RoIFunction;
-  __pyx_vtable_5pyart_3map_17_gate_to_grid_map_DistBeamRoI.__pyx_base.get_roi = (float (*)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, float, float, float, int __pyx_skip_dispatch))__pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_get_roi;
+  __pyx_vtable_5pyart_3map_17_gate_to_grid_map_DistBeamRoI.__pyx_base.roi = (float (*)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, float, float, float))__pyx_f_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI_roi;
   __pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI.tp_base = __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction;
-  if (PyType_Ready(&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyType_Ready(&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI.tp_print = 0;
   #if CYTHON_COMPILING_IN_CPYTHON
   {
-    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
       __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
       __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__.doc = __pyx_doc_5pyart_3map_17_gate_to_grid_map_11DistBeamRoI___init__;
@@ -17686,16 +23309,35 @@ PyMODINIT_FUNC PyInit__gate_to_grid_map(void)
     }
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI.tp_dict, __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_DistBeamRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttrString(__pyx_m, "DistBeamRoI", (PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI.tp_dict, __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_DistBeamRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttrString(__pyx_m, "DistBeamRoI", (PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_5pyart_3map_17_gate_to_grid_map_DistBeamRoI = &__pyx_type_5pyart_3map_17_gate_to_grid_map_DistBeamRoI;
+  __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_LatticeRoI = &__pyx_vtable_5pyart_3map_17_gate_to_grid_map_LatticeRoI;
+  __pyx_vtable_5pyart_3map_17_gate_to_grid_map_LatticeRoI.__pyx_base = *__pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_RoIFunction;
+  __pyx_vtable_5pyart_3map_17_gate_to_grid_map_LatticeRoI.__pyx_base.roi = (float (*)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_RoIFunction *, float, float, float))__pyx_f_5pyart_3map_17_gate_to_grid_map_10LatticeRoI_roi;
+  __pyx_type_5pyart_3map_17_gate_to_grid_map_LatticeRoI.tp_base = __pyx_ptype_5pyart_3map_17_gate_to_grid_map_RoIFunction;
+  if (PyType_Ready(&__pyx_type_5pyart_3map_17_gate_to_grid_map_LatticeRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 160; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_type_5pyart_3map_17_gate_to_grid_map_LatticeRoI.tp_print = 0;
+  #if CYTHON_COMPILING_IN_CPYTHON
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_LatticeRoI, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 160; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
+      __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_10LatticeRoI___init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_10LatticeRoI___init__.doc = __pyx_doc_5pyart_3map_17_gate_to_grid_map_10LatticeRoI___init__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_10LatticeRoI___init__;
+    }
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_type_5pyart_3map_17_gate_to_grid_map_LatticeRoI.tp_dict, __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_LatticeRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 160; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttrString(__pyx_m, "LatticeRoI", (PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_LatticeRoI) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 160; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_ptype_5pyart_3map_17_gate_to_grid_map_LatticeRoI = &__pyx_type_5pyart_3map_17_gate_to_grid_map_LatticeRoI;
   __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_GateToGridMapper = &__pyx_vtable_5pyart_3map_17_gate_to_grid_map_GateToGridMapper;
   __pyx_vtable_5pyart_3map_17_gate_to_grid_map_GateToGridMapper.map_gate = (int (*)(struct __pyx_obj_5pyart_3map_17_gate_to_grid_map_GateToGridMapper *, float, float, float, float, __Pyx_memviewslice, __Pyx_memviewslice, int))__pyx_f_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper_map_gate;
-  if (PyType_Ready(&__pyx_type_5pyart_3map_17_gate_to_grid_map_GateToGridMapper) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyType_Ready(&__pyx_type_5pyart_3map_17_gate_to_grid_map_GateToGridMapper) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_type_5pyart_3map_17_gate_to_grid_map_GateToGridMapper.tp_print = 0;
   #if CYTHON_COMPILING_IN_CPYTHON
   {
-    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_GateToGridMapper, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_GateToGridMapper, "__init__"); if (unlikely(!wrapper)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
     if (Py_TYPE(wrapper) == &PyWrapperDescr_Type) {
       __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
       __pyx_wrapperbase_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__.doc = __pyx_doc_5pyart_3map_17_gate_to_grid_map_16GateToGridMapper___init__;
@@ -17703,8 +23345,8 @@ PyMODINIT_FUNC PyInit__gate_to_grid_map(void)
     }
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_type_5pyart_3map_17_gate_to_grid_map_GateToGridMapper.tp_dict, __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_GateToGridMapper) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttrString(__pyx_m, "GateToGridMapper", (PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_GateToGridMapper) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (__Pyx_SetVtable(__pyx_type_5pyart_3map_17_gate_to_grid_map_GateToGridMapper.tp_dict, __pyx_vtabptr_5pyart_3map_17_gate_to_grid_map_GateToGridMapper) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyObject_SetAttrString(__pyx_m, "GateToGridMapper", (PyObject *)&__pyx_type_5pyart_3map_17_gate_to_grid_map_GateToGridMapper) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 242; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_ptype_5pyart_3map_17_gate_to_grid_map_GateToGridMapper = &__pyx_type_5pyart_3map_17_gate_to_grid_map_GateToGridMapper;
   if (PyType_Ready(&__pyx_type___pyx_array) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 99; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_type___pyx_array.tp_print = 0;
@@ -17738,42 +23380,93 @@ PyMODINIT_FUNC PyInit__gate_to_grid_map(void)
   /*--- Function import code ---*/
   /*--- Execution code ---*/
 
-  /* "pyart/map/_gate_to_grid_map.pyx":26
+  /* "pyart/map/_gate_to_grid_map.pyx":29
  * 
  * # constants
  * cdef int BARNES = 0             # <<<<<<<<<<<<<<
  * cdef int CRESSMAN = 0
- * cdef float PI = 3.141592653589793
+ * cdef int NEAREST = 2
  */
   __pyx_v_5pyart_3map_17_gate_to_grid_map_BARNES = 0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":27
+  /* "pyart/map/_gate_to_grid_map.pyx":30
  * # constants
  * cdef int BARNES = 0
  * cdef int CRESSMAN = 0             # <<<<<<<<<<<<<<
- * cdef float PI = 3.141592653589793
- * cdef float R = 8494666.66666667   # 4/3 earths radius of 6371 km in meters
+ * cdef int NEAREST = 2
+ * cdef int BILINEAR = 3
  */
   __pyx_v_5pyart_3map_17_gate_to_grid_map_CRESSMAN = 0;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":28
+  /* "pyart/map/_gate_to_grid_map.pyx":31
  * cdef int BARNES = 0
  * cdef int CRESSMAN = 0
+ * cdef int NEAREST = 2             # <<<<<<<<<<<<<<
+ * cdef int BILINEAR = 3
+ * cdef float PI = 3.141592653589793
+ */
+  __pyx_v_5pyart_3map_17_gate_to_grid_map_NEAREST = 2;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":32
+ * cdef int CRESSMAN = 0
+ * cdef int NEAREST = 2
+ * cdef int BILINEAR = 3             # <<<<<<<<<<<<<<
+ * cdef float PI = 3.141592653589793
+ * cdef float R = 8494666.66666667   # 4/3 earths radius of 6371 km in meters
+ */
+  __pyx_v_5pyart_3map_17_gate_to_grid_map_BILINEAR = 3;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":33
+ * cdef int NEAREST = 2
+ * cdef int BILINEAR = 3
  * cdef float PI = 3.141592653589793             # <<<<<<<<<<<<<<
  * cdef float R = 8494666.66666667   # 4/3 earths radius of 6371 km in meters
- * 
+ * cdef int RAY_BLOCK_SIZE = 16      # rays loaded and located at once
  */
   __pyx_v_5pyart_3map_17_gate_to_grid_map_PI = 3.141592653589793;
 
-  /* "pyart/map/_gate_to_grid_map.pyx":29
- * cdef int CRESSMAN = 0
+  /* "pyart/map/_gate_to_grid_map.pyx":34
+ * cdef int BILINEAR = 3
  * cdef float PI = 3.141592653589793
  * cdef float R = 8494666.66666667   # 4/3 earths radius of 6371 km in meters             # <<<<<<<<<<<<<<
+ * cdef int RAY_BLOCK_SIZE = 16      # rays loaded and located at once
  * 
- * # This definition can be added to a .pxd file so others can defined fast
  */
   __pyx_v_5pyart_3map_17_gate_to_grid_map_R = 8494666.66666667;
 
+  /* "pyart/map/_gate_to_grid_map.pyx":35
+ * cdef float PI = 3.141592653589793
+ * cdef float R = 8494666.66666667   # 4/3 earths radius of 6371 km in meters
+ * cdef int RAY_BLOCK_SIZE = 16      # rays loaded and located at once             # <<<<<<<<<<<<<<
+ * 
+ * # This definition can be added to a .pxd file so others can defined fast
+ */
+  __pyx_v_5pyart_3map_17_gate_to_grid_map_RAY_BLOCK_SIZE = 16;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":212
+ * 
+ * 
+ * def find_roi_on_lattice(             # <<<<<<<<<<<<<<
+ *         RoIFunction roi_func, tuple lattice_starts, tuple lattice_steps,
+ *         float[:, :, ::1] roi_array):
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5pyart_3map_17_gate_to_grid_map_1find_roi_on_lattice, NULL, __pyx_n_s_pyart_map__gate_to_grid_map); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_find_roi_on_lattice, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "pyart/map/_gate_to_grid_map.pyx":775
+ * @cython.boundscheck(False)
+ * @cython.wraparound(False)
+ * def find_gate_locations_and_roi(             # <<<<<<<<<<<<<<
+ *         float[::1] elevations, float[::1] azimuths, float[::1] ranges,
+ *         offset, float toa, RoIFunction roi_func,
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5pyart_3map_17_gate_to_grid_map_3find_gate_locations_and_roi, NULL, __pyx_n_s_pyart_map__gate_to_grid_map); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_find_gate_locations_and_roi, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 775; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
   /* "pyart/map/_gate_to_grid_map.pyx":1
  * """             # <<<<<<<<<<<<<<
  * pyart.map._gate_to_grid_map
@@ -17804,7 +23497,7 @@ PyMODINIT_FUNC PyInit__gate_to_grid_map(void)
  * cdef strided = Enum("<strided and direct>") # default
  * cdef indirect = Enum("<strided and indirect>")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_MemviewEnum_type)), __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_MemviewEnum_type)), __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(generic);
   __Pyx_DECREF_SET(generic, __pyx_t_1);
@@ -17818,7 +23511,7 @@ PyMODINIT_FUNC PyInit__gate_to_grid_map(void)
  * cdef indirect = Enum("<strided and indirect>")
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_MemviewEnum_type)), __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_MemviewEnum_type)), __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 277; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(strided);
   __Pyx_DECREF_SET(strided, __pyx_t_1);
@@ -17832,7 +23525,7 @@ PyMODINIT_FUNC PyInit__gate_to_grid_map(void)
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_MemviewEnum_type)), __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_MemviewEnum_type)), __pyx_tuple__19, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(indirect);
   __Pyx_DECREF_SET(indirect, __pyx_t_1);
@@ -17846,7 +23539,7 @@ PyMODINIT_FUNC PyInit__gate_to_grid_map(void)
  * cdef indirect_contiguous = Enum("<contiguous and indirect>")
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_MemviewEnum_type)), __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_MemviewEnum_type)), __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 281; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(contiguous);
   __Pyx_DECREF_SET(contiguous, __pyx_t_1);
@@ -17860,7 +23553,7 @@ PyMODINIT_FUNC PyInit__gate_to_grid_map(void)
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_MemviewEnum_type)), __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __Pyx_PyObject_Call(((PyObject *)((PyObject *)__pyx_MemviewEnum_type)), __pyx_tuple__21, NULL); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 282; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_XGOTREF(indirect_contiguous);
   __Pyx_DECREF_SET(indirect_contiguous, __pyx_t_1);
@@ -18915,42 +24608,162 @@ static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
     } else {
         return __Pyx_IterFinish();
     }
-    return 0;
-}
-
-static void __Pyx_RaiseBufferIndexError(int axis) {
-  PyErr_Format(PyExc_IndexError,
-     "Out of bounds on buffer access (axis %d)", axis);
+    return 0;
+}
+
+static void __Pyx_RaiseBufferIndexError(int axis) {
+  PyErr_Format(PyExc_IndexError,
+     "Out of bounds on buffer access (axis %d)", axis);
+}
+
+static void __Pyx_RaiseArgumentTypeInvalid(const char* name, PyObject *obj, PyTypeObject *type) {
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+}
+static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
+    const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (none_allowed && obj == Py_None) return 1;
+    else if (exact) {
+        if (likely(Py_TYPE(obj) == type)) return 1;
+        #if PY_MAJOR_VERSION == 2
+        else if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(PyObject_TypeCheck(obj, type))) return 1;
+    }
+    __Pyx_RaiseArgumentTypeInvalid(name, obj, type);
+    return 0;
+}
+
+static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+}
+
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
 }
 
-static void __Pyx_RaiseArgumentTypeInvalid(const char* name, PyObject *obj, PyTypeObject *type) {
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-}
-static CYTHON_INLINE int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact)
-{
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
     }
-    if (none_allowed && obj == Py_None) return 1;
-    else if (exact) {
-        if (likely(Py_TYPE(obj) == type)) return 1;
-        #if PY_MAJOR_VERSION == 2
-        else if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
-        #endif
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
     }
-    else {
-        if (likely(PyObject_TypeCheck(obj, type))) return 1;
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
     }
-    __Pyx_RaiseArgumentTypeInvalid(name, obj, type);
-    return 0;
-}
-
-static CYTHON_INLINE void __Pyx_RaiseNoneNotIterableError(void) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
 }
 
 #if PY_MAJOR_VERSION < 3
@@ -19091,147 +24904,27 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
     }
     PyErr_SetObject(type, value);
     if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#else
-        PyThreadState *tstate = PyThreadState_GET();
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-#endif
-    }
-bad:
-    Py_XDECREF(owned_instance);
-    return;
-}
-#endif
-
-static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
-#if CYTHON_COMPILING_IN_PYPY
-    return PyObject_RichCompareBool(s1, s2, equals);
-#else
-    if (s1 == s2) {
-        return (equals == Py_EQ);
-    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
-        const char *ps1, *ps2;
-        Py_ssize_t length = PyBytes_GET_SIZE(s1);
-        if (length != PyBytes_GET_SIZE(s2))
-            return (equals == Py_NE);
-        ps1 = PyBytes_AS_STRING(s1);
-        ps2 = PyBytes_AS_STRING(s2);
-        if (ps1[0] != ps2[0]) {
-            return (equals == Py_NE);
-        } else if (length == 1) {
-            return (equals == Py_EQ);
-        } else {
-            int result = memcmp(ps1, ps2, (size_t)length);
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
-        }
-    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
-        return (equals == Py_NE);
-    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
-        return (equals == Py_NE);
-    } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
-    }
-#endif
-}
-
-static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
-#if CYTHON_COMPILING_IN_PYPY
-    return PyObject_RichCompareBool(s1, s2, equals);
-#else
-#if PY_MAJOR_VERSION < 3
-    PyObject* owned_ref = NULL;
-#endif
-    int s1_is_unicode, s2_is_unicode;
-    if (s1 == s2) {
-        goto return_eq;
-    }
-    s1_is_unicode = PyUnicode_CheckExact(s1);
-    s2_is_unicode = PyUnicode_CheckExact(s2);
-#if PY_MAJOR_VERSION < 3
-    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
-        owned_ref = PyUnicode_FromObject(s2);
-        if (unlikely(!owned_ref))
-            return -1;
-        s2 = owned_ref;
-        s2_is_unicode = 1;
-    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
-        owned_ref = PyUnicode_FromObject(s1);
-        if (unlikely(!owned_ref))
-            return -1;
-        s1 = owned_ref;
-        s1_is_unicode = 1;
-    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
-        return __Pyx_PyBytes_Equals(s1, s2, equals);
-    }
-#endif
-    if (s1_is_unicode & s2_is_unicode) {
-        Py_ssize_t length;
-        int kind;
-        void *data1, *data2;
-        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
-            return -1;
-        length = __Pyx_PyUnicode_GET_LENGTH(s1);
-        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
-            goto return_ne;
-        }
-        kind = __Pyx_PyUnicode_KIND(s1);
-        if (kind != __Pyx_PyUnicode_KIND(s2)) {
-            goto return_ne;
-        }
-        data1 = __Pyx_PyUnicode_DATA(s1);
-        data2 = __Pyx_PyUnicode_DATA(s2);
-        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
-            goto return_ne;
-        } else if (length == 1) {
-            goto return_eq;
-        } else {
-            int result = memcmp(data1, data2, (size_t)(length * kind));
-            #if PY_MAJOR_VERSION < 3
-            Py_XDECREF(owned_ref);
-            #endif
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
-        }
-    } else if ((s1 == Py_None) & s2_is_unicode) {
-        goto return_ne;
-    } else if ((s2 == Py_None) & s1_is_unicode) {
-        goto return_ne;
-    } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
-    }
-return_eq:
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(owned_ref);
-    #endif
-    return (equals == Py_EQ);
-return_ne:
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(owned_ref);
-    #endif
-    return (equals == Py_NE);
+#if CYTHON_COMPILING_IN_PYPY
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#else
+        PyThreadState *tstate = PyThreadState_GET();
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
 #endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
 }
+#endif
 
 static CYTHON_INLINE Py_ssize_t __Pyx_div_Py_ssize_t(Py_ssize_t a, Py_ssize_t b) {
     Py_ssize_t q = a / b;
@@ -19956,17 +25649,17 @@ no_fail:
     return retval;
 }
 
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_d_dc_float(PyObject *obj) {
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(PyObject *obj) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
-    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
     int retcode;
     if (obj == Py_None) {
         result.memview = (struct __pyx_memoryview_obj *) Py_None;
         return result;
     }
     retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
-                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 4,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 3,
                                                  &__Pyx_TypeInfo_float, stack,
                                                  &result, obj);
     if (unlikely(retcode == -1))
@@ -19978,17 +25671,17 @@ __pyx_fail:
     return result;
 }
 
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_float(PyObject *obj) {
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_d_dc_float(PyObject *obj) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
-    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
     int retcode;
     if (obj == Py_None) {
         result.memview = (struct __pyx_memoryview_obj *) Py_None;
         return result;
     }
     retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
-                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 3,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 4,
                                                  &__Pyx_TypeInfo_float, stack,
                                                  &result, obj);
     if (unlikely(retcode == -1))
@@ -20022,28 +25715,6 @@ __pyx_fail:
     return result;
 }
 
-static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_char(PyObject *obj) {
-    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
-    __Pyx_BufFmt_StackElem stack[1];
-    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
-    int retcode;
-    if (obj == Py_None) {
-        result.memview = (struct __pyx_memoryview_obj *) Py_None;
-        return result;
-    }
-    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
-                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 3,
-                                                 &__Pyx_TypeInfo_char, stack,
-                                                 &result, obj);
-    if (unlikely(retcode == -1))
-        goto __pyx_fail;
-    return result;
-__pyx_fail:
-    result.memview = NULL;
-    result.data = NULL;
-    return result;
-}
-
 static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_dc_char(PyObject *obj) {
     __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
     __Pyx_BufFmt_StackElem stack[1];
@@ -20192,6 +25863,50 @@ raise_neg_overflow:
     return (int) -1;
 }
 
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_int(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 3,
+                                                 &__Pyx_TypeInfo_int, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_d_d_dc_char(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_FOLLOW), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_CONTIG) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, __Pyx_IS_C_CONTIG,
+                                                 (PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE), 3,
+                                                 &__Pyx_TypeInfo_char, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     const int neg_one = (int) -1, const_zero = 0;
     const int is_unsigned = neg_one > const_zero;
@@ -20255,6 +25970,32 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
     }
 }
 
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_char(char value) {
+    const char neg_one = (char) -1, const_zero = 0;
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(char) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(char) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+        } else if (sizeof(char) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+        }
+    } else {
+        if (sizeof(char) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(char) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(char),
+                                     little, !is_unsigned);
+    }
+}
+
 static int
 __pyx_memviewslice_is_contig(const __Pyx_memviewslice *mvs,
                              char order, int ndim)
@@ -20695,6 +26436,160 @@ __pyx_fail:
     return result;
 }
 
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_char(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                 PyBUF_RECORDS, 2,
+                                                 &__Pyx_TypeInfo_char, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_double(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                 PyBUF_RECORDS, 2,
+                                                 &__Pyx_TypeInfo_double, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_signed_char(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                 PyBUF_RECORDS, 2,
+                                                 &__Pyx_TypeInfo_signed_char, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_char(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                 PyBUF_RECORDS, 2,
+                                                 &__Pyx_TypeInfo_unsigned_char, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_short(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                 PyBUF_RECORDS, 2,
+                                                 &__Pyx_TypeInfo_short, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_unsigned_short(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                 PyBUF_RECORDS, 2,
+                                                 &__Pyx_TypeInfo_unsigned_short, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
+static CYTHON_INLINE __Pyx_memviewslice __Pyx_PyObject_to_MemoryviewSlice_dsds_int(PyObject *obj) {
+    __Pyx_memviewslice result = { 0, 0, { 0 }, { 0 }, { 0 } };
+    __Pyx_BufFmt_StackElem stack[1];
+    int axes_specs[] = { (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED), (__Pyx_MEMVIEW_DIRECT | __Pyx_MEMVIEW_STRIDED) };
+    int retcode;
+    if (obj == Py_None) {
+        result.memview = (struct __pyx_memoryview_obj *) Py_None;
+        return result;
+    }
+    retcode = __Pyx_ValidateAndInit_memviewslice(axes_specs, 0,
+                                                 PyBUF_RECORDS, 2,
+                                                 &__Pyx_TypeInfo_int, stack,
+                                                 &result, obj);
+    if (unlikely(retcode == -1))
+        goto __pyx_fail;
+    return result;
+__pyx_fail:
+    result.memview = NULL;
+    result.data = NULL;
+    return result;
+}
+
 static int __Pyx_check_binary_version(void) {
     char ctversion[4], rtversion[4];
     PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
@@ -14,10 +14,13 @@ a uniform grid.
     ConstantRoI
     DistRoI
     DistBeamRoI
+    LatticeRoI
+    find_roi_on_lattice
 
 """
 
 from libc.math cimport sqrt, exp, ceil, floor, sin, cos, tan, asin
+from libc.math cimport atan2, fabs
 from cython.view cimport array as cvarray
 
 cimport cython
@@ -25,16 +28,23 @@ cimport cython
 # constants
 cdef int BARNES = 0
 cdef int CRESSMAN = 0
+cdef int NEAREST = 2
+cdef int BILINEAR = 3
 cdef float PI = 3.141592653589793
 cdef float R = 8494666.66666667   # 4/3 earths radius of 6371 km in meters
+cdef int RAY_BLOCK_SIZE = 16      # rays loaded and located at once
 
 # This definition can be added to a .pxd file so others can defined fast
-# RoI functions
+# RoI functions by implementing the roi method.
 cdef class RoIFunction:
     """ A class for storing radius of interest calculations. """
 
     cpdef float get_roi(self, float z, float y, float x):
         """ Return the radius of influence for coordinates in meters. """
+        return self.roi(z, y, x)
+
+    cdef float roi(self, float z, float y, float x) nogil:
+        """ Return the radius of influence without holding the GIL. """
         return 0
 
 
@@ -47,7 +57,7 @@ cdef class ConstantRoI(RoIFunction):
         """ intialize. """
         self.constant_roi = constant_roi
 
-    cpdef float get_roi(self, float z, float y, float x):
+    cdef float roi(self, float z, float y, float x) nogil:
         """ Return contstant radius of influence. """
         return self.constant_roi
 
@@ -80,7 +90,7 @@ cdef class DistRoI(RoIFunction):
     @cython.cdivision(True)
     @cython.boundscheck(False)
     @cython.wraparound(False)
-    cpdef float get_roi(self, float z, float y, float x):
+    cdef float roi(self, float z, float y, float x) nogil:
         """ Return the radius of influence for coordinates in meters. """
         cdef float min_roi, roi, z_offset, y_offset, x_offset
         cdef int i
@@ -128,7 +138,7 @@ cdef class DistBeamRoI(RoIFunction):
     @cython.cdivision(True)
     @cython.boundscheck(False)
     @cython.wraparound(False)
-    cpdef float get_roi(self, float z, float y, float x):
+    cdef float roi(self, float z, float y, float x) nogil:
         """ Return the radius of influence for coordinates in meters. """
 
         cdef float min_roi, roi, z_offset, y_offset, x_offset
@@ -147,6 +157,88 @@ cdef class DistBeamRoI(RoIFunction):
         return min_roi
 
 
+cdef class LatticeRoI(RoIFunction):
+    """
+    Radius of influence interpolated from values on a regular lattice.
+
+    The radius at any location is found by trilinear interpolation between
+    the eight surrounding lattice points, locations outside of the lattice
+    take the value at the nearest edge.
+    """
+
+    cdef float[:, :, ::1] roi_values
+    cdef float z_start, y_start, x_start
+    cdef float z_step, y_step, x_step
+    cdef int nz, ny, nx
+
+    def __init__(self, float[:, :, ::1] roi_values, tuple lattice_starts,
+                 tuple lattice_steps):
+        """ initalize. """
+        self.roi_values = roi_values
+        self.nz = roi_values.shape[0]
+        self.ny = roi_values.shape[1]
+        self.nx = roi_values.shape[2]
+        self.z_start, self.y_start, self.x_start = lattice_starts
+        self.z_step, self.y_step, self.x_step = lattice_steps
+
+    @cython.initializedcheck(False)
+    @cython.cdivision(True)
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef float roi(self, float z, float y, float x) nogil:
+        """ Return the radius of influence for coordinates in meters. """
+        cdef int z0, y0, x0, z1, y1, x1
+        cdef float zw, yw, xw, c00, c01, c10, c11
+
+        lattice_position(z, self.z_start, self.z_step, self.nz, &z0, &zw)
+        lattice_position(y, self.y_start, self.y_step, self.ny, &y0, &yw)
+        lattice_position(x, self.x_start, self.x_step, self.nx, &x0, &xw)
+        z1 = z0 + 1 if z0 + 1 < self.nz else z0
+        y1 = y0 + 1 if y0 + 1 < self.ny else y0
+        x1 = x0 + 1 if x0 + 1 < self.nx else x0
+
+        c00 = (self.roi_values[z0, y0, x0] * (1. - xw) +
+               self.roi_values[z0, y0, x1] * xw)
+        c01 = (self.roi_values[z0, y1, x0] * (1. - xw) +
+               self.roi_values[z0, y1, x1] * xw)
+        c10 = (self.roi_values[z1, y0, x0] * (1. - xw) +
+               self.roi_values[z1, y0, x1] * xw)
+        c11 = (self.roi_values[z1, y1, x0] * (1. - xw) +
+               self.roi_values[z1, y1, x1] * xw)
+        return ((c00 * (1. - yw) + c01 * yw) * (1. - zw) +
+                (c10 * (1. - yw) + c11 * yw) * zw)
+
+
+def find_roi_on_lattice(
+        RoIFunction roi_func, tuple lattice_starts, tuple lattice_steps,
+        float[:, :, ::1] roi_array):
+    """
+    Evaluate a radius of influence function on a regular lattice.
+
+    Parameters
+    ----------
+    roi_func : RoIFunction
+        Object whose get_roi method returns the radius of influence.
+    lattice_starts, lattice_steps : tuple of floats
+        Location of the first lattice point and the spacing between points,
+        in meters.  Dimensions are ordered as z, y, x.
+    roi_array : 3D float32 array
+        Array which will be filled by the radius of influence at each point
+        in the lattice.
+
+    """
+    cdef int ix, iy, iz
+    cdef float z_start, y_start, x_start, z_step, y_step, x_step
+    z_start, y_start, x_start = lattice_starts
+    z_step, y_step, x_step = lattice_steps
+    for iz in range(roi_array.shape[0]):
+        for iy in range(roi_array.shape[1]):
+            for ix in range(roi_array.shape[2]):
+                roi_array[iz, iy, ix] = roi_func.get_roi(
+                    z_start + z_step * iz, y_start + y_step * iy,
+                    x_start + x_step * ix)
+
+
 cdef class GateToGridMapper:
     """
     A class for efficient mapping of radar gates to a regular grid by
@@ -229,27 +321,45 @@ cdef class GateToGridMapper:
     @cython.wraparound(False)
     def map_gates_to_grid(
             self, float[::1] elevations, float[::1] azimuths,
-            float[::1] ranges, float[:, :, ::1] field_data,
-            char[:, :, ::1] field_mask, char[:, ::1] excluded_gates,
-            offset, float toa, RoIFunction roi_func, int weighting_function):
+            float[::1] ranges, list field_data, list field_mask,
+            float[::1] scale_factors, float[::1] add_offsets,
+            char[:, ::1] excluded_gates, offset, float toa,
+            RoIFunction roi_func, int weighting_function,
+            int ray_start=0, int ray_end=-1):
         """
         Map radar gates unto the regular grid.
 
         The grid_sum and grid_wsum arrays used to initalize the class
         are update with the mapped gate data.
 
+        The field data is read in place a block of rays at a time, no copy
+        of the radar fields is made.  The location and radius of influence
+        of each gate are found once and the gates are mapped onto the grid
+        with the GIL released, only the buffer acquisition of the field
+        data and any RoIFunction whose get_roi method is implemented in
+        Python require the GIL.  Separate instances of this class, each
+        with their own grid_sum and grid_wsum arrays, can therefore map
+        different rays from a radar concurrently in multiple threads.
+
         Parameters
         ----------
         elevations, azimuths : 1D float32 array
             Elevation and azimuth angles in degrees for each ray in the radar.
         ranges : 1D float32 array
             Gate ranges in meters for each bin in the radar.
-        field_data : 3D float32 array
-            Array containing field data for the radar, dimension are ordered
-            as nrays, ngates, nfields.
-        field_mask : 3D uint8 array
-            Array containing masking of the field data for the radar,
-            dimension are ordered as nrays, ngates, nfields.
+        field_data : list of 2D arrays
+            Field data for each field to map, dimensions are ordered as
+            nrays, ngates.  float32, float64, int8, uint8, int16, uint16
+            and int32 arrays are supported, arrays do not need to be
+            contiguous.
+        field_mask : list of 2D uint8 arrays or None
+            Masking of the field data for each field, dimension are
+            ordered as nrays, ngates.  Gates with non-zero values will not
+            be included in the mapping of that field.  None indicates that
+            no gates in the field are masked.
+        scale_factors, add_offsets : 1D float32 array
+            Scale factor and offset applied to the field data for each
+            field, the mapped value is data * scale_factor + add_offset.
         excluded_gates : 2D uint8 array
             Array containing gate masking information.  Gates with non-zero
             values will not be included in the mapping.
@@ -263,63 +373,111 @@ cdef class GateToGridMapper:
         weighting_function : int
             Function to use for weighting gates based upon distance.
             0 for Barnes, 1 for Cressman weighting.
+        ray_start, ray_end : int
+            Range of rays, [ray_start, ray_end), to map.  The default maps
+            all rays, a ray_end of -1 indicates the last ray.
 
         """
 
-        cdef int nrays, ngates
-        cdef float elevation, azimuth, r, s
-        cdef float value, roi
-        cdef float[:] values
-        cdef char[:] masks
-        cdef float x, y, z
+        cdef int nrays, ngates, nray, ngate, i, nblock
+        cdef int block_start, block_end
         cdef float x_offset, y_offset, z_offset
+        cdef float[:, :, ::1] ray_data
+        cdef char[:, :, ::1] ray_mask
+        cdef float[:, :, ::1] gate_info
+        cdef char[:, :] mask
+        cdef bint nogil_roi
 
         nrays = len(elevations)
         ngates = len(ranges)
+        if ray_end < 0 or ray_end > nrays:
+            ray_end = nrays
+        if ray_start < 0:
+            ray_start = 0
+        if ray_start >= ray_end or ngates == 0 or self.nfields == 0:
+            return
         z_offset, y_offset, x_offset = offset
-        for nray in range(nrays):
-            # elevation and azimuth angles in radians
-            elevation = elevations[nray] * PI / 180.0
-            azimuth = azimuths[nray] * PI / 180.0
-            for ngate in range(ngates):
-
-                # continue if gate excluded
-                if excluded_gates[nray, ngate]:
-                    continue
-
-                # calculate cartesian coordinate assuming 4/3 earth radius
-                r = ranges[ngate]
-                z = (r**2 + R**2 + 2.0*r*R*sin(elevation))**0.5 - R
-                if z + z_offset >= toa:
-                    continue    # above top of atmosphere
-                s = R * asin(r * cos(elevation) / (R + z))  # arc length in m.
-                x = s * sin(azimuth)
-                y = s * cos(azimuth)
-
-                # add offsets
-                x += x_offset
-                y += y_offset
-                z += z_offset
-
-                # Region of influence
-                roi = roi_func.get_roi(z, y, x)
-
-                values = field_data[nray, ngate]
-                masks = field_mask[nray, ngate]
-                self.map_gate(x, y, z, roi, values, masks, weighting_function)
+        nogil_roi = _has_nogil_roi(roi_func)
+
+        # buffers holding the field data, masks, gate locations and radius
+        # of influence for a block of rays
+        nblock = min(RAY_BLOCK_SIZE, ray_end - ray_start)
+        ray_data = cvarray(shape=(nblock, ngates, self.nfields),
+                           itemsize=sizeof(float), format='f')
+        ray_mask = cvarray(shape=(nblock, ngates, self.nfields),
+                           itemsize=sizeof(char), format='c')
+        gate_info = cvarray(shape=(nblock, ngates, 4),
+                            itemsize=sizeof(float), format='f')
+
+        for block_start in range(ray_start, ray_end, RAY_BLOCK_SIZE):
+            block_end = min(block_start + RAY_BLOCK_SIZE, ray_end)
+
+            # load the field data and masks for the rays in the block
+            for i in range(self.nfields):
+                _load_rays(field_data[i], block_start, block_end, i,
+                           scale_factors[i], add_offsets[i], ray_data)
+                if field_mask[i] is None:
+                    with nogil:
+                        for nray in range(block_end - block_start):
+                            for ngate in range(ngates):
+                                ray_mask[nray, ngate, i] = 0
+                else:
+                    mask = field_mask[i]
+                    with nogil:
+                        for nray in range(block_start, block_end):
+                            for ngate in range(ngates):
+                                ray_mask[nray - block_start, ngate, i] = (
+                                    mask[nray, ngate])
+
+            # find the location and radius of influence of each gate,
+            # radius of influence methods implemented in Python are
+            # evaluated while holding the GIL
+            if nogil_roi:
+                with nogil:
+                    _find_gate_info(
+                        elevations, azimuths, ranges, block_start, block_end,
+                        z_offset, y_offset, x_offset, toa, excluded_gates,
+                        True, roi_func, True, gate_info)
+            else:
+                _find_gate_info(
+                    elevations, azimuths, ranges, block_start, block_end,
+                    z_offset, y_offset, x_offset, toa, excluded_gates,
+                    True, roi_func, False, gate_info)
+                for nray in range(block_end - block_start):
+                    for ngate in range(ngates):
+                        if gate_info[nray, ngate, 3] < 0:
+                            continue
+                        gate_info[nray, ngate, 3] = roi_func.get_roi(
+                            gate_info[nray, ngate, 0],
+                            gate_info[nray, ngate, 1],
+                            gate_info[nray, ngate, 2])
+
+            # map the gates in the block onto the grid
+            with nogil:
+                for nray in range(block_end - block_start):
+                    for ngate in range(ngates):
+                        if gate_info[nray, ngate, 3] < 0:
+                            continue
+                        self.map_gate(
+                            gate_info[nray, ngate, 2],
+                            gate_info[nray, ngate, 1],
+                            gate_info[nray, ngate, 0],
+                            gate_info[nray, ngate, 3],
+                            ray_data[nray, ngate], ray_mask[nray, ngate],
+                            weighting_function)
 
     @cython.initializedcheck(False)
     @cython.cdivision(True)
     @cython.boundscheck(False)
     @cython.wraparound(False)
     cdef int map_gate(self, float x, float y, float z, float roi,
-                      float[:] values, char[:] masks,
-                      int weighting_function):
+                      float[::1] values, char[::1] masks,
+                      int weighting_function) nogil:
         """ Map a single gate to the grid. """
 
         cdef float xg, yg, zg, dist, weight, roi2, dist2
         cdef int x_min, x_max, y_min, y_max, z_min, z_max
-        cdef int xi, yi, zi
+        cdef int xi, yi, zi, i
 
         # shift positions so that grid starts at 0
         x -= self.x_start
@@ -370,9 +528,505 @@ cdef class GateToGridMapper:
                         self.grid_wsum[zi, yi, xi, i] += weight
         return 1
 
+    @cython.cdivision(True)
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def find_nearest_sweep(
+            self, float[::1] sweep_elevations, offset,
+            int[:, :, ::1] nearest_sweep):
+        """
+        Find the sweep nearest in elevation angle to each grid point.
+
+        Parameters
+        ----------
+        sweep_elevations : 1D float32 array
+            Elevation angle of each sweep in degrees.
+        offset : tuple of floats
+            Offset of the radar from the grid origin.  Dimension are ordered
+            as z, y, x.
+        nearest_sweep : 3D int32 array
+            Array which will be filled with the index of the sweep nearest
+            to each grid point.
+
+        """
+        cdef int ix, iy, iz, isweep, nsweeps
+        cdef double x, y, z, s, elevation, diff, min_diff
+        cdef double x_offset, y_offset, z_offset
+
+        z_offset, y_offset, x_offset = offset
+        nsweeps = len(sweep_elevations)
+        for iz in range(self.nz):
+            for iy in range(self.ny):
+                for ix in range(self.nx):
+                    x = self.x_start + self.x_step * ix - x_offset
+                    y = self.y_start + self.y_step * iy - y_offset
+                    z = self.z_start + self.z_step * iz - z_offset
+                    s = sqrt(x * x + y * y)
+                    elevation = point_elevation(s, z)
+                    min_diff = 1e30
+                    for isweep in range(nsweeps):
+                        diff = fabs(elevation - sweep_elevations[isweep])
+                        if diff < min_diff:
+                            min_diff = diff
+                            nearest_sweep[iz, iy, ix] = isweep
+        return
+
+    @cython.initializedcheck(False)
+    @cython.cdivision(True)
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    def map_sweep_to_grid(
+            self, float[::1] azimuths, float[::1] ranges, float elevation,
+            float[:, :, ::1] sweep_data, char[:, :, ::1] sweep_mask,
+            int[:, :, ::1] nearest_sweep, int isweep, offset, float toa,
+            RoIFunction roi_func, int weighting_function,
+            float max_azimuth_gap):
+        """
+        Map a radar sweep onto the grid points nearest to the sweep.
+
+        The value at each grid point, whose nearest sweep is the given
+        sweep, is found from the gates surrounding the point's projection
+        onto the sweep, either the nearest gate or by bilinear interpolation
+        in azimuth and range.  Each grid point is visited once so the cost
+        scales with the number of grid points, not with the radius of
+        influence.
+
+        Parameters
+        ----------
+        azimuths : 1D float32 array
+            Azimuth angles of the rays in the sweep, in degrees, sorted in
+            increasing order.
+        ranges : 1D float32 array
+            Gate ranges in meters, increasing.
+        elevation : float
+            Elevation angle of the sweep in degrees.
+        sweep_data : 3D float32 array
+            Field data for the sweep, dimensions are ordered as rays (in the
+            order of the azimuths parameter), gates and fields.
+        sweep_mask : 3D int8 array
+            Non-zero for gates which are masked or excluded, same dimensions
+            as sweep_data.
+        nearest_sweep : 3D int32 array
+            Index of the sweep nearest to each grid point, see
+            :py:func:`find_nearest_sweep`.
+        isweep : int
+            Index of the sweep being mapped.
+        offset : tuple of floats
+            Offset of the radar from the grid origin.  Dimension are ordered
+            as z, y, x.
+        toa : float
+            Top of atmosphere.  Points where the beam is above this level are
+            not mapped.
+        roi_func : RoIFunction
+            Object whose get_roi method returns the radius of influence.
+            Grid points further than this distance from the center of the
+            beam are not mapped.
+        weighting_function : int
+            Function to use for interpolating, 2 for nearest, 3 for bilinear.
+        max_azimuth_gap : float
+            Maximum difference in azimuth, in degrees, between rays used for
+            interpolation.  Larger gaps are treated as missing data.
+
+        """
+        cdef int ix, iy, iz, i, j, nrays, ngates
+        cdef int i0, i1, j0, j1, ilow, ihigh, imid
+        cdef double x, y, z, xg, yg, zg, s, theta, r, zb, az, roi
+        cdef double az0, az1, ta, tr, w, wsum, vsum
+        cdef double sin_e, cos_e
+        cdef double x_offset, y_offset, z_offset
+        cdef double weights[4]
+        cdef int rays[4]
+        cdef int gates[4]
+
+        z_offset, y_offset, x_offset = offset
+        nrays = len(azimuths)
+        ngates = len(ranges)
+        if nrays == 0 or ngates == 0:
+            return
+        sin_e = sin(elevation * PI / 180.)
+        cos_e = cos(elevation * PI / 180.)
+
+        for iz in range(self.nz):
+            for iy in range(self.ny):
+                for ix in range(self.nx):
+                    if nearest_sweep[iz, iy, ix] != isweep:
+                        continue
+                    xg = self.x_start + self.x_step * ix
+                    yg = self.y_start + self.y_step * iy
+                    zg = self.z_start + self.z_step * iz
+                    x = xg - x_offset
+                    y = yg - y_offset
+                    z = zg - z_offset
+
+                    # range along the sweep and height of the beam center
+                    # at the ground distance of the point
+                    s = sqrt(x * x + y * y)
+                    theta = s / R
+                    if cos_e * cos(theta) - sin_e * sin(theta) <= 0:
+                        continue
+                    r = R * sin(theta) / (cos_e * cos(theta) -
+                                          sin_e * sin(theta))
+                    zb = sqrt(r * r + R * R + 2.0 * r * R * sin_e) - R
+                    if zb + z_offset >= toa:
+                        continue
+                    roi = roi_func.get_roi(zg, yg, xg)
+                    if fabs(z - zb) > roi:
+                        continue
+                    az = atan2(x, y) * 180. / PI
+                    if az < 0:
+                        az += 360.
+
+                    # find rays bracketing the azimuth, i0 <= az < i1
+                    if az < azimuths[0]:
+                        i0 = nrays - 1
+                        i1 = 0
+                        az0 = azimuths[nrays - 1] - 360.
+                        az1 = azimuths[0]
+                    elif az >= azimuths[nrays - 1]:
+                        i0 = nrays - 1
+                        i1 = 0
+                        az0 = azimuths[nrays - 1]
+                        az1 = azimuths[0] + 360.
+                    else:
+                        ilow = 0
+                        ihigh = nrays - 1
+                        while ihigh - ilow > 1:
+                            imid = (ilow + ihigh) // 2
+                            if azimuths[imid] <= az:
+                                ilow = imid
+                            else:
+                                ihigh = imid
+                        i0 = ilow
+                        i1 = ihigh
+                        az0 = azimuths[i0]
+                        az1 = azimuths[i1]
+                    if az1 - az0 > max_azimuth_gap:
+                        continue
+
+                    # find gates bracketing the range, j0 <= r <= j1
+                    if r < ranges[0] or r > ranges[ngates - 1]:
+                        continue
+                    if ngates == 1:
+                        j0 = 0
+                        j1 = 0
+                    else:
+                        ilow = 0
+                        ihigh = ngates - 1
+                        while ihigh - ilow > 1:
+                            imid = (ilow + ihigh) // 2
+                            if ranges[imid] <= r:
+                                ilow = imid
+                            else:
+                                ihigh = imid
+                        j0 = ilow
+                        j1 = ihigh
+
+                    if az1 > az0:
+                        ta = (az - az0) / (az1 - az0)
+                    else:
+                        ta = 0
+                    if ranges[j1] > ranges[j0]:
+                        tr = (r - ranges[j0]) / (ranges[j1] - ranges[j0])
+                    else:
+                        tr = 0
+
+                    if weighting_function == NEAREST:
+                        rays[0] = i0 if ta < 0.5 else i1
+                        gates[0] = j0 if tr < 0.5 else j1
+                        for i in range(self.nfields):
+                            if sweep_mask[rays[0], gates[0], i]:
+                                continue
+                            self.grid_sum[iz, iy, ix, i] += (
+                                sweep_data[rays[0], gates[0], i])
+                            self.grid_wsum[iz, iy, ix, i] += 1.
+                        continue
+
+                    # bilinear interpolation between the four gates
+                    rays[0] = i0
+                    rays[1] = i0
+                    rays[2] = i1
+                    rays[3] = i1
+                    gates[0] = j0
+                    gates[1] = j1
+                    gates[2] = j0
+                    gates[3] = j1
+                    weights[0] = (1 - ta) * (1 - tr)
+                    weights[1] = (1 - ta) * tr
+                    weights[2] = ta * (1 - tr)
+                    weights[3] = ta * tr
+                    for i in range(self.nfields):
+                        wsum = 0
+                        vsum = 0
+                        for j in range(4):
+                            if sweep_mask[rays[j], gates[j], i]:
+                                continue
+                            wsum += weights[j]
+                            vsum += weights[j] * sweep_data[
+                                rays[j], gates[j], i]
+                        if wsum <= 0:
+                            continue
+                        self.grid_sum[iz, iy, ix, i] += vsum
+                        self.grid_wsum[iz, iy, ix, i] += wsum
+        return
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def find_gate_locations_and_roi(
+        float[::1] elevations, float[::1] azimuths, float[::1] ranges,
+        offset, float toa, RoIFunction roi_func,
+        float[:, :, ::1] gate_info):
+    """
+    Find the Cartesian location and radius of influence of radar gates.
+
+    Parameters
+    ----------
+    elevations, azimuths : 1D float32 array
+        Elevation and azimuth angles in degrees for each ray in the radar.
+    ranges : 1D float32 array
+        Gate ranges in meters for each bin in the radar.
+    offset : tuple of floats
+        Offset of the radar from the grid origin.  Dimension are ordered
+        as z, y, x.
+    toa : float
+        Top of atmosphere.  Gates above this level are assigned a radius of
+        influence of -1.
+    roi_func : RoIFunction
+        Object whose get_roi method returns the radius of influence.
+    gate_info : 3D float32 array
+        Array which will be filled with the z, y, x location and radius of
+        influence of each gate, dimensions are ordered as nrays, ngates, 4.
+
+    """
+    cdef int nray, ngate, nrays
+    cdef float x_offset, y_offset, z_offset
+    cdef bint nogil_roi
+    cdef char[:, ::1] excluded_gates = None
+
+    z_offset, y_offset, x_offset = offset
+    nrays = len(elevations)
+    nogil_roi = _has_nogil_roi(roi_func)
+    with nogil:
+        _find_gate_info(
+            elevations, azimuths, ranges, 0, nrays, z_offset, y_offset,
+            x_offset, toa, excluded_gates, False, roi_func, nogil_roi,
+            gate_info)
+    if nogil_roi:
+        return
+    for nray in range(nrays):
+        for ngate in range(len(ranges)):
+            if gate_info[nray, ngate, 3] < 0:
+                continue
+            gate_info[nray, ngate, 3] = roi_func.get_roi(
+                gate_info[nray, ngate, 0], gate_info[nray, ngate, 1],
+                gate_info[nray, ngate, 2])
+
+
+ctypedef fused field_data_t:
+    float
+    double
+    signed char
+    unsigned char
+    short
+    unsigned short
+    int
+
+
+cdef int _load_rays(
+        object field_data, int ray_start, int ray_end, int ifield,
+        float scale_factor, float add_offset,
+        float[:, :, ::1] ray_data) except -1:
+    """
+    Load the scaled field data for a block of rays into a ray buffer.
+
+    Parameters
+    ----------
+    field_data : 2D array
+        Field data, dimensions are ordered as nrays, ngates.  The
+        field_data_t types are supported.
+    ray_start, ray_end : int
+        Range of rays, [ray_start, ray_end), to load.
+    ifield : int
+        Index of the field in the ray buffer.
+    scale_factor, add_offset : float
+        Scale factor and offset applied to the field data.
+    ray_data : 3D float32 array
+        Ray buffer, dimensions are ordered as rays, ngates, nfields.
+
+    """
+    cdef float[:, :] f4
+    cdef double[:, :] f8
+    cdef signed char[:, :] i1
+    cdef unsigned char[:, :] u1
+    cdef short[:, :] i2
+    cdef unsigned short[:, :] u2
+    cdef int[:, :] i4
+
+    # the buffer is acquired using the memoryview matching the field dtype,
+    # the data is then loaded without the GIL
+    dtype_char = field_data.dtype.char
+    if dtype_char == 'f':
+        f4 = field_data
+        with nogil:
+            _load_typed_rays(f4, ray_start, ray_end, ifield, scale_factor,
+                             add_offset, ray_data)
+    elif dtype_char == 'd':
+        f8 = field_data
+        with nogil:
+            _load_typed_rays(f8, ray_start, ray_end, ifield, scale_factor,
+                             add_offset, ray_data)
+    elif dtype_char == 'b':
+        i1 = field_data
+        with nogil:
+            _load_typed_rays(i1, ray_start, ray_end, ifield, scale_factor,
+                             add_offset, ray_data)
+    elif dtype_char == 'B':
+        u1 = field_data
+        with nogil:
+            _load_typed_rays(u1, ray_start, ray_end, ifield, scale_factor,
+                             add_offset, ray_data)
+    elif dtype_char == 'h':
+        i2 = field_data
+        with nogil:
+            _load_typed_rays(i2, ray_start, ray_end, ifield, scale_factor,
+                             add_offset, ray_data)
+    elif dtype_char == 'H':
+        u2 = field_data
+        with nogil:
+            _load_typed_rays(u2, ray_start, ray_end, ifield, scale_factor,
+                             add_offset, ray_data)
+    else:
+        i4 = field_data
+        with nogil:
+            _load_typed_rays(i4, ray_start, ray_end, ifield, scale_factor,
+                             add_offset, ray_data)
+    return 0
+
+
+@cython.initializedcheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline void _load_typed_rays(
+        field_data_t[:, :] field_data, int ray_start, int ray_end,
+        int ifield, float scale_factor, float add_offset,
+        float[:, :, ::1] ray_data) nogil:
+    """ Load and scale a block of rays from typed field data. """
+    cdef int nray, ngate
+    for nray in range(ray_start, ray_end):
+        for ngate in range(ray_data.shape[1]):
+            ray_data[nray - ray_start, ngate, ifield] = (
+                field_data[nray, ngate] * scale_factor + add_offset)
+
+
+@cython.initializedcheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _find_gate_info(
+        float[::1] elevations, float[::1] azimuths, float[::1] ranges,
+        int ray_start, int ray_end, float z_offset, float y_offset,
+        float x_offset, float toa, char[:, ::1] excluded_gates,
+        bint check_excluded, RoIFunction roi_func, bint find_roi,
+        float[:, :, ::1] gate_info) nogil:
+    """
+    Find the location and radius of influence of the gates in a block of
+    rays, [ray_start, ray_end).
+
+    gate_info is filled with the z, y, x location and radius of influence of
+    each gate, dimensions are ordered as rays in the block, gates, 4.  Gates
+    above the top of atmosphere and, when check_excluded is True, excluded
+    gates are assigned a radius of -1.  When find_roi is False the radius of
+    all other gates is set to 0 and should be found using get_roi.
+    """
+    cdef int nray, ngate
+    cdef float x, y, z
+    for nray in range(ray_start, ray_end):
+        for ngate in range(ranges.shape[0]):
+            if check_excluded and excluded_gates[nray, ngate]:
+                gate_info[nray - ray_start, ngate, 3] = -1.
+                continue
+            gate_location(elevations[nray], azimuths[nray], ranges[ngate],
+                          z_offset, y_offset, x_offset, &z, &y, &x)
+            gate_info[nray - ray_start, ngate, 0] = z
+            gate_info[nray - ray_start, ngate, 1] = y
+            gate_info[nray - ray_start, ngate, 2] = x
+            if z >= toa:
+                gate_info[nray - ray_start, ngate, 3] = -1.  # above toa
+            elif find_roi:
+                gate_info[nray - ray_start, ngate, 3] = roi_func.roi(z, y, x)
+            else:
+                gate_info[nray - ray_start, ngate, 3] = 0.
+
+
+cdef bint _has_nogil_roi(RoIFunction roi_func):
+    """
+    Return True when the radius of influence of roi_func can be found
+    without the GIL, False when get_roi is overridden, for example by a
+    subclass defined in Python.
+    """
+    for cls in type(roi_func).__mro__:
+        if cls is RoIFunction:
+            return True
+        if 'get_roi' in cls.__dict__:
+            return False
+    return True
+
+
+@cython.cdivision(True)
+cdef inline void gate_location(
+        float elevation, float azimuth, float r, float z_offset,
+        float y_offset, float x_offset, float *z, float *y, float *x) nogil:
+    """
+    Find the Cartesian location of a gate assuming a 4/3 earth radius.
+
+    Elevation and azimuth are in degrees, range and offsets in meters.
+    """
+    cdef float s
+    elevation = elevation * PI / 180.0
+    azimuth = azimuth * PI / 180.0
+    z[0] = (r**2 + R**2 + 2.0*r*R*sin(elevation))**0.5 - R
+    s = R * asin(r * cos(elevation) / (R + z[0]))  # arc length in m.
+    x[0] = s * sin(azimuth) + x_offset
+    y[0] = s * cos(azimuth) + y_offset
+    z[0] = z[0] + z_offset
+
+
+@cython.cdivision(True)
+cdef inline double point_elevation(double s, double z) nogil:
+    """
+    Find the elevation angle, in degrees, of the beam which passes through a
+    point at arc length s and height z, in meters, from the radar assuming a
+    4/3 earth radius.
+    """
+    cdef double theta
+    theta = s / R
+    return atan2((R + z) * cos(theta) - R, (R + z) * sin(theta)) * 180. / PI
+
+
+@cython.cdivision(True)
+cdef inline void lattice_position(
+        float coord, float start, float step, int npoints, int *index,
+        float *frac) nogil:
+    """
+    Find the index of the lattice point at or below a coordinate and the
+    fractional distance to the next point, clamped to the lattice edges.
+    """
+    cdef float pos
+    index[0] = 0
+    frac[0] = 0.
+    if npoints == 1 or step == 0:
+        return
+    pos = (coord - start) / step
+    if pos <= 0:
+        return
+    if pos >= npoints - 1:
+        index[0] = npoints - 1
+        return
+    index[0] = <int>floor(pos)
+    frac[0] = pos - index[0]
+
 
 @cython.cdivision(True)
-cdef int find_min(float a, float roi, float step):
+cdef int find_min(float a, float roi, float step) nogil:
     """ Find the mimumum gate index for a dimension. """
     cdef int a_min
     if step == 0:
@@ -384,7 +1038,7 @@ cdef int find_min(float a, float roi, float step):
 
 
 @cython.cdivision(True)
-cdef int find_max(float a, float roi, float step, int na):
+cdef int find_max(float a, float roi, float step, int na) nogil:
     """ Find the maximum gate index for a dimension. """
     cdef int a_max
     if step == 0:
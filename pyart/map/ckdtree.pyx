@@ -116,6 +116,36 @@ cdef inline int list_append(list results, np.intp_t i) except -1:
         # Other platforms
         results.append(i)
     return 0
+
+
+# Growable array of indices, used to collect neighbors without creating
+# Python objects for each one.
+cdef struct index_buffer:
+    np.intp_t *data
+    np.intp_t size
+    np.intp_t max_size
+
+cdef int index_buffer_init(index_buffer *buf,
+                           np.intp_t max_size) except -1:
+    buf.data = <np.intp_t*> stdlib.malloc(max_size * sizeof(np.intp_t))
+    if buf.data == NULL:
+        raise MemoryError
+    buf.size = 0
+    buf.max_size = max_size
+    return 0
+
+cdef inline int index_buffer_append(index_buffer *buf,
+                                    np.intp_t i) except -1:
+    cdef void *tmp
+    if buf.size == buf.max_size:
+        tmp = stdlib.realloc(buf.data, 2 * buf.max_size * sizeof(np.intp_t))
+        if tmp == NULL:
+            raise MemoryError
+        buf.data = <np.intp_t*> tmp
+        buf.max_size *= 2
+    buf.data[buf.size] = i
+    buf.size += 1
+    return 0
     
 
 
@@ -1437,6 +1467,128 @@ cdef class cKDTree:
                 result[c] = self.__query_ball_point(&xx[0], r, p, eps)
             return result
 
+    cdef int __query_ball_points_flat_traverse_no_checking(
+            cKDTree self, index_buffer *results, innernode* node) except -1:
+        cdef leafnode* lnode
+        cdef np.intp_t i
+
+        if node.split_dim == -1:  # leaf node
+            lnode = <leafnode*> node
+            for i in range(lnode.start_idx, lnode.end_idx):
+                index_buffer_append(results, self.raw_indices[i])
+        else:
+            self.__query_ball_points_flat_traverse_no_checking(
+                results, node.less)
+            self.__query_ball_points_flat_traverse_no_checking(
+                results, node.greater)
+
+        return 0
+
+
+    @cython.cdivision(True)
+    cdef int __query_ball_points_flat_traverse_checking(
+            cKDTree self, index_buffer *results, innernode* node,
+            PointRectDistanceTracker tracker) except -1:
+        cdef leafnode* lnode
+        cdef np.float64_t d
+        cdef np.intp_t i
+
+        if tracker.min_distance > tracker.upper_bound * tracker.epsfac:
+            return 0
+        elif tracker.max_distance < tracker.upper_bound / tracker.epsfac:
+            self.__query_ball_points_flat_traverse_no_checking(results, node)
+        elif node.split_dim == -1:  # leaf node
+            lnode = <leafnode*>node
+            # brute-force
+            for i in range(lnode.start_idx, lnode.end_idx):
+                d = _distance_p(
+                    self.raw_data + self.raw_indices[i] * self.m,
+                    tracker.pt, tracker.p, self.m, tracker.upper_bound)
+                if d <= tracker.upper_bound:
+                    index_buffer_append(results, self.raw_indices[i])
+        else:
+            tracker.push_less_of(node)
+            self.__query_ball_points_flat_traverse_checking(
+                results, node.less, tracker)
+            tracker.pop()
+
+            tracker.push_greater_of(node)
+            self.__query_ball_points_flat_traverse_checking(
+                results, node.greater, tracker)
+            tracker.pop()
+
+        return 0
+
+
+    def query_ball_points_flat(cKDTree self, object x, object r,
+                               np.float64_t p=2., np.float64_t eps=0):
+        """query_ball_points_flat(self, x, r, p, eps)
+
+        Find all points within a per-point distance of many points.
+
+        Unlike query_ball_point, which returns a object array of lists, the
+        neighbors of all query points are collected during the tree
+        traversal into a single flat array, in compressed sparse row order,
+        which is suitable for vectorized post-processing.
+
+        Parameters
+        ----------
+        x : array_like, shape (n, self.m)
+            The points to search for neighbors of.
+        r : float or array_like, shape (n, )
+            The radius of points to return, either a single radius for all
+            query points or one radius for each query point.
+        p : float, optional
+            Which Minkowski p-norm to use.  Should be in the range [1, inf].
+        eps : nonnegative float, optional
+            Approximate search, see query_ball_point.
+
+        Returns
+        -------
+        ind : ndarray of intp, shape (counts.sum(), )
+            Indices of the neighbors of all query points, the neighbors of
+            query point i are ind[offset[i]:offset[i] + counts[i]] where
+            offset is the cumulative sum of counts starting at 0.
+        counts : ndarray of intp, shape (n, )
+            Number of neighbors of each query point.
+
+        """
+        cdef np.ndarray[np.float64_t, ndim=2, mode="c"] xx
+        cdef np.ndarray[np.float64_t, ndim=1, mode="c"] rr
+        cdef np.ndarray[np.intp_t, ndim=1, mode="c"] counts
+        cdef np.ndarray[np.intp_t, ndim=1, mode="c"] ind
+        cdef index_buffer results
+        cdef PointRectDistanceTracker tracker
+        cdef Rectangle rect
+        cdef np.intp_t i, start, npoints
+
+        xx = np.ascontiguousarray(x, dtype=np.float64)
+        if xx.shape[1] != self.m:
+            raise ValueError("Searching for a %d-dimensional point in a " \
+                             "%d-dimensional KDTree" % (int(xx.shape[1]), int(self.m)))
+        npoints = xx.shape[0]
+        rr = np.ascontiguousarray(
+            np.ones(npoints, dtype=np.float64) * np.asarray(r, np.float64))
+        counts = np.empty(npoints, dtype=np.intp)
+
+        # the rectangle is restored after each traversal and can be shared
+        rect = Rectangle(self.mins, self.maxes)
+        index_buffer_init(&results, max(npoints, 16))
+        try:
+            for i in range(npoints):
+                tracker = PointRectDistanceTracker()
+                tracker.init(&xx[i, 0], rect, p, eps, rr[i])
+                start = results.size
+                self.__query_ball_points_flat_traverse_checking(
+                    &results, self.tree, tracker)
+                counts[i] = results.size - start
+            ind = np.empty(results.size, dtype=np.intp)
+            for i in range(results.size):
+                ind[i] = results.data[i]
+        finally:
+            stdlib.free(results.data)
+        return ind, counts
+
     # ---------------
     # query_ball_tree
     # ---------------
@@ -8,6 +8,9 @@ Generate a Cartesian grid by mapping from radar gates onto the grid.
     :toctree: generated/
 
     map_gates_to_grid
+    _prepare_field_data
+    _map_gates_in_threads
+    _map_sweeps_to_grid
     _detemine_cy_weighting_func
     _parse_grid_origin
     _parse_gatefilters
@@ -15,9 +18,12 @@ Generate a Cartesian grid by mapping from radar gates onto the grid.
     _find_offsets
     _find_grid_params
     _parse_roi_func
+    _find_roi_lattice
 
 """
 
+from multiprocessing.pool import ThreadPool
+
 import numpy as np
 from ..config import get_field_name
 from ..core.radar import Radar
@@ -26,6 +32,19 @@ from ..filters import GateFilter, moment_based_gate_filter
 
 from ._gate_to_grid_map import GateToGridMapper
 from ._gate_to_grid_map import RoIFunction, ConstantRoI, DistBeamRoI, DistRoI
+from ._gate_to_grid_map import LatticeRoI, find_roi_on_lattice
+
+# cython weighting function values of the per sweep interpolation methods
+_NEAREST = 2
+_BILINEAR = 3
+
+# default maximum number of points along each dimension of the lattice on
+# which radius of influence functions are evaluated
+_ROI_LATTICE_POINTS = 25
+
+# field data types which the gate mapper can read without a copy
+_SUPPORTED_DTYPES = [np.dtype(t) for t in [
+    'float32', 'float64', 'int8', 'uint8', 'int16', 'uint16', 'int32']]
 
 
 def map_gates_to_grid(
@@ -33,7 +52,8 @@ def map_gates_to_grid(
         grid_origin_alt=None, fields=None, gatefilters=False, map_roi=True,
         weighting_function='Barnes', toa=17000.0, roi_func='dist_beam',
         constant_roi=500., z_factor=0.05, xy_factor=0.02, min_radius=500.0,
-        h_factor=1.0, nb=1.5, bsp=1.0, **kwargs):
+        h_factor=1.0, nb=1.5, bsp=1.0, nthreads=1, roi_lattice_shape=None,
+        **kwargs):
     """
     Map gates from one or more radars to a Cartesian grid.
 
@@ -49,7 +69,19 @@ def map_gates_to_grid(
 
     Parameters
     ----------
-    roi_func : str or RoIFunction
+    weighting_function : 'Barnes', 'Cressman', 'Nearest' or 'Bilinear'
+        Functions used to weight nearby collected points when interpolating
+        a grid point.  'Barnes' and 'Cressman' weight every gate within the
+        radius of influence of a grid point.  'Nearest' and 'Bilinear' are
+        fast interpolations whose cost scales with the number of grid points,
+        suitable for quick-look products.  Each grid point is projected onto
+        the sweep nearest to it in elevation angle and takes the value of the
+        nearest gate in that sweep, 'Nearest', or the value bilinearly
+        interpolated in azimuth and range from the four surrounding gates,
+        'Bilinear'.  With these methods the radius of influence gives the
+        maximum distance between a grid point and the beam center for the
+        point to be mapped and the nthreads parameter is not used.
+    roi_func : str, RoIFunction, array or function
         Radius of influence function.  A functions which takes an
         z, y, x grid location, in meters, and returns a radius (in meters)
         within which all collected points will be included in the weighting
@@ -66,6 +98,30 @@ def map_gates_to_grid(
         and defining a get_roi method which returns the radius.  For efficient
         mapping this class should be implemented in Cython.
 
+        A 3D array with the same shape as the grid can be used to specify
+        the radius of influence at each grid point.  A Python function can
+        also be given, this function is called once with three arrays of
+        z, y and x locations, in meters, which broadcast against each other
+        and must return an array of radii.  The function is evaluated on a
+        lattice of points, see roi_lattice_shape.  In both cases the radius
+        of influence of a gate is interpolated from the array or lattice
+        values, gates outside the grid take the value at the nearest grid
+        edge.
+    nthreads : int
+        Number of threads used to map the gates onto the grid.  When greater
+        than 1 the rays of each radar are divided between the threads which
+        map the gates with the GIL released.  Each additional thread
+        allocates its own copy of the grid accumulation arrays which are
+        summed once all gates have been mapped.
+    roi_lattice_shape : 3-tuple of int or None
+        Number of points (z, y, x) in the lattice spanning the grid on which
+        a Python roi_func function is evaluated.  None uses the grid points
+        with at most 25 points along each dimension.  When specified for a
+        string or RoIFunction roi_func, this function is also evaluated on
+        the lattice and interpolated, which can speed up the mapping when
+        the radius of influence is expensive to calculate, for example the
+        'dist' and 'dist_beam' functions for many radars.
+
     Returns
     -------
     grids : dict
@@ -94,42 +150,63 @@ def map_gates_to_grid(
     offsets = _find_offsets(radars, grid_origin, grid_origin_alt)
     grid_starts, grid_steps = _find_grid_params(grid_shape, grid_limits)
     roi_func = _parse_roi_func(roi_func, constant_roi, z_factor, xy_factor,
-                               min_radius, h_factor, nb, bsp, offsets)
+                               min_radius, h_factor, nb, bsp, offsets,
+                               grid_shape, grid_starts, grid_steps,
+                               roi_lattice_shape)
 
-    # prepare grid storage arrays
+    if int(nthreads) < 1:
+        raise ValueError('nthreads must be a positive integer')
+    nthreads = int(nthreads)
+
+    # prepare grid storage arrays, each thread has its own arrays
     nfields = len(fields)
-    grid_sum = np.zeros(grid_shape + (nfields, ), dtype=np.float32)
-    grid_wsum = np.zeros(grid_shape + (nfields, ), dtype=np.float32)
-    gatemapper = GateToGridMapper(
-        grid_shape, grid_starts, grid_steps, grid_sum, grid_wsum)
+    grid_sums = [np.zeros(grid_shape + (nfields, ), dtype=np.float32)
+                 for i in range(nthreads)]
+    grid_wsums = [np.zeros(grid_shape + (nfields, ), dtype=np.float32)
+                  for i in range(nthreads)]
+    gatemappers = [
+        GateToGridMapper(grid_shape, grid_starts, grid_steps, gsum, gwsum)
+        for gsum, gwsum in zip(grid_sums, grid_wsums)]
+    gatemapper = gatemappers[0]
 
     # project gates from each radar onto the grid
     for radar, radar_offset, gatefilter in zip(radars, offsets, gatefilters):
 
-        # Copy the field data and masks.
-        # TODO method that does not copy field data into new array
-        shape = (radar.nrays, radar.ngates, nfields)
-        field_data = np.empty(shape, dtype='float32')
-        field_mask = np.empty(shape, dtype='uint8')
-        for i, field in enumerate(fields):
-            fdata = radar.fields[field]['data']
-            field_data[:, :, i] = np.ma.getdata(fdata)
-            field_mask[:, :, i] = np.ma.getmaskarray(fdata)
+        # field data, masks and scaling, the field data is not copied
+        field_data, field_mask, scale_factors, add_offsets = (
+            _prepare_field_data(radar, fields))
 
         # find excluded gates from the gatefilter
         if gatefilter is False:
             gatefilter = GateFilter(radar)  # include all gates
         elif gatefilter is None:
             gatefilter = moment_based_gate_filter(radar, **kwargs)
-        excluded_gates = gatefilter.gate_excluded.astype('uint8')
+        excluded_gates = np.ascontiguousarray(
+            gatefilter.gate_excluded).view('uint8')
 
         # map the gates onto the grid
-        gatemapper.map_gates_to_grid(
-            radar.elevation['data'].astype('float32'),
-            radar.azimuth['data'].astype('float32'),
-            radar.range['data'].astype('float32'),
-            field_data, field_mask, excluded_gates,
-            radar_offset, toa, roi_func, cy_weighting_function)
+        args = (radar.elevation['data'].astype('float32'),
+                radar.azimuth['data'].astype('float32'),
+                radar.range['data'].astype('float32'),
+                field_data, field_mask, scale_factors, add_offsets,
+                excluded_gates, radar_offset, toa, roi_func,
+                cy_weighting_function)
+        if cy_weighting_function in [_NEAREST, _BILINEAR]:
+            _map_sweeps_to_grid(
+                gatemapper, grid_shape, radar, field_data, field_mask,
+                scale_factors, add_offsets, excluded_gates, radar_offset,
+                toa, roi_func, cy_weighting_function)
+        elif nthreads == 1:
+            gatemapper.map_gates_to_grid(*args)
+        else:
+            _map_gates_in_threads(gatemappers, args, radar.nrays)
+
+    # sum the grid storage arrays from all threads
+    grid_sum = grid_sums[0]
+    grid_wsum = grid_wsums[0]
+    for thread_sum, thread_wsum in zip(grid_sums[1:], grid_wsums[1:]):
+        grid_sum += thread_sum
+        grid_wsum += thread_wsum
 
     # create and return the grid dictionary
     mweight = np.ma.masked_equal(grid_wsum, 0)
@@ -143,12 +220,118 @@ def map_gates_to_grid(
     return grids
 
 
+def _prepare_field_data(radar, fields):
+    """
+    Return the field data, masks, scale factors and offsets for mapping.
+
+    The field data and masks are views of the radar field arrays, no copies
+    are made unless the field data type is not supported by the gate mapper.
+    Integer fields with 'scale_factor' and/or 'add_offset' keys are scaled
+    by these values during the mapping.
+    """
+    nfields = len(fields)
+    field_data = []
+    field_mask = []
+    scale_factors = np.ones((nfields, ), dtype='float32')
+    add_offsets = np.zeros((nfields, ), dtype='float32')
+    for i, field in enumerate(fields):
+        fdic = radar.fields[field]
+        fdata = fdic['data']
+        data = np.ma.getdata(fdata)
+        if data.dtype not in _SUPPORTED_DTYPES:
+            data = data.astype('float32')
+        if np.issubdtype(data.dtype, np.integer):
+            scale_factors[i] = fdic.get('scale_factor', 1.)
+            add_offsets[i] = fdic.get('add_offset', 0.)
+        field_data.append(data)
+
+        mask = np.ma.getmask(fdata)
+        if mask is np.ma.nomask:
+            field_mask.append(None)
+        else:
+            field_mask.append(mask.view('uint8'))
+    return field_data, field_mask, scale_factors, add_offsets
+
+
+def _map_gates_in_threads(gatemappers, args, nrays):
+    """ Map the rays of a radar onto the grid using multiple threads. """
+    nthreads = len(gatemappers)
+    ray_bounds = np.linspace(0, nrays, nthreads + 1).astype('int')
+
+    def map_rays(i):
+        """ Map a block of rays using the i-th gate mapper. """
+        gatemappers[i].map_gates_to_grid(
+            *args, ray_start=ray_bounds[i], ray_end=ray_bounds[i + 1])
+
+    pool = ThreadPool(nthreads)
+    try:
+        pool.map(map_rays, range(nthreads))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _map_sweeps_to_grid(
+        gatemapper, grid_shape, radar, field_data, field_mask, scale_factors,
+        add_offsets, excluded_gates, offset, toa, roi_func,
+        weighting_function):
+    """
+    Map a radar onto the grid one sweep at a time using nearest neighbor or
+    bilinear interpolation.
+    """
+    nfields = len(field_data)
+    sweep_slices = list(radar.iter_slice())
+    sweep_elevations = np.array(
+        [radar.elevation['data'][s].mean() for s in sweep_slices],
+        dtype='float32')
+    nearest_sweep = np.empty(grid_shape, dtype=np.int32)
+    gatemapper.find_nearest_sweep(sweep_elevations, offset, nearest_sweep)
+    ranges = radar.range['data'].astype('float32')
+
+    for isweep, sweep_slice in enumerate(sweep_slices):
+        if not np.any(nearest_sweep == isweep):
+            continue
+
+        # rays in the sweep sorted by azimuth
+        azimuths = radar.azimuth['data'][sweep_slice]
+        order = np.argsort(azimuths)
+        rays = np.arange(sweep_slice.start, sweep_slice.stop)[order]
+        azimuths = np.ascontiguousarray(azimuths[order], dtype='float32')
+
+        # rays further apart than twice the typical spacing are not
+        # interpolated between, this includes the edges of sector scans
+        if len(azimuths) > 1:
+            spacing = np.diff(np.append(azimuths, azimuths[0] + 360.))
+            max_azimuth_gap = 2. * np.median(spacing)
+        else:
+            max_azimuth_gap = 360.
+
+        # field data and masks for the sweep
+        sweep_data = np.empty((len(rays), radar.ngates, nfields), 'float32')
+        sweep_mask = np.empty((len(rays), radar.ngates, nfields), 'uint8')
+        for i in range(nfields):
+            sweep_data[..., i] = (
+                field_data[i][rays] * scale_factors[i] + add_offsets[i])
+            sweep_mask[..., i] = excluded_gates[rays]
+            if field_mask[i] is not None:
+                sweep_mask[..., i] |= field_mask[i][rays]
+
+        gatemapper.map_sweep_to_grid(
+            azimuths, ranges, sweep_elevations[isweep], sweep_data,
+            sweep_mask, nearest_sweep, isweep, offset, toa,
+            roi_func, weighting_function, max_azimuth_gap)
+
+
 def _detemine_cy_weighting_func(weighting_function):
     """ Determine cython weight function value. """
     if weighting_function.upper() == 'CRESSMAN':
         cy_weighting_function = 1
     elif weighting_function.upper() == 'BARNES':
         cy_weighting_function = 0
+    elif weighting_function.upper() == 'NEAREST':
+        cy_weighting_function = _NEAREST
+    elif weighting_function.upper() == 'BILINEAR':
+        cy_weighting_function = _BILINEAR
     else:
         raise ValueError('unknown weighting_function')
     return cy_weighting_function
@@ -183,6 +366,8 @@ def _determine_fields(fields, radars):
         for radar in radars[1:]:
             fields = fields.intersection(radar.fields.keys())
         fields = list(fields)
+    if len(fields) == 0:
+        raise ValueError('no fields to map')
     return fields
 
 
@@ -226,10 +411,20 @@ def _find_grid_params(grid_shape, grid_limits):
 
 
 def _parse_roi_func(roi_func, constant_roi, z_factor, xy_factor, min_radius,
-                    h_factor, nb, bsp, offsets):
+                    h_factor, nb, bsp, offsets, grid_shape, grid_starts,
+                    grid_steps, roi_lattice_shape=None):
     """ Return the Radius of influence object. """
+    if isinstance(roi_func, np.ndarray):
+        roi_values = np.ascontiguousarray(roi_func, dtype=np.float32)
+        if roi_values.shape != tuple(grid_shape):
+            raise ValueError('roi_func array must have the grid shape')
+        return LatticeRoI(roi_values, tuple(grid_starts), tuple(grid_steps))
+
+    vectorized = False
     if not isinstance(roi_func, RoIFunction):
-        if roi_func == 'constant':
+        if callable(roi_func):
+            vectorized = True
+        elif roi_func == 'constant':
             roi_func = ConstantRoI(constant_roi)
         elif roi_func == 'dist':
             roi_func = DistRoI(z_factor, xy_factor, min_radius, offsets)
@@ -237,4 +432,47 @@ def _parse_roi_func(roi_func, constant_roi, z_factor, xy_factor, min_radius,
             roi_func = DistBeamRoI(h_factor, nb, bsp, min_radius, offsets)
         else:
             raise ValueError('unknown roi_func: %s' % roi_func)
+
+    if vectorized or roi_lattice_shape is not None:
+        lattice_axes, lattice_starts, lattice_steps = _find_roi_lattice(
+            grid_shape, grid_starts, grid_steps, roi_lattice_shape)
+        lattice_shape = tuple(len(axis) for axis in lattice_axes)
+        roi_values = np.empty(lattice_shape, dtype=np.float32)
+        if vectorized:
+            z, y, x = lattice_axes
+            roi_values[:] = roi_func(
+                z[:, np.newaxis, np.newaxis], y[np.newaxis, :, np.newaxis],
+                x[np.newaxis, np.newaxis, :])
+        else:
+            find_roi_on_lattice(
+                roi_func, lattice_starts, lattice_steps, roi_values)
+        roi_func = LatticeRoI(roi_values, lattice_starts, lattice_steps)
     return roi_func
+
+
+def _find_roi_lattice(grid_shape, grid_starts, grid_steps, lattice_shape):
+    """
+    Find the axes, starting points and step sizes of the lattice spanning
+    the grid on which the radius of influence is evaluated.
+    """
+    if lattice_shape is None:
+        lattice_shape = [min(n, _ROI_LATTICE_POINTS) for n in grid_shape]
+    if len(lattice_shape) != 3 or min(lattice_shape) < 1:
+        raise ValueError('roi_lattice_shape must be three positive integers')
+
+    axes = []
+    starts = []
+    steps = []
+    for npoints, ngrid, start, step in zip(
+            lattice_shape, grid_shape, grid_starts, grid_steps):
+        npoints = int(npoints)
+        extent = step * (ngrid - 1)
+        if npoints == 1:
+            start = start + extent / 2.
+            step = 0.
+        else:
+            step = extent / (npoints - 1.)
+        axes.append(start + step * np.arange(npoints, dtype=np.float32))
+        starts.append(float(start))
+        steps.append(float(step))
+    return axes, tuple(starts), tuple(steps)
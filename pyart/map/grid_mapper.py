@@ -11,7 +11,13 @@ Utilities for mapping radar objects to Cartesian grids.
     map_to_grid
     example_roi_func_constant
     example_roi_func_dist
+    _make_grid_field
+    _make_grid_axes
+    _make_grid_metadata
     _load_nn_field_data
+    _weight_neighbors_in_block
+    _geometry_matches
+    _roi_for_points
     _gen_roi_func_constant
     _gen_roi_func_dist
     _gen_roi_func_dist_beam
@@ -21,6 +27,7 @@ Utilities for mapping radar objects to Cartesian grids.
     :template: dev_template.rst
 
     NNLocator
+    GridMapper
 
 """
 
@@ -29,7 +36,6 @@ import scipy.spatial
 
 from ..config import get_fillvalue
 from ..graph.common import corner_to_point
-from ..io.common import radar_coords_to_cart
 from ..core.grid import Grid
 from ..core.radar import Radar
 from ..filters import GateFilter, moment_based_gate_filter
@@ -37,6 +43,8 @@ from ._load_nn_field_data import _load_nn_field_data
 from .ckdtree import cKDTree
 from .ball_tree import BallTree
 from .gates_to_grid import map_gates_to_grid
+from .gates_to_grid import _parse_grid_origin, _find_offsets
+from .gates_to_grid import _find_grid_params
 
 
 def grid_from_radars(radars, grid_shape, grid_limits,
@@ -87,25 +95,39 @@ def grid_from_radars(radars, grid_shape, grid_limits,
         raise ValueError('invalid gridding_algo')
 
     # create and populate the field dictionary
-    fields = {}
     first_radar = radars[0]
+    fields = dict([(field, _make_grid_field(first_radar, field, data))
+                   for field, data in grids.items()])
+    axes = _make_grid_axes(
+        radars, grid_shape, grid_limits, kwargs.get('grid_origin', None),
+        kwargs.get('grid_origin_alt', None))
+    metadata = _make_grid_metadata(radars)
+    return Grid(fields, axes, metadata)
 
-    for field in grids.keys():
-        if field == 'ROI':
-            fields['ROI'] = {
-                'data': grids['ROI'],
-                'standard_name': 'radius_of_influence',
-                'long_name': 'Radius of influence for mapping',
-                'units': 'm',
-                'least_significant_digit': 1,
-                '_FillValue': get_fillvalue()}
-        else:
-            fields[field] = {'data': grids[field]}
-            # copy the metadata from the radar to the grid
-            for key in first_radar.fields[field].keys():
-                if key == 'data':
-                    continue
-                fields[field][key] = first_radar.fields[field][key]
+
+def _make_grid_field(first_radar, field, data):
+    """ Return a grid field dictionary with metadata from the radar. """
+    if field == 'ROI':
+        return {
+            'data': data,
+            'standard_name': 'radius_of_influence',
+            'long_name': 'Radius of influence for mapping',
+            'units': 'm',
+            'least_significant_digit': 1,
+            '_FillValue': get_fillvalue()}
+    field_dic = {'data': data}
+    # copy the metadata from the radar to the grid
+    for key in first_radar.fields[field].keys():
+        if key == 'data':
+            continue
+        field_dic[key] = first_radar.fields[field][key]
+    return field_dic
+
+
+def _make_grid_axes(radars, grid_shape, grid_limits, grid_origin=None,
+                    grid_origin_alt=None):
+    """ Return the axes dictionary of a grid mapped from radars. """
+    first_radar = radars[0]
 
     # time dictionaries
     time = {
@@ -150,15 +172,15 @@ def grid_from_radars(radars, grid_shape, grid_limits,
              'positive': 'up'}
 
     # grid origin location dictionaries
-    if 'grid_origin' in kwargs:
-        lat = np.array([kwargs['grid_origin'][0]])
-        lon = np.array([kwargs['grid_origin'][1]])
+    if grid_origin is not None:
+        lat = np.array([grid_origin[0]])
+        lon = np.array([grid_origin[1]])
     else:
         lat = first_radar.latitude['data']
         lon = first_radar.longitude['data']
 
-    if 'grid_origin_alt' in kwargs:
-        alt = np.array([kwargs['grid_origin_alt']])
+    if grid_origin_alt is not None:
+        alt = np.array([grid_origin_alt])
     else:
         alt = first_radar.altitude['data']
 
@@ -194,9 +216,12 @@ def grid_from_radars(radars, grid_shape, grid_limits,
             'alt': altorigin,
             'lat': latorigin,
             'lon': lonorigin}
+    return axes
+
 
-    # metadata dictionary
-    metadata = dict(first_radar.metadata)
+def _make_grid_metadata(radars):
+    """ Return the metadata dictionary of a grid mapped from radars. """
+    metadata = dict(radars[0].metadata)
 
     # add radar_{0,1, ...}_{lat, lon, alt, instrument_name} key/value pairs
     # to the metadata dictionary.
@@ -210,8 +235,7 @@ def grid_from_radars(radars, grid_shape, grid_limits,
         else:
             i_name = ''
         metadata['radar_{0:d}_instrument_name'.format(i)] = i_name
-
-    return Grid(fields, axes, metadata)
+    return metadata
 
 
 class NNLocator:
@@ -277,14 +301,59 @@ class NNLocator:
             ind, dist = self.tree.query_radius(q, r, return_distance=True)
             return ind[0], dist[0]
 
+    def find_neighbors_and_dists_flat(self, qs, rs):
+        """
+        Find all neighbors and distances for a block of query points.
+
+        The neighbors of all query points are returned in flat (ragged)
+        arrays, the neighbors of query point i are located at
+        ``ind[offsets[i]:offsets[i] + counts[i]]`` where `offsets` is the
+        cumulative sum of `counts` starting at zero.
+
+        Parameters
+        ----------
+        qs : array, (n_points, n_dimensions)
+            Points to query.
+        rs : array, (n_points, )
+            Distance within which neighbors are returned for each point.
+
+        Returns
+        -------
+        ind : array of intergers
+            Indices of the neighbors of all query points.
+        dist : array of floats
+            Distances to the neighbors of all query points.
+        counts : array of integers
+            Number of neighbors of each query point.
+
+        """
+        qs = np.ascontiguousarray(qs, dtype=np.float64)
+        rs = np.ascontiguousarray(rs, dtype=np.float64)
+
+        if self._algorithm == 'kd_tree':
+            ind, counts = self.tree.query_ball_points_flat(qs, rs)
+            owner = np.repeat(np.arange(len(qs)), counts)
+            diff = self.tree.data[ind] - qs[owner]
+            dist = np.sqrt(np.sum(diff * diff, axis=1))
+            return ind, dist, counts
+
+        elif self._algorithm == 'ball_tree':
+            ind, dist = self.tree.query_radius(qs, rs, return_distance=True)
+            counts = np.array([len(i) for i in ind], dtype=np.intp)
+            if counts.sum() == 0:
+                return (np.array([], dtype=np.intp), np.array([]), counts)
+            ind = np.concatenate(ind).astype(np.intp)
+            dist = np.concatenate(dist)
+            return ind, dist, counts
+
 
 def map_to_grid(radars, grid_shape, grid_limits, grid_origin=None,
                 grid_origin_alt=None, fields=None, gatefilters=False,
                 map_roi=True, weighting_function='Barnes', toa=17000.0,
                 copy_field_data=True, algorithm='kd_tree', leafsize=10.,
-                roi_func='dist_beam', constant_roi=500.,
-                z_factor=0.05, xy_factor=0.02, min_radius=500.0,
-                h_factor=1.0, nb=1.5, bsp=1.0, **kwargs):
+                roi_func='dist_beam', constant_roi=500., z_factor=0.05,
+                xy_factor=0.02, min_radius=500.0, h_factor=1.0, nb=1.5,
+                bsp=1.0, block_size=None, **kwargs):
     """
     Map one or more radars to a Cartesian grid.
 
@@ -393,6 +462,15 @@ def map_to_grid(radars, grid_shape, grid_limits, grid_origin=None,
         to store the tree. The optimal value depends on the nature of the
         problem. This value should only effect the speed of the gridding,
         not the results.
+    block_size : int or None
+        Number of grid points to interpolate at once.  When specified
+        the neighbors of blocks of this many grid points are found with a
+        single query of the neighbor lookup tree and the weighting of the
+        neighbors is performed using vectorized operations over the entire
+        block.  This is typically much faster than the default, None, which
+        interpolates each grid point individually.  Larger blocks require
+        more memory.  This value should only effect the speed of the
+        gridding, not the results.
 
     Returns
     -------
@@ -425,6 +503,8 @@ def map_to_grid(radars, grid_shape, grid_limits, grid_origin=None,
         raise ValueError('unknown weighting_function')
     if algorithm not in ['kd_tree', 'ball_tree']:
         raise ValueError('unknow algorithm: %s' % algorithm)
+    if block_size is not None and int(block_size) < 1:
+        raise ValueError('block_size must be a positive integer or None')
     badval = get_fillvalue()
 
     # find the grid origin if not given
@@ -483,18 +563,17 @@ def map_to_grid(radars, grid_shape, grid_limits, grid_origin=None,
         z_disp = float(radar.altitude['data']) - grid_origin_alt
         offsets.append((z_disp, y_disp, x_disp))
 
-        # calculate cartesian locations of gates
-        rg, azg = np.meshgrid(radar.range['data'], radar.azimuth['data'])
-        rg, eleg = np.meshgrid(radar.range['data'], radar.elevation['data'])
-        xg_loc, yg_loc, zg_loc = radar_coords_to_cart(rg / 1000., azg, eleg)
-        del rg, azg, eleg
+        # cartesian locations of gates, these are cached by the radar
+        xg_loc = radar.gate_x['data']
+        yg_loc = radar.gate_y['data']
+        zg_loc = radar.gate_z['data']
 
         # add gate locations to gate_locations array
         start, end = gate_offset[iradar], gate_offset[iradar + 1]
-        gate_locations[start:end, 0] = (zg_loc + z_disp).flat
-        gate_locations[start:end, 1] = (yg_loc + y_disp).flat
-        gate_locations[start:end, 2] = (xg_loc + x_disp).flat
-        del xg_loc, yg_loc
+        gate_locations[start:end, 0] = zg_loc.flat
+        gate_locations[start:end, 1] = yg_loc.flat
+        gate_locations[start:end, 2] = xg_loc.flat
+        gate_locations[start:end] += (z_disp, y_disp, x_disp)
 
         # determine which gates should be included in the interpolation
         gflags = zg_loc < toa      # include only those below toa
@@ -592,56 +671,94 @@ def map_to_grid(radars, grid_shape, grid_limits, grid_origin=None,
     if map_roi:
         roi = np.empty((nz, ny, nx), dtype=np.float64)
 
-    # interpolate field values for each point in the grid
-    for iz, iy, ix in np.ndindex(nz, ny, nx):
+    if block_size is not None:
+        # interpolate field values for blocks of grid points
+        block_size = int(block_size)
+        for block_start in range(0, nz * ny * nx, block_size):
+            block_end = min(block_start + block_size, nz * ny * nx)
+            iz, iy, ix = np.unravel_index(
+                np.arange(block_start, block_end), (nz, ny, nx))
+
+            # calculate the grid points in the block
+            xs = x_start + x_step * ix
+            ys = y_start + y_step * iy
+            zs = z_start + z_step * iz
+            rs = _roi_for_points(roi_func, zs, ys, xs)
+            if map_roi:
+                roi[iz, iy, ix] = rs
+
+            # find neighbors and distances of all points in the block
+            ind, dist, counts = nnlocator.find_neighbors_and_dists_flat(
+                np.column_stack((zs, ys, xs)), rs)
+
+            # find the field values for all neighbors
+            if copy_field_data:
+                nn_field_data = filtered_field_data[ind]
+            else:
+                r_nums, e_nums = divmod(lookup[ind], total_gates)
+                npoints = r_nums.size
+                r_nums = r_nums.astype(np.intc)
+                e_nums = e_nums.astype(np.intc)
+                nn_field_data = np.empty((npoints, nfields), np.float64)
+                _load_nn_field_data(field_data_objs, nfields, npoints, r_nums,
+                                    e_nums, nn_field_data)
+
+            grid_data[iz, iy, ix] = _weight_neighbors_in_block(
+                nn_field_data, dist, counts, rs, weighting_function, badval)
 
-        # calculate the grid point
-        x = x_start + x_step * ix
-        y = y_start + y_step * iy
-        z = z_start + z_step * iz
-        r = roi_func(z, y, x)
-        if map_roi:
-            roi[iz, iy, ix] = r
+    else:
+        # interpolate field values for each point in the grid
+        for iz, iy, ix in np.ndindex(nz, ny, nx):
 
-        # find neighbors and distances
-        ind, dist = nnlocator.find_neighbors_and_dists((z, y, x), r)
+            # calculate the grid point
+            x = x_start + x_step * ix
+            y = y_start + y_step * iy
+            z = z_start + z_step * iz
+            r = roi_func(z, y, x)
+            if map_roi:
+                roi[iz, iy, ix] = r
 
-        if len(ind) == 0:
-            # when there are no neighbors, mark the grid point as bad
-            grid_data[iz, iy, ix] = np.ma.masked
-            grid_data.data[iz, iy, ix] = badval
-            continue
+            # find neighbors and distances
+            ind, dist = nnlocator.find_neighbors_and_dists((z, y, x), r)
 
-        # find the field values for all neighbors
-        if copy_field_data:
-            # copy_field_data == True, a slice will get the field data.
-            nn_field_data = filtered_field_data[ind]
-        else:
-            # copy_field_data == False, use the lookup table to find the
-            # radar numbers and gate numbers for the neighbors.  Then
-            # use the _load_nn_field_data function to load this data from
-            # the field data object array.  This is done in Cython for speed.
-            r_nums, e_nums = divmod(lookup[ind], total_gates)
-            npoints = r_nums.size
-            r_nums = r_nums.astype(np.intc)
-            e_nums = e_nums.astype(np.intc)
-            nn_field_data = np.empty((npoints, nfields), np.float64)
-            _load_nn_field_data(field_data_objs, nfields, npoints, r_nums,
-                                e_nums, nn_field_data)
-
-        # preforms weighting of neighbors.
-        dist2 = dist * dist
-        r2 = r * r
-
-        if weighting_function.upper() == 'CRESSMAN':
-            weights = (r2 - dist2) / (r2 + dist2)
-            value = np.ma.average(nn_field_data, weights=weights, axis=0)
-        elif weighting_function.upper() == 'BARNES':
-            w = np.exp(-dist2 / (2.0 * r2)) + 1e-5
-            w /= np.sum(w)
-            value = np.ma.dot(w, nn_field_data)
-
-        grid_data[iz, iy, ix] = value
+            if len(ind) == 0:
+                # when there are no neighbors, mark the grid point as bad
+                grid_data[iz, iy, ix] = np.ma.masked
+                grid_data.data[iz, iy, ix] = badval
+                continue
+
+            # find the field values for all neighbors
+            if copy_field_data:
+                # copy_field_data == True, a slice will get the field data.
+                nn_field_data = filtered_field_data[ind]
+            else:
+                # copy_field_data == False, use the lookup table to find the
+                # radar numbers and gate numbers for the neighbors.  Then
+                # use the _load_nn_field_data function to load this data
+                # from the field data object array.  This is done in Cython
+                # for speed.
+                r_nums, e_nums = divmod(lookup[ind], total_gates)
+                npoints = r_nums.size
+                r_nums = r_nums.astype(np.intc)
+                e_nums = e_nums.astype(np.intc)
+                nn_field_data = np.empty((npoints, nfields), np.float64)
+                _load_nn_field_data(field_data_objs, nfields, npoints,
+                                    r_nums, e_nums, nn_field_data)
+
+            # preforms weighting of neighbors.
+            dist2 = dist * dist
+            r2 = r * r
+
+            if weighting_function.upper() == 'CRESSMAN':
+                weights = (r2 - dist2) / (r2 + dist2)
+                value = np.ma.average(
+                    nn_field_data, weights=weights, axis=0)
+            elif weighting_function.upper() == 'BARNES':
+                w = np.exp(-dist2 / (2.0 * r2)) + 1e-5
+                w /= np.sum(w)
+                value = np.ma.dot(w, nn_field_data)
+
+            grid_data[iz, iy, ix] = value
 
     # create and return the grid dictionary
     grids = dict([(f, grid_data[..., i]) for i, f in enumerate(fields)])
@@ -650,9 +767,398 @@ def map_to_grid(radars, grid_shape, grid_limits, grid_origin=None,
     return grids
 
 
+class GridMapper(object):
+    """
+    A persistent engine for mapping a series of radar volumes to a grid.
+
+    The neighbor lookup tree of the gate locations and the neighbors of
+    every grid point, along with their distances, are found once when the
+    mapper is created.  Radars whose geometry matches those used to create
+    the mapper, for example consecutive volumes collected using the same
+    scan strategy, can then be mapped by gathering and weighting the field
+    data of the stored neighbors without rebuilding or querying the tree.
+    The grids produced are identical to those from :py:func:`map_to_grid`.
+
+    Parameters not defined below are identical to those in
+    :py:func:`map_to_grid`.
+
+    Parameters
+    ----------
+    radars : Radar or tuple of Radar objects.
+        Radar objects whose geometry (ranges, azimuth and elevation angles
+        and location) is used to find the neighbors of each grid point.
+        Field data is not used.
+    block_size : int
+        Number of grid points whose neighbors are found, and later weighted,
+        at once.
+
+    Attributes
+    ----------
+    grid_shape : tuple
+        Number of points in the grid (z, y, x).
+    grid_limits : tuple
+        Grid limits in meters for the z, y, x coordinates.
+    nnlocator : NNLocator
+        Neighbor lookup tree of the gate locations below the top of
+        atmosphere.
+    ind : array
+        Indices, in the flattened gates of all radars, of the neighbors of
+        all grid points.  The neighbors of grid point i are located at
+        ``ind[indptr[i]:indptr[i + 1]]``.
+    dist : array
+        Distances from each grid point to its neighbors.
+    indptr : array
+        Location of the neighbors of each grid point in `ind` and `dist`.
+    roi : array
+        Radius of influence at each grid point.
+
+    """
+
+    def __init__(self, radars, grid_shape, grid_limits, grid_origin=None,
+                 grid_origin_alt=None, weighting_function='Barnes',
+                 toa=17000.0, algorithm='kd_tree', leafsize=10.,
+                 block_size=10000, roi_func='dist_beam', constant_roi=500.,
+                 z_factor=0.05, xy_factor=0.02, min_radius=500.0,
+                 h_factor=1.0, nb=1.5, bsp=1.0):
+        """ initialize. """
+        if isinstance(radars, Radar):
+            radars = (radars, )
+        if weighting_function.upper() not in ['CRESSMAN', 'BARNES']:
+            raise ValueError('unknown weighting_function')
+        if algorithm not in ['kd_tree', 'ball_tree']:
+            raise ValueError('unknow algorithm: %s' % algorithm)
+        if int(block_size) < 1:
+            raise ValueError('block_size must be a positive integer')
+
+        self.grid_shape = tuple(int(i) for i in grid_shape)
+        self.grid_limits = tuple(tuple(float(j) for j in i)
+                                 for i in grid_limits)
+        self.weighting_function = weighting_function
+        self.block_size = int(block_size)
+
+        # geometry of the radars
+        self._geometries = [
+            (np.array(radar.range['data']), np.array(radar.azimuth['data']),
+             np.array(radar.elevation['data'])) for radar in radars]
+        ngates_per_radar = [radar.nrays * radar.ngates for radar in radars]
+        self._gate_offset = np.cumsum([0] + ngates_per_radar)
+        total_gates = self._gate_offset[-1]
+
+        # gate locations, only gates below the top of atmosphere are
+        # included in the neighbor lookup tree
+        grid_origin = _parse_grid_origin(grid_origin, radars)
+        if grid_origin_alt is None:
+            grid_origin_alt = float(radars[0].altitude['data'])
+        offsets = _find_offsets(radars, grid_origin, grid_origin_alt)
+        gate_locations = np.empty((total_gates, 3), dtype=np.float64)
+        include_gate = np.empty((total_gates, ), dtype=np.bool_)
+        for iradar, (radar, offset) in enumerate(zip(radars, offsets)):
+            start = self._gate_offset[iradar]
+            end = self._gate_offset[iradar + 1]
+            zg_loc = radar.gate_z['data']
+            gate_locations[start:end, 0] = zg_loc.flat
+            gate_locations[start:end, 1] = radar.gate_y['data'].flat
+            gate_locations[start:end, 2] = radar.gate_x['data'].flat
+            gate_locations[start:end] += offset
+            include_gate[start:end] = (zg_loc < toa).flat
+        included_gates = np.flatnonzero(include_gate)
+        self.nnlocator = NNLocator(
+            gate_locations[included_gates], algorithm=algorithm,
+            leafsize=leafsize)
+
+        if not hasattr(roi_func, '__call__'):
+            if roi_func == 'constant':
+                roi_func = _gen_roi_func_constant(constant_roi)
+            elif roi_func == 'dist':
+                roi_func = _gen_roi_func_dist(
+                    z_factor, xy_factor, min_radius, offsets)
+            elif roi_func == 'dist_beam':
+                roi_func = _gen_roi_func_dist_beam(
+                    h_factor, nb, bsp, min_radius, offsets)
+            else:
+                raise ValueError('unknown roi_func: %s' % roi_func)
+
+        # find the neighbors of blocks of grid points
+        npoints = int(np.prod(self.grid_shape))
+        grid_starts, grid_steps = _find_grid_params(grid_shape, grid_limits)
+        roi = np.empty((npoints, ), dtype=np.float64)
+        counts = np.empty((npoints, ), dtype=np.intp)
+        ind = []
+        dist = []
+        for block_start in range(0, npoints, self.block_size):
+            block_end = min(block_start + self.block_size, npoints)
+            points = np.unravel_index(
+                np.arange(block_start, block_end), self.grid_shape)
+            zs, ys, xs = [start + step * point for start, step, point in
+                          zip(grid_starts, grid_steps, points)]
+            rs = _roi_for_points(roi_func, zs, ys, xs)
+            roi[block_start:block_end] = rs
+            block_ind, block_dist, block_counts = (
+                self.nnlocator.find_neighbors_and_dists_flat(
+                    np.column_stack((zs, ys, xs)), rs))
+            counts[block_start:block_end] = block_counts
+            ind.append(included_gates[block_ind])
+            dist.append(block_dist)
+
+        self.ind = np.concatenate(ind)
+        self.dist = np.concatenate(dist)
+        self.indptr = np.zeros((npoints + 1, ), dtype=np.intp)
+        np.cumsum(counts, out=self.indptr[1:])
+        self.roi = roi.reshape(self.grid_shape)
+
+    def matches(self, radars, angle_tolerance=0.1, range_tolerance=1.0):
+        """
+        Return True if the mapper can be used to map the given radars.
+
+        Parameters
+        ----------
+        radars : Radar or tuple of Radar objects.
+            Radars to check, in the same order as those used to create the
+            mapper.
+        angle_tolerance : float
+            Maximum difference in degrees between the azimuth and elevation
+            angles of the radars and those used to create the mapper.
+        range_tolerance : float
+            Maximum difference in meters between the gate ranges of the
+            radars and those used to create the mapper.
+
+        Returns
+        -------
+        matches : bool
+            True if the geometry of the radars match those of the mapper.
+
+        """
+        if isinstance(radars, Radar):
+            radars = (radars, )
+        if len(radars) != len(self._geometries):
+            return False
+        return all(
+            _geometry_matches(radar, ranges, azimuths, elevations,
+                              angle_tolerance, range_tolerance)
+            for radar, (ranges, azimuths, elevations) in
+            zip(radars, self._geometries))
+
+    def map_to_grid(self, radars, fields=None, gatefilters=False,
+                    map_roi=True, check_geometry=True, **kwargs):
+        """
+        Map one or more radars to the grid.
+
+        Parameters
+        ----------
+        radars : Radar or tuple of Radar objects.
+            Radar objects with the same geometry as the radars used to
+            create the mapper, in the same order.
+        fields : list or None
+            List of fields within the radar objects which will be mapped to
+            the cartesian grid. None, the default, will map the fields which
+            are present in all the radar objects.
+        gatefilters : GateFilter, tuple of GateFilter objects, optional
+            Specify what gates from each radar will be included in the
+            interpolation onto the grid, see :py:func:`map_to_grid`.
+        map_roi : bool
+            True to include a radius of influence field in the returned
+            dictionary under the 'ROI' key.
+        check_geometry : bool
+            True to verify that the geometry of the radars matches that of
+            the mapper using :py:meth:`matches` with the default
+            tolerances.  False only checks the number of gates.
+
+        Returns
+        -------
+        grids : dict
+            Dictionary of mapped fields, see :py:func:`map_to_grid`.
+
+        """
+        if isinstance(radars, Radar):
+            radars = (radars, )
+        ngates_per_radar = [radar.nrays * radar.ngates for radar in radars]
+        if (len(radars) != len(self._geometries) or
+                np.any(np.diff(self._gate_offset) != ngates_per_radar)):
+            raise ValueError('Radar gates do not match the mapper gates')
+        if check_geometry and not self.matches(radars):
+            raise ValueError(
+                'Radar geometry does not match the mapper geometry')
+
+        if isinstance(gatefilters, GateFilter):
+            gatefilters = (gatefilters, )  # make tuple if single filter
+        if gatefilters is False:
+            gatefilters = (False, ) * len(radars)
+        if gatefilters is None:
+            gatefilters = (None, ) * len(radars)
+        if len(gatefilters) != len(radars):
+            raise ValueError(
+                'Length of gatefilters must match length of radars')
+
+        if fields is None:
+            fields = set(radars[0].fields.keys())
+            for radar in radars[1:]:
+                fields = fields.intersection(radar.fields.keys())
+            fields = list(fields)
+        nfields = len(fields)
+        badval = get_fillvalue()
+
+        # gather the field data and the gates excluded by the gatefilters
+        total_gates = self._gate_offset[-1]
+        field_data = np.ma.empty((total_gates, nfields), dtype=np.float64)
+        include_gate = None
+        for iradar, (radar, gatefilter) in enumerate(
+                zip(radars, gatefilters)):
+            start = self._gate_offset[iradar]
+            end = self._gate_offset[iradar + 1]
+            for ifield, field in enumerate(fields):
+                field_data[start:end, ifield] = (
+                    radar.fields[field]['data'].ravel())
+            if gatefilter is False:
+                continue
+            if gatefilter is None:
+                gatefilter = moment_based_gate_filter(radar, **kwargs)
+            if include_gate is None:
+                include_gate = np.ones((total_gates, ), dtype=np.bool_)
+            include_gate[start:end] = gatefilter.gate_included.flat
+
+        # weight the neighbors of blocks of grid points
+        npoints = len(self.indptr) - 1
+        grid_data = np.ma.empty((npoints, nfields), dtype=np.float64)
+        grid_data.set_fill_value(badval)
+        roi = self.roi.ravel()
+        for block_start in range(0, npoints, self.block_size):
+            block_end = min(block_start + self.block_size, npoints)
+            first = self.indptr[block_start]
+            last = self.indptr[block_end]
+            ind = self.ind[first:last]
+            dist = self.dist[first:last]
+            counts = np.diff(self.indptr[block_start:block_end + 1])
+            if include_gate is not None:
+                # excluded gates are removed from the neighbors
+                keep = include_gate[ind]
+                owner = np.repeat(np.arange(block_end - block_start), counts)
+                counts = np.bincount(
+                    owner[keep], minlength=block_end - block_start)
+                ind = ind[keep]
+                dist = dist[keep]
+            grid_data[block_start:block_end] = _weight_neighbors_in_block(
+                field_data[ind], dist, counts, roi[block_start:block_end],
+                self.weighting_function, badval)
+
+        grid_data = grid_data.reshape(self.grid_shape + (nfields, ))
+        grids = dict([(f, grid_data[..., i]) for i, f in enumerate(fields)])
+        if map_roi:
+            grids['ROI'] = self.roi
+        return grids
+
+
+def _weight_neighbors_in_block(nn_field_data, dist, counts, rs,
+                               weighting_function, badval):
+    """
+    Interpolate a block of grid points from the weighted neighbors.
+
+    Parameters
+    ----------
+    nn_field_data : 2D array or masked array
+        Field data for the neighbors of all grid points in the block,
+        dimensions are ordered as neighbor, field.
+    dist : 1D array
+        Distance to each neighbor.
+    counts : 1D array
+        Number of neighbors of each grid point in the block, the neighbors
+        of each grid point are stored contiguously in `nn_field_data`
+        and `dist`.
+    rs : 1D array
+        Radius of influence for each grid point in the block.
+    weighting_function : 'Barnes' or 'Cressman'
+        Function used to weight the neighbors.
+    badval : float
+        Value used for grid points which cannot be interpolated.
+
+    Returns
+    -------
+    values : masked array
+        Interpolated field values for each grid point in the block,
+        dimensions are ordered as grid point, field.  Grid points with no
+        neighbors, or with only masked neighbors, are masked.  When Cressman
+        weighting is used grid points with NaN neighbors are also masked.
+
+    """
+    npoints = len(counts)
+    nfields = nn_field_data.shape[1]
+    owner = np.repeat(np.arange(npoints), counts)
+
+    # weights of each neighbor
+    dist2 = dist * dist
+    r2 = np.repeat(rs * rs, counts)
+    if weighting_function.upper() == 'CRESSMAN':
+        weights = (r2 - dist2) / (r2 + dist2)
+    elif weighting_function.upper() == 'BARNES':
+        weights = np.exp(-dist2 / (2.0 * r2)) + 1e-5
+
+    # weighted sums over the neighbors of each grid point, masked neighbors
+    # do not contribute to the sums.
+    valid = ~np.ma.getmaskarray(nn_field_data)
+    data = np.where(valid, np.ma.getdata(nn_field_data), 0)
+    values = np.empty((npoints, nfields), dtype=np.float64)
+    wsums = np.empty((npoints, nfields), dtype=np.float64)
+    for i in range(nfields):
+        values[:, i] = np.bincount(
+            owner, weights * data[:, i], minlength=npoints)
+        wsums[:, i] = np.bincount(
+            owner, weights * valid[:, i], minlength=npoints)
+
+    if weighting_function.upper() == 'CRESSMAN':
+        # average of the unmasked neighbors
+        norm = wsums
+    else:
+        # BARNES, weights are normalized using all neighbors, masked
+        # neighbors are treated as having zero value
+        norm = np.bincount(owner, weights, minlength=npoints)
+        norm = np.repeat(norm[:, np.newaxis], nfields, axis=1)
+
+    mask = np.logical_or(wsums == 0, counts[:, np.newaxis] == 0)
+    values[~mask] /= norm[~mask]
+    if weighting_function.upper() == 'CRESSMAN':
+        # invalid averages are masked as np.ma.average does, these occur
+        # when unmasked neighbors are NaN, which is how masked gates are
+        # loaded when the field data is not copied.
+        mask = np.logical_or(mask, ~np.isfinite(values))
+    values[mask] = badval
+    return np.ma.masked_array(values, mask)
+
+
+def _geometry_matches(radar, ranges, azimuths, elevations, angle_tolerance,
+                      range_tolerance):
+    """
+    Return True if the gate ranges and ray angles of a radar match those
+    given within the given tolerances.
+    """
+    if radar.nrays != len(azimuths) or radar.ngates != len(ranges):
+        return False
+    az_diff = np.abs(radar.azimuth['data'] - azimuths) % 360.
+    az_diff = np.minimum(az_diff, 360. - az_diff)
+    el_diff = np.abs(radar.elevation['data'] - elevations)
+    rng_diff = np.abs(radar.range['data'] - ranges)
+    return bool(np.all(az_diff <= angle_tolerance) and
+                np.all(el_diff <= angle_tolerance) and
+                np.all(rng_diff <= range_tolerance))
+
+
 # Radius of Influence (RoI) functions
 
 
+def _roi_for_points(roi_func, zs, ys, xs):
+    """
+    Return the radius of influence at an array of grid points.
+
+    The built in RoI functions, those with a true vectorized attribute, are
+    evaluated for all points at once, other functions are called for each
+    point in turn.
+    """
+    if getattr(roi_func, 'vectorized', False):
+        rs = np.empty((len(zs), ), dtype=np.float64)
+        rs[:] = roi_func(zs, ys, xs)
+        return rs
+    return np.array([roi_func(z, y, x) for z, y, x in zip(zs, ys, xs)],
+                    dtype=np.float64)
+
+
 def example_roi_func_constant(zg, yg, xg):
     """
     Example RoI function which returns a constant radius.
@@ -683,6 +1189,7 @@ def _gen_roi_func_constant(constant_roi):
         """ constant radius of influence function. """
         return constant_roi
 
+    roi.vectorized = True
     return roi
 
 
@@ -729,11 +1236,15 @@ def _gen_roi_func_dist(z_factor, xy_factor, min_radius, offsets):
 
     def roi(zg, yg, xg):
         """ dist radius of influence function. """
+        # grid locations may be scalars or arrays, the minimum radius from
+        # all radars is found along a trailing radar dimension
+        zg, yg, xg = [np.asarray(v)[..., np.newaxis] for v in (zg, yg, xg)]
         r = (z_factor * (zg - zg_off) +
              xy_factor * np.sqrt((xg - xg_off)**2 + (yg - yg_off)**2) +
              min_radius)
-        return min(r)
+        return np.min(r, axis=-1)
 
+    roi.vectorized = True
     return roi
 
 
@@ -783,9 +1294,13 @@ def _gen_roi_func_dist_beam(h_factor, nb, bsp, min_radius, offsets):
 
     def roi(zg, yg, xg):
         """ dist_beam radius of influence function. """
+        # grid locations may be scalars or arrays, the minimum radius from
+        # all radars is found along a trailing radar dimension
+        zg, yg, xg = [np.asarray(v)[..., np.newaxis] for v in (zg, yg, xg)]
         r = (h_factor * ((zg - zg_off) / 20.0) +
              np.sqrt((yg - yg_off)**2 + (xg - xg_off)**2) *
              np.tan(nb * bsp * np.pi / 180.0) + min_radius)
-        return min(r)
+        return np.min(r, axis=-1)
 
+    roi.vectorized = True
     return roi
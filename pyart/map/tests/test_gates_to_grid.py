@@ -71,6 +71,22 @@ def test_map_to_grid_constant_roi():
     assert_array_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
 
 
+def test_map_to_grid_python_roi_class():
+    # RoIFunction subclasses implemented in Python are evaluated with the GIL
+    from pyart.map._gate_to_grid_map import RoIFunction
+
+    class PythonConstantRoI(RoIFunction):
+        def get_roi(self, z, y, x):
+            return 30.
+
+    radar = pyart.testing.make_target_radar()
+    args = dict(COMMON_MAP_TO_GRID_ARGS)
+    args['roi_func'] = PythonConstantRoI()
+    grids = pyart.map.map_gates_to_grid((radar,), **args)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_array_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+
+
 def test_map_to_grid_dist_roi():
     radar = pyart.testing.make_target_radar()
     grids = pyart.map.map_gates_to_grid(
@@ -199,3 +215,171 @@ def test_example_roi_funcs():
     assert pyart.map.example_roi_func_constant(0, 0, 0) == 500.
     assert pyart.map.example_roi_func_dist(0, 0, 0) == 500.
     assert pyart.map.example_roi_func_dist_beam(0, 0, 0) == 500.
+
+
+def test_map_to_grid_nthreads():
+    radar = pyart.testing.make_target_radar()
+    radar.fields['reflectivity']['data'][0:100, 25] = 99999.0
+    gatefilter = pyart.filters.GateFilter(radar)
+    gatefilter.exclude_above('reflectivity', 41.0)
+    grids = pyart.map.map_gates_to_grid(
+        (radar, radar), gatefilters=(gatefilter, gatefilter),
+        **COMMON_MAP_TO_GRID_ARGS)
+    for nthreads in [2, 3, 7]:
+        thread_grids = pyart.map.map_gates_to_grid(
+            (radar, radar), gatefilters=(gatefilter, gatefilter),
+            nthreads=nthreads, **COMMON_MAP_TO_GRID_ARGS)
+        refl = grids['reflectivity']
+        thread_refl = thread_grids['reflectivity']
+        assert_array_equal(thread_refl.mask, refl.mask)
+        assert np.allclose(thread_refl, refl)
+        assert_array_equal(thread_grids['ROI'], grids['ROI'])
+
+    assert_raises(ValueError, pyart.map.map_gates_to_grid, (radar, ),
+                  nthreads=0, **COMMON_MAP_TO_GRID_ARGS)
+
+
+def test_map_to_grid_native_dtypes():
+    radar = pyart.testing.make_target_radar()
+    refl = radar.fields['reflectivity']['data']
+    grids = pyart.map.map_gates_to_grid(radar, **COMMON_MAP_TO_GRID_ARGS)
+
+    # scaled integer fields are mapped without conversion
+    for dtype in ['uint8', 'int16', 'uint16', 'int32']:
+        radar.fields['reflectivity'] = {
+            'data': ((refl + 10.) * 2).astype(dtype),
+            'scale_factor': 0.5, 'add_offset': -10.}
+        int_grids = pyart.map.map_gates_to_grid(
+            radar, **COMMON_MAP_TO_GRID_ARGS)
+        assert np.allclose(int_grids['reflectivity'], grids['reflectivity'])
+
+    # float64 and non-contiguous fields
+    radar.fields['reflectivity'] = {'data': refl.astype('float64')}
+    grids64 = pyart.map.map_gates_to_grid(radar, **COMMON_MAP_TO_GRID_ARGS)
+    assert np.allclose(grids64['reflectivity'], grids['reflectivity'])
+
+    big_refl = np.empty((refl.shape[0], refl.shape[1] * 2), 'float32')
+    big_refl[:, ::2] = refl
+    radar.fields['reflectivity'] = {'data': big_refl[:, ::2]}
+    grids_nc = pyart.map.map_gates_to_grid(radar, **COMMON_MAP_TO_GRID_ARGS)
+    assert np.allclose(grids_nc['reflectivity'], grids['reflectivity'])
+
+
+def test_map_to_grid_masked_field():
+    radar = pyart.testing.make_target_radar()
+    fdata = np.ma.masked_greater(radar.fields['reflectivity']['data'], 41.)
+    fdata[0:100, 25] = 99999.0
+    fdata[0:100, 25] = np.ma.masked
+    radar.fields['reflectivity']['data'] = fdata
+    grids = pyart.map.map_gates_to_grid(radar, **COMMON_MAP_TO_GRID_ARGS)
+    assert grids['reflectivity'].max() < 41.0
+
+
+def test_map_to_grid_nearest():
+    radar = pyart.testing.make_target_radar()
+    grids = pyart.map.map_gates_to_grid(
+        radar, weighting_function='Nearest', **COMMON_MAP_TO_GRID_ARGS)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_array_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+
+    # levels further than the radius of influence from the beam are masked
+    assert np.all(grids['reflectivity'].mask[0])
+    assert np.all(grids['reflectivity'].mask[2])
+
+
+def test_map_to_grid_bilinear():
+    radar = pyart.testing.make_target_radar()
+    grids = pyart.map.map_gates_to_grid(
+        radar, weighting_function='Bilinear', **COMMON_MAP_TO_GRID_ARGS)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_array_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+    assert np.all(grids['reflectivity'].mask[0])
+    assert np.all(grids['reflectivity'].mask[2])
+
+    # a field equal to the gate range is interpolated to the point distance
+    radar.fields['reflectivity']['data'][:] = radar.range['data']
+    grids = pyart.map.map_gates_to_grid(
+        radar, weighting_function='Bilinear', **COMMON_MAP_TO_GRID_ARGS)
+    x = np.linspace(-900, 900, 10)
+    y = np.linspace(-900, 900, 9)
+    dist = np.sqrt(x[np.newaxis, :] ** 2 + y[:, np.newaxis] ** 2)
+    inside = dist < 1000.
+    assert np.allclose(grids['reflectivity'][1][inside], dist[inside],
+                       atol=1.)
+    assert np.all(grids['reflectivity'].mask[1][~inside])
+
+
+def test_map_to_grid_nearest_gatefilter():
+    radar = pyart.testing.make_target_radar()
+    gatefilter = pyart.filters.GateFilter(radar)
+    gatefilter.exclude_above('reflectivity', 35.0)
+    for weighting_function in ['Nearest', 'Bilinear']:
+        grids = pyart.map.map_gates_to_grid(
+            radar, gatefilters=gatefilter,
+            weighting_function=weighting_function, **COMMON_MAP_TO_GRID_ARGS)
+        center_slice = grids['reflectivity'][1, 4, :]
+        assert np.all(center_slice.mask[[0, -1]])
+        assert_array_equal(np.round(center_slice[1:-1]),
+                           EXPECTED_CENTER_SLICE[1:-1])
+
+
+def test_map_to_grid_nearest_sector():
+    # rays on one side of the radar only, other half of the grid is masked
+    radar = pyart.testing.make_target_radar()
+    radar.azimuth['data'][:] = np.linspace(0, 179, radar.nrays)
+    grids = pyart.map.map_gates_to_grid(
+        radar, weighting_function='Bilinear', **COMMON_MAP_TO_GRID_ARGS)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert np.all(center_slice.mask[:5])
+    assert_array_equal(np.round(center_slice[5:]), EXPECTED_CENTER_SLICE[5:])
+
+
+def test_map_to_grid_roi_array():
+    radar = pyart.testing.make_target_radar()
+    args = dict(COMMON_MAP_TO_GRID_ARGS)
+    args['roi_func'] = np.ones(args['grid_shape'], dtype='float64') * 30.
+    grids = pyart.map.map_gates_to_grid(radar, **args)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_array_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+    assert np.allclose(grids['ROI'], 30.)
+
+    # array must match the grid shape
+    args['roi_func'] = np.ones((3, 9, 9))
+    assert_raises(ValueError, pyart.map.map_gates_to_grid, radar, **args)
+
+
+def test_map_to_grid_roi_vectorized_function():
+    radar = pyart.testing.make_target_radar()
+    args = dict(COMMON_MAP_TO_GRID_ARGS)
+    args['roi_func'] = lambda z, y, x: 30. + 0. * (z + y + x)
+    grids = pyart.map.map_gates_to_grid(radar, **args)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_array_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+
+    # linear functions are reproduced exactly from a coarse lattice
+    def roi_func(z, y, x):
+        return 30. + 0.01 * z + 0.02 * y - 0.01 * x
+
+    args['roi_func'] = roi_func
+    args['roi_lattice_shape'] = (2, 2, 3)
+    grids = pyart.map.map_gates_to_grid(radar, **args)
+    z, y, x = np.meshgrid(np.linspace(-400, 400, 3), np.linspace(-900, 900, 9),
+                          np.linspace(-900, 900, 10), indexing='ij')
+    assert np.allclose(grids['ROI'], roi_func(z, y, x), atol=1e-3)
+
+    args['roi_lattice_shape'] = (2, 2)
+    assert_raises(ValueError, pyart.map.map_gates_to_grid, radar, **args)
+
+
+def test_map_to_grid_roi_lattice_shape():
+    radar = pyart.testing.make_target_radar()
+    args = dict(COMMON_MAP_TO_GRID_ARGS)
+    args.update(roi_func='dist', z_factor=0.05, xy_factor=0.02,
+                min_radius=30.)
+    grids = pyart.map.map_gates_to_grid(radar, **args)
+    lattice_grids = pyart.map.map_gates_to_grid(
+        radar, roi_lattice_shape=(3, 9, 10), **args)
+    assert np.allclose(lattice_grids['ROI'], grids['ROI'])
+    lattice_grids = pyart.map.map_gates_to_grid(
+        radar, roi_lattice_shape=(2, 3, 3), **args)
+    assert np.allclose(lattice_grids['ROI'], grids['ROI'], rtol=0.15)
@@ -4,6 +4,7 @@ from __future__ import print_function
 
 import numpy as np
 from numpy.testing import assert_array_equal, assert_raises
+from numpy.testing import assert_allclose
 
 import pyart
 
@@ -140,6 +141,86 @@ def test_map_to_grid_balltree():
     assert_array_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
 
 
+def test_map_to_grid_block_size():
+    radar = pyart.testing.make_target_radar()
+    grids = pyart.map.map_to_grid((radar,), block_size=7,
+                                  **COMMON_MAP_TO_GRID_ARGS)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_array_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+
+
+def test_map_to_grid_block_size_matches_loop():
+    radar = pyart.testing.make_target_radar()
+    fdata = np.ma.masked_invalid(radar.fields['reflectivity']['data'])
+    fdata[::7, ::3] = np.ma.masked
+    radar.fields['reflectivity']['data'] = fdata
+    for weighting_function in ['Barnes', 'Cressman']:
+        for algorithm in ['kd_tree', 'ball_tree']:
+            kwargs = dict(
+                grid_shape=(3, 9, 10),
+                grid_limits=((-400.0, 400.0), (-900.0, 900.0), (-900, 900)),
+                roi_func='constant', constant_roi=75.,
+                weighting_function=weighting_function, algorithm=algorithm)
+            loop = pyart.map.map_to_grid((radar, ), **kwargs)
+            block = pyart.map.map_to_grid((radar, ), block_size=16, **kwargs)
+            loop_refl = loop['reflectivity']
+            block_refl = block['reflectivity']
+            assert_array_equal(block_refl.mask, loop_refl.mask)
+            assert_allclose(block_refl.compressed(), loop_refl.compressed())
+            assert_array_equal(block['ROI'], loop['ROI'])
+
+
+def test_map_to_grid_block_size_masked_nan_gates():
+    # masked gates with NaN data are interpolated as in the per point loop
+    radar = pyart.testing.make_target_radar()
+    data = np.ma.array(radar.fields['reflectivity']['data'], dtype='float64')
+    data[:, 5:15] = np.nan
+    data[:, 5:15] = np.ma.masked
+    radar.fields['reflectivity']['data'] = data
+    for weighting_function in ['Cressman', 'Barnes']:
+        for copy_field_data in [True, False]:
+            kwargs = dict(COMMON_MAP_TO_GRID_ARGS)
+            kwargs['weighting_function'] = weighting_function
+            kwargs['copy_field_data'] = copy_field_data
+            loop = pyart.map.map_to_grid((radar, ), **kwargs)
+            block = pyart.map.map_to_grid((radar, ), block_size=16, **kwargs)
+            loop_refl = loop['reflectivity']
+            block_refl = block['reflectivity']
+            assert_array_equal(block_refl.mask, loop_refl.mask)
+            assert_allclose(block_refl.compressed(), loop_refl.compressed())
+
+
+def test_nnlocator_find_neighbors_and_dists_flat():
+    np.random.seed(2)
+    data = np.random.random((500, 3))
+    qs = np.random.random((50, 3))
+    rs = np.random.random(50) * 0.3
+    for algorithm in ['kd_tree', 'ball_tree']:
+        nnlocator = pyart.map.grid_mapper.NNLocator(data, algorithm=algorithm)
+        ind, dist, counts = nnlocator.find_neighbors_and_dists_flat(qs, rs)
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        for i, (q, r) in enumerate(zip(qs, rs)):
+            ref_ind, ref_dist = nnlocator.find_neighbors_and_dists(q, r)
+            assert counts[i] == len(ref_ind)
+            if counts[i] == 0:
+                continue
+            ref_ind = np.asarray(ref_ind)
+            order = np.argsort(ind[offsets[i]:offsets[i + 1]])
+            ref_order = np.argsort(ref_ind)
+            assert_array_equal(
+                ind[offsets[i]:offsets[i + 1]][order], ref_ind[ref_order])
+            assert_allclose(
+                dist[offsets[i]:offsets[i + 1]][order], ref_dist[ref_order])
+
+
+def test_map_to_grid_block_size_no_copy():
+    radar = pyart.testing.make_target_radar()
+    grids = pyart.map.map_to_grid((radar, radar), copy_field_data=False,
+                                  block_size=100, **COMMON_MAP_TO_GRID_ARGS)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_array_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+
+
 def test_map_to_grid_tiny_grid():
     radar = pyart.testing.make_target_radar()
     grids = pyart.map.map_to_grid(
@@ -158,6 +239,9 @@ def test_map_to_grid_errors():
     assert_raises(ValueError, pyart.map.map_to_grid, (None, ), (1, 1, 1),
                   ((-1, 1), (-1, 1), (-1, 1)),
                   algorithm='foo')
+    assert_raises(ValueError, pyart.map.map_to_grid, (None, ), (1, 1, 1),
+                  ((-1, 1), (-1, 1), (-1, 1)),
+                  block_size=0)
     radar = pyart.testing.make_target_radar()
     assert_raises(ValueError, pyart.map.map_to_grid, (radar, ), (1, 1, 1),
                   ((-1, 1), (-1, 1), (-1, 1)),
@@ -223,3 +307,103 @@ def test_example_roi_funcs():
     assert pyart.map.example_roi_func_constant(0, 0, 0) == 500.
     assert pyart.map.example_roi_func_dist(0, 0, 0) == 500.
     assert pyart.map.example_roi_func_dist_beam(0, 0, 0) == 500.
+
+
+def test_roi_for_points():
+    # built in RoI functions evaluated for many points match the values
+    # found for each point
+    from pyart.map import grid_mapper
+    offsets = ((0, 0, 0), (100., -2000., 5000.))
+    zs = np.array([0., 500., 1500., 3000.])
+    ys = np.array([-4000., 0., 2500., 10000.])
+    xs = np.array([3000., -7000., 0., 500.])
+    for roi_func in [grid_mapper._gen_roi_func_constant(300.),
+                     grid_mapper._gen_roi_func_dist(0.05, 0.02, 500., offsets),
+                     grid_mapper._gen_roi_func_dist_beam(
+                         1.0, 1.5, 1.0, 500., offsets),
+                     lambda z, y, x: 0.1 * x + 300.]:
+        rs = grid_mapper._roi_for_points(roi_func, zs, ys, xs)
+        expected = [roi_func(z, y, x) for z, y, x in zip(zs, ys, xs)]
+        assert rs.dtype == np.float64
+        assert_array_equal(rs, expected)
+
+
+def _assert_grids_equal(grids, ref_grids):
+    """ Check that two dictionaries of grids are identical. """
+    assert set(grids.keys()) == set(ref_grids.keys())
+    for field in ref_grids.keys():
+        assert_array_equal(np.ma.getmaskarray(grids[field]),
+                           np.ma.getmaskarray(ref_grids[field]))
+        assert_allclose(np.ma.filled(grids[field], 0),
+                        np.ma.filled(ref_grids[field], 0))
+
+
+def test_grid_mapper():
+    radar = pyart.testing.make_synthetic_ppi_radar(
+        ngates=40, rays_per_sweep=36, nsweeps=3, gate_spacing=1000.)
+    args = {
+        'grid_shape': (4, 11, 12),
+        'grid_limits': ((0, 3000), (-40000, 40000), (-40000, 40000)),
+        'roi_func': 'dist_beam', 'min_radius': 2000.}
+    mapper = pyart.map.GridMapper(radar, block_size=100, **args)
+    assert mapper.matches(radar)
+
+    grids = mapper.map_to_grid(radar)
+    ref_grids = pyart.map.map_to_grid(radar, block_size=100, **args)
+    _assert_grids_equal(grids, ref_grids)
+
+    # second volume with the same geometry and different data
+    radar2 = pyart.testing.make_synthetic_ppi_radar(
+        ngates=40, rays_per_sweep=36, nsweeps=3, gate_spacing=1000.,
+        seed=2016)
+    gatefilter = pyart.filters.GateFilter(radar2)
+    gatefilter.exclude_below('reflectivity', 20.)
+    grids = mapper.map_to_grid(
+        radar2, fields=['reflectivity'], gatefilters=gatefilter)
+    ref_grids = pyart.map.map_to_grid(
+        radar2, fields=['reflectivity'], gatefilters=gatefilter,
+        block_size=100, **args)
+    _assert_grids_equal(grids, ref_grids)
+
+
+def test_grid_mapper_two_radars():
+    radar = pyart.testing.make_target_radar()
+    radar.fields['reflectivity']['data'] = np.ma.masked_greater(
+        radar.fields['reflectivity']['data'], 35.)
+    args = dict(COMMON_MAP_TO_GRID_ARGS)
+    args.pop('fields')
+    mapper = pyart.map.GridMapper((radar, radar), **args)
+    grids = mapper.map_to_grid((radar, radar))
+    ref_grids = pyart.map.map_to_grid((radar, radar), **args)
+    _assert_grids_equal(grids, ref_grids)
+
+    # number of radars must match
+    assert not mapper.matches(radar)
+    assert_raises(ValueError, mapper.map_to_grid, radar)
+
+
+def test_grid_mapper_geometry_mismatch():
+    radar = pyart.testing.make_target_radar()
+    args = dict(COMMON_MAP_TO_GRID_ARGS)
+    args.pop('fields')
+    mapper = pyart.map.GridMapper(radar, **args)
+
+    radar.azimuth['data'] = radar.azimuth['data'] + 1.
+    assert not mapper.matches(radar)
+    assert_raises(ValueError, mapper.map_to_grid, radar)
+    mapper.map_to_grid(radar, check_geometry=False)
+
+    radar = pyart.testing.make_empty_ppi_radar(10, 10, 1)
+    assert not mapper.matches(radar)
+    assert_raises(ValueError, mapper.map_to_grid, radar,
+                  check_geometry=False)
+
+
+def test_grid_mapper_errors():
+    radar = pyart.testing.make_target_radar()
+    assert_raises(ValueError, pyart.map.GridMapper, radar, (1, 1, 1),
+                  ((-1, 1), (-1, 1), (-1, 1)), weighting_function='foo')
+    assert_raises(ValueError, pyart.map.GridMapper, radar, (1, 1, 1),
+                  ((-1, 1), (-1, 1), (-1, 1)), algorithm='foo')
+    assert_raises(ValueError, pyart.map.GridMapper, radar, (1, 1, 1),
+                  ((-1, 1), (-1, 1), (-1, 1)), roi_func='foo')
@@ -0,0 +1,161 @@
+""" Unit Tests for Py-ART's map/tiled_grid.py module. """
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_raises
+
+import pyart
+from pyart.map import tiled_grid
+
+COMMON_ARGS = {
+    'grid_shape': (3, 20, 21),
+    'grid_limits': ((0.0, 1000.0), (-10000.0, 10000.0), (-10000, 10000)),
+    'roi_func': 'dist_beam',
+    'min_radius': 250., }
+
+
+def _make_radar():
+    """ Radar with a unique value at each gate. """
+    radar = pyart.testing.make_target_radar()
+    data = np.arange(radar.nrays * radar.ngates, dtype='float32')
+    radar.fields['reflectivity']['data'] = data.reshape(
+        radar.nrays, radar.ngates) / 1000.
+    return radar
+
+
+def _assert_tiles_match_full_grid(tiles, grids):
+    """ Check that tiles cover the full grid and match it. """
+    covered = np.zeros(COMMON_ARGS['grid_shape'], dtype='int')
+    for tile_slices, tile_grids in tiles:
+        covered[tile_slices] += 1
+        for field in grids.keys():
+            full = grids[field][tile_slices]
+            tile = tile_grids[field]
+            assert tile.shape == full.shape
+            assert np.all(np.ma.getmaskarray(tile) ==
+                          np.ma.getmaskarray(full))
+            assert_allclose(np.ma.filled(tile, 0), np.ma.filled(full, 0),
+                            rtol=1e-5)
+    assert np.all(covered == 1)
+
+
+def test_iter_grid_tiles():
+    radar = _make_radar()
+    grids = pyart.map.map_gates_to_grid(radar, **COMMON_ARGS)
+    tiles = pyart.map.iter_grid_tiles(radar, tile_shape=(7, 8), **COMMON_ARGS)
+    _assert_tiles_match_full_grid(tiles, grids)
+
+
+def test_iter_grid_tiles_3d():
+    radar = _make_radar()
+    grids = pyart.map.map_gates_to_grid(radar, **COMMON_ARGS)
+    tiles = pyart.map.iter_grid_tiles(
+        radar, tile_shape=(2, 5, 21), **COMMON_ARGS)
+    _assert_tiles_match_full_grid(tiles, grids)
+
+
+def test_iter_grid_tiles_gatefilter():
+    radar = _make_radar()
+    gatefilter = pyart.filters.GateFilter(radar)
+    gatefilter.exclude_above('reflectivity', 20.0)
+    grids = pyart.map.map_gates_to_grid(
+        radar, gatefilters=gatefilter, **COMMON_ARGS)
+    tiles = pyart.map.iter_grid_tiles(
+        radar, tile_shape=(5, 5), gatefilters=gatefilter, **COMMON_ARGS)
+    _assert_tiles_match_full_grid(tiles, grids)
+
+
+def test_iter_grid_tiles_nthreads():
+    radar = _make_radar()
+    grids = pyart.map.map_gates_to_grid(radar, **COMMON_ARGS)
+    tiles = pyart.map.iter_grid_tiles(
+        radar, tile_shape=(7, 8), nthreads=3, **COMMON_ARGS)
+    _assert_tiles_match_full_grid(tiles, grids)
+
+
+def test_iter_grid_tiles_nearest():
+    radar = _make_radar()
+    grids = pyart.map.map_gates_to_grid(
+        radar, weighting_function='NEAREST', **COMMON_ARGS)
+    tiles = pyart.map.iter_grid_tiles(
+        radar, tile_shape=(7, 8), weighting_function='NEAREST',
+        **COMMON_ARGS)
+    _assert_tiles_match_full_grid(tiles, grids)
+
+
+def test_find_tile_ray_runs():
+    radar = _make_radar()
+    elevations = radar.elevation['data'].astype('float32')
+    azimuths = radar.azimuth['data'].astype('float32')
+    ranges = radar.range['data'].astype('float32')
+    roi_func = pyart.map._gate_to_grid_map.ConstantRoI(50.)
+    extents = tiled_grid._find_gate_extents(
+        elevations, azimuths, ranges, (0., 0., 0.), 17000., roi_func)
+    nblocks = -(-radar.ngates // tiled_grid._GATE_BLOCK_SIZE)
+    assert extents.shape == (radar.nrays, nblocks, 2, 3)
+
+    # a tile covering the radar is reached by every ray and gate
+    limits = ((-1000., 1000.), (-1e6, 1e6), (-1e6, 1e6))
+    runs = tiled_grid._find_tile_ray_runs(extents, limits, radar.ngates)
+    assert runs == [(0, radar.nrays, 0, radar.ngates)]
+
+    # a small tile to the north is only reached by some rays and gates
+    limits = ((-1000., 1000.), (800., 900.), (-50., 50.))
+    runs = tiled_grid._find_tile_ray_runs(extents, limits, radar.ngates)
+    assert len(runs) > 0
+    for ray_start, ray_end, gate_start, gate_end in runs:
+        assert ray_end - ray_start < radar.nrays
+        assert gate_end - gate_start < radar.ngates
+
+    # no rays reach a tile far from the radar
+    limits = ((0., 1000.), (1e6, 1.1e6), (1e6, 1.1e6))
+    assert tiled_grid._find_tile_ray_runs(
+        extents, limits, radar.ngates) == []
+
+
+def test_iter_grid_tiles_empty_tile():
+    radar = _make_radar()
+    tiles = list(pyart.map.iter_grid_tiles(
+        radar, (1, 2, 2), ((0, 0), (90000, 100000), (90000, 100000)),
+        tile_shape=(1, 1), roi_func='constant', constant_roi=500.))
+    assert len(tiles) == 4
+    for tile_slices, grids in tiles:
+        assert np.all(np.ma.getmaskarray(grids['reflectivity']))
+        assert_allclose(grids['ROI'], 500.)
+
+
+def test_iter_grid_tiles_bad_tile_shape():
+    radar = _make_radar()
+    tiles = pyart.map.iter_grid_tiles(radar, tile_shape=(0, 5), **COMMON_ARGS)
+    assert_raises(ValueError, next, tiles)
+    tiles = pyart.map.iter_grid_tiles(radar, tile_shape=(5, ), **COMMON_ARGS)
+    assert_raises(ValueError, next, tiles)
+
+
+def test_write_tiled_grid():
+    radar = _make_radar()
+    grid = pyart.map.grid_from_radars(
+        radar, gridding_algo='map_gates_to_grid', **COMMON_ARGS)
+    with pyart.testing.InTemporaryDirectory():
+        pyart.map.write_tiled_grid(
+            'tiled_grid.nc', radar, tile_shape=(6, 6), **COMMON_ARGS)
+        tiled_grid = pyart.io.read_grid('tiled_grid.nc')
+
+    for field in ['reflectivity', 'ROI']:
+        assert field in tiled_grid.fields
+        data = tiled_grid.fields[field]['data']
+        ref = grid.fields[field]['data']
+        assert data.shape == ref.shape
+        assert np.all(np.ma.getmaskarray(data) == np.ma.getmaskarray(ref))
+        assert_allclose(np.ma.filled(data, 0), np.ma.filled(ref, 0),
+                        rtol=1e-5)
+    assert_allclose(tiled_grid.axes['x_disp']['data'],
+                    grid.axes['x_disp']['data'])
+    assert (tiled_grid.metadata['radar_0_instrument_name'] ==
+            grid.metadata['radar_0_instrument_name'])
+
+
+def test_write_tiled_grid_bad_format():
+    radar = _make_radar()
+    assert_raises(ValueError, pyart.map.write_tiled_grid, 'tiled_grid.nc',
+                  radar, tile_shape=(6, 6), format='NETCDF3_CLASSIC',
+                  **COMMON_ARGS)
@@ -0,0 +1,154 @@
+""" Unit Tests for Py-ART's map/weight_operator.py module. """
+
+import os
+
+import numpy as np
+from numpy.testing import assert_array_equal, assert_allclose
+from numpy.testing import assert_raises
+
+import pyart
+
+EXPECTED_CENTER_SLICE = [40, 30, 20, 10, 0, 0, 10, 20, 30, 40]
+
+COMMON_ARGS = {
+    'grid_shape': (3, 9, 10),
+    'grid_limits': ((-400.0, 400.0), (-900.0, 900.0), (-900, 900)),
+    'roi_func': 'constant',
+    'constant_roi': 30., }
+
+
+def test_map_fields():
+    radar = pyart.testing.make_target_radar()
+    operator = pyart.map.build_grid_weight_operator(radar, **COMMON_ARGS)
+    grids = operator.map_fields(radar)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_array_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+    assert np.all(grids['ROI'] == 30.)
+
+
+def test_matches_map_to_grid():
+    radar = pyart.testing.make_target_radar()
+    for weighting_function in ['Barnes', 'Cressman']:
+        kwargs = dict(COMMON_ARGS)
+        kwargs['constant_roi'] = 75.
+        kwargs['weighting_function'] = weighting_function
+        operator = pyart.map.build_grid_weight_operator(
+            radar, block_size=13, **kwargs)
+        grids = operator.map_fields(radar)
+        ref_grids = pyart.map.map_to_grid(radar, **kwargs)
+        assert_array_equal(grids['reflectivity'].mask,
+                           ref_grids['reflectivity'].mask)
+        assert_allclose(grids['reflectivity'].compressed(),
+                        ref_grids['reflectivity'].compressed())
+
+
+def test_masked_and_filtered_gates():
+    radar = pyart.testing.make_target_radar()
+    radar.fields['reflectivity']['data'][0:100, 25] = 99999.0
+    operator = pyart.map.build_grid_weight_operator(radar, **COMMON_ARGS)
+
+    grids = operator.map_fields(radar)
+    assert grids['reflectivity'].max() > 41.0
+
+    gatefilter = pyart.filters.GateFilter(radar)
+    gatefilter.exclude_above('reflectivity', 41.0)
+    grids = operator.map_fields(radar, gatefilter=gatefilter)
+    assert grids['reflectivity'].max() < 41.0
+
+    fdata = np.ma.masked_greater(radar.fields['reflectivity']['data'], 41.)
+    radar.fields['reflectivity']['data'] = fdata
+    grids = operator.map_fields(radar)
+    assert grids['reflectivity'].max() < 41.0
+
+
+def test_save_and_load():
+    radar = pyart.testing.make_target_radar()
+    operator = pyart.map.build_grid_weight_operator(radar, **COMMON_ARGS)
+    with pyart.testing.InTemporaryDirectory():
+        operator.save('operator.npz')
+        assert os.path.exists('operator.npz')
+        loaded = pyart.map.load_grid_weight_operator('operator.npz')
+    assert loaded.key == operator.key
+    assert loaded.grid_shape == operator.grid_shape
+    assert (loaded.weights != operator.weights).nnz == 0
+    grids = loaded.map_fields(radar)
+    center_slice = grids['reflectivity'][1, 4, :]
+    assert_array_equal(np.round(center_slice), EXPECTED_CENTER_SLICE)
+
+
+def test_key():
+    radar = pyart.testing.make_target_radar()
+    key1 = pyart.map.build_grid_weight_operator(radar, **COMMON_ARGS).key
+    key2 = pyart.map.build_grid_weight_operator(radar, **COMMON_ARGS).key
+    assert key1 == key2
+    kwargs = dict(COMMON_ARGS)
+    kwargs['constant_roi'] = 60.
+    key3 = pyart.map.build_grid_weight_operator(radar, **kwargs).key
+    assert key1 != key3
+
+
+def test_key_roi_closures():
+    # closures with the same name but different parameters have unique keys
+    radar = pyart.testing.make_target_radar()
+    kwargs = dict(COMMON_ARGS)
+    keys = []
+    for constant_roi in [30., 30., 60.]:
+        kwargs['roi_func'] = pyart.map.grid_mapper._gen_roi_func_constant(
+            constant_roi)
+        keys.append(
+            pyart.map.build_grid_weight_operator(radar, **kwargs).key)
+    assert keys[0] == keys[1]
+    assert keys[0] != keys[2]
+
+    kwargs['roi_func'] = pyart.map.example_roi_func_constant
+    key = pyart.map.build_grid_weight_operator(radar, **kwargs).key
+    assert key not in keys
+
+    class ConstantRoI(object):
+        def __call__(self, z, y, x):
+            return 30.
+
+    kwargs['roi_func'] = ConstantRoI()
+    assert_raises(ValueError, pyart.map.build_grid_weight_operator,
+                  radar, **kwargs)
+
+
+def test_check_key():
+    radar = pyart.testing.make_target_radar()
+    operator = pyart.map.build_grid_weight_operator(radar, **COMMON_ARGS)
+    operator.map_fields(radar, key=operator.key)
+    assert_raises(ValueError, operator.map_fields, radar, key='0' * 40)
+    with pyart.testing.InTemporaryDirectory():
+        operator.save('operator.npz')
+        loaded = pyart.map.load_grid_weight_operator(
+            'operator.npz', key=operator.key)
+        assert loaded.key == operator.key
+        assert_raises(ValueError, pyart.map.load_grid_weight_operator,
+                      'operator.npz', key='0' * 40)
+
+
+def test_geometry_mismatch():
+    radar = pyart.testing.make_target_radar()
+    operator = pyart.map.build_grid_weight_operator(radar, **COMMON_ARGS)
+    assert operator.matches(radar)
+
+    radar.azimuth['data'] += 5.
+    assert not operator.matches(radar)
+    assert_raises(ValueError, operator.map_fields, radar)
+    operator.map_fields(radar, check_geometry=False)
+
+    radar = pyart.testing.make_empty_ppi_radar(10, 36, 1)
+    assert not operator.matches(radar)
+    assert_raises(ValueError, operator.map_fields, radar,
+                  check_geometry=False)
+
+
+def test_errors():
+    radar = pyart.testing.make_target_radar()
+    assert_raises(ValueError, pyart.map.build_grid_weight_operator, radar,
+                  (1, 1, 1), ((-1, 1), (-1, 1), (-1, 1)),
+                  weighting_function='foo')
+    assert_raises(ValueError, pyart.map.build_grid_weight_operator, radar,
+                  (1, 1, 1), ((-1, 1), (-1, 1), (-1, 1)), algorithm='foo')
+    assert_raises(ValueError, pyart.map.build_grid_weight_operator, radar,
+                  (1, 1, 1), ((-1, 1), (-1, 1), (-1, 1)), roi_func='foo')
@@ -0,0 +1,377 @@
+"""
+pyart.map.tiled_grid
+====================
+
+Memory bounded mapping of radar gates onto large Cartesian grids by
+mapping the grid one tile at a time.
+
+.. autosummary::
+    :toctree: generated/
+
+    iter_grid_tiles
+    write_tiled_grid
+    _find_tile_bounds
+    _find_gate_extents
+    _find_tile_ray_runs
+    _create_tiled_ncvar
+
+"""
+
+import numpy as np
+import netCDF4
+
+from ..config import get_fillvalue
+from ..core.radar import Radar
+from ..filters import GateFilter, moment_based_gate_filter
+from ..io.grid_io import _create_grid_axes
+from .gates_to_grid import _parse_gatefilters, _detemine_cy_weighting_func
+from .gates_to_grid import _parse_grid_origin, _determine_fields
+from .gates_to_grid import _find_offsets, _parse_roi_func
+from .gates_to_grid import _find_grid_params, _prepare_field_data
+from .gates_to_grid import _map_gates_in_threads, _map_sweeps_to_grid
+from .gates_to_grid import _NEAREST, _BILINEAR
+from .grid_mapper import _make_grid_field, _make_grid_axes
+from .grid_mapper import _make_grid_metadata
+from ._gate_to_grid_map import GateToGridMapper
+from ._gate_to_grid_map import find_gate_locations_and_roi
+
+# number of gates along each ray whose extents are combined into a block
+_GATE_BLOCK_SIZE = 32
+
+# number of rays whose gate locations are found at once
+_RAY_BLOCK_SIZE = 256
+
+
+def iter_grid_tiles(
+        radars, grid_shape, grid_limits, tile_shape, grid_origin=None,
+        grid_origin_alt=None, fields=None, gatefilters=False, map_roi=True,
+        weighting_function='Barnes', toa=17000.0, roi_func='dist_beam',
+        constant_roi=500., z_factor=0.05, xy_factor=0.02, min_radius=500.0,
+        h_factor=1.0, nb=1.5, bsp=1.0, nthreads=1, roi_lattice_shape=None,
+        **kwargs):
+    """
+    Map gates from one or more radars to a Cartesian grid, tile by tile.
+
+    The grid is divided into tiles which are mapped one at a time using
+    the same method as :py:func:`map_gates_to_grid`.  The extent of the
+    radius of influence of each block of gates is found once, each tile
+    then maps only the runs of rays and the range of gates which reach the
+    tile, tiles which no gates reach are not mapped.  Memory use is bounded
+    by the tile size, not the size of the full grid, allowing grids which
+    do not fit in memory to be created.  The tiles produced are identical
+    to the matching region of a grid created by mapping the full grid at
+    once.  The 'Nearest' and 'Bilinear' weighting functions interpolate
+    between the rays of complete sweeps, radars with gates reaching a tile
+    are mapped in full using these methods.
+
+    Parameters not defined below are identical to those in
+    :py:func:`map_gates_to_grid`.
+
+    Parameters
+    ----------
+    tile_shape : 2 or 3-tuple of int
+        Maximum number of points in each tile (z, y, x) or (y, x).  When
+        only the y and x sizes are given each tile spans all vertical
+        levels.  Tiles at the edges of the grid may be smaller.
+
+    Yields
+    ------
+    tile_slices : 3-tuple of slices
+        Location of the tile in the full grid (z, y, x).
+    grids : dict
+        Dictionary of mapped fields for the tile, see
+        :py:func:`map_gates_to_grid`.
+
+    See Also
+    --------
+    write_tiled_grid : Map radars to a grid stored in a netCDF file.
+
+    """
+    # make a tuple if passed a radar object as the first argument
+    if isinstance(radars, Radar):
+        radars = (radars, )
+
+    if grid_origin_alt is None:
+        grid_origin_alt = float(radars[0].altitude['data'])
+
+    # parameters which are shared by all tiles
+    gatefilters = _parse_gatefilters(gatefilters, radars)
+    grid_origin = _parse_grid_origin(grid_origin, radars)
+    fields = _determine_fields(fields, radars)
+    offsets = _find_offsets(radars, grid_origin, grid_origin_alt)
+    grid_starts, grid_steps = _find_grid_params(grid_shape, grid_limits)
+    roi_func = _parse_roi_func(roi_func, constant_roi, z_factor, xy_factor,
+                               min_radius, h_factor, nb, bsp, offsets,
+                               grid_shape, grid_starts, grid_steps,
+                               roi_lattice_shape)
+
+    cy_weighting_function = _detemine_cy_weighting_func(weighting_function)
+    if int(nthreads) < 1:
+        raise ValueError('nthreads must be a positive integer')
+    nthreads = int(nthreads)
+
+    # field data, excluded gates and gate extents of each radar, the field
+    # data is not copied
+    radar_params = []
+    for radar, radar_offset, gatefilter in zip(radars, offsets, gatefilters):
+        if gatefilter is False:
+            gatefilter = GateFilter(radar)  # include all gates
+        elif gatefilter is None:
+            gatefilter = moment_based_gate_filter(radar, **kwargs)
+        excluded_gates = np.ascontiguousarray(
+            gatefilter.gate_excluded).view('uint8')
+        elevations = radar.elevation['data'].astype('float32')
+        azimuths = radar.azimuth['data'].astype('float32')
+        ranges = radar.range['data'].astype('float32')
+        extents = _find_gate_extents(
+            elevations, azimuths, ranges, radar_offset, toa, roi_func)
+        radar_params.append((
+            radar, radar_offset, elevations, azimuths, ranges,
+            excluded_gates, extents) + _prepare_field_data(radar, fields))
+
+    nz, ny, nx = grid_shape
+    (z0, z1), (y0, y1), (x0, x1) = grid_limits
+    grid_axes = (np.linspace(z0, z1, nz), np.linspace(y0, y1, ny),
+                 np.linspace(x0, x1, nx))
+    nfields = len(fields)
+
+    for tile_slices in _find_tile_bounds(grid_shape, tile_shape):
+        shape = tuple(s.stop - s.start for s in tile_slices)
+        tile_limits = tuple((axis[s.start], axis[s.stop - 1])
+                            for axis, s in zip(grid_axes, tile_slices))
+        tile_starts = tuple(start for start, stop in tile_limits)
+
+        # grid storage arrays for the tile, each thread has its own arrays
+        grid_sums = [np.zeros(shape + (nfields, ), dtype=np.float32)
+                     for i in range(nthreads)]
+        grid_wsums = [np.zeros(shape + (nfields, ), dtype=np.float32)
+                      for i in range(nthreads)]
+        gatemappers = [
+            GateToGridMapper(shape, tile_starts, grid_steps, gsum, gwsum)
+            for gsum, gwsum in zip(grid_sums, grid_wsums)]
+        gatemapper = gatemappers[0]
+
+        # map the runs of rays and gates which reach the tile
+        for (radar, radar_offset, elevations, azimuths, ranges,
+             excluded_gates, extents, field_data, field_mask, scale_factors,
+             add_offsets) in radar_params:
+            runs = _find_tile_ray_runs(extents, tile_limits, len(ranges))
+            if len(runs) == 0:
+                continue
+            if cy_weighting_function in [_NEAREST, _BILINEAR]:
+                _map_sweeps_to_grid(
+                    gatemapper, shape, radar, field_data, field_mask,
+                    scale_factors, add_offsets, excluded_gates, radar_offset,
+                    toa, roi_func, cy_weighting_function)
+                continue
+            for ray_start, ray_end, gate_start, gate_end in runs:
+                rays = slice(ray_start, ray_end)
+                gates = slice(gate_start, gate_end)
+                args = (elevations[rays], azimuths[rays], ranges[gates],
+                        [data[rays, gates] for data in field_data],
+                        [None if mask is None else mask[rays, gates]
+                         for mask in field_mask],
+                        scale_factors, add_offsets,
+                        np.ascontiguousarray(excluded_gates[rays, gates]),
+                        radar_offset, toa, roi_func, cy_weighting_function)
+                if nthreads == 1:
+                    gatemapper.map_gates_to_grid(*args)
+                else:
+                    _map_gates_in_threads(
+                        gatemappers, args, ray_end - ray_start)
+
+        # sum the grid storage arrays from all threads
+        grid_sum = grid_sums[0]
+        grid_wsum = grid_wsums[0]
+        for thread_sum, thread_wsum in zip(grid_sums[1:], grid_wsums[1:]):
+            grid_sum += thread_sum
+            grid_wsum += thread_wsum
+
+        # fields are fully masked in tiles which no gates reach
+        mweight = np.ma.masked_equal(grid_wsum, 0)
+        msum = np.ma.masked_array(grid_sum, mweight.mask)
+        grids = dict([(f, msum[..., i] / mweight[..., i])
+                      for i, f in enumerate(fields)])
+        if map_roi:
+            roi_array = np.empty(shape, dtype=np.float32)
+            gatemapper.find_roi_for_grid(roi_array, roi_func)
+            grids['ROI'] = roi_array
+        yield tile_slices, grids
+
+
+def write_tiled_grid(filename, radars, grid_shape, grid_limits, tile_shape,
+                     format='NETCDF4', arm_time_variables=False, **kwargs):
+    """
+    Map one or more radars to a Cartesian grid stored in a netCDF file.
+
+    The grid is mapped tile by tile using :py:func:`iter_grid_tiles` and
+    each tile is written to the file as soon as it has been mapped.  The
+    field variables are chunked by tile so only a single tile of the grid
+    is held in memory at any time.  The file can be read using
+    :py:func:`pyart.io.read_grid`.
+
+    Additional arguments are passed to :py:func:`iter_grid_tiles`.
+
+    Parameters
+    ----------
+    filename : str
+        Filename to save the grid to.
+    radars : Radar or tuple of Radar objects.
+        Radar objects which will be mapped to the Cartesian grid.
+    grid_shape : 3-tuple of floats
+        Number of points in the grid (z, y, x).
+    grid_limits : 3-tuple of 2-tuples
+        Minimum and maximum grid location (inclusive) in meters for the
+        z, y, x coordinates.
+    tile_shape : 2 or 3-tuple of int
+        Maximum number of points in each tile (z, y, x) or (y, x).
+    format : 'NETCDF4' or 'NETCDF4_CLASSIC'
+        NetCDF format, must be a netCDF4/HDF5 format which supports chunked
+        variables.
+    arm_time_variables : bool
+        True to write the ARM standard time variables base_time and
+        time_offset. False will not write these variables.
+
+    """
+    # make a tuple if passed a radar object as the first argument
+    if isinstance(radars, Radar):
+        radars = (radars, )
+    if format not in ['NETCDF4', 'NETCDF4_CLASSIC']:
+        raise ValueError('format must be NETCDF4 or NETCDF4_CLASSIC')
+
+    ncobj = netCDF4.Dataset(filename, mode='w', format=format)
+    try:
+        # dimensions, axes and metadata
+        axes = _make_grid_axes(
+            radars, grid_shape, grid_limits,
+            kwargs.get('grid_origin', None),
+            kwargs.get('grid_origin_alt', None))
+        _create_grid_axes(ncobj, grid_shape, axes, arm_time_variables)
+        for k, v in _make_grid_metadata(radars).items():
+            setattr(ncobj, k, v)
+
+        # map and write the tiles, field variables are created when the
+        # first tile is mapped
+        chunksizes = None
+        tiles = iter_grid_tiles(
+            radars, grid_shape, grid_limits, tile_shape, **kwargs)
+        for tile_slices, grids in tiles:
+            if chunksizes is None:
+                chunksizes = (1, ) + tuple(
+                    s.stop - s.start for s in tile_slices)
+                for field, data in grids.items():
+                    field_dic = _make_grid_field(radars[0], field, data)
+                    _create_tiled_ncvar(field_dic, ncobj, field, chunksizes)
+            for field, data in grids.items():
+                ncobj.variables[field][(0, ) + tile_slices] = data
+    finally:
+        ncobj.close()
+    return
+
+
+def _find_tile_bounds(grid_shape, tile_shape):
+    """ Yield the slices (z, y, x) of each tile in a grid. """
+    if len(tile_shape) == 2:
+        tile_shape = (grid_shape[0], ) + tuple(tile_shape)
+    if len(tile_shape) != 3:
+        raise ValueError('tile_shape must have 2 or 3 elements')
+    tile_shape = tuple(int(s) for s in tile_shape)
+    if min(tile_shape) < 1:
+        raise ValueError('tile_shape must contain positive integers')
+
+    nz, ny, nx = grid_shape
+    tz, ty, tx = tile_shape
+    for iz in range(0, nz, tz):
+        for iy in range(0, ny, ty):
+            for ix in range(0, nx, tx):
+                yield (slice(iz, min(iz + tz, nz)),
+                       slice(iy, min(iy + ty, ny)),
+                       slice(ix, min(ix + tx, nx)))
+
+
+def _find_gate_extents(elevations, azimuths, ranges, offset, toa,
+                       roi_func):
+    """
+    Return the extent of the radius of influence of blocks of gates.
+
+    The returned array has dimensions of nrays, gate blocks, 2, 3 and holds
+    the minimum and maximum z, y, x location reached by the radius of
+    influence of the gates in each block of _GATE_BLOCK_SIZE gates along a
+    ray.  Blocks with no gates below the top of atmosphere have a minimum of
+    inf and a maximum of -inf.  Gate locations are found for
+    _RAY_BLOCK_SIZE rays at a time.
+    """
+    nrays = len(elevations)
+    ngates = len(ranges)
+    nblocks = -(-ngates // _GATE_BLOCK_SIZE)
+    extents = np.empty((nrays, nblocks, 2, 3), dtype='float32')
+    for ray_start in range(0, nrays, _RAY_BLOCK_SIZE):
+        ray_end = min(ray_start + _RAY_BLOCK_SIZE, nrays)
+        nblock_rays = ray_end - ray_start
+        gate_info = np.empty((nblock_rays, ngates, 4), dtype='float32')
+        find_gate_locations_and_roi(
+            elevations[ray_start:ray_end], azimuths[ray_start:ray_end],
+            ranges, offset, toa, roi_func, gate_info)
+
+        # gates above the top of atmosphere have roi -1
+        loc = gate_info[..., :3]
+        roi = gate_info[..., 3:]
+        lower = np.full((nblock_rays, nblocks * _GATE_BLOCK_SIZE, 3),
+                        np.inf, dtype='float32')
+        upper = np.full_like(lower, -np.inf)
+        lower[:, :ngates] = np.where(roi >= 0, loc - roi, np.inf)
+        upper[:, :ngates] = np.where(roi >= 0, loc + roi, -np.inf)
+        shape = (nblock_rays, nblocks, _GATE_BLOCK_SIZE, 3)
+        extents[ray_start:ray_end, :, 0] = lower.reshape(shape).min(axis=2)
+        extents[ray_start:ray_end, :, 1] = upper.reshape(shape).max(axis=2)
+    return extents
+
+
+def _find_tile_ray_runs(extents, tile_limits, ngates):
+    """
+    Return the runs of rays and range of gates which reach a tile.
+
+    A list of (ray_start, ray_end, gate_start, gate_end) tuples is returned,
+    one for each run of consecutive rays with gates whose radius of
+    influence reaches the tile.  The gate range covers the gate blocks of
+    the run which reach the tile.
+    """
+    tile_starts = np.array([start for start, stop in tile_limits])
+    tile_stops = np.array([stop for start, stop in tile_limits])
+    reaching = np.all((extents[:, :, 1] >= tile_starts) &
+                      (extents[:, :, 0] <= tile_stops), axis=-1)
+    rays = reaching.any(axis=1).astype('int8')
+    edges = np.diff(np.concatenate(([0], rays, [0])))
+    runs = []
+    for ray_start, ray_end in zip(np.flatnonzero(edges == 1),
+                                  np.flatnonzero(edges == -1)):
+        blocks = np.flatnonzero(reaching[ray_start:ray_end].any(axis=0))
+        gate_start = blocks[0] * _GATE_BLOCK_SIZE
+        gate_end = min((blocks[-1] + 1) * _GATE_BLOCK_SIZE, ngates)
+        runs.append((int(ray_start), int(ray_end), int(gate_start),
+                     int(gate_end)))
+    return runs
+
+
+def _create_tiled_ncvar(dic, dataset, name, chunksizes):
+    """
+    Create an empty grid field Variable chunked by tile in a netCDF Dataset.
+    """
+    fill_value = dic.get('_FillValue', get_fillvalue())
+    ncvar = dataset.createVariable(
+        name, np.dtype(dic['data'].dtype), ('time', 'nz', 'ny', 'nx'),
+        zlib=dic.get('_Zlib', True), complevel=dic.get('_DeflateLevel', 4),
+        shuffle=dic.get('_Shuffle', True), chunksizes=chunksizes,
+        fill_value=fill_value)
+
+    # long_name and units attributes first, ARM standard
+    for key in ['long_name', 'units']:
+        if key in dic:
+            ncvar.setncattr(key, dic[key])
+
+    # set the remaining attributes, excluding the netCDF special keys
+    for key, value in dic.items():
+        if key.startswith('_') or key in ['data', 'long_name', 'units']:
+            continue
+        ncvar.setncattr(key, value)
+    return ncvar
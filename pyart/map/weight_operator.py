@@ -0,0 +1,444 @@
+"""
+pyart.map.weight_operator
+=========================
+
+Reusable sparse interpolation weights for mapping radars with a fixed
+geometry to a Cartesian grid.
+
+.. autosummary::
+    :toctree: generated/
+
+    build_grid_weight_operator
+    load_grid_weight_operator
+    _geometry_key
+    _callable_state
+    _check_key
+
+.. autosummary::
+    :toctree: generated/
+    :template: dev_template.rst
+
+    GridWeightOperator
+
+"""
+
+import hashlib
+
+import numpy as np
+import scipy.sparse
+
+from ..config import get_fillvalue
+from ..filters import moment_based_gate_filter
+from .grid_mapper import NNLocator, _geometry_matches
+from .grid_mapper import _gen_roi_func_constant, _gen_roi_func_dist
+from .grid_mapper import _gen_roi_func_dist_beam, _roi_for_points
+from .gates_to_grid import _parse_grid_origin, _find_offsets
+from .gates_to_grid import _find_grid_params
+
+
+class GridWeightOperator(object):
+    """
+    A sparse operator which maps radar gates onto a Cartesian grid.
+
+    The operator stores the interpolation weights between each gate of a
+    radar and each point in a Cartesian grid as a compressed sparse row
+    (CSR) matrix.  Since these weights depend only on the geometry of the
+    radar and the grid, a single operator can be used to grid any number of
+    radar volumes which share the same geometry, for example successive
+    volumes collected using the same scan strategy.  Mapping a field is then
+    a pair of sparse matrix-vector products.
+
+    Operators should be created using :py:func:`build_grid_weight_operator`
+    or :py:func:`load_grid_weight_operator`.
+
+    Parameters
+    ----------
+    weights : scipy.sparse.csr_matrix
+        Interpolation weights, shape (number of grid points, number of
+        gates).  Gates are ordered as in a flattened (nrays, ngates) radar
+        field, grid points as in a flattened (nz, ny, nx) grid.
+    grid_shape : 3-tuple of ints
+        Number of points in the grid (z, y, x).
+    grid_limits : 3-tuple of 2-tuples
+        Minimum and maximum grid location (inclusive) in meters for the
+        z, y, x coordinates.
+    roi : array
+        Radius of influence at each grid point, shape `grid_shape`.
+    ranges, azimuths, elevations : array
+        Gate ranges in meters and ray azimuth and elevation angles in
+        degrees of the radar used to create the weights.
+    key : str
+        Key identifying the radar geometry, grid specification, radius of
+        influence function and weighting function used to create the
+        weights.
+
+    Attributes
+    ----------
+    weights : scipy.sparse.csr_matrix
+        Interpolation weights.
+    grid_shape : tuple
+        Number of points in the grid (z, y, x).
+    grid_limits : tuple
+        Grid limits in meters for the z, y, x coordinates.
+    roi : array
+        Radius of influence at each grid point.
+    ranges, azimuths, elevations : array
+        Geometry of the radar used to create the operator.
+    key : str
+        Key identifying the geometry and parameters used to create the
+        operator.
+
+    """
+
+    def __init__(self, weights, grid_shape, grid_limits, roi, ranges,
+                 azimuths, elevations, key):
+        """ initialize. """
+        self.weights = weights.tocsr()
+        self.grid_shape = tuple(int(i) for i in grid_shape)
+        self.grid_limits = tuple(tuple(float(j) for j in i)
+                                 for i in grid_limits)
+        self.roi = roi
+        self.ranges = ranges
+        self.azimuths = azimuths
+        self.elevations = elevations
+        self.key = key
+
+    def matches(self, radar, angle_tolerance=0.1, range_tolerance=1.0):
+        """
+        Return True if the operator can be used to map the given radar.
+
+        Parameters
+        ----------
+        radar : Radar
+            Radar to check.
+        angle_tolerance : float
+            Maximum difference in degrees between the azimuth and elevation
+            angles of the radar and those used to create the operator.
+        range_tolerance : float
+            Maximum difference in meters between the gate ranges of the
+            radar and those used to create the operator.
+
+        Returns
+        -------
+        matches : bool
+            True if the geometry of the radar matches that of the operator.
+
+        """
+        return _geometry_matches(
+            radar, self.ranges, self.azimuths, self.elevations,
+            angle_tolerance, range_tolerance)
+
+    def map_fields(self, radar, fields=None, gatefilter=False, map_roi=True,
+                   check_geometry=True, key=None, **kwargs):
+        """
+        Map the fields of a radar to the grid.
+
+        Parameters
+        ----------
+        radar : Radar
+            Radar object with the same geometry as the radar used to create
+            the operator.
+        fields : list or None
+            List of fields within the radar object which will be mapped to
+            the grid.  None, the default, maps all fields.
+        gatefilter : GateFilter, None or False.
+            GateFilter specifying which gates will be included in the mapping.
+            False, the default, includes all gates.  None creates a
+            GateFilter from the radar moments using any additional arguments
+            by passing them to :py:func:`moment_based_gate_filter`.
+        map_roi : bool
+            True to include the radius of influence in the returned
+            dictionary under the 'ROI' key.
+        check_geometry : bool
+            True to verify that the geometry of the radar matches that of
+            the operator using :py:meth:`matches` with the default
+            tolerances.  False only checks the number of gates.
+        key : str or None
+            Expected key of the operator, for example the key of an
+            operator built with the desired gridding parameters.  A
+            ValueError is raised if the key of the operator differs.  None,
+            the default, does not check the key.
+
+        Returns
+        -------
+        grids : dict
+            Dictionary of mapped fields.  Each element is a `grid_shape`
+            masked float64 array containing the interpolated grid for that
+            field.  Grid points with no unmasked gates within their radius of
+            influence are masked.
+
+        """
+        _check_key(self.key, key)
+        if radar.nrays * radar.ngates != self.weights.shape[1]:
+            raise ValueError('Radar gates do not match the operator gates')
+        if check_geometry and not self.matches(radar):
+            raise ValueError(
+                'Radar geometry does not match the operator geometry')
+        if fields is None:
+            fields = list(radar.fields.keys())
+
+        # gates which should be included in the mapping
+        if gatefilter is False:
+            include = np.ones((radar.nrays * radar.ngates, ), dtype=np.bool_)
+        else:
+            if gatefilter is None:
+                gatefilter = moment_based_gate_filter(radar, **kwargs)
+            include = gatefilter.gate_included.ravel()
+
+        badval = get_fillvalue()
+        grids = {}
+        for field in fields:
+            fdata = radar.fields[field]['data']
+            valid = np.logical_and(
+                include, ~np.ma.getmaskarray(fdata).ravel())
+            values = np.where(valid, np.ma.getdata(fdata).ravel(), 0)
+
+            # weighted sum of the valid gates renormalized by the sum of
+            # the weights of the valid gates.
+            grid_sum = self.weights.dot(values.astype(np.float64))
+            grid_wsum = self.weights.dot(valid.astype(np.float64))
+            mask = grid_wsum == 0
+            grid_sum[mask] = badval
+            grid_sum[~mask] /= grid_wsum[~mask]
+            grid = np.ma.masked_array(grid_sum, mask, fill_value=badval)
+            grids[field] = grid.reshape(self.grid_shape)
+
+        if map_roi:
+            grids['ROI'] = self.roi
+        return grids
+
+    def save(self, filename):
+        """
+        Save the operator to a NumPy .npz file.
+
+        Parameters
+        ----------
+        filename : str
+            Filename to save the operator to.
+
+        """
+        np.savez(
+            filename, data=self.weights.data, indices=self.weights.indices,
+            indptr=self.weights.indptr, shape=self.weights.shape,
+            grid_shape=self.grid_shape, grid_limits=self.grid_limits,
+            roi=self.roi, ranges=self.ranges, azimuths=self.azimuths,
+            elevations=self.elevations, key=self.key)
+
+
+def load_grid_weight_operator(filename, key=None):
+    """
+    Load a GridWeightOperator saved with :py:meth:`GridWeightOperator.save`.
+
+    Parameters
+    ----------
+    filename : str
+        Filename of the saved operator.
+    key : str or None
+        Expected key of the saved operator.  A ValueError is raised if the
+        key of the saved operator differs, for example when the file was
+        created with different gridding parameters.  None, the default,
+        does not check the key.
+
+    Returns
+    -------
+    operator : GridWeightOperator
+        Sparse gridding operator.
+
+    """
+    with np.load(filename) as npzfile:
+        _check_key(str(npzfile['key']), key)
+        weights = scipy.sparse.csr_matrix(
+            (npzfile['data'], npzfile['indices'], npzfile['indptr']),
+            shape=tuple(npzfile['shape']))
+        return GridWeightOperator(
+            weights, npzfile['grid_shape'], npzfile['grid_limits'],
+            npzfile['roi'], npzfile['ranges'], npzfile['azimuths'],
+            npzfile['elevations'], str(npzfile['key']))
+
+
+def build_grid_weight_operator(
+        radar, grid_shape, grid_limits, grid_origin=None,
+        grid_origin_alt=None, weighting_function='Barnes', toa=17000.0,
+        algorithm='kd_tree', leafsize=10., block_size=10000,
+        roi_func='dist_beam', constant_roi=500., z_factor=0.05,
+        xy_factor=0.02, min_radius=500.0, h_factor=1.0, nb=1.5, bsp=1.0):
+    """
+    Build a sparse operator which maps gates from a radar to a grid.
+
+    The interpolation weights are calculated in the same manner as
+    :py:func:`map_to_grid`, all gates within the radius of influence of a
+    grid point are weighted by their distance from the grid point.  Unlike
+    :py:func:`map_to_grid`, masked and excluded gates are removed from the
+    normalization of the weights for both the Barnes and Cressman weighting
+    functions.  For fields without masked gates the two methods give
+    identical results.
+
+    Parameters not defined below are identical to those in
+    :py:func:`map_to_grid`.
+
+    Parameters
+    ----------
+    radar : Radar
+        Radar object whose geometry (ranges, azimuth and elevation angles
+        and location) is used to calculate the weights.  Field data is not
+        used.
+    roi_func : str or function
+        Radius of influence function, either a function which takes a
+        z, y, x grid location and returns a radius or one of the strings
+        'constant', 'dist' or 'dist_beam'.  Functions are identified in the
+        operator key by their name, code, default arguments and the values
+        of any variables they enclose, global variables used by the
+        function are not included.
+    block_size : int
+        Number of grid points whose neighbors are found at once.
+
+    Returns
+    -------
+    operator : GridWeightOperator
+        Sparse gridding operator.
+
+    """
+    if weighting_function.upper() not in ['CRESSMAN', 'BARNES']:
+        raise ValueError('unknown weighting_function')
+    if algorithm not in ['kd_tree', 'ball_tree']:
+        raise ValueError('unknow algorithm: %s' % algorithm)
+
+    grid_origin = _parse_grid_origin(grid_origin, (radar, ))
+    if grid_origin_alt is None:
+        grid_origin_alt = float(radar.altitude['data'])
+    offsets = _find_offsets((radar, ), grid_origin, grid_origin_alt)
+    z_disp, y_disp, x_disp = offsets[0]
+
+    key = _geometry_key(
+        radar, grid_shape, grid_limits, grid_origin, grid_origin_alt,
+        weighting_function, toa, roi_func, constant_roi, z_factor,
+        xy_factor, min_radius, h_factor, nb, bsp)
+
+    if not hasattr(roi_func, '__call__'):
+        if roi_func == 'constant':
+            roi_func = _gen_roi_func_constant(constant_roi)
+        elif roi_func == 'dist':
+            roi_func = _gen_roi_func_dist(
+                z_factor, xy_factor, min_radius, offsets)
+        elif roi_func == 'dist_beam':
+            roi_func = _gen_roi_func_dist_beam(
+                h_factor, nb, bsp, min_radius, offsets)
+        else:
+            raise ValueError('unknown roi_func: %s' % roi_func)
+
+    # gate locations, only gates below the top of atmosphere are included
+    zg_loc = radar.gate_z['data']
+    gate_locations = np.empty((radar.nrays * radar.ngates, 3), np.float64)
+    gate_locations[:, 0] = zg_loc.flat
+    gate_locations[:, 1] = radar.gate_y['data'].flat
+    gate_locations[:, 2] = radar.gate_x['data'].flat
+    gate_locations += (z_disp, y_disp, x_disp)
+    included_gates = np.flatnonzero(zg_loc < toa)
+    nnlocator = NNLocator(gate_locations[included_gates],
+                          algorithm=algorithm, leafsize=leafsize)
+
+    # find the weights for blocks of grid points
+    nz, ny, nx = grid_shape
+    npoints = nz * ny * nx
+    grid_starts, grid_steps = _find_grid_params(grid_shape, grid_limits)
+    roi = np.empty((npoints, ), dtype=np.float64)
+    counts = np.empty((npoints, ), dtype=np.intp)
+    indices = []
+    weights = []
+    for block_start in range(0, npoints, int(block_size)):
+        block_end = min(block_start + int(block_size), npoints)
+        points = np.unravel_index(
+            np.arange(block_start, block_end), grid_shape)
+        zs, ys, xs = [start + step * point for start, step, point in
+                      zip(grid_starts, grid_steps, points)]
+        rs = _roi_for_points(roi_func, zs, ys, xs)
+        roi[block_start:block_end] = rs
+
+        ind, dist, block_counts = nnlocator.find_neighbors_and_dists_flat(
+            np.column_stack((zs, ys, xs)), rs)
+        dist2 = dist * dist
+        r2 = np.repeat(rs * rs, block_counts)
+        if weighting_function.upper() == 'CRESSMAN':
+            block_weights = (r2 - dist2) / (r2 + dist2)
+        else:
+            block_weights = np.exp(-dist2 / (2.0 * r2)) + 1e-5
+        counts[block_start:block_end] = block_counts
+        indices.append(included_gates[ind])
+        weights.append(block_weights)
+
+    indptr = np.zeros((npoints + 1, ), dtype=np.intp)
+    np.cumsum(counts, out=indptr[1:])
+    weights = scipy.sparse.csr_matrix(
+        (np.concatenate(weights), np.concatenate(indices), indptr),
+        shape=(npoints, radar.nrays * radar.ngates))
+    return GridWeightOperator(
+        weights, grid_shape, grid_limits, roi.reshape(grid_shape),
+        np.array(radar.range['data']), np.array(radar.azimuth['data']),
+        np.array(radar.elevation['data']), key)
+
+
+def _geometry_key(radar, *args):
+    """
+    Return a key identifying the geometry of a radar and gridding parameters.
+
+    The key is a hex digest of the radar ranges, azimuth and elevation
+    angles and location along with the representation of any additional
+    arguments.  Function arguments are represented by their state as
+    returned by :py:func:`_callable_state`.  Radars with identical
+    geometries mapped with the same parameters will have the same key.
+    """
+    sha = hashlib.sha1()
+    for dic in (radar.range, radar.azimuth, radar.elevation,
+                radar.latitude, radar.longitude, radar.altitude):
+        sha.update(np.ascontiguousarray(dic['data'], dtype='float32').data)
+    for arg in args:
+        if hasattr(arg, '__call__'):
+            arg = _callable_state(arg)
+        sha.update(repr(arg).encode('utf-8'))
+    return sha.hexdigest()
+
+
+def _callable_state(func):
+    """
+    Return a tuple describing a function for use in an operator key.
+
+    The tuple contains the module, name, byte code and constants of the
+    function along with its default arguments and the values of the
+    variables in its closure, so closures created with different
+    parameters, such as those returned by _gen_roi_func_constant, are
+    distinguished.  Arrays are included by their contents.  Callables which
+    are not Python functions cannot be described and raise a ValueError.
+    """
+    code = getattr(func, '__code__', None)
+    if code is None:
+        raise ValueError(
+            'roi_func must be a string or a Python function, not %r' % func)
+
+    def describe(value):
+        """ Return a representation of a default or closure value. """
+        if hasattr(value, '__code__'):
+            return _callable_state(value)
+        if isinstance(value, np.ndarray):
+            return (value.dtype.str, value.shape, value.tobytes())
+        return value
+
+    def describe_code(code):
+        """ Return the byte code and constants of a code object. """
+        return (code.co_code, tuple(
+            describe_code(c) if hasattr(c, 'co_code') else c
+            for c in code.co_consts))
+
+    defaults = func.__defaults__ or ()
+    closure = [cell.cell_contents for cell in func.__closure__ or ()]
+    return (func.__module__, getattr(func, '__qualname__', func.__name__),
+            describe_code(code),
+            tuple(describe(value) for value in defaults),
+            tuple(describe(value) for value in closure))
+
+
+def _check_key(operator_key, key):
+    """ Raise a ValueError if key is not None and differs from an operator. """
+    if key is not None and key != operator_key:
+        raise ValueError(
+            'Operator key %s does not match the expected key %s' %
+            (operator_key, key))
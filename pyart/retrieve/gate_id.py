@@ -15,7 +15,6 @@ import netCDF4
 from scipy import interpolate
 
 from ..config import get_fillvalue, get_metadata, get_field_name
-from ..io.common import radar_coords_to_cart
 
 
 def map_profile_to_gates(profile, heights, radar, toa=None,
@@ -48,10 +47,9 @@ def map_profile_to_gates(profile, heights, radar, toa=None,
         interpolated onto the radar gates.
 
     """
-    # retrieve the Z coordinates of the radar gates
-    rg, azg = np.meshgrid(radar.range['data'], radar.azimuth['data'])
-    rg, eleg = np.meshgrid(radar.range['data'], radar.elevation['data'])
-    _, _, z = radar_coords_to_cart(rg / 1000.0, azg, eleg)
+    # retrieve the Z coordinates of the radar gates, cached by the radar in
+    # single precision, heights are returned in double precision
+    z = radar.gate_z['data'].astype('float64')
 
     # find toa is not provided
     if toa is None:
@@ -15,6 +15,19 @@ def test_map_profile_to_gates():
     assert temp_dict['data'].mean() == 1.0
 
 
+def test_map_profile_to_gates_height():
+    test_radar = pyart.testing.make_empty_ppi_radar(100, 360, 5)
+    test_radar.altitude['data'][0] = 100.
+    z_dict, temp_dict = pyart.retrieve.map_profile_to_gates(
+        np.ones(100), np.linspace(0, 1000, 100), test_radar)
+    _, _, z = pyart.io.common.radar_coords_to_cart(
+        test_radar.range['data'][np.newaxis, :].astype('float64') / 1000.,
+        test_radar.azimuth['data'][:, np.newaxis].astype('float64'),
+        test_radar.elevation['data'][:, np.newaxis].astype('float64'))
+    assert z_dict['data'].dtype == np.float64
+    assert np.allclose(z_dict['data'], z + 100., rtol=0, atol=0.01)
+
+
 def test_fetch_radar_time_profile():
     test_radar = pyart.testing.make_empty_ppi_radar(100, 360, 5)
     test_radar.time['units'] = 'seconds since 2011-05-10T00:00:01Z'
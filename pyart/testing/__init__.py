@@ -17,6 +17,7 @@ Testing functions
     make_target_radar
     make_single_ray_radar
     make_velocity_aliased_radar
+    make_synthetic_ppi_radar
     make_empty_grid
     make_target_grid
 
@@ -44,6 +45,7 @@ from .sample_objects import make_empty_grid
 from .sample_objects import make_target_grid, make_storm_grid
 from .sample_objects import make_empty_rhi_radar
 from .sample_objects import make_velocity_aliased_rhi_radar
+from .sample_objects import make_synthetic_ppi_radar
 from .tmpdirs import InTemporaryDirectory
 
 __all__ = [s for s in dir() if not s.startswith('_')]
@@ -10,6 +10,7 @@ Functions for creating sample Radar and Grid objects.
     make_empty_ppi_radar
     make_target_radar
     make_velocity_aliased_radar
+    make_synthetic_ppi_radar
     make_single_ray_radar
     make_empty_grid
     make_target_grid
@@ -19,7 +20,7 @@ Functions for creating sample Radar and Grid objects.
 import numpy as np
 
 from .sample_files import _EXAMPLE_RAYS_FILE
-from ..config import get_metadata
+from ..config import get_metadata, get_field_name
 from ..core.radar import Radar
 from ..core.grid import Grid
 
@@ -211,6 +212,89 @@ def make_velocity_aliased_rhi_radar(alias=True):
     return radar
 
 
+def make_synthetic_ppi_radar(ngates=400, rays_per_sweep=360, nsweeps=5,
+                             gate_spacing=250., nyquist_vel=10.0, seed=2015):
+    """
+    Return a PPI volume with synthetic, storm like, moment fields.
+
+    The radar contains reflectivity, velocity, differential phase, cross
+    correlation ratio and normalized coherent power fields.  The velocity
+    field is a uniform wind aliased at the Nyquist velocity and the
+    differential phase accumulates in regions of high reflectivity.  Radars
+    of realistic sizes can be created which are useful for benchmarking.
+
+    Parameters
+    ----------
+    ngates : int
+        Number of gates per ray.
+    rays_per_sweep : int
+        Number of rays in each PPI sweep.
+    nsweeps : int
+        Number of sweeps, elevation angles are evenly spaced between 0.5 and
+        19.5 degrees.
+    gate_spacing : float
+        Distance between gates in meters.
+    nyquist_vel : float
+        Nyquist velocity in meters per second.
+    seed : int
+        Seed for the random number generator used to add noise to the fields.
+
+    Returns
+    -------
+    radar : Radar
+        Radar object with synthetic fields.
+
+    """
+    radar = make_empty_ppi_radar(ngates, rays_per_sweep, nsweeps)
+    nrays = radar.nrays
+    radar.range['data'] = np.arange(ngates, dtype='float32') * gate_spacing
+    radar.range['meters_between_gates'] = gate_spacing
+    radar.range['meters_to_center_of_first_gate'] = 0.0
+    fixed_angle = np.linspace(0.5, 19.5, nsweeps).astype('float32')
+    radar.fixed_angle['data'] = fixed_angle
+    radar.elevation['data'] = np.repeat(fixed_angle, rays_per_sweep)
+    radar.azimuth['data'] = np.tile(np.linspace(
+        0, 360, rays_per_sweep, endpoint=False).astype('float32'), nsweeps)
+    radar.instrument_parameters = {
+        'nyquist_velocity': {'data': np.ones(nrays, 'float32') * nyquist_vel}}
+
+    random = np.random.RandomState(seed)
+    x = radar.gate_x['data']
+    y = radar.gate_y['data']
+    max_range = max(ngates * gate_spacing, 1.)
+
+    # reflectivity, two convective cells on a stratiform background
+    refl = 10. + random.normal(0, 1, (nrays, ngates))
+    for xc, yc in [(0.3, 0.2), (-0.2, -0.4)]:
+        dist2 = (x - xc * max_range) ** 2 + (y - yc * max_range) ** 2
+        refl += 45. * np.exp(-dist2 / (2 * (0.1 * max_range) ** 2))
+
+    # velocity, radial component of a uniform wind aliased to the Nyquist
+    azimuth = np.deg2rad(radar.azimuth['data'])[:, np.newaxis]
+    elevation = np.deg2rad(radar.elevation['data'])[:, np.newaxis]
+    vel = (15. * np.sin(azimuth) + 20. * np.cos(azimuth)) * np.cos(elevation)
+    vel = vel + random.normal(0, 0.5, (nrays, ngates))
+    vel = (vel + nyquist_vel) % (2 * nyquist_vel) - nyquist_vel
+
+    # differential phase, accumulates from the specific differential phase
+    kdp = np.where(refl > 35., (refl - 35.) * 0.1, 0.) * gate_spacing / 1000.
+    phidp = 10. + 2. * np.cumsum(kdp, axis=1)
+    phidp += random.normal(0, 2., (nrays, ngates))
+
+    rhohv = np.clip(random.normal(0.98, 0.01, (nrays, ngates)), 0, 1)
+    ncp = np.clip(random.normal(0.9, 0.05, (nrays, ngates)), 0, 1)
+
+    for name, data in [('reflectivity', refl), ('velocity', vel),
+                       ('differential_phase', phidp),
+                       ('cross_correlation_ratio', rhohv),
+                       ('normalized_coherent_power', ncp)]:
+        field_name = get_field_name(name)
+        field_dic = get_metadata(field_name)
+        field_dic['data'] = data.astype('float32')
+        radar.fields[field_name] = field_dic
+    return radar
+
+
 def make_single_ray_radar():
     """
     Return a PPI radar with a single ray taken from a ARM C-SAPR Radar
@@ -0,0 +1,10 @@
+
+# THIS FILE IS GENERATED FROM PYART SETUP.PY
+short_version = '1.6.0'
+version = '1.6.0'
+full_version = '1.6.0.dev+Unknown'
+git_revision = 'Unknown'
+release = False
+
+if not release:
+    version = full_version